@@ -0,0 +1,194 @@
+"""
+Ekspresso procedure
+Copyright (C) 2022  Mateusz Jaracz 
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+
+
+from argparse import ArgumentParser
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
+from time import perf_counter
+from typing import Iterable, Iterator, TextIO
+
+import json
+import sys
+
+from ekspansja import (
+    InvalidInputException,
+    UndefinedBehaviourException,
+    PackedMatrix,
+    anytime_packed,
+    heuristic_packed,
+    systematic_packed,
+    weighted_packed
+)
+
+
+Engines: dict = {
+    'systematic': systematic_packed,
+    'heuristic': heuristic_packed,
+    'anytime': anytime_packed,
+    'weighted': weighted_packed
+}
+
+
+@dataclass(frozen=True, slots=True)
+class PackedR:
+    rows: PackedMatrix
+    members: frozenset
+    length: int
+
+
+@lru_cache(maxsize=16)
+def pack_r(second: tuple[int]) -> PackedR:
+    """
+    This function validates and packs R cube, the last few R cubes are
+    remembered so problems sharing the same R set parse it only once
+    :param second: sorted R indexes
+    :type second: tuple of int
+    :returns: packed R cube
+    :rtype: PackedR
+    :raises InvalidInputException: when R contains negative numbers
+    """
+    if second and min(second) < 0:
+        raise InvalidInputException()
+    return PackedR(list(second), frozenset(second),
+                   max(second, default=0).bit_length())
+
+
+def pack_problem(
+        first: list[int],
+        second: list[int]
+        ) -> tuple[PackedMatrix, PackedMatrix, int]:
+    """
+    This function validates and packs one problem
+    :param first: F indexes
+    :type first: list of int
+    :param second: R indexes
+    :type second: list of int
+    :returns: packed F and R cubes and bit length
+    :rtype: tuple of packed matrixes and int
+    :raises InvalidInputException: when given data is invalid
+    """
+    if (not isinstance(first, list) or not isinstance(second, list)
+            or not all(type(index) is int for index in chain(first, second))):
+        raise InvalidInputException()
+    rcube = pack_r(tuple(sorted(second)))
+    if not first or min(first) < 0 or not rcube.members.isdisjoint(first):
+        raise InvalidInputException()
+    return (list(first), rcube.rows,
+            max(rcube.length, max(first).bit_length(), 1))
+
+
+def minimize(problem: dict, method: str, **options: ...) -> dict:
+    """
+    This function minimizes one problem
+    :param problem: problem with "f" and "r" lists and optional "id"
+    :type problem: dict
+    :param method: name of the engine
+    :type method: str
+    :param options: keyword arguments of the engine
+    :type options: any
+    :returns: problem id with the result and time or with the error,
+        anytime engine adds flag telling if the result is proven optimal
+    :rtype: dict
+    """
+    output = {'id': problem.get('id')}
+    try:
+        start = perf_counter()
+        output['result'] = Engines[method](
+            *pack_problem(problem['f'], problem['r']), **options)
+        output['time'] = perf_counter() - start
+        if method == 'anytime':
+            output['result'], output['optimal'] = output['result']
+    except (InvalidInputException, UndefinedBehaviourException,
+            KeyError, TypeError, ValueError) as exception:
+        output['error'] = str(exception) or type(exception).__name__
+    return output
+
+
+def minimize_stream(
+        lines: Iterable[str],
+        method: str = 'heuristic',
+        **options: ...
+        ) -> Iterator[dict]:
+    """
+    This function minimizes stream of JSONL problems, one problem is read
+    at a time and its result is yielded before the next one is read
+    :param lines: lines of JSON objects {"f": [...], "r": [...]}
+    :type lines: iterable of str
+    :param method: name of the engine
+    :type method: str
+    :param options: keyword arguments of the engine
+    :type options: any
+    :returns: results in order of problems
+    :rtype: iterator of dict
+    """
+    for index, line in enumerate(lines):
+        if not line.strip():
+            continue
+        try:
+            problem = json.loads(line)
+        except json.JSONDecodeError as exception:
+            yield {'id': index, 'error': str(exception)}
+            continue
+        if not isinstance(problem, dict):
+            yield {'id': index, 'error': 'Problem must be a JSON object'}
+            continue
+        problem.setdefault('id', index)
+        yield minimize(problem, method, **options)
+
+
+def write_stream(results: Iterable[dict], handle: TextIO) -> None:
+    """
+    This function writes results as JSONL, flushing after every line
+    :param results: results to be written
+    :type results: iterable of dict
+    :param handle: output file
+    :type handle: text file
+    """
+    for result in results:
+        handle.write(json.dumps(result) + '\n')
+        handle.flush()
+
+
+def main() -> None:
+    parser = ArgumentParser(description='Minimize stream of JSONL problems')
+    parser.add_argument('input', nargs='?', default='-',
+                        help='JSONL file with problems, - for stdin')
+    parser.add_argument('-o', '--output', default='-',
+                        help='JSONL file for results, - for stdout')
+    parser.add_argument('-m', '--method', choices=Engines,
+                        default='heuristic')
+    parser.add_argument('--batched', action='store_true')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--time-budget', type=float, default=1.0,
+                        help='seconds per problem of the anytime method')
+    args = parser.parse_args()
+    options = {'batched': args.batched, 'workers': args.workers}
+    if args.method == 'anytime':
+        options['time_budget'] = args.time_budget
+    source = sys.stdin if args.input == '-' else open(args.input, 'r')
+    destiny = sys.stdout if args.output == '-' else open(args.output, 'w')
+    with source, destiny:
+        write_stream(minimize_stream(source, args.method, **options),
+                     destiny)
+
+
+if __name__ == '__main__':
+    main()
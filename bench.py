@@ -0,0 +1,264 @@
+"""
+Ekspresso procedure
+Copyright (C) 2022  Mateusz Jaracz 
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+
+from argparse import ArgumentParser
+from contextlib import nullcontext
+from random import Random
+from statistics import median, quantiles
+from time import perf_counter_ns
+
+import json
+import subprocess
+import sys
+import tracemalloc
+
+from ekspansja import systematic, heuristic, espresso, weighted
+from tracing import tracing
+from cache import caching
+
+
+Engines: dict = {
+    'systematic': systematic.__wrapped__,
+    'heuristic': heuristic.__wrapped__,
+    'espresso': espresso.__wrapped__,
+    'weighted': weighted.__wrapped__
+}
+
+
+def generate_problem(
+        length: int,
+        density: float,
+        seed: int,
+        dont_care: float = 0.0
+        ) -> tuple[list[int], list[int]]:
+    """
+    This function generates random F and R indexes, every minterm is in F
+    with given probability, don't care with given probability or in R
+    :param length: number of variables
+    :type length: int
+    :param density: probability of a minterm being in F
+    :type density: float
+    :param seed: seed of the generator
+    :type seed: int
+    :param dont_care: probability of a minterm being in neither set
+    :type dont_care: float
+    :returns: F and R indexes, both not empty
+    :rtype: tuple of lists of int
+    """
+    generator, first, second = Random(f'{seed}:{length}:{density}'), [], []
+    for minterm in range(1 << length):
+        if (draw := generator.random()) < density:
+            first.append(minterm)
+        elif draw >= density + dont_care:
+            second.append(minterm)
+    if not first:
+        first.append(second.pop(generator.randrange(len(second))))
+    if not second:
+        second.append(first.pop(generator.randrange(len(first))))
+    return first, second
+
+
+def cover_size(result: str | list[str]) -> dict:
+    """
+    This function counts implicants and literals of a cover
+    :param result: result of the engine
+    :type result: str or list of str
+    :returns: number of implicants, literals and of equal covers
+    :rtype: dict
+    """
+    covers = result if isinstance(result, list) else [result]
+    implicants = covers[0].split(' + ')
+    return {'implicants': len(implicants),
+            'literals': sum(item.count('x') for item in implicants),
+            'covers': len(covers)}
+
+
+def percentiles(times: list[int]) -> dict:
+    """
+    This function summarizes times of repeated runs
+    :param times: times in nanoseconds
+    :type times: list of int
+    :returns: median, 90th and 99th percentile, minimum and maximum
+    :rtype: dict
+    """
+    cuts = (quantiles(times, n=100, method='inclusive') if len(times) > 1
+            else times * 99)
+    return {'median_ns': median(times), 'p90_ns': cuts[89],
+            'p99_ns': cuts[98], 'min_ns': min(times), 'max_ns': max(times)}
+
+
+def measure(
+        method: str,
+        first: list[int],
+        second: list[int],
+        repeat: int
+        ) -> dict:
+    """
+    This function runs the engine repeatedly without the cache and
+    measures it, peak memory and phases are measured by one additional run
+    as tracemalloc slows the engine down
+    :param method: name of the engine
+    :type method: str
+    :param first: F indexes
+    :type first: list of int
+    :param second: R indexes
+    :type second: list of int
+    :param repeat: number of timed runs
+    :type repeat: int
+    :returns: times, peak memory, trace and size of the cover
+    :rtype: dict
+    """
+    engine, times = Engines[method], []
+    with caching(None):
+        for _ in range(repeat):
+            start = perf_counter_ns()
+            result = engine(first, second)
+            times.append(perf_counter_ns() - start)
+        tracemalloc.start()
+        with tracing() as tracer:
+            engine(first, second)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {'runs': repeat, **percentiles(times), 'peak_bytes': peak,
+            **cover_size(result), 'trace': tracer.to_dict()}
+
+
+def scaling(
+        lengths: range,
+        densities: list[float],
+        methods: list[str],
+        repeat: int,
+        seed: int,
+        limit: float
+        ) -> list[dict]:
+    """
+    This function measures engines over growing number of variables, an
+    engine is not run for greater lengths once its median exceeds limit
+    :param lengths: numbers of variables
+    :type lengths: range
+    :param densities: probabilities of a minterm being in F
+    :type densities: list of float
+    :param methods: names of engines
+    :type methods: list of str
+    :param repeat: number of timed runs
+    :type repeat: int
+    :param seed: seed of the generator
+    :type seed: int
+    :param limit: time limit of a single run in seconds
+    :type limit: float
+    :returns: one record for every measured problem and engine, engine
+        which raised is not run for greater lengths either
+    :rtype: list of dict
+    """
+    output, stopped = [], set()
+    for length in lengths:
+        for density in densities:
+            first, second = generate_problem(length, density, seed)
+            for method in methods:
+                if (method, density) in stopped:
+                    continue
+                record = {'method': method, 'variables': length,
+                          'density': density, 'f': len(first),
+                          'r': len(second)}
+                try:
+                    record.update(measure(method, first, second, repeat))
+                except Exception as exception:
+                    record['error'] = repr(exception)
+                output.append(record)
+                print(json.dumps(record), file=sys.stderr)
+                if 'error' in record or record['median_ns'] > limit * 1e9:
+                    stopped.add((method, density))
+    return output
+
+
+def cold_start(modules: list[str], repeat: int, budget: float) -> dict:
+    """
+    This function measures import of given modules by a new interpreter,
+    time of starting the interpreter alone is measured too and subtracted
+    :param modules: names of modules, "main" is what the window needs
+        before it is shown
+    :type modules: list of str
+    :param repeat: number of timed runs
+    :type repeat: int
+    :param budget: seconds which import of a module should not exceed
+    :type budget: float
+    :returns: times of the interpreter and of every module with a flag
+        telling if its median fits in the budget
+    :rtype: dict
+    """
+    def run(code: str) -> list[int]:
+        times = []
+        for _ in range(repeat):
+            start = perf_counter_ns()
+            subprocess.run([sys.executable, '-c', code], check=True,
+                           capture_output=True)
+            times.append(perf_counter_ns() - start)
+        return times
+
+    interpreter = run('pass')
+    output = {'budget_ns': int(budget * 1e9),
+              'interpreter': percentiles(interpreter)}
+    for module in modules:
+        try:
+            times = [max(0, time - median(interpreter))
+                     for time in run(f'import {module}')]
+        except subprocess.CalledProcessError as exception:
+            output[module] = {'error': exception.stderr.decode()
+                              .strip().splitlines()[-1]}
+            continue
+        output[module] = {**percentiles(times),
+                          'within_budget': median(times) <= budget * 1e9}
+    return output
+
+
+def main() -> None:
+    parser = ArgumentParser(description='Benchmark of the engines')
+    parser.add_argument('--min-variables', type=int, default=4)
+    parser.add_argument('--max-variables', type=int, default=20)
+    parser.add_argument('--density', type=float, nargs='+',
+                        default=[0.25, 0.5])
+    parser.add_argument('--method', choices=Engines, nargs='+',
+                        default=list(Engines))
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--limit', type=float, default=10.0,
+                        help='seconds after which an engine is not run '
+                        'for more variables')
+    parser.add_argument('--startup-budget', type=float, default=0.25,
+                        help='seconds which import of the application '
+                        'should not exceed')
+    parser.add_argument('-o', '--output', default='-',
+                        help='JSON file for results, - for stdout')
+    args = parser.parse_args()
+    results = {'seed': args.seed, 'repeat': args.repeat,
+               'startup': cold_start(['main', 'ekspansja'], args.repeat,
+                                     args.startup_budget),
+               'results': scaling(range(args.min_variables,
+                                        args.max_variables + 1),
+                                  args.density, args.method, args.repeat,
+                                  args.seed, args.limit)}
+    destiny = nullcontext(sys.stdout) if args.output == '-' \
+        else open(args.output, 'w')
+    with destiny as handle:
+        json.dump(results, handle, indent=2)
+        handle.write('\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,295 @@
+"""
+Ekspresso procedure
+Copyright (C) 2022  Mateusz Jaracz 
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+
+
+from contextlib import contextmanager
+from functools import wraps
+from hashlib import sha256
+from inspect import signature
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Callable, Iterator, Sequence
+
+import json
+import os
+
+from npn import Transform, canonical_form, from_labels, to_labels
+import tracing
+
+
+# version of stored results, changing it invalidates all of them
+FORMAT: int = 4
+
+# arguments which do not change the result of an engine
+IGNORED: frozenset = frozenset({'progress', 'batched', 'workers'})
+
+
+class ResultCache:
+    """
+    Content-addressed cache of engine results kept in a directory, one
+    file per result, modification time of a file is the time of its last
+    use, least recently used files are removed when the directory grows
+    over the limit, files are replaced atomically so processes can share
+    the directory, the size is counted from written files and the
+    directory is listed only when it seems to be over the limit, with npn
+    set results are shared between functions which differ only by
+    permutation and negation of inputs
+    """
+    def __init__(
+            self,
+            directory: str | Path,
+            limit: int = 64 << 20,
+            npn: bool = True
+            ) -> None:
+        self.directory = Path(directory)
+        self.limit = limit
+        self.npn = npn
+        self.hits = self.misses = self.writes = self.evictions = 0
+        self.size: int | None = None
+
+    def path(self, key: str) -> Path:
+        return self.directory / f'{key}.json'
+
+    def get(self, key: str) -> tuple[bool, object]:
+        """
+        This function reads the result and marks it as used
+        :param key: key of the result
+        :type key: str
+        :returns: if the result was found and the result
+        :rtype: tuple of bool and object
+        """
+        path = self.path(key)
+        try:
+            value = json.loads(path.read_text())
+            os.utime(path)
+        except (OSError, ValueError):
+            self.misses += 1
+            tracing.count('cache.misses')
+            return False, None
+        self.hits += 1
+        tracing.count('cache.hits')
+        return True, value
+
+    def put(self, key: str, value: object) -> None:
+        """
+        This function writes the result atomically and evicts least
+        recently used results if the limit is exceeded, errors of the
+        file system are ignored as the result is already computed
+        :param key: key of the result
+        :type key: str
+        :param value: result which can be written as JSON
+        :type value: object
+        """
+        path = self.path(key)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            if self.size is None:
+                self.size = sum(entry[1] for entry in self.entries())
+            with NamedTemporaryFile('w', dir=self.directory, suffix='.tmp',
+                                    delete=False) as handle:
+                json.dump(value, handle)
+            if path.exists():
+                self.size -= path.stat().st_size
+            os.replace(handle.name, path)
+            self.size += path.stat().st_size
+        except OSError:
+            return
+        self.writes += 1
+        if self.size > self.limit:
+            self.evict()
+
+    def entries(self) -> list[tuple[float, int, Path]]:
+        """
+        This function lists stored results from the least recently used
+        :returns: modification time, size and path of every result
+        :rtype: list of tuples of float, int and Path
+        """
+        output = []
+        for path in self.directory.glob('*.json'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            output.append((stat.st_mtime, stat.st_size, path))
+        return sorted(output)
+
+    def evict(self) -> None:
+        entries = self.entries()
+        size = sum(entry[1] for entry in entries)
+        for _, length, path in entries:
+            if size <= self.limit:
+                break
+            path.unlink(missing_ok=True)
+            size -= length
+            self.evictions += 1
+        self.size = size
+
+    def clear(self) -> None:
+        for _, _, path in self.entries():
+            path.unlink(missing_ok=True)
+        self.size = 0
+
+    def stats(self) -> dict:
+        entries = self.entries()
+        return {'hits': self.hits, 'misses': self.misses,
+                'writes': self.writes, 'evictions': self.evictions,
+                'entries': len(entries),
+                'bytes': sum(entry[1] for entry in entries)}
+
+
+def default_cache() -> ResultCache | None:
+    """
+    This function creates the cache from EKSPANSJA_CACHE environment
+    variable, the cache is disabled when it is not set, empty, 0 or off,
+    1 or on means ekspansja in the user cache directory, anything else is
+    the directory of the cache
+    :returns: cache or None when it is disabled
+    :rtype: ResultCache or None
+    """
+    directory = os.environ.get('EKSPANSJA_CACHE', '')
+    if directory.lower() in ('', '0', 'off'):
+        return None
+    if directory.lower() in ('1', 'on'):
+        directory = Path(os.environ.get('XDG_CACHE_HOME')
+                         or Path.home() / '.cache') / 'ekspansja'
+    return ResultCache(directory)
+
+
+# cache used by the engines, None when caching is disabled
+ACTIVE: ResultCache | None = default_cache()
+
+
+@contextmanager
+def caching(cache: ResultCache | None) -> Iterator[ResultCache | None]:
+    """
+    This function sets the cache used by the engines inside with block
+    :param cache: cache to be used, None to disable caching
+    :type cache: ResultCache or None
+    :returns: given cache
+    :rtype: iterator of ResultCache or None
+    """
+    global ACTIVE
+    previous, ACTIVE = ACTIVE, cache
+    try:
+        yield cache
+    finally:
+        ACTIVE = previous
+
+
+def set_cache(cache: ResultCache | None) -> None:
+    """
+    This function sets the cache used by the engines
+    :param cache: cache to be used, None to disable caching
+    :type cache: ResultCache or None
+    """
+    global ACTIVE
+    ACTIVE = cache
+
+
+def cache_key(engine: str, arguments: dict) -> str:
+    """
+    This function hashes the call, arguments which do not change the
+    result are skipped, order of indexes and cubes is kept as the engines
+    depend on it, sequences like arrays of indexes are hashed as lists
+    :param engine: qualified name of the engine
+    :type engine: str
+    :param arguments: all arguments of the call by their names
+    :type arguments: dict
+    :returns: hexadecimal digest
+    :rtype: str
+    """
+    canonical = {name: list(value) if isinstance(value, Sequence)
+                 and not isinstance(value, str) else value
+                 for name, value in arguments.items() if name not in IGNORED}
+    text = json.dumps([FORMAT, engine, canonical], sort_keys=True)
+    return sha256(text.encode()).hexdigest()
+
+
+def canonical_arguments(arguments: dict) -> tuple[Transform, dict] | None:
+    """
+    This function replaces F, R and don't care indexes with their
+    representative of the class of input permutations and negations
+    :param arguments: all arguments of the call by their names
+    :type arguments: dict
+    :returns: transform and canonical arguments, None if indexes cannot
+        be transformed
+    :rtype: tuple of transform and dict or None
+    """
+    names = [name for name in ('first', 'second', 'dont_care')
+             if arguments.get(name) is not None]
+    if (form := canonical_form(*map(arguments.get, names),
+                               length=arguments.get('length'))) is None:
+        return None
+    transform, sets = form
+    return transform, {**arguments, **dict(zip(names, sets)),
+                       'length': len(transform[0])}
+
+
+def relabel(
+        value: str | list[str],
+        function: Callable[[str, Transform], str],
+        transform: Transform
+        ) -> str | list[str]:
+    if isinstance(value, list):
+        return [function(expression, transform) for expression in value]
+    return function(value, transform)
+
+
+def cached(function: Callable) -> Callable:
+    """
+    This function makes the engine use the active cache, exceptions are
+    never cached, unless the cache is created without npn the canonical
+    function is solved on a miss and its result is stored as labels of
+    canonical variables, every call relabels it back, so the result of
+    functions differing only by permutation and negation of inputs is
+    the same cover, not always the one the engine would give directly
+    :param function: engine taking F, R and don't care indexes and
+        returning expression or list of them
+    :type function: callable
+    :returns: engine using the cache
+    :rtype: callable
+    """
+    parameters = signature(function)
+    engine = f'{function.__module__}.{function.__qualname__}'
+
+    @wraps(function)
+    def wrapper(*args: ..., **kwargs: ...) -> any:
+        cache = ACTIVE
+        if cache is None:
+            return function(*args, **kwargs)
+        bound = parameters.bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = bound.arguments
+        if not cache.npn or (form := canonical_arguments(arguments)) is None:
+            key = cache_key(engine, arguments)
+            found, value = cache.get(key)
+            if not found:
+                value = function(*args, **kwargs)
+                cache.put(key, value)
+            return value
+        transform, arguments = form
+        key = cache_key(engine, arguments)
+        found, value = cache.get(key)
+        if not found:
+            value = relabel(function(**{
+                name: arguments[name] for name in parameters.parameters}),
+                to_labels, (tuple(range(len(transform[0]))), 0))
+            cache.put(key, value)
+        return relabel(value, from_labels, transform)
+    return wrapper
@@ -0,0 +1,207 @@
+"""
+Ekspresso procedure
+Copyright (C) 2022  Mateusz Jaracz 
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+
+
+from argparse import ArgumentParser
+
+import sys
+
+import cache
+
+from ekspansja import (
+    systematic,
+    heuristic,
+    anytime,
+    espresso,
+    weighted,
+    systematic_cubes,
+    heuristic_cubes,
+    espresso_cubes,
+    weighted_cubes
+)
+from multioutput import multi_output
+from pla import (
+    Functions,
+    PLAHeader,
+    WIDE,
+    load_pla,
+    expression_cubes,
+    write_pla
+)
+
+
+Engines: dict = {
+    'systematic': systematic,
+    'heuristic': heuristic,
+    'anytime': anytime,
+    'espresso': espresso,
+    'weighted': weighted
+}
+
+CubeEngines: dict = {
+    'systematic': systematic_cubes,
+    'heuristic': heuristic_cubes,
+    'espresso': espresso_cubes,
+    'weighted': weighted_cubes
+}
+
+
+def minimize_output(
+        first: list[int] | list[str],
+        second: list[int] | list[str],
+        header: PLAHeader,
+        method: str,
+        engines: dict = Engines,
+        **options: ...
+        ) -> tuple[list[str], float]:
+    """
+    This function minimizes one output of PLA file
+    :param first: F indexes or cubes
+    :type first: list of int or list of str
+    :param second: R indexes or cubes
+    :type second: list of int or list of str
+    :param header: header of the file
+    :type header: PLAHeader
+    :param method: name of the engine
+    :type method: str
+    :param engines: engines by their names, CubeEngines for cubes
+    :type engines: dict
+    :param options: keyword arguments of the engine
+    :type options: any
+    :returns: input parts of cubes of the cover and time
+    :rtype: tuple of list of str and float
+    """
+    if not first:
+        return [], 0.0
+    if not second:
+        return ['-' * header.inputs], 0.0
+    result, time = engines[method](first, second, **options)
+    if method == 'anytime':
+        result, _ = result
+    if isinstance(result, list):
+        result = result[0]
+    return expression_cubes(result, header.inputs), time
+
+
+def minimize_shared(
+        functions: Functions,
+        header: PLAHeader,
+        batched: bool
+        ) -> tuple[list[list[str]], float]:
+    """
+    This function minimizes all outputs of PLA file at once sharing
+    implicants between them
+    :param functions: F and R indexes of each output
+    :type functions: list of tuples of lists of int
+    :param header: header of the file
+    :type header: PLAHeader
+    :param batched: if b matrixes should be built with numpy at once
+    :type batched: bool
+    :returns: input parts of cubes of each output and time
+    :rtype: tuple of list of list of str and float
+    """
+    covers, used = [[] for _ in functions], []
+    for i, (first, second) in enumerate(functions):
+        if first and not second:
+            covers[i] = ['-' * header.inputs]
+        elif first:
+            used.append(i)
+    if not used:
+        return covers, 0.0
+    result, time = multi_output([functions[i] for i in used], batched)
+    for i, expression in zip(used, result):
+        covers[i] = expression_cubes(expression, header.inputs)
+    return covers, time
+
+
+def main() -> None:
+    parser = ArgumentParser(description='Minimize Berkeley PLA file')
+    parser.add_argument('input', nargs='?', default='-',
+                        help='PLA file, - for stdin')
+    parser.add_argument('-o', '--output', default='-',
+                        help='PLA file for the result, - for stdout')
+    parser.add_argument('-m', '--method', choices=Engines,
+                        default='heuristic')
+    parser.add_argument('--batched', action='store_true')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--time-budget', type=float, default=1.0,
+                        help='seconds per output of the anytime method')
+    parser.add_argument('--iterations', type=int, default=8,
+                        help='maximal number of iterations of the espresso '
+                        'method')
+    parser.add_argument('-s', '--shared', action='store_true',
+                        help='minimize all outputs at once sharing '
+                        'implicants between them')
+    parser.add_argument('-t', '--time', action='store_true',
+                        help='print time of every output to stderr')
+    parser.add_argument('-c', '--cubes', action='store_true',
+                        help='minimize cubes without enumerating their '
+                        'minterms, R cubes of types f and fd are computed '
+                        'as the complement, files with more than '
+                        f'{WIDE} inputs are read as cubes by methods '
+                        'accepting them')
+    parser.add_argument('--cache', metavar='DIRECTORY', default=None,
+                        help='keep results in the directory, by default '
+                        'EKSPANSJA_CACHE environment variable is used')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='do not use the cache of results')
+    parser.add_argument('--cache-stats', action='store_true',
+                        help='print statistics of the cache to stderr')
+    args = parser.parse_args()
+    if args.cache:
+        cache.set_cache(cache.ResultCache(args.cache))
+    if args.no_cache:
+        cache.set_cache(None)
+    if args.cubes and args.method not in CubeEngines:
+        parser.error(f'method {args.method} does not accept cubes')
+    if args.cubes and args.shared:
+        parser.error('shared implicants are not computed for cubes')
+    source = sys.stdin if args.input == '-' else open(args.input, 'r')
+    wide = None if args.method in CubeEngines and not args.shared else False
+    with source:
+        header, functions, cubes = load_pla(source, args.cubes or wide)
+    options = {}
+    if args.method == 'espresso':
+        options['iterations'] = args.iterations
+    elif not cubes:
+        options = {'batched': args.batched, 'workers': args.workers}
+        if args.method == 'anytime':
+            options['time_budget'] = args.time_budget
+    if args.shared:
+        covers, time = minimize_shared(functions, header, args.batched)
+        if args.time:
+            print(f'all outputs: {time:.6f} s', file=sys.stderr)
+    else:
+        covers = []
+        for i, (first, second) in enumerate(functions):
+            cover, time = minimize_output(
+                first, second, header, args.method,
+                CubeEngines if cubes else Engines, **options)
+            covers.append(cover)
+            if args.time:
+                print(f'output {i}: {time:.6f} s', file=sys.stderr)
+    destiny = sys.stdout if args.output == '-' else open(args.output, 'w')
+    with destiny:
+        write_pla(destiny, header, covers)
+    if args.cache_stats and cache.ACTIVE:
+        print(f'cache: {cache.ACTIVE.stats()}', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
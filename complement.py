@@ -0,0 +1,124 @@
+"""
+Ekspresso procedure
+Copyright (C) 2022  Mateusz Jaracz 
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+
+
+from typing import List, Tuple
+
+Cube = Tuple[int, int]
+CubeMatrix = List[Cube]
+
+
+def parse_cube(cube: str) -> Cube:
+    """
+    This function converts cube notation into masks of its specified
+    bits and of their values, the first character is the most significant
+    :param cube: string of '0', '1' and '-'
+    :type cube: str
+    :returns: care mask and value mask
+    :rtype: tuple of int
+    """
+    return (int(cube.replace('0', '1').replace('-', '0'), 2),
+            int(cube.replace('-', '0'), 2))
+
+
+def cube_string(cube: Cube, length: int) -> str:
+    """
+    This function converts masks of a cube into cube notation
+    :param cube: care mask and value mask
+    :type cube: tuple of int
+    :param length: number of variables
+    :type length: int
+    :returns: string of '0', '1' and '-'
+    :rtype: str
+    """
+    care, value = cube
+    return ''.join('01'[value >> i & 1] if care >> i & 1 else '-'
+                   for i in reversed(range(length)))
+
+
+def cofactor(cubes: CubeMatrix, mask: int, value: int) -> CubeMatrix:
+    """
+    This function returns cubes restricted to the half of the space where
+    the bit of given mask has given value, the bit becomes unspecified
+    :param cubes: care and value masks of cubes
+    :type cubes: cube matrix
+    :param mask: mask of a single bit
+    :type mask: int
+    :param value: mask if the bit is one, 0 otherwise
+    :type value: int
+    :returns: cofactor of cubes
+    :rtype: cube matrix
+    """
+    return [(care & ~mask, other & ~mask) for care, other in cubes
+            if not care & mask or other & mask == value]
+
+
+def splitting_bit(cubes: CubeMatrix) -> int:
+    """
+    This function chooses the bit to split on, binate bits are preferred
+    and then the bit specified by the most cubes
+    :param cubes: care and value masks of cubes
+    :type cubes: cube matrix
+    :returns: mask of the chosen bit
+    :rtype: int
+    """
+    cares = [care for care, _ in cubes]
+    ones = zeros = 0
+    for care, value in cubes:
+        ones |= care & value
+        zeros |= care & ~value
+    candidates = ones & zeros or ones | zeros
+    bits = []
+    while candidates:
+        bits.append(candidates & -candidates)
+        candidates ^= bits[-1]
+    return max(bits, key=lambda bit: sum(map(bit.__and__, cares)) // bit)
+
+
+def complement(cubes: CubeMatrix) -> CubeMatrix:
+    """
+    This function returns cubes covering every point which is not covered
+    by given cubes, the space is split recursively on a single bit until
+    cofactors are empty, contain the universal cube or a single cube
+    :param cubes: care and value masks of cubes
+    :type cubes: cube matrix
+    :returns: care and value masks of the complement
+    :rtype: cube matrix
+    """
+    if not cubes:
+        return [(0, 0)]
+    if not all(care for care, _ in cubes):
+        return []
+    if len(cubes) == 1:
+        care, value = cubes[0]
+        output = []
+        while care:
+            low = care & -care
+            output.append((low, ~value & low))
+            care ^= low
+        return output
+    mask = splitting_bit(cubes)
+    high = complement(cofactor(cubes, mask, mask))
+    low = complement(cofactor(cubes, mask, 0))
+    common = set(high) & set(low)
+    return ([(care | mask, value | mask) for care, value in high
+             if (care, value) not in common]
+            + [(care | mask, value) for care, value in low
+               if (care, value) not in common]
+            + [cube for cube in high if cube in common])
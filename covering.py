@@ -0,0 +1,398 @@
+"""
+Ekspresso procedure
+Copyright (C) 2022  Mateusz Jaracz 
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+
+from functools import reduce
+from math import inf
+from time import perf_counter
+from typing import Callable, Iterator, List, Tuple
+
+import tracing
+
+Cover = Tuple[int, ...]
+Costs = List[float] | None
+Check = Callable[[], None] | None
+
+
+class DeadlineException(Exception):
+    def __init__(self) -> None:
+        super().__init__('Deadline has expired')
+
+
+def check_deadline(deadline: float | None) -> None:
+    """
+    This function raises DeadlineException when the deadline has passed
+    :param deadline: value of time.perf_counter, None for no deadline
+    :type deadline: float or None
+    :raises DeadlineException: when the deadline has passed
+    """
+    if deadline is not None and perf_counter() > deadline:
+        raise DeadlineException()
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    """
+    This function yields indexes of ones in given mask from the lowest
+    :param mask: just a bitmask
+    :type mask: int
+    :returns: indexes of set bits
+    :rtype: iterator of int
+    """
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def column_masks(rows: List[int], width: int) -> List[int]:
+    """
+    This function transposes rows, i bit of a row is set if the row has
+    one in i column, i bit of a column is set if i row has one in it
+    :param rows: rows of the matrix
+    :type rows: list of int
+    :param width: number of columns
+    :type width: int
+    :returns: columns of the matrix
+    :rtype: list of int
+    """
+    columns = [0] * width
+    for i, row in enumerate(rows):
+        for j in iter_bits(row):
+            columns[j] |= 1 << i
+    return columns
+
+
+def lower_bound(
+        rows: List[int],
+        uncovered: int,
+        allowed: int,
+        costs: Costs = None
+        ) -> float:
+    """
+    This function counts uncovered rows which do not share any allowed
+    column, every one of them needs a separate column in the cover, with
+    costs the cheapest allowed column of every such row is added
+    :param rows: rows of the matrix
+    :type rows: list of int
+    :param uncovered: mask of rows which are not covered yet
+    :type uncovered: int
+    :param allowed: mask of columns which still can be chosen
+    :type allowed: int
+    :param costs: not negative cost of each column, None for all ones
+    :type costs: list of float or None
+    :returns: number or cost of columns needed, infinity when some row
+        cannot be covered
+    :rtype: float
+    """
+    count, used = 0, 0
+    for i in iter_bits(uncovered):
+        row = rows[i] & allowed
+        if not row:
+            return inf
+        if not row & used:
+            count += 1 if costs is None else min(
+                costs[j] for j in iter_bits(row))
+            used |= row
+    return count
+
+
+def greedy_cover(
+        rows: List[int],
+        columns: List[int],
+        costs: Costs = None
+        ) -> List[int]:
+    """
+    This function picks columns covering the most of uncovered rows,
+    with costs per unit of their cost, until all of them are covered
+    :param rows: rows of the matrix
+    :type rows: list of int
+    :param columns: columns of the matrix
+    :type columns: list of int
+    :param costs: not negative cost of each column, None for all ones
+    :type costs: list of float or None
+    :returns: indexes of chosen columns
+    :rtype: list of int
+    """
+    uncovered, output = (1 << len(rows)) - 1, []
+
+    def gain(i: int) -> float:
+        count = (columns[i] & uncovered).bit_count()
+        if costs is None or not count:
+            return count
+        return count / costs[i] if costs[i] else inf
+
+    while uncovered:
+        index = max(range(len(columns)), key=gain)
+        if not columns[index] & uncovered:
+            raise ValueError('Matrix cannot be covered')
+        output.append(index)
+        uncovered &= ~columns[index]
+    return output
+
+
+def cyclic_core(
+        rows: List[int],
+        width: int,
+        dominance: bool = True,
+        costs: Costs = None
+        ) -> Tuple[List[int], List[int]]:
+    """
+    This function reduces the matrix until nothing changes, columns of
+    rows with single one are forced and rows covered by them are removed,
+    rows containing other rows are removed and with dominance columns
+    contained in not more expensive columns are removed, the later one of
+    equal columns goes, without dominance every minimum cover of the
+    matrix is a minimum cover of what is left plus forced columns, with
+    dominance at least one of them is
+    :param rows: rows of the matrix, i bit set means one in i column
+    :type rows: list of int
+    :param width: number of columns
+    :type width: int
+    :param dominance: if dominated columns should be removed
+    :type dominance: bool
+    :param costs: not negative cost of each column, None for all ones
+    :type costs: list of float or None
+    :returns: indexes of forced columns and rows of the cyclic core,
+        columns keep their indexes
+    :rtype: tuple of list of int and list of int
+    """
+    forced, changed = [], True
+    costs = costs or [1] * width
+    while changed and all(rows):
+        changed = False
+        if (essential := reduce(int.__or__, (row for row in rows
+                                             if row.bit_count() == 1), 0)):
+            forced.extend(iter_bits(essential))
+            rows = [row for row in rows if not row & essential]
+            changed = True
+        kept = []
+        for row in sorted(rows, key=int.bit_count):
+            if not any(other & ~row == 0 for other in kept):
+                kept.append(row)
+        changed |= len(kept) < len(rows)
+        rows = kept
+        if not dominance:
+            continue
+        columns, alive = column_masks(rows, width), 0
+        for i, column in enumerate(columns):
+            if column:
+                alive |= 1 << i
+        for i in iter_bits(alive):
+            if any(k != i and not columns[i] & ~columns[k]
+                   and costs[k] <= costs[i]
+                   and (columns[i] != columns[k]
+                        or (costs[k], k) < (costs[i], i))
+                   for k in iter_bits(alive)):
+                alive &= ~(1 << i)
+                rows = [row & ~(1 << i) for row in rows]
+                changed = True
+    return sorted(forced), rows
+
+
+def best_cover(
+        rows: List[int],
+        width: int,
+        deadline: float | None = None,
+        incumbent: List[int] | None = None,
+        costs: Costs = None,
+        check: Check = None
+        ) -> Tuple[Cover, bool]:
+    """
+    This function searches for the minimum cover with branch and bound,
+    every step reduces what is left to its cyclic core and branches on
+    the row with the fewest columns, the search starts from the better of
+    the greedy and the given cover and it stops with the best cover found
+    so far when the deadline passes, with costs the cheapest cover is
+    searched for instead of the smallest one
+    :param rows: rows of the matrix
+    :type rows: list of int
+    :param width: number of columns
+    :type width: int
+    :param deadline: value of time.perf_counter, None for no deadline
+    :type deadline: float or None
+    :param incumbent: indexes of columns of already known cover
+    :type incumbent: list of int or None
+    :param costs: not negative cost of each column, None for all ones
+    :type costs: list of float or None
+    :param check: function called whenever the deadline is checked, it
+        may raise CancelledException
+    :type check: callable[[], None] or None
+    :returns: indexes of columns of the best cover and flag telling if
+        it is proven to be the minimum one
+    :rtype: tuple of tuple of int and bool
+    """
+    def total(cover: List[int]) -> float:
+        return len(cover) if costs is None else sum(costs[j] for j in cover)
+
+    forced, rows = cyclic_core(rows, width, costs=costs)
+    tracing.count('covering.forced_columns', len(forced))
+    best = sorted(forced + greedy_cover(rows, column_masks(rows, width),
+                                        costs))
+    if incumbent is not None and total(incumbent) < total(best):
+        best = sorted(incumbent)
+    nodes = 0
+
+    def search(rows: List[int], chosen: List[int]) -> None:
+        nonlocal best, nodes
+        nodes += 1
+        if not nodes & 255:
+            check_deadline(deadline)
+            if check:
+                check()
+        forced, rows = cyclic_core(rows, width, costs=costs)
+        chosen = chosen + forced
+        if not rows:
+            if total(chosen) < total(best):
+                best = sorted(chosen)
+            return
+        if total(chosen) + lower_bound(rows, (1 << len(rows)) - 1, -1,
+                                       costs) >= total(best):
+            return
+        columns = column_masks(rows, width)
+        for j in sorted(iter_bits(min(rows, key=int.bit_count)),
+                        key=lambda x: -columns[x].bit_count()):
+            search([row for row in rows if not row >> j & 1], chosen + [j])
+            rows = [row & ~(1 << j) for row in rows]
+
+    try:
+        search(rows, forced)
+        proven = True
+    except DeadlineException:
+        proven = False
+    finally:
+        tracing.count('covering.size_nodes', nodes)
+    return tuple(best), proven
+
+
+def minimum_cover_size(
+        rows: List[int],
+        width: int,
+        deadline: float | None = None,
+        check: Check = None
+        ) -> int:
+    """
+    This function finds the size of the minimum cover
+    :param rows: rows of the matrix
+    :type rows: list of int
+    :param width: number of columns
+    :type width: int
+    :param deadline: value of time.perf_counter, None for no deadline
+    :type deadline: float or None
+    :param check: function called whenever the deadline is checked, it
+        may raise CancelledException
+    :type check: callable[[], None] or None
+    :returns: number of columns in the minimum cover
+    :rtype: int
+    :raises DeadlineException: when the deadline passes before the size
+        is proven
+    """
+    cover, proven = best_cover(rows, width, deadline, check=check)
+    if not proven:
+        raise DeadlineException()
+    return len(cover)
+
+
+def iter_minimum_covers(
+        rows: List[int],
+        width: int,
+        size: int | None = None,
+        deadline: float | None = None,
+        check: Check = None
+        ) -> Iterator[Cover]:
+    """
+    This function yields every minimum cover in the same order as
+    itertools.combinations would list them
+    :param rows: rows of the matrix, i bit set means one in i column
+    :type rows: list of int
+    :param width: number of columns
+    :type width: int
+    :param size: size of the minimum cover if it is already known
+    :type size: int or None
+    :param deadline: value of time.perf_counter, None for no deadline
+    :type deadline: float or None
+    :param check: function called whenever the deadline is checked, it
+        may raise CancelledException
+    :type check: callable[[], None] or None
+    :returns: indexes of columns of each minimum cover
+    :rtype: iterator of tuple of int
+    :raises DeadlineException: when the deadline passes
+    """
+    if not all(rows):
+        return
+    forced, rows = cyclic_core(rows, width, False)
+    tracing.count('covering.forced_columns', len(forced))
+    if size is None:
+        size = minimum_cover_size(rows, width, deadline, check)
+    else:
+        size -= len(forced)
+    columns = column_masks(rows, width)
+    suffix = [0] * (width + 1)
+    for i in reversed(range(width)):
+        suffix[i] = suffix[i + 1] | columns[i]
+    chosen, nodes = [], 0
+
+    def search(index: int, uncovered: int) -> Iterator[Cover]:
+        nonlocal nodes
+        nodes += 1
+        if not nodes & 255:
+            check_deadline(deadline)
+            if check:
+                check()
+        if not uncovered:
+            yield tuple(sorted(chosen + forced))
+            return
+        if len(chosen) + lower_bound(rows, uncovered,
+                                     -1 << index) > size:
+            return
+        for j in range(index, width):
+            if uncovered & ~suffix[j]:
+                return
+            if columns[j] & uncovered:
+                chosen.append(j)
+                yield from search(j + 1, uncovered & ~columns[j])
+                chosen.pop()
+
+    try:
+        yield from search(0, (1 << len(rows)) - 1)
+    finally:
+        tracing.count('covering.cover_nodes', nodes)
+
+
+def minimum_covers(
+        rows: List[int],
+        width: int,
+        deadline: float | None = None,
+        check: Check = None
+        ) -> List[Cover]:
+    """
+    This function returns every minimum cover of the matrix
+    :param rows: rows of the matrix, i bit set means one in i column
+    :type rows: list of int
+    :param width: number of columns
+    :type width: int
+    :param deadline: value of time.perf_counter, None for no deadline
+    :type deadline: float or None
+    :param check: function called whenever the deadline is checked, it
+        may raise CancelledException
+    :type check: callable[[], None] or None
+    :returns: indexes of columns of each minimum cover
+    :rtype: list of tuple of int
+    :raises DeadlineException: when the deadline passes
+    """
+    return list(iter_minimum_covers(rows, width, deadline=deadline,
+                                    check=check))
@@ -17,21 +17,47 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>
 """
 
 
-from typing import List, Callable, Tuple
-from itertools import chain, combinations
-from copy import deepcopy
+from typing import List, Callable, Tuple, Iterator
+from itertools import chain, islice, repeat
+from functools import reduce, partial
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from time import perf_counter
 
 import numpy as np
 
 from timing import benchmark
-
-Matrix = List[List[bool]]
+from cache import cached
+from complement import Cube, CubeMatrix, complement, parse_cube
+from covering import (
+    Check,
+    DeadlineException,
+    best_cover,
+    check_deadline,
+    column_masks,
+    greedy_cover,
+    iter_minimum_covers
+)
+
+import tracing
+
+PackedMatrix = List[int]
+Inserter = Callable[[CubeMatrix, bool, Cube | CubeMatrix], None]
+Expansion = Iterator[Tuple[Cube | CubeMatrix, bool]]
+Progress = Callable[[int, int], None] | None
+Cost = Callable[[str], float] | None
 
 
 # fill f and r lists here
 f = [0, 1, 3, 7, 8, 12]
 r = [2, 4, 6, 9, 15]
 
+# R cube of a worker process of expand_parallel
+WORKER_STATE: dict = {}
+
+# part of the anytime budget kept for the search of the fallback cover
+RESERVE: float = 0.25
+
 
 class InvalidInputException(Exception):
     def __init__(self) -> None:
@@ -43,6 +69,11 @@ class UndefinedBehaviourException(Exception):
         super().__init__('Undefined behaviour has been obserbed')
 
 
+class CancelledException(Exception):
+    def __init__(self) -> None:
+        super().__init__('Minimization has been cancelled')
+
+
 def data_validation(first: List[int], second: List[int]) -> bool:
     """
     This function checks if intersection of given lists are empty and
@@ -68,450 +99,879 @@ def bit_length(*sequences: List[int]) -> int:
     return len(bin(max(chain(*sequences)))) - 2
 
 
-def one_and_zeros_to_True_and_False(line: str) -> List[bool]:
+def output_parsing(output: CubeMatrix) -> CubeMatrix:
     """
-    This function converts string of one and zerios into a list of
-    True or False
-    :param line: string containing only one and zeros
-    :type line: str
-    :returns: list of True or False
-    :rtype: list of bools
+    This function removes repeated implicants keeping the first ones
+    :param output: implicant masks
+    :type output: cube matrix
+    :returns: unique implicant masks
+    :rtype: cube matrix
     """
-    return [True if char == '1' else False for char in line]
+    return list(dict.fromkeys(output))
 
 
-def parse_input(sequence: List[int], length: int) -> Matrix:
+def implicant_string(implicant: Cube) -> str:
     """
-    This function converts int inputs into it's "True False" form of given length
-    :param sequence: List of given inputs from F or R
-    :type sequence: list of ints
-    :param length: Number of bits of max from F and R
+    This function converts implicant masks into text, variables from the
+    most significant, it is the only place where implicants become text
+    :param implicant: care mask and value mask
+    :type implicant: tuple of int
+    :returns: implicant like "x3x1`", "x" when no bit is specified
+    :rtype: str
+    """
+    care, value = implicant
+    return 'x' + 'x'.join(f'{i}' if value >> i & 1 else f'{i}`'
+                          for i in reversed(range(care.bit_length()))
+                          if care >> i & 1)
+
+
+def last_matrix_setting(
+        fmatrix: PackedMatrix,
+        op: CubeMatrix,
+        length: int,
+        chunk_size: int = 1 << 26
+        ) -> PackedMatrix:
+    """
+    This function sets last matrix wchich must be to processed, a bit is
+    set if the implicant covers the F row, the whole table is computed
+    with numpy for chunks of F rows at once
+    :param fmatrix: packed F cube
+    :type fmatrix: packed matrix
+    :param op: implicant masks
+    :type op: cube matrix
+    :param length: bit length of the greatest number
     :type length: int
-    :returns: List of strings containing binary form of inputs
-    :rtype: list of strs
+    :param chunk_size: maximal number of cells of a single chunk
+    :type chunk_size: int
+    :returns: packed last matrix, the first implicant is the most
+        significant bit of a row
+    :rtype: packed matrix
     """
-    return [one_and_zeros_to_True_and_False(f'{bin(bits)[2:]:0>{length}}')
-            for bits in sequence]
+    if length > 64 or not op:
+        bits = [1 << (len(op) - 1 - j) for j in range(len(op))]
+        return [sum(bit for bit, (care, value) in zip(bits, op)
+                    if not (line ^ value) & care) for line in fmatrix]
+    output = []
+    for covered in last_matrix_chunks(fmatrix, op, chunk_size):
+        output.extend(pack_rows(covered))
+    return output
 
 
-def bit_swaping(sequence: Matrix, swapper: str) -> Matrix:
+def last_matrix_chunks(
+        fmatrix: PackedMatrix,
+        op: CubeMatrix,
+        chunk_size: int = 1 << 26
+        ) -> Iterator[np.ndarray]:
     """
-    This function swapping '1' and '0' in proper index of every element
-    in sequence if under corresponding index in swapper is '1'
-    :param sequence: list of strings, all the same length representing binary
-        forms of numbers
-    :type sequence: list of str
-    :param swapper: string consisting of '0' and '1' of the same length as
-        every element in sequence
-    :type swapper: str
-    :returns: list of strings of the same size as given but with swapped
-        suitable indexes
-    :rtype: list of str
+    This function yields the last matrix as boolean arrays of chunks of
+    F rows, implicants are columns in their order
+    :param fmatrix: packed F cube, numbers are not greater than 64 bits
+    :type fmatrix: packed matrix
+    :param op: not empty list of implicant masks
+    :type op: cube matrix
+    :param chunk_size: maximal number of cells of a single chunk
+    :type chunk_size: int
+    :returns: chunks of the last matrix
+    :rtype: iterator of numpy arrays
     """
-    for i, bit in enumerate(swapper):
-        if bit:
-            for j in range(len(sequence)):
-                sequence[j][i] = not sequence[j][i]
-    return sequence
+    care, value = (np.asarray(x, dtype=np.uint64) for x in zip(*op))
+    step = max(1, chunk_size // len(op))
+    for start in range(0, len(fmatrix), step):
+        lines = np.asarray(fmatrix[start:start + step],
+                           dtype=np.uint64)[:, None]
+        yield ((lines ^ value) & care) == 0
 
 
-def list_sorting(sequence: Matrix) -> Matrix:
+def pack_rows(matrix: np.ndarray) -> PackedMatrix:
     """
-    This function sorts list of strings first by number of '1' in then
-    second by value of them
-    :param sequence: list of strings, all the same length representing
-        binary forms of numbers
-    :type sequence: list of str
-    :returns: Sorted list of strings
-    :rtype: list od str
+    This function packs rows of boolean array into ints, the first column
+    becomes the most significant bit
+    :param matrix: boolean array
+    :type matrix: numpy array
+    :returns: packed rows
+    :rtype: packed matrix
     """
-    return sorted(sequence, key=lambda x: (x.count(True), x))
+    shift = -matrix.shape[1] % 8
+    return [int.from_bytes(row.tobytes(), 'big') >> shift
+            for row in np.packbits(matrix, axis=1)]
 
 
-def line_strength(left: str, right: str) -> bool:
+def unique_rows(matrix: np.ndarray) -> np.ndarray:
     """
-    This function check if rihgt has ones in the same spots as left
-    left and right must have same length
-    :param left: potentially 'stronger' line
-    :type left: str
-    :param right: potentially 'weaker' line
-    :type right: str
-    :returns: False if right don't have one in all corresponding places
-    :rtype: bool
+    This function removes repeated rows of boolean array, rows are
+    compared as packed bytes
+    :param matrix: boolean array
+    :type matrix: numpy array
+    :returns: unique rows sorted like packed rows
+    :rtype: numpy array
     """
-    for lchar, rchar in zip(left, right):
-        if lchar and not rchar:
-            return False
-    return True
+    packed = np.packbits(matrix, axis=1)
+    _, index = np.unique(packed.view(np.dtype((np.void, packed.shape[1]))),
+                         return_index=True)
+    return matrix[index]
 
 
-def line_parsing(sequence: Matrix) -> Matrix:
+def absorb_rows(matrix: np.ndarray) -> np.ndarray:
     """
-    This function removes unnecesary lines from matrix
-    :param sequence: list of strings, all the same length representing binary
-        forms of numbers
-    :type sequence: list of str
-    :returns: parsed sequence
-    :rtype: list of str
+    This function is a boolean array counterpart of line_parsing_packed,
+    repeated rows and rows containing other rows are removed, every layer
+    of rows with the same number of ones is compared with all rows before
+    it with a product of matrixes, rows removed before are contained in
+    kept ones so they do not change the result
+    :param matrix: boolean array
+    :type matrix: numpy array
+    :returns: kept rows sorted like in list_sorting_packed
+    :rtype: numpy array
+    """
+    matrix = unique_rows(matrix)
+    count = matrix.sum(axis=1)
+    order = np.argsort(count, kind='stable')
+    matrix, count = matrix[order], count[order]
+    values, keep = matrix.astype(np.float32), np.ones(len(matrix), bool)
+    bounds = np.searchsorted(count, np.unique(count)).tolist()
+    for start, stop in zip(bounds[1:], bounds[2:] + [len(matrix)]):
+        outside = values[:start] @ (1 - values[start:stop]).T
+        keep[start:stop] = outside.all(axis=0)
+    return matrix[keep]
+
+
+def labels_string(value: Tuple[Cube, ...], predone: CubeMatrix) -> str:
     """
-    for i, comp in enumerate(sequence):
-        for j in range(len(sequence) - 1, i, -1):
-            if line_strength(comp, sequence[j]):
-                del sequence[j]
-    return sequence
+    This function creates output
+    :param value: implicants have to be add
+    :type value: tuple of tuples of int
+    :param predone: list of must be implicants
+    :type predone: cube matrix
+    :returns: joined string
+    :rtype: str
+    """
+    return ' + '.join(map(implicant_string, chain(value, predone)))
 
 
-def get_column_count(columns: Matrix) -> Matrix:
+def predone_string(predone: CubeMatrix) -> str:
     """
-    This function return number of '1' in each column of given list of strings
-    column mean collection of i index from every string in given list
-    :param columns: list of strings, all the same length representing binary
-        forms of numbers
-    :type columns: list of str
-    :returns: number of '1' in each column
-    :rtype: list of int
+    This function also creates output
+    :param predone: list of must be implicants
+    :type predone: cube matrix
+    :returns: joined string or nothing
+    :rtype: str or None
     """
-    return [list(column).count(True) for column in columns]
+    return labels_string((), predone)
 
 
-def column_sorting(columns: Matrix) -> Matrix:
+def parse_input_packed(sequence: List[int]) -> PackedMatrix:
     """
-    This function sorts column form left to right by number of '1' in each
-        column
-    (columns containing the most '1' are in the left)
-    :param columns: list of strings, all the same length representing
-        binary forms of numbers
-    :type columns: list of str
-    :returns: sorted list of input
-    :rtype: list of str
+    This function converts int inputs into it's packed form, packed form
+    of a minterm is the minterm itself so the length is not needed
+    :param sequence: List of given inputs from F or R
+    :type sequence: list of ints
+    :returns: packed cube
+    :rtype: packed matrix
     """
-    return np.array([x for x, _ in list(sorted(zip(columns,
-                    get_column_count(columns)),
-                    key=lambda x: x[1], reverse=True))])
+    return list(sequence)
 
 
-def label_setting(swapper: str) -> List[str]:
+def bit_swaping_packed(sequence: PackedMatrix, swapper: int) -> PackedMatrix:
     """
-    This function is setting a label
-    :param swapper: one element of F cube
-    :type swapper: str
-    :returns: label
-    :rtype: list of str
+    This function swaps bits of every row where the swapper has ones, it
+    does not modify given sequence
+    :param sequence: packed r cube
+    :type sequence: packed matrix
+    :param swapper: one element of packed F cube
+    :type swapper: int
+    :returns: packed b matrix
+    :rtype: packed matrix
     """
-    return list(reversed([f'L{i}' if x else f'L{i}`'
-                for i, x in enumerate(reversed(swapper))]))
+    return [row ^ swapper for row in sequence]
 
 
-def label_sorting(label: List[str], count: List[int]) -> List[str]:
+def list_sorting_packed(sequence: PackedMatrix) -> PackedMatrix:
     """
-    This function forts labels in te same way as columns are sorted
-    :param label: just a labels
-    :type label: list of str
-    :param count: count of ones in each column
-    :type count: list of int
-    :returns: sorted labels
-    :rtype: list of str
+    This function sorts packed rows first by number of ones then by value
+    :param sequence: packed matrix
+    :type sequence: packed matrix
+    :returns: sorted packed matrix
+    :rtype: packed matrix
+    """
+    return sorted(sequence, key=lambda x: (x.bit_count(), x))
+
+
+def line_strength_packed(left: int, right: int) -> bool:
     """
-    return [x for x, _ in
-            sorted(zip(label, count), key=lambda x: x[1], reverse=True)]
+    This function check if right has ones in the same spots as left
+    :param left: potentially 'stronger' line
+    :type left: int
+    :param right: potentially 'weaker' line
+    :type right: int
+    :returns: False if right don't have one in all corresponding places
+    :rtype: bool
+    """
+    return left & ~right == 0
 
 
-def remove_column(sequence: Matrix, index: int) -> None:
+def line_parsing_packed(sequence: PackedMatrix) -> PackedMatrix:
     """
-    This function remove column of a given index from a cube
-    :param sequence: b cube
-    :type sequence: matrix
-    :param index: index of comuln to be removed
-    :type index: int
+    This function removes unnecesary lines from packed matrix
+    :param sequence: sorted packed matrix
+    :type sequence: packed matrix
+    :returns: parsed sequence
+    :rtype: packed matrix
     """
-    for column in sequence:
-        del column[index]
+    output = []
+    for row in sequence:
+        if not any(line_strength_packed(comp, row) for comp in output):
+            output.append(row)
+    return output
 
 
-def get_column(sequnece: Matrix, index: int) -> List[bool]:
+def get_column_count_packed(sequence: PackedMatrix, length: int) -> List[int]:
     """
-    This function retunrs comumn of a given index
-    :param sequence: b cube
-    :type sequence: matrix
-    :param index: index o column to be returned
-    :type index: int
-    :returns: column of a given index
-    :rtype: list of bools
+    This function return number of ones in each column of packed matrix,
+    columns are ordered from the most significant bit
+    :param sequence: packed matrix
+    :type sequence: packed matrix
+    :param length: number of columns
+    :type length: int
+    :returns: number of ones in each column
+    :rtype: list of int
     """
-    return [row[index] for row in sequnece]
+    return [sum(row >> bit & 1 for row in sequence)
+            for bit in reversed(range(length))]
 
 
-def print_matrix(sequence: Matrix) -> None:
+def column_sorting_packed(sequence: PackedMatrix, length: int) -> List[int]:
     """
-    This function was used to print matrixes in more
-    familiar form in the console
-    :param sequence: matrix to be printed
-    :type sequence: matrix
+    This function returns column masks sorted form left to right by number
+    of ones in each column, the rows are not modified
+    :param sequence: packed matrix
+    :type sequence: packed matrix
+    :param length: number of columns
+    :type length: int
+    :returns: sorted column masks
+    :rtype: list of int
     """
-    result = ''
-    for row in sequence:
-        result += '"'
-        for bit in row:
-            result += '1' if bit else '0'
-        result += '", '
-    print('[' + result[:-2] + ']')
+    return [1 << (length - 1 - i) for i, _ in
+            sorted(enumerate(get_column_count_packed(sequence, length)),
+                   key=lambda x: x[1], reverse=True)]
+
+
+def label_setting_packed(swapper: int, length: int) -> CubeMatrix:
+    """
+    This function is setting a label for packed row, labels are masks of
+    single literals
+    :param swapper: one element of packed F cube
+    :type swapper: int
+    :param length: bit length of the greatest number
+    :type length: int
+    :returns: label
+    :rtype: cube matrix
+    """
+    return [(1 << i, swapper & 1 << i) for i in reversed(range(length))]
 
 
-def pre_parsing_column(sequence: Matrix, label: List[str]) -> List[str]:
+def pre_parsing_column_packed(
+        sequence: PackedMatrix,
+        columns: List[int],
+        label: CubeMatrix
+        ) -> CubeMatrix:
     """
-    This function removes columns which contain only zeros
-    removes rows which contain only one one and return label of it one
-    :param sequence: b cube
-    :type sequence: matrix
+    This function removes columns which contain only zeros and rows
+    which contain a single one, labels of their columns are returned
+    :param sequence: packed b cube
+    :type sequence: packed matrix
+    :param columns: sorted column masks
+    :type columns: list of int
     :param label: sorted label
-    :type label: list of str
+    :type label: cube matrix
     :returns: must be laleb in all impicants if such a one exists
-    :rtype: list of str
+    :rtype: cube matrix
     """
     minimal = []
-    for i in reversed(range(len(sequence[0]))):
-        if not any(get_column(sequence, i)):
-            remove_column(sequence, i)
+    for i in reversed(range(len(columns))):
+        if not any(row & columns[i] for row in sequence):
+            del columns[i]
             del label[i]
     for i in reversed(range(len(sequence))):
-        count = sequence[i].count(True)
+        count = sequence[i].bit_count()
         if not count:
             raise UndefinedBehaviourException()
         if count == 1:
-            index = sequence[i].index(True)
+            index = columns.index(sequence[i])
             minimal.append(label.pop(index))
             del sequence[i]
-            remove_column(sequence, index)
+            mask = ~columns.pop(index)
+            sequence[:] = [row & mask for row in sequence]
     return minimal
 
 
-def is_ones(sequence: Matrix, label: List[str], combi: List[str]) -> List[str]:
+def label_combinations_packed(
+        labels: CubeMatrix,
+        columns: List[int],
+        sequence: PackedMatrix,
+        deadline: float | None = None,
+        check: Check = None
+        ) -> List[Tuple[Cube, ...]]:
     """
-    This function chcecs if any of given combinations covers all row if yes
-    returns all combinations which matche the requirements
-    :param sequence: b matrix
-    :type sequence: matrix
-    :param label: labels
-    :type label: list of str
-    :param combi: combinations of labels of the same length
-    :type combi: list of str
-    :returns: list containing combinations which match the
-        requirements or empty list
-    :rtype: list of str or empty list
+    This function returns implicants of every minimum cover of the matrix
+    :param labels: labels of matrix(stripped)
+    :type labels: cube matrix
+    :param columns: column masks of matrix(stripped)
+    :type columns: list of int
+    :param sequence: packed b matrix(stripped)
+    :type sequence: packed matrix
+    :param deadline: value of time.perf_counter, None for no deadline
+    :type deadline: float or None
+    :param check: function called whenever the deadline is checked, it
+        may raise CancelledException
+    :type check: callable[[], None] or None
+    :returns: list of implicants which needs to be merged if needed
+    :rtype: list of tuples of tuples of int
+    :raises UndefinedBehaviourException: when matrix cannot be covered
+    :raises DeadlineException: when the deadline passes
     """
-    output = []
-    for possible in list(combi):
-        hold = sequence[:]
-        for check in possible:
-            if hold:
-                for i in range(len(label)):
-                    if label[i] == check:
-                        for k in reversed(range(len(hold))):
-                            if hold[k][i]:
-                                del hold[k]
-        if not hold:
-            output.append(possible)
-    return output
+    return list(iter_label_combinations_packed(labels, columns, sequence,
+                                               deadline, check))
 
 
-def output_parsing(output: List[List[str]]) -> List[str]:
+def iter_label_combinations_packed(
+        labels: CubeMatrix,
+        columns: List[int],
+        sequence: PackedMatrix,
+        deadline: float | None = None,
+        check: Check = None
+        ) -> Iterator[Tuple[Cube, ...]]:
     """
-    This function parse implicants
-    :param output: list of strings whcich have to be joined together
-    :type output: list of list of str
-    :returns: joined list
-    :rtype: list of str
+    This function is a lazy counterpart of label_combinations_packed,
+    only the current cover is kept in memory
+    :param labels: labels of matrix(stripped)
+    :type labels: cube matrix
+    :param columns: column masks of matrix(stripped)
+    :type columns: list of int
+    :param sequence: packed b matrix(stripped)
+    :type sequence: packed matrix
+    :param deadline: value of time.perf_counter, None for no deadline
+    :type deadline: float or None
+    :param check: function called whenever the deadline is checked, it
+        may raise CancelledException
+    :type check: callable[[], None] or None
+    :returns: implicants which needs to be merged if needed
+    :rtype: iterator of tuples of tuples of int
+    :raises UndefinedBehaviourException: when matrix cannot be covered
+    :raises DeadlineException: when the deadline passes
     """
-    return list(dict.fromkeys(['x' + 'x'.join(line) for line in output]))
-
-
-def implicants(outputparsed: List[str]) -> List[List[str]]:
+    rows = [sum(1 << i for i, column in enumerate(columns) if row & column)
+            for row in sequence]
+    found = False
+    for cover in iter_minimum_covers(rows, len(labels), deadline=deadline,
+                                     check=check):
+        found = True
+        yield tuple(labels[i] for i in cover)
+    if not found:
+        raise UndefinedBehaviourException()
+
+
+def covering_implicants_packed(
+        rows: PackedMatrix,
+        columns: List[int],
+        labels: CubeMatrix,
+        not_labels_join: Callable[[CubeMatrix], Cube | str],
+        lables_join: Callable[[Tuple[Cube, ...], CubeMatrix], Cube | str],
+        deadline: float | None = None,
+        lazy: bool = False,
+        check: Check = None
+        ) -> Tuple[Cube | str | list | Iterator, bool]:
     """
-    This function split implicants by x
-    :param outputparsed: list of implicants
-    :type outputparsed: list of str
-    :returns: separated implicants
-    :rtype: list of list of str
+    This function joins implicants of already parsed and sorted packed
+    b matrix, given rows, columns and labels are modified
+    :param rows: parsed and sorted packed b matrix
+    :type rows: packed matrix
+    :param columns: sorted column masks
+    :type columns: list of int
+    :param labels: sorted labels
+    :type labels: cube matrix
+    :param not_labels_join: function called when label list is empty
+    :type not_labels_join: callable[[cube matrix], tuple of int or str]
+    :param lables_join: function called when label list is not empty
+    :type lables_join: callable[[tuple, cube matrix], tuple of int or str]
+    :param deadline: value of time.perf_counter, None for no deadline
+    :type deadline: float or None
+    :param lazy: if the list of implicants should be an iterator
+    :type lazy: bool
+    :param check: function called whenever the deadline is checked, it
+        may raise CancelledException
+    :type check: callable[[], None] or None
+    :returns: joined implicants and flag telling if there is a list of them
+    :rtype: tuple of joined implicant, list or iterator of them and bool
     """
-    return [item.split('x')[1:] for item in outputparsed]
-
-
-def implicants_binary(implicants: List[str], length: int) -> List[List[str]]:
+    if tracing.ACTIVE:
+        tracing.count('pre_parsing_column.rows_before', len(rows))
+        tracing.count('pre_parsing_column.columns_before', len(columns))
+    with tracing.phase('pre_parsing_column'):
+        predone = pre_parsing_column_packed(rows, columns, labels)
+    if tracing.ACTIVE:
+        tracing.count('pre_parsing_column.rows_after', len(rows))
+        tracing.count('pre_parsing_column.columns_after', len(columns))
+    if not labels:
+        return not_labels_join(predone), False
+    if lazy:
+        return (lables_join(value, predone) for value in
+                iter_label_combinations_packed(labels, columns, rows,
+                                               deadline, check)), True
+    with tracing.phase('label_combinations'):
+        combinations = label_combinations_packed(labels, columns, rows,
+                                                 deadline, check)
+    return [lables_join(value, predone) for value in combinations], True
+
+
+def joining_implicants_packed(
+        sequence: PackedMatrix,
+        length: int,
+        label: CubeMatrix,
+        not_labels_join: Callable[[CubeMatrix], Cube | str],
+        lables_join: Callable[[Tuple[Cube, ...], CubeMatrix], Cube | str],
+        deadline: float | None = None,
+        lazy: bool = False,
+        check: Check = None
+        ) -> Tuple[Cube | str | list | Iterator, bool]:
     """
-    This function change implicants into "cube form"
-    :param implicants: just implicants
-    :type implicants: list of str
-    :param length: bit length of the grates number
+    This function joins implicants of packed b matrix, its rows are
+    sorted and parsed first and its columns are sorted by number of ones
+    :param sequence: packed b matrix
+    :type sequence: packed matrix
+    :param length: number of columns
     :type length: int
-    :returns: "cube form" of inputs
-    :rtype: list of list of str
-    """
-    hold = []
-    for implicant in implicants:
-        hold.append(list())
-        x = 0
-        for j in reversed(range(0, length)):
-            if x < len(implicant):
-                if int(implicant[x][0]) == j:
-                    hold[-1].append(True if len(implicant[x]) == 1 else False)
-                    x += 1
-                else:
-                    hold[-1].append('*')
-            else:
-                hold[-1].append('*')
-    return hold
-
-
-def row_setting(sequence: Matrix, label: str) -> bool:
-    """
-    This function set a row of last matrix
-    :param sequence: list of implicants formed to a matrix
-    :type sequence: matrix
-    :param label: list of implicants
-    :type label: list of str
-    :param i, j: look at last_matrix_setting() function
-    :type label: list of str
-    :returns: True or False
-    :rtype: bool
+    :param label: labels of columns
+    :type label: cube matrix
+    :param not_labels_join: function called when label list is empty
+    :type not_labels_join: callable[[cube matrix], tuple of int or str]
+    :param lables_join: function called when label list is not empty
+    :type lables_join: callable[[tuple, cube matrix], tuple of int or str]
+    :param deadline: value of time.perf_counter, None for no deadline
+    :type deadline: float or None
+    :param lazy: if the list of implicants should be an iterator
+    :type lazy: bool
+    :param check: function called whenever the deadline is checked, it
+        may raise CancelledException
+    :type check: callable[[], None] or None
+    :returns: joined implicants and flag telling if there is a list of them
+    :rtype: tuple of joined implicant, list or iterator of them and bool
+    """
+    with tracing.phase('line_parsing'):
+        rows = line_parsing_packed(list_sorting_packed(sequence))
+    if tracing.ACTIVE:
+        tracing.count('line_parsing.rows_before', len(sequence))
+        tracing.count('line_parsing.rows_after', len(rows))
+    columns = column_sorting_packed(rows, length)
+    labels = [label[length - column.bit_length()] for column in columns]
+    return covering_implicants_packed(rows, columns, labels,
+                                      not_labels_join, lables_join, deadline,
+                                      lazy, check)
+
+
+def prepare_packed_input(
+        first: List[int],
+        second: List[int]
+        ) -> Tuple[PackedMatrix, PackedMatrix, int]:
     """
-    for k in range(len(sequence)):
-        if '*' != label[k] != sequence[k]:
-            return False
-    return True
+    This function converts F and R lists into a tuple of packed F and R
+    matrixes and the number of their columns
+    :param first: list of int
+    :type first: F indexes
+    :param second: list of int
+    :type second: R indexes
+    :returns: packed F and R cubes and bit length
+    :rtype: tuple of packed matrixes and int
+    """
+    with tracing.phase('prepare_input'):
+        if data_validation(first, second):
+            raise InvalidInputException()
+        return (parse_input_packed(first), parse_input_packed(second),
+                bit_length(first, second))
 
 
-def last_matrix_setting(sequences: Matrix, labels: List[str]) -> Matrix:
+def implicant_join(value: Tuple[Cube, ...], predone: CubeMatrix) -> Cube:
     """
-    This function sets last matrix wchich must be to processed
-    :param sequence: list of implicants formed to a matrix
-    :type sequence: matrix
-    :param label: list of implicants
-    :type label: list of str
-    :returns: last matrix
-    :rtype: matrix
+    This function joins labels of one implicant
+    :param value: labels chosen by covering
+    :type value: tuple of tuples of int
+    :param predone: list of must be labels
+    :type predone: cube matrix
+    :returns: implicant masks
+    :rtype: tuple of int
     """
-    return [[row_setting(sequence, label) for label in labels]
-            for sequence in sequences]
+    care = mask = 0
+    for label_care, label_value in chain(value, predone):
+        care |= label_care
+        mask |= label_value
+    return care, mask
 
 
-def label_combinations(labels: List[str], columns: Matrix) -> List[str]:
+def predone_join(predone: CubeMatrix) -> Cube:
     """
-    This function returns implicants for each line of f matrix
-    :param labels: labels of matrix(stripped)
-    :type labels: list of str
-    :param columns: b matrix(strippend)
-    :type columns: matrix
-    :returns: list of implicants which needs to be merged if needed
-    :rtype: list of str
+    This function joins labels of implicant made only of must be labels
+    :param predone: list of must be labels
+    :type predone: cube matrix
+    :returns: implicant masks
+    :rtype: tuple of int
     """
-    for i in range(1, len(labels)):
-        if (combination := is_ones(columns, labels, combinations(labels, i))):
-            return combination
-    raise Exception()
+    return implicant_join((), predone)
 
 
-def labels_string(value: List[str], predone: List[str]) -> str:
+def expand_packed(
+        fmatrix: PackedMatrix,
+        rmatrix: PackedMatrix,
+        length: int,
+        progress: Progress = None
+        ) -> Expansion:
     """
-    This function creates output
-    :param value: implicants have to be add
-    :type value: list of str
-    :param predone: list of must be implicants
-    :type predone: list of str
-    :returns: joined string
-    :rtype: str
+    This function yields implicants of every F row using packed cubes
+    :param fmatrix: packed F cube
+    :type fmatrix: packed matrix
+    :param rmatrix: packed R cube
+    :type rmatrix: packed matrix
+    :param length: bit length of the greatest number
+    :type length: int
+    :param progress: function called with numbers of done and all F rows
+        after each row, it may raise CancelledException
+    :type progress: callable[[int, int], None] or None
+    :returns: implicant masks of each row and flags telling if there is a
+        list of them
+    :rtype: iterator of tuples of implicant masks or cube matrix and bool
+    """
+    for done, line in enumerate(fmatrix, 1):
+        yield joining_implicants_packed(
+            bit_swaping_packed(rmatrix, line), length,
+            label_setting_packed(line, length), predone_join,
+            implicant_join)
+        if progress:
+            progress(done, len(fmatrix))
+
+
+def blocking_tensor(
+        fmatrix: PackedMatrix,
+        rmatrix: PackedMatrix,
+        length: int
+        ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    This function builds b matrixes of all given F rows at once
+    :param fmatrix: packed F cube
+    :type fmatrix: packed matrix
+    :param rmatrix: packed R cube
+    :type rmatrix: packed matrix
+    :param length: bit length of the greatest number
+    :type length: int
+    :returns: |F| x |R| packed b matrixes and their |F| x |R| x length
+        bits, the most significant bit first
+    :rtype: tuple of numpy arrays
+    """
+    packed = np.bitwise_xor.outer(np.asarray(fmatrix, dtype=np.uint64),
+                                  np.asarray(rmatrix, dtype=np.uint64))
+    bits = np.empty(packed.shape + (length,), dtype=np.uint8)
+    plane = np.empty_like(packed)
+    for i in range(length):
+        np.right_shift(packed, np.uint64(length - 1 - i), out=plane)
+        np.bitwise_and(plane, np.uint64(1), out=plane)
+        bits[..., i] = plane
+    return packed, bits
+
+
+def line_parsing_array(sequence: np.ndarray, count: np.ndarray) -> np.ndarray:
+    """
+    This function is a vectorized counterpart of line_parsing_packed,
+    rows are compared layer by layer of their number of ones
+    :param sequence: packed b matrix
+    :type sequence: numpy array
+    :param count: number of ones in each row
+    :type count: numpy array
+    :returns: indexes of kept rows sorted like in list_sorting_packed
+    :rtype: numpy array
+    """
+    _, index = np.unique(sequence, return_index=True)
+    index = index[np.lexsort((sequence[index], count[index]))]
+    kept, output = sequence[:0], []
+    for layer in np.unique(count[index]):
+        current = index[count[index] == layer]
+        if kept.size:
+            current = current[~((kept[None, :] & ~sequence[current, None])
+                                == 0).any(axis=1)]
+        output.append(current)
+        kept = np.concatenate((kept, sequence[current]))
+    return np.concatenate(output) if output else index
+
+
+def expand_batched(
+        fmatrix: PackedMatrix,
+        rmatrix: PackedMatrix,
+        length: int,
+        chunk_size: int = 1 << 26,
+        progress: Progress = None
+        ) -> Expansion:
     """
-    output = ''.join(value)
-    output += ' + ' if value and predone else ''
-    return output + ' + '.join(predone)
+    This function yields implicants of every F row, b matrixes, their
+    column counts and orders are computed for chunks of F rows at once
+    :param fmatrix: packed F cube
+    :type fmatrix: packed matrix
+    :param rmatrix: packed R cube
+    :type rmatrix: packed matrix
+    :param length: bit length of the greatest number
+    :type length: int
+    :param chunk_size: maximal number of bytes of arrays of a single chunk
+    :type chunk_size: int
+    :param progress: function called with numbers of done and all F rows
+        after each row, it may raise CancelledException
+    :type progress: callable[[int, int], None] or None
+    :returns: implicant masks of each row and flags telling if there is a
+        list of them
+    :rtype: iterator of tuples of implicant masks or cube matrix and bool
+    """
+    if length > 64:
+        yield from expand_packed(fmatrix, rmatrix, length, progress)
+        return
+    # packed rows, a bit plane and counts take 17 bytes per b matrix row
+    step = max(1, chunk_size // max(1, len(rmatrix) * (length + 17)))
+    for start in range(0, len(fmatrix), step):
+        lines = fmatrix[start:start + step]
+        packed, bits = blocking_tensor(lines, rmatrix, length)
+        counts = bits.sum(axis=2, dtype=np.uint8)
+        with tracing.phase('line_parsing'):
+            indexes = [line_parsing_array(packed[i], counts[i])
+                       for i in range(len(lines))]
+        if tracing.ACTIVE:
+            tracing.count('line_parsing.rows_before', packed.size)
+            tracing.count('line_parsing.rows_after',
+                          sum(map(len, indexes)))
+        for done, (line, row, column, index) in enumerate(
+                zip(lines, packed, bits, indexes), start + 1):
+            order = np.argsort(-column[index].sum(axis=0, dtype=np.int64),
+                               kind='stable')
+            label = label_setting_packed(line, length)
+            yield covering_implicants_packed(
+                row[index].tolist(),
+                [1 << (length - 1 - i) for i in order.tolist()],
+                [label[i] for i in order.tolist()], predone_join,
+                implicant_join)
+            if progress:
+                progress(done, len(fmatrix))
+
+
+def share_rmatrix(rmatrix: PackedMatrix) -> shared_memory.SharedMemory:
+    """
+    This function places packed R cube in a new block of shared memory
+    :param rmatrix: packed R cube
+    :type rmatrix: packed matrix
+    :returns: shared memory holding R cube as uint64 array
+    :rtype: shared memory
+    """
+    memory = shared_memory.SharedMemory(create=True,
+                                        size=max(1, len(rmatrix)) * 8)
+    np.ndarray((len(rmatrix),), dtype=np.uint64,
+               buffer=memory.buf)[:] = rmatrix
+    return memory
 
 
-def predone_string(predone: List[str]) -> str:
+def attach_rmatrix(name: str, size: int) -> None:
     """
-    This function also creates output
-    :param predone: list of must be implicants
-    :type predone: list of str
-    :returns: joined string or nothing
-    :rtype: str or None
+    This function initializes worker process with R cube from shared memory
+    :param name: name of shared memory block
+    :type name: str
+    :param size: number of rows of R cube
+    :type size: int
     """
-    return ' + '.join(predone)
+    memory = shared_memory.SharedMemory(name=name)
+    WORKER_STATE['memory'] = memory
+    WORKER_STATE['rmatrix'] = np.ndarray((size,), dtype=np.uint64,
+                                         buffer=memory.buf)
 
 
-def joining_implicants(
-        sequence: Matrix,
-        label: List[str],
-        not_labels_join: Callable[[List[str]], str],
-        lables_join: Callable[[List[str], List[str]], str]
-        ) -> Tuple[List[str], bool]:
+def expand_chunk(
+        fmatrix: PackedMatrix,
+        length: int,
+        batched: bool
+        ) -> List[Tuple[Cube | CubeMatrix, bool]]:
     """
-    This function
-    :param sequence:
-    :type sequence:
-    :param label:
-    :type label:
-    :param not_labels_join: function called when label list is empty
-    :type not_labels_join: callable[[list[str]], str]
-    :param lables_join: function called when label list is not empty
-    :type lables_join: callable[[list[str], list[str]], str]
-    :returns:
-    :rtype:
-    """
-    columns = np.transpose(line_parsing(list_sorting(sequence)))
-    labels = label_sorting(label, get_column_count(columns))
-    columns = [list(x) for x in np.transpose(column_sorting(columns))]
-    predone = pre_parsing_column(columns, labels)
-    if not labels:
-        return not_labels_join(predone), False
-    return [lables_join(value, predone)
-            for value in label_combinations(labels, columns)], True
+    This function expands chunk of F rows against R cube of the worker
+    :param fmatrix: chunk of packed F cube
+    :type fmatrix: packed matrix
+    :param length: bit length of the greatest number
+    :type length: int
+    :param batched: if b matrixes should be built with numpy at once
+    :type batched: bool
+    :returns: implicant masks of each row and flags telling if there is a
+        list of them
+    :rtype: list of tuples of implicant masks or cube matrix and bool
+    """
+    if batched:
+        return list(expand_batched(fmatrix, WORKER_STATE['rmatrix'], length))
+    if 'rows' not in WORKER_STATE:
+        WORKER_STATE['rows'] = WORKER_STATE['rmatrix'].tolist()
+    return list(expand_packed(fmatrix, WORKER_STATE['rows'], length))
+
+
+def expand_parallel(
+        fmatrix: PackedMatrix,
+        rmatrix: PackedMatrix,
+        length: int,
+        workers: int,
+        batched: bool = False,
+        progress: Progress = None
+        ) -> Expansion:
+    """
+    This function yields implicants of every F row, chunks of F rows are
+    expanded by a pool of processes sharing one copy of R cube
+    :param fmatrix: packed F cube
+    :type fmatrix: packed matrix
+    :param rmatrix: packed R cube
+    :type rmatrix: packed matrix
+    :param length: bit length of the greatest number
+    :type length: int
+    :param workers: number of processes
+    :type workers: int
+    :param batched: if b matrixes should be built with numpy at once
+    :type batched: bool
+    :param progress: function called with numbers of done and all F rows
+        after each chunk, it may raise CancelledException
+    :type progress: callable[[int, int], None] or None
+    :returns: implicant masks of each row in order of F rows and flags
+        telling if there is a list of them
+    :rtype: iterator of tuples of implicant masks or cube matrix and bool
+    """
+    if length > 64 or workers < 2 or len(fmatrix) < 2:
+        yield from (expand_batched if batched else expand_packed)(
+            fmatrix, rmatrix, length, progress=progress)
+        return
+    step = -(-len(fmatrix) // (workers * 4))
+    chunks = [fmatrix[i:i + step] for i in range(0, len(fmatrix), step)]
+    memory = share_rmatrix(rmatrix)
+    try:
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=attach_rmatrix,
+                                 initargs=(memory.name, len(rmatrix))
+                                 ) as executor:
+            done = 0
+            try:
+                for result in executor.map(expand_chunk, chunks,
+                                           repeat(length), repeat(batched)):
+                    yield from result
+                    done += len(result)
+                    if progress:
+                        progress(done, len(fmatrix))
+            except BaseException:
+                executor.shutdown(cancel_futures=True)
+                raise
+    finally:
+        memory.close()
+        memory.unlink()
+
+
+def insert_implicants(rows: Expansion, inserter: Inserter) -> CubeMatrix:
+    """
+    This function gathers implicants of F rows with given inserter
+    :param rows: implicant masks of each row and flags telling if there is
+        a list of them
+    :type rows: iterator of tuples of implicant masks or cube matrix and
+        bool
+    :param inserter: function adding result of a row to the output
+    :type inserter: callable[[cube matrix, bool, tuple | cube matrix], None]
+    :returns: all implicant masks
+    :rtype: cube matrix
+    """
+    output = []
+    for result, flag in rows:
+        inserter(output, flag, result)
+    return output
 
 
-def prepare_input(
-        first: List[int],
-        second: List[int]
-        ) -> Tuple[Matrix, Matrix]:
+def first_part_packed(
+        fmatrix: PackedMatrix,
+        rmatrix: PackedMatrix,
+        length: int,
+        inserter: Inserter,
+        progress: Progress = None
+        ) -> CubeMatrix:
     """
-    This function converts F and R lists into a tuple of F and R matrixes
-    :param first: list of int
-    :type first: F indexes
-    :param second: list of int
-    :type second: R indexes
-    :returns: F and R cubes
-    :rtype: tuple of matrixes
+    This function return all implicants using packed cubes
+    :param fmatrix: packed F cube
+    :type fmatrix: packed matrix
+    :param rmatrix: packed R cube
+    :type rmatrix: packed matrix
+    :param length: bit length of the greatest number
+    :type length: int
+    :param inserter: function adding result of a row to the output
+    :type inserter: callable[[cube matrix, bool, tuple | cube matrix], None]
+    :param progress: function called with numbers of done and all F rows
+    :type progress: callable[[int, int], None] or None
+    :returns: all implicant masks
+    :rtype: cube matrix
     """
-    if data_validation(first, second):
-        raise InvalidInputException()
-    nobits = bit_length(first, second)
-    return parse_input(first, nobits), parse_input(second, nobits)
+    return insert_implicants(expand_packed(fmatrix, rmatrix, length,
+                                           progress=progress), inserter)
 
 
-def first_part(
-        fmatrix: List[int],
-        rmatrix: List[int],
-        inserter: Callable[[list[str], bool, str | list[str]], None]
-        ) -> List[List[str]]:
+def first_part_batched(
+        fmatrix: PackedMatrix,
+        rmatrix: PackedMatrix,
+        length: int,
+        inserter: Inserter,
+        progress: Progress = None
+        ) -> CubeMatrix:
     """
-    This function return all implicants
-    :param first: F indexes
-    :type first: list of int
-    :param second: R indexes
-    :type second: list of int
-    :returns: all implicants
-    :rtype: list of list of str
+    This function return all implicants, b matrixes are built with numpy
+    for chunks of F rows at once
+    :param fmatrix: packed F cube
+    :type fmatrix: packed matrix
+    :param rmatrix: packed R cube
+    :type rmatrix: packed matrix
+    :param length: bit length of the greatest number
+    :type length: int
+    :param inserter: function adding result of a row to the output
+    :type inserter: callable[[cube matrix, bool, tuple | cube matrix], None]
+    :param progress: function called with numbers of done and all F rows
+    :type progress: callable[[int, int], None] or None
+    :returns: all implicant masks
+    :rtype: cube matrix
     """
-    output = []
-    for line in fmatrix:
-        bmatrix = bit_swaping(deepcopy(rmatrix), line)
-        result, flag = joining_implicants(bmatrix, label_setting(line),
-                                          ''.join,
-                                          lambda x, y: ''.join(x) + ''.join(y))
-        inserter(output, flag, result)
-    return [sorted(line.split('L')[1:], reverse=True) for line in output]
+    return insert_implicants(expand_batched(fmatrix, rmatrix, length,
+                                            progress=progress), inserter)
+
+
+def first_part_parallel(
+        fmatrix: PackedMatrix,
+        rmatrix: PackedMatrix,
+        length: int,
+        inserter: Inserter,
+        workers: int,
+        batched: bool = False,
+        progress: Progress = None
+        ) -> CubeMatrix:
+    """
+    This function return all implicants, F rows are expanded by a pool
+    of processes and merged in their original order
+    :param fmatrix: packed F cube
+    :type fmatrix: packed matrix
+    :param rmatrix: packed R cube
+    :type rmatrix: packed matrix
+    :param length: bit length of the greatest number
+    :type length: int
+    :param inserter: function adding result of a row to the output
+    :type inserter: callable[[cube matrix, bool, tuple | cube matrix], None]
+    :param workers: number of processes
+    :type workers: int
+    :param batched: if b matrixes should be built with numpy at once
+    :type batched: bool
+    :param progress: function called with numbers of done and all F rows
+    :type progress: callable[[int, int], None] or None
+    :returns: all implicant masks
+    :rtype: cube matrix
+    """
+    return insert_implicants(expand_parallel(fmatrix, rmatrix, length,
+                                             workers, batched, progress),
+                             inserter)
 
 
 def append_or_extend(
-        output: list[str],
+        output: CubeMatrix,
         flag: bool,
-        result: str | list[str]
+        result: Cube | CubeMatrix
         ) -> None:
     if flag:
         output.extend(result)
@@ -519,60 +979,1298 @@ def append_or_extend(
         output.append(result)
 
 
+def expansion(
+        batched: bool,
+        workers: int | None = None,
+        progress: Progress = None
+        ) -> Callable[[PackedMatrix, PackedMatrix, int, Inserter],
+                      CubeMatrix]:
+    """
+    This function chooses implementation of the first part
+    :param batched: if b matrixes should be built with numpy at once
+    :type batched: bool
+    :param workers: number of processes, None to work in this process
+    :type workers: int or None
+    :param progress: function called with numbers of done and all F rows
+    :type progress: callable[[int, int], None] or None
+    :returns: first part function
+    :rtype: callable
+    """
+    if workers:
+        return partial(first_part_parallel, workers=workers, batched=batched,
+                       progress=progress)
+    return partial(first_part_batched if batched else first_part_packed,
+                   progress=progress)
+
+
+def progress_check(progress: Progress, total: int) -> Check:
+    """
+    This function turns the progress callback into the check of the cover
+    search, it is called with all rows done
+    :param progress: function called with numbers of done and all rows,
+        it may raise CancelledException
+    :type progress: callable[[int, int], None] or None
+    :param total: number of all rows
+    :type total: int
+    :returns: check of the cover search
+    :rtype: callable[[], None] or None
+    """
+    return None if progress is None else partial(progress, total, total)
+
+
+def systematic_packed(
+        fmatrix: PackedMatrix,
+        rmatrix: PackedMatrix,
+        length: int,
+        batched: bool = False,
+        workers: int | None = None,
+        progress: Progress = None,
+        lazy: bool = False
+        ) -> List[str] | Iterator[str]:
+    """
+    This function return optimalized function of already validated and
+    packed F and R cubes, minterms are minimized as cubes with every bit
+    specified
+    :param fmatrix: packed F cube
+    :type fmatrix: packed matrix
+    :param rmatrix: packed R cube
+    :type rmatrix: packed matrix
+    :param length: bit length of the greatest number
+    :type length: int
+    :param batched: if b matrixes should be built with numpy at once
+    :type batched: bool
+    :param workers: number of processes expanding F rows, None to work in
+        this process
+    :type workers: int or None
+    :param progress: function called with numbers of done and all F rows,
+        it may raise CancelledException
+    :type progress: callable[[int, int], None] or None
+    :param lazy: if minimum covers should be yielded one by one
+    :type lazy: bool
+    :returns: optimalized function
+    :rtype: list of str or iterator of str
+    """
+    return systematic_cubes_packed(*minterm_cubes(fmatrix, rmatrix, length),
+                                   batched, workers, progress, lazy)
+
+
+def final_cover(
+        fmatrix: PackedMatrix,
+        length: int,
+        op: CubeMatrix,
+        deadline: float | None = None,
+        lazy: bool = False,
+        check: Check = None
+        ) -> List[str] | Iterator[str]:
+    """
+    This function returns every minimum cover of F rows by implicants
+    :param fmatrix: packed F cube
+    :type fmatrix: packed matrix
+    :param length: bit length of the greatest number
+    :type length: int
+    :param op: implicant masks
+    :type op: cube matrix
+    :param deadline: value of time.perf_counter, None for no deadline
+    :type deadline: float or None
+    :param lazy: if minimum covers should be yielded one by one
+    :type lazy: bool
+    :param check: function called whenever the deadline is checked, it
+        may raise CancelledException
+    :type check: callable[[], None] or None
+    :returns: optimalized function
+    :rtype: list of str or iterator of str
+    :raises DeadlineException: when the deadline passes
+    """
+    if length > 64 or not op:
+        with tracing.phase('last_matrix_setting'):
+            matrix = last_matrix_setting(fmatrix, op, length)
+        return cover_implicants(matrix, op, deadline, lazy, check)
+    with tracing.phase('last_matrix_setting'):
+        chunks = [unique_rows(covered)
+                  for covered in last_matrix_chunks(fmatrix, op)]
+    with tracing.phase('final_cover'):
+        with tracing.phase('line_parsing'):
+            matrix = absorb_rows(np.concatenate(chunks))
+        if tracing.ACTIVE:
+            tracing.count('line_parsing.rows_before', len(fmatrix))
+            tracing.count('line_parsing.rows_after', len(matrix))
+        order = np.argsort(-matrix.sum(axis=0), kind='stable').tolist()
+        result, flag = covering_implicants_packed(
+            pack_rows(matrix), [1 << (len(op) - 1 - i) for i in order],
+            [op[i] for i in order], predone_string, labels_string,
+            deadline, lazy, check)
+    return iter([result]) if lazy and not flag else result
+
+
+def cover_implicants(
+        matrix: PackedMatrix,
+        op: CubeMatrix,
+        deadline: float | None = None,
+        lazy: bool = False,
+        check: Check = None
+        ) -> List[str] | Iterator[str]:
+    """
+    This function returns every minimum cover of the last matrix
+    :param matrix: packed last matrix, the first implicant is the most
+        significant bit of a row
+    :type matrix: packed matrix
+    :param op: implicant masks
+    :type op: cube matrix
+    :param deadline: value of time.perf_counter, None for no deadline
+    :type deadline: float or None
+    :param lazy: if minimum covers should be yielded one by one, only
+        the current one is kept in memory
+    :type lazy: bool
+    :param check: function called whenever the deadline is checked, it
+        may raise CancelledException
+    :type check: callable[[], None] or None
+    :returns: optimalized function
+    :rtype: list of str or iterator of str
+    :raises DeadlineException: when the deadline passes
+    """
+    with tracing.phase('final_cover'):
+        result, flag = joining_implicants_packed(
+            matrix, len(op), op, predone_string, labels_string, deadline,
+            lazy, check)
+    return iter([result]) if lazy and not flag else result
+
+
+def single_cover(
+        matrix: PackedMatrix,
+        op: CubeMatrix,
+        deadline: float | None = None,
+        check: Check = None
+        ) -> str:
+    """
+    This function returns one minimum cover of the last matrix, the one
+    found by the search for the minimum size, so covers are not enumerated
+    :param matrix: packed last matrix, the first implicant is the most
+        significant bit of a row
+    :type matrix: packed matrix
+    :param op: implicant masks
+    :type op: cube matrix
+    :param deadline: value of time.perf_counter, None for no deadline
+    :type deadline: float or None
+    :param check: function called whenever the deadline is checked, it
+        may raise CancelledException
+    :type check: callable[[], None] or None
+    :returns: optimalized function
+    :rtype: str
+    :raises DeadlineException: when the deadline passes
+    """
+    with tracing.phase('final_cover'):
+        cover, proven = best_cover(matrix, len(op), deadline, check=check)
+    if not proven:
+        raise DeadlineException()
+    return ' + '.join(implicant_string(op[len(op) - 1 - i])
+                      for i in reversed(cover))
+
+
 @benchmark
-def systematic(first: List[int], second: List[int]) -> List[str]:
+@cached
+def systematic(
+        first: List[int],
+        second: List[int] | None = None,
+        batched: bool = False,
+        workers: int | None = None,
+        progress: Progress = None,
+        dont_care: List[int] | None = None,
+        length: int | None = None
+        ) -> List[str]:
     """
     This function return optimalized function
     :param first: F indexes
     :type first: list of int
-    :param second: R indexes
-    :type second: list of int
+    :param second: R indexes, None to compute R cubes as the complement
+        of F and don't care indexes
+    :type second: list of int or None
+    :param batched: if b matrixes should be built with numpy at once,
+        ignored when R is computed
+    :type batched: bool
+    :param workers: number of processes expanding F rows, None to work in
+        this process, ignored when R is computed
+    :type workers: int or None
+    :param progress: function called with numbers of done and all F rows,
+        it may raise CancelledException
+    :type progress: callable[[int, int], None] or None
+    :param dont_care: don't care indexes, used only when R is not given
+    :type dont_care: list of int or None
+    :param length: number of variables, used only when R is not given,
+        None to use the bit length of the greatest index
+    :type length: int or None
     :returns: optimalized function
     :rtype: list of str
     """
-    n = bit_length(first, second)
-    op = output_parsing(first_part(*prepare_input(first, second),
-                        append_or_extend))
-    return joining_implicants(last_matrix_setting(parse_input(first, n),
-                              implicants_binary(implicants(op), n)),
-                              op, predone_string, labels_string)[0]
+    return systematic_cubes_packed(
+        *prepare_index_input(first, second, dont_care, length), batched,
+        workers, progress)
+
+
+def iter_systematic(
+        first: List[int],
+        second: List[int] | None = None,
+        limit: int | None = None,
+        first_only: bool = False,
+        batched: bool = False,
+        workers: int | None = None,
+        progress: Progress = None,
+        dont_care: List[int] | None = None,
+        length: int | None = None
+        ) -> Iterator[str]:
+    """
+    This function yields minimum covers one by one in the order of
+    systematic, implicants are found at once but covers are enumerated
+    only when they are needed so memory does not grow with their number,
+    when only one cover is needed it is the one found by the search for
+    the minimum size, it need not be the first one of systematic
+    :param first: F indexes
+    :type first: list of int
+    :param second: R indexes, None to compute R cubes as the complement
+        of F and don't care indexes
+    :type second: list of int or None
+    :param limit: maximal number of yielded covers, None for all of them
+    :type limit: int or None
+    :param first_only: if only the first cover should be yielded
+    :type first_only: bool
+    :param batched: if b matrixes should be built with numpy at once,
+        ignored when R is computed
+    :type batched: bool
+    :param workers: number of processes expanding F rows, None to work in
+        this process, ignored when R is computed
+    :type workers: int or None
+    :param progress: function called with numbers of done and all F rows,
+        it may raise CancelledException
+    :type progress: callable[[int, int], None] or None
+    :param dont_care: don't care indexes, used only when R is not given
+    :type dont_care: list of int or None
+    :param length: number of variables, used only when R is not given,
+        None to use the bit length of the greatest index
+    :type length: int or None
+    :returns: minimum covers
+    :rtype: iterator of str
+    """
+    first_only = first_only or limit == 1
+    covers = systematic_cubes_packed(
+        *prepare_index_input(first, second, dont_care, length), batched,
+        workers, progress, True, first_only)
+    return islice(covers, 1 if first_only else limit)
 
 
 def generate_first_output(
-        first_output: list[list[str]],
-        fmatrix: Matrix,
+        first_output: CubeMatrix,
+        fmatrix: PackedMatrix
+        ) -> CubeMatrix:
+    uncovered, output = dict.fromkeys(fmatrix), []
+    for care, value in output_parsing(first_output):
+        if (covered := [row for row in uncovered
+                        if not (row ^ value) & care]):
+            output.append((care, value))
+            for row in covered:
+                del uncovered[row]
+    return output
+
+
+def row_implicant(result: Cube | CubeMatrix, flag: bool) -> Cube:
+    """
+    This function returns the first implicant of expanded F row
+    :param result: implicant masks of the row
+    :type result: tuple of int or cube matrix
+    :param flag: if there is a list of implicants
+    :type flag: bool
+    :returns: care mask and value mask
+    :rtype: tuple of int
+    """
+    return result[0] if flag else result
+
+
+def generate_covering_output(
+        fmatrix: PackedMatrix,
+        rmatrix: PackedMatrix,
+        length: int,
+        batched: bool = False,
+        progress: Progress = None
+        ) -> CubeMatrix:
+    """
+    This function gives the same output as generate_first_output called
+    on the first part, implicants are chosen while F rows are expanded so
+    implicants of all rows are never kept at once
+    :param fmatrix: packed F cube
+    :type fmatrix: packed matrix
+    :param rmatrix: packed R cube
+    :type rmatrix: packed matrix
+    :param length: bit length of the greatest number
+    :type length: int
+    :param batched: if b matrixes should be built with numpy at once
+    :type batched: bool
+    :param progress: function called with numbers of done and all F rows
+    :type progress: callable[[int, int], None] or None
+    :returns: implicant masks
+    :rtype: cube matrix
+    """
+    uncovered, seen, output = dict.fromkeys(fmatrix), set(), []
+    for result, flag in (expand_batched if batched else expand_packed)(
+            fmatrix, rmatrix, length, progress=progress):
+        if (implicant := row_implicant(result, flag)) in seen:
+            continue
+        seen.add(implicant)
+        care, value = implicant
+        if (covered := [row for row in uncovered
+                        if not (row ^ value) & care]):
+            output.append(implicant)
+            for row in covered:
+                del uncovered[row]
+    return output
+
+
+def heuristic_packed(
+        fmatrix: PackedMatrix,
+        rmatrix: PackedMatrix,
+        length: int,
+        batched: bool = False,
+        workers: int | None = None,
+        progress: Progress = None
+        ) -> str:
+    """
+    This function return heuristicly optimalized function of already
+    validated and packed F and R cubes, minterms are minimized as cubes
+    with every bit specified
+    :param fmatrix: packed F cube
+    :type fmatrix: packed matrix
+    :param rmatrix: packed R cube
+    :type rmatrix: packed matrix
+    :param length: bit length of the greatest number
+    :type length: int
+    :param batched: if b matrixes should be built with numpy at once
+    :type batched: bool
+    :param workers: number of processes expanding F rows, None to work in
+        this process
+    :type workers: int or None
+    :param progress: function called with numbers of done and all F rows,
+        it may raise CancelledException
+    :type progress: callable[[int, int], None] or None
+    :returns: optimalized function
+    :rtype: str
+    """
+    return heuristic_cubes_packed(*minterm_cubes(fmatrix, rmatrix, length),
+                                  batched, workers, progress)
+
+
+@benchmark
+@cached
+def heuristic(
+        first: List[int],
+        second: List[int] | None = None,
+        batched: bool = False,
+        workers: int | None = None,
+        progress: Progress = None,
+        dont_care: List[int] | None = None,
+        length: int | None = None
+        ) -> str:
+    return heuristic_cubes_packed(
+        *prepare_index_input(first, second, dont_care, length), batched,
+        workers, progress)
+
+
+def anytime_packed(
+        fmatrix: PackedMatrix,
+        rmatrix: PackedMatrix,
+        length: int,
+        time_budget: float,
+        batched: bool = False,
+        workers: int | None = None,
+        progress: Progress = None
+        ) -> Tuple[List[str], bool]:
+    """
+    This function return optimalized function of already validated and
+    packed F and R cubes within given time, the heuristic cover is found
+    first and when the time runs out before the systematic one is done,
+    the best cover of implicants found so far is returned instead, a part
+    of the budget is always kept for searching it
+    :param fmatrix: packed F cube
+    :type fmatrix: packed matrix
+    :param rmatrix: packed R cube
+    :type rmatrix: packed matrix
+    :param length: bit length of the greatest number
+    :type length: int
+    :param time_budget: seconds given to the search, the heuristic cover
+        is always completed
+    :type time_budget: float
+    :param batched: if b matrixes should be built with numpy at once
+    :type batched: bool
+    :param workers: number of processes expanding F rows, None to work in
+        this process
+    :type workers: int or None
+    :param progress: function called with numbers of done and all F rows,
+        it may raise CancelledException
+    :type progress: callable[[int, int], None] or None
+    :returns: optimalized function and flag telling if it is proven to be
+        minimum, then it holds every minimum cover unless the time runs out
+        while they are listed
+    :rtype: tuple of list of str and bool
+    """
+    start = perf_counter()
+    deadline = start + time_budget
+    search_deadline = start + time_budget * (1 - RESERVE)
+    with tracing.phase('incumbent'):
+        incumbent = generate_covering_output(fmatrix, rmatrix, length,
+                                             batched)
+    found, best = [], incumbent
+    check = progress_check(progress, len(fmatrix))
+
+    def step(done: int, total: int) -> None:
+        if progress:
+            progress(done, total)
+        check_deadline(search_deadline)
+
+    def inserter(_: CubeMatrix, flag: bool, result: Cube | CubeMatrix
+                 ) -> None:
+        append_or_extend(found, flag, result)
+
+    def joined(implicants: CubeMatrix) -> List[str]:
+        return [' + '.join(map(implicant_string, implicants))]
+
+    try:
+        with tracing.phase('first_part'):
+            expansion(batched, workers, step)(fmatrix, rmatrix, length,
+                                              inserter)
+        op = output_parsing(found)
+        with tracing.phase('last_matrix_setting'):
+            matrix = last_matrix_setting(fmatrix, op, length)
+        with tracing.phase('final_cover'):
+            cover, proven = best_cover(matrix, len(op), search_deadline,
+                                       check=check)
+        if len(cover) < len(best):
+            best = [op[len(op) - 1 - j] for j in reversed(cover)]
+        if proven:
+            try:
+                return list(cover_implicants(matrix, op, deadline, True,
+                                             check)), True
+            except DeadlineException:
+                return joined(best), True
+    except DeadlineException:
+        pass
+    tracing.count('anytime.expired')
+    candidates = output_parsing(best + incumbent + found)
+    indexes = {implicant: i for i, implicant in enumerate(candidates)}
+    with tracing.phase('final_cover'):
+        rows = [sum(1 << i for i, (care, value) in enumerate(candidates)
+                    if not (line ^ value) & care) for line in fmatrix]
+        cover, _ = best_cover(rows, len(candidates), deadline,
+                              [indexes[implicant] for implicant in best],
+                              check=check)
+    return joined([candidates[i] for i in cover]), False
+
+
+@benchmark
+def anytime(
+        first: List[int],
+        second: List[int],
+        time_budget: float,
+        batched: bool = False,
+        workers: int | None = None,
+        progress: Progress = None
+        ) -> Tuple[List[str], bool]:
+    return anytime_packed(*prepare_packed_input(first, second), time_budget,
+                          batched, workers, progress)
+
+
+def prepare_cube_input(
+        first: List[str],
+        second: List[str] | None,
+        dont_care: List[str] | None = None
+        ) -> Tuple[CubeMatrix, CubeMatrix, int]:
+    """
+    This function converts F and R cubes written like "1-0--1" into their
+    masks and the number of variables, when R is not given it is computed
+    as the complement of F and don't care cubes
+    :param first: F cubes
+    :type first: list of str
+    :param second: R cubes, None to compute them
+    :type second: list of str or None
+    :param dont_care: don't care cubes, used only when R is not given
+    :type dont_care: list of str or None
+    :returns: F and R cube masks and number of variables
+    :rtype: tuple of cube matrixes and int
+    :raises InvalidInputException: when cubes are not of the same length,
+        contain other characters, any F cube intersects any R cube or
+        R is empty
+    """
+    with tracing.phase('prepare_input'):
+        given = [first, second or [], dont_care or []]
+        if (not first or not first[0]
+                or len({len(cube) for cube in chain(*given)}) != 1
+                or not set().union(*chain(*given)) <= set('01-')):
+            raise InvalidInputException()
+        fcubes = [parse_cube(cube) for cube in first]
+        if second is None:
+            with tracing.phase('complement'):
+                rcubes = complement(fcubes + [parse_cube(cube)
+                                              for cube in dont_care or []])
+        else:
+            rcubes = [parse_cube(cube) for cube in second]
+            if not all(all(bit_swaping_cube(rcubes, line))
+                       for line in fcubes):
+                raise InvalidInputException()
+        if not rcubes:
+            raise InvalidInputException()
+        return fcubes, rcubes, len(first[0])
+
+
+def prepare_complement_input(
+        first: List[int],
+        dont_care: List[int] | None = None,
+        length: int | None = None
+        ) -> Tuple[CubeMatrix, CubeMatrix, int]:
+    """
+    This function converts F indexes into cube masks and computes R cube
+    masks as the complement of F and don't care indexes, minterms of R
+    are never enumerated
+    :param first: F indexes
+    :type first: list of int
+    :param dont_care: don't care indexes
+    :type dont_care: list of int or None
+    :param length: number of variables, None to use the bit length of the
+        greatest index
+    :type length: int or None
+    :returns: F and R cube masks and number of variables
+    :rtype: tuple of cube matrixes and int
+    :raises InvalidInputException: when given data is invalid, indexes do
+        not fit in length bits or R is empty
+    """
+    with tracing.phase('prepare_input'):
+        dont_care = dont_care or []
+        if not first or data_validation(first, dont_care):
+            raise InvalidInputException()
+        if length is None:
+            length = bit_length(first, dont_care)
+        elif length < bit_length(first, dont_care):
+            raise InvalidInputException()
+        full = (1 << length) - 1
+        fcubes = [(full, minterm) for minterm in first]
+        with tracing.phase('complement'):
+            rcubes = complement(fcubes + [(full, minterm)
+                                          for minterm in dont_care])
+        if not rcubes:
+            raise InvalidInputException()
+        return fcubes, rcubes, length
+
+
+def minterm_cubes(
+        fmatrix: PackedMatrix,
+        rmatrix: PackedMatrix,
         length: int
-        ) -> list[list[str]]:
-    parsed, output = output_parsing(first_output), []
-    for implicant in implicants_binary(implicants(parsed), length):
-        for i, row in reversed(list(enumerate(fmatrix))):
-            if row_setting(row, implicant):
-                output.append(implicant)
-                fmatrix.pop(i)
+        ) -> Tuple[CubeMatrix, CubeMatrix, int]:
+    """
+    This function converts packed F and R cubes into cube masks of their
+    minterms, every bit of them is specified
+    :param fmatrix: packed F cube
+    :type fmatrix: packed matrix
+    :param rmatrix: packed R cube
+    :type rmatrix: packed matrix
+    :param length: bit length of the greatest number
+    :type length: int
+    :returns: F and R cube masks and number of variables
+    :rtype: tuple of cube matrixes and int
+    """
+    full = (1 << length) - 1
+    return ([(full, line) for line in fmatrix],
+            [(full, line) for line in rmatrix], length)
+
+
+def minterm_values(cubes: CubeMatrix, length: int) -> PackedMatrix | None:
+    """
+    This function is the inverse of minterm_cubes for one list of cubes
+    :param cubes: cube masks
+    :type cubes: cube matrix
+    :param length: number of variables
+    :type length: int
+    :returns: packed cube, None if any cube is not a minterm
+    :rtype: packed matrix or None
+    """
+    full = (1 << length) - 1
+    if any(care != full for care, _ in cubes):
+        return None
+    return [line for _, line in cubes]
+
+
+def prepare_index_input(
+        first: List[int],
+        second: List[int] | None,
+        dont_care: List[int] | None = None,
+        length: int | None = None
+        ) -> Tuple[CubeMatrix, CubeMatrix, int]:
+    """
+    This function converts F and R indexes into cube masks of minterms,
+    when R is not given its cubes are computed as the complement of F and
+    don't care indexes
+    :param first: F indexes
+    :type first: list of int
+    :param second: R indexes, None to compute R cubes
+    :type second: list of int or None
+    :param dont_care: don't care indexes, used only when R is not given
+    :type dont_care: list of int or None
+    :param length: number of variables, used only when R is not given,
+        None to use the bit length of the greatest index
+    :type length: int or None
+    :returns: F and R cube masks and number of variables
+    :rtype: tuple of cube matrixes and int
+    :raises InvalidInputException: when given data is invalid
+    """
+    if second is None:
+        return prepare_complement_input(first, dont_care, length)
+    return minterm_cubes(*prepare_packed_input(first, second))
+
+
+def bit_swaping_cube(sequence: CubeMatrix, swapper: Cube) -> PackedMatrix:
+    """
+    This function is a cube counterpart of bit_swaping_packed, a bit of
+    b matrix is set where both cubes specify the bit with other values
+    :param sequence: R cube masks
+    :type sequence: cube matrix
+    :param swapper: masks of one F cube
+    :type swapper: tuple of int
+    :returns: packed b matrix
+    :rtype: packed matrix
+    """
+    care, value = swapper
+    return [(value ^ other) & care & mask for mask, other in sequence]
+
+
+def expand_cubes(
+        fcubes: CubeMatrix,
+        rcubes: CubeMatrix,
+        length: int,
+        skip: Callable[[Cube], bool] | None = None,
+        progress: Progress = None,
+        batched: bool = False,
+        workers: int | None = None
+        ) -> Expansion:
+    """
+    This function yields implicants of every F cube, columns of bits not
+    specified by the F cube are empty so they are never chosen, when all
+    cubes are minterms and nothing is skipped their values are expanded
+    like packed rows
+    :param fcubes: F cube masks
+    :type fcubes: cube matrix
+    :param rcubes: R cube masks
+    :type rcubes: cube matrix
+    :param length: number of variables
+    :type length: int
+    :param skip: function called just before expanding a cube, the cube
+        is not expanded nor yielded if it returns True
+    :type skip: callable[[tuple[int, int]], bool] or None
+    :param progress: function called with numbers of done and all F cubes
+        after each cube, it may raise CancelledException
+    :type progress: callable[[int, int], None] or None
+    :param batched: if b matrixes should be built with numpy at once,
+        used only when all cubes are minterms
+    :type batched: bool
+    :param workers: number of processes expanding F cubes, None to work
+        in this process, used only when all cubes are minterms
+    :type workers: int or None
+    :returns: implicant masks of each cube and flags telling if there is a
+        list of them
+    :rtype: iterator of tuples of implicant masks or cube matrix and bool
+    """
+    if skip is None and (fmatrix := minterm_values(fcubes, length)) \
+            is not None and (rmatrix := minterm_values(rcubes, length)) \
+            is not None:
+        yield from expand_parallel(fmatrix, rmatrix, length, workers or 0,
+                                   batched, progress)
+        return
+    for done, line in enumerate(fcubes, 1):
+        if not (skip and skip(line)):
+            yield joining_implicants_packed(
+                bit_swaping_cube(rcubes, line), length,
+                label_setting_packed(line[1], length), predone_join,
+                implicant_join)
+        if progress:
+            progress(done, len(fcubes))
+
+
+def cube_cover_matrix(
+        fcubes: CubeMatrix,
+        op: CubeMatrix,
+        length: int
+        ) -> PackedMatrix:
+    """
+    This function is a cube counterpart of last_matrix_setting, a bit is
+    set if the implicant contains the whole F cube, when all F cubes are
+    minterms the last matrix of their values is computed with numpy
+    :param fcubes: F cube masks
+    :type fcubes: cube matrix
+    :param op: implicant masks
+    :type op: cube matrix
+    :param length: number of variables
+    :type length: int
+    :returns: packed last matrix, the first implicant is the most
+        significant bit of a row
+    :rtype: packed matrix
+    """
+    if (fmatrix := minterm_values(fcubes, length)) is not None:
+        return last_matrix_setting(fmatrix, op, length)
+    return [sum(1 << (len(op) - 1 - i)
+                for i, (care, value) in enumerate(op)
+                if not care & ~fcare and not (fvalue ^ value) & care)
+            for fcare, fvalue in fcubes]
+
+
+def systematic_cubes_packed(
+        fcubes: CubeMatrix,
+        rcubes: CubeMatrix,
+        length: int,
+        batched: bool = False,
+        workers: int | None = None,
+        progress: Progress = None,
+        lazy: bool = False,
+        first_only: bool = False
+        ) -> List[str] | Iterator[str]:
+    """
+    This function return optimalized function of already validated F and
+    R cube masks
+    :param fcubes: F cube masks
+    :type fcubes: cube matrix
+    :param rcubes: R cube masks
+    :type rcubes: cube matrix
+    :param length: number of variables
+    :type length: int
+    :param batched: if b matrixes should be built with numpy at once,
+        used only when all cubes are minterms
+    :type batched: bool
+    :param workers: number of processes expanding F cubes, None to work
+        in this process, used only when all cubes are minterms
+    :type workers: int or None
+    :param progress: function called with numbers of done and all F cubes,
+        it may raise CancelledException
+    :type progress: callable[[int, int], None] or None
+    :param lazy: if minimum covers should be yielded one by one
+    :type lazy: bool
+    :param first_only: if only one minimum cover should be yielded, covers
+        are not enumerated then
+    :type first_only: bool
+    :returns: optimalized function
+    :rtype: list of str or iterator of str
+    """
+    with tracing.phase('first_part'):
+        op = output_parsing(insert_implicants(
+            expand_cubes(fcubes, rcubes, length, progress=progress,
+                         batched=batched, workers=workers),
+            append_or_extend))
+    check = progress_check(progress, len(fcubes))
+    if not first_only and (fmatrix := minterm_values(fcubes, length)) \
+            is not None:
+        return final_cover(fmatrix, length, op, lazy=lazy, check=check)
+    with tracing.phase('last_matrix_setting'):
+        matrix = cube_cover_matrix(fcubes, op, length)
+    if first_only:
+        return iter([single_cover(matrix, op, check=check)])
+    return cover_implicants(matrix, op, lazy=lazy, check=check)
+
+
+@benchmark
+def systematic_cubes(
+        first: List[str],
+        second: List[str] | None = None,
+        progress: Progress = None,
+        dont_care: List[str] | None = None
+        ) -> List[str]:
+    """
+    This function return optimalized function of F and R given as cubes
+    :param first: F cubes like "1-0--1"
+    :type first: list of str
+    :param second: R cubes like "1-0--1", None to compute them as the
+        complement of F and don't care cubes
+    :type second: list of str or None
+    :param progress: function called with numbers of done and all F cubes,
+        it may raise CancelledException
+    :type progress: callable[[int, int], None] or None
+    :param dont_care: don't care cubes, used only when R is not given
+    :type dont_care: list of str or None
+    :returns: optimalized function
+    :rtype: list of str
+    """
+    return systematic_cubes_packed(
+        *prepare_cube_input(first, second, dont_care), progress=progress)
+
+
+def generate_cube_output(
+        fcubes: CubeMatrix,
+        rcubes: CubeMatrix,
+        length: int,
+        batched: bool = False,
+        workers: int | None = None,
+        progress: Progress = None
+        ) -> CubeMatrix:
+    """
+    This function is a cube counterpart of generate_covering_output
+    :param fcubes: F cube masks
+    :type fcubes: cube matrix
+    :param rcubes: R cube masks
+    :type rcubes: cube matrix
+    :param length: number of variables
+    :type length: int
+    :param batched: if b matrixes should be built with numpy at once,
+        used only when all cubes are minterms
+    :type batched: bool
+    :param workers: number of processes expanding F cubes, None to work
+        in this process, used only when all cubes are minterms
+    :type workers: int or None
+    :param progress: function called with numbers of done and all F cubes
+    :type progress: callable[[int, int], None] or None
+    :returns: implicant masks
+    :rtype: cube matrix
+    """
+    uncovered, seen, output = dict.fromkeys(fcubes), set(), []
+    for result, flag in expand_cubes(fcubes, rcubes, length,
+                                     progress=progress, batched=batched,
+                                     workers=workers):
+        if (implicant := row_implicant(result, flag)) in seen:
+            continue
+        seen.add(implicant)
+        care, value = implicant
+        if (covered := [row for row in uncovered if not care & ~row[0]
+                        and not (row[1] ^ value) & care]):
+            output.append(implicant)
+            for row in covered:
+                del uncovered[row]
     return output
 
 
-def for_first_output(
-        line: str,
+def heuristic_cubes_packed(
+        fcubes: CubeMatrix,
+        rcubes: CubeMatrix,
+        length: int,
+        batched: bool = False,
+        workers: int | None = None,
+        progress: Progress = None
+        ) -> str:
+    """
+    This function return heuristicly optimalized function of already
+    validated F and R cube masks
+    :param fcubes: F cube masks
+    :type fcubes: cube matrix
+    :param rcubes: R cube masks
+    :type rcubes: cube matrix
+    :param length: number of variables
+    :type length: int
+    :param batched: if b matrixes should be built with numpy at once,
+        used only when all cubes are minterms
+    :type batched: bool
+    :param workers: number of processes expanding F cubes, None to work
+        in this process, used only when all cubes are minterms
+    :type workers: int or None
+    :param progress: function called with numbers of done and all F cubes,
+        it may raise CancelledException
+    :type progress: callable[[int, int], None] or None
+    :returns: optimalized function
+    :rtype: str
+    """
+    with tracing.phase('first_part'):
+        output = generate_cube_output(fcubes, rcubes, length, batched,
+                                      workers, progress)
+    return ' + '.join(map(implicant_string, output))
+
+
+@benchmark
+def heuristic_cubes(
+        first: List[str],
+        second: List[str] | None = None,
+        progress: Progress = None,
+        dont_care: List[str] | None = None
+        ) -> str:
+    return heuristic_cubes_packed(
+        *prepare_cube_input(first, second, dont_care), progress=progress)
+
+
+def cheapest_cover(
+        matrix: PackedMatrix,
+        op: CubeMatrix,
+        cost: Cost = None,
+        deadline: float | None = None,
+        check: Check = None
+        ) -> str:
+    """
+    This function returns the cheapest cover of the last matrix, the
+    search is bounded by the cost instead of the number of implicants
+    :param matrix: packed last matrix, the first implicant is the most
+        significant bit of a row
+    :type matrix: packed matrix
+    :param op: implicant masks
+    :type op: cube matrix
+    :param cost: function giving not negative cost of implicant like
+        "x3x1`", None to count its literals
+    :type cost: callable[[str], float] or None
+    :param deadline: value of time.perf_counter, None for no deadline
+    :type deadline: float or None
+    :param check: function called whenever the deadline is checked, it
+        may raise CancelledException
+    :type check: callable[[], None] or None
+    :returns: optimalized function
+    :rtype: str
+    """
+    costs = [cost(implicant_string(implicant)) if cost
+             else implicant[0].bit_count() for implicant in reversed(op)]
+    with tracing.phase('final_cover'):
+        cover, _ = best_cover(matrix, len(op), deadline, costs=costs,
+                              check=check)
+    return ' + '.join(implicant_string(op[len(op) - 1 - i])
+                      for i in reversed(cover))
+
+
+def weighted_packed(
+        fmatrix: PackedMatrix,
+        rmatrix: PackedMatrix,
+        length: int,
+        cost: Cost = None,
+        batched: bool = False,
+        workers: int | None = None,
+        progress: Progress = None
+        ) -> str:
+    """
+    This function return the cheapest cover of already validated and
+    packed F and R cubes by implicants found like in systematic, minterms
+    are minimized as cubes with every bit specified
+    :param fmatrix: packed F cube
+    :type fmatrix: packed matrix
+    :param rmatrix: packed R cube
+    :type rmatrix: packed matrix
+    :param length: bit length of the greatest number
+    :type length: int
+    :param cost: function giving not negative cost of implicant like
+        "x3x1`", None to count its literals
+    :type cost: callable[[str], float] or None
+    :param batched: if b matrixes should be built with numpy at once
+    :type batched: bool
+    :param workers: number of processes expanding F rows, None to work in
+        this process
+    :type workers: int or None
+    :param progress: function called with numbers of done and all F rows,
+        it may raise CancelledException
+    :type progress: callable[[int, int], None] or None
+    :returns: optimalized function
+    :rtype: str
+    """
+    return weighted_cubes_packed(*minterm_cubes(fmatrix, rmatrix, length),
+                                 cost, batched, workers, progress)
+
+
+def weighted_cubes_packed(
+        fcubes: CubeMatrix,
+        rcubes: CubeMatrix,
+        length: int,
+        cost: Cost = None,
+        batched: bool = False,
+        workers: int | None = None,
+        progress: Progress = None
+        ) -> str:
+    """
+    This function return the cheapest cover of already validated F and R
+    cube masks by implicants found like in systematic
+    :param fcubes: F cube masks
+    :type fcubes: cube matrix
+    :param rcubes: R cube masks
+    :type rcubes: cube matrix
+    :param length: number of variables
+    :type length: int
+    :param cost: function giving not negative cost of implicant like
+        "x3x1`", None to count its literals
+    :type cost: callable[[str], float] or None
+    :param batched: if b matrixes should be built with numpy at once,
+        used only when all cubes are minterms
+    :type batched: bool
+    :param workers: number of processes expanding F cubes, None to work
+        in this process, used only when all cubes are minterms
+    :type workers: int or None
+    :param progress: function called with numbers of done and all F cubes,
+        it may raise CancelledException
+    :type progress: callable[[int, int], None] or None
+    :returns: optimalized function
+    :rtype: str
+    """
+    with tracing.phase('first_part'):
+        op = output_parsing(insert_implicants(
+            expand_cubes(fcubes, rcubes, length, progress=progress,
+                         batched=batched, workers=workers),
+            append_or_extend))
+    with tracing.phase('last_matrix_setting'):
+        matrix = cube_cover_matrix(fcubes, op, length)
+    return cheapest_cover(matrix, op, cost,
+                          check=progress_check(progress, len(fcubes)))
+
+
+@benchmark
+def weighted(
+        first: List[int],
+        second: List[int] | None = None,
+        cost: Cost = None,
+        batched: bool = False,
+        workers: int | None = None,
+        progress: Progress = None,
+        dont_care: List[int] | None = None,
+        length: int | None = None
+        ) -> str:
+    """
+    This function return the cheapest cover instead of every cover with
+    the fewest implicants, by default the one with the fewest literals
+    :param first: F indexes
+    :type first: list of int
+    :param second: R indexes, None to compute R cubes as the complement
+        of F and don't care indexes
+    :type second: list of int or None
+    :param cost: function giving not negative cost of implicant like
+        "x3x1`", None to count its literals
+    :type cost: callable[[str], float] or None
+    :param batched: if b matrixes should be built with numpy at once,
+        ignored when R is computed
+    :type batched: bool
+    :param workers: number of processes expanding F rows, None to work in
+        this process, ignored when R is computed
+    :type workers: int or None
+    :param progress: function called with numbers of done and all F rows,
+        it may raise CancelledException
+    :type progress: callable[[int, int], None] or None
+    :param dont_care: don't care indexes, used only when R is not given
+    :type dont_care: list of int or None
+    :param length: number of variables, used only when R is not given,
+        None to use the bit length of the greatest index
+    :type length: int or None
+    :returns: optimalized function
+    :rtype: str
+    """
+    return weighted_cubes_packed(
+        *prepare_index_input(first, second, dont_care, length), cost,
+        batched, workers, progress)
+
+
+@benchmark
+def weighted_cubes(
+        first: List[str],
+        second: List[str] | None = None,
+        cost: Cost = None,
+        progress: Progress = None,
+        dont_care: List[str] | None = None
+        ) -> str:
+    return weighted_cubes_packed(
+        *prepare_cube_input(first, second, dont_care), cost,
+        progress=progress)
+
+
+def cube_contains(outer: Cube, inner: Cube) -> bool:
+    """
+    This function checks if one cube contains the other one
+    :param outer: masks of the bigger cube
+    :type outer: tuple of int
+    :param inner: masks of the smaller cube
+    :type inner: tuple of int
+    :returns: True if every minterm of inner lies in outer
+    :rtype: bool
+    """
+    return not outer[0] & ~inner[0] and not (outer[1] ^ inner[1]) & outer[0]
+
+
+def supercube(cubes: CubeMatrix) -> Cube:
+    """
+    This function finds the smallest cube containing all given cubes
+    :param cubes: masks of not empty list of cubes
+    :type cubes: cube matrix
+    :returns: masks of the supercube
+    :rtype: tuple of int
+    """
+    care, value = cubes[0]
+    for other_care, other_value in cubes[1:]:
+        care &= other_care & ~(value ^ other_value)
+    return care, value & care
+
+
+def cover_cost(cover: CubeMatrix) -> Tuple[int, int]:
+    """
+    This function counts implicants and literals of the cover
+    :param cover: implicant masks
+    :type cover: cube matrix
+    :returns: number of implicants and number of literals
+    :rtype: tuple of int
+    """
+    return len(cover), sum(care.bit_count() for care, _ in cover)
+
+
+def expand_cover(
+        cover: CubeMatrix,
+        rcubes: CubeMatrix,
         length: int
-        ) -> list[str]:
-    result = []
-    for i, char in enumerate(line):
-        if char != '*':
-            h = length - i - 1
-            result.append(f'{h}' if char else f'{h}`')
-    return result
+        ) -> CubeMatrix:
+    """
+    This function is the EXPAND step, every implicant is made prime with
+    the expansion step, the biggest implicants go first and the ones
+    contained in already expanded implicants are dropped, among equally
+    big primes the one containing the most implicants is chosen
+    :param cover: implicant masks
+    :type cover: cube matrix
+    :param rcubes: R cube masks
+    :type rcubes: cube matrix
+    :param length: number of variables
+    :type length: int
+    :returns: prime implicant masks
+    :rtype: cube matrix
+    """
+    order, primes = sorted(cover, key=lambda cube: cube[0].bit_count()), []
+
+    def skip(line: Cube) -> bool:
+        return any(cube_contains(prime, line) for prime in primes)
+
+    for result, flag in expand_cubes(order, rcubes, length, skip):
+        primes.append(max(
+            result if flag else [result],
+            key=lambda prime: sum(cube_contains(prime, line)
+                                  for line in order)))
+    return primes
+
+
+def irredundant_cover(cover: CubeMatrix, fcubes: CubeMatrix) -> CubeMatrix:
+    """
+    This function is the IRREDUNDANT step, implicants are chosen greedily
+    until every F cube is contained in one of them, then chosen ones whose
+    F cubes are all contained in other chosen ones are dropped
+    :param cover: implicant masks
+    :type cover: cube matrix
+    :param fcubes: F cube masks
+    :type fcubes: cube matrix
+    :returns: implicant masks of irredundant cover
+    :rtype: cube matrix
+    """
+    rows = [sum(1 << i for i, cube in enumerate(cover)
+                if cube_contains(cube, line)) for line in fcubes]
+    columns = column_masks(rows, len(cover))
+    chosen = greedy_cover(rows, columns)
+    for index in reversed(chosen[:]):
+        others = reduce(int.__or__, (columns[i] for i in chosen
+                                     if i != index), 0)
+        if not columns[index] & ~others:
+            chosen.remove(index)
+    return [cover[i] for i in sorted(chosen)]
+
+
+def reduce_cover(cover: CubeMatrix, fcubes: CubeMatrix) -> CubeMatrix:
+    """
+    This function is the REDUCE step, one by one, the biggest first, every
+    implicant is shrunk to the smallest cube containing F cubes which no
+    other implicant contains, implicants without such cubes are dropped
+    :param cover: implicant masks
+    :type cover: cube matrix
+    :param fcubes: F cube masks
+    :type fcubes: cube matrix
+    :returns: reduced implicant masks
+    :rtype: cube matrix
+    """
+    output = list(cover)
+    counts = [sum(cube_contains(cube, line) for cube in cover)
+              for line in fcubes]
+    for i in sorted(range(len(output)),
+                    key=lambda i: output[i][0].bit_count()):
+        cube = output[i]
+        inside = [j for j, line in enumerate(fcubes)
+                  if cube_contains(cube, line)]
+        own = [fcubes[j] for j in inside if counts[j] == 1]
+        output[i] = supercube(own) if own else None
+        for j in inside:
+            if not own or not cube_contains(output[i], fcubes[j]):
+                counts[j] -= 1
+    return [cube for cube in output if cube is not None]
+
+
+def espresso_packed(
+        fcubes: CubeMatrix,
+        rcubes: CubeMatrix,
+        length: int,
+        iterations: int = 8,
+        progress: Progress = None
+        ) -> str:
+    """
+    This function return optimalized function of already validated F and
+    R cube masks with the iterative Espresso loop, the first cover is
+    expanded and made irredundant, then REDUCE, EXPAND and IRREDUNDANT are
+    repeated until the cover stops getting cheaper
+    :param fcubes: F cube masks
+    :type fcubes: cube matrix
+    :param rcubes: R cube masks
+    :type rcubes: cube matrix
+    :param length: number of variables
+    :type length: int
+    :param iterations: maximal number of REDUCE, EXPAND and IRREDUNDANT
+        iterations
+    :type iterations: int
+    :param progress: function called with numbers of done and all
+        iterations, it may raise CancelledException
+    :type progress: callable[[int, int], None] or None
+    :returns: optimalized function
+    :rtype: str
+    """
+    fcubes = list(dict.fromkeys(fcubes))
+    with tracing.phase('expand'):
+        cover = expand_cover(fcubes, rcubes, length)
+    with tracing.phase('irredundant'):
+        best = cover = irredundant_cover(cover, fcubes)
+    for done in range(1, iterations + 1):
+        with tracing.phase('reduce'):
+            cover = reduce_cover(cover, fcubes)
+        with tracing.phase('expand'):
+            cover = expand_cover(cover, rcubes, length)
+        with tracing.phase('irredundant'):
+            cover = irredundant_cover(cover, fcubes)
+        tracing.count('espresso.iterations')
+        if progress:
+            progress(done, iterations)
+        if cover_cost(cover) >= cover_cost(best):
+            break
+        best = cover
+    return ' + '.join(map(implicant_string, best))
+
+
+@benchmark
+def espresso(
+        first: List[int],
+        second: List[int] | None = None,
+        iterations: int = 8,
+        progress: Progress = None,
+        dont_care: List[int] | None = None,
+        length: int | None = None
+        ) -> str:
+    """
+    This function return optimalized function with the iterative Espresso
+    loop
+    :param first: F indexes
+    :type first: list of int
+    :param second: R indexes, None to compute R cubes as the complement
+        of F and don't care indexes
+    :type second: list of int or None
+    :param iterations: maximal number of REDUCE, EXPAND and IRREDUNDANT
+        iterations
+    :type iterations: int
+    :param progress: function called with numbers of done and all
+        iterations, it may raise CancelledException
+    :type progress: callable[[int, int], None] or None
+    :param dont_care: don't care indexes, used only when R is not given
+    :type dont_care: list of int or None
+    :param length: number of variables, used only when R is not given,
+        None to use the bit length of the greatest index
+    :type length: int or None
+    :returns: optimalized function
+    :rtype: str
+    """
+    return espresso_packed(
+        *prepare_index_input(first, second, dont_care, length), iterations,
+        progress)
 
 
 @benchmark
-def heuristic(first: List[int], second: List[int]) -> List[str]:
-    fmatrix, rmatrix = prepare_input(first, second)
-    temp = first_part(fmatrix, rmatrix,
-                      lambda o, f, r: o.append(r[0] if f else r))
-    n = bit_length(first, second)
-    s_output = [for_first_output(line, n)
-                for line in generate_first_output(temp, fmatrix, n)]
-    return ' + '.join(output_parsing(s_output))
+def espresso_cubes(
+        first: List[str],
+        second: List[str] | None = None,
+        iterations: int = 8,
+        progress: Progress = None,
+        dont_care: List[str] | None = None
+        ) -> str:
+    return espresso_packed(*prepare_cube_input(first, second, dont_care),
+                           iterations, progress)
 
 
 def main() -> None:
@@ -15,44 +15,24 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>
 """
-PRE: str = "from PySide6.QtGui import QPixmap, QIcon\n\n"
-POST: str = """
+from pathlib import Path
 
-def generate_icon() -> QIcon:
-    pixmap = QPixmap()
-    pixmap.loadFromData(SOURCE)
-    return QIcon(pixmap)
-
-"""
+RESOURCE: Path = Path(__file__).with_name('logo.png')
 
 
-def read_as_hex(file_name: str) -> bin:
+def read_image(file_name: str) -> bytes:
     with open(file_name, 'rb') as handle:
-        return handle.read().hex()
-
-
-def spliter(hex_data: bin) -> str:
-    return map(''.join, zip(hex_data[::2], hex_data[1::2]))
-
-
-def add_prefix(string_data: list[str]) -> list[str]:
-    return ['\\' + 'x' + datum for datum in string_data]
-
-
-def make_module_string(string_data: list[str]) -> str:
-    return PRE + "SOURCE: bin = b'" + ''.join(string_data) + "'\n" + POST
+        return handle.read()
 
 
-def save_to_file(file_name: str, data: str) -> None:
-    with open(file_name, 'w') as handle:
-        handle.write(data + '\n')
+def save_to_file(file_name: Path, data: bytes) -> None:
+    with open(file_name, 'wb') as handle:
+        handle.write(data)
 
 
 def main() -> None:
     source = input("Input image: ")
-    destiny = input("Result module: ")
-    prefixed = add_prefix(spliter(read_as_hex(source)))
-    save_to_file(destiny, make_module_string(prefixed))
+    save_to_file(RESOURCE, read_image(source))
 
 
 if __name__ == '__main__':
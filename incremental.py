@@ -0,0 +1,212 @@
+"""
+Ekspresso procedure
+Copyright (C) 2022  Mateusz Jaracz 
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+
+
+from typing import Dict, Iterable, List, Tuple
+
+from timing import benchmark
+from complement import Cube, CubeMatrix
+from ekspansja import (
+    PackedMatrix,
+    Progress,
+    prepare_packed_input,
+    bit_swaping_packed,
+    list_sorting_packed,
+    line_parsing_packed,
+    line_strength_packed,
+    label_setting_packed,
+    joining_implicants_packed,
+    predone_join,
+    implicant_join,
+    append_or_extend,
+    output_parsing,
+    final_cover,
+    progress_check
+)
+import tracing
+
+
+Row = Tuple[PackedMatrix, Cube | CubeMatrix, bool]
+
+
+def reduced_matrix(rmatrix: Iterable[int], line: int) -> PackedMatrix:
+    """
+    This function builds b matrix of F row without rows containing other
+    rows, the same rows as left by line_parsing_packed
+    :param rmatrix: R indexes
+    :type rmatrix: iterable of int
+    :param line: F index
+    :type line: int
+    :returns: reduced packed b matrix
+    :rtype: packed matrix
+    """
+    return line_parsing_packed(list_sorting_packed(
+        bit_swaping_packed(list(rmatrix), line)))
+
+
+def repair_matrix(
+        rows: PackedMatrix,
+        line: int,
+        added: Iterable[int],
+        removed: Iterable[int]
+        ) -> PackedMatrix | None:
+    """
+    This function updates reduced b matrix of F row after R indexes were
+    added and removed, rows of added indexes which contain any row are
+    skipped and rows they are contained in are dropped
+    :param rows: reduced packed b matrix
+    :type rows: packed matrix
+    :param line: F index
+    :type line: int
+    :param added: R indexes added since the matrix was built
+    :type added: iterable of int
+    :param removed: R indexes removed since the matrix was built
+    :type removed: iterable of int
+    :returns: the same rows if nothing changed, updated rows or None when
+        a row of removed index was left by the reduction, rows it was
+        hiding are unknown then
+    :rtype: packed matrix or None
+    """
+    present = set(rows)
+    if any(index ^ line in present for index in removed):
+        return None
+    for index in added:
+        row = index ^ line
+        if not any(line_strength_packed(other, row) for other in rows):
+            rows = [other for other in rows
+                    if not line_strength_packed(row, other)] + [row]
+    return rows
+
+
+class Session:
+    """
+    Keeps reduced b matrixes and implicants of every F row of the last
+    systematic minimization, after small edits of F or R only rows whose
+    reduced b matrix changed are expanded again and the final cover is
+    computed again only if implicants or F changed, the result is the same
+    as the one of systematic for the same lists
+    """
+    def __init__(self) -> None:
+        self.first: List[int] = []
+        self.second: set[int] = set()
+        self.length = 0
+        self.rows: Dict[int, Row] = {}
+        self.op: CubeMatrix = []
+        self.result: str | List[str] | None = None
+
+    @benchmark
+    def minimize(
+            self,
+            first: List[int],
+            second: List[int],
+            progress: Progress = None
+            ) -> str | List[str]:
+        """
+        This function minimizes given F and R reusing rows of the last
+        minimization, the difference is found by the session
+        :param first: F indexes
+        :type first: list of int
+        :param second: R indexes
+        :type second: list of int
+        :param progress: function called with numbers of done and all
+            expanded F rows, it may raise CancelledException
+        :type progress: callable[[int, int], None] or None
+        :returns: optimalized function
+        :rtype: str or list of str
+        """
+        return self.__minimize(list(first), list(second), progress)
+
+    @benchmark
+    def update(
+            self,
+            add_first: Iterable[int] = (),
+            remove_first: Iterable[int] = (),
+            add_second: Iterable[int] = (),
+            remove_second: Iterable[int] = (),
+            progress: Progress = None
+            ) -> str | List[str]:
+        """
+        This function minimizes F and R of the last minimization after
+        given edits, added F indexes go to the end of F
+        :param add_first: F indexes to be added
+        :type add_first: iterable of int
+        :param remove_first: F indexes to be removed
+        :type remove_first: iterable of int
+        :param add_second: R indexes to be added
+        :type add_second: iterable of int
+        :param remove_second: R indexes to be removed
+        :type remove_second: iterable of int
+        :param progress: function called with numbers of done and all
+            expanded F rows, it may raise CancelledException
+        :type progress: callable[[int, int], None] or None
+        :returns: optimalized function
+        :rtype: str or list of str
+        """
+        removed = set(remove_first)
+        first = [line for line in self.first if line not in removed]
+        present = set(first)
+        first += [line for line in dict.fromkeys(add_first)
+                  if line not in present]
+        second = self.second - set(remove_second) | set(add_second)
+        return self.__minimize(first, list(second), progress)
+
+    def __minimize(
+            self,
+            first: List[int],
+            second: List[int],
+            progress: Progress
+            ) -> str | List[str]:
+        fmatrix, rmatrix, length = prepare_packed_input(first, second)
+        rset = set(rmatrix)
+        added, removed = rset - self.second, self.second - rset
+        previous = self.rows if length == self.length else {}
+        rows, pending = {}, []
+        with tracing.phase('repair_matrix'):
+            for line in dict.fromkeys(fmatrix):
+                if line not in previous:
+                    pending.append((line, None))
+                elif (matrix := repair_matrix(previous[line][0], line,
+                                              added, removed)) \
+                        is previous[line][0]:
+                    rows[line] = previous[line]
+                else:
+                    pending.append((line, matrix))
+        tracing.count('incremental.expanded_rows', len(pending))
+        with tracing.phase('first_part'):
+            for done, (line, matrix) in enumerate(pending, 1):
+                if matrix is None:
+                    matrix = reduced_matrix(rset, line)
+                rows[line] = (matrix, *joining_implicants_packed(
+                    matrix, length, label_setting_packed(line, length),
+                    predone_join, implicant_join))
+                if progress:
+                    progress(done, len(pending))
+            output = []
+            for line in fmatrix:
+                append_or_extend(output, rows[line][2], rows[line][1])
+            op = output_parsing(output)
+        if op == self.op and fmatrix == self.first:
+            result = self.result
+        else:
+            result = final_cover(
+                fmatrix, length, op,
+                check=progress_check(progress, len(pending)))
+        self.first, self.second, self.length = fmatrix, rset, length
+        self.rows, self.op, self.result = rows, op, result
+        return result
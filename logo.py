@@ -17,14 +17,13 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>
 """
 
 
-from PySide6.QtGui import QPixmap, QIcon
 
-SOURCE: bin = b'\x89\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\x00\x02\x58\x00\x00\x02\x58\x08\x02\x00\x00\x00\x31\x04\x0f\x8b\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\x2b\x0e\x1b\x00\x00\x20\x00\x49\x44\x41\x54\x78\x9c\xec\xbd\x77\x98\x1c\xc7\x75\xf6\x7b\xaa\xaa\xd3\xc4\xcd\x09\xbb\xc0\x2e\xf2\x22\x67\x22\x10\x24\x18\xc5\x9c\x24\x8a\x14\x45\x05\xdb\x94\x45\xc9\x92\x83\xd2\x63\x5b\xb6\xef\xb5\x6c\xf9\xb3\x2d\x5f\x5f\xdb\xb2\xaf\x6c\x4b\x96\x95\x03\x25\x91\xa2\xc4\x24\x91\x62\x8e\x20\x08\x22\x83\xc8\x61\x23\x36\xcf\xcc\x4e\xea\x54\x75\xff\xe8\xe9\x9e\x9a\x99\xc5\x12\x14\x01\x92\xe0\x9c\x1f\x1f\x2e\x7a\xba\x4f\x9f\xae\xaa\x9e\xa9\xb7\xcf\xa9\xea\x6e\x22\x84\x80\x33\x66\x62\x62\xe2\xcc\x8d\x01\xa0\xae\xae\x0e\x3d\xa3\x67\xf4\x8c\x9e\xd1\x33\x7a\x7e\x27\x7b\xa6\x6f\xa8\x10\x08\x82\x20\x08\xf2\x2e\x03\x85\x10\x41\x10\x04\xa9\x6a\x50\x08\x11\x04\x41\x90\xaa\x06\x85\x10\x41\x10\x04\xa9\x6a\x50\x08\x11\x04\x41\x90\xaa\x06\x85\x10\x41\x10\x04\xa9\x6a\x50\x08\x11\x04\x41\x90\xaa\x06\x85\x10\x41\x10\x04\xa9\x6a\x50\x08\x11\x04\x41\x90\xaa\x06\x85\x10\x41\x10\x04\xa9\x6a\x50\x08\x11\x04\x41\x90\xaa\x06\x85\x10\x41\x10\x04\xa9\x6a\x50\x08\x11\x04\x41\x90\xaa\x06\x85\x10\x41\x10\x04\xa9\x6a\xc8\xf8\xf8\xf8\xdb\x5d\x06\x04\x41\x10\x04\x79\xdb\x50\xde\xe8\x0e\xe7\xdd\x8b\xa6\xd0\x33\x7a\x46\xcf\xe8\x19\x3d\xa3\xe7\x69\xc0\xd4\x28\x82\x20\x08\x52\xd5\xa0\x10\x22\x08\x82\x20\x55\x0d\x0a\x21\x82\x20\x08\x52\xd5\xa0\x10\x22\x08\x82\x20\x55\x0d\x0a\x21\x82\x20\x08\x52\xd5\xa0\x10\x22\x08\x82\x20\x55\x0d\x0a\x21\x82\x20\x08\x52\xd5\xa0\x10\x22\x08\x82\x20\x55\x0d\x0a\x21\x82\x20\x08\x52\xd5\xa0\x10\x22\x08\x82\x20\x55\x0d\x0a\x21\x82\x20\x08\x52\xd5\xa0\x10\x22\x08\x82\x20\x55\x0d\x0a\x21\x82\x20\x08\x52\xd5\xe0\x6b\x98\x10\x04\x41\x90\xaa\x86\x08\x21\xce\xdc\xfa\x7c\x7c\xbf\x06\x7a\x46\xcf\xe8\x19\x3d\xa3\x67\xf4\x3c\x0d\x98\x1a\x45\x10\x04\x41\xaa\x1a\x14\x42\x04\x41\x10\xa4\xaa\x41\x21\x44\x10\x04\x41\xaa\x1a\x14\x42\x04\x41\x10\xa4\xaa\x41\x21\x44\x10\x04\x41\xaa\x1a\x14\x42\x04\x41\x10\xa4\xaa\x41\x21\x44\x10\x04\x41\xaa\x1a\x14\x42\x04\x41\x10\xa4\xaa\x41\x21\x44\x10\x04\x41\xaa\x1a\x14\x42\x04\x41\x10\xa4\xaa\x41\x21\x44\x10\x04\x41\xaa\x1a\x14\x42\x04\x41\x10\xa4\xaa\x41\x21\x44\x10\x04\x41\xaa\x1a\x7c\x0d\x13\x82\x20\x08\x52\xd5\x28\x6f\x74\x87\xf3\xee\xfd\x1a\xe8\x19\x3d\xa3\x67\xf4\x8c\x9e\xd1\xf3\x34\x60\x6a\x14\x41\x10\x04\xa9\x6a\x50\x08\x11\x04\x41\x90\xaa\x06\x85\x10\x41\x10\x04\xa9\x6a\x50\x08\x11\x04\x41\x90\xaa\x06\x85\x10\x41\x10\x04\xa9\x6a\x50\x08\x11\x04\x41\x90\xaa\x06\x85\x10\x41\x10\x04\xa9\x6a\x50\x08\x11\x04\x41\x90\xaa\x06\x85\x10\x41\x10\x04\xa9\x6a\x50\x08\x11\x04\x41\x90\xaa\x06\x85\x10\x41\x10\x04\xa9\x6a\x50\x08\x11\x04\x41\x90\xaa\x06\x85\x10\x41\x10\x04\xa9\x6a\xf0\x35\x4c\x08\x82\x20\x48\x55\x43\x84\x10\x67\x6e\x7d\x3e\xbe\x5f\x03\x3d\xa3\x67\xf4\x8c\x9e\xd1\x33\x7a\x9e\x06\x4c\x8d\x22\x08\x82\x20\x55\x0d\x0a\x21\x82\x20\x08\x52\xd5\xa0\x10\x22\x08\x82\x20\x55\x0d\x0a\x21\x82\x20\x08\x52\xd5\xa0\x10\x22\x08\x82\x20\x55\x0d\x0a\x21\x82\x20\x08\x52\xd5\xa0\x10\x22\x08\x82\x20\x55\x0d\x0a\x21\x82\x20\x08\x52\xd5\xa0\x10\x22\x08\x82\x20\x55\x0d\x0a\x21\x82\x20\x08\x52\xd5\xa0\x10\x22\x08\x82\x20\x55\x0d\x0a\x21\x82\x20\x08\x52\xd5\xa0\x10\x22\x08\x82\x20\x55\x0d\xbe\x86\x09\x41\x10\x04\xa9\x6a\x94\x37\xba\xc3\x79\xf7\x7e\x0d\xf4\x8c\x9e\xd1\x33\x7a\x46\xcf\xe8\x79\x1a\x30\x35\x8a\x20\x08\x82\x54\x35\x28\x84\x08\x82\x20\x48\x55\x83\x42\x88\x20\x08\x82\x54\x35\x28\x84\x08\x82\x20\x48\x55\x83\x42\x88\x20\x08\x82\x54\x35\x28\x84\x08\x82\x20\x48\x55\x83\x42\x88\x20\x08\x82\x54\x35\x28\x84\x08\x82\x20\x48\x55\x83\x42\x88\x20\x08\x82\x54\x35\x28\x84\x08\x82\x20\x48\x55\x83\x42\x88\x20\x08\x82\x54\x35\x28\x84\x08\x82\x20\x48\x55\x83\x42\x88\x20\x08\x82\x54\x35\xf8\x1a\x26\x04\x41\x10\xa4\xaa\x21\x42\x88\x33\xb7\x3e\x1f\xdf\xaf\x81\x9e\xd1\x33\x7a\x46\xcf\xe8\x19\x3d\x4f\x03\xa6\x46\x11\x04\x41\x90\xaa\x06\x85\x10\x41\x10\x04\xa9\x6a\x50\x08\x11\x04\x41\x90\xaa\x06\x85\x10\x41\x10\x04\xa9\x6a\x50\x08\x11\x04\x41\x90\xaa\x06\x85\x10\x41\x10\x04\xa9\x6a\x50\x08\x11\x04\x41\x90\xaa\x06\x85\x10\x41\x10\x04\xa9\x6a\x50\x08\x11\x04\x41\x90\xaa\x06\x85\x10\x41\x10\x04\xa9\x6a\x50\x08\x11\x04\x41\x90\xaa\x06\x85\x10\x41\x10\x04\xa9\x6a\x50\x08\x11\x04\x41\x90\xaa\x06\x5f\xc3\x84\x20\x08\x82\x54\x35\xca\x1b\xdd\xe1\xbc\x7b\xbf\x06\x7a\x46\xcf\xe8\x19\x3d\xa3\x67\xf4\x3c\x0d\x98\x1a\x45\x10\x04\x41\xaa\x1a\x14\x42\x04\x41\x10\xa4\xaa\x41\x21\x44\x10\x04\x41\xaa\x1a\x14\x42\x04\x41\x10\xa4\xaa\x41\x21\x44\x10\x04\x41\xaa\x1a\x14\x42\x04\x41\x10\xa4\xaa\x41\x21\x44\x10\x04\x41\xaa\x1a\x14\x42\x04\x41\x10\xa4\xaa\x41\x21\x44\x10\x04\x41\xaa\x1a\x14\x42\x04\x41\x10\xa4\xaa\x41\x21\x44\x10\x04\x41\xaa\x1a\x14\x42\x04\x41\x10\xa4\xaa\x41\x21\x44\x10\x04\x41\xaa\x1a\x7c\x0d\x13\x82\x20\x08\x52\xd5\x10\x21\xc4\x99\x5b\x9f\x8f\xef\xd7\x40\xcf\xe8\x19\x3d\xa3\x67\xf4\x8c\x9e\xa7\x01\x53\xa3\x08\x82\x20\x48\x55\xf3\x86\x5f\xcc\x8b\x20\xef\x7a\x4e\x97\x26\x71\x5d\x57\x08\x01\x20\x3c\x02\x4b\xdf\xde\xdb\x08\x00\x82\xbb\x0e\x78\x8b\x00\xc4\xdb\xe6\x2f\xcb\xae\x83\x4d\xb9\x5c\x16\x00\x08\x29\xfb\x43\x08\x04\xff\x11\x6f\xdd\x94\x65\xf3\xb6\x21\x08\xf2\xdb\x81\x42\x88\xbc\xcb\x29\x15\x2d\x21\xb8\xe0\x82\x0b\x21\x04\xe7\xbe\x5c\x09\xcf\x0e\x02\x61\xf3\x25\xaa\x20\x6b\x00\x20\x04\x21\x64\x7c\x6c\xb8\xc2\x7d\xa5\x06\x91\xb2\x45\xcf\x1b\x91\xd6\x05\x52\x16\x88\x5a\x26\x3d\x59\x2a\x91\x85\x83\x42\xd9\x2a\xe2\x95\x91\x10\xe2\xfd\x23\x65\x74\xe4\x82\x78\x0a\x0a\x00\x84\x98\x66\x9e\x10\x42\x09\x25\x94\x40\x20\xa7\x84\xa0\x76\x22\x48\x00\x0a\x21\x72\x1e\x23\x85\x47\xc2\xff\x4f\x64\x32\x93\x05\xb5\xe3\x9c\x73\xce\x85\x00\x21\xb8\x1f\xc9\x15\x05\x49\x8a\xba\x08\x01\x42\x29\x14\x96\xbd\x15\xc1\x27\x12\x7c\x0a\xfe\x96\xfd\xef\x3b\x2c\xf9\x58\x41\x41\xbd\xce\xb4\x42\xc5\x4a\xc9\x9b\x82\xbf\x42\x08\xe1\x6b\xbb\xf0\xd5\x5e\x48\xc1\x6a\xa1\xc6\xa9\x54\x42\x16\x54\x52\x84\x12\x4a\x29\xa1\x94\x52\x6f\x91\x73\xd7\x0b\x3e\x83\x5a\xa0\x58\x22\x55\x02\x0a\x21\xf2\x8e\x26\xe8\xd7\xc1\x57\x32\x28\xe8\x83\x28\xa8\x44\x21\xbd\x28\x02\xa9\xca\xe7\x72\x5e\x2a\x91\x12\x42\x29\x65\x7e\xbf\x2f\x89\x00\x14\x44\xac\xd0\xd1\x17\x92\x91\x42\x88\x29\x3b\x7f\x39\xd4\xaa\xcc\x71\x7a\xa5\x3b\x03\x1b\x21\x99\x9d\xce\x86\x50\xfa\xba\x7e\x8a\xc7\x92\x55\xb3\x54\x42\x89\x1f\x52\x16\x73\xb6\x45\xed\xf4\x02\x62\x21\x84\xe0\x2e\x77\x1d\xc7\x6f\x4a\x21\x78\xa1\x25\xc1\x6f\x56\xbf\x4d\xc1\xbf\x14\x90\x5a\x0c\x41\xde\x35\xa0\x10\x22\xef\x08\xbc\x54\xa5\xe0\xdc\xe5\x2e\xe7\x2e\x77\x5d\x97\x73\xee\xba\xdc\x75\x39\x77\xa1\x10\xa9\x00\x00\xf8\x89\x3e\x4a\x28\x21\x84\xd2\x20\xbe\x21\x44\xca\xfc\x81\x24\x69\x53\xf6\xda\x42\x12\x18\x51\xaa\x8b\x05\xbc\x78\x12\x82\xf8\xcb\x17\x33\xaf\x5c\x92\x9c\xc8\x43\x86\x50\x26\x5a\xa7\xfb\x78\x7a\xe4\x40\x94\x10\x42\x28\xa5\x94\x52\xc6\x58\xe5\x56\xea\x53\xc8\x96\x96\xd7\x0b\x4a\x72\xa7\x53\xb4\x00\xf8\xb5\x83\x20\x73\x1c\x68\xa4\x97\x3e\x96\x6a\xc9\x3d\x21\x0d\xce\x44\x62\x62\x8c\x32\x46\x29\x65\x94\x51\xc6\x28\x65\x94\x12\xef\xc2\xe3\xf5\xea\x88\x20\xef\x2c\x50\x08\x91\xb7\x1a\xaf\xc7\x35\x4d\x93\x73\xc7\x75\x5d\xee\x38\x8e\xcb\xb9\x70\x85\x00\x52\xec\xc1\x0b\x7a\xc7\x14\x45\x21\x2a\xf5\x65\xcf\x8b\x4a\x3c\x03\xaf\xff\x2e\x5b\x08\x24\xb0\x18\x46\xfa\xea\xc5\x79\xb1\x53\x77\x5d\xd7\x9b\xf9\xe2\xad\xf4\xb6\xba\xae\xa7\x7c\x7e\x6e\x91\x0b\x3f\x46\x2a\xaa\xa0\x1f\x63\x11\x7f\x62\x4c\x70\xf4\x62\x4c\x16\x8c\x33\xca\x9b\x84\x90\x6d\xe4\x39\x2f\xc1\xa6\x92\xbd\xa6\xdc\x14\xac\x0f\x1a\x21\x08\x70\x29\x2d\x24\x3a\x19\x63\x8a\xa2\xf8\x32\xc9\x14\x85\xa9\xaa\x4a\xa9\x77\xd5\x50\xdc\x1a\x84\xd2\x84\x78\xc2\x49\x09\x29\x3b\x8a\x74\xba\x00\x8a\x22\xc9\xfd\x36\x13\xdc\xb1\x6d\x6f\x15\xf8\xba\x4a\x7d\x75\x66\x0a\x63\x54\x61\x8c\x51\xca\x82\x13\xf4\xdb\x7d\x61\x10\xe4\x5c\x83\x42\x88\x9c\x43\xfc\x58\x83\x17\x12\x9b\x85\x94\x26\x80\x80\x54\x72\xa2\x10\xdc\x50\x4a\x29\x61\x44\x25\xfe\x68\x55\x31\x94\x2b\x76\x9d\x41\xc4\x23\x27\x41\x49\xb1\x67\xf6\xf5\xcc\x75\x5d\xce\x5d\x4f\xf2\x1c\xc7\x29\x1d\x25\x2c\x04\x6d\x9e\x5e\x7a\x89\x50\x00\xe1\xeb\x0d\x09\x06\xdd\x24\x1d\x15\xde\x7a\x89\x60\xbe\x4a\xf9\x5c\x16\x4f\xc3\x08\x01\x22\x69\x59\x60\xe6\xe9\x8d\x24\xdb\x41\xfb\x54\x06\xa6\xb2\x8a\x07\x47\x21\x52\x7b\x0a\x52\x3a\xdc\x58\xb9\x5c\x71\x7d\x20\x0b\x27\x21\x84\x30\x46\x15\x45\x55\x55\x95\x31\x4a\x29\x55\x14\x45\xd3\xb4\x40\x29\x15\x45\x09\x4e\x81\x3f\x31\x87\x78\x99\x5b\x41\x0b\xc1\x29\x94\x8b\xa4\xd7\xd4\x85\xb0\xde\xc9\x3b\x42\xe4\x0a\xe5\x27\x00\x02\x0a\xb3\x75\x0a\x33\x60\x8b\x33\x77\x10\xe4\x6d\x07\x85\x10\x39\x6b\x04\xc9\x35\x7f\x00\x4f\x9a\xc9\x52\x90\x3c\x56\x08\x4c\xfc\x45\x6f\xb3\xb7\x10\x28\x1c\xf8\x7d\xbd\xbf\x2f\x08\x21\x1c\xc7\xf5\xd4\x2e\x90\x37\x2f\x7b\xea\xad\x2c\x1e\xbf\xe0\x27\xd0\x0c\x20\x15\x53\x54\x48\x61\x42\xa5\xac\x70\xc5\x7b\x1c\xa4\x1c\x63\x49\x79\x82\x1d\xa5\x05\x22\xaf\x94\x92\x8d\xa4\xd4\x0c\xa4\x41\xbb\xe0\x58\x81\x0a\x06\xca\x57\x31\xfd\xd4\x2f\x89\xa4\xca\xe0\x6b\x76\x59\x8d\x8a\x6b\xa6\xba\x8c\xf0\xcb\xe7\xc7\xb6\x00\xe0\x38\x60\x9a\x16\x54\xe0\x69\x9e\x77\x96\x14\x45\xd1\x75\xcd\x53\x46\x5d\xd7\x14\x45\x61\x8c\xe9\xba\xc6\x18\xf5\x45\x96\x04\x27\x17\x80\x30\xa6\x94\xc6\xcd\x50\xbc\x4c\xf1\xa7\x2f\x79\x57\x24\xc4\x6f\x3d\xf0\x15\x11\xa5\x11\x79\x1b\x41\x21\x44\x7e\x4b\x84\x10\xdc\x75\x1d\xd7\x71\x1d\xc7\x75\x1d\xee\x5a\x85\x44\x1e\x08\x02\xa4\x20\x75\xc5\x20\x4f\x9a\x04\x52\x98\x8b\x51\x8c\x57\x7c\x09\x14\x81\xb6\x05\xa9\x4b\x4f\xf6\xe4\x8e\xb5\x2c\x7f\x28\xfc\x19\x2e\x52\x10\x56\xa2\x1c\x52\x0c\x57\xbe\x17\xf8\xea\x1b\x88\xa5\x14\xfd\xc8\xe1\xa0\x28\x0d\xe0\xbc\xbd\x0a\x91\x8e\x94\xbd\x24\x84\x04\x4e\xe4\xa8\x31\xd8\x4b\x48\x85\x01\x39\x77\x5a\x6a\x13\x1c\x0b\x48\x69\xdc\x59\x1a\xa7\x8a\xd3\xef\x55\x9e\x37\x0e\xf6\x92\x17\xa6\x3c\xa7\x20\xa9\x97\xe3\x38\xb9\x5c\xae\x72\x2f\x4a\xa9\xa2\x30\x5d\x37\x14\x85\xa9\xaa\xe6\x69\xa4\xa6\x69\xaa\xaa\x06\x81\xaf\x7f\x2e\x08\x21\x85\x10\x52\x2a\x09\x17\x05\x6d\xf4\x93\xac\x42\x08\x41\xc0\x8f\x3b\xb3\x99\xb4\xa7\xbe\x94\xe1\x88\x23\xf2\x56\x80\x42\x88\x9c\x11\x5e\xb7\xeb\x38\xae\xeb\xd8\x8e\x63\xbb\xae\xeb\x38\x76\x30\xa0\x44\x08\xf5\xa7\x4b\x14\xf0\x45\xa2\x38\x6c\xe6\x6b\x49\x61\x45\xa0\x79\x8e\xe3\x0a\x21\x5c\xd7\x8b\xf3\xa6\x4e\xf7\x95\xcd\x31\xa9\xc8\x49\x16\x47\xb6\xe4\x01\xb6\x60\x4d\xa0\x1f\xc1\x1a\x29\x4c\x14\xa5\x4a\x23\x4a\x77\x91\x0b\x2f\x4a\x4d\x02\x3d\x2b\x31\x96\x22\x3f\x08\x2c\x3d\x81\x94\x0f\x57\x9a\xcc\x9c\xba\xe4\x81\x07\x79\x74\x50\x36\x0e\x5a\xb5\xac\xee\xa7\x5b\xa8\xd4\xcb\xe9\xf7\x2d\x93\xc0\x60\x93\x77\x99\xe2\x05\x94\xb2\xe8\x02\x80\xa2\x28\x86\x61\x28\x8a\x62\x18\xba\xa6\xa9\xaa\xaa\x1a\x86\x11\x24\x66\xfd\xa3\x51\xc2\x28\x2b\xce\x7d\x0d\x12\xab\x85\xc8\x31\x97\xcb\xf8\x0d\x21\x14\xa6\x30\x45\x55\x14\x55\x51\x14\xc6\x94\x60\x50\x14\x41\xce\x22\x28\x84\xc8\xd4\x78\xbd\x9b\x63\xdb\xb6\x63\xbb\x8e\xed\x38\x8e\xeb\x38\xc1\x0d\x66\x94\x12\xa6\x28\x85\xd1\x3d\x7f\x54\x8f\x10\xe2\xf7\xf8\xc4\xef\xbe\x89\x10\x25\x71\x9e\xf7\xd7\x4f\xa2\x96\x1f\xd0\x4f\xb5\x05\x01\x56\x60\x34\xc5\x3c\x91\xd2\xde\xbc\x24\x31\x58\x1a\x26\x06\x59\xd6\x20\xbc\x2b\x1f\x7a\x0c\x3a\x7f\x29\x49\x5b\x12\xbd\x05\xa9\x4b\x29\x98\x2b\xa8\xa3\x57\x66\x21\xe4\x18\xb7\x28\x9c\xc1\xfa\xa0\x16\x81\xb8\x48\xcb\xc5\xca\x12\x02\x15\x9b\x64\x88\x14\x9b\x0a\x79\xfc\x0f\x4a\x85\x6d\xca\x13\xfa\xba\x11\x61\xa5\x93\x33\x71\x2e\x6f\x72\x1c\x27\x9d\x4e\x97\x19\x30\xc6\x74\x5d\xf7\x44\x51\xd3\x54\x6f\x99\xd2\xc2\x45\x14\x00\x10\x42\x09\xa3\xd4\x1f\x7b\xf4\xa5\xd1\xf5\xa2\x46\xcb\x34\x2d\x33\xef\xbb\x52\x98\xa2\x28\x8a\xaa\x28\x2a\x63\x6c\xfa\xba\x20\xc8\x19\x82\x42\x88\x14\x91\xc2\x0d\xee\xcd\xb5\x4c\x26\x0b\x0f\xae\xa5\x94\x32\x55\xf5\xa2\x3d\x7f\xf6\x66\x90\xe4\x2c\x71\x20\x0b\x9e\xf7\x6f\x59\xb0\x11\xa8\x54\x30\x63\xa5\x34\x5e\xf4\xd4\x34\x98\xdf\x21\xdb\x14\x62\xb2\xb2\xe1\xb4\xd2\xc0\xa8\x18\x9f\xc9\xf3\x56\xfc\xd0\x0a\x2a\xb5\x50\x1e\x20\x94\xbd\xfa\xc2\x09\x7e\x31\xbc\x85\xa2\xb0\x95\x45\x84\x41\x61\xca\x90\x77\x91\x0e\x24\xfc\xd1\x3e\xd9\x52\x0e\x22\x83\x12\x16\x8b\x57\xda\xef\x97\x5c\x10\xc8\xf5\x9f\x52\xf0\x2a\xc3\xbb\xd3\xe9\xe2\x59\xb7\x71\x1c\xc7\x75\x5d\x00\x48\x24\x12\xc1\x35\x93\xaa\xaa\x9a\xa6\xe9\xba\x6e\x18\xba\xae\xeb\x9a\xe6\x4d\x6d\xf5\x6e\x05\x01\x42\x28\x50\xc2\x7c\x3f\x41\xd0\xe8\xeb\xa2\x09\xfe\x99\x13\x84\x12\x00\x20\x14\x5e\xef\x52\x00\x41\x4e\x07\xbe\x86\xa9\xda\xf1\x87\x9a\x84\xe0\xbc\x18\xc8\x01\x14\x26\xb5\x10\xe6\x8b\x1f\xf8\xfd\x8c\xdc\x77\x17\xba\x27\x7f\xae\x26\x77\x5d\x1e\x74\xd9\xa2\x38\x51\x85\xc8\x29\x37\x00\xf0\x07\xb9\x8a\xf9\xbd\x52\x01\x10\xfe\x5e\xe0\xc7\x8e\x81\x96\x94\xc4\x4f\x52\x15\x8a\xbb\x7b\x9d\xa6\x1f\x5a\x9d\x36\x5b\x58\x7a\x68\x00\x7f\xfa\x68\x69\xcb\xc8\x22\x54\x72\xac\x60\x4d\x99\x94\x06\x69\x55\xd9\x4f\xe9\x50\xdf\x14\x66\x7e\xad\x40\x88\x92\x65\xb9\x52\x53\x05\x88\xe5\x39\xcf\x80\x29\x87\x09\xe5\x4d\x72\x34\x39\xbd\x93\xd2\x11\xd3\x73\x68\xa3\x69\xaa\xa6\x69\x86\x61\xe8\xba\x1e\x0a\x85\x18\x63\x8c\x15\x72\xec\x52\x99\xc1\xff\xd6\x09\x21\xdc\xe2\xf8\xb1\x9f\x43\x26\x85\xb4\x7c\x59\x32\x16\x41\xa6\xe3\x0d\x0b\xe1\x79\xf7\x7e\x0d\xf4\x5c\xe9\x99\x73\xee\xba\x8e\x63\x5b\x8e\xe3\x38\x8e\x23\x84\xeb\xf5\x1d\x94\x92\xd2\x7b\x18\x48\x20\x7e\x41\xdf\xc5\x79\x31\xcd\xe9\xdf\x86\x17\xcc\x25\x01\x69\x59\xf8\x09\x52\xe1\xcf\xa2\x14\x81\x4d\x59\x91\xa4\x35\xc5\xa0\x4d\x94\x4f\x8f\x2c\x09\xf5\xca\x15\x4d\xd2\xa4\x29\x37\x04\x6e\xa5\x50\x4f\xf6\x2c\xdf\xf3\x57\xdc\x24\xc5\x91\x95\x99\xd2\xc0\xac\x50\xc1\xd2\x7a\x05\xba\x55\x5e\x9e\xd2\x19\x34\xc5\x8d\xc1\x26\x5f\x33\xe4\x00\xba\xb2\xb9\x2a\xdb\xa7\x9c\xca\x10\x6d\x1a\xcb\x33\x31\x3b\x47\x9c\xee\xe8\x8c\x31\x4d\xd3\x0c\x43\x37\x0c\x23\x14\x0a\xa9\xaa\xaa\x28\x4c\x4e\x7d\x4b\x97\x14\xc2\x9f\x80\x53\x98\xab\x4c\x80\x30\x55\x51\x14\x55\x55\x35\xc6\x14\x4a\x29\xbc\xc3\x7e\x83\xe8\xf9\x1d\xe5\x19\x53\xa3\xd5\x82\xdf\xdd\xf0\x54\x32\xe1\xba\x4e\x21\xfe\x23\x84\x12\xca\x98\x46\xa4\x84\x27\xf8\x39\x4f\x5f\xf9\x84\x10\x8e\x97\xe4\xf4\xba\x1a\xdf\x5f\x70\x2f\x76\xe0\x3e\x18\x60\x83\x20\xe1\x19\x88\x84\x3c\x37\x12\xfc\x9c\xe7\x54\x11\x98\x28\x6c\xf7\x87\xd9\xfc\x4e\xbf\x60\x05\x00\xc1\xfd\x09\xd2\x21\x44\x69\xbf\x5f\x99\x3e\x0d\x24\xb6\x52\x1b\x82\x34\xaf\xac\x82\x81\xbc\x95\x64\x80\xa5\x62\x94\x0c\x2e\x4e\xd5\xe0\x50\x5a\x59\x79\x77\x90\x76\x17\xc1\x26\x29\xfb\x5a\x52\xec\xa0\xad\xe4\x31\xd4\x29\xa7\xba\xc0\xe9\xc3\xaf\x69\x16\xa4\x03\xbd\xbe\xf1\x59\x5f\x38\xdd\xd1\xbd\x84\x6a\x36\xeb\xbd\x97\x83\x50\x4a\x3d\x5d\x0c\x85\x42\xe1\x70\xc8\x1b\x23\x24\x85\xe7\xc2\x02\xa5\x0a\xb0\xc2\x25\x02\xe7\x42\x70\xee\x3a\x8e\x63\xdb\xb9\x6c\xd6\x1b\xcf\x56\x15\x2d\x70\x5e\x79\xb2\x90\x2a\x07\x85\xf0\xdd\x8c\x14\x53\xf0\xe0\xd7\xef\xb8\x0e\x25\x84\xaa\xaa\xf7\x4c\x2c\x59\x06\xfc\xf0\x45\xb8\xae\xf0\x23\x3f\x1e\x88\x48\x99\x5b\x52\xb8\x03\xbd\xd8\xa1\x89\x92\xa1\xbe\xb2\x48\x8e\x04\x3a\x57\x1a\xc7\x04\x3d\x76\x41\x7e\xa4\xbf\xc1\xfe\xc1\x58\x9a\x1c\xf9\x95\x27\x1b\x4b\x93\xa5\xf2\xe8\xa0\x3c\x9d\xa4\xcc\xa6\x4c\x7d\x85\xd4\x08\x44\x76\x5b\x5a\x00\x39\xee\x2c\xee\x12\x28\x99\xdc\x9b\x4b\x6b\x82\x07\xdf\xc8\x36\xc5\x5a\x9c\x26\x3d\x59\x3e\x2a\xe9\xfd\x5b\xa6\x82\x65\xa2\x32\x7d\xa4\x58\xb9\xa3\xbc\x50\x7a\xa0\xb7\xc2\x66\x9a\xf2\xc8\x5b\x5d\xd7\xcd\xe5\x72\xb9\x5c\x2e\x91\x48\x42\x21\x5e\x54\xc3\xe1\x70\x28\x64\x18\x86\xa1\x69\x5a\x70\x92\x29\x25\x84\x31\x11\xc0\xb9\xe3\xb8\x8e\x9d\x2d\x9c\x3b\x42\x81\x60\xee\x14\x29\x01\x85\xf0\x5d\x88\x27\x66\xe0\xfd\x05\x00\xf0\xa6\x8d\x14\x1e\xd1\x49\x29\x0b\x42\x9c\xa0\xbb\xf1\x1f\xcc\x22\x38\x77\xa5\xe0\xa9\x28\x66\xfe\xdf\xb2\xc0\xa8\xd0\x95\xfb\x51\x88\x5c\x86\x20\xa4\x23\xc1\xcd\x03\xbe\x1e\x94\xec\x1e\xe0\xf7\x4a\x42\x08\x79\xe2\xa5\x3c\x6b\x26\x90\x4d\x08\x54\x2a\xd8\x14\xbc\x9c\x28\xa8\x97\x1c\x1b\x95\x46\x1b\x00\x85\xc7\xc7\x88\x52\x29\x2a\x14\xc0\x97\x73\x39\xa8\x2a\x29\xa7\x54\x3c\x22\x44\xb9\x9f\x8a\xe4\x30\x48\xdd\xae\x90\xcc\xe4\x8b\x03\xb9\xd1\x20\x30\x93\xea\x4b\x64\xb7\xa2\x34\xd4\x83\xd2\x3e\x5d\xd6\x7e\xb9\x6d\xa5\x0b\x82\xe9\xb6\x56\x72\xba\x1d\xdf\xa4\x4d\xd0\x16\xf2\x2e\x65\x36\xa7\x73\xeb\xba\x6e\x2e\xe7\xe6\x72\x79\x00\x20\x04\x14\x45\x0d\x85\x42\xe1\xb0\x11\x0e\x87\x75\x5d\x27\x84\xf8\xf6\x84\x2a\xd4\xbb\xff\xdf\x4f\xe4\xf3\x62\x20\x2f\x88\x27\x8a\xa8\x88\x55\x0e\x0a\xe1\xbb\x08\x21\x00\x84\x00\x01\xc0\x21\x78\x99\x2b\x21\x5e\xce\x53\x12\xbf\xc0\x5c\x78\xd9\x4e\xff\xd1\xd2\x20\xa7\xe9\xa4\xa8\x4b\x04\xa3\x59\xd2\x4d\x05\x45\x27\x72\x98\x05\x45\x01\x28\xa6\x43\x45\xc9\x9c\x94\xe2\x9a\x92\x3d\x24\x6f\xa5\x36\x25\x9d\xbe\xb7\xa9\x74\x94\xae\x78\x53\x44\x99\x84\xcb\x11\xe1\x94\x31\x0a\x00\x94\x56\xad\xac\x40\x53\x3c\xf6\x53\x0a\x70\x4b\x1a\xca\x2f\x4c\xb0\xa9\x18\x35\xca\x89\x4d\xa9\x3d\x8b\xe1\xdd\xe9\x0e\x2a\xeb\x5c\x65\x90\xe4\x57\xb6\x28\xfc\xf2\x42\xd9\xee\x81\x07\x28\xe5\x4c\x02\xc7\x73\xc4\x59\x3c\xb4\x10\x60\xdb\xb6\x6d\xdb\xa9\x54\x0a\x00\x14\x85\x19\x86\x11\x0e\x87\x23\x91\xb0\xae\x1b\x81\x28\x12\xc6\x28\x08\x21\x58\x21\x7d\xea\x3d\x75\x4f\x70\x20\x44\x08\xe2\x5d\x2e\x02\x2a\x62\x55\x82\x42\x78\xfe\xe3\xe9\x9f\x10\x5e\x1f\x48\x08\x10\xc2\xbc\x47\x54\x7b\xdb\xe5\x21\x2e\x21\x3d\x66\x1a\x4a\x3a\x23\x21\x19\x07\xe3\x5b\x65\x81\xce\x14\xcf\xc9\x94\x13\x77\x81\x07\x51\xb6\xa2\xa8\x31\xa4\xcc\x40\xb2\x24\xf2\x9a\x52\x27\x41\x40\x26\xa0\x64\xce\xaa\x1c\x42\x55\x26\x5d\xcb\xfc\x17\xcb\x2c\x55\xb6\x3c\x30\x12\xa2\x28\xe4\x72\x83\x94\x66\x4a\x65\xd1\x2a\xda\x94\x95\x19\x8a\xcf\xb3\x0e\x8e\x25\x2a\x1a\xa7\xa4\x3c\x65\x94\x85\x4d\xa7\x53\x8e\x33\x4c\x84\xc2\x54\xaa\x09\xaf\x97\x4a\x3d\xa7\x36\xd3\x97\x47\xb6\x7c\x43\x36\x8e\xe3\xa6\xd3\x99\xc9\xc9\x34\x21\x84\x31\x16\x0a\x85\x22\x91\x70\x38\x1c\x0a\x6e\xed\x07\x00\xc6\xa8\x10\x14\x00\xfc\x37\x6c\xf0\x42\xae\x56\x78\x5f\x69\x54\xc4\xea\x02\x85\xf0\x7c\x45\x08\x61\x5b\x96\x65\x9b\x02\xdc\x42\x72\x47\x7a\x80\xa7\x14\x07\x78\xb6\xc5\x21\x19\xce\x85\x14\x30\x95\xe4\xee\x4e\xd3\xd9\x06\x3d\x42\x49\x38\x28\x0f\x9b\x05\xc9\x43\x21\xca\xd5\xc5\xf7\x20\x0f\xa1\x11\xa9\x0f\x0c\xaa\x03\x72\xe0\x28\xcd\xc3\x14\x81\x90\xfb\x77\x9a\xcb\x7d\x1f\xf8\xe5\x2f\x06\x3c\x92\x7d\x71\x5f\x49\x99\x0a\x05\x28\x4d\xc7\x41\x99\xaa\xf9\x75\x91\xea\x50\x50\xb5\x20\xaa\x0e\x02\x32\xe2\x2f\x13\xc9\x5b\xf1\xa3\xdf\xce\x41\x1b\x96\xb7\xad\xec\x19\x40\x6e\x84\xf2\x9b\xe5\x2b\x3b\xfd\x32\x33\xb9\x4d\xa7\xcc\x7f\x56\x7a\x7b\xdd\xbc\xe8\xb9\xb0\x29\x3b\xfd\x53\x96\xff\xac\x2c\x7b\x37\xf8\x7b\xf7\xf8\x2b\x0a\x8b\x44\x22\xd1\x68\x24\x12\x89\x04\x13\x50\x09\x61\x82\x08\x00\x26\x44\xe1\x9e\x0c\xef\xcb\x48\x04\x98\x66\x5e\xd3\xb4\x69\x5f\x65\x85\xbc\x4b\x40\x21\x3c\xcf\x10\x42\x38\x8e\x6d\x9a\xa6\x6d\x99\xde\x1a\xf9\x8d\x0d\x44\x1a\x85\x92\x3a\xca\x20\x8d\x06\x72\x47\x5c\xf9\x4c\x4e\x51\x9c\xed\x22\xa4\x21\xb7\x20\x79\x28\xab\x4b\x59\xe4\x24\xa0\x64\xc2\x48\x10\x38\xca\xda\x59\xd4\x0c\x3f\x5b\x48\xca\x52\xa6\x41\x1d\x83\xc0\x54\x94\xdf\x24\x20\xd7\x4e\x4e\xd2\x12\xe9\x58\xb2\x76\x56\x86\x20\x85\xbd\xa4\x5a\x80\x6c\x29\xe9\x71\xd9\x5e\x41\x06\x55\xf6\x50\x79\x95\x50\x76\x83\x44\x59\x23\x00\x4c\x95\x71\x2d\xcb\xa6\x06\xe5\x29\x3b\xf5\x53\x6e\xaa\xcc\x8b\x9e\x2e\x53\x2a\x87\x53\x65\x9e\xcb\x36\x9d\xd3\x05\x38\x03\xce\x64\xd0\xee\x8d\xda\x38\x8e\x9b\x4c\xa6\x92\xc9\x14\x00\x84\x42\x46\x34\x1a\x8d\x46\xa3\x86\xa1\x17\x7f\x3b\x94\x8a\x00\xce\x33\xe9\xc9\x2c\xa5\x9a\xaa\x69\x9a\xae\x14\x1e\xa3\x8a\xbc\x3b\x41\x21\x3c\x3f\xf0\x92\x99\x96\x95\xb7\xcc\xbc\xf7\x40\x4e\x2f\x02\x0c\x86\x3f\xa0\x24\x5c\x00\x3f\x04\x0c\x3a\x62\x28\xcb\xcb\x95\xea\x59\xb1\xdf\x97\x75\xc5\x77\x28\xff\x05\xc9\x26\x58\x16\x92\x6c\xc8\x91\x5f\xe0\x27\xf0\x59\x8c\x75\x00\x40\x7a\x44\xb5\x90\x76\x91\x8b\x51\x72\xe8\x8a\x2e\xb4\xac\x82\x25\xa5\x2a\x9d\xa1\x13\x2c\x10\x28\x97\x37\xf9\xa0\x7e\x63\x94\xdc\x38\x21\x24\x27\x42\xae\xaf\x54\xe6\x92\xf2\x48\xc1\xb1\x28\x31\x2d\x2d\x4f\xa9\x87\x72\xb3\x8a\x92\x4f\x41\x99\xf3\xd7\x5d\x98\x72\xfd\xe9\x12\xb0\xd3\x68\xd8\x9b\xb4\x29\xab\x51\x65\x80\x58\x59\xe5\xb3\x6e\x93\xcb\xe5\x73\xb9\xfc\xc8\xc8\xa8\xa2\x28\xd1\x68\x34\x1e\x8f\x86\xc3\xe1\xe0\xd7\x24\x89\x22\xb7\x2c\xd3\xb2\x4c\x42\x88\xa6\x1b\xba\xae\xe3\x9b\x87\xdf\x95\xa0\x10\xbe\xd3\x11\x42\xd8\xb6\x65\x9a\x79\xd7\xb6\xbd\x44\x1a\x65\x85\x97\x39\x94\x46\x30\x41\xbf\x53\xd0\x06\x52\x98\xdc\x28\x2a\xe3\x2a\x29\x59\x27\xc7\x0d\x05\x7f\xfe\x8e\x10\x74\xeb\x72\x5c\xe5\x8f\xcd\x80\x28\x3e\x12\x33\x48\x2a\x06\x31\x0d\x91\x24\x44\xee\x21\x03\x3f\x65\x4a\x53\xd2\x43\x06\x49\xd7\xd2\x6c\x61\x79\x9c\x27\x6d\x02\xb9\xf7\xf3\x8f\x57\x38\x1c\x14\xa3\x55\xcf\x82\x48\xae\x0a\x35\x93\xca\x53\x19\x32\x82\x54\x9d\x62\x43\xc9\xbb\x48\x65\x86\xa0\xcf\x0f\x0a\x53\x2a\xa8\x72\x4d\x4b\x96\xfd\x7d\xbd\x96\x92\xaf\x69\x4a\x32\x99\x65\xe7\xe2\xcc\xbe\x44\x25\xc7\xab\xf4\x30\x8d\x9f\xd3\x25\x5a\x7f\x6b\x9b\x33\xf9\xf8\x56\xae\x71\x1c\x27\x91\x48\x24\x12\x09\x4a\x69\x34\x1a\x8d\xc7\x63\xd1\x68\x84\x10\x02\x40\x28\x25\x00\x54\x14\xa2\x44\x6e\x99\x39\x33\x9f\x53\x55\x55\xd3\x74\x55\xd3\x51\x0e\xdf\x4d\xa0\x10\xbe\x73\xe1\xdc\xb5\x4c\xd3\xb4\x4c\xc1\x39\x78\xbf\x4b\x1a\x3c\x50\x71\x9a\x0c\x53\xd9\x25\x79\x31\x06\x0a\x20\xc5\x47\x63\x17\xd7\xf9\x66\xf2\xd5\x74\xa1\x6b\x0e\xfe\x4a\xfd\xb5\x80\x92\x1b\x21\x84\x28\x1d\x51\x2b\x8b\x1a\xe5\x34\xa9\x5f\xc8\x92\x60\x4e\xca\x10\x92\xa0\x84\x52\x5c\x58\x1e\xa2\x55\xee\x12\x94\x23\x10\x3f\x28\x6d\xa6\xc0\x5e\x2a\xea\x14\x8d\x23\x95\x30\xb0\x99\xda\xc0\x3b\xf4\x54\x27\x22\x50\x97\xca\xd3\x54\xa2\x9a\x53\xb8\x2b\xd5\x14\x59\xfc\x4a\x36\x94\xee\x58\x16\x03\x4d\x99\x02\x7d\xdd\xbc\xe8\x34\x1e\xce\xa2\xcd\xe9\x0a\x7f\x2e\x8e\xf5\x86\x6c\x38\xe7\xa9\x54\x2a\x99\x4c\x32\xc6\x62\xb1\x68\x4d\x4d\x3c\x1c\x0e\xd3\xc2\x2f\x8e\x52\x2f\x40\xe4\xdc\x7b\x18\x13\xc9\x65\x35\x4d\xd7\x74\x83\x4a\xef\x91\x46\xce\x5f\x50\x08\xdf\x81\x08\x00\xc8\x66\xd2\x96\x65\x01\x08\x28\xa6\x40\x8b\x1d\xab\xac\x3a\xb2\x56\x41\x31\x42\xf2\x7d\x95\x66\x86\x02\x0f\x81\x99\xbf\x7b\xb1\x8f\x2a\x3d\x84\x28\xdd\x3d\x70\x58\x2e\x36\x95\xfd\x73\xc1\x59\x51\xa8\x82\x50\x35\x38\x74\xa0\x76\x41\xb0\x05\xa5\x7a\x19\x78\x90\xbd\x41\x99\x59\x69\x9e\x0d\x24\x3f\x65\xed\xe0\x05\x5e\x72\x92\x90\x94\x6a\x61\x70\x2c\xe2\x07\x8e\xe5\x37\x11\x96\x1e\xae\x24\x60\x2d\x4d\xb4\x16\x6f\xac\x0c\xda\xa7\x32\x6f\x27\x99\x9d\xfe\xba\xa6\x22\xb9\x1a\xac\x0f\x02\xbb\xb2\xad\x53\x06\x7f\x53\xfa\xf4\xbe\x57\x95\x66\xa5\xd1\xff\x59\xb3\x39\x5d\x91\x82\x95\xa7\xf3\x73\x8e\x6c\xa6\x6c\x58\xd7\x75\x13\x89\x64\x22\x91\x54\x55\x35\x16\x8b\xd6\xd4\xd4\x18\x86\x5e\xc8\xc1\x78\xaf\xcc\x10\x82\x0b\x61\x9a\xf9\xbc\x99\xd3\x54\x4d\x37\x42\x15\x5f\x5a\xe4\x3c\x03\x85\xf0\x1d\x45\xb1\x07\xf7\x86\x25\x08\x65\x00\xc5\x38\xa6\x60\x24\x09\x95\x9f\x3a\x2b\xae\x0f\x90\xf2\x6e\x25\x71\x4f\x45\x14\x55\xd6\xd1\x97\x74\xfd\x92\x72\x78\x05\x23\xc1\x4d\x1a\x7e\x52\x51\x76\x25\x2a\x34\x29\xb0\x01\xbf\xdf\x97\x15\x94\x10\x22\xa4\x2a\x10\x5f\xab\x8a\x75\x91\xd6\x97\xe4\x3c\xe5\x94\x66\x69\xfc\x44\xa4\xd6\x08\x7a\xe1\x92\x4c\x6f\xe0\xd3\xfb\x28\x47\x96\xa4\xf8\xba\xdd\x92\x0b\xfd\x40\xd5\x4a\xb3\xbe\x25\xed\xed\xf7\xbf\x50\x3a\x5f\x34\x38\x11\x45\xc5\xf2\xd7\x14\x03\x47\xf9\x74\x49\x17\x2b\x44\xde\x5d\x88\x92\x62\xbd\x6e\x56\x73\x1a\x1b\x59\x09\xa6\x77\x75\x16\x6d\xa6\x49\xc6\x96\xad\x3c\xd7\x36\xa7\xbb\xb6\x28\xc3\xb6\xed\xf1\xf1\x89\xf1\xf1\x09\xc3\xd0\x6b\x6a\x6a\x6a\x6a\xe2\x8a\xa2\x10\x42\x80\x90\xe0\x0e\x7d\xef\xfe\x45\x00\x01\xe0\x4d\x2e\x45\x39\x3c\x2f\x41\x21\x7c\x87\x50\x94\x40\x52\xb8\x11\x9e\xca\x22\x07\x52\xfc\x54\xd6\xd1\x4b\xbb\x97\x65\x14\x4b\xcc\xfc\x90\x85\x40\xf1\xce\x01\x21\x8d\xdb\x05\x47\x21\x15\xfb\x7a\xbb\x00\x14\x9e\xa2\x12\x64\x56\x65\x9d\x13\xb2\xd8\x80\xe4\xbd\x34\x8e\x0c\x8e\x15\xe8\x4d\xb0\x5c\x16\xd8\x05\x5b\x8b\x91\xa2\x2c\xab\xb2\xde\xc8\x81\x97\x6f\x57\xd6\xb6\xb2\xd8\x7b\xc2\x53\x54\xf7\x20\xa4\xf6\xaf\x30\xe4\x10\xad\xfc\x9e\x8a\xa0\x65\x02\x01\x0b\x6a\xe7\xaf\x29\xe2\x5f\xc1\x54\x26\x36\x2b\x3b\xe2\xa2\xd2\x97\x8a\xa2\x6c\x56\xbc\x04\x28\x36\x47\x45\x6f\x7e\xba\xf0\xab\x72\x21\x70\x3e\x8d\xcd\x59\x5c\x78\xdd\xf2\xbc\x05\x0b\xa5\x27\xf1\x4c\xf7\xca\xe7\xcd\x7c\x7e\x78\x64\x64\x34\x1a\x8d\xd6\xd5\xd5\x78\x29\x53\x21\x84\x17\x20\x0a\x21\x40\xf0\x52\xff\x28\x87\xe7\x19\xf8\x1a\xa6\xb7\x9d\x62\x37\x57\x98\x03\x4a\x88\x1c\xb2\x40\xe9\x5d\x0d\x81\x0a\x4e\x6f\x23\x84\xac\x43\xc2\xdf\xb1\x30\xb9\x06\x0a\xf9\xc9\x42\xf6\x0f\x4a\x02\xa3\xc0\x61\xa0\x16\x9e\xfc\x04\xb1\x5a\xf1\x07\x2f\xb9\x2a\x8a\x74\x20\x27\xbe\x02\x95\x75\x40\x85\xde\x3c\xe8\x12\xe5\xdd\x83\x5d\x24\x3f\xc5\x43\x48\x71\x6a\xb1\x6a\xc1\x8a\xd2\x5a\xcb\x66\xb2\x9f\x62\x0b\x04\xd5\x94\x75\x74\xca\x2a\x48\x97\x29\xe5\xf7\x57\xf8\x12\x58\xe8\x39\x4b\xaf\x39\x84\x54\xaf\xa2\x5b\xbf\x68\x05\xe5\x93\xda\xb9\xfc\x9b\xe1\x7b\x90\x2f\x05\x4a\x02\x9a\xd3\x75\xf4\xf2\xc7\xd3\xf5\xef\x67\x22\x15\xa7\xf3\xf0\xdb\xd9\x04\xed\x15\x48\x75\xe5\x2e\x65\x2b\xcf\xba\x0d\x48\xdf\x8a\xdf\xba\xf5\x0c\x43\xaf\xab\xab\x8b\xc7\x63\x8c\xb1\xe2\x26\x11\x34\xaa\x10\x25\x63\x01\xc8\x79\xc0\x74\xdf\xda\x4a\xce\xc7\xf7\x6b\xbc\x93\x3d\xbb\xae\x93\xcf\xe7\x1c\xdb\x02\x08\x24\x50\xbe\x82\x16\xc1\x95\x3d\x00\xf8\xfd\x6c\x51\x8d\xa6\xb1\x99\x52\x0f\x82\x7f\xcb\x96\xfd\x8f\x65\xdd\x71\x51\xfc\x2a\xfa\x77\xb9\x5b\x17\x53\xb9\x2a\xea\xb1\x7c\xc4\xd2\x95\x53\x94\x44\x94\xce\x50\xf5\xd7\x93\x62\x07\x33\xd5\x93\xb5\xfd\x5d\xc0\x97\xfc\x4a\xc1\x2e\x57\xc4\x60\xbd\x98\x3a\xc2\xae\x8c\xa4\xa7\x6c\xb4\x62\x83\x94\x36\x1a\x94\xc9\x79\x59\xed\xa6\x2b\x5d\xc9\xcf\xb1\x52\xfb\xa7\x58\xae\x4c\x45\x96\xad\xac\xb4\x79\x43\xbf\xfa\xb3\xc2\x5b\x7f\xc4\x73\x7d\x74\x45\x51\x6a\x6b\x6b\xea\xea\x6a\x35\x4d\x2b\x1e\xc5\x17\x43\x45\x51\x75\x23\xa4\x28\x53\xa4\xdc\xde\xc9\x3d\x52\xd5\x7a\xc6\xd4\xe8\xdb\x03\xe7\xdc\x34\xf3\xa6\x99\x27\x00\x84\x50\x5f\x02\x01\xca\x93\x87\xe0\x2b\x81\x97\x90\x2c\x2c\xbc\xae\x8d\xb4\x52\x96\x8d\x42\xe4\x27\x45\x84\x00\xe5\x49\xd7\xa2\x07\x29\x9d\x05\xbe\x93\x12\x0d\x28\x0b\xb3\x4a\xf5\xb8\x5c\x38\x25\x99\x09\xe4\xbc\x3c\xd2\x95\xa5\xc8\x2f\x49\x31\x20\x2b\x66\x0c\x4f\x33\x21\xd0\xd7\xe0\xa2\x9f\xb2\x38\x20\x10\xa1\x40\x50\xcb\x94\xd5\x3b\x8a\x95\x49\x81\x93\xa7\x44\x78\x81\x28\x17\x22\x9f\x1a\x07\x3b\xcb\x08\x27\x85\xb4\x6a\xe1\xfa\x9f\xbb\xae\x6d\xe6\xb8\x63\x09\xd7\x49\xa5\x52\x96\x69\x35\x35\xc4\xbd\x3a\x11\xf9\x59\x6e\x7e\x7d\xe4\xea\x71\x20\x89\x54\x6e\x22\x95\xeb\x9a\xd9\x42\x98\x42\x98\xaa\xe8\x21\x4a\xa9\x77\x55\xe4\x55\x27\x93\xb3\x5c\x60\x91\x86\x56\x45\xd1\x00\x08\x10\x22\x04\x38\x82\xb2\x50\x8d\x67\x25\xd5\xbd\x3c\xb8\x91\xaa\x3c\x75\xa3\x55\x09\x53\x5e\x37\xbc\xc9\x05\x00\x70\x1c\x67\x6c\x6c\x7c\x62\x22\x11\x8f\xc7\x1a\x1a\xea\xbd\x27\x7d\x07\xbf\x31\xc7\xb1\x9d\xb4\xa5\x69\x86\x6e\x78\xe7\x14\x79\x47\x83\x42\xf8\x56\x23\x84\xb0\x6d\x2b\x9f\xcf\x09\xce\x89\xdf\x97\x41\xf1\x21\x64\xc1\x42\x41\xf0\xc0\xbf\x9d\x40\x9a\x5a\x72\x26\x36\x45\x99\xf1\x38\xfd\x72\x31\xe2\x81\x42\x4f\x7a\xba\xb2\x17\xcc\x82\x2c\xab\xdc\xb1\x06\xa3\x60\xa5\xbd\x7d\xc1\xa5\xbf\x09\xa0\x7c\x32\x0e\x94\xca\x39\x94\x8d\xd8\x95\xfa\x0c\x2c\x89\xbc\xbb\x5f\x0c\x51\xb1\x63\x11\xc7\xb6\x2c\xcb\x62\x6e\x9e\x09\x1b\x80\x73\xd7\xcd\x8d\x0f\x28\xc4\x05\xc1\x39\x77\x47\x4f\x0d\xc4\x14\x87\xf9\x77\x8c\x65\xb3\x99\x44\x22\xd5\xda\x54\xe7\xfb\x15\xc7\x7b\x86\x7a\x06\x47\x36\xae\xee\xd6\x55\x05\x08\x49\xa6\x32\x39\xd3\x6a\x6e\xa8\xa5\x94\x10\x00\x06\x00\x00\xfb\x77\xef\x7f\x7a\xeb\xde\x4f\x7f\xe4\x3a\xc7\x75\xc7\x13\xe9\x99\x6d\x8d\xba\xae\x7a\x47\x1f\x1a\x4b\x66\x73\x66\x67\x7b\x53\xdf\xe0\x58\x73\x63\x8d\xae\x2a\x02\x80\x02\xf4\x1e\x3d\xfe\xd8\x73\x3b\x7f\xef\xb6\x2b\xea\x6b\x63\x20\x84\x0b\xc4\x25\x20\x5f\x5e\x3c\xf4\xd8\xd6\xbd\x07\x7a\xbe\xf0\x89\x5b\x34\x55\x09\x2a\x2e\x80\x70\x45\xf3\x26\xee\x73\x41\x6c\x62\x68\xb1\x06\x4a\x29\xa1\x8a\xe9\x12\x25\xd6\xc4\x98\x02\x94\x39\x42\x51\xc2\x35\x72\x23\xc8\xd2\x58\xd6\xb9\x4f\x93\xf3\x3c\x2b\x36\x41\x01\x2a\x73\x95\xa5\x59\x90\xb3\x6f\x13\x54\x5c\x6e\x04\x79\xb9\x32\x8b\x70\x26\x36\x9e\x73\xce\x79\x22\x91\x4c\x26\x53\xf1\x78\xac\xb1\xb1\x41\xd7\xf5\xc2\x36\x42\x84\x10\x96\x65\x5a\xb6\x15\x0a\x85\x55\x55\xab\xce\xab\x90\xf3\x05\x14\xc2\xb7\x14\xce\x79\x2e\x97\x75\x1c\x1b\x00\xfc\x9b\x02\x83\x8d\xc4\xff\x18\xac\x12\x7e\xd7\x2f\xe4\x4d\x67\x62\x03\xa5\xcf\xd2\x94\x92\x99\xa2\xd4\x06\x24\x69\x91\xb3\x7f\xc5\x82\xc9\x6e\x82\x01\x26\x28\xcc\xbb\x01\x3f\x2e\x94\x77\x3f\xed\x0f\x5e\x4a\x42\x7a\x1f\xe5\xd4\x6e\xc9\xbe\x92\xcd\x14\x6e\xe5\xb2\x79\x23\x9d\x99\xf4\xa4\xeb\xd8\xb1\x9a\x3a\x33\x39\xc4\x84\xed\xba\x4e\x6e\x62\x48\xe1\x39\x21\xb8\x99\x49\xf1\xec\xd8\xb6\x9d\x07\xee\x7b\xf8\xb9\x5b\xaf\xdd\xb8\xe7\xb5\xe3\xb1\x68\xe8\xc2\x35\x8b\x5a\x9b\xeb\x6c\x00\x02\x90\xce\xe6\xff\xf9\xbf\xef\xbb\x60\xe5\xc2\xeb\x2f\x5b\xeb\x95\xe9\x44\xcf\xe0\x0f\xee\x7f\xea\xf7\x3f\xf0\x9e\xd9\x33\x5b\xc0\x3b\x55\x8c\x9e\x1a\x9e\xc8\x9b\xb6\x61\x68\xc9\x54\xf6\x1f\xff\xeb\xbe\x7c\xde\x6a\x6b\xa9\xfb\xc8\x7b\x2f\x6b\x6d\xae\x03\x00\xd3\xb2\x37\xad\x59\xb4\x61\xf5\x42\xce\xc5\xdf\xff\xc7\x4f\xc7\x93\xe9\x68\xc4\xb8\xe3\x86\x8b\x97\x76\x77\x0a\x10\x8d\xf5\x71\xc1\x45\xde\xb4\x7f\xf2\xd0\x73\x4b\x16\xcc\xba\x7a\xcb\x6a\xaf\x06\x2b\x16\xcf\x5e\xd6\xdd\xe5\xa9\xa9\x20\x44\x08\x31\x3a\x96\xaa\xab\x89\x2a\xac\x10\x43\x5c\x77\xd9\xda\xab\x2e\x5e\xa5\x2a\x4c\x3a\x05\x40\x09\xd8\xf9\xcc\xd3\x5b\xf7\xcd\xeb\x6a\xeb\x6a\x6f\x56\x20\xc3\xad\x31\xd7\x6f\x32\x77\x94\xb8\x05\x53\xe2\x30\x95\x52\xe6\x08\x0a\xa1\x3a\xa6\x18\xc7\xfb\xc7\xa2\x0d\x2d\x6d\x33\xda\x41\x10\x57\x8d\x2a\x46\xd4\x3f\x0b\x30\x7d\x37\xfd\xe6\x6d\xca\xc2\xd3\xb7\x66\x59\x16\xad\x37\x54\x9e\x37\x64\xe3\x1d\x28\x99\x4c\xa5\x52\x93\xb5\xb5\x35\x4d\x4d\x8d\xc5\x8c\x28\x21\x42\x88\x5c\x2e\x6b\xdb\x96\x61\x84\xbd\x31\x45\xe4\x1d\x08\x0a\xe1\x5b\x87\x6d\x5b\xf9\x6c\x46\x48\x3f\x27\x39\x53\xe7\x2f\x10\x69\x41\x4e\x1e\xbe\x31\x1b\x0f\xe9\xa2\x58\xc8\x1a\x53\xa6\x6d\x72\x92\x50\x1a\x6c\x2b\xc9\x67\x7a\xe2\xe7\x87\xa1\xc1\x61\x8a\x7a\x2c\x67\x5c\x7d\x55\xf6\x52\xa6\x44\x4a\x3f\xca\xda\x1c\xb4\x44\x89\x1f\x69\x74\xad\x6c\xb8\xb4\x30\xba\x06\x00\x8e\x65\x3a\xa9\x53\x14\xdc\x6c\x72\x94\x98\xc9\x91\xb1\x89\xbf\xfb\x3f\xff\x92\xcf\xe5\x16\xcc\x69\xbf\xe3\xc6\xcd\x35\xb1\xf0\x2f\x1f\x7b\x79\xef\xc1\x93\x7f\x72\xd7\x8d\xd1\x48\x88\x00\x30\x42\xd6\x2f\x9f\xbd\x7c\x41\xfb\x0b\xdb\x5f\xdb\xb1\xf7\x28\x10\xf2\xf2\xce\xc3\x7f\xf9\x87\xb7\xd5\xd5\x44\x85\x10\xc9\x74\xee\x03\x37\x6e\x59\x30\xa7\x9d\x50\x02\x40\x1c\xc7\xcd\xe6\xcc\xbf\xfd\xfc\x87\xbc\xd7\x16\x7b\xd9\xd6\xd9\x33\x5b\xe7\xcc\x6a\x15\x20\x40\x10\x43\x57\x0d\x5d\xcd\x64\x72\x7d\x83\x63\xfb\x0f\xf7\xb6\x36\xd7\xb9\xae\xfb\xd5\x6f\x3d\x50\x5f\x13\xfb\xbd\xdb\xaf\x10\x14\xda\x5a\xea\xc7\x93\xe9\x74\x3a\x7f\xe4\xe4\xe0\xd2\xee\x4e\x10\x84\x51\xd2\x7b\x6a\x24\x1e\x8b\x5c\x7f\xf9\xba\xf9\x5d\x33\x0e\x1d\x1f\x52\x55\xd5\xe5\x3c\xa4\x2b\x6d\x4d\x71\x42\x88\x00\x01\x02\x4c\xcb\xf9\x9f\x7b\x1e\x5b\x38\xa7\xfd\xbd\x57\x6f\x14\x42\x1c\x3e\x31\x9c\xc9\xd9\xf5\xb5\xf1\xc9\xcc\x44\x2e\x9f\x9f\xd3\xd1\x58\x5f\x17\x25\x00\x02\x04\x21\xc4\x71\xdc\xe1\xd1\x44\x57\x47\x33\x00\x9c\xec\x1f\x17\x40\x6c\xc7\x55\x18\xcc\x6c\xab\xf7\x74\x94\x80\x10\xae\xe5\xba\x40\x00\x60\x32\xf3\xe8\x73\xbb\x1e\x7a\xe2\x15\x4a\xc9\xca\xc5\x73\x3e\x78\xd3\xc5\x8c\x31\x97\x29\x02\x08\xd7\x6b\xd5\x50\xcc\xe1\x94\x46\x9b\x99\xaa\xdb\x60\xa8\xb1\xfa\xb3\x95\x42\x9c\x32\x4c\x3c\x93\xd8\xe8\xcd\xdb\x4c\x1f\x9b\x9e\xad\x32\x40\x69\x65\x27\x26\x12\xc9\x64\xaa\xb1\xb1\xa1\xa1\xa1\x5e\xde\xdd\x75\x9c\x74\x3a\xe5\x85\x86\x67\xe2\x13\x79\x8b\xc1\xc9\x32\x6f\x91\x67\x02\x82\x50\xff\x9a\xd9\xef\xd0\x83\xb1\xb4\xd2\x35\x95\x0b\x6f\xcc\xc6\x1f\x2a\x2b\xa6\x1c\x83\x41\x38\x3f\x65\x2a\xdb\x14\x90\xb3\x94\xfe\x72\x71\x54\x4f\x1a\x7e\x83\xd2\x95\x65\x03\x30\x20\x8a\xb7\x3c\x0a\x28\x1d\xa4\xf4\x57\x16\x82\x3c\xbf\x48\x25\xdf\xc1\xa2\x3d\x77\x01\x60\xa8\xf7\xb8\x26\xf2\x0a\x71\xec\xe4\x20\x11\x6e\x76\x7c\x80\xf1\x3c\x77\x5d\xcf\x9f\xe3\xb8\xba\xa6\xa6\xd2\xb9\x7f\xf8\xda\xcf\x26\x33\x39\x00\xf8\xd0\x2d\x97\x6c\x5c\xd3\xed\xd8\xee\x64\x26\x57\x57\x13\x0d\xca\xc7\xb9\x78\xea\xa5\x3d\x33\x9a\xeb\xb7\xef\x39\x32\x3a\x9e\x6a\x6b\xa9\xbf\xe5\xaa\x8d\xaa\xca\x40\x04\x15\x28\x06\xd6\xbd\x83\xa3\x00\x30\xb3\xad\x31\x97\xb7\x0f\x1e\x1b\x6a\x69\xac\x9b\xcc\x66\x41\xf0\xae\xf6\x06\x2f\x38\xcb\x9b\xd6\xf1\xde\xe1\xde\xc1\x91\x2d\xeb\x97\x6a\xaa\x02\x20\x4c\xcb\x11\x42\x18\xba\xe6\xd5\x66\x64\x2c\x49\x29\x31\x4d\x3b\x93\x33\x17\xcc\x9e\x41\x08\x19\x4b\x4c\x86\x43\xba\x65\xdb\x2f\xbc\x7a\x22\x1c\x8e\x5f\xba\x7e\xe9\x64\x26\xf3\xb3\x47\x9f\xdd\xb5\xff\xc4\xa6\x55\x0b\xae\xbf\x64\x99\xa6\x29\x05\xd5\x05\xe1\x72\xf1\x93\x87\xb7\xd7\xd7\xd6\x5f\x7b\xc9\x9a\xe6\xfa\x9a\x53\xa3\xe3\x4f\x6e\xdd\xf9\xe8\xf3\x3b\x23\x86\xbe\x69\xd5\xbc\x4d\xab\xe6\x1a\xba\x5a\x08\xf1\x09\x3c\xbf\xfd\x68\x62\x92\x5f\xbb\x65\x75\x2a\x93\x79\xf4\xb9\xed\x2f\xed\x3c\xb4\xb2\xbb\xf3\xa6\xcb\x57\xd6\xc4\x42\x5e\xc5\xfa\x4f\x8d\xa5\xd2\x39\x21\xc4\xb7\x7e\xfa\xb8\x65\xd9\xd1\xb0\xf1\xe7\x9f\xba\x35\x12\x36\xe0\x34\x50\x4a\x39\x30\x08\x35\x28\x7a\xc4\xa6\x21\x3d\xd6\x60\x0b\x85\x45\x1b\x81\x30\xa8\xd0\x86\x29\x87\x27\xa7\xa7\x52\x17\x2b\x63\xaf\x37\x6f\x23\xca\xbe\x58\x15\x94\xa5\x3a\xdf\xa4\x4d\x59\xf5\x75\x5d\x6b\x6d\x6d\x8d\x44\xc2\xc1\x38\x82\xe7\x45\x55\x35\xd3\xb4\xa6\xf1\x56\xc9\x79\xd7\xd7\x9d\x8f\x9e\x31\x22\x7c\x2b\xa0\xc4\xff\x01\xfb\x3f\x63\xef\x27\x43\x4a\x66\x6a\x10\x7f\x0d\xf1\x43\xab\xdf\xda\x26\xe8\x98\x40\xce\x0f\x49\x91\x5f\x31\x7d\x2a\x0d\xb7\x04\x36\xc5\x90\x55\x1e\x1f\x91\xd5\x94\x14\x6f\x96\x2f\xce\xcd\x09\xc6\xea\x7c\xcd\x26\xa5\xf1\x2b\xf8\x12\x18\xd4\xc2\xcf\x7c\xba\x36\x00\x98\xc9\x11\xb0\x52\xf9\x4c\xca\x9d\x1c\x16\xdc\x32\x27\x06\xa9\x70\x7e\xf8\x8b\xa7\x4f\xf4\x0d\x7d\xfe\xe3\xb7\xa8\xaa\x42\x00\x54\x42\x80\x12\xc1\xc9\xc9\x81\x51\x10\xf0\x9f\xdf\x7b\xf8\x77\x6f\xbf\x72\xf1\x82\x59\x7f\xf6\xa9\xf7\x9f\xec\x1b\x0e\x87\xf4\x79\x5d\x6d\x00\x64\x32\x6b\x9e\xe8\x9f\x98\x48\x59\xe1\xb0\x5a\x5f\x13\xf6\xd4\x2b\x99\x30\xde\x3d\xd5\x00\x00\x20\x00\x49\x44\x41\x54\xca\x30\x4a\xef\xbc\xe5\x12\x02\x60\x3b\x6e\xde\xb4\x14\xc5\xd8\x73\xb0\x3f\x1a\x8e\x35\xd6\xc7\x4e\xf6\x9f\x52\x15\x32\x67\x66\x93\xaa\xb0\x83\x47\xfb\xf6\x1d\xec\xf9\xc4\x87\xae\xf9\xce\xcf\x5f\xda\xbc\x76\x69\x5b\x73\x6b\xbe\x7f\xf0\x9e\x87\x9f\x19\x18\x9a\xb8\x7c\xc3\x92\x6b\x2e\x5e\x6a\xe8\xda\x8c\x96\xfa\xfb\x1f\x7d\x29\x1e\x09\xad\x5e\x3e\x6f\x68\x74\x32\x9d\x35\x6d\xdb\x8d\x45\xf4\xe6\x86\x98\xa1\xab\x2d\x8d\xb5\x00\xf0\xf2\xae\x43\x2f\xef\x3c\x3c\xb3\xad\xd1\xb4\xec\xfe\x53\x63\x33\xdb\x1a\x6b\xe2\xe1\x43\x27\x06\x07\x46\x5e\x7b\x71\xc7\x1e\x2e\x60\x78\x2c\x35\x36\x91\xf9\xc9\x23\xdb\x86\xc7\x26\x3f\x79\xc7\x16\x20\x20\x40\x9c\xe8\x1d\xee\x1f\x4a\x1c\xe9\x19\x5d\x62\x84\x5e\xd9\x7b\x28\xa4\x6b\xd9\xbc\x99\x98\xcc\x86\x0c\xad\x67\x70\xf4\xb5\xa3\xa7\xee\xff\xcd\xce\x3f\xfc\xf0\x65\x0b\x3a\x5b\xbc\x66\xee\x19\x18\xdb\xbe\xef\xe4\xbe\xc3\xc7\x08\x25\x23\xe3\x93\x63\x13\x99\x87\x9f\xde\x73\xe4\xe4\xc8\x97\xfe\xe8\x46\x42\x08\x10\x18\x1d\x4f\xbd\xb4\xf3\xd0\x87\x6e\xde\xf2\x57\x7f\x74\xfb\x37\x7e\xf8\xeb\x65\x8b\xba\x62\x91\xb0\x37\x99\x07\x2a\x7a\x79\x21\xc4\x33\x2f\xef\xeb\x1f\x1c\xeb\x9e\xd7\xbe\x74\x41\x27\x63\xd4\x1a\x05\x00\x70\x09\x11\x44\x15\x7a\xad\xa2\x87\x5d\xbd\x56\x35\x62\xb6\x12\x53\x43\x31\x41\xa8\xf7\xd8\x07\x78\xbd\xbc\x68\x40\xa5\xd9\x59\x5f\x53\xa6\x9a\x95\xa1\xea\x94\xbb\xbc\x19\x9b\xb2\xf2\x58\x96\xdd\xd3\xd3\x5b\x5b\x5b\xd3\xdc\xdc\xe4\xdd\x86\xef\xfd\x1e\x1c\xdb\x22\xa7\x19\xc6\x46\xde\x46\x30\x22\x3c\xe7\x9e\x29\x95\x87\x4f\x0a\x29\xcd\xb2\x8b\xe8\xd2\x8b\xd9\xb3\x60\x03\x52\x5f\x20\xfc\x04\xa5\x74\xae\x0b\x31\x99\x9f\xcf\x0c\xe6\xa0\xca\x3f\xd1\xa2\x27\x29\xb6\x0b\x62\x50\x11\xdc\x86\x28\x44\x51\xea\x82\xb0\x52\xce\xc7\x0a\x49\x4e\x5d\xdb\x24\xc2\x35\xd3\x09\x37\x3b\x66\xe7\x33\x23\x3d\x87\x7b\xfa\x4e\xcd\x6e\x64\x1a\x13\x9c\x0b\x52\xb8\x85\xa4\x00\x08\x48\x67\x73\xe1\x90\xc1\xa8\x37\xa5\x47\x00\x10\x01\x20\x38\x1f\x9d\x98\x6c\xac\x8f\x27\x52\x99\x58\x34\xa4\x30\x56\xcc\xaf\x0a\x71\xbc\x7f\xec\xa9\xad\x47\xdf\x77\xd5\x26\x00\xf1\x8b\x27\x5e\xdc\x7b\xf0\xf8\xf2\x05\x9d\xd7\x5d\xba\xbc\x26\x1a\x0a\xbe\xf0\xdb\xf7\x1c\xb9\xf7\x91\xe7\xaf\xbd\x6c\xfd\x81\xe3\x13\xd7\x6c\x59\x5d\x13\x8f\xbc\xb8\x63\xdf\x83\x4f\x6e\x13\x2e\xb9\xed\xda\x0b\x2e\x5c\x3d\x0f\x00\x2c\xc7\xf9\xe2\x3f\xdf\x47\xa8\xd0\x35\xc5\xb4\x9c\x54\x3a\x9f\x4c\xe5\x6c\x87\xff\xee\xfb\x2e\xbc\x6e\xcb\x72\xaf\x11\x06\x86\x93\x0f\x3f\xbd\x7f\x79\xf7\xdc\x55\x4b\xe6\x08\xce\x5f\xd8\xb1\xff\x95\xbd\x87\x29\x11\x6b\x96\x74\xad\x59\xda\x19\x36\x34\x02\x84\x73\xfe\x6f\xdf\x7a\xe0\x78\xef\x90\xa6\x2a\x57\x6f\x59\xdd\xd2\xdc\x70\xdf\xc3\x2f\x5b\x8e\xc3\x39\xb7\x1c\xee\xba\xc2\xb2\xf9\xfc\xd9\xad\x7f\xfc\xbb\x57\x80\x20\x00\xe2\x37\xcf\xed\x7a\x75\xdf\xf1\x83\x27\x13\xaa\x4a\x43\x86\xaa\x28\xd4\xe5\xc2\xb1\x79\x3a\x6b\x99\xa6\xc3\x85\xe0\x5c\xb4\x35\xd5\xfc\xc3\xe7\xdf\x1b\x32\x34\x00\xe8\x1b\x1c\xff\xee\xbd\xcf\xa6\xb3\x79\x42\xc0\xb4\x5d\xd7\x15\xb6\xed\x46\xa3\xa1\x2f\x7f\xee\x7d\x85\xc1\x45\x39\xf7\xec\xe3\xba\xdc\x71\xdd\x74\xd6\xea\x1d\x9c\x20\x84\x68\xaa\x12\x32\x94\xa6\xfa\x68\xd8\xd0\xbe\xf0\x77\xdf\xb2\x1d\x17\x00\xae\xbc\x68\xe5\x75\x97\xad\x05\x00\xc7\x75\x6d\xdb\x55\x15\xf6\x8d\x1f\x3d\xba\x78\xc1\xcc\x8b\x2f\x58\x32\x38\x3c\xbe\xf7\x60\xcf\xc5\xeb\x97\xa9\x91\x3a\x35\x1c\x77\x94\x98\x16\xa9\x73\x94\xb8\x12\x8a\x09\xaa\x78\xd2\x28\xcb\x46\xf0\x95\x2a\xd3\x8f\x69\xd2\xaa\x6f\xc6\x26\xf8\xce\xbf\x05\xc7\xf2\x56\x9e\xce\x46\x55\xd5\xb6\xb6\x96\x48\x24\xe2\x59\xf9\xbf\x32\xef\xf9\xc1\x67\xc4\x79\xd4\xd7\x9d\xbf\x9e\x31\x22\x3c\xb7\x04\x2a\xe8\x21\x8f\xcf\x95\x86\x88\x81\x8a\x9c\x1d\x1b\x69\x98\x50\x2e\x4e\x31\x71\x1a\x5c\xe3\xca\xd7\xd0\x81\x13\x29\x76\x94\xc7\xf6\x82\xac\x29\x48\x8a\x08\x7e\x00\x3a\x45\x1d\x1d\x33\x03\x82\x67\x87\x8f\x13\x6e\xa7\x47\xfb\xa8\x9b\xcb\xa7\xc6\x88\x9b\x17\x82\x7b\xcd\x32\xd8\x73\xea\x81\x47\x5e\xb8\xe3\xa6\x2d\xad\x4d\xf5\xdf\xbd\xf7\x71\xd3\xb4\xd7\xae\x98\xbf\x6e\xf9\x7c\xc6\x28\x00\xb8\x9c\xef\x7a\xed\x84\xaa\x1a\xaa\xaa\x46\x42\xc6\xc8\x78\xa2\xa1\x36\xd2\xd1\x5a\x17\x0d\x1b\x4d\x0d\x35\x00\xe0\x25\x3f\x6d\xdb\x19\x1a\x99\xa8\x89\x47\x62\x91\x10\x00\x39\x7a\x72\x78\xef\xa1\x13\x83\xa3\x23\x86\xa6\xf5\x9f\x1a\x1b\x1a\x4b\x1d\x3e\xb1\x7d\xc7\x6b\xbd\xff\xe7\xb3\xb7\xa8\x8a\x32\x9e\x98\x1c\x19\x4f\xad\x5d\x3e\x7f\xd1\xfc\x59\x3d\x03\xe3\x2f\xff\xe2\xa5\x7d\x47\x8e\x31\x46\x73\x79\x7b\x32\x6d\xe6\x4d\xe7\xab\xdf\x7d\x7c\xd9\x82\x8e\xba\x9a\x48\x88\xb1\x9b\x2f\x5f\xf1\xe8\xd3\xbb\x5c\xcb\x56\x41\xd4\x85\xb4\xb0\xc2\x2c\xdb\x05\x20\xd4\x9f\xcc\xf2\xd0\xd3\x7b\xa3\xe1\x68\x38\xa4\x26\x53\x93\x02\x20\x6c\x68\xb1\xa8\xbe\xff\x48\xef\xab\xfb\x4e\xfe\xe8\xc1\xd0\x47\x6f\xd9\xb4\x71\xe5\x5c\xca\xe8\xa2\x79\x33\x4f\x8d\x4c\x08\x21\x06\x87\x27\x2e\xdf\xbc\xa2\xa1\x36\x7a\xe0\x70\x7f\x2e\x67\x01\x08\xca\x68\x6d\x4d\x74\xe9\xc2\x0e\x02\x04\x08\x08\x01\x57\x6c\x5e\x71\xc9\x86\xa5\xdf\xf8\xf1\x53\x27\xfa\x46\x04\x08\xe0\x5c\x11\x40\x29\xd4\x84\x54\x47\x53\x6c\x87\x73\x2e\x92\x93\xb9\x74\xc6\x64\x8c\x1e\x38\xd2\xb7\x60\x4e\xfb\xa7\x3e\x72\xe5\xee\xd7\x7a\x46\xc7\x53\xc7\x7b\x87\x22\x61\xfd\xb5\xa3\x3d\xb6\xe5\x7c\xff\xbe\x27\x6f\xbf\xe1\xa2\x70\x48\xf7\xce\x1e\x29\xcc\x38\x2d\x74\xd0\x3b\xf7\x1f\xbf\xff\xd1\xad\xb3\x3b\x67\x5f\xb3\xe5\x82\xee\x39\x1d\x63\xc9\xe4\x93\x5b\x77\xfd\xf8\xe1\xad\xd1\x90\x3e\xb3\xa3\x2d\x93\xc9\x84\x0d\xad\xa3\xad\xd1\x9b\xfa\xbf\x67\xdf\xb1\x5f\x3e\xf6\xf2\xdd\x77\x5e\x7d\xd5\x96\xd5\xba\xa6\x10\x42\x86\x47\x93\x0f\x3f\xb9\xbd\xad\xb9\x7e\xe9\x42\xe6\x26\x53\x04\xc0\x1e\x03\x00\x70\x08\x13\x5a\x8c\x6a\x61\x11\x6e\x24\x6a\x84\x44\x5b\x80\x2a\x44\xd1\x3d\x61\x90\x33\x10\xf2\xf7\x52\x4a\x4b\x9c\x1d\x1b\xf0\x2f\x01\xdf\x82\x63\x95\x09\x70\x99\x8d\x6d\xdb\xbd\xbd\x7d\x0d\x0d\x0d\x8d\x8d\x0d\xde\x75\x9e\x67\x49\x89\xe0\x18\x17\xbe\x63\x40\x21\x3c\x87\x54\xaa\x20\xf8\x3a\xe1\x27\x06\x8b\xeb\xcf\xae\x0d\x29\x3e\x87\xb3\x3c\x0f\xe3\xab\x29\x91\x22\xb6\xc2\x7a\x5f\xdb\x88\x94\xbd\x91\x6f\x0c\x17\xfe\x26\xef\x37\x4f\x4a\x8f\x22\xdc\x7c\x3a\x93\x9e\xcc\x8e\xf6\x1a\xcc\xcd\x8e\x9e\x04\x6e\x99\xc9\x11\xd7\xb1\x38\xe7\x9a\xa6\x52\x42\x81\x00\x23\x84\x30\x4a\x80\x79\x1d\xf3\x82\x39\x1d\x7f\xfe\xa9\xdb\xfb\x06\x47\xf7\x1e\x3c\xf9\xea\xde\xa3\x42\xc0\xbe\xc3\x3d\xdc\xe5\x9b\xd6\x2e\x06\x80\xc1\x91\xe4\xce\x83\x23\x17\xad\x59\xb2\x66\xe9\x5c\x4a\xc9\xde\xc3\x27\x9e\x7e\x79\xf7\xbe\xc3\x3d\xf3\x3b\xdb\x2e\xdf\xb8\x78\x41\x57\x8b\xf7\x0c\xe4\x07\x1f\xdf\xf6\xd8\xb3\x3b\x42\x86\x76\xd1\x05\x4b\x6e\xb9\x6a\xd3\xd2\xf9\xed\x4f\x3c\xbf\x7b\x64\x68\x0c\x08\x70\x0e\x71\x43\x0b\xab\x4a\x22\x99\x76\x39\x09\xa9\x4a\x38\x1c\xea\x8a\x84\x15\x55\xa9\x51\x95\x45\xe1\xd0\x7b\x36\x2e\xda\xf5\xda\x09\xee\x72\xcd\x50\x63\x9a\xc2\x39\x50\x85\x25\x27\xb3\xcf\xbf\xb2\xaf\xb9\xb1\x76\xc3\xea\x05\x8b\xe6\xb6\x1f\x38\xd2\x9f\x37\xed\x74\x36\xff\xea\xde\x23\x73\x66\xb5\x5f\x72\xc1\x42\x85\x29\x39\xd3\x62\x94\x8e\x4e\xa4\x5e\xd9\x7b\x6c\xc7\x81\xc3\x86\xae\x0a\x21\xf2\x79\x3b\x9d\x31\xb3\x79\xcb\x76\xf8\x58\x22\xf3\x6f\xdf\x79\xbc\xa1\x36\xb6\x60\x76\x4b\xd7\xcc\x96\x8f\x76\x5c\xd1\xde\xd2\x50\x13\x0f\x33\x4a\x07\x87\xc7\x67\x77\x36\xcd\xed\x6c\x13\x5c\x24\x26\x33\x9a\xaa\x84\x43\x3a\xf8\x9d\x69\x6a\x32\x9b\x4a\x67\x3f\x70\xc3\x86\x87\x1f\xdf\xd1\xd3\x3f\xca\x4b\x42\x7c\x22\x84\xe0\x02\x96\x2f\x99\xdd\xdc\x50\x93\xca\x64\x9f\xdd\xb6\x5f\x08\x58\xb3\x6c\xde\xa5\x9b\x96\x8e\x8c\xa7\x8e\xde\x33\xd0\x35\xb3\xf9\x78\xdf\x60\xde\xb4\xf7\x1c\x38\x79\xd9\xa6\x15\xf1\x58\xf4\x68\xcf\xe8\x8c\x96\x86\xb1\x44\xb2\x2e\x1e\x6a\x6f\xa9\x53\x18\x03\x80\x85\x73\x66\x12\x65\x5f\x53\x43\xdd\xf0\xf8\x84\xe3\xda\x39\xd3\x04\x21\x74\x4d\xd9\x7d\xb0\x27\x9d\xb1\x5b\x9b\x6a\x3f\x79\xdd\x86\x85\x73\x5a\xbd\x43\xaf\x5a\x32\x77\xce\xac\xd6\xda\x78\xd4\x6b\x70\x10\xb0\x68\xfe\xac\x0f\xbf\xf7\xd2\xce\x8e\x66\xc6\x18\xe7\x22\xb8\x2a\x72\x5c\x07\xb2\x13\x3c\x3f\x41\x27\x07\x04\x00\x21\xd4\x05\xa6\x46\xea\x1d\x25\xaa\x44\x1a\xb8\x5e\x47\xb5\xb0\x50\x43\x53\xe6\x1e\xcb\xa2\xab\x37\x63\x23\xa7\x46\xcf\xf5\xb1\x2a\x57\x96\x7d\x14\x02\x46\x47\xc7\xf2\x79\x73\xc6\x8c\x56\xc6\x14\xef\x27\x44\x28\x21\x42\x70\x5e\x7e\xb3\x11\xf2\xb6\x80\xa9\xd1\x73\xe5\x99\x51\x28\x08\x45\x71\x5c\x4d\x1e\x2d\x83\xd3\x2c\x9c\x1d\x9b\x52\x75\x14\x81\x8c\x01\x40\xd0\x67\x79\xe9\x23\xa8\x18\xe7\x97\x76\x29\x1a\xfb\xeb\xbd\xce\x5a\x00\x80\x63\x3b\x3c\x9f\xca\xa5\x46\x79\x76\x3c\x33\xda\x2b\xac\x8c\x35\x39\xfe\x8b\x5f\x3f\x77\xe4\xc4\xe0\xa7\x3e\x72\x6d\x28\xa4\x13\x42\x4c\xcb\xfe\x8f\x6f\x3f\x98\xce\xe4\x96\x76\x77\x5d\x77\xe9\xba\x68\x24\x74\xf8\xc4\x50\x62\xd2\x6a\x6e\xac\xed\x1d\x18\xaa\xaf\x09\x2f\x98\xdd\xa2\x30\x66\x3b\x8e\xeb\xba\x3b\xf6\x1d\x3b\x70\xa4\x4f\xd7\xd5\xce\x8e\xe6\xe5\xdd\x5d\xb1\x48\xe8\x9e\x87\xb6\x0d\x8e\xa6\x17\xcc\x6e\x6b\xaa\x8f\x6b\xaa\x32\x32\x9e\x3c\x74\xbc\x6f\xdf\x91\x9e\xd1\xf1\xb4\xeb\xc2\x85\xab\x17\x7c\xf2\x83\x97\x86\x0c\xed\xd9\x6d\xfb\x7e\xfc\x8b\xa7\x1d\xc7\xa9\xad\x89\x7e\xe5\x2f\x3e\x46\x00\x86\x46\x12\xdb\x76\x1e\x7e\x65\xf7\xe1\x78\x34\x52\x13\x8f\xd4\xd5\x44\x96\x2d\xea\x9a\x3f\xbb\xed\x78\xef\xa9\x7f\xfd\xe6\xfd\x94\x90\x95\x4b\xe6\xde\x7e\xc3\x96\x90\xa1\x71\x2e\x4e\x8d\x4c\x1c\x3b\x39\x64\x59\xb6\xaa\x2a\xf5\xb5\xd1\x59\xed\x4d\xbf\x7c\xec\xc5\x27\x5e\xd8\x45\x08\xe9\xea\x68\xf9\xb3\x3f\xb8\x5d\x55\x19\x00\x3c\xf5\xe2\xee\xef\xdd\xf7\xb8\x00\x68\xa8\x8d\xfd\xd5\x1f\x7d\xf0\xc7\x0f\x3c\x9d\xce\xe4\xe6\xcf\xee\xfc\xc5\x63\xdb\x80\x08\x20\x40\x08\x38\x8e\xe0\x5c\xd8\x0e\x77\x5d\xe1\xba\xc2\x71\xf9\x7b\xaf\x5e\x77\xe7\x8d\x1b\x13\xa9\x4c\x26\x97\x6f\x6f\x69\xf0\xae\x3e\x1e\x7c\xfc\x65\xcb\xb2\x6f\xbe\x6a\xe3\xcb\x3b\x0f\x7d\xef\xbe\xc7\x43\x86\xb6\x61\x55\xf7\x4d\x57\x6d\x64\x94\x02\xc0\xb6\x5d\x87\x1e\x7e\xf2\x95\xbb\xef\xbc\xa6\xa9\xbe\xa6\x77\x60\xb4\xa7\x7f\x24\x93\x35\x5d\xce\x29\x21\x9a\xa6\xd6\xc6\x23\x5d\x33\x9b\x9b\x1b\x6b\x8a\xdd\x34\x14\x3b\x60\x01\x20\x84\x18\x1d\x4f\x8d\x8c\x27\xe3\xd1\x30\x21\xf0\xad\x7b\x9f\xbb\xee\xb2\x0d\x4b\xe7\xcf\xda\x73\xe8\xf8\xf7\x7f\xf9\xa4\xeb\x88\x1b\x2e\x5d\x75\xc9\x05\xdd\x89\xc9\xec\xa7\xff\xe6\x7b\xba\xce\x42\xba\xaa\x28\x94\x52\x6a\x59\x6e\x32\x9d\xcb\xe7\x6d\xcb\xe6\x42\x88\xfa\xda\xe8\x57\xff\xf2\x83\xf1\x68\x28\xf8\x9e\x88\x60\x32\x4f\xe9\x04\xa3\x67\x5f\xde\xf7\xea\xde\xa3\x1f\xb8\xe1\xe2\x17\x77\x9e\x5c\xb2\x60\x76\x53\x7d\xfc\x91\x67\xb6\x45\x0c\x65\xf3\x9a\xf9\xf1\xa8\x21\xef\x42\x08\xc9\xe4\x5d\xae\x44\xc3\xb5\x4d\x5a\xac\xd1\x35\x1a\x88\x1a\xa1\x7a\x78\x9a\x51\x80\xdf\x7a\xa1\x32\x3a\x3c\xd7\x0b\x85\xd3\x71\x7a\x9b\x50\xc8\xe8\xe8\xe8\x50\x55\xa5\xf8\x8b\x13\xc2\x7d\xbd\x1c\xe9\x3b\xbf\xaf\x7b\x17\x78\xc6\x88\xf0\x9c\xc0\x28\x10\x42\x25\x15\x14\xc1\x58\x89\x77\x1d\xe9\xe7\x24\x89\xa4\x58\x67\xcd\x06\xe4\x7f\x4b\x6e\x19\x84\xa0\x4f\x2b\xcd\xac\x16\x46\x07\xa5\x5c\x28\x48\x7a\x59\xb0\xe1\xae\x63\xa5\x27\x32\xe3\x83\x90\x4f\x64\x86\x8f\xbb\x56\x86\xe7\x52\xc2\x7f\x44\x2a\xa1\x54\xa1\xe4\xc6\x2b\xd7\x9b\x96\x13\x8b\x86\x08\x21\x04\x88\x65\xb9\xa7\x46\x26\xb2\x39\xf3\xc9\x17\x76\xd7\x44\x23\x17\xae\x5b\xf2\xe4\xd6\xc3\xb7\x5e\x73\x61\x43\x6d\xac\x67\x60\xf8\x7f\x7e\xf6\x84\xaa\x68\xbf\x73\xcb\xe6\x45\x73\xdb\x54\x85\x6d\x5c\xdd\xbd\x71\x75\xb7\x65\x3b\x5f\xfb\xde\x43\x23\xa3\x89\x9b\xaf\xde\x98\x37\xad\x57\xf7\x1d\xde\x7f\xe4\x38\x63\x94\x31\xea\xba\x3c\x9b\xb3\x73\xa6\xed\x38\xc2\x75\xc5\x93\x5b\x0f\x74\xb4\xd5\xdf\x71\xc3\x86\x2d\x1b\x96\x2d\x9a\x37\x33\x97\xb7\x1b\xea\x62\x8c\x92\x4c\xce\x6c\x69\xaa\xbb\x74\xf3\xf2\xed\xfb\x0e\xad\x59\x31\xe7\xb2\x4d\x2b\x00\x60\x22\x99\x9e\x4c\xe7\x34\x45\xb5\x6d\xd7\xb2\xed\xe7\x5f\xd9\xbf\xf9\x82\xa5\x8b\xe6\xce\x02\x80\x39\xb3\x66\x9c\x1a\x49\xcc\x9e\xd5\x32\xaf\xab\x9d\x51\x4a\x28\xbd\x6a\xcb\xfa\x93\xfd\x23\x99\x5c\xbe\xb5\xb9\xa1\x26\x1e\xf7\x46\xda\x2e\x5c\xbb\x6c\xe7\xfe\x63\xc3\xa3\x89\xfa\xda\x58\x3c\x16\xbb\xfb\xce\x1b\x4c\xd3\x8a\x45\xc3\x99\x4c\x6e\xe7\xde\x63\x2e\xe7\x10\x3c\x34\x95\x03\x00\xd8\x2e\x77\x38\x6c\x5e\xbb\x28\x1a\x89\x46\xc3\x91\x81\xe1\xb1\x6c\xce\xaa\xaf\x8b\xbb\xae\x7b\xe9\xc6\x15\x91\xb0\xa1\x2a\x2c\x1c\x36\x38\x17\xc9\xc9\xec\x53\x2f\xed\xb9\x7c\xf3\xea\x86\xba\x18\x00\x6c\x58\xbd\x68\xdd\x8a\x85\x84\x80\xcb\x85\x6e\xa8\xeb\x56\x2e\x88\x47\xc3\x50\x3c\x5f\x85\x6f\xc0\xce\xd7\x7a\x2c\x5b\xd4\xc6\x23\xfd\x43\xa3\xb3\x3b\x1a\x67\x77\x34\x13\x02\xae\xcb\x5f\xda\x71\xe0\xa2\x75\x4b\xda\x9a\xeb\x01\xc8\xce\xd7\x8e\xf5\xf4\xf6\x7e\xeb\x67\x09\x5d\xd7\xf2\xa6\x3d\x36\x91\x99\xcc\xe4\xff\xed\x3b\x8f\x35\x35\xd4\xac\xe8\xee\xdc\xb8\x7c\xce\xfe\x23\xbd\xdc\x71\x1c\x4e\x04\x08\xee\x0a\x8d\x12\x66\xa8\x9a\xc2\x05\x87\xc9\x74\x6e\x70\x24\x55\x17\x8f\x8e\x25\x52\x3f\xb8\xff\x49\x02\x64\xc3\xea\xee\xd5\x4b\xe7\x11\x02\xa3\x13\xa9\x1d\x7b\x8f\xc6\x63\xe1\xc5\xf3\x67\x45\x42\xfa\xea\xa5\xf3\x9a\x1b\x6a\xf7\x1d\x39\x95\x4c\x5b\x0a\x63\xd9\xbc\x19\x8d\x84\x7e\xf3\xfc\xce\x07\x9f\xdc\x7d\xd7\xfb\x2f\xba\x60\xf9\x6c\x21\x3c\x25\x14\x99\x6c\xfe\xab\xff\xfb\x40\x72\x32\xd3\xd5\xd1\xf2\xde\x6b\x36\x36\x37\xd4\xb8\xa0\x90\x50\xdc\xd5\x6a\x89\x51\xc7\x62\x2d\x42\x09\x11\x45\x9b\x32\xcd\xe8\x7f\x1b\x45\xa5\xce\x55\xda\x54\x1a\xbf\xae\x9f\x37\x69\x03\x15\x17\x94\x95\x36\xb9\x5c\xbe\xa7\xa7\x77\xd6\xac\x0e\x4d\x53\xfd\xb3\x49\x29\xe5\x67\x3e\x5e\x88\x9c\x23\x50\x08\xcf\x3e\x8c\x11\x6f\x44\x86\x48\x99\xc6\x40\x90\x24\xc5\x22\x84\x40\xf0\xd4\x95\xb3\x68\xe3\x47\x8d\x05\x82\x8f\xc1\xaf\x15\xa4\xa7\xa3\x05\x66\x53\x3d\xff\x45\x58\xe9\x84\x95\x1e\x37\x27\x7a\x33\x23\x3d\xb9\xd4\xd8\x37\xbe\xfb\xf3\x53\x23\xe3\xdd\x73\x3b\xae\xbd\x74\x6d\x5d\x4d\x54\x51\x94\x6d\xbb\x0f\xbd\xba\xf7\xe8\x87\x6e\xbe\x2c\x1e\x0b\x13\x42\x14\x45\x21\xc4\x7a\x7e\xdb\xfe\xe5\xdd\xb3\xeb\x6a\x62\xa1\x90\x3e\xbf\x6b\x86\xa2\xb0\x85\x73\x3a\xd6\x2c\x9b\x97\xce\x9a\x3b\x5e\x3b\x36\x9e\x4a\xa9\x0a\x1d\x4b\xa4\x27\x92\xb9\x64\x6a\xe2\xcb\x5f\x7b\xe0\xab\x7f\x75\x67\x63\x5d\x14\x00\x4c\xd3\xde\xb9\xff\xd8\x1f\xff\xde\x4d\x94\x50\x4a\xc9\x45\xeb\x16\xee\xde\x7f\xdc\x71\x1d\x01\x00\xdc\x15\x42\x44\x34\xa6\x52\xe2\xba\xc2\x71\xb8\xe3\xf2\x93\xfd\x63\x8c\xd0\x67\xb7\xed\xcb\x9b\xd6\xe5\x17\xae\xa4\x94\xb8\x5c\xfc\xbf\x5f\xbf\x6f\xf6\xcc\xd6\x8f\xdc\x7a\xc5\xdf\x7c\xf6\x23\x8c\x29\x8c\x51\x45\x51\xee\xfb\xd5\x8b\xaf\x1d\xe9\xf9\xd2\x67\x3f\xfa\x8f\x5f\xfc\x78\xef\xc0\x70\x43\x5d\x7c\xf6\xcc\xb6\x90\xa1\x79\x82\xdd\x58\x57\xf3\x95\xff\xfa\xc9\x5f\x7c\xfa\x43\x73\x66\xb5\x8d\x8e\xa7\x16\xcc\xe9\xf8\xca\x17\xef\x76\x1c\x57\xd3\x14\x00\xb0\x6d\x27\x9b\x37\x9b\x1b\xeb\xfe\xef\x3f\xf9\xe8\x89\xfe\x61\x4a\x68\x36\xef\x4c\xa6\xb3\xed\xad\xf5\x86\xae\x7d\xec\x8e\xab\x0f\x1e\xed\xdb\xb5\xff\xd8\xc0\xa9\x31\xc7\x71\x09\x25\x84\x90\x5c\x3e\x7f\xf0\x78\xdf\xb2\xee\xae\xc6\xba\xa8\x97\x8a\xfc\xcd\x73\x3b\xfa\x4f\x8d\x7e\xe1\xee\xdb\x1e\x7b\x66\xc7\xcf\x7f\xfd\x7c\x3c\x1a\xbe\xfa\x92\xb5\x97\x5f\xb8\xaa\xf5\x73\x0d\xa3\xe3\xc9\xfa\xda\x58\x24\x1c\x36\x4d\x17\x08\x18\x9a\xe2\x82\xf8\x87\xaf\xfd\x24\x97\x37\x87\x46\x27\x22\x21\xe3\xd2\x4d\x2b\xdf\x77\xcd\xe6\xe2\xc9\x01\x38\x7c\x62\x68\xeb\xae\x93\xef\xbb\x6a\x63\x7d\x4d\xf4\xc0\xb1\xbe\xbf\xfb\xcf\x9f\xcf\x9b\x35\xe3\xe3\xb7\x5f\xd6\xdc\x10\xdf\xbc\x6e\x29\x65\xf4\x44\xef\x50\x34\x6c\xac\x5a\x3c\xef\x9a\x4b\xd6\x3f\xbf\x6d\xbf\x93\xcb\x13\x2e\xea\xc2\x5a\x5c\x57\xf3\xb6\xcb\xb9\xd0\x34\xe5\x63\x1f\xb8\xfc\xfb\xf7\x3e\x79\xa2\x77\x88\xfb\x19\x83\x42\x94\xc2\x85\xed\xf2\x96\xe6\x86\x79\x9d\xad\x8a\xa2\x8c\x8c\xa5\xf6\x1c\x38\x01\x02\xf6\x1c\x3c\xf1\x85\xbb\x6f\x5d\x38\xa7\xe3\x7b\xf7\x3e\x7e\xe0\x68\x1f\x00\xd4\xd5\x44\x7f\xe7\xfd\x57\x2e\x9e\x3f\xab\xbe\x26\x7e\xac\x6f\xfb\x33\xdb\xf6\xec\x39\x78\x84\x10\xc8\xe4\xec\x54\x3a\x6f\x9a\xce\xd7\x7f\xfc\xcc\x9a\x25\x5d\x0a\xa3\xff\xf3\x93\x47\x6b\x63\x91\xeb\x2e\x5b\xe7\x25\x90\x0f\x1c\xe9\xdb\xf5\xda\x89\xab\x2e\x5a\x45\xc0\x15\xb9\x09\x92\x1b\x87\x24\xb8\x43\x04\x14\x83\xb3\x30\x8b\xb7\xba\x46\x3d\xd1\x6b\xc0\x88\x95\xe5\x27\xcb\x96\xa7\xcc\x61\xc2\xb4\xd3\x58\xa6\xf1\x73\xb6\x6c\xa6\x29\xb3\x65\x59\x3d\x3d\x7d\x9d\x9d\x33\x55\xb5\xa0\x85\x94\x50\x42\x84\xeb\x62\x8a\xf4\xed\x04\x85\xf0\x2c\xe3\x8d\xdb\x81\x9f\x8a\x14\x6f\xf0\x19\xa1\x67\xc5\xc6\x0b\xfc\xfc\x48\xb1\x24\xb0\x13\x25\xcf\x1a\x2d\x0c\x3b\x91\xd2\x67\x8d\xe6\x13\x43\xb9\xf1\x81\xfc\x44\x7f\x7e\xec\xa4\x93\x4f\x03\x77\xbc\x5f\xb1\x63\x39\x43\x23\x13\xe3\x89\xf4\xf3\xdb\x5f\x0b\x87\x8c\xf7\x5f\x77\x11\x21\x64\xd1\xbc\x4e\x4a\x59\xc8\xd0\x29\xa5\x04\xa0\x77\x70\x34\x1a\x31\x0e\x1d\xef\x0f\x87\x8c\x75\xcb\xa3\x94\x90\xd6\xe6\xfa\xf6\xd6\x86\x4d\x6b\x16\x09\x01\x84\x50\x05\xf8\xc9\x9e\x01\x42\x89\xe3\x70\xe1\x72\x43\x65\x8e\xed\x1c\x38\x76\xea\xe2\x75\x0b\xb9\x10\x86\x61\x6c\x5c\xb3\xb8\xf0\x50\x7f\x80\xee\xb9\xed\x77\xdd\x76\xe9\x03\x8f\x6d\x4b\x67\x72\x00\xc0\x83\xe9\x09\x40\x6c\x97\xeb\x86\x7e\xcb\x95\x6b\x08\xa5\x35\xf1\x48\xa2\x3f\xa3\x28\xaa\xc2\xa8\xaa\x6a\x7f\xf5\x47\x1f\xd6\x34\x35\x16\x0d\x13\x42\x83\x2b\x87\xbb\x6e\xbf\xce\x76\x1c\x43\xd7\xe2\xb1\xe8\xfc\xae\x0e\x01\xe2\xc0\x91\x9e\x58\x24\xfc\xda\x91\x93\x97\x5f\xb8\x7a\xd5\xd2\x05\x5f\xfb\xf2\x9f\x78\x1f\xff\xe5\x7f\x7e\xf6\xd9\x8f\xbf\x3f\x1a\x09\x51\x42\xda\x5b\x1b\x09\x90\x57\x76\x1f\xfa\x9f\x1f\x3f\xfc\xd7\x9f\xf9\x68\x32\x9d\xff\xf5\xb3\x7b\xaf\xbb\x74\x0d\xa5\xf4\x37\x2f\xee\x7e\x79\xf7\xe1\x95\xdd\x73\x3f\x78\xc3\x85\x4b\x17\x76\x2d\x5d\xd8\x25\x40\x64\x73\xa6\x37\xda\x77\xdf\xaf\x9e\xdd\x7d\xf0\xe8\xb6\xdd\x07\x0e\x1c\xed\xf9\xea\x97\x3e\x1d\x09\x19\x1f\x7e\xef\x95\x9c\x0b\x43\x57\x29\xa5\xb9\xbc\x99\xcd\xe7\x7f\xfa\xe0\x33\x97\x6d\x5a\x35\x77\x56\x5b\xef\xa9\xc4\x03\x4f\xee\x5d\xb5\x78\x4e\x7b\x4b\xc3\xa1\xe3\x7d\xfb\x8e\x9c\x8c\x85\xf5\x0b\x56\x2d\xc9\x64\x32\x0f\x3f\xb9\x35\x9d\xcd\x3f\xb3\x75\xcf\x6d\xd7\x6f\x01\x00\xd3\xb2\xbf\xf1\xc3\x87\x2f\x58\xd5\x9d\x98\xb4\x76\xec\x3f\x32\x3c\x3e\x1e\x0d\xeb\x23\x63\xa9\x4c\xd6\x7a\xf6\x95\x03\x3d\x03\xe3\x5f\xff\xf2\x5d\x9a\xaa\x00\x90\x93\xfd\xc3\xc7\x7a\x06\x56\x2e\x9e\xf7\x81\x1b\x2f\xda\xb0\x6a\xe1\xd1\x93\x83\x99\x4c\x9e\x31\x1a\x0e\xe9\xb3\x3a\x9a\xe7\x76\xb6\x12\x4a\x1a\xeb\xe3\x1f\xfb\xe0\x55\x87\x8f\x0f\x1c\x39\x3e\x30\x32\x96\x74\x39\x27\x40\x0c\x5d\xad\xaf\x8b\xcf\xe9\x6c\xa5\x94\xf4\x0e\x0c\x8f\x25\x26\x67\xcd\x68\xfa\xe0\x4d\x97\x1e\xed\x19\xac\xaf\x89\x75\x75\xb4\x2a\x8a\xd2\xdc\x58\xe7\x09\xe1\x44\x32\xbd\x7d\xcf\x91\x65\x0b\x67\x0b\x10\x1b\x57\xcd\x7f\xe6\xa5\x3d\xa9\xc9\x24\x00\x10\x20\xb5\x61\xdd\xd2\x14\x01\xc2\xe5\x60\xe8\xca\x0d\x97\xaf\xb7\x1c\x27\x12\x36\x3e\xf3\xb1\x9b\x8f\xf5\x0e\x69\xaa\x32\xb7\xb3\x8d\x31\x56\x08\x15\xa1\x10\x6c\x6d\xdb\xb1\x77\xd9\xc2\x4e\x62\x8e\x01\x80\x20\x0c\xd4\xb0\x1b\x6a\x24\xa1\x06\x1a\x69\x04\xa3\x96\xbc\xc1\x87\x76\x96\xcd\x64\x39\xa7\x0b\x65\x32\x39\x0d\x96\x65\xf5\xf6\xf6\x77\x75\xcd\x0a\x9e\x41\x4a\x08\x50\x4a\x38\x4e\x9e\x79\xfb\xc0\xd7\x30\x9d\x65\x18\x2d\x74\xbf\x3e\xc2\x9f\x54\x02\xa2\xe4\x19\xa1\x50\xbc\xbc\x3f\xdb\x36\xbe\xc2\x4d\x91\xab\x11\xa2\x38\xc8\xe7\x2f\x03\x00\xc9\x25\x46\xb2\x63\x3d\xf9\xb1\x9e\xed\x2f\x3c\xe7\x5a\x99\x45\x73\xdb\x19\xa3\x02\xe0\xc5\xed\x07\x36\xae\x59\xa4\x30\xe6\xa5\x3f\xfb\x06\x47\x77\xee\x3f\xa6\xaa\xca\xfa\x95\x0b\x1b\xea\xe2\xa5\x55\x17\x00\xa4\xff\xd4\x58\x53\x7d\x5c\xbe\x37\x1c\x80\x08\xc1\xb7\xee\x38\x58\x57\x13\xeb\xea\x68\x7e\x65\xcf\x91\x5f\x3d\xb9\xc3\xb6\x5d\x01\x20\x38\x08\x21\x42\xe1\xd0\xe7\x3e\x7e\xe3\xe3\x2f\xee\xaf\x8b\xd7\xce\xef\x6a\x7d\xe2\xa5\x5d\x42\xb8\x17\xad\x5d\x98\x4a\x4d\x5e\xb0\xb2\xdb\xb2\xed\xef\xfc\xec\x37\x91\x50\x28\x16\x09\xa5\xd2\x39\xce\xb9\xa1\x6b\x75\xf1\xe8\x8c\xd6\xfa\x39\xb3\x5a\xa3\xd1\xb0\xa6\xaa\x94\x50\x2e\x40\x70\x61\xda\x8e\xe3\xba\x8e\xc3\x1d\xd7\xb5\x1d\x87\xbb\xc5\x64\x16\x01\x20\x94\x28\x8c\x29\x8c\x2a\x0a\x53\x18\x65\x8c\x69\xaa\xa2\x30\x4a\x19\x65\x94\x06\xfd\x5a\x36\x6f\x1e\x3e\xd6\xf7\xa5\x7f\xfd\x0e\x21\xb0\x78\x7e\xd7\xe7\x3e\x7e\x5b\x2c\x12\xca\xe4\xf2\xe1\x90\x71\xdf\xa3\x2f\xdf\xf3\xd0\x73\x4d\xf5\x51\x2e\x44\x2a\x9d\x1b\x1a\x4d\xa5\x33\xd6\xcc\xb6\x86\xef\xfe\xd3\xa7\x42\x86\x96\x48\xa6\xff\xf4\xef\xbf\x7e\xf5\x25\x17\xdc\x78\xe5\xa6\x54\x3a\xf3\xdd\x7b\x1f\x1b\x1e\x9d\x68\x6d\xae\x0f\x85\x6b\xbb\xda\x5b\x66\xcd\x68\x7a\x75\xff\xe1\xa3\x3d\x83\xab\x17\xcf\xae\x8f\x87\xf2\xa6\x39\xb3\xad\x79\xe6\x8c\xa6\x83\xc7\x07\xbf\x75\xef\xb3\x57\x5f\xb4\x6a\x7e\x57\x5b\x24\x6c\x0c\x8e\x8c\x6d\xdb\x7d\xe0\xd9\xed\xfb\x06\x86\x12\xf5\xf1\x9a\x2d\x17\x2c\xdc\xb8\x72\x5e\x5b\x73\x7d\x2c\x1a\x06\x00\x2e\xc4\x4b\xaf\xee\xaf\xaf\x89\x13\xc2\xfe\xe6\xdf\x7f\x42\x88\x00\x02\xb6\xc3\x4d\xd3\x35\x6d\x2e\x04\x7c\xef\xff\xf9\x83\xd6\xa6\x5a\x00\xc8\x9b\xd6\x73\xdb\xf6\x86\x43\xc6\xa6\x35\x8b\x0b\x27\x9a\x56\xf4\xd4\x42\xfc\xf7\x0f\x1e\xea\x1d\x1c\xf9\xe0\xcd\x57\x02\x21\x9a\xc2\x3a\xda\xea\x75\x4d\x2d\xc4\x2e\xb6\x03\x00\x8f\x3c\xf9\xf2\xab\x7b\x0e\x7d\xfe\xee\xdb\x62\xd1\x70\x30\xab\x2a\x6f\x5a\xcf\x6f\xdb\x3b\x3c\x96\xa8\x89\x45\xd6\xaf\xea\xae\x89\x45\x6c\xc7\x39\xd9\x37\x94\x9a\xcc\x7d\xf3\x9e\x47\x52\xe9\x2c\x08\x88\x47\xa3\xf5\xb5\x35\xeb\x57\x77\x5f\x75\xf1\x0a\x21\x04\x17\x5c\x08\xf1\x9b\xe7\x76\xa4\x33\xf9\xeb\x2f\xbf\x40\x51\x98\xeb\xba\x2f\xbe\x7a\x60\xfe\xec\x19\x0d\xb5\x31\xaf\x38\x9c\xf3\x74\x36\x1f\x0e\xe9\x85\x14\xbd\x80\xb1\x44\x6a\x78\x34\xb9\x70\x6e\xbb\x00\x32\x30\x9a\x31\x69\x7c\xd6\xbc\x6e\xad\x76\x86\x30\xea\x28\x63\x65\xd9\xd1\xca\x14\xe5\xf4\x19\xcb\x29\xf7\xfd\xed\x6c\x82\xad\xa7\x2b\x8f\xfc\xe3\xf4\xfe\xd6\xd5\xd5\xb6\xb5\xb5\x12\x52\x48\x1b\x09\x21\x38\x9f\xca\x3b\xf2\x96\xf0\x86\x23\xc2\xf3\x6e\x14\xf4\x2d\xf3\x2c\x84\x30\xf3\x39\xdb\xb1\xbd\x4f\x20\x3d\xff\x33\x08\xb6\xbc\xab\x46\x52\x88\x19\xcf\x95\x8d\x87\x6f\x53\x9c\x3b\xe3\xff\x2c\x0b\x1f\x1d\xdb\xcc\x8f\xf6\x4c\x0e\x1c\x4a\x0f\x1d\x75\xf3\x93\x00\x9c\x12\x32\x3a\x7c\xea\x64\xff\xf0\x92\x05\xb3\xbc\xbb\x80\x9b\x1b\xeb\xfe\xe2\x2b\xdf\xfd\xfd\x3b\xae\x5e\x34\x6f\x26\x10\xd2\xd5\xd1\xda\xd5\xd1\x2a\x40\xec\xd8\x77\xb4\xa1\x2e\xee\x1d\xf5\xbe\x47\x9e\x7f\xea\xa5\xdd\xb3\x67\xb6\xdc\x78\xc5\x86\x50\x28\xf4\xab\x67\xf6\x46\xa3\x91\xfa\x9a\x68\xdf\xa9\x51\x85\x91\xb9\xb3\x9a\xe6\x75\x36\xaf\x5b\xb1\x20\x6f\xda\x86\xae\x6f\x59\xbf\x6c\xdd\x8a\x85\x07\x0e\xf7\xdb\xb6\x43\x19\x89\xc7\xc2\x73\x3b\xdb\x4e\x0e\x8c\x9d\xe8\x1f\x9f\xdf\x35\x93\x52\xd2\x58\x1f\x7b\xe4\x99\x57\x1e\x7a\x6a\xe7\x6d\xd7\x6c\x58\xbf\x8a\xa8\x8a\xd2\xd1\xd6\xd8\xdc\x50\xbb\x6e\xc5\x42\x00\xc8\x9b\xd6\xe1\xe3\xfd\xab\x97\x2e\x00\x00\xd7\x85\x5c\xde\x1a\x9d\xc8\xe6\x4d\x3b\x67\x5a\xa6\x65\x5b\xb6\x63\xdb\xae\xed\xb8\x8e\xe3\xb8\x9c\x73\x2e\xbc\xab\x6c\xaf\x81\x08\x01\x4a\x28\x65\x44\x61\x4c\x51\x98\xaa\x30\x55\x61\x9a\xa6\x1a\x9a\xaa\x6b\x6a\xc8\x50\xc3\x86\x66\x68\x9a\xae\xab\x8d\xf5\x35\xaa\xaa\xe4\xf2\xe6\x9e\x03\xc7\x7a\x07\x47\x96\x77\xcf\x89\xc7\x22\x03\xa7\x46\xeb\x62\x7a\x63\xcc\x48\x8c\x27\x29\x25\xc0\x45\x6d\x48\x8b\xe9\xaa\x63\xdb\x79\xd3\x0e\x87\xf4\xba\x9a\xd8\x3f\x7e\xf1\xe3\xc7\x4e\x0e\xde\xf5\x85\x7f\x8a\x84\x8d\x2b\x2f\x5a\xf3\xe9\x8f\xde\x7c\xb4\x67\xe8\x1f\xbf\xfe\x8b\xf1\x64\xea\xb5\x63\x3d\x63\x89\xd4\xde\x43\x27\x7f\xf5\xf4\xae\x05\xb3\x67\xfc\xcb\x17\x3f\x12\x0d\x1b\x02\x44\xff\xa9\xf1\x63\xbd\x83\x3f\x7e\x28\x19\x8d\x18\x8a\x42\x85\x80\x54\x3a\x37\x3e\x91\x33\x2d\xde\x33\x38\xfa\x9d\x9f\x8f\xc6\xa3\xd1\xc5\xf3\x3b\xc7\x26\x52\xdb\xf7\x1c\x9a\x39\xa3\xf9\xe2\x0b\x96\x13\x42\x38\x17\x77\x5c\xb7\xe9\xf1\xe7\x76\xba\x9c\x7b\xe7\x97\x0b\x51\x5b\x1b\x6f\x6a\xa8\x11\x02\x7e\xf3\xdc\xab\x99\x6c\x6e\xed\x8a\x85\x1d\xad\x4d\xf7\x3d\xba\x0d\x80\xad\x5c\x34\x7b\xf7\xc1\x63\x27\xfa\x4f\x2d\x5f\xd8\xb9\x79\x4d\xb7\xe1\x3f\x0d\xfc\x7d\xd7\x5e\xfc\x8d\x7b\x9e\xe4\x5c\x6d\x6b\xa9\x7b\xf4\xf9\xed\xff\xf4\xcd\xfb\xbb\xe7\xcc\xfa\xc0\xf5\x9b\xda\x5b\xea\x0d\x5d\x23\x00\xb7\x5c\x75\xe1\x0d\x57\x6c\x64\x8c\x12\x42\x9e\x7a\x71\xe7\xc9\xfe\xe1\x0f\xdc\x78\x49\xc8\xd0\xaf\xb8\x68\x4d\xf1\x7b\x0f\x30\x91\x4c\x7f\xe3\x47\x8f\x5c\x7f\xf9\x86\xaf\x7c\xf1\xf7\xfb\x06\x47\xc3\x21\xbd\xb1\xbe\x46\x55\x98\xe2\xdf\xc8\xe8\xc5\x7c\x0b\xe6\xcc\xec\x1d\x18\xf1\x24\x99\x52\xfa\xda\xe1\x9e\x5c\xde\xba\x6a\xcb\x1a\xce\xb9\xeb\xba\x3f\xfa\xe5\x33\xdb\x76\x1d\x6a\x6e\xac\xbd\xf1\xca\xf5\x4b\x17\x74\x0a\x21\x9a\x1a\x6a\xe3\xd1\xc8\xf6\x3d\x47\x1b\xeb\xe3\xff\xf6\xbf\xbf\x14\x42\x34\x37\xd4\xfe\xce\xfb\xaf\x98\xd1\xd6\xe2\x86\x1a\x20\xd4\x44\xa3\xcd\x10\x69\x00\x20\x95\x39\xc9\x29\x45\x0b\x24\xc5\x9a\xc6\xec\x8d\xda\x04\x6b\x2a\xf7\xad\xdc\xea\xfd\x4d\x24\x92\xf1\x78\x2c\x1a\x8d\x82\xff\x5b\xd6\x55\xd5\x08\x85\xcb\x22\xcb\x77\x66\x5f\xf7\xee\xf3\x8c\xa9\xd1\xb3\x86\x10\xdc\x71\x03\x15\x2c\xa1\x54\xb7\xa6\xe6\x2c\xda\x88\xc2\xbd\xf6\xc5\x09\x35\xf2\xf6\xfc\xe4\x58\x66\xe8\x48\xba\xff\x60\x7e\xa2\x8f\x3b\x36\x21\x40\x28\x55\x18\x21\x44\x25\x94\x5c\x76\xe1\x0a\x42\x88\x9f\x54\x24\x4b\x16\x74\x7e\xfe\xee\x5b\x9b\x1b\x6b\x09\xa5\xc5\x1b\xd1\x80\x2c\x98\xdd\x4e\x08\x31\x4d\x7b\x70\x78\xec\xd4\xc8\x44\x26\x6b\xee\x3b\xd4\x73\xbc\x77\x64\xe6\xcc\xae\x6b\x2e\x5e\xbb\xbc\xbb\x33\x64\x68\x47\x4e\xf6\x3f\xf6\xc2\xab\x3f\x7f\xec\x25\x55\xd5\xae\xd8\xb4\xec\xc6\xcb\x56\x7b\xcf\xe6\x7f\xe8\x89\xe7\x8e\xf7\x9e\xfa\xcc\x5d\xef\xf5\xb2\x88\x00\x90\xc9\x99\xdb\x76\x1f\x3c\x74\xa2\x87\x52\x30\x4d\x77\x32\x63\xe6\x72\xf6\xf7\xee\x7f\x7e\xcb\x05\x8b\x3b\x67\x34\xde\x70\xc5\x46\xaf\x06\x8c\x31\x42\x58\x7b\x6b\xeb\xa9\xd1\x54\x3a\x6b\x66\xb2\xf9\x6c\xde\xca\xe7\xcd\xbc\x65\xe7\x4d\xdb\xb4\x1c\x4f\x08\x2d\xc7\x71\x5c\xee\xba\xae\xcb\x05\xe7\x9e\x50\x00\x10\xa0\x40\x28\x25\x8c\x51\x4a\xa9\x42\xa9\xaa\x30\x4d\x55\x54\x55\xd1\x34\xc5\xd0\x54\x4d\x53\xc2\x86\xa6\xeb\x5a\xd8\xd0\xc2\x86\xfe\x97\x7f\xf8\x91\x44\x6a\xb2\xa3\xad\x69\xd6\x8c\x66\x00\x20\x40\x8e\xf5\x9e\x7a\xec\x99\x6d\x9f\xfb\xf8\x2d\x87\x8f\xf5\x9f\xec\x1b\x72\x5d\xce\x18\xad\x89\x47\xd7\xaf\xea\x6e\xac\x8b\x8f\x25\x52\x21\x5d\xab\xaf\x89\x1f\x83\xc1\x54\x3a\x9b\x9c\xcc\x7c\xe7\x67\x8f\x2e\xef\x9e\xdb\xd2\x58\x93\x9e\x4c\x6f\x7d\x75\x3f\xa5\xe0\xb8\x22\x93\x75\x18\x21\x07\x8f\x0e\xec\x3f\xd2\xbf\x7e\xe5\x3c\x10\xd0\xde\x52\x9f\xcb\xe6\x4e\x99\x39\x42\x09\xa3\xe0\x72\xe1\xba\xc2\x76\x04\x11\x40\x81\x52\x0a\xf7\x3c\xfc\xd2\xad\x57\xaf\xff\xfe\xcf\x1f\x7f\xfe\x95\xbd\x94\x92\xb5\xcb\x16\x7e\xe1\x13\xb7\x2b\x0a\x7d\xdf\x75\x9b\x2f\x5c\xb7\xe4\xc8\x89\x01\xdb\x71\x35\x95\xd5\xd6\x44\x17\xcc\xe9\xd0\x54\xa5\x67\x60\xf8\x9b\xf7\x3c\x22\x84\xf8\xd9\xc3\xcf\xde\x7a\xdd\x25\x8f\xbf\x78\x60\xf1\xbc\x0e\x42\xf9\xc0\xd0\xf8\xee\x83\x27\x1f\x7c\x72\x47\x7b\x4b\xc3\xbf\xff\xd5\xef\xd4\xd7\x46\x01\xc0\xb4\xdd\xfd\x47\xfb\x46\x26\x7e\xa5\x28\xcc\xb2\x9d\xd1\x89\xcc\x03\x4f\x6c\x7f\xe2\xc5\xfd\xdf\xfc\xfb\x8f\xb7\xb7\xd4\x7b\x5f\xe5\xc9\x54\xfa\x64\xdf\xd0\xea\xa5\xf3\xbb\x66\xb6\x4d\x24\xd3\xf7\x3d\xf2\x1c\xa5\xf4\xc2\xb5\x4b\x66\xb6\x35\x79\x5f\x38\x01\xd0\xd2\x54\xff\xcf\x7f\xf9\x09\xef\x5b\x53\x5b\x13\x03\x21\x9e\x78\x69\xff\xa1\xe3\x43\xad\x4d\xf5\xaa\xc2\x86\xc7\x26\x72\x66\x7e\x76\x7b\xe3\x86\x95\xf3\xbb\xe7\xce\xe2\x9c\x0f\x0e\x8f\xb7\x34\xd6\x7e\xf2\xc3\x37\x78\xa7\x88\x52\xaa\x28\x8a\xeb\x72\xcb\x76\xfa\x06\x47\x7f\xf9\xd8\xd6\x25\xf3\x3b\x29\xa3\x20\xc0\x76\xcc\x97\x77\x1d\x5e\xbb\x6c\x5e\x63\x5d\x7c\x78\x2c\x39\x3c\x96\x1c\x1e\x4b\xb4\xb7\xd4\x43\x7a\x50\xa4\x07\xf8\x08\x50\xa6\x8b\x70\x13\x0f\x37\x91\x48\x0b\x8d\xd4\x97\xfe\x16\xca\x75\x48\x8e\x11\x2b\x47\xf2\x7e\x6b\x9b\x69\x86\x0f\xa7\xe1\xd4\xa9\xe1\xb9\x73\x23\x81\xb1\xcb\x5d\xce\x5d\xc6\xb0\x4f\x7e\x1b\xc0\x46\x3f\x6b\xd8\xb6\x5d\xa9\x80\xbe\x08\x4d\x23\x5d\x67\xdf\xa6\x34\x33\x04\x00\x00\x82\xe7\x92\xa3\x93\xfd\xaf\xa5\xfa\x5e\xb3\x26\x87\x3c\x23\x4a\x88\xa2\x2a\x04\xc8\x2b\x7b\x4f\xa4\xb3\x7c\xe1\x9c\xf6\x3d\x87\x8e\x53\x22\x2e\x5a\xbb\xb0\x26\x1a\xf6\x6c\x0e\x1e\xeb\xdb\x7b\xf0\xc4\xc2\x39\x1d\x4b\x16\x74\x02\x01\xee\x72\x01\x82\x51\x1a\x8b\x86\x40\x40\xff\xa9\xd1\xaf\x7d\xef\xc1\x5b\xaf\xdd\xbc\x60\x4e\xbb\x65\x39\xc7\xfa\x27\x4e\x8d\xa6\x5f\xde\x73\xe0\x48\x4f\x9f\xa6\x2a\x93\xd9\xdc\xf0\x58\x8a\x0b\x32\x38\x92\xf8\xe6\x4f\x9e\x7a\xf8\xa9\xdd\xff\xf4\xa7\x77\xb4\x36\xd6\x5c\x7f\xf9\x86\xd1\xf1\x64\xc8\xd0\xfb\x06\x47\x0f\x1d\xef\x5f\x30\xbb\x7d\xc5\xc2\x59\x4b\x66\xb7\x8e\x8c\x27\x09\x00\x51\x08\x0b\x6b\x11\x4d\x31\x2d\x37\x9f\xb7\xbc\xb9\x27\x00\x24\x9f\xb7\x13\x63\xe9\x64\x26\x97\xce\xe6\xd3\x99\x7c\x36\x67\x66\x73\x66\x36\x6f\xe5\x4c\x3b\x6f\x5a\x79\xd3\xb6\x6c\xc7\xb2\x6d\xdb\x76\x6d\xdb\x13\x42\xee\x05\x85\x85\xf4\x28\x01\x00\xa0\x84\x50\x42\x98\x42\x19\xa3\x0a\x63\x81\x16\xea\xaa\x62\xe8\xaa\xa1\x69\x86\xae\x1a\xba\x16\x0e\x69\xa1\x90\x16\x36\xf4\xa1\xf1\x54\x26\x67\xc5\xc2\x46\x2c\x16\x5e\xb7\x7c\xe1\xe6\xb5\x4b\x09\x21\x0b\xe7\xcc\xac\x6c\xfd\xff\xbd\xe7\x91\xfe\x53\x23\x5f\xf9\xe2\x27\xd6\xad\xe8\xfe\xbf\xfe\xe4\x23\x3d\xfd\xc3\xcd\x0d\xb5\x73\x3b\x67\x10\x4a\xfe\xfe\x0b\x1f\xfa\xc9\x2f\x9f\xee\x19\x18\x16\x42\x88\x1a\xd0\x54\x75\xd1\x82\xce\xe5\xdd\x9d\x84\x90\xbc\x69\x2d\x9a\xd7\x71\xe7\xf5\x9b\x9e\x7e\x69\x0f\xe7\x1c\x08\x70\x7f\x04\x54\x08\x70\x5d\x6e\xda\x6e\xd7\xcc\x26\x45\x61\x97\x6c\x5c\xb9\xff\xf0\xc9\x4c\x2e\xef\xb8\x1c\x08\x78\xc3\x4b\x33\x5a\x1b\x66\xb4\x36\x04\x65\xf8\x8f\x6f\xdf\xbf\x76\xf9\xc2\xb5\xcb\x17\x5c\xb1\x79\xf5\xf6\x3d\x87\xa3\x91\x50\x67\x47\x33\x85\x7d\xcf\xbe\xbc\x8b\x10\x30\x6d\xd7\xb2\xb8\x42\x68\xff\xe0\xd8\xd6\x5d\x47\xaf\xbf\x74\x35\x00\xb4\x35\xd5\xcd\x99\x51\xdf\x3b\x30\xec\x0a\xee\xba\x42\x25\xd0\x10\x0b\xe5\x2d\xb7\x6f\x70\xbc\xa3\xb5\xd1\x0b\xe5\x1a\x6a\x6b\x9a\xea\x6b\x01\x60\x5e\xe7\x0c\xc7\x71\xff\xf2\x9f\xfe\x57\x70\x71\xff\xaf\x9f\xfb\xcb\x3f\xfa\xd0\xf2\xee\x39\xde\xf7\x4c\x00\x28\xaa\x02\xfe\x04\xcb\xc7\x5f\xdc\xbb\x6d\xcf\x89\x1b\x2e\x5b\xd7\xd1\xd2\xa0\x69\xca\x91\x9e\xfe\x27\x5e\xda\xf1\xfd\x07\x9e\xf9\x8f\x1f\xfc\x7a\xc3\x8a\x85\x1f\xb9\xf9\xa2\x74\x26\xd7\xd1\xda\x44\x08\xec\xd8\x77\xa4\xb5\xa9\xbe\xb1\x3e\x2e\x04\xff\xe8\xad\x57\x2e\xeb\xee\xb2\x6c\x77\xf1\xfc\x59\x86\xa1\xbb\xae\x6b\x5a\x36\x21\xf0\x99\xbb\x6e\x06\x80\x8d\xab\x17\x0d\x8f\x27\x1f\x7f\x6e\xe7\x73\xdb\xf6\x2f\x59\xd0\xe9\xdd\xb8\x99\xcd\x99\x3d\x03\x83\xf3\x3a\x4d\x32\xd9\x27\x00\xf6\x1c\x1d\xee\x9d\x64\x0b\x96\xad\xe9\xea\x5e\xc6\xf4\x48\x30\x6a\x70\xba\x09\x2f\x25\xbf\x9f\xdf\xca\x26\x58\x90\x33\x9f\xf2\x47\x90\xf4\xb2\xcc\xc6\xb2\xac\x64\x32\x55\x5b\x5b\x53\xc8\x59\x08\x61\xdb\x36\x0a\xe1\xdb\xc2\x1b\x1e\x23\x7c\x27\x84\xb1\xef\x40\xcf\x42\x88\x5c\x36\xc3\x39\x0f\x86\xfd\xfd\x9f\x01\x91\x72\x92\xc5\xb9\x9a\xe7\xda\x26\x28\x95\x95\x49\x24\x4e\xee\x4e\xf5\xee\x37\x53\xa7\x28\x29\xdc\xe9\x30\x91\x4c\x3f\xfa\xcc\x8e\x2b\x2e\x5a\xd5\xd6\x5c\x37\x99\x36\xbf\xfd\xf3\x17\xdf\xfb\x9e\x8d\xb1\x68\x68\xfb\xde\x83\xbf\x7c\x62\xeb\xf8\x44\xee\xb2\x0d\xdd\x97\xac\x5f\x34\xaf\x73\x46\xff\xd0\xe8\xf3\xdb\xf6\xad\x5c\x32\x77\xc1\xec\xf6\xc9\x4c\xee\x1f\xbe\xf6\x93\x54\x3a\xbb\x7a\xe9\xbc\xf7\x5d\x7d\x61\x3c\x16\x06\x00\x20\x40\x08\xa5\x84\x10\x42\x7f\xfe\xe8\xb6\xef\xfc\xfc\x69\x55\xa5\x8c\x11\x4a\x88\xcb\x85\x65\xb9\x96\xcd\x1d\x87\x73\x2e\xb8\x80\xf7\x6c\x5e\xf6\xc5\x4f\xde\x04\x7e\x37\xf1\x85\xbf\xfb\x7a\xff\xe0\x28\x10\xb8\xf1\xca\x4d\x97\x6d\x5a\x75\xcf\x2f\x9e\xee\x19\x18\xe1\x9c\x13\x42\x34\x55\x5d\xb5\x6c\xde\xfb\xae\xd9\xc4\x18\x4b\xa5\xf3\xe3\xc9\x4c\x32\x9d\x4d\xa5\xb3\xe9\x4c\x3e\x9d\xcd\xa7\xb3\x66\x36\x67\x66\xf2\x66\xde\xb4\xf2\x79\xdb\x34\xed\x42\x5e\xd4\x71\x1d\x2e\x84\x20\x5c\x08\x97\x0b\xee\x72\x2e\x84\xe0\x9c\x0b\xc1\x39\xe7\x2e\xf7\x9e\x68\x43\x29\x61\x84\x32\x85\x7a\xb9\x3b\x4d\x55\x54\x95\x19\x9a\xaa\xa9\x8a\x61\x68\x86\xa6\x18\xba\x16\x32\xb4\x88\xa1\x87\x42\x7a\x24\xa4\x85\xc3\x46\x34\xa4\x47\x23\x46\x2c\xac\x87\x0d\xdd\x30\x34\x95\x31\xc6\xa8\xa2\x30\x42\x08\xa5\x54\x61\xd4\x1b\xbf\xa5\x53\xf5\xa1\xde\x6c\x10\xef\xf8\x84\x00\xa3\x14\x08\xfc\xfa\xe9\x6d\x97\x5f\xb8\xfa\x4f\xff\xfe\xeb\x4d\x0d\xb5\x5f\xb8\xfb\xf6\x6d\x3b\x0f\x3e\xf3\xd2\x9e\xde\x81\x11\x97\x73\x28\x24\x72\x49\x5d\x6d\x6c\xf1\xc2\xae\x6b\x2f\x5d\xfb\xcc\xd6\x5d\xf1\x68\xf8\xa2\xf5\xcb\x85\x28\x1e\xe2\xeb\x3f\x7c\xb0\xa9\xbe\xe6\xe6\xab\x36\x13\x5a\x18\x67\x7a\xfc\xf9\x57\x63\x91\xf0\x05\xab\xba\xe5\xa3\xf7\xf4\x0d\xff\xec\xa1\x67\x8f\xf5\x0c\xba\x5c\x80\x00\x42\x48\xfb\x8c\xe6\xbb\xef\xbc\xba\xb1\x3e\xee\xed\x35\x99\xce\x3e\xf9\xe2\xee\x63\x27\x06\xd2\xd9\x3c\x63\x34\x1e\x8b\x2c\x98\xd3\x71\xf1\x86\xa5\x5b\x77\xbc\xb6\x68\xee\xac\x6f\xff\xec\xd7\x7d\x83\x23\x6b\x96\xcd\xbf\xe9\x3d\x9b\xe3\xd1\xb0\xed\xba\xdf\xfa\xc9\x23\x7b\x0e\x1c\x8f\x47\xc3\xbf\xff\xc1\xeb\x3a\xdb\x5b\x00\xe0\xd1\x67\x5e\x79\x65\xf7\xa1\x4f\x7c\xe8\xfa\x1f\xde\xff\x44\xdf\xa9\x91\x35\xcb\x16\xec\x3b\x3a\x7c\xe0\x58\x7f\x5b\x73\x6d\x5d\x3c\xc2\x18\xcd\xe6\xcc\x91\xf1\x54\xff\xd0\xf8\x64\x26\xef\x38\x22\x16\x09\xfd\xcb\x17\x3f\x3c\xaf\xab\x15\x84\x70\xb9\xf8\x87\xff\xef\x47\x33\xdb\x9b\x3e\x74\xf3\x15\x8e\xeb\xb8\x2e\xf7\x5a\xd5\xbb\xac\x7b\x65\xf7\xc1\xff\xfe\xc1\x43\x9f\xf9\xd8\x2d\x9d\xed\xcd\x5e\x75\x26\x33\xb9\xf1\xc4\xe4\xcc\xb6\x46\xef\x3b\x7f\xbc\x77\xe8\x7b\xf7\x3d\x71\xfb\x0d\x17\xcd\xeb\x6c\xb3\x1c\xe7\x6f\xfe\xf5\x47\x89\x54\x06\x00\xde\x73\xd1\xaa\x6b\xaf\xb9\x3c\xc9\xa3\xb1\x96\x39\x2c\xd6\x0c\xb4\xa8\x2e\x72\x48\x77\x3a\xce\xdc\x46\xfe\x58\x39\x22\x28\xff\x12\xa7\xb4\x89\x44\xc2\x9d\x9d\xb3\xbc\xda\x12\x42\x09\x21\xe1\x48\x54\xde\xf1\x1d\xd8\xd7\xbd\x2b\x3d\xe3\xd5\xc7\xd9\xc1\xeb\x6f\xbd\x65\x5f\xa8\x40\x9a\xc6\x22\xff\x66\xc8\x5b\x60\xe3\x5a\xb9\xd4\xc0\xc1\xc4\x89\x9d\xd9\x91\x13\x8e\xe3\xfc\xf4\xa1\xe7\x07\x86\xc6\x97\x2e\xec\xbc\x62\xf3\xca\x48\xd8\x88\x46\xc2\xf1\x58\xc4\x76\x5c\xc6\x14\xcb\xc9\xbe\xb4\xf3\xc0\xe1\x93\x7d\xaa\x4a\x2d\xcb\x9d\x48\x66\x27\x33\xf9\x7b\x7f\xfd\xea\x45\xeb\x16\x13\x02\x1d\xad\x4d\xb7\xdf\xb0\xc5\x0b\xa8\x38\x17\x93\xe9\x6c\x3a\x93\x7b\x7a\xeb\x9e\xd6\xa6\xba\xeb\x2f\x5f\x4f\x29\x25\x84\x3a\xae\x9b\x48\xa5\xa3\xe1\xf0\x65\x1b\x96\xbc\xfc\xea\x81\x44\x2a\xcd\x85\x00\x02\xae\xcb\x41\x57\x2d\x9b\x0b\x01\x96\xe3\xe5\x9b\x87\xde\x00\x00\x20\x00\x49\x44\x41\x54\x3a\xae\xc8\xe7\x2d\xaf\x1f\x7f\x65\xef\xe1\x79\x9d\xed\x17\x5f\xb0\xec\x97\xbf\x79\x51\x08\x91\x37\xad\xd6\xe6\xba\x3f\xfe\xd8\xcd\x7b\x0f\x1e\xcf\xe6\xcc\xee\xb9\x33\x63\xd1\x30\x00\x49\xa6\x73\x63\x13\xe9\x89\xc9\x4c\x32\x95\x49\xa5\xf3\x93\x99\xfc\x64\x36\x9f\xc9\xe6\xb3\x79\x33\x9b\x33\xf3\x79\xcb\xcb\x88\x3a\x5c\x10\xca\x80\x32\x20\x8a\x60\xe0\xb8\xae\x10\x82\x13\x01\x0a\x50\x00\x10\x82\x06\x27\x49\x80\xcb\x5d\xd7\x71\x4c\xc7\x71\x4c\x93\xbb\xae\xa7\x4c\xaa\xaa\xa8\x2a\xd3\x55\x55\xd7\x14\x4d\x53\x42\xba\xaa\xeb\x6a\x48\xd7\x42\x46\x21\x53\x1a\x0e\xe9\x91\xb0\x1e\x32\xf4\x90\xa1\x85\x0c\x35\x64\x68\x21\x5d\x33\x34\x55\x53\x99\xc2\x98\x27\xfc\x94\x52\xea\xdd\xf6\x41\x08\x25\xde\xd5\x80\x77\x85\x40\x28\xa5\x94\x10\x85\x15\x85\xf2\xea\x2d\x17\x00\xc0\x97\x3f\x7f\x97\x10\x42\x61\x6c\xe3\x9a\xc5\x1b\xd7\x2c\xb6\x1d\x27\x6f\xda\x82\x0b\xc6\xa8\x17\xaa\x7a\xc6\xd1\x48\x78\x68\x2c\xc1\x68\xc9\xdb\xec\x36\xac\x5e\x6c\x9a\xb6\x77\x38\xef\xe4\x5f\x79\xd1\x5a\xd9\x60\xcf\xc1\x63\x87\x8e\xf5\x5d\x77\xd9\x86\xcf\x7f\xe2\xfd\x96\xed\xe4\x4d\x8b\x52\x62\xe8\x9a\x77\x3b\xc7\xc1\xa3\x3d\x8f\x3e\xbb\xfd\x83\x37\x5d\x5e\x5f\x17\xbb\xe9\xaa\x8d\xd2\x57\xb9\xf0\xef\xaa\x25\xf3\x76\xec\x3d\xf2\xda\x91\x93\xe3\x89\xc9\x13\x7d\xa7\x1c\x87\xdf\xf5\x81\x6b\x35\x4a\xee\xbe\xf3\x86\x32\xe3\xb5\xcb\xbb\xeb\x6a\x62\x00\xe4\xd5\x7d\x87\x13\xc9\xf4\xa1\xa3\x7d\x8a\x16\x9a\xcc\x3a\xe9\x74\x9a\x32\x42\x08\x38\x0e\x77\x1c\x61\xda\x9c\xbb\x40\x80\xa4\xd2\xb9\x1f\x3d\xf8\xe2\x5f\xff\xf1\xad\x20\x04\xa5\xf0\xbb\xb7\x5d\xcd\x85\xc8\x99\xd6\xc0\xd0\xf8\xf0\x58\x62\x79\xf7\xec\x88\x37\x5f\x06\xe0\x82\x15\x8b\x56\x2c\x9a\xab\x69\x2a\xe7\xdc\x71\x9c\x13\x7d\xa7\x38\xe7\x1d\xad\x8d\xc1\x8b\xfd\xe6\x76\xb6\xfd\xf5\x67\xee\xf4\xd4\x85\x52\x7a\xe5\x45\xab\x9e\x78\x61\x17\x00\x89\x45\x43\xb9\xe4\xf0\x57\xbf\xfe\xdf\x1b\x56\x2d\xbc\xf2\xe2\x75\x24\xda\x4c\x62\x33\xdc\x50\x33\xd5\x23\x40\x58\xe5\x9c\xcf\x62\x85\xde\xc8\xb3\x46\xa1\x22\x53\x0a\x15\x04\xb9\xd3\x29\x6d\x72\xb9\xbc\xeb\xba\x8a\x52\x78\xad\x87\x00\x10\x9c\x13\x7c\x6d\xe1\x5b\x0e\x0a\xe1\xd9\x41\x08\x2e\xcd\x54\x11\xa5\x83\x73\xc5\x2f\xbf\x74\xaf\xde\x39\xb1\x11\x5c\xe4\x12\x43\x13\xc7\xb6\x4f\xf6\xef\xef\xef\xeb\x9f\x48\xa6\x17\xcd\x9f\x05\x40\x0e\x1e\xeb\x9f\x48\xa6\x4f\x0e\x0c\xbb\x5c\x5c\xbd\x65\xcd\x89\xbe\xe1\xf7\x5d\xbb\xd9\x7b\xc0\x75\x5d\x4d\x74\x7e\x47\xd3\xe8\x44\xd2\xb4\x85\xcb\x85\xa1\x10\x1a\x36\xf2\x96\x73\x6a\x24\xd1\x3d\x77\x86\x77\x94\xa3\x27\x06\x84\x10\xf3\xbb\x66\xfc\xf9\xa7\x3f\x70\xe8\x58\x7f\x48\xd7\x56\x2d\x9b\xaf\x2a\xaa\xf7\xeb\xfd\xe1\xbd\x8f\xfd\xfa\xe9\x57\xea\x6a\x62\x37\x5f\xb5\xe9\xb3\xbf\x7f\xd3\x4f\x1f\x7c\xf6\x44\xcf\x90\xc3\x79\xa1\x35\x42\x00\x00\x02\x48\x5d\x6d\xec\x77\x6e\xdd\xe2\xcd\x80\x5f\xb7\xa2\xfb\xbf\xbe\xff\x40\xd8\xd0\xff\xfd\x4b\x9f\x26\x94\x44\x42\x86\x57\xab\x13\x7d\x43\xfb\x0e\x9d\x58\xb5\x74\x7e\x2e\xef\x0c\x8d\xa5\xc6\x93\xe9\x44\x2a\x93\x9c\xcc\x26\xd3\xd9\x54\x3a\x9f\xce\xe6\x32\xd9\x7c\x36\x67\xe5\xf2\x56\xce\xb4\x6c\x87\x13\xaa\x50\x45\x23\x94\x3a\xae\xcb\x1d\x21\x84\x03\x65\x17\xf2\x42\x4a\x25\x13\x42\x08\x28\x84\x31\xc6\x40\x2b\xbc\x16\xce\x75\x5d\xdb\xb6\x4d\xcb\xca\xe6\x2d\x02\x59\xc6\x98\xae\x2a\x9a\xa6\xe8\x9a\x6a\xe8\x8a\xae\xa9\x21\x43\xf3\x02\xc4\x90\xae\x19\x7a\xe1\xa3\xa1\x2b\x86\xae\xea\xaa\xaa\x6b\xaa\xa6\x29\xba\xa6\x68\xaa\xaa\xab\x4c\x53\x15\x45\x61\x8c\x52\x85\x79\xa2\x48\xa4\xf7\x8e\x14\xbb\x4e\x2f\x2f\xed\xdd\x6b\x4a\x08\x24\x27\x33\x8c\x14\x4c\x19\xa5\x84\x02\x00\x38\x2e\x77\xdd\xc2\xfb\x7a\x36\xad\x59\x4a\x00\x4c\xd3\x16\xfe\x38\x31\x00\x2c\x9e\xd7\x45\x08\x71\x5d\x0e\xfe\x20\x55\x30\x85\xd8\xfb\xa0\x6b\xda\xe8\x44\x32\x97\xb7\x42\x86\xae\x6b\xaa\xee\xdf\xc4\xed\xd1\xd8\x50\xdb\xd1\xd6\x24\x84\xf0\x8e\x77\xf0\x68\xef\xf1\xbe\xc1\x2b\x2e\x5c\xa3\xf8\x2f\x01\xae\x8d\xc7\x2e\xdd\xb4\xaa\xad\xa5\xe1\xa5\x57\xf7\xab\x0a\xbb\x78\xc3\x0a\x2f\x1f\x5b\x48\xbb\x83\x38\xd6\x33\xe8\x38\x6e\x57\x47\x6b\x73\x43\x6d\x73\x43\xad\x00\xf8\xfc\xc7\x6f\x7f\xf1\xd5\x7d\xaa\xa2\xac\x5f\xb9\xe8\x07\x3f\x7f\xb2\x67\x60\x84\x00\x70\x6f\x0f\x01\x0e\x17\x20\xc0\x71\x78\xde\x72\xea\x6b\x23\x9e\x1e\x0b\x21\xba\x66\xb6\x1e\x39\x79\xea\xdb\xf7\x3e\x77\xf5\xc5\x6b\xea\x6a\xd9\x7f\xfe\xf8\x31\x10\xe2\x96\x2b\xd6\xcf\xef\x6a\x05\x02\xba\xae\x51\x42\x28\xa1\x27\xfa\x86\xff\xf6\xab\x3f\xe4\x5c\xcc\x9e\xd9\xf2\x89\x3b\xaf\xab\xaf\x8b\xc9\x27\x16\x00\x28\xa1\x57\x6c\x5e\x75\xf9\x85\x2b\x83\x1b\x32\xbe\xf8\xa9\xdb\x18\x63\x8c\x72\x91\x19\x14\xe9\x01\x46\x28\xd7\xe2\x22\xdc\x92\x82\xda\x78\x73\x3b\x55\xa6\x78\x6b\xfc\x34\xc9\xcf\x33\xb4\x29\x1b\x35\x9c\xde\x46\x08\x61\x9a\xa6\xa2\x44\xbc\x26\xa5\x40\x5c\xce\x29\x0a\xe1\x5b\x0e\x0a\xe1\xd9\xc1\xbb\x27\xa1\x70\x63\x72\xa1\xeb\x2d\x49\x51\x42\x21\x7a\x2b\xf4\x53\x67\xdd\x46\xb8\x4e\x7a\xe8\xe8\xc8\x81\x17\xf3\xe3\x3d\x5e\x62\x6d\x64\x3c\xf5\xf4\xd6\xbd\xb3\xda\x5b\x1a\xeb\xe3\x77\xdf\x79\xed\xd6\x1d\x07\x5f\x3b\xd2\xb3\x72\xf1\xdc\xda\x9a\xd8\xaa\xda\x38\x00\x38\x2e\x57\x29\x0d\xe9\xda\xdd\x1f\xbc\xe2\xbe\x87\x5f\x18\x18\x9e\xf0\xe6\xac\x33\x46\x1b\x1a\x6a\x57\x2d\x9e\x4d\xfc\x5e\xf5\x64\xdf\xf0\xfe\xc3\x3d\xf3\x3e\xda\x31\x67\xe6\x8c\x39\x33\x67\x40\xe1\x01\xce\x85\x20\x34\x1a\x0e\x11\x02\xe3\x89\xd4\xaf\x9f\x7e\xe5\x8a\xcd\xab\xff\xf8\xae\x9b\x07\x86\xc6\x06\x86\xc6\x27\xd3\x59\xc7\x71\x0d\x5d\xab\xad\x89\x36\xd5\xd7\xb4\x34\xd5\x2a\xd2\xcb\x10\xae\xb9\xe4\x82\x6c\x2e\x1f\x8d\x84\xfd\xf9\xae\x94\x00\xdc\x7c\xd5\x85\xd7\x5e\xba\x61\x78\x3c\x35\x3c\x96\x1a\x4f\xa6\x27\x92\x99\xc4\x64\x36\x99\xce\x4e\xa6\x73\x99\x6c\x3e\x93\x35\xb3\x79\x33\x97\xb7\x1c\x0e\x4c\xd1\xa8\x66\x78\xcf\x33\x13\xc0\x83\xc6\x29\x4b\x67\x09\xff\x8e\x4e\x7f\x6a\x6d\x61\xae\x7a\x60\xc0\x18\xa3\x94\x1a\xba\x2e\x00\x1c\xc7\xb1\x6d\x3b\x67\xd9\x99\x9c\xc9\x28\xd5\x54\x45\xd3\x15\x5d\x55\x74\x5d\x35\x34\x55\xd7\x55\x5d\x53\xbd\x69\x35\x7a\x41\x05\x0b\xfa\xa7\xaa\x8a\xa6\x2a\x9a\x5a\x9c\x8c\xaa\x28\xcc\x9b\x9b\xaa\x50\xca\x14\xaa\x30\xc6\x28\x65\x94\x14\x6e\xd4\x20\x85\xa1\x4f\x12\x24\x01\xe5\xde\x36\x90\x1a\x10\xde\x74\x50\x6f\xa0\x93\x73\xe1\x72\xce\x5d\xee\x0a\x2f\xc9\x09\x84\x50\x4a\xbd\x60\xd4\x8b\x3e\xc1\x0b\x49\x19\xa5\x8c\xd2\x58\x24\x7a\xf3\x7b\x2e\x76\x1c\x3e\x36\x31\xc9\x28\xf5\x03\xd6\x82\x41\x6d\x3c\x76\xd3\x95\x17\x12\x7f\x52\x55\x2e\x6f\xee\xd8\x7b\x78\xdd\xf2\x6e\xef\xae\x98\xc9\x74\xf6\xbf\x7f\xf0\xc0\x35\x97\xae\x5f\xb2\xa0\xab\x7b\xee\x2c\x00\x70\x1c\xd7\x71\x5d\xd5\x7f\xf7\x7a\xef\xc0\xc8\xe7\xfe\xf6\x3f\x39\xe7\x5d\x1d\xad\x7f\xfa\xc9\x3b\xda\xdb\x1a\x09\xc0\xf2\xee\x39\xcb\xbb\xe7\x78\x57\x65\x7f\xfa\xa9\xdb\x1e\x78\xf4\xa5\x5d\xfb\x8e\xa6\xd2\x59\xc7\x71\xbd\xef\xad\xaa\x2a\xe1\x90\xb1\x78\x61\xd7\xad\xd7\x5e\x48\xa4\x59\x94\x5b\x77\x1d\x99\xcc\xe6\xf6\x1c\x3e\x66\xd9\x8e\x65\xd9\xaf\xee\x3b\xf6\xf8\x0b\xfb\x3f\x77\xd7\xf5\xeb\x96\x76\xfd\xf3\xd7\x7f\xfa\xfe\xeb\xb7\xac\x5c\x3c\xaf\xa9\xbe\xa6\xb1\xae\x66\x78\x2c\x31\x30\x34\x9e\x98\xcc\x75\xcc\x68\x71\x1c\xc7\x75\x5d\x2f\x13\xc3\x85\x48\x65\x32\x47\x4f\x0c\x3e\xf5\xd2\x9e\xf6\xd6\xfa\x2d\x1b\x96\x87\x43\x46\x62\xd2\x54\x15\xe6\x72\x4e\x29\xd4\x44\x0d\x4a\x81\x5a\x49\x91\x4f\x0c\x1c\xe9\x8d\x2e\x9c\x0f\xd1\x16\x88\xce\x20\xd1\x16\x50\xf4\x20\x62\xf3\x28\xfb\x58\xb6\x32\x28\x79\xe5\x2e\x81\xda\x4d\x79\xe7\xc6\x94\x36\xa2\x30\xb0\x0a\x00\x44\x80\xb0\x6d\x2b\xb8\xd7\x1e\x79\xcb\xc0\x31\xc2\xb3\xe3\xd9\x71\x6c\x33\x9f\x17\x9e\x92\x80\x10\xa5\xef\x91\x97\x7e\x3f\xe5\x9b\xde\xbc\x8d\x63\xe6\x27\x4e\xec\x1a\x3d\xfc\xb2\x9d\x1e\xcd\x64\xf3\x75\x35\x51\xc6\x98\x97\x90\xf3\x7b\x5c\x4a\x80\x64\x73\xe6\x7f\x7e\xff\xc1\xd5\x4b\xe7\x5d\x7e\xe1\x2a\x02\xe4\x9b\xf7\x3c\x72\xe8\x78\xff\xfc\xd9\xed\x37\x5e\xb9\xb1\xb9\xa1\xd6\x75\xdd\x53\x23\x09\xdb\x76\x28\xa5\x21\x43\xab\xaf\x8b\xfd\xe6\xd9\x57\x13\xa9\xf4\x1d\x37\x5d\xa6\x30\x16\xc4\x1a\x13\xc9\xf4\xbf\x7f\xfb\xfe\x6b\x2e\x5d\x77\xc1\x8a\xee\xf1\xc4\xa4\xed\xb8\x2d\x4d\x75\xae\xe3\xee\x39\x78\xdc\x71\xdc\xae\x99\xad\x4d\xf5\x35\x5e\x83\xec\xd8\x7b\xe4\x64\xff\xd0\x75\x97\x6f\xd0\x14\x25\x67\x5a\x84\x80\xa1\x6b\x27\xfb\x86\x0c\x5d\x3b\x7c\xa2\x9f\x12\xb2\xac\x7b\xb6\x97\xff\x7c\xe4\xc9\xad\x2f\x6c\xdf\xf7\x67\x7f\x70\x47\x34\x12\xce\xe6\xcc\xfe\xa1\x89\xa1\xd1\xc4\x58\x22\x3d\x9e\x48\x4f\x4c\x66\x53\xe9\x6c\x3a\x9d\x4b\x67\xcd\x4c\xce\xcc\xe6\x4d\xdb\xe1\xaa\x16\xa2\x8a\xea\x8d\xa5\xf9\xbd\x8c\xf0\x05\xae\x2c\x16\x14\x85\x05\x02\xfe\x9d\x93\x25\x2f\xe1\x2b\xfb\x08\xfe\xa3\xe6\x84\x10\x8e\xe3\xd8\x96\xe5\xba\x0e\x05\xa2\x2a\x4c\xd3\x14\x4d\x53\x3d\xb5\xd3\x54\x45\xd7\x54\xcd\xd7\x3f\x4f\xf9\x54\x55\x51\x15\xe6\x4d\xc0\x51\x3c\xe5\x63\x85\x29\x39\x8c\x51\x46\x28\x65\xc5\xdc\x29\x25\x84\xd0\x82\x0a\x7a\xb1\x9c\x57\xe4\xa0\x30\xa2\xd0\x3f\x82\x10\x5c\x08\xe0\x9c\x73\x0e\xc5\x01\x4f\x21\xbc\x3a\x51\x42\xbc\x07\x93\x10\xea\xe7\x66\x49\x41\xea\x28\x25\x9e\xf8\x31\x6f\x81\x51\x46\x29\x63\x54\xa1\xd4\x2b\x18\x25\x84\x51\xff\x96\x4a\x4a\x19\x23\x8c\x29\x8a\xb7\x89\x12\xce\xf9\xa3\xcf\xbc\x32\x7f\x76\xc7\x92\x05\x5d\xde\x0b\xa5\xbf\x7b\xef\xa3\xfb\x0e\x1d\xff\xd2\x67\x7f\x37\x64\xe8\x42\x88\x74\x36\xf7\x85\x2f\xff\x57\xdf\xa9\x11\x5d\x53\x3f\xff\xf1\xdb\x37\xac\x5e\x0c\x41\x0b\x4a\x4f\x22\x35\x2d\xfb\xff\x67\xef\xbd\xe3\x2c\x39\xea\x7b\xd1\x5f\x55\x75\xf7\xc9\x73\xce\xcc\x99\x3c\x3b\x3b\x3b\x9b\x73\xd6\xee\x2a\x0b\x01\x12\xb2\x8c\x84\xb1\x01\x63\x03\x06\x0c\x8e\x5c\x6c\x7c\x71\xe4\xf9\xfa\xda\xe6\xa6\x8f\xfd\x1c\xde\xb5\xdf\xb5\x7d\xaf\xed\x07\x0e\x18\x1b\x8c\x31\x46\x48\x04\x09\xe5\xb4\x5a\x6d\xd6\xee\x6a\x73\x98\x9d\x1c\x4e\xec\x54\x55\xef\x8f\xea\xaa\xae\xee\x3e\x33\xbb\x20\x69\xb5\x92\xa7\x10\xb3\x7d\xba\xab\x2b\x75\xd5\xef\x5b\xdf\x5f\xfd\xea\x57\xd3\xb3\x55\xcf\xf7\x45\xed\x52\x29\xab\xd8\x96\x4b\x99\x26\x07\x7e\xe4\xc4\xd9\x2f\x3f\xf0\x58\x6f\x57\xfb\x3b\xde\xb2\xfb\xe1\xa7\x8f\x7c\xe1\x6b\x8f\xa5\x52\x84\x73\x70\x5d\xd6\xb4\x3d\xd7\x63\x9d\x1d\x6d\x5f\xfc\xe3\x5f\x38\x76\xf2\x5c\x7f\x4f\x67\x57\xb9\xc8\x39\xaf\xd6\x9a\x53\x33\x73\xe9\x74\xaa\xab\xa3\x28\x20\xd0\x34\x0d\xca\x98\xe7\x79\xe3\x53\x33\xff\xf5\x4f\xfe\x01\x00\xa6\x67\xab\x08\xa1\x7c\x2e\xbb\x65\xe3\xc6\x2d\x6b\x97\xaf\x58\xda\x3b\x36\x39\xf3\xd8\xde\xc3\x67\x2f\x8d\xae\x1c\xec\xde\xb3\x75\xe5\xd0\x40\x19\x49\xf8\xe1\xc0\x39\x36\x51\xa6\x0b\xda\x06\x20\xdf\x0b\x66\x56\x8e\xaf\xb8\xb5\x8b\xba\x13\x7c\xa9\x05\xe3\x7c\x4f\x77\x96\x2e\x5d\x92\xcb\xe5\x14\xa9\xa5\x8c\xb5\xb5\x15\x5f\xb9\x44\xba\x62\x58\x4c\x59\x0f\x8b\x8c\xf0\x55\x0b\x08\x90\xd2\xc3\xc9\x1e\x0f\xfa\xcf\xd8\xf5\x2b\x8f\xe3\xdb\x8d\xa9\xd3\x2f\xcc\x9c\x7c\xce\xb7\x2b\xfb\x0e\x9d\xda\xba\x61\xf9\xe4\x4c\xb5\xbd\xd8\x76\x7e\x64\x06\x63\x62\x9a\x84\x52\x56\x6a\xcb\x76\x94\xf2\x18\xe1\x42\x3e\xfb\x2b\x3f\xf3\xde\xc3\xc7\xcf\x4e\x4e\xcf\x75\x95\x4b\x2f\x9f\x1d\xb9\x3c\x3e\x3d\x32\x36\xe5\xba\xde\xcf\x7d\xe8\x3e\x83\x90\x81\xde\xe0\x98\x18\x21\xae\xd7\xae\x1c\x3a\x7b\x61\x94\x60\x82\x31\x56\x39\x17\xdb\x72\xf7\xbc\x65\x57\x5f\x77\x07\x42\xf8\xb1\xe7\x0e\x3d\xfe\xdc\xc1\xff\xf2\xcb\x3f\x99\x4e\x59\xdf\x7e\x62\x9f\x41\xc8\xae\xad\x6b\xc7\xa7\x2a\x8d\xa6\xcb\x38\x9f\x9c\xad\xcd\x56\xea\xbe\x4f\x53\xa6\x39\x57\xa9\xdb\x8e\x7b\x71\x74\x72\xa0\xb7\x7c\x69\x74\xf2\x8f\xfe\xf2\xcb\x00\xd0\xd9\x51\xfc\xcc\x27\x7e\x7c\x68\xa0\xe7\xb6\xdd\x9b\x57\x0c\x0d\x64\x33\x99\x6a\xad\x79\x61\x74\x6a\x74\x62\x76\x62\xba\x3a\x39\x53\x9b\xa9\xd4\xaa\xb5\x46\xb5\x6e\xd7\x1a\x76\xa3\xe9\x34\x1d\xdf\x30\x53\x56\x36\xc7\x19\x8f\xa2\x20\x2c\x84\x82\xa0\xe8\x2b\x87\x04\x0a\x02\xc4\x5e\x94\x7a\x45\x00\xd3\x34\x0d\xc3\xe0\x9c\x53\x4a\xa9\xef\xd7\xed\x80\x26\x06\x98\xa7\xf0\xcf\x08\x58\xa0\x00\x3f\x1d\x02\x09\xc1\x44\x11\x41\xb9\x7a\x88\xc3\x65\x43\x90\x20\x18\x5b\x80\x0a\x88\x20\x97\x44\x90\x4b\x3a\xc8\x38\xe7\x8c\x33\x0d\xc4\x03\xdb\x27\x14\x90\x42\x14\xa0\x20\x22\x51\x44\x8c\xc3\x21\x46\x04\x13\x4c\x90\x82\x46\x4c\xb0\x11\xc0\x36\x26\x98\x18\x06\x26\x18\xaf\x5b\x35\x4c\x30\x3e\x7b\x71\xdc\x34\x08\x21\xf8\xc6\xed\x1b\x37\xae\x5e\x6e\xdb\x9e\xef\x33\xc3\x20\x29\xd3\xfa\x1f\xbf\xfe\xd3\x33\x73\xd5\x4c\xda\xea\x2a\x97\x24\xa3\x15\x27\x3e\xa3\xff\xf7\xf3\x5f\x5d\xb3\x7c\xf0\xad\x37\x6f\x4f\xa7\xac\xfe\x9e\xb2\x6a\xed\x27\x9e\x3b\xf8\xc4\xde\xc3\x3f\xfb\x81\xfb\x8a\x6d\xb9\xe7\xf7\x1f\x7b\xe1\xd0\x09\x00\x78\xea\x85\xa3\xff\xe9\x17\x7f\xe2\x99\xbd\x87\x6b\x8d\x26\x02\xc4\xd2\xdc\xcb\x5a\x9e\xc7\x0a\x6d\x19\xd3\x30\xb6\x6f\x5a\x0d\x1c\x46\xc6\xa6\x08\xc1\x5d\xe5\x52\xa9\x98\x17\xd3\x84\x07\xbf\xfb\xfc\xb7\x9f\x7c\xe1\x37\x3f\xf9\xc1\xf6\x62\xde\x24\xc6\xd2\xfe\xd4\x67\x3f\xfd\x91\x4a\xad\xfe\x8d\xef\x3e\x3f\x3e\x39\x7b\x79\xaa\xd1\xd5\x51\xcc\x64\x4c\xdb\x75\x10\x86\xce\x8e\xfc\xd9\x11\xfe\xd0\x93\x07\xff\xf5\x91\x03\xdb\xd7\x0d\x7d\xec\xbd\xb7\x75\x14\x73\xa2\x61\x1d\xd7\x39\x7c\xe8\x89\xc1\xfe\xae\xaf\x3f\xf2\xe2\x5b\xde\x72\xfb\x92\x35\x5b\xa1\xad\x1f\xa5\x0a\x3a\x61\xd5\x47\x5f\xfc\x73\x45\x6d\xd3\xbe\xbf\x38\x62\x46\x8b\x00\x03\x42\xbe\xef\x8b\xfd\x24\xb0\x18\xae\x61\x58\x04\xc2\x57\x27\x08\xdb\x77\x00\x5d\xde\x02\xc4\xd7\xd2\x41\x3a\x85\x41\xaf\x30\x8e\xef\xd8\xd3\xa7\xf7\x4d\x9d\x78\xda\x6b\xce\x39\xae\xdf\x96\xcf\xde\xb8\x63\x3d\xc6\xb8\xbb\xb3\xe3\x2f\xbe\xf8\xf8\xda\x15\x43\x3b\x37\xad\x48\x99\xc6\xde\x23\x2f\x3f\xfb\xc0\x33\xae\xe7\xed\xd9\xb2\xfa\xa6\xed\xab\x4a\x6d\xb9\x4d\x6b\x87\x45\x82\x9f\xfc\xc8\xbb\x9e\xdc\x7b\x04\x21\xb4\x6b\xeb\x1a\x84\x90\xef\xd3\x7d\x47\x4e\xae\x5f\x35\x54\x2e\xb5\x01\x42\x9e\xe7\x1f\x38\x76\x29\x9f\xcb\x3d\xbe\xf7\xe4\xc8\xf8\xe4\xda\x15\xfd\xdb\xd6\x2d\x23\x04\x9b\x86\xb9\x66\xf9\x92\x91\xb1\x69\x8c\xd1\xbb\xee\xbe\xf9\xde\xb7\xec\x4e\xa7\x2d\x00\xf8\xf8\xfb\xef\xf5\x7c\xff\xe5\xb3\xa3\xdf\x78\xf4\xe0\xfd\x6f\xdb\xed\x79\xce\x8b\x2f\x9d\x9b\x9a\xad\x1d\x3a\x71\x71\xf7\x96\x95\xfd\x3d\x65\x9f\xd2\xaf\x3c\xf4\xc4\xd4\x4c\xdf\xdb\x6e\xd9\xb1\x69\xcd\xf0\xd9\x8b\xa3\x06\x21\x9e\x4f\x11\xc6\xc5\xb6\x7c\xb1\x90\x9f\x9e\xad\x9d\xbf\x3c\x75\x79\x62\x7a\x7c\xaa\x32\x31\x5d\x9d\x9e\xab\xcd\x55\x1b\xb5\x9a\x5d\x6b\xda\xf5\xa6\xc3\x18\x4a\xe7\xf2\x38\x3c\xf1\x47\x69\x9c\x5a\x71\x41\x5d\x23\x0a\xda\x19\x8c\xea\xa1\xbc\xdf\xe2\xc5\x10\x5c\x83\x0b\x42\x88\x40\x44\xce\x39\xa5\xcc\x63\xbe\xd3\x70\x38\xd8\x62\x21\x50\x81\x9f\x61\x10\x42\x10\x21\x44\x50\x2e\x4c\x24\xf6\x28\x16\xa8\xf8\x79\xb8\x40\xd8\x12\x04\x43\x20\x14\x7a\x51\x00\xce\x18\x08\xd7\x00\xc1\x9e\x48\x45\x6d\x05\x04\x6a\x70\x28\x88\x66\x90\xa9\x54\x07\x88\xcc\x89\x56\x12\x01\x81\x58\x52\x46\x83\x60\x2c\x98\xa2\xe4\x8b\x8a\x38\x0a\x53\x20\x83\x10\x42\x88\x41\xf0\x4b\x67\x46\x0c\x82\x05\xf7\x25\x04\x9b\x06\x01\xc7\x1f\x19\x9b\x31\x0d\x62\x9a\x44\x98\x1d\x19\x04\xaf\x5d\xbe\xd4\x30\xb0\x3a\x69\x59\xb5\xf6\xba\x95\x43\x9e\xef\x5b\x96\x89\x00\xdd\x7f\xf7\x2d\xb5\xa6\x3d\x33\x5b\x5d\xb9\x6c\x60\x78\xb0\xf7\x37\x3e\xf1\xbe\x87\x1e\xd9\x3b\x3a\x31\xc3\x38\x27\x18\x75\x95\xdb\xdf\x7e\xdb\x76\xcb\x34\x00\xe0\xc0\xb1\x53\xbf\xfb\xc7\x9f\xc7\x18\x6f\x59\xbf\xe2\x93\x1f\x7e\x77\x3e\x9f\xf1\x3c\x56\x69\xb2\xb5\xab\xd6\x3c\xfd\xe2\xe9\xf1\xe9\x99\xf5\x2b\x97\xdc\xb0\x69\x65\x6f\x77\xb9\xb7\xab\xbc\x72\xd9\xe0\xb9\x91\x89\x9f\xfd\x4f\xff\xe7\xdf\x1e\x79\x56\x2c\xdf\x32\xc6\x9a\xb6\x5f\xa9\x09\xc3\x14\xf6\xd4\x8b\x27\xe7\xaa\xf6\x67\x3f\xf5\x6e\xd7\xf3\xf7\x1f\x3d\xbd\x7b\xeb\xea\x2d\xeb\x57\x50\x4a\x97\x0d\x94\xb1\x33\x85\xc6\x5f\xe4\x13\x07\x79\xaa\x04\x6d\x83\xa8\xd0\x8f\xd2\x11\xf7\x49\xb1\xef\x15\xfb\x09\xad\x2c\x6b\xae\x18\x07\x63\x12\x0c\x6b\x0c\x08\xb8\xef\xd3\xa4\x56\x76\x31\xbc\xd6\x61\x51\x35\xfa\xea\xa4\x6c\xdb\xb6\xef\xbb\x08\x21\x4a\x99\x72\x84\xf6\x5a\x5c\x50\xcf\x9b\x3e\xbd\x6f\xf2\xd8\x13\xcc\xad\x11\x8c\x8f\xbe\x7c\xe1\xf3\x5f\x7e\xf8\xe7\x7f\xe2\x9d\xab\x96\xf5\x23\x84\xfe\xea\x4b\x8f\x7b\x14\x6d\x5d\xb7\xac\xb7\xb3\x84\x31\x3a\x37\x32\x76\xe0\xd8\xe9\xfd\x2f\x9d\x99\x9c\xae\x65\xd3\x99\x0f\xff\xf0\xed\xf7\xdc\xb6\x05\x63\xc4\x83\x99\x3b\x08\x56\x81\x09\x6e\xda\xde\x9f\x7e\xee\x5f\xb6\x6d\x58\x79\xd7\x6d\x37\x20\x04\x5f\x7b\x78\xdf\xe8\x44\xf5\x8e\xdd\x1b\x30\x86\x6f\x3e\xb9\xef\xc1\x47\xf7\x0d\xf5\xf7\xfe\xea\x4f\xdf\x3f\xd8\x5b\x66\x9c\x7b\x9e\x9f\x4a\x99\x00\x30\x57\xa9\x1f\x79\xf9\xdc\x40\x4f\x79\x68\x49\x0f\x00\xfa\xf2\x83\xcf\x1e\x7a\xf9\xc2\x8a\xa5\xdd\x94\xb2\x97\x4e\x9d\x3f\xfc\xf2\x85\x6a\xd5\xf9\xf8\xfb\xde\xf6\xa1\x77\xdd\x16\x6e\xe8\x02\xf0\x29\x6d\x3a\xae\x65\x18\xe9\x94\x85\x10\x62\x8c\x8d\x4f\x55\x2e\x8c\x4e\x5d\x9e\x98\x19\x9f\xac\x8c\x4d\xcf\x4d\xcf\x56\x67\x2b\x8d\x6a\xad\x59\x6b\x38\x4d\xdb\x35\xcc\x54\x3a\x97\x53\xda\x24\x45\xe7\x42\xdd\x67\x64\xc6\x0d\xa0\xee\xaa\x96\x53\xb0\x17\xe0\x0c\x08\xa3\x44\x88\x4b\x9c\x08\xac\xca\x64\x11\x42\x52\x13\x2d\x1d\xb4\x72\xce\x19\xa5\x94\xfa\x8c\x32\x91\x92\xe2\x5b\x01\x21\x23\x88\x84\x36\xa4\x48\xff\x2b\xa0\x21\x24\xfd\x00\x1c\x05\xcb\x97\x8a\xeb\x09\x15\x3b\x13\xff\x48\x50\xe4\xd2\xea\x44\x16\x2b\xf0\x1b\xa7\x12\x14\xa9\x87\x6b\x90\x72\xbb\x8c\x46\x16\x03\xad\x6c\x00\x82\x08\xa1\x00\xad\x95\x1e\x35\x28\x39\xd1\x71\x11\x07\x7c\x91\x10\x6c\x60\xb1\x6f\x44\x82\xa5\x74\x56\xa7\x1c\xd7\x19\x06\x31\xc5\xe2\x28\xc1\x26\x21\x2a\xa6\xe0\xd0\x02\x59\x95\x9e\x36\x36\x9a\x02\x4d\x70\xb0\xfc\x89\x4e\x9c\xb9\x68\x1a\x64\xd9\x60\xef\xf9\x4b\xe3\xbf\xf2\x5f\xfe\xac\xe9\xb8\x84\xe0\xff\xf6\xab\x1f\x5f\xb3\x7c\xf0\xdb\x4f\x1d\x3a\x70\xec\xc2\x5b\x6f\xdc\x44\x08\xfa\xee\xb3\x07\xbe\xf9\xe4\xfe\x9e\x8e\xf2\xaf\xfe\xd4\x7d\x4b\xfb\xcb\xd5\x7a\xf3\x3f\xff\xc1\xe7\x2f\x8c\xce\x02\xc2\x1c\x00\x63\xe0\x1c\x7c\xca\x3c\x9f\x31\x0a\x8e\x47\x19\xe3\x08\xa1\xff\xe7\x37\x3f\x38\xd8\xd7\x21\xd6\x17\x8f\x9e\x1c\x99\xad\x39\xc5\x7c\xf6\xd2\xd8\xc4\xf2\xc1\xce\xc1\xbe\xf6\xa0\xb9\x11\xe6\xa9\x76\x54\x5c\x8a\x8a\x83\xc8\xca\xea\xbd\x24\xa9\x2c\x8d\xd7\xe5\xea\xe2\x18\x86\xb1\x6a\xd5\x0a\xc1\xff\xc4\xdf\xb9\xb9\x6a\x57\x57\x97\x5a\x26\xbc\x0e\x65\xdd\x9b\x32\xe5\x45\x46\xf8\xea\x04\x8c\x71\xb3\x69\x67\xb3\x59\x24\x1d\x98\x89\xce\xaf\xed\x6d\x88\xe8\xdf\xbe\xbf\x38\xb3\x67\x0f\x8d\x1d\x7d\xd4\xab\x4d\x12\x4c\x4c\xc3\xc0\x98\x6c\x5e\xb7\xfc\x37\x3e\xd1\x5d\xa9\xd6\x31\x21\x18\xa1\xd9\x6a\xed\xc0\xb1\xf3\x07\x8f\x9f\x14\x84\xc0\xf3\x69\xd3\xf6\xe6\xaa\x4d\xcf\xe3\xd3\x4e\xfd\x0f\xff\xfa\x1b\x1d\xc5\xdc\x8d\xdb\x56\x21\x40\x94\xd2\xd1\x89\x99\xde\xae\x72\x2a\x93\x42\x08\x0a\x39\xf3\xd7\x7e\xee\xfd\xcf\xbc\xf8\x52\xd3\x76\x72\xd9\xcc\xd9\x8b\x13\x4f\xbc\x70\x74\xdf\x4b\xc7\xb9\x38\x0c\xbd\xe1\xee\x3b\x7a\xe6\x77\xff\xe4\x9f\xff\xd7\xef\x7e\xcc\xc0\x98\xa4\xac\x7f\x7e\xe8\xf1\x73\x17\xc7\x1c\xd7\x7b\xf6\xc5\x97\x0c\x83\xbc\xed\xe6\x1d\x3f\xfd\x81\x77\x22\xe0\xcf\xed\x7f\xe9\xc5\x23\xc7\x39\xe7\x9e\xcf\x6c\x9b\xfa\x94\xfd\xd5\x97\x1e\xf9\xd0\x0f\xdd\x8e\x00\x66\x2b\xb5\x33\x17\x2e\x6f\xdf\xb8\x1a\x21\xf4\xd4\xde\xc3\x6b\x57\x2c\x5d\xbe\xb4\xdf\x76\xdc\xd1\x89\xd9\x91\x89\x99\xb1\xc9\xb9\xb1\xc9\xb9\xf1\xe9\xb9\xa9\x99\xea\xec\x5c\x63\xae\xd6\xa8\xd5\x6d\xdb\xf5\xb3\xf9\xbc\x95\x4a\xa3\x88\xd1\x01\xd7\xff\x15\x20\xa1\x5b\xe4\x05\x7f\x02\xf1\x13\x65\xe8\x1c\x00\xe6\x43\x41\x48\xa2\xa0\xe0\x32\x41\xd6\x51\x37\x92\x86\x61\x18\xd2\x72\x84\x33\xe1\xc8\x86\x89\x9d\x1b\x20\x97\x7f\x90\x54\x5f\xe2\x80\x06\x06\x77\x03\x2b\x24\x00\x4d\x8b\x00\x1c\xc2\x52\xa9\x65\x42\x50\x6b\xce\xd0\xa2\xcc\x0a\x51\x15\xc0\x2a\x53\x54\xcd\x18\x47\x14\x20\xb8\xd6\x41\x51\xac\x30\x2a\x85\x6d\xc8\x23\x31\x26\x04\x61\x8d\xd1\x92\x00\x23\x31\xc1\x48\x91\x45\x09\x90\x44\xc2\x24\x31\x08\x16\x58\x28\xb4\xac\x06\x21\x62\xb3\xa6\x69\x18\x42\xa5\x6c\x99\x86\x65\x10\xcb\x24\x96\x61\x18\x06\xb6\x4c\xc3\x32\x8d\x80\x4f\x1b\x84\x60\xac\x3b\x44\x7d\xe1\xd0\x89\xa3\x2f\x9f\xfd\xed\x4f\x7d\x78\x68\xa0\xe7\x4f\x3e\xfb\x0b\x97\xc6\x26\x3b\x4b\xc5\xfe\xde\x4e\x84\xe0\xdc\xa5\x89\xc7\xf7\x1e\x3a\xf2\xf2\x69\x84\xa1\x5a\x73\xaa\x35\x67\x7c\xf2\xfc\x67\xfe\xe0\x8b\x5f\xf8\xc3\x5f\x28\xe4\xd0\x47\xde\x7b\xd7\xec\x5c\xfd\xdf\xbe\xfd\xfc\x5c\xb5\xae\xda\x4c\x18\xb2\x31\x06\xae\xe7\x97\xda\x8b\x3d\x9d\x45\x31\x13\x38\x7f\x79\xea\xe9\xfd\x67\xdf\x77\xef\xad\x99\xb4\x75\x7e\x74\xe2\xf7\xfe\xea\xeb\x4b\xba\x3b\x3f\xf2\xee\x5b\xba\xcb\x05\xce\x39\xb3\x27\x59\x63\x02\x4f\x1c\x62\xd9\x6e\x54\x5e\x83\xf2\xdd\x90\x08\xb1\x35\xbf\x96\x7c\x6e\xbe\x38\x85\x42\x1e\x63\x2c\xc1\x12\x51\x4a\x85\x36\x7e\xd1\x5e\xe6\x1a\x87\x45\x20\x7c\x75\x02\x21\xa4\x5a\xa9\xe6\xb2\x59\x6d\x1a\x08\x20\xb7\x37\xc8\x8e\x1e\xe8\xf4\x44\xa7\xff\x9e\xe2\xcc\x5d\x3a\x31\x79\xf4\x11\x7b\xf6\x32\x46\x48\x40\xa0\xef\xd3\xbf\xfd\xca\x77\xb6\x6f\x5c\xb5\x75\xfd\x72\xd3\x10\x16\x0f\x68\xfb\xba\xa1\xa3\xc7\xcf\xd9\x8d\xa6\x90\x86\xbe\xcf\x28\xe5\x29\x83\x98\x18\x7b\x3e\xf5\x28\x7f\x66\xff\xc9\x5b\x76\xac\xc1\x84\xfc\x7f\xff\xf4\xcd\x47\x9e\xda\x9f\xcd\xa6\xdf\xfd\x8e\x5b\xef\x7f\xfb\x4d\x00\x00\x08\xed\xda\xb2\x56\x18\xda\xdc\xb8\x6d\xd5\x53\x7b\x0f\xcd\x4c\xcd\x01\xe2\x94\x42\x2e\x65\xa6\x0d\x63\x6a\x66\xce\xb6\xdd\x42\x2e\x03\x00\x7b\xb6\xad\xef\xed\xec\xa8\x37\xec\x17\x0e\x9e\xf0\x7d\x7a\x6e\x64\x0c\x01\xbc\xed\xe6\xcd\xcf\xbe\x70\x64\x62\x7a\x8e\x03\xa7\x94\xd3\x1c\xf7\x7d\x66\xa5\xd3\x42\x13\x58\x2a\x16\x36\xe7\x45\xfb\xa0\x0b\x23\x13\x4d\xdb\x2d\x16\xf2\xa3\x93\x73\x13\xd3\x95\x89\xe9\xca\xf8\x74\x65\x62\xba\x32\x3d\x53\x9d\xae\xd4\xe7\xaa\x8d\x6a\xdd\xf6\x7d\x56\x28\x96\x88\x61\xe8\x82\x43\x42\x02\x8f\xa1\xa0\x14\x34\x00\x0a\xfa\x94\x3c\x0a\x70\x52\x32\x29\xf9\x82\xfc\x4c\x71\x13\x3e\xf5\x57\xb4\x89\x42\x41\xd0\x01\x52\x94\x42\xb1\x3a\x8c\x09\x0e\xf6\x6c\x07\xe4\x3d\x98\xca\x88\xf2\x29\xd3\x0c\x00\x0e\xc2\xfc\x45\xac\xa5\x69\x75\x09\x59\x6a\xc4\x82\x54\xa1\x9d\x46\x2b\x04\xa0\xaa\x16\x09\xb6\xaf\x06\x6a\x53\xae\x37\x8f\x9e\x90\xfe\x7a\x08\x90\x38\xbc\x88\xd2\x47\xb5\xca\x28\x74\x06\x88\x20\x8c\x31\x22\x24\x30\x3a\xd5\xd0\x11\x85\xf4\x51\x80\x25\xc1\x81\xc3\x81\x40\x75\x2c\x16\x53\x03\x52\xa8\x5c\xf9\x58\x96\x61\x09\x9f\x3e\xd2\x0a\xc9\x34\x8c\x74\xca\x34\x04\x70\x9a\xc6\x8f\xdd\xff\x56\xc6\xb9\x98\x3f\x74\x95\x4b\x5d\xe5\xd2\xc8\xe8\xd4\x03\x0f\x3f\x7b\xe7\xcd\x5b\x6f\xd8\xb4\xfc\xa1\xef\x3e\x37\x3b\x5b\x11\xc7\x28\x66\x2d\xc3\xc4\x64\xae\x52\x73\x5c\x2f\x93\x4e\x6d\xdf\xb8\x86\x73\xbe\x79\xfd\xf2\xa7\x9e\x3f\x7a\xf2\xec\xe5\xb9\x6a\xdd\xf3\x7c\x42\x70\x36\x9d\x6a\x2f\x16\x96\x2e\xe9\xda\xb6\x71\x38\x93\xb6\x04\xc9\x9f\x9c\xa9\x1d\x39\x79\xee\xcf\xbe\x30\x87\x30\x9a\x98\xae\x34\x1a\xde\xde\xc3\x67\x46\xc6\xe7\x7e\xef\x57\xde\x9b\x4e\x19\xfb\x0f\x9d\xf9\xd2\x03\x4f\xfc\xf4\x8f\xbf\x63\xa0\xd7\x83\xea\x25\x9e\x2e\xa1\xf6\x15\xac\x38\x44\xcc\x54\xe4\x03\x25\xd6\xf5\x63\x61\xbe\x38\x8a\xb2\x88\x0f\xec\xb9\x1e\xe7\xdc\xf7\xfd\x64\x0a\x8b\xe1\x35\x0d\x8b\x40\xf8\xea\x04\x84\x50\xb3\xd9\xf4\x7c\xdf\x34\x0c\xca\xa9\x92\xae\xe2\x42\x80\xa3\xc0\xb9\xd8\xa3\x2b\xc6\xb1\xe7\x26\xc7\x0e\x7d\xab\x3a\x72\x1c\x21\x10\xe2\x86\x73\x84\x10\x4e\xa7\x8c\xf5\xab\x86\xd2\x69\xcb\x34\xcd\xde\xee\x0e\x31\x94\xde\x7e\xeb\xb6\xe9\xe9\xca\x33\xfb\x8e\x73\x8d\x3f\x88\xd3\x8b\x3c\x9f\xb9\x3e\xbb\x63\xf7\x7a\xcb\xb2\x10\xa0\xae\x72\xc9\xa7\xb4\x52\x6d\x7c\xf3\xb1\xbd\xc2\xab\x32\x00\xb2\xcc\x40\x5b\xb5\x7b\xeb\xaa\x1f\x7b\xe7\xad\x0f\x7d\xf7\x05\x4a\x69\x50\x14\x40\xb7\xdd\xb8\xa5\x90\xcb\x88\x31\xbc\xa4\xb7\x2b\x65\x99\x5d\x1d\xa5\x5b\x77\x6d\xf6\x3c\xbf\x90\xcf\x22\x8c\xdb\x8b\xf9\xcf\x7c\xf2\xfd\xdf\x7e\xfc\xc5\x8b\x23\xe3\x9e\x4f\x2d\xcb\xe8\xee\x6c\x7f\xeb\x2d\xdb\x10\x42\x9e\x4f\xff\xe8\x2f\xff\xe9\xe6\x9d\x9b\x6e\xde\xb9\x11\x01\xfc\xc8\xbd\x77\x4c\xcd\x54\x4f\x9c\x1b\x9d\x9e\xab\xcd\xcc\xd6\x26\x67\x6a\x93\xb3\xd5\x99\xb9\xda\xec\x5c\x7d\xae\xda\xa8\xd4\x9b\x80\x48\xb1\xa3\x8c\x31\x6e\xc5\x87\xe2\x1a\xd1\x38\x7a\x29\x1c\x4a\xbc\x22\x50\x50\xad\x2f\x4a\x79\xd4\x52\x23\x0a\xb1\x6b\xf5\x53\x51\xf4\x18\xcc\x70\x49\xe4\x03\x66\xc6\x39\x20\x84\x31\x0e\x22\x6b\xab\xbc\xb2\xcb\x84\x25\x01\xfd\x1f\x90\x08\x2f\x8b\xac\x3f\x91\x05\x08\x4c\x80\x92\x72\x37\x20\x9c\xa2\x80\x28\x5e\x05\x95\xbe\x30\x37\xf2\x29\x07\xce\x54\x43\xc9\xa4\x82\x57\x74\x2d\x2b\x42\x81\x0d\x0e\x52\xd0\xa8\x2c\x71\x10\x22\x04\x0b\xb0\x14\x46\xa7\xd2\x0c\x95\x48\x1b\x1c\x12\x22\xa2\x49\x2c\x83\x98\x86\x61\x59\x86\x65\x10\xb1\x11\x33\xd8\xb8\x69\x99\x29\xcb\x48\x5b\x56\x3a\x25\xb6\xa3\x18\x99\x94\x69\x9a\x86\xc0\x45\x00\xf0\x29\x3d\x76\xea\xdc\xc6\x35\xcb\xb6\xac\x1b\xfe\xe8\x7b\xde\xf6\xd5\x87\x9e\xf2\x3c\x1f\x02\x65\x32\xdc\xb0\x6d\x9d\xf4\x5e\x8b\x10\x42\x5d\x1d\xed\xf7\xdd\x75\x93\xef\xfb\xae\xe7\x8a\xf6\xc7\x08\x89\xdd\x32\xb6\xe3\xfc\xcf\xbf\xfe\xca\x92\xbe\xce\x77\xbe\x6d\x4f\x57\x7b\xbe\x51\xab\x9f\xac\xd7\x38\x70\xdf\xe7\xbe\x47\x0d\x4c\xc6\x26\x66\x2f\x5c\x9e\x5e\xb3\xbc\x77\xdb\x86\x15\x03\xbd\xe5\xce\xf6\x36\x8c\x11\xe7\x9c\x3b\x73\x7c\xf4\x05\x34\x76\x80\x97\x57\xf3\xd2\x72\x9c\x2e\x24\x5a\x36\x1e\xe6\xd3\x8b\x02\x40\x5b\x5b\x21\x9d\x4e\x41\x50\x36\xcc\x19\x77\x5c\x17\x21\xb4\x78\x50\xef\xb5\x0f\x8b\xc7\x30\xbd\x3a\x81\x73\x7e\xf9\xf2\xe5\x6c\x36\xd3\xd3\xd3\x2d\x5c\x7a\x69\x6a\x2f\xfd\x22\x58\xdf\xd1\x2e\xe6\x8d\xe3\xbb\xf6\xc4\xb1\x27\xa6\x8e\x3f\x85\x80\x09\xc2\x37\x33\xd7\xfc\xd2\x83\xfb\x6e\xde\xb9\x31\x65\x19\xdf\x78\xec\xb9\xc1\xde\x8e\x1f\xb8\x7d\x5b\x59\xee\x2c\x1e\x9b\x9c\xb5\x4c\xa3\xa3\x58\x38\x7d\x7e\x74\xff\x91\xd3\xa3\xe3\xd3\xb6\xe3\x21\x04\x96\x69\xe4\xb2\xe9\xbe\x9e\xf2\xae\xad\x6b\x1e\x7f\xee\xe0\x63\xcf\x1d\xfc\xef\xbf\xfe\x53\x85\x5c\xe6\xfc\xa5\xf1\x86\xed\x0c\xf6\x75\xe5\x73\x19\x00\x34\x33\x5b\x39\x79\x6e\x64\xfb\x86\x55\x86\x19\xec\xe7\x6d\x36\xdd\x53\xe7\x46\x5c\xd7\x27\x04\xbb\x9e\xb7\x6b\xeb\x5a\x55\x59\x84\xd0\xde\x83\xc7\x77\x6c\x5a\x23\x04\x04\x00\x4c\xce\xcc\xb5\xe5\x73\x96\x65\xaa\x71\x7f\xe6\xc2\xe5\x5c\x36\xd3\x5d\x2e\x01\x00\x63\xec\x5b\x8f\xbf\x90\x49\xa7\x86\x07\xfb\x2b\xb5\xe6\x5c\xbd\x51\xa9\x36\xe6\xaa\xcd\xd9\x4a\x63\xba\x52\x9b\xad\xd4\xe7\x2a\xf5\xd9\x6a\xa3\x52\x6d\xd6\x1a\xb6\x61\xa5\x73\x85\x50\xc4\x24\x0d\x58\x22\x58\x05\x1a\xbc\x71\xbd\x55\x81\x73\x06\xad\xce\x31\x5f\xd8\x40\x26\xa4\x89\xd1\x17\x83\xf4\xe5\x87\x0a\x81\x4d\xcc\xf5\xb5\x14\x90\xa2\xf6\x80\x38\x12\xc0\x1c\xa4\x26\x29\x7e\xd2\x26\x30\xbe\xce\xa9\xfe\x55\x94\x0f\xc2\x7c\x40\x56\x33\xec\x39\x1a\xd0\xa2\xf0\x61\xd0\x42\x48\xe1\x66\xb8\x97\x24\xb8\x0c\xe1\x5c\xeb\x85\xda\x7e\x93\x50\x49\xcb\xb5\xd6\x08\x50\x13\x49\x83\x55\xb1\xd2\x2c\xae\x03\xbe\x48\x02\xbe\x68\x60\xac\x21\x22\x96\x3b\x2c\xb1\xd0\x97\x5a\xc1\x16\x4c\xc3\x32\x8d\x94\x65\xa4\x2c\x33\x65\x19\xa9\x94\x99\x4e\x99\x69\xcb\x4c\xa7\x4c\xe1\xc7\xc0\x32\x48\x26\x93\x4a\x99\xc1\x26\x16\x51\x59\xc7\xf5\x5e\x3e\x73\xc9\x71\x5c\xcb\x32\x97\xf6\x77\x07\x3e\xff\x82\x8a\x70\xce\xe1\xc5\x23\x27\xd7\xaf\x1a\x3a\x71\xe6\x72\xa5\xd6\x4c\xa7\xad\xe9\xd9\xb9\x35\xc3\x7d\xdd\xe5\x22\xc6\xf8\xe0\x4b\xa7\x9b\xb6\xb3\x75\xfd\x72\xc6\xd9\xbf\x3c\xf8\xcc\xc3\x4f\x1d\x14\x1b\x31\x85\x3d\x72\x36\x97\xfb\xf4\x4f\xbd\x33\x9f\x4b\x71\x19\x7c\x9f\xfe\xf9\xdf\x3d\x70\xe1\xf2\xe4\xda\x15\x4b\xee\xbd\xf3\x86\xb6\x42\x06\x00\x41\x61\x00\x75\x6d\x80\x4c\x3b\x4a\xf8\x11\x4d\xea\x42\x63\x7f\x31\xc6\x2b\x56\x0c\x0b\x15\xa8\xf8\x69\xdb\x4e\xb3\x69\x03\x80\x61\x18\x96\x74\xf8\xb0\x18\xae\x4d\x30\xae\x7e\x39\x11\xde\x98\xab\xa0\xd7\x26\x65\x84\x10\x21\x64\x6e\xae\x52\x2c\x16\xd3\xe9\xb4\x38\x6f\x9a\x4b\x26\x20\xc7\x03\xe8\x47\x09\xca\x3b\xad\xe3\x54\x2e\x1d\x3f\xfc\xc8\x17\xf7\xbf\x78\xa0\xaf\xbb\x63\xed\x8a\x41\xc3\x30\x08\xc6\x0f\x3d\xb1\xb7\xad\x2d\x4f\x08\x78\xbe\xdb\x96\x4f\x7f\xed\x91\xbd\xff\xfc\xcd\xbd\xbf\xfe\x33\xf7\xef\xde\xb2\x12\x00\x1e\xfc\xee\xf3\x27\xce\x5c\xfc\xec\xa7\x3f\xb2\x62\xa8\x6f\xc5\x50\x1f\x00\x00\x82\xb9\x4a\xfd\x1f\xfe\xf5\x11\xca\xe9\xca\xe1\xfe\xbe\x9e\xf2\xfd\x77\xdf\x72\xd3\xce\x8d\x85\x5c\x16\x21\xd4\xd9\x51\x74\x1c\xaf\x90\xcb\x0a\x39\x39\x3e\x35\xf7\xe5\x07\x1e\x2b\x16\x72\x6b\x57\x2c\x3d\x71\xfa\xc2\x83\x8f\x3e\xff\x81\x1f\x7a\xfb\xa6\x75\xcb\x11\x00\x63\x6c\x6c\x72\x46\x8c\xf0\xd3\xe7\x47\xfe\xf2\x8b\x0f\x7c\xe4\xbd\xf7\xdc\xb0\x65\xad\xaa\xbb\x4f\xe9\xef\xff\xf9\x17\xdb\x8b\x85\x5f\xfb\xb9\x1f\x03\xa9\x12\x2c\x15\xf2\x8c\xb3\xe9\xd9\x9a\xed\xb8\xf5\xa6\xd3\xdb\xd3\xdd\x68\x3a\xc7\xcf\x5d\x6e\x34\xec\x5a\xc3\xa9\xd5\xed\xb9\x5a\xb3\x5a\x6f\x54\x6a\xcd\x6a\xad\x59\xa9\x35\xab\x75\xbb\x69\x7b\xd9\x42\xd1\x4a\xa7\x55\xc3\xea\x92\x05\x6b\xfa\x40\x50\xed\xab\xe4\xb7\xb0\x1e\xe1\xea\x39\x17\x4a\x45\x58\xd0\x5a\x41\xcd\xd8\x95\x8e\x55\x9d\xfe\xaa\x2c\x5a\x74\x4d\xa9\xbc\x00\x80\x70\x21\x92\x43\x24\x5a\xc8\xf0\x21\x70\xef\xc9\x39\xe7\x72\x9a\x2f\xd6\xaa\x94\x22\x57\x29\x44\x43\xf6\x26\xe1\x3c\x06\xd8\x2a\x2f\x89\xb3\x32\x39\x0d\x84\x35\x74\x46\x61\xd3\x28\x4e\xad\x2f\x4f\x8a\x5e\xa7\xa7\xaf\x5f\x08\x05\x6d\xf0\x7f\x65\xf2\x0f\x7a\x83\x0b\x70\xa4\x9c\x0b\x97\x76\xdc\xa3\x48\x32\x6f\x61\xb3\x23\x00\x92\x84\x26\xa9\x28\xd8\x4f\x42\xb0\x61\x60\x65\x7d\x6a\x9a\xc4\x30\x88\xa5\x16\x11\x4d\x23\x65\x06\x88\x28\xfc\x18\xa4\x53\x66\x3a\x6d\x05\x1e\xef\x52\x66\xca\x32\xb3\x69\x2b\x9d\xb2\x52\x96\xb9\x7e\xf5\x50\xcc\xbf\x2b\xe7\x7c\x74\x7c\xaa\x69\xbb\xc3\x83\xbd\xc3\x83\xbd\xa7\x2f\x8c\x7f\xf3\xc9\xc3\xef\x79\xc7\x4d\xd9\x8c\xb5\xff\xa5\x53\x7f\xfa\xf7\xdf\xd8\xb5\x71\xf5\x47\x7f\xe4\x2d\x4b\x07\xba\x27\xa7\x2b\xe9\x74\xda\xf7\xfd\x89\xe9\x99\x99\xca\x2c\xc6\x78\x69\x5f\xf7\x6d\xbb\x37\xf7\x76\xb5\xaf\x1c\xee\xb3\x4c\x83\x73\x3e\x57\xad\x9b\x06\x49\x59\xa6\x8f\xd8\xa5\xb1\xe9\xd9\x4a\xfd\x99\x17\x8f\x19\x06\xf9\xd1\x77\xde\xc6\x39\xe7\xd5\x4b\xbc\x7a\x89\xa7\xcb\xa8\x73\x0d\x6a\x5b\x92\xa4\xde\x7a\xc7\xe3\xd1\x39\x59\x7f\x7f\x9f\x61\x18\xa2\xd3\x61\x4c\x18\x63\xb6\xed\xf0\x60\x21\x33\xc2\x08\xaf\x37\x59\xf7\xa6\x4c\x79\x51\x35\xfa\xaa\x05\x42\x08\x63\x6c\x6c\x6c\x7c\x70\x70\x09\xc1\x84\x32\x1a\x93\x2d\xfa\xb5\x92\x83\xc9\x38\xbe\x53\x1f\x7d\xf1\xc1\xb9\x0b\x07\xbf\xfa\x6f\x8f\xec\x3d\xf8\x32\x42\x68\xf3\xda\x65\x3f\xff\x13\xf7\x11\x62\x78\x9e\xff\xdd\xe7\x0e\x3c\xfe\xfc\x01\xc6\x99\xe3\xd0\x4a\xcd\xf1\x7c\xf6\x17\xff\xf0\xf0\x8e\x8d\xcb\x4d\x42\x3e\xf2\xde\xbb\xf5\x3c\x10\x42\x67\x2e\x8c\xee\x3b\x7c\xf2\xbb\xcf\x1c\xe0\x9c\x3f\xf2\xf4\xfe\xcf\xfe\xf2\x47\x37\xac\x5a\x36\x34\xd0\x23\x04\xe2\xc3\x4f\xbe\xf8\xb5\x6f\x3f\xf5\x5b\x9f\xfa\xf0\xd9\x8b\xa3\xb7\xee\xda\xbc\x7e\xd5\xd0\xef\x7d\xe6\x67\xc4\xeb\x5d\xe5\x52\x7f\x4f\x99\x52\xaa\xa4\x7b\x57\x47\xc9\x71\x3d\x4a\x59\xb1\x90\xbf\xf5\x86\xcd\x06\x26\xd5\x7a\x93\x73\x2e\x76\xf5\x51\xca\x7f\xe1\xa3\xef\x61\x8c\x5d\xb8\x3c\xe5\xf9\xbe\xe7\x51\xdf\xf7\x5d\x9f\xba\x9e\x2f\xfe\xb3\x1d\xcf\x71\xbd\xa6\xed\xda\xb6\x5b\xb7\xdd\x46\xc3\xa9\x37\x9d\x9a\x6d\x37\x1a\x4e\xad\x6e\xd7\x9a\x4e\xbd\xe1\x70\x44\xda\x3a\xca\xd2\xbf\x54\xb0\xd0\x85\xa2\x93\x05\x24\x04\x4a\x10\x43\x19\xb3\xe8\x28\xa1\x2f\xd0\x82\x5c\x20\x0c\x42\x80\x30\xba\xc5\xa6\xae\xac\x04\x1d\xbf\x38\x42\xc0\xa5\x86\x33\x82\xa6\x6a\xa6\xaf\xbf\xa8\xd9\xd1\x84\x9a\x49\x95\x05\xe7\x3a\xdb\xe7\x1a\x6a\x2a\x95\x2d\x44\x50\x50\x27\x82\x1a\x1e\xcb\x49\x41\xf0\xaa\xb2\x07\x52\x4b\x8e\xe2\xb6\x5e\xa1\x18\xfa\xc9\x3a\xc6\xb8\x4b\xd8\x44\x52\xa7\x1a\x79\x14\x60\xac\x74\x68\x24\xcb\x22\xbf\x49\x3c\x70\xce\x99\x38\x69\x96\x33\xf0\xa9\x58\x27\x45\x00\xc1\xd2\x63\xd4\x1e\xd5\x08\x76\x61\x62\xe5\x97\x47\x59\xd6\xa4\xc4\x3a\xa2\x15\xb0\x43\x75\x36\x48\x3a\x65\x65\xd3\x66\x36\x9d\xca\xa4\x4c\xe1\x03\x36\x6d\x99\xa6\x69\x88\xf5\xce\xe7\x0f\x1c\xff\xf6\x13\x7b\x7f\xf7\xd3\x3f\xd9\x5e\x2c\x3c\xbd\xff\xe4\xd1\x93\xe7\xfe\xec\x1f\x66\xd2\x29\x6b\x64\x7c\xba\xd1\xf4\xfe\xf5\xe1\x17\x4e\x9d\x1f\xff\xe3\xdf\xfc\xd0\xf2\xa5\xbd\x9c\x73\xc3\x30\x3a\xda\x8b\x84\x60\xc6\xb8\xeb\x7b\x77\xdd\xbe\x8d\x73\xee\xb8\xbe\x48\xea\x6f\xbf\xf2\x70\xbd\x61\x7f\xea\x63\xef\xce\xa4\x52\x9f\xfc\xc8\xfd\x2f\x1c\x7a\x19\x23\xb4\x73\xf3\x2a\x42\x08\x93\xfb\x3c\xbd\xfa\x38\x6e\x4e\x40\xba\x84\xba\xd6\x43\xdb\x12\x40\x46\xac\x29\x44\x52\x8a\x1d\x02\x40\x67\x67\xb9\x50\xc8\x8b\xa6\xc5\x98\x00\x40\xa3\xd1\xd4\x23\x2c\x86\x6b\x1c\x16\x81\xf0\x55\x0b\xc2\x86\xd0\xb6\xed\xc9\xc9\xc9\x9e\xee\x6e\x8c\xb1\xf0\x02\xa2\xf7\xed\x85\xfd\x88\x72\xce\xe7\x2e\x9d\x18\xd9\xfb\x35\xea\x54\x31\xc6\xbb\xb6\xae\x3e\x7b\x61\xcc\x71\x3d\x61\xbb\xe0\xf9\xf4\xe6\xed\xab\x8e\x1e\x3f\xe3\xf9\x3e\xe3\xd8\x4a\xe3\x34\x21\x1e\x65\x26\x46\x9c\x71\x64\xa0\x53\xe7\x47\x1e\x7b\xf6\xe0\x60\x7f\xf7\x4d\x3b\x36\xe4\xb3\x69\x42\xc8\xda\x15\x43\xcb\x97\x0e\x50\xc6\x4e\x9c\xbe\xd0\xd9\x5e\xec\xef\x2e\x7b\xbe\xcf\x18\x4f\xa7\x53\x08\xe0\xfe\xbb\x6f\xb9\xf7\xce\x3d\xa6\x69\xf4\x75\x97\x81\x73\xca\x38\xa5\xd4\xf5\xa9\xef\x53\x9f\xf2\x1b\x77\x6c\x6a\xd8\xde\xc9\xb3\xa3\xae\xef\xf9\x3e\x13\x68\x47\x39\x63\x8c\xe5\x0b\x6d\x17\xc6\x66\x2f\x8c\xcd\x70\xb5\xe9\x4d\x9e\xf0\x40\x19\xa7\x94\x51\x4a\x7d\xca\x7c\x9f\x79\x3e\xf5\x7c\xdf\xf5\x7c\xd7\xf5\x1d\xd7\xb3\x5d\x5f\x1c\x99\x64\x3b\x6e\xd3\xf1\x9a\xb6\xdb\x6c\x06\x5e\x43\xad\x4c\xde\x4a\xa5\xb4\xe6\x44\xe1\x42\x5f\x40\x5d\x90\x34\x06\x91\x30\x26\x31\x4b\x97\x1c\x9c\x73\xa4\xed\xa6\x8f\x93\x2a\xdd\x82\x26\x84\x52\x14\x91\xf8\x0a\x58\x91\xb6\xc2\x16\x87\x0a\xd0\xa5\x9b\x84\x5b\x4d\x88\x05\x6a\xcb\x40\x1d\x1a\xdc\x01\x09\xdb\x10\x94\x1c\x20\x58\xa1\x53\x45\x4a\x96\x39\x52\xe5\x90\x09\x2a\xb8\x95\x51\x22\x94\x31\xa4\x7a\x21\x61\x8e\xfd\x6c\x6d\xdc\x11\xb1\x1e\x92\xd7\x28\xe0\x82\xa1\x91\x90\x6a\xad\x28\xad\xd4\x66\x03\x49\x81\x2e\xd0\x91\x32\x06\xd4\x97\xe9\x03\x42\x88\x20\x84\xc5\xc6\x0c\x03\x1b\x18\x1b\x06\x36\x34\x4f\x05\xa6\x49\x84\x37\x1f\xcb\x34\x53\x56\x08\x8a\xc2\xe9\x6b\x36\x13\x9c\x13\x92\xcd\x58\xb9\x74\x2a\x9f\x4b\xe7\x32\xa9\x7b\xef\xdc\x73\xdf\x5d\x37\x8b\xec\xfb\xbb\x4a\xe3\x13\x53\xe3\x93\x93\x08\x81\xe7\x31\xea\xb1\x94\x61\x9c\x3a\x3f\x36\x3d\xdb\xec\xef\x29\x31\xc6\x6c\xc7\x1d\x1e\xec\xfd\xef\xbf\xf6\xf1\x7a\xa3\xd9\xd3\x59\xc2\x08\x3b\x9e\xf7\x5b\x7f\xf0\xf9\xdb\x76\x6d\xfa\x81\x3b\x77\xfd\xdc\x87\xde\x49\x29\x13\xec\xb0\xa3\x54\xd8\xb5\x75\x0d\x02\xf8\xfb\xaf\x7e\xf7\xfe\xbb\xf6\x0c\x0d\x74\x0b\x95\xe9\x5f\x7d\xf1\xdb\xe5\xf6\xc2\xbb\xef\xb9\x91\x5f\x7c\x1a\xac\x36\xde\xb9\x1e\x95\x06\x91\x3c\xef\xa2\x95\x81\x6d\x3a\x13\x83\x00\x00\x20\x00\x49\x44\x41\x54\x4c\xa9\xab\xab\x53\xfc\x14\xfe\x68\x1d\xc7\xf1\x3c\x4f\x8f\xc3\xe7\x57\x63\x2c\x86\xd7\x22\xcc\x7b\x8e\x73\xcb\x70\x9d\xd0\xd8\xeb\x33\xe5\x6a\xb5\x3a\x35\x35\x25\xae\x7b\x7b\x7b\x4a\xc5\xa2\x38\x23\x1d\x34\xd1\x19\xd5\x88\x86\x01\x21\xc4\x7c\x6f\xf4\xd0\xc3\xd3\x2f\x3f\x8d\x11\x20\x8c\x8f\x9f\xba\xb4\x72\xa8\x3f\x95\xb2\x28\xe5\xd9\x4c\x8a\x10\xd2\x68\xda\x93\xd3\x95\x7a\xc3\xfd\xe6\xa3\xfb\xa6\x67\xab\x3e\xa5\x06\x21\xa5\x62\xe1\xae\xdb\xb7\x6f\xdb\xb8\x1c\x00\xfe\xe7\x5f\xff\xcb\x93\x7b\x0f\x03\x87\x15\xcb\xfa\x7f\xff\x33\x3f\x83\x31\x16\xb3\x72\xd3\x20\x8a\x08\x4c\x4c\xcf\xce\xcc\xd6\x56\x2d\x5f\xc2\x28\x73\x3d\x3f\x60\x69\x8e\xdb\x10\x6e\xac\x3d\xdf\xf5\xa8\xeb\xf9\x3e\xa5\xbe\xcf\x7c\x26\x76\xca\x31\x46\xc5\x39\x4a\xba\xaf\x93\x50\x8f\xc7\x94\x1b\x14\x16\xf8\xc3\xa4\x8c\xf9\x12\x0e\x05\x16\x7a\x1e\x75\x3d\xdf\xf3\x05\x22\xfa\x8e\xe7\x3b\xae\xe7\x3a\xbe\x4f\x99\x99\xca\xa4\xb2\x59\xd9\x38\x52\x2b\x18\x59\x2e\x95\xf8\x14\x82\x97\xf2\x9e\x26\xb9\x17\x52\x0b\x59\x61\x1c\xdd\xcc\x44\xc6\x94\x41\xe2\x53\xf8\x37\xaa\x06\x4d\xd8\xb6\xe8\xef\xf1\xf8\x2d\x99\x1f\x92\x5f\x57\xd1\x26\xae\xc3\x5b\x54\xa3\xa9\xac\x49\xe5\xef\xf8\x6a\x65\x52\x86\xce\x83\x5e\x61\x37\x6a\x7d\x4f\x42\x72\x48\x94\xc5\x23\x80\x78\xf5\x16\x0e\x72\x2d\x16\xc9\x2f\x80\x10\x8a\xb4\xaa\x96\x57\xab\xb7\xd5\x28\xe0\x61\xd6\xa2\x09\x58\x60\xb0\x83\x00\x10\x0e\x8c\x6e\x34\xb2\x48\x4c\x53\x1c\x1e\x49\x4c\xc3\x48\x59\xc4\xb2\x02\x8f\xe7\x99\x94\x99\x4e\x89\xf3\x40\x52\xd9\x8c\x95\xcd\x58\xb9\x4c\x3a\x97\x49\x15\x72\xe9\xb6\x5c\x36\x9f\x4b\x19\x06\xf9\xdc\x3f\x7e\xeb\xc9\xbd\x47\x28\x63\x20\xb6\x66\x72\xe8\xea\xea\xf8\xec\xa7\x3f\x90\x4e\x99\x8c\x32\x40\x40\x29\x05\x84\x30\x42\xb6\xe3\x36\x6d\x07\x00\x46\xc6\xa6\x8a\xf9\x6c\xb9\xa3\x4d\x7d\x42\xce\xf9\xd3\xfb\x5e\xfa\xf2\x03\x8f\x7f\xe2\xc3\xf7\x9d\xbd\x38\xb6\x72\xa8\xaf\xbb\x5c\x12\xa4\x70\x74\x62\x86\x52\x8a\x10\x3a\x76\xf2\x42\x5f\x4f\xc7\xd0\x40\x17\xc9\x94\x50\xcf\x66\x28\xf4\x23\x4c\xf4\xa6\x40\x08\xb5\xb7\x97\x7a\x7b\x7b\xc4\x4f\x8c\x31\x21\xc4\xf7\xfc\x4a\xb5\xa6\x47\xc3\x18\xa7\xd3\x69\x0d\x38\xaf\x3b\x59\xf7\xe6\x4b\x79\x91\x11\xbe\x6a\x41\xf8\x1f\x11\xe3\x7c\x6c\x6c\xdc\x30\x8c\x7c\x3e\x0f\x2c\xa2\xf1\xd7\x15\x24\x52\xd1\xc5\x39\x07\xa7\x5e\x19\x79\xfe\x2b\xf5\xb1\xd3\x84\x04\xd6\xe9\x9d\x1d\xed\xe3\xd3\xf5\x6c\xc6\x67\x8c\xcf\xd5\xec\x9e\x72\xb1\xad\x90\x2f\xb5\x15\x00\x60\xcb\xfa\xe1\x23\x27\xce\xb5\x17\x0b\xa5\x62\x3e\x9b\x4e\xcd\x56\x6a\x2f\x1c\x7a\x79\xe7\xa6\xd5\x3f\xf8\xd6\x3d\xb3\x95\x5a\xad\xd1\x5c\xbb\x62\x29\x26\x04\x01\x3c\xfc\xc4\x0b\xdf\xf8\xee\x73\xbf\xf1\xf3\x3f\xde\x55\x2e\x71\xce\x1d\xcf\x37\x0d\x33\x93\xc9\x1c\x3b\x75\xb1\x2a\xce\xb6\xb5\x1d\xc7\xf5\x1d\xd7\x73\x5d\xdf\xf5\x83\x23\x6d\x7d\xca\x28\xf5\x29\x65\x3e\x0d\x4e\x78\xe7\xea\xa0\xc5\x88\xbc\x16\x1a\x2f\x49\x0a\xa3\x58\xc8\x04\x83\x64\x54\x9c\x91\xeb\xfb\x0a\x14\xa9\xe7\x51\xdf\xa7\x80\xb1\x95\xca\x14\x32\x19\x8c\x89\xdc\xe5\x0e\x52\xcb\x18\x1c\x89\x10\x35\x55\x41\x28\x5c\x9e\x42\x81\xb9\x89\xb6\xa4\xc7\xb9\x12\xae\x28\xa6\xcb\x94\x18\x10\x41\x9a\x40\xc7\xa8\x29\x39\x43\xdd\x63\x3c\x4b\x1e\x90\xc9\xf0\xe3\xa9\x28\x12\x90\x11\xd7\x16\xe5\x90\x92\x9e\x32\x2d\x90\xf4\x11\xc9\x85\xcd\x08\x0a\xc6\x51\xf9\x4a\x21\x39\x91\x92\x1f\x24\xe4\x8e\xb2\xc3\xa9\xd6\x51\x34\x38\x00\x6b\x1e\x79\x3d\xa8\xbd\x86\xc1\x89\x3b\xe1\x36\x15\x2d\x0e\x68\x71\x00\x01\xe2\x2d\xe2\x68\x84\x15\x14\x16\x06\x7f\x31\x42\x1c\x30\xd6\x27\x2f\x94\x71\xcf\xf3\xc1\x0d\x7c\x8b\x0b\xd3\x1b\x69\x62\x13\x7a\x76\x4d\x09\xd7\xaf\x92\x23\xa6\x52\x56\x36\x2d\xb0\x30\x95\xcb\xa6\x0b\xb9\x74\x21\x97\x29\x15\xb2\xf7\xdd\x75\xe3\x8d\x3b\xd6\xbd\x7c\xe6\x12\x65\xcc\x20\xa4\xb7\xab\x7d\xdd\xea\xa1\x4c\xda\xda\x77\xe8\xc4\xe7\xbe\xf4\xcd\x8e\x52\xe1\xde\x3b\xf7\x6c\xdd\xb0\xf2\xe1\xa7\x0f\xbf\x78\xf4\xdc\x0d\x9b\x57\x97\x0a\xb9\xf3\x97\x67\x4f\x9d\x3f\x6a\x99\x64\xf7\xe6\x15\x2b\x87\x7a\x4d\xd3\xe0\x9c\xdf\xb4\x63\xfd\xce\xcd\xab\x4d\x83\x0c\x0d\xf4\x88\x9e\x8e\x38\xe2\x9c\xf7\x77\x97\x19\x67\x7f\xfa\xf9\x7f\x3b\x74\xec\x2c\x42\x68\xf7\xd6\xd5\xef\xbf\xff\x36\x7e\xe1\x49\x9e\xe9\xc4\x7d\xdb\x20\xd3\xa1\xea\xdb\xd9\x59\xee\xea\xea\x04\xc9\x98\x09\x31\x28\xa5\xd5\x5a\x3d\xd1\x62\x8b\xe1\x5a\x87\x45\x20\x7c\xd5\x02\x91\xc7\xca\x88\xbf\x23\x23\x97\x07\x06\xfa\x73\xb9\x1c\x40\x0c\x0b\x23\x93\x7a\xce\xc1\x9e\x1d\x3b\xfb\xf8\xdf\x53\x7b\x2e\xf0\xb9\x41\xc8\x63\xcf\x9f\x38\x7e\x66\xf2\x96\x9d\xeb\x7b\xbb\x3b\x26\xa7\xe7\x1e\x79\xee\xf0\xf1\xd3\x17\x86\x97\x74\xdf\xba\x73\xfd\xa6\xd5\x83\x84\x90\xbe\x9e\x72\x2e\x93\xce\xa4\x2d\x00\xd4\x51\x6a\x2b\x15\x0b\x1c\x60\xd5\xf0\xc0\xef\xfc\xd2\x87\x0d\xc3\x50\x8a\xa9\x9b\x77\x6e\x5a\xd2\xdb\x85\x31\xb9\x78\x79\x6a\x7a\xae\x3a\x53\x69\x54\xeb\xcd\x9a\x3c\xc9\xc8\x71\x3d\x5b\x9c\x67\xeb\x51\xcf\xf7\x05\x56\x51\xc6\x28\x65\x8c\x32\xaa\x7b\xba\x94\xec\x46\x14\x5c\xcc\xe7\x03\xcd\x25\x0a\x50\x4c\x01\xa5\x40\x44\x46\xb9\x54\x96\x8a\xc3\xe2\x39\xa5\x8c\x31\x8e\x08\x31\x2d\x2b\x9b\x6b\x33\x2d\x4b\x38\xdc\xe4\x5c\x91\x0b\x80\xa8\x52\x48\xd1\x32\x1e\xb0\x1d\x4d\x46\x44\xa5\x06\xd7\xce\xbe\x11\xe5\x50\xe9\x89\x94\xc2\x17\x51\xc8\x18\xd5\x62\x18\x48\x10\x51\x50\x11\xa1\x93\xca\xcc\x32\x92\x84\x68\x04\x55\x60\x24\x0b\x29\x75\x9e\x51\xac\x12\xe5\x0d\x51\x30\x04\xd1\x04\x0a\x4a\x3c\x6b\xc9\x47\x63\xbd\x28\x76\x5f\x3c\x8b\x54\x38\x01\x8d\x61\x11\xa3\x85\xd3\x6b\x18\xe3\xa6\xaf\xfc\x22\x16\x02\xe3\x1b\xa9\x7a\xe5\x81\x12\x40\x1a\xe5\x10\x84\x00\x87\xa4\x9e\x71\xd7\xe7\xae\xe7\x89\xd9\x12\x46\x48\x78\x7d\x93\xe7\x2a\x07\xa6\xa7\x62\x11\x31\x93\xb6\x72\x99\x54\x2e\x93\xce\x65\x53\x02\x0b\xdb\xf2\x99\x52\x21\x7b\xc3\xb6\xb5\x9d\xed\x05\xcb\x34\x5d\xcf\x3f\x7c\xfc\xcc\xb6\x0d\x2b\xcf\x5d\x1a\x3f\x73\x61\xf4\xec\xc5\xd1\xc3\x27\xce\xfe\xd2\xc7\x7f\xf4\xdb\x4f\x1d\xb9\x73\xcf\xa6\xe1\x25\xdd\x29\xcb\x00\x44\xc7\xa7\xa7\x9e\xd8\x7b\xf4\x2b\xdf\x7a\xae\xb7\xb3\xe3\x47\xef\xbd\xf1\x8e\xdd\xeb\x30\xc6\x29\xcb\x74\x5d\xef\xe9\x7d\x2f\x59\x96\xb1\x61\xd5\x50\x26\x63\x71\xce\x39\xe2\x9f\xff\xa7\xef\x5c\x18\x99\x2c\x16\x72\x94\x52\xd7\xf3\xc5\x34\x8e\x35\x27\xd8\xe9\xef\xa0\xee\x8d\xd0\xb9\x86\x18\x66\x6f\x6f\x4f\xb1\xd8\x06\x01\x0a\x62\x42\x08\xa5\xb4\x5a\xad\xaa\xbe\xaa\x77\xe6\x96\x8d\xb6\x18\x5e\xbb\xb0\x08\x84\xaf\x5a\x10\x5b\xd1\xd5\x4f\xc6\xd8\xa5\x4b\x23\xfd\xfd\x7d\x85\x7c\x1e\x01\xa2\x8c\x4a\x1e\x12\xf1\x23\x6a\xcf\x8e\xee\xff\xb7\x3f\x9b\x9b\x9e\x5a\xb6\xa4\x1b\x63\x4c\x88\xd1\x68\xba\xdf\x7e\xea\xd8\xce\x4d\x2b\x38\xa7\x13\xd3\x33\xb6\xe3\xb6\xe5\xd3\x1c\xd8\x77\x9e\x3e\xf8\xd5\x6f\xbf\xb0\x76\xf9\x92\x5f\xfe\xf8\x0f\x2e\xed\xef\xac\xd7\x6d\xce\x01\x63\x04\x00\x0f\x3f\xb1\xef\xa1\x47\x9f\xff\xcc\x7f\xf8\xf1\x9e\xae\x0e\x91\xf8\xb1\x53\xe7\x07\x7a\xbb\xa6\xe7\x6a\x75\x87\x3e\x77\xe8\xe4\xec\x5c\xbd\xa2\xbc\x57\xdb\x6e\xd3\x71\x5d\xd7\x73\x5c\xdf\xa7\x8c\x71\x10\x6a\x4f\x89\x55\x2c\x58\xe4\xf3\x29\x65\x34\xd8\x63\x06\x00\xa1\x6c\x0d\x0f\xd2\x03\xa9\x23\xd3\xe1\x43\xc8\x75\xc6\x24\xbe\x61\x4c\x0c\xc3\x34\xad\x4c\x36\x65\x59\x16\x21\x06\x04\x80\x25\x24\x32\x83\x18\x64\xcd\x73\x02\x8e\xcc\x41\xdd\x8a\xe8\x39\x43\x10\x8b\x9e\x06\xa7\x4b\x78\xc5\xf7\x38\xe2\x48\x18\xc3\x04\xde\xcd\x54\x9c\x50\xd5\x27\x29\x0e\x0f\x35\xb1\x3c\x54\x82\xca\x08\x52\xd7\x17\x14\x32\xac\x85\x98\x12\x44\x1b\x2e\x98\x3e\xc0\x15\xb9\x60\x00\x82\xd2\x8b\x7b\x4c\xfd\x38\x4f\x13\x45\x5a\x43\x6f\x27\xd5\x14\x10\x24\x25\x2a\xa0\xbf\xdf\x9a\x83\x44\xb1\x36\x1e\x47\xa7\xce\xfa\xec\x22\xac\x6a\xe4\x2d\x3d\x4e\x3c\x0b\xa5\x52\x06\x10\x80\x28\x3e\x36\x97\x6d\x8b\x08\x32\xa2\xeb\xbe\x3e\xe5\x9e\xef\x37\x1c\x0f\x01\xc7\x08\x19\x06\x49\x99\xa6\x65\x19\x69\xcb\x10\x26\xa6\xd9\xb4\x95\x15\xbc\x30\x9b\x6e\xcb\xa7\xdb\xf2\xd9\x89\xd9\x6a\x7b\x21\xd7\xdb\x55\xec\x6c\x6f\x5b\x31\xd4\x8f\x10\xba\xe7\x8e\x5d\x00\x70\xe4\xc4\xd9\xed\x1b\x57\x4d\xce\xd4\x8e\x9e\x3c\x37\x3e\x3d\xdd\x51\xcc\x21\x84\x18\x67\x73\xd5\xe6\xf4\x5c\xd3\xf7\xd9\xe9\xf3\x63\xff\xf5\xcf\xbe\x5a\xa9\xd9\x3f\xf4\xf6\x1d\x1c\x60\xdf\x91\x93\xff\xe7\x1f\x1e\x00\x40\xdd\xe5\xd2\xaf\xfc\xec\x7b\xcb\xa5\x02\x07\x7e\xf7\x6d\x3b\x6e\xd9\xb9\xa1\xb7\xbb\xe4\x53\x96\x4e\x99\xb6\xed\x4c\xcf\xd5\x7a\xbb\x4a\xc0\x29\x1f\x3b\x60\xb5\x75\x2f\x5d\xb9\x33\x95\x4a\x05\xeb\x82\x18\x13\x4c\x7c\xdf\xaf\x54\x6b\x8c\x31\x5d\x68\x2c\x92\xc2\xd7\x2b\x2c\x02\xe1\xab\x16\x10\x42\x62\x96\x07\x52\x1c\x0b\x2c\xec\xed\xe9\x29\x95\x8a\x08\x21\x9f\xfa\xca\xf7\xa5\xb8\x68\xcc\x4e\x9c\x7b\xec\x6f\x99\xdb\x70\x3d\x1f\x63\xe1\xc8\x98\x70\x0e\xa7\xce\x8f\x8c\x4f\x4f\xa7\x2c\x22\x96\xf7\x5c\x97\xce\x56\x9b\x8d\x86\xef\xf9\xec\xc0\xb1\x73\x9f\xf9\x83\x7f\xdc\xbd\x71\xe0\xc5\x23\x2f\x0f\xf4\x74\xbe\xff\xfe\x3b\x37\xaf\x5b\x7e\xeb\xae\x4d\xcb\x97\xf6\x95\x4b\x45\x8c\xf0\x6c\xa5\xe6\xf9\xec\xc2\xe5\xe9\x8b\xa3\xb3\x13\x33\x95\x99\xb9\xc6\x5c\xad\x51\xad\x8b\x23\x6d\x9d\xa6\xed\xf9\x8c\x1b\x56\xda\xb4\x52\x24\x9d\x33\x11\x96\xcc\x2f\x60\x75\xc0\x41\x9e\xf5\xc3\x38\xe7\xbe\xef\x0b\x77\xf8\x41\xa0\x54\xe3\x89\x5c\x2d\xd6\x05\xc8\x18\xb8\xe9\x12\xb4\xd6\x90\x67\xb7\x63\x1c\x00\x7f\x5c\x7a\x07\x4c\x0f\xc5\x85\xa6\x02\x27\xa5\x76\x0c\x08\x1c\xe7\x08\x2b\x0c\xd0\xc4\x07\x92\xa7\xea\xc5\x49\x58\xc4\xe2\x00\x21\x85\x3b\xc1\x2f\xd0\xe6\xe0\x31\x79\x84\x10\x56\x72\x3b\x40\x96\x60\x47\x42\xe0\xf4\x0c\xc9\xa2\x71\x1e\x96\x50\x52\x44\x2e\xcb\xa7\xb6\xb4\x23\x2e\x41\x20\x6c\x6e\x35\x71\x90\x6d\xc1\x95\x41\xac\x72\xad\xa7\xec\x37\x65\x73\x40\xb2\x1d\x17\x14\x9d\x7a\xe4\x70\x3e\x11\x8b\xd3\xea\xc5\x38\xe9\x4c\x3c\x0e\xfe\xd5\x9e\xf2\x58\x64\xa4\xcf\x56\xe2\x71\x44\xe1\xc2\xf4\x82\x2a\x06\x15\x45\xb1\xf4\xa5\xe9\x2b\x07\xc0\x80\xb8\x5c\x7a\x13\x4d\xe9\x7a\xd4\x71\x7d\xdc\x40\xc1\x66\xc4\x94\x99\x49\x99\x99\xb4\x95\xcd\x58\x95\x4c\x6a\xae\x96\x29\xe4\x1a\xc5\x6a\xa6\x92\x6f\xcc\x56\x1b\xe5\x52\x75\xb0\xaf\x0c\x00\xd9\x4c\xfa\xdd\xef\xb8\xf5\xdd\xef\xb8\x95\x03\x3f\x74\xec\x1c\xa7\xfe\xc4\xe4\xf4\xc4\xd4\x34\xc1\x88\x52\xee\xf9\xcc\xf5\x18\x67\x20\x5c\xa0\x7d\xe3\xd1\xfd\xf7\xbd\x75\x3b\xc1\x68\xed\x8a\xc1\xa1\x25\xbd\x63\x13\x33\x84\x60\xea\x53\x01\xef\x7d\x3d\x1d\x3c\x1c\x36\xec\xe4\xd9\xcb\x5f\x7e\xf0\xa9\x9f\x7c\xdf\xdb\xfb\xba\x3b\x4a\x43\x9b\x7b\xd6\x6d\x55\x3b\x82\x0c\x62\x20\x84\x5c\xd7\xab\xd5\xeb\xdf\xd3\x77\x5c\x0c\xaf\x69\x58\x04\xc2\x57\x2d\x08\x20\xd4\xdd\x23\x89\x8e\x3e\x36\x3e\xee\xba\x6e\x57\x77\x97\x69\x9a\xbe\xef\x4b\xb9\x07\x08\xc1\xd4\x89\x67\x98\x53\xbb\x30\x32\xf9\xaf\xdf\x7a\xf6\x67\x3f\x70\xef\x60\x7f\x17\xc6\xb8\x90\xcf\x6e\x5a\xd9\x7f\xe6\xe2\x98\x4d\x3d\x17\x23\xce\x39\x63\x1c\x73\x96\xb1\x88\x81\x11\xe7\x70\x79\x6c\xe6\x44\x0e\xd5\x1b\xf6\xf1\xd3\x17\xbf\xf0\xaf\x0f\x6f\x59\xb7\x22\x97\x4d\xaf\x5d\xb1\x94\x10\x52\x6f\xd8\xfb\x0e\x9f\x9a\xa9\xd4\x1b\xb6\x2f\x0e\x42\xaa\x54\xeb\xf2\x24\x23\x97\x23\x5c\x28\x76\x64\xb3\x59\x00\xc4\x38\xf7\x28\xe7\x9c\xea\xb0\x22\x79\x1a\xc2\x04\x01\x60\x0e\x40\x0c\x23\x05\x11\x91\x14\xd6\xae\x15\xb0\xc5\x07\xb2\x9a\xc4\x6b\x84\x4c\x8f\x2c\xed\x37\x04\x39\x0b\xa4\x20\x57\x1b\x02\x83\x09\xb2\x6c\xdf\xa8\x06\x49\x24\xcf\x75\x3e\xa1\x6c\xf9\x95\x77\x6d\x0d\xe4\xb8\xf6\x34\xdc\x4f\xa0\x15\x9b\x47\xa6\xe4\x0a\x05\x03\x4f\x31\x3c\xd0\x84\x6a\x86\x3a\x28\xe0\xf7\x11\x72\xaa\x16\xdf\x82\x45\x35\x95\x63\x50\x18\xc9\x9a\xe3\x8c\x90\xeb\xa0\xa2\x13\x20\x8d\x09\xc1\x3c\x61\x61\x0d\xe4\xf7\x1a\x6d\x81\xc8\xfa\xba\xab\x2c\xde\x95\xe3\x5c\x21\x48\x78\xd6\x29\x63\x0b\xb5\x30\x68\xdf\x56\x7b\x55\xf8\xef\x11\x13\x90\xa6\xeb\xd9\xae\x6b\xda\x46\xc3\x32\xd2\x29\x33\xd3\xb4\x1a\x69\xa7\xde\x74\x6a\x8d\x74\xad\xee\x54\xeb\x4e\xad\xe9\xd4\x9b\x4e\xb5\xde\xec\xef\xee\x58\xda\x5f\x36\x08\x01\x00\x4a\x59\xca\x24\xf7\xdd\xb9\xe3\xe9\xbd\x2f\x31\xce\x10\x02\x61\xc9\xcb\x18\x07\x40\x94\x32\xc7\xa7\x03\xdd\x25\x42\x30\x02\x28\x97\xda\x7e\xfb\x53\x1f\xaa\x37\x9a\xe7\x2e\x8d\x97\xdb\xdb\x7c\x9f\xfe\xfd\xbf\x3c\x72\xe6\xc2\xe8\xfa\xd5\x4b\xdf\x7a\xd3\x96\x4c\xda\xe2\x9c\x6f\x58\xbd\x74\xe5\xb2\xde\x6c\xb1\xb3\x67\xcb\xdd\x6d\x03\x6b\x85\x37\x6d\x84\x90\x41\x0c\x40\xc8\x71\xdc\x5a\xad\xc6\xa3\xca\xfc\x24\x2f\x5c\x0c\xd7\x32\x2c\x02\x21\xf0\x68\xa8\x54\x2a\x6a\x49\x4f\x52\x1c\x4c\x08\x21\x84\x5c\xd1\x13\xae\x70\x41\x05\x51\x15\x07\xe7\x7c\x66\x76\xd6\xf5\xdc\xde\xde\x5e\xc3\x30\x85\x7f\x66\x00\xc4\x39\xef\xdf\x7e\x4f\x3a\x5f\xda\x91\x7a\x6a\xdb\x86\x15\x96\x69\x62\x4c\x10\xc2\x29\x0b\x7f\xe2\x83\xef\xf8\xdf\x5f\x78\x68\x62\xaa\x22\xa5\xa2\x70\x50\x09\x9c\x83\xeb\xd1\x72\xb9\xfd\xb7\x7e\xe1\xbd\x2f\xbd\x7c\xd6\xa7\x74\xed\xca\xa5\x22\x1b\x8c\xf1\xd4\x4c\xe5\xec\xc8\xe4\x4c\xd5\x1e\x9b\xaa\x4d\xcd\x56\x67\xe6\x6a\x73\xd5\x46\xa5\xd6\xac\x35\x9c\x46\xd3\x29\x14\xdb\xcb\x5d\x5d\x08\x63\x61\x3d\xa7\x15\x52\x53\x82\x09\xf9\x2b\xe4\x3e\xe7\x08\x38\xa0\xa8\x0f\x14\xae\x6f\x52\x43\x11\x6c\x4c\x18\x7c\xcb\xe1\x2d\x15\x7e\x1a\x8c\x45\x58\x1d\x97\x8b\x44\x72\xfc\x63\x14\xe4\xa3\x74\xc8\x8a\x0b\x69\x18\x84\x24\x04\x06\x4f\x14\xd4\x0a\x62\x86\x02\x43\x8f\x88\x35\x28\x0f\xf8\x67\xa4\xdc\xe2\x14\x07\x01\x9c\x02\xd5\x58\xd2\x3f\x88\xb4\x03\x41\x4a\x17\x1a\x32\x35\xf9\x0f\x42\xc1\xae\x79\xc4\x15\x66\x82\xbe\x92\x1a\xae\x0b\x4a\xe6\x18\xd5\x8b\x2e\x2c\xff\x5a\x3f\x4f\xac\x0e\x5e\xf9\x95\x56\x61\x61\x2e\x72\xf5\xcb\x57\x0b\xab\x6d\x5b\xe7\x12\xc5\x54\xfd\xe5\x68\x7c\x35\x35\x4a\xa4\x2f\x6f\x60\x84\x39\xe7\x8e\xeb\xbb\xae\x67\x3b\x9e\xed\x78\x4d\xc7\xcb\x3a\xc1\x06\xd6\xa6\xe3\x34\x1d\x57\x5c\xdb\x8e\x57\x6f\xd8\x2b\x86\x7a\xb3\x69\xab\xd1\xb0\xff\xe4\x73\x5f\xb9\x69\xe7\xc6\x9f\xfe\xc0\x3d\x8f\x3d\x73\xe8\xec\xc5\x31\xe1\xb9\x0d\x00\x0c\x42\x3a\xcb\xc5\xb5\xab\x96\xde\x7d\xfb\x76\x2c\xab\x66\x1a\xc4\xa7\xec\xef\xbe\xf2\x9d\x77\xdc\xb1\x73\xc7\xa6\x95\x07\x8f\x9d\x9e\x9a\xa9\x9e\xbd\x38\x56\xaf\x37\xdf\xfb\x83\xb7\x30\xc6\x39\x40\xef\xfa\xdb\x3a\xd7\xdf\x6a\xa6\xb2\xe2\x15\x21\x42\x18\xe3\x8e\x6d\xb3\xd0\xb5\x42\x44\x4a\xb4\x04\xc5\xc5\x70\x6d\xc2\xbf\xd3\xed\x13\x9c\x73\xe1\xe8\x1d\xa4\x11\xb3\x3a\x97\x46\xef\x9d\x20\x3b\xab\xd4\x0b\x52\x61\x8a\x62\x59\x96\x65\x59\x95\x4a\x25\x96\xec\xe4\xe4\xa4\x98\xeb\x81\x92\xd4\x5a\x30\x0c\xa3\xbb\xbb\x3b\x9f\xcf\x71\xce\x29\xf5\xa5\x1b\x36\xee\x37\xab\x33\xc7\x1e\x6f\x8e\x1e\x13\x2a\xc4\xd9\x4a\xbd\xab\x5c\xf2\x3c\xba\xef\xd0\xc9\x97\xcf\x8c\x54\xaa\x75\xdf\xa7\x18\xe3\x54\xca\x2c\xb5\xe5\x96\x0f\xf5\xdf\xb0\x65\x75\xe0\xc9\x4c\x4e\xa1\x11\xa0\xd9\x4a\xfd\xec\xa5\xc9\xd3\x17\xc6\xc6\xa6\x2a\x13\xd3\x95\xe9\xd9\xea\x6c\xa5\x5e\xa9\x35\xab\x35\xbb\xd1\x74\x4a\xe5\x72\x4f\x5f\x1f\x68\xab\x62\x5c\x4a\x14\x41\x05\x35\x84\x01\x00\x00\x16\xca\x26\x91\x11\x0f\x8d\x3a\xe3\x72\x28\x54\xe8\xc9\xdf\x31\x2d\x65\xac\x8f\x25\x39\x50\x8b\x68\x5a\x5a\xf3\x49\x5f\xae\xfd\x2f\x28\x86\xd4\x5c\x46\x9d\xb4\x44\xc1\x86\xeb\x49\x4b\x75\xa6\x96\x3b\x63\x4c\xa2\x9b\xe2\x94\x5a\x22\x2a\xdd\xa8\x1d\xaa\xd0\x8c\xc5\x6a\xa1\x58\x9f\x28\x6d\x84\x05\xce\x83\x82\x5c\xa9\x8b\xb9\xe2\x48\x10\x5c\xb4\x6a\xc6\xab\x0a\xd1\xf5\x3c\x05\xdb\x49\x71\xcb\x5b\xbc\x71\x95\x09\x47\x4a\xd5\xf2\xf5\xab\xc4\x5a\xad\x10\xf3\x96\x2f\x42\x0a\xb5\x03\xb1\xf5\x72\x88\xe5\xb7\xb4\x65\xa6\xd3\x66\x36\x9d\xca\x65\xac\x7c\x36\x9d\xcf\xa7\xdb\x72\x99\xf6\x42\xb6\x54\xcc\x77\x94\xf2\x5d\x1d\x85\xd5\xcb\xfa\xdb\xf2\x19\x4a\x19\x42\x20\x56\x07\x7d\x9f\xfa\x3e\x15\xfe\xbe\x11\x06\xe1\xb9\x46\xa8\x3d\x8f\x9c\x38\x7b\x71\x74\xf2\x8e\x3d\x9b\x1d\xc7\xfd\xf2\x83\x4f\x70\xce\x77\x6f\x5d\xe3\xf9\xf4\xf9\x03\xc7\x31\x46\x3b\x37\xaf\xea\xef\xe9\x48\x75\x0c\xf5\x6f\xbf\x27\x5d\xec\x06\x08\xad\x43\x11\x42\x9e\xe7\xb9\xae\x2b\x9d\xc8\xd8\x0b\x34\x05\x00\x64\x32\x19\xd5\x20\xd7\xad\x14\x7d\x33\xa5\xfc\xef\x88\x11\x8a\x21\x2a\xd6\xf0\x10\x42\xe2\x08\x72\x01\x81\x0a\xab\x54\x64\xa4\x6d\x85\x8e\x51\x46\x4a\x69\xb3\xd9\x54\xe6\x5e\xc2\x46\x46\xbc\xab\xce\xe5\x51\x89\xe8\x3f\x29\xa5\xa3\xa3\xa3\x85\x42\xa1\xb3\xb3\x6c\x1a\x26\x63\xcc\xa7\x3e\x00\x32\x32\x85\xae\x6d\xf7\x7a\xd5\xdd\xb3\xc7\x1e\x3d\x75\xe4\xc5\xdf\xf9\xa3\xbf\xf9\xd8\xfb\x7f\xe0\xf6\xdd\x5b\x6e\xd9\xb5\xf1\xd6\xdd\x1b\x01\x60\xae\x52\x6f\x2f\x16\xc4\x5a\x05\x00\xcc\x56\x6a\x18\x63\xcb\x34\x00\xc1\x81\x97\x4e\xfd\xfe\x5f\xfc\xe3\x2f\x7e\xf4\x87\x0b\xf9\xc2\xd8\xe4\xec\x5c\xb5\x31\x57\xa9\x57\x6a\x01\x04\x56\x6b\x76\xbd\x61\x23\x42\xba\x7a\x7a\x10\x12\xeb\x4e\x08\x00\x09\x13\x15\x5d\x19\xa7\x16\xb4\x20\xc4\x06\xa9\xa3\x12\xef\x68\xc4\x31\x86\x5e\xe1\x72\x8e\x94\xb0\xe1\xdf\x96\x6a\x1f\x69\x2a\x13\x53\x82\xe9\x2a\xb5\x08\x39\x50\x34\x4f\x3f\x86\x42\x13\x8a\x89\xbf\x71\x44\xd5\xbf\xa3\x36\xef\x06\xc1\x7e\x15\x44\xf1\x48\x6e\x7a\x01\x40\x29\x82\x75\x29\xad\x8a\x07\x01\x0a\xf2\xc4\x33\xb5\xe8\x25\xc0\x4f\xe1\x33\x70\x99\xab\x0e\xcc\x7a\x23\xc9\xfc\xd5\x53\xce\x19\x43\x9a\x6d\xaa\xae\x3e\x8d\x85\xf8\x5d\xcd\xfb\x4b\x0c\xa5\xe7\x83\xa6\xb0\x6a\xd1\x80\xa2\xf7\xe7\x03\xe3\x85\x41\x7a\x01\x44\x8c\xc3\x61\x2c\x62\xab\x54\x19\xb4\x72\x51\xcd\x41\xe8\xff\x1b\x4d\xc7\xf3\x7d\xcf\xf3\x3d\xdf\x17\xbb\x77\x7c\x9f\xfa\x94\xfa\xc1\xee\x58\xc6\x18\x5f\x33\xdc\x5f\x2c\x64\x41\xf6\x55\x42\xf0\x9f\xff\xdd\xd7\x3a\x4a\x85\xf7\xbd\xf3\x2d\x8c\x71\x9f\xfa\xaa\xa3\x52\xc6\x4e\x9e\xbd\xb4\x63\xe3\xca\x0b\x23\xe3\x0f\x3d\xfa\x02\x07\xf8\xce\x13\xfb\x3f\xf9\xd1\xfb\x7e\xe8\x1d\x37\x72\xce\x53\xa5\xfe\x9e\x4d\x6f\xcb\xf7\x0c\xab\x52\x10\x42\x08\x26\x8c\xf3\x7a\xbd\x01\x00\x18\x93\x05\xea\x1e\x29\xfe\x22\x2f\xbc\xb6\xe1\xdf\x05\x10\x2a\xfe\x27\x70\x6b\x01\xfc\xd3\x5f\x01\x7d\xc5\x3e\x3c\x15\x36\x48\x44\x10\x44\x4a\xa9\xb0\x25\x11\xba\xd3\x18\x10\xb6\xec\xcd\xb5\x5a\xcd\x71\xec\x8e\x8e\x72\x21\x9f\xb3\x70\x8a\x32\x5f\x60\xb3\x91\x2f\x77\xee\x7c\x77\x71\xd5\xcd\x9f\xdf\xb8\x03\xea\xe3\x42\x05\xb7\xff\xe8\x49\x04\xe8\x8f\xfe\xf2\x4b\xef\x7b\xe7\x5b\xe6\x2a\xf5\x5b\x77\x6f\x1e\xec\xeb\xfa\xc3\xbf\xfc\x12\xc1\xf8\x3f\x7f\xea\xc3\x00\xb0\x69\xcd\xf2\xff\xf6\xab\x1f\x27\x98\x5c\x9e\x9c\x6b\x3a\xae\xed\x78\x8e\xe7\x39\x8e\xe7\x38\x9e\xe3\xfa\xae\xe7\x53\xc6\xda\xdb\xdb\x89\x61\x4a\x03\x4f\x10\x74\x46\x95\x4d\x11\x3e\x08\x44\xba\xa4\xb3\xb2\xfc\x8a\xda\xc2\x3c\x02\x2e\xc4\x27\x95\xa0\xd6\x86\x2a\x0e\x48\x14\x44\x9a\x74\x97\xaf\x83\x06\x1d\x22\xa9\x30\x92\x7a\xa6\x61\x46\x74\xb9\x0e\x40\x58\xd5\x87\x5e\x5a\x62\x91\x15\x01\x45\xfa\x4b\x08\xe4\xb2\x5f\xa8\x68\x05\x50\x8c\x4c\x6f\x07\xbd\xda\x28\xa8\x69\xb0\xcb\x4d\x63\x99\x92\xa5\x73\x0e\xa1\x63\xeb\x10\x05\x25\xfa\x71\xe5\x66\x61\x01\xae\x9b\xb8\xc3\xd5\x03\xde\x0a\x00\x83\xe7\xf2\x63\xc4\x54\x8a\xb1\xf8\xaa\x75\x17\xc0\x2b\x04\xf3\x7c\x6e\x88\x7f\x68\x95\x4b\x3c\xda\x3c\x21\x12\xb3\x95\xd1\x0d\xc4\xe0\x30\x7c\x33\x51\x1e\xc9\xcb\x23\x6f\x81\x3e\xbd\x02\xc7\xf3\x28\xa5\x94\x8a\x6d\x3c\x8c\x05\x46\x2d\x9c\x0b\xfb\x54\x04\x08\xc1\xda\xe5\x03\x85\x5c\x06\x10\x20\x8e\x30\xc2\x77\xde\xb4\x5d\xec\xac\xff\xeb\x7f\x7a\xf0\x9b\x8f\xed\x1d\x1e\xec\x7d\xcf\x0f\xdc\xb6\x61\xf5\xd0\xfa\x55\x43\x6b\x96\x0f\x30\xc6\x86\x97\xf6\xde\xbe\x67\xd3\xc9\xb3\x23\x6d\xf9\x6c\x21\x97\x21\xb9\xae\xee\x0d\x6f\x29\x2e\x59\x1d\xa8\xc5\x11\x08\xdb\x37\x00\xe4\x38\x8e\xed\x38\xa6\x69\xaa\x21\x90\xfc\xee\x0b\xeb\x93\x17\xc3\x35\x08\x6f\x72\x20\xf4\x7d\xdf\x75\x5d\x05\x54\x0a\xff\xc4\x50\x48\xa2\xa0\xbe\x8e\xa5\x82\xae\xc2\xd2\xbb\x6c\x70\x28\x0d\xc6\x02\x11\x1d\xc7\xb9\xca\x52\x51\xca\x84\x12\xb5\xa3\xa3\x3d\x95\x4a\x61\x4c\xc4\x0c\x95\x73\xb0\x4a\xbd\xe5\x1d\xef\xf2\xab\xe3\xf6\x85\x03\x74\xf6\xe2\xf6\x8d\xab\x11\x82\xff\xfd\x3f\x3e\x0d\x00\x5f\xfc\xda\x23\xa3\x13\xd3\x43\x03\x3d\x9f\xf9\xc4\x07\xb0\xdc\x45\x4e\x08\x1e\xec\xeb\x9a\x99\xab\x71\xb1\x8c\xc8\x15\xdb\x00\xce\x39\xe3\x1c\x10\x32\xe4\x20\xd4\x4c\x1a\x01\x27\x2a\xce\xe5\x42\x24\x0a\xf7\x03\xa0\x96\x0d\xa2\x37\x42\x24\x82\xa0\x38\x51\x21\x28\xb3\x46\xfa\xe8\x47\x71\x69\x08\x81\x3a\x33\x2e\x0e\x10\xc8\x04\x85\x9b\x51\x08\xf0\x07\x40\x83\x8b\xb0\x74\x3a\xa7\xd7\x90\x46\x96\x4b\xe4\x12\x44\x08\x67\x05\x61\xa5\xe4\xa2\x9e\xae\xdc\x0e\x31\x23\xb0\xcc\xe0\xc1\x8a\x02\x92\x45\x56\xc5\x0e\xb0\x48\x25\x1b\x12\x3f\xae\x0a\xd1\x0a\x05\xaf\x82\x57\x85\x54\x32\x6c\xbe\x44\x13\xca\xa4\xc2\x5d\x1f\x41\x95\x93\xb8\x7a\x85\x10\xac\xa5\xca\x45\x55\xae\x2c\x73\x45\x7a\x8c\xab\xf6\x88\x59\x36\x69\x59\x20\x50\x67\x62\x68\x38\x87\xa2\x3f\x21\xa6\x57\xd7\x4a\xa0\xd7\xab\x25\x4e\xcc\x57\x8b\x24\x06\x7b\x3e\x65\xcc\x91\xe8\xc7\x15\x70\x62\x84\xc4\x19\x52\xa7\xce\x8f\xae\x5b\xbe\x24\x95\x32\x45\x4d\xd7\xaf\x1a\x12\x5e\x63\x6a\xb5\x86\xe7\xf9\x27\x4e\x5f\xfc\xdb\xaf\x7c\xe7\x77\xfe\xe3\x87\x00\xb8\x38\x81\x99\x73\xf6\x9e\x7b\x6f\xe6\x80\xb2\xe5\xc1\xf2\xea\x9b\xf2\x7d\x2b\x91\x5c\x4d\x17\x9b\xa0\x10\x42\xbe\xef\x37\x1a\x4d\xa1\x7c\xd2\x17\x4a\x78\x62\x39\x30\x79\xb1\x48\x07\xaf\x71\x78\x73\x1e\xc3\x24\x7a\xbc\xe0\x6a\x6a\x09\x10\x12\x38\xa7\x77\xca\x96\xd4\x10\x69\x4b\x86\x3a\x1c\xc6\x32\x12\x81\x31\xe6\xba\xee\xd8\xd8\x98\xfe\x0a\x6a\x15\x74\x32\x9a\xcf\xe7\x8a\xc5\xa2\xf0\x4a\x23\xe0\x50\xc9\x2f\x5a\x9f\x71\x2e\x1f\xa5\x93\xa7\x11\xf3\x54\xd9\x1e\x78\xf8\x99\x07\x1f\x7d\x7e\x78\x69\xdf\xbb\xee\xba\x79\x78\xb0\x8f\x03\x77\x1c\x8f\x10\x32\x36\x39\xfb\xcd\xc7\xf7\x51\x86\xc6\xa6\xab\x13\x53\x73\x53\x33\xd5\x99\x4a\xa3\x52\x6b\xda\x8e\x5b\xea\x28\x0f\x0e\x0d\x81\x26\x7c\x51\x8b\x49\xa8\x40\xc1\x78\xf5\x63\x95\x55\x37\xe7\x9b\xc0\x4a\x5e\x25\xc4\x5f\xd8\x0e\xc9\xd6\xe3\x4a\x1e\x69\x04\x31\x94\xa7\x3c\x2e\xc0\xb9\x46\x89\xd4\x2d\x48\x54\x44\xcf\x48\x09\x3e\x15\x41\x8f\xa8\x71\x43\x91\x19\xf0\xd8\xd2\x62\x54\x31\xae\x97\x53\xe5\xa5\xa7\x1f\x81\x36\xe0\xc0\x41\x08\x53\x59\x59\x00\xce\x95\xa7\xe6\x48\x6b\x48\x1c\x6d\xd9\xa8\x2d\xe0\xb0\x55\xb8\x22\xa5\xe0\xd1\x55\x5e\x5d\x59\x8a\xf4\x38\xdf\xaf\x04\xe6\xad\x10\xe8\x35\x0a\xf1\x32\x43\xbc\x5e\x2d\x5b\x83\x60\x9c\x49\xa7\x72\x59\x4b\x6c\xb4\x2f\x16\x32\xa5\xb6\x7c\xb9\x54\xe8\x6c\x2f\x74\x96\x0b\x4b\xba\x3b\x56\x2e\xeb\x6b\x34\xec\xbf\xfa\xc7\x07\xee\xba\xed\x86\x55\xcb\x06\x38\xe7\xb5\x46\xe3\xb9\xfd\xc7\x6c\xc7\x5d\xb1\xb4\xb7\xb7\xbb\x9d\x52\xe6\x53\xdf\xf7\x7d\xc0\x46\xa6\x6b\x79\xfb\xca\x1b\xda\x7a\x97\xab\xf4\x15\x04\x52\x4a\x1b\x8d\x26\x63\x4c\x9d\xb2\xa4\x8f\x1d\xb1\x58\xb8\x70\x05\xf5\x35\xc2\xc5\x70\x0d\xc2\xf7\xcc\x08\xaf\xff\x55\x50\xc6\x98\xe7\x79\x02\x02\x45\xe0\x9c\xab\x03\x66\xf5\xa0\xe3\x62\x4b\x38\x9c\x4f\x6b\x1a\x11\x8e\x9a\x58\x54\x33\xbe\x2b\x56\x41\x01\x70\xbd\xde\x68\x36\xed\x7c\x3e\x57\x28\x14\x0c\xc3\xd4\xe0\x10\x70\xb6\x94\x59\x71\x13\x1b\xdc\xea\x8e\x9f\xf2\xc7\x8e\x63\xaf\x86\x10\x3a\x76\xea\xfc\xd9\x8b\xa3\x67\x2f\x8e\xbe\x7c\xfa\xc2\x9f\x7e\xf6\x17\x11\x42\xa7\xce\x8d\xf4\x76\xb5\xf7\x75\xb5\xbf\x65\xcf\x96\x97\xcf\x8d\x32\x0e\xb6\xe3\x36\x6d\xb7\xe9\x78\xb6\xed\xba\x1e\x6a\x36\xea\xc2\x70\x40\xa2\x54\x60\x00\xa9\x95\xa4\x05\x97\x6b\x89\x82\xd0\x52\xc4\xc8\xf7\xc4\x5e\x42\x85\x2f\x01\x99\x68\xd9\x18\x92\x69\x45\x74\xce\x61\x54\x0d\x10\x35\xcb\x1b\x85\xe2\x61\xa4\x58\xfb\x6b\xbf\x23\xe5\xd4\x14\x68\x5c\xa9\x5e\x23\x34\x26\x04\x5e\xb5\x4d\x22\x9a\x08\x02\x00\x8c\x80\x49\xbd\xa3\xe4\x16\x2a\xfd\x80\x1a\x31\x1e\xc8\x66\xdd\x3a\x26\x60\x84\xad\xba\x8d\xca\x09\xa4\xce\x38\xd9\xc2\x31\x2c\x6c\x6d\x1e\x22\x3f\x25\xcc\x6f\x01\xa7\xd3\x48\x1e\xbb\x1f\x26\xd2\xf2\xd5\xab\x0a\xaf\xe0\xd5\x57\x94\x57\xcb\x7a\x71\x9d\x7e\x72\x00\x00\x4a\xa9\xe3\xb8\x18\x03\xc1\x98\x60\x6c\x18\xd8\x34\x8d\x94\x69\x0a\x83\x9a\xe9\xb9\xfa\xe4\x74\xa5\xbd\x98\xeb\xeb\x2e\x57\xaa\xf5\xbf\xf9\xca\xb7\x7c\xcf\xdf\xb3\x7d\xdd\x4d\x3b\xd6\x3f\xbd\xef\xe8\xe1\x13\x67\xdb\x4b\x39\xc6\x18\xb2\xb2\x6d\xcb\x36\x75\xae\xd8\x61\xe6\xda\x21\xd0\x3a\x23\x05\x81\x8c\xb1\x46\xa3\xe1\x79\xbe\x69\x9a\xc2\x7a\x60\xbe\xa9\xb3\xba\x93\x9c\x59\x22\x84\x8a\xc5\xa2\xf0\x54\x75\x9d\xd8\x92\xbc\xe9\x53\x7e\x53\xa9\x46\x05\x04\x0a\x07\xb8\xaa\x7b\xf9\xbe\x3f\x1f\x38\xe9\xe0\xa7\x43\xa0\xfa\xa9\xde\x52\x8f\xb8\xda\x36\xcb\x58\x4c\xae\x89\x9b\xe2\xd0\x89\x2b\x16\x55\x87\x19\xce\x79\xad\x56\x6f\x34\x9a\xb9\x5c\x2e\x9f\xcb\x99\x86\xc5\x39\x17\x6b\x87\x9c\x73\x92\xca\x65\x06\x37\xb1\xbe\x75\xce\xf4\x45\x3a\xf1\xf2\x4f\xbc\xf7\x07\xfb\xba\xcb\x4d\xdb\xdd\xb8\x66\x18\x63\x5c\x6f\xda\xab\x86\x97\x58\xa6\x01\x00\x83\x7d\x65\xc6\x18\x65\x62\x39\x44\x78\xf5\xf4\x3d\x9f\xda\xae\x5b\xad\x54\x0a\x6d\x6d\x62\x41\x84\x47\x6c\x41\xe4\xba\x85\x52\x72\x85\xb7\xc3\x5b\x0b\x41\xbb\x86\x82\xb1\x3b\xa1\xf2\x71\x1e\x32\x1d\x8a\x6c\x1e\xd9\x37\x07\x48\x2a\x18\x21\x3c\x50\x5e\xe2\x53\x70\x3a\x51\x6c\x0d\x2c\xae\x97\x8b\x32\x42\xf5\x9c\x07\x1a\xcd\xb8\xdc\x89\x14\x2f\x58\x68\x63\x61\xbe\x51\x9e\x11\x30\x56\xce\x54\x55\x51\x98\xbe\x78\x3f\xe8\x27\xe1\x3b\x12\x33\xb9\x16\x2f\x01\x1c\xc1\xcd\x08\xce\xe9\xeb\xa0\x5c\x3b\xfa\x28\x6c\x16\xbd\xd1\x91\x9c\xd0\x84\xdc\x4e\x9b\x49\x70\xf1\x95\x10\x44\xef\xbf\xf1\xee\x5c\x35\xe0\x46\x9b\x99\x03\xb8\xbe\x8f\x1d\x61\x28\x40\x4c\xc3\xb0\x4c\x37\x65\x39\xe9\xa6\x95\x6d\x58\xf5\xac\x3d\x39\x53\x6b\x2f\xe6\x7e\xe4\x07\x6e\x3f\x76\xea\xfc\x97\x1f\x78\x0c\x00\xbe\xfe\xc8\xb3\xff\xf1\xe3\x3f\x8c\x10\x1f\x9f\xae\xa0\x42\x7f\xf7\x8a\x6d\xf9\xbe\xd5\xc4\x4c\xc9\xf1\x8b\x08\x26\x21\x0b\xb4\x1b\x9e\xe7\xab\x63\x75\xe7\x13\x3b\x3c\xe1\x59\x34\x76\xa7\xa5\x76\x6a\x31\xbc\xa6\xe1\x4d\x02\x84\x02\xf0\xc4\x51\x26\xa0\x24\x60\x6b\xe1\x0b\x10\xd5\x8e\xaa\x6e\x17\x43\x44\xfd\xa7\x4a\x8d\x25\x02\x8f\x06\xf5\xee\xc2\xc3\x95\x27\xec\x68\x38\xe7\xf5\x7a\xbd\xd9\x6c\x66\x32\x99\x5c\x2e\x67\x9a\xa6\x41\x4c\x09\x87\x80\x88\x91\xe9\x1e\x86\xee\xe1\xd4\xf0\x9e\xf7\xad\xde\xc3\xa6\xcf\x1a\x5e\x15\x21\xf4\x17\x7f\xf7\xb5\xd9\x4a\xed\xff\xfa\x0f\x1f\x34\x0c\x62\x18\x64\x68\xa0\x4b\x58\x26\x72\x04\x82\x62\x51\xc6\x59\xb5\x31\x39\x3e\x96\xcb\xe7\x31\xc6\x1c\x38\x8a\x70\x1d\x39\x39\x45\x6a\xd9\x8d\x03\x48\xdb\xc4\x84\x5d\xa2\x1a\xb1\x48\xd3\x2a\x0b\xf9\x14\xc6\x45\x10\x11\xde\xf3\xf3\x9b\x00\xd4\xf4\x08\x01\x31\x0b\x17\xfd\x42\x96\x26\x9f\x07\xe5\x44\xd1\x17\xd5\xcb\x0a\xae\x82\x4f\xa3\x8a\x13\xdf\x53\x18\xe0\x82\x76\x47\xa2\x18\xe2\x4c\x43\x41\x8d\x13\xf2\xd0\xec\x53\x32\x41\xed\xa6\x06\x42\x21\x17\x54\xbf\x01\x80\xa9\x23\x06\x15\xc9\xd5\xec\x94\xb8\xba\xa3\xb5\x54\xb4\x82\x48\x2b\x74\x84\x01\x05\xf8\x26\x12\xd3\xa3\x84\x71\x25\x26\x68\x15\xe2\xe1\xbd\x37\xda\x9d\xe0\x83\x26\x8d\xd1\x34\xc0\x9f\x27\x8e\xeb\xfb\x86\xeb\x39\x26\x71\x4c\xc3\x71\x3c\xdb\x71\xc5\xa1\x60\xb6\xed\x36\x9a\x76\xa5\xda\xe8\x28\x15\x86\x07\xfb\xee\x7b\xfb\x4d\x87\x8e\x9d\xce\x65\x53\xb9\x52\xe7\x96\xad\x37\xdd\xb5\x74\x53\xaa\xad\x53\x97\x1b\x04\x13\x42\x08\x20\xe4\xfb\x7e\xb3\x69\x53\x4a\x09\x21\x96\x65\x25\x19\x5e\x4b\x29\x94\xd4\x3c\x2d\x82\xdf\xeb\x18\xde\x0c\x40\x48\x29\x75\x5d\x57\x10\x41\x71\x27\xa6\x7c\x80\x44\x5f\x54\x21\x86\x7c\xb1\x3b\xca\x1c\x06\xc9\x85\x2e\x61\x2c\xaa\xfe\x8a\x8b\x18\xbd\xb8\x1a\x2c\x9c\xaf\xd3\x73\xce\x6d\xdb\x76\x1c\xc7\xb2\xac\x6c\x36\x9b\x4a\x59\x84\x18\x8c\x31\x69\x4d\xc3\x8d\x4c\xa1\xb0\x7c\x3b\x1d\xda\xe2\xcc\x8e\x7b\x93\xa7\x3f\xf2\x81\xf7\x30\xbb\x6a\x9a\xc6\xc1\x97\x4e\xb7\x97\x0a\x83\x7d\x5d\xcb\x06\xba\x11\x04\x56\x00\x62\x7f\xbf\xd8\x65\x38\x35\x31\xd1\xd9\xdd\xad\x24\xa8\x3e\x09\x05\x08\x69\x4e\xac\xc5\xe2\x55\x50\xf8\xc9\x18\xa8\xfd\xe3\xf2\x51\x98\x94\x82\x17\x0d\x6f\xf5\x34\x90\x76\xd6\xbc\x02\x5f\x45\x65\x54\x23\xe9\x65\x88\x30\x46\x71\x0c\x02\x48\xc1\xae\xd3\x27\x08\xbe\x93\x6c\xe7\x48\x45\x42\xbc\xd3\x84\x25\x44\x6b\x7a\xc5\x59\x14\x68\x44\x33\x1a\x41\x65\xaf\x45\xd0\x52\xe3\x9c\x27\xdb\x59\x36\x1d\x0a\x55\x78\x48\xd5\x2a\x52\x40\x04\x28\xf8\xa3\xc3\x82\x04\xbc\xf0\x9e\xaa\x57\x54\x85\x1a\xa2\x61\x94\xf9\x73\x2d\x1f\x40\xe8\x0d\x12\x27\x38\x6b\x98\xf3\x58\x1c\x5d\xd1\xd2\x3a\x0e\x63\x3c\x38\x23\x33\xf8\xcf\xb3\x5d\xcf\x75\x3d\xcf\xa3\xae\xef\xd7\x1b\x76\xb1\x2d\x07\xc0\xde\xfb\xae\xbb\x7e\xb4\x38\x90\xed\x5f\x97\x2d\x2f\x21\xa6\xa5\xbe\xbe\xd0\x82\x0a\x9b\x03\xd7\x75\x6d\xdb\x66\x8c\x1b\x86\xa1\x7b\xdb\x88\x4d\xb8\xe3\x63\x2d\xda\xb5\x62\xca\x21\x91\x05\x2c\x86\x6b\x1b\xde\xd8\x40\xc8\x39\xd7\x57\x9e\xf5\x1d\xcd\xba\x5c\xd3\xe3\xc7\x52\xd0\xc1\x4f\xff\xa9\x6e\x8a\x55\x46\x3d\x85\x24\x16\x82\x26\x3d\xf5\xae\xff\x4a\xa6\x78\xae\xeb\x7a\x9e\x67\x18\x46\x3a\x9d\x4a\xa7\xd3\xa6\x69\x71\xce\xc5\x96\x0d\xc6\x38\x21\x24\x5b\xee\xe3\x1d\xfd\xd9\xe5\xbb\xbc\xb9\x71\x3a\x7d\x76\xc3\xc6\x0c\xa1\xcd\xbf\xf9\xe7\x6f\x9e\x38\x7d\xf1\x37\x3e\xf1\xe3\x84\x04\xce\x3e\x0d\x82\x09\xc1\x84\xa0\xd9\xb9\x99\x4c\x36\x93\xcb\x17\x14\x89\xe0\x01\x97\x91\x06\x82\x7a\xc3\x02\x17\xab\x61\x52\xed\xa9\xa9\xdb\x84\x88\x47\xe1\xa6\x7b\xd1\x2e\x91\xd2\x47\x27\x22\x2d\xb0\x90\xb1\x28\x57\x44\x92\x0b\x86\xf1\xa5\x2c\x8c\x1e\xe3\x07\xda\xe1\xba\x12\x51\x14\x3f\x94\x9f\x9e\xe9\x85\x95\x75\xe0\x9a\x46\x54\x79\x9d\x01\xe0\xf1\x1e\x92\x00\xce\xf0\xdf\xa0\xc5\xa4\x47\x9b\x20\x6f\xf5\x06\x68\xef\xea\xe0\x17\x5e\x70\xad\x32\x3c\x4c\x58\x7e\x81\xa8\xc0\x0c\x35\x9a\x48\xe5\x27\x67\x7a\xb2\x82\x48\x4f\x4c\x5c\x85\x6c\x9a\x6b\x9f\x4f\xdf\x1a\x1a\x36\x7a\x90\x8d\xfc\x81\xe0\xdf\x47\x1c\x71\x2e\x98\x3c\x11\x8c\xf9\x94\xba\x3e\xf5\x7c\x6a\xfb\xdc\x49\x77\x39\xed\xab\x52\x1d\x83\xc5\x8e\x1e\x62\xa5\xd5\x2b\xd2\xe6\x2e\x58\xf6\x6b\x36\x9b\x8e\xe3\x22\x84\x0c\x43\xb8\x69\x6b\x61\x4f\xa7\x7f\xce\xe4\x44\x50\x5d\x47\x4a\xbe\x48\x0d\x5f\xa7\xf0\x06\x06\x42\xce\xb9\x3a\xd9\x19\x34\xfc\x4b\x42\xe0\x15\x26\xf8\x10\xf8\xd5\x55\xe8\xa5\x3a\xa2\x32\xb7\x89\xad\x11\x2a\x08\x4c\xaa\x46\x21\x31\x12\xe6\x2b\xfc\xd5\x74\x77\xdf\xf7\xeb\x75\xda\x68\x34\x2d\xcb\x4a\xa7\xd3\x96\x65\x11\x62\x32\xc6\x98\xdc\x7d\x48\x0c\xd3\xe8\x1c\x80\xce\x25\xcc\xf7\x9c\xd9\xb1\xbb\xdf\xdd\xb5\xe1\xc4\xc1\x74\x2a\x35\x34\xd0\x65\x59\x86\x65\xca\x63\xbe\x0d\x62\x10\x32\x3b\x31\x66\x18\x86\x95\x4a\x05\xe3\x53\x51\x16\x35\xd9\x4e\x34\x8e\x86\x4c\x9a\xe0\x16\x64\x23\xd1\x9e\xb1\xe1\x9d\x9c\x76\xf0\xd8\x8f\x10\xfc\x14\x51\x0a\xf9\x8c\x48\x41\x97\x1f\x10\x12\x49\xd0\x50\x0d\x10\x02\xce\xa2\xcc\x4f\x71\x8b\xe0\x87\x8e\x82\xe2\x0d\xe0\x00\xda\xd9\x1a\x3c\x38\x49\x4f\x2f\xb9\xd6\x06\x92\x94\x86\x78\xa6\x36\x4f\x08\x0a\x13\x79\xb7\x15\x0a\x72\xce\xe3\x02\x3b\xd1\x32\x61\x8f\xd0\x49\xb3\x02\x34\xa9\xeb\x8b\xb7\x64\x88\x76\x3c\x72\x0f\x49\x4e\xa5\x55\x4a\x7e\x23\xce\xc3\x2d\x9d\x01\x03\x45\xa1\x9a\xf6\x4d\x1e\x47\x9c\x1d\x2d\xff\xe3\xb9\x62\xe7\xf0\x96\x1d\x6b\xb7\xec\x58\xb6\x66\x43\xbe\xad\x28\x26\xbe\xaa\x31\x09\x21\x18\x07\x14\xd0\xf3\x3c\xdb\xb6\x7d\xdf\x57\x14\x30\xb2\x46\x10\x0d\xba\x1e\xb5\xe5\xe8\x50\xa2\x26\x96\xc2\x2b\x9c\x43\x2f\x86\xef\x23\xbc\x51\x81\x90\x31\xd6\x6c\x36\x19\x63\xbc\x95\xd0\x11\x71\x92\x17\xc9\x9b\xe2\xaf\x6e\x53\xaa\x77\x5f\xa5\x17\x55\x1b\x1e\x94\x50\x8b\x41\xa0\xfa\xd9\xd2\x4f\x5b\x32\x2c\xdc\xd1\x63\x03\x43\xf8\x64\x72\x1c\x07\x63\x9c\x49\xa7\x05\x41\x34\x0d\x60\x8c\xfa\x94\x32\x46\x01\x00\x1b\x66\xba\x3c\xb0\xac\x73\xc9\xd2\x1b\xee\xb6\x67\xc7\xd9\xcc\xf9\x2e\xf3\x62\xda\x32\x53\xa6\x99\xb6\x0c\xcb\x32\x2d\xd3\x30\x27\xe7\xe6\x26\xc7\x4b\x5d\xdd\x86\xa6\xea\xe1\x9c\x87\x2b\x4a\x0a\x8f\x40\xc3\xa6\x20\x9a\x2a\xb9\xfe\x33\xa4\x4d\xba\xc0\x4d\xb0\xc1\xb0\x62\xa0\x2d\xe3\x85\xb9\x48\xa9\xa5\x72\x54\xf9\x22\x0d\x0e\x75\xbf\x32\x3a\x58\x86\x6f\x29\x68\xd4\x57\x2c\x35\xec\x08\x8b\x1b\x95\x47\x0a\xc9\x22\xe0\x2d\xb1\x45\xe2\x22\xe7\x9c\x8b\xd5\x53\xae\xdd\xe7\x00\x9c\x0b\x07\x93\x01\x0a\x22\x00\x16\xc3\xd4\x16\xd3\x82\xd0\x16\x56\x91\x17\xae\xb5\x72\x18\x3d\x38\x33\x0a\x85\x64\x58\x94\x19\x01\x80\x26\x5e\x21\xd1\x36\x48\x5b\x8b\x14\x89\xca\x72\x08\xa8\x90\x98\xa1\x27\x03\xff\x2e\xe2\x70\x20\xc4\x5c\xbd\x71\xcb\xcd\x77\xdc\xb1\xeb\x96\x5b\x97\x0e\x2f\xcf\x66\xb3\xd1\xaf\x03\x44\x1c\x9e\x82\x09\x20\xa0\x94\x35\x1a\x0d\xd7\x75\x11\x42\xc9\x85\xc0\x18\xe0\x41\xab\x10\xd3\x7f\x26\xa7\x26\x6a\xc8\xcf\x07\xab\x8b\xe1\x35\x0d\x6f\x48\x20\xa4\x94\x36\x1a\x8d\x98\x4e\x32\x09\x84\xea\xa6\x7e\xad\x47\x4b\xa2\x66\x0c\x05\x75\xed\xa8\xb8\x00\xe9\x75\x70\xbe\xa0\x9b\x8c\x7e\xdf\x7d\x7a\xbe\xb7\x28\xa5\xb5\x7a\xbd\x56\xaf\x9b\xa6\x99\x4e\xa7\xd3\xe9\x94\xb0\x4f\x13\x3b\xfa\x03\x44\x24\x24\x5b\xee\x83\x72\x3f\x67\xcc\xaa\xce\xae\x19\x7c\x39\x75\xfc\x00\xdf\xbf\x2f\x6d\x19\x96\x65\x58\x13\x73\xb3\x33\x93\xf9\x52\x27\x22\x24\x10\x93\x08\x85\x4e\xc6\x13\x83\x53\xcf\x9d\x07\x67\x4b\x01\x48\x6d\x5d\x82\x98\x70\xce\x5b\x18\xf6\x87\xd6\xa7\x10\x72\xab\xe0\x54\x40\x95\xc8\xfc\x7c\x1d\x02\xf1\x15\xbb\xd7\xfa\xcb\x6a\x85\x12\x8b\x43\x3c\x52\x50\x9e\x78\x5d\x69\x25\xc3\x8e\x04\x20\x71\x5d\xcf\x23\xf8\x2f\xba\x97\x83\x73\x1e\xc1\x3c\x71\xad\x91\x42\x95\x76\xb4\x02\x61\x39\x42\x4e\x2c\xad\x55\x35\x68\x94\xad\x27\x3e\x87\x82\x3a\x45\xf5\x40\x5d\x28\x0b\x5d\x40\x28\x00\xd9\x78\x1f\x42\xea\x9f\xe0\x13\xf3\xf8\xa3\x37\x7f\x9c\xae\xae\xee\x1b\x6e\xbe\xe9\xb6\x3b\xdf\xba\xe7\xd6\x5b\x3b\xbb\x3a\x85\x2b\x28\x1d\x81\xc4\x12\xa0\x3a\x64\xdb\x76\x6c\xdb\x76\x38\xe7\xc2\xe7\xbe\xce\xed\x5a\x42\xd7\x7c\x8f\x78\x82\xf3\x81\x16\x16\xe9\xe0\xeb\x1e\xde\x78\x40\x68\xdb\xb6\x70\x6c\x1d\x83\x34\x48\x08\x44\x11\x92\xd8\x06\x00\xa6\x69\xe6\x72\xb9\x74\x3a\x6d\x18\x86\x70\x93\xe6\xba\xae\xeb\xba\xd5\x6a\xd5\x71\x1c\xb1\xeb\x4e\xb1\x40\x42\x88\xc4\x80\xe0\x14\xcd\xf9\xb0\x50\x44\xb8\x1a\x46\xb8\x70\x50\xc3\x46\xff\xab\x6a\x87\x10\x12\xa5\xad\x54\xc0\xb2\xac\x4c\x26\x9d\x4e\xa7\xc5\xd0\x95\x7e\xdf\x28\x00\x20\x8c\xb2\xc5\xf6\x6c\x71\xf7\x92\x8d\xbb\xf6\xdc\xe7\x9f\x3a\x76\xe4\xa5\x17\xf7\x1e\x7e\x71\xef\x91\x03\x07\xa6\x67\xa7\xd3\x85\x12\xc2\x26\x07\x29\xb2\x45\xbe\x10\xe0\x00\x53\xea\x52\x59\x91\x16\x6d\x9b\x60\x54\x9a\xac\x16\xa9\x69\xbb\x2f\x02\x38\x0a\x4d\x40\x38\x30\x8d\x79\xca\x67\x02\x84\xb4\x84\x14\x8c\x69\xd4\x2c\x6c\xa5\xd8\x85\xca\x58\xfc\x95\xe4\x95\x87\x8c\x30\xee\x14\x4d\x45\xd0\xb9\x62\x90\xa4\xdc\x32\xa8\x80\x4d\xf3\x32\xd3\xb2\xef\x89\x4b\x79\x2b\x06\xa3\xc1\x77\x54\x33\x85\xa8\xb4\xe6\xca\x03\xb8\xfe\x42\x62\x4e\x21\x91\x0f\xc9\x28\x6a\x7a\x11\xaf\x7e\x04\x49\x01\x20\x6a\x43\x03\xc1\x67\x00\xed\xe2\x4d\x1b\xc7\x4a\xa5\xd6\x6e\xd8\x78\xe3\x6d\xb7\xde\xfa\xd6\xb7\x6e\xd8\xb4\x29\x9d\x4e\x07\x6b\xae\x5a\x90\x07\xcc\x48\xfc\xb3\x6d\xc7\x09\x3c\x52\x29\xb0\xd4\xfb\x5b\x6c\xa6\xa8\x0f\xf2\xf3\x71\xd8\x00\x00\x20\x00\x49\x44\x41\x54\x93\x24\x04\xea\x71\xe2\x7d\xb5\x55\x58\xc4\xc2\x6b\x1f\xde\x60\x40\xe8\x38\xce\xe8\xe8\xa8\x3a\xfc\x36\x06\x81\x3a\x8d\x83\x28\x04\x8a\x0b\xd1\xad\x4b\xa5\x52\x36\x9b\x6d\xd9\xd5\x66\x66\x66\x84\xd2\xb5\x56\xab\x35\x1a\xc2\x4f\x6e\xb0\x60\xa0\xfb\xa6\x51\xb9\x43\xb4\xa3\xc7\xf0\x8f\xcf\xcf\x08\x17\x78\x94\x8c\x16\x1b\x3c\xfa\x4f\xc7\x71\x1c\xc7\x41\xa8\x22\x16\x11\xd3\xe9\x94\x69\xa6\x4c\x13\xa4\x41\xab\x2f\x0a\x45\x0c\x63\xcd\xa6\xad\xab\x37\x6e\xb9\xff\x83\x1f\x9b\x99\x9a\x3c\xb4\xef\x85\xbd\x4f\x3f\x7d\xec\xc8\xd1\xd9\xd9\x59\xc7\x71\x95\xe8\xd0\x71\x8c\xc5\x60\x41\x06\xa4\x20\x45\x1f\xe1\xf3\x6d\x99\xd2\xa8\x98\x7e\x2d\xd3\x94\x89\xc5\x6b\xa7\xe1\x08\x52\x72\x2d\xc8\x48\x2f\x4d\x2b\x78\x8e\x5c\x29\xc4\xe3\x42\x53\xa8\xfc\xb8\x85\x20\x99\x94\x4d\x21\xc0\xf3\x90\xde\x49\xc1\x1a\x9b\x75\xa9\x62\x84\x28\x18\xdc\x52\xff\xf0\xc0\xc1\xb7\x82\x79\x9d\x08\x87\x4e\x4d\xc3\xb7\xb4\xb2\x05\x5a\x6b\x59\x42\x39\x45\x40\x91\x03\x7b\x25\x94\xca\x4b\x8d\x0e\xca\xa6\x96\x10\x11\x00\xa7\xca\x4e\x96\x24\xfc\x10\x6f\x82\x38\x08\xc0\x34\xad\xfe\x25\x83\x37\xdc\x74\xd3\x9e\x5b\x6f\xbd\xe1\xc6\x3d\x9d\x5d\x5d\xd2\xe4\x4d\x4d\x66\x00\x21\x24\xf0\x0f\x63\x31\x89\x64\xb6\xed\xb8\xae\x43\x69\x0b\xd7\xc1\xe1\x27\x48\x48\x95\xef\x29\x4e\xf2\x88\x12\x48\xa8\x3b\x16\xad\x46\xaf\x7d\x78\x23\x01\xa1\xe7\x79\x23\x23\x23\x6a\xbb\x82\x0e\x3c\xba\x13\xed\x58\x77\x14\x7f\x85\x7a\x33\x9b\xcd\xb6\xb5\xb5\x89\x79\xdf\x7c\x01\x63\x9c\xcb\xe5\x72\xb9\x9c\xe7\x79\xd5\x6a\xb5\x5a\xad\xfa\xbe\xaf\x48\xe1\x7c\xba\x7e\x75\x2d\x66\x91\x57\xac\xcb\xd5\xcf\xf8\x54\x16\xb1\xac\x41\x02\xbf\xc8\xda\xb6\x6d\xdb\xb6\x11\x42\x52\x6b\x9a\x36\x0c\xd3\x14\xae\x6a\xe4\x26\x7b\x84\x10\xe7\xd0\xd1\xd9\x79\xdb\xdb\xef\xbe\xfd\xae\xbb\x01\xd0\xf8\xe8\xe5\x13\x2f\xbd\x74\x68\xff\xfe\x83\xfb\xf6\x8d\x8f\x8e\x39\xb6\x1d\xce\xa7\x45\x3e\x10\x81\x00\x80\xa8\xc8\x56\xe5\x61\x2c\xf2\x3b\x51\xc7\x80\xef\x69\x47\xe0\xea\xd9\xc4\x2b\x0b\x1a\x84\x72\x1e\xa9\xbb\xd4\x4b\xca\x68\x21\x28\x21\xb9\xae\x16\x12\xca\x88\xbc\xd1\x5c\x7b\x6b\xd5\x49\xc4\x0c\xc4\x6c\xb0\xb4\x28\x72\x57\xd8\xaf\x30\x0f\x10\xc8\x85\xc0\x10\x4b\xc3\xfe\xa0\x33\x6c\x55\x5e\xa1\x89\xd6\xf0\x0a\x02\xcf\xa5\x21\x29\x8e\x92\x45\x24\x97\x6e\x91\xde\xde\xe1\xa2\x20\xa8\xc5\x5d\x95\x22\xe8\xd7\x91\x57\x42\x8a\xdf\x4a\x6b\x17\x34\xdb\x1b\x37\x0e\x00\x58\x96\xd5\xdd\xd3\xb3\x6d\xd7\xae\xdd\x37\xdd\xbc\x7d\xf7\xae\xa1\xe1\x61\xc3\x30\x93\x7d\x0c\x63\xe1\x73\x9f\x60\x84\xb8\x5c\x67\x11\xbe\xa8\xc4\x7d\x42\x0c\xbd\x47\xb4\x1c\xf8\x2d\x35\x9f\x57\x13\x47\xfb\xb2\xf3\xc6\x59\x04\xc2\x6b\x1f\xde\x30\x40\x48\x29\x1d\x19\x19\x11\x36\xa2\x49\x08\xd4\xbd\x77\xea\x40\xa8\x50\xd0\x30\x8c\x4c\x26\x93\xcf\xe7\xaf\x1e\x81\x4c\xd3\xec\xe8\xe8\x28\x16\x8b\x73\x73\x73\x42\x19\xab\x72\x51\x71\xb8\x16\xd4\x9d\x57\xae\xd6\x88\xa5\xa0\x27\xae\x47\x48\x50\x19\xe0\x9c\x4b\xad\x69\xc5\x30\x8c\x54\xca\x4a\xa7\xd2\x56\xca\x12\x73\x5b\x69\xef\x4a\xe5\xa2\x20\xef\xee\xed\xed\xe9\xeb\xbb\xf5\xce\x3b\x01\x60\x7c\x6c\xec\xe4\xf1\xe3\x47\x0e\x1c\x7c\xe9\xf0\xa1\x8b\xe7\xcf\xd7\xaa\x35\x1e\x91\xe8\x00\x92\xdf\x84\x34\x04\x01\x0a\x0e\xf2\x86\x98\xc4\xe1\xad\x2a\x02\xba\x40\xd7\xd9\x4f\xf4\xb1\x8e\x49\x5c\x6e\xce\x53\x4f\x63\x8a\xe2\xa0\x41\x00\x40\xba\x39\x95\x4a\xd6\x00\xe7\x82\xdd\x64\x10\xde\x89\xbd\xae\x48\x5c\x58\x0c\xcd\x9b\x76\x8c\x5a\x81\x40\x49\xb1\x5f\x5f\x31\x4a\xad\x5d\x78\xd8\x6a\xa0\x6f\xe4\xd3\xb6\xd0\xc7\xf6\xce\x2b\xfd\x81\xca\x5d\xff\xb0\x2a\x4e\xd0\x1a\x8a\x21\x87\x2d\x17\x7e\x0f\x59\x54\x3d\x61\x79\xc6\x96\x68\x0a\xf9\x45\x74\xa1\x1c\xe6\xf5\x86\x8b\x93\xce\x64\x7b\xfb\xfa\xb6\xec\xdc\x79\xc3\x8d\x37\x6e\xd9\xb1\x63\x78\xf9\x72\xd3\xb2\xd4\xfb\xaa\x1d\xe5\xe9\xda\x58\x90\x3f\xce\xb8\xe7\x7b\xae\xeb\xfa\x3e\xe5\x9c\x2b\x8f\xfc\xba\x2e\x27\x76\xa1\xae\x95\x04\xf8\xfe\xe2\x44\x3e\x6d\x82\x38\x2a\x79\x05\x8b\xe1\xda\x86\x37\x06\x10\x72\xce\xc7\xc6\xc6\x9a\xcd\x26\x68\x5d\x0d\x6b\xbd\x3b\x06\x51\x31\x2e\x28\x16\xba\xbf\x27\x14\x54\x81\x10\xd2\xd1\xd1\x51\x28\x14\x66\x67\x67\x6d\xdb\x6e\xd9\x47\x35\x3e\x10\x01\xc5\x85\x6b\x74\x95\x85\x89\x0d\x21\x7d\xf2\x08\xd1\x71\x15\x4b\xd9\xf3\x3c\xcf\xf3\x6a\xb5\x3a\x42\xc8\xb2\xac\x74\x3a\x95\x4a\xa5\x4c\xd3\x44\xc8\x04\x10\x9b\x40\xc4\xf6\x8f\x40\x57\xd3\xdd\xd3\xd3\xdd\xd3\x73\xf3\xed\xb7\x03\x40\xb5\x52\xb9\x78\xfe\xfc\xb1\xc3\x47\x4e\x1c\x7b\xe9\xe4\xf1\xe3\x13\x63\xe3\x8d\x46\x1d\xe9\xc6\x98\x20\x0e\xb9\x07\x29\xf6\x43\xca\x13\x32\xc6\xa8\x0f\xeb\xa0\xd8\x31\x4e\xd9\x4a\xf7\x0b\x52\x98\x87\x4c\x09\x20\x5c\xce\x0c\x5a\x38\x7c\x0e\xa1\xbe\x11\x24\x74\x46\x5e\x14\x25\x0f\x81\x50\x47\x35\xa5\xd0\x44\xea\xcc\x06\x0e\x00\x62\x4b\x3e\x6a\xd5\xfe\x00\x88\x49\x00\x54\x15\x4c\xa2\xa0\xc8\x5f\xa4\x8f\xc2\x5d\x8b\x61\xf6\x41\x7b\x69\xc8\x15\x16\x43\x16\x54\xe9\x51\x05\x07\x42\xc1\x2a\x54\xbc\x89\xc2\xe9\x83\xb2\x14\xd5\x9a\x27\xe8\x12\xaa\x19\x43\x5d\x9c\xc6\x38\xd5\x3f\xd7\x77\x1c\x8c\x71\xb1\x54\x5a\x3a\x3c\xbc\x6d\xe7\x0d\xdb\x76\xdd\xb0\x7e\xd3\xa6\x25\x4b\x87\x30\xc6\xb2\x07\x22\xd5\x9c\x08\x21\xb1\xf3\x5d\x19\x72\x53\x4a\x6d\xbb\x29\xc8\x1f\xd2\x8c\xe0\x54\xe2\x3c\xea\x38\x29\xd2\x21\xe5\xcd\x57\x1e\x47\xfd\x0d\xba\x6e\x62\x52\xbb\x08\x84\xd7\x3e\xbc\x31\x80\x70\x7a\x7a\x7a\x6e\x6e\x0e\xe6\x47\xc1\xd8\x6e\x3f\x90\x93\x32\x24\x6d\x5e\x72\xb9\xdc\x2b\x21\x6a\xa6\x69\x76\x76\x76\xda\xb6\x3d\x37\x37\x27\x9c\x97\x8a\xfb\x4a\x14\x26\x67\x85\x0b\x87\xab\x29\x4c\x12\x2c\x93\x43\x2b\xf6\x33\x16\x81\x4b\x1b\x1f\xa1\x38\x05\x00\x61\xfc\x9d\x4e\xa7\x53\xa9\x94\x61\x88\xe3\x99\x94\xdf\x38\x2a\x6c\x80\x00\xa0\xd0\xd6\xb6\x6e\xe3\xa6\x75\x1b\x37\x21\x84\x38\x67\x93\xe3\xe3\x53\x93\x93\x07\xf6\xed\x3b\x7f\xf6\xec\x89\xa3\x47\x27\xc6\xc6\x6a\xd5\x1a\x04\x20\x18\xa2\x4e\x00\x7e\xca\x6c\x96\xeb\xf2\x1d\x94\xa4\x0b\xd9\x90\x10\x01\xf3\xa8\x55\xe3\x34\x2d\x04\x1d\x99\x7a\x84\x20\x31\xb9\x9f\x20\xd1\xfe\xb1\xe3\x2f\x84\xa2\x51\x03\x32\x24\x71\x54\xc1\x1e\x67\x4c\xb5\x65\x98\xb9\xdc\xd8\xae\x4e\x90\x50\x89\xc8\x09\x81\xa2\x96\x5c\xe6\x2c\xd5\x9d\x3c\x5a\x17\xd0\xc4\xbc\x14\x84\x81\xb1\x47\x78\xa4\xa0\xe6\xc1\x4e\x36\x18\x97\x17\x11\xbb\x10\xe0\x10\x9d\x7f\xc4\x66\x24\x08\x45\x3a\x86\xce\xab\x24\xc5\x0d\x1a\xe5\xfa\x8c\x93\xc9\x66\xfb\xfa\xfb\xd7\x6d\xdc\xb8\x79\xc7\x8e\xcd\xdb\xb6\x0d\xaf\x58\xd9\xd1\x59\x96\x5a\x00\xae\x6a\x07\x92\xf9\x49\x27\x18\x08\x80\xfb\x3e\xb5\x6d\xc7\xf7\x83\x7d\xb7\xfa\xa4\xb9\xe5\x98\x6d\x89\x5e\xb1\x47\xaf\x24\x4e\xec\x91\x42\x41\xfd\xce\xd5\xac\xad\x2c\x86\x57\x37\xbc\x01\x8e\x61\xf2\x3c\x6f\x62\x62\x42\xf5\x12\xd1\x51\xd4\xe1\x82\x31\x20\xd4\x49\xa1\x0a\xaf\x62\x61\x28\xa5\x33\x33\x33\x02\x54\x44\xe0\xda\x26\x42\x71\xa1\x7b\x9d\x47\xad\x82\x98\xf1\xe9\xea\xdc\xe4\x53\xf5\x6e\xcb\xb1\x94\xbc\x56\xd9\xc5\x86\x34\xcc\x3f\xc8\x0d\xc3\xc8\x66\xb3\x96\x65\x99\xa6\x69\x18\x86\x8c\xac\x40\x91\xa9\x52\xc4\x5e\x9f\x9e\x9a\x9a\x9a\x98\x38\x7a\xe8\xe0\xb9\xd3\x67\x4e\x1e\x3f\x3e\x7a\x79\x64\x66\x6a\xca\x8f\x9e\xef\x81\xa2\xe5\x44\x52\xcd\x05\xe1\x8c\x5d\xaf\x92\x7a\x47\x5e\x48\xf9\x8f\x14\x60\x40\x78\x53\xb2\xb6\x50\x65\x18\x69\x9f\x68\x73\x69\x55\xe6\xa0\xef\x7c\x4f\xf8\x46\x57\xc0\x16\xb1\x0a\x66\x4c\xdc\x00\x2e\x41\x4d\xa0\x94\x4c\x3b\x54\x41\x6a\x25\x64\x11\x94\x8c\x14\x26\x56\x67\xf5\x54\xbc\xa0\x2e\x01\x04\x23\x84\xb0\x15\xb9\xe4\x49\xda\x14\xa0\x85\x38\xd6\x4b\x14\x6c\x02\x51\xfe\xd4\x23\x8d\x24\x40\x53\x35\x4b\x62\xa4\xbc\x6e\x71\xd2\x99\x6c\x5f\xff\xc0\xf2\xd5\xab\x36\x6e\xd9\xb2\x71\xeb\xd6\x95\xab\x57\x77\xf5\xf4\x98\xa6\xf0\x64\x1d\x36\xb2\xf8\x29\xb6\x3c\x28\x0f\x50\x9c\x73\x4a\xa9\xe7\x79\x0a\xfc\x62\x72\x20\x99\x7b\xec\x4e\x72\xd0\xa1\xc4\x8e\xf8\xef\x3b\x8e\xe3\x38\xbe\xef\xc3\x82\x21\x95\x4a\x2d\x62\xe1\x35\x0e\x57\xf0\x0d\x1d\x0b\xd7\xfe\x7c\x0d\xce\xf9\xd4\xd4\x54\xb3\xd9\xd4\x66\x7c\xd8\x30\x0c\x2c\xed\x9d\x15\x0a\x0a\xf8\x51\x3d\xbe\xd5\x60\x7b\x75\xca\xcc\x18\x9b\x98\x98\x18\x1f\x1f\xe7\x9a\xa6\x4e\x01\xa1\x5c\x72\xc7\xaa\x0c\x2d\xa1\xae\xe5\xfd\x2b\x02\x61\xec\x3a\x39\xd2\x54\x91\x62\x10\x18\x7b\x5d\xa1\xa6\x25\x17\x54\x44\xab\x5a\x96\x65\x99\xa6\x61\x84\xfb\xa8\x58\x78\x82\x9e\x5c\x09\x4c\x74\x98\x7a\xad\x36\x3b\x33\x73\xfe\xcc\x99\xb3\xa7\x4f\x9d\x3d\x7d\xfa\xe2\xb9\x73\xa3\x97\x2f\x4f\x4f\x4d\x31\x4a\xb9\xac\x48\x90\xa3\x94\xd2\xc2\x2b\x64\xcb\x9e\x97\x10\xd9\x10\x81\x92\x04\xdb\x8b\x32\x4d\x2e\xe1\x33\x96\x82\x06\x56\xd1\xef\x25\xbe\x99\x40\x3b\x71\x74\x12\x02\xc0\x18\x61\x8c\x08\x16\x22\x16\x61\x82\x09\xc6\x84\x20\x1c\x7c\x3a\x90\xdf\xaf\x05\xb5\x17\x2d\xc5\x19\x17\x8a\x67\x9f\x32\x4a\xa9\x4f\x19\xa5\xcc\xf7\x99\x4f\x83\x59\x06\x65\x0a\xed\xb4\xe2\xca\xef\x27\x2e\x35\xcd\x67\xd0\x7a\x10\x6b\x1c\x81\xc9\xfa\x34\x42\xa3\x8b\x00\x81\x2e\x3b\x6c\x14\x19\x53\x03\x4a\x5d\x8f\xfa\xfa\xf8\x11\x45\x08\xda\x8a\xc5\xfe\xc1\xc1\xd5\x6b\xd7\xae\xdb\xb4\x69\xfd\xa6\x4d\xcb\x96\xaf\xe8\xe8\xec\xb4\x2c\x0b\x85\xfc\x3e\x98\x73\x20\x40\x28\xd8\xd3\x8b\x31\x0a\x94\x40\x8c\x31\x5f\x04\x4a\xf5\xc3\x67\x5a\xce\x23\x75\xc4\x8a\x0d\x22\xf5\x96\x6a\x5d\x15\x39\x36\xd1\xfc\xbe\xe3\x08\xc7\x34\xb1\xf2\x44\xbf\x27\x64\x32\x19\x5d\x3b\x7a\x3d\x9c\x52\xf4\xa6\x4f\xf9\x7a\x57\x8d\x3a\x8e\x53\xab\xd5\x74\x0a\xa5\xfe\x2a\x38\x51\x3a\x52\x7d\xde\xa7\xf7\xc2\x57\xb7\x48\x18\xe3\xee\xee\x6e\xc3\x30\x2e\x5e\xbc\xd8\x32\x82\xc0\xc2\xef\x1b\x89\x63\xf3\x4a\xfd\x7e\x2c\x4e\x4b\xaa\x17\x43\xbb\xab\xcc\x4b\x9c\x2a\x2c\xbc\xb6\x8a\x26\xb5\x2c\xd3\x32\x2d\xd3\x34\x0d\x53\x91\x45\x49\x90\x42\xdd\x20\x00\xf0\x7c\xa1\x90\xcb\x17\x96\x2c\x1d\xbc\xe9\xf6\xdb\x11\x02\x71\x24\x5b\xb3\xd1\x38\x7b\xf2\xd4\xc5\x0b\xe7\x47\x2e\x5e\x3c\x75\xe2\xe5\x99\xe9\xa9\x0b\xe7\xce\x35\xea\x75\x50\x12\x4a\x00\x6b\xac\x95\x50\x48\x00\x51\x54\xb5\x07\x12\xc6\x5a\x56\x44\x3a\x76\x89\x33\x06\x80\x40\xf3\x2b\x66\x29\x9c\x05\x68\x87\x11\x18\x04\x9b\x04\x9b\x29\x6c\x1a\xa6\x61\x10\x83\x60\xc3\xc0\x81\x77\x56\x8c\x09\x41\x24\xb8\xc0\x08\x21\x1c\x78\x30\x47\x18\x2b\x14\x44\x31\xd0\x0e\xb8\x20\x63\x8c\x03\x63\x8c\x32\xb1\x10\xcb\x7d\x71\x86\x08\x65\x7e\x80\x85\xd4\xf7\x99\x27\x7c\x5d\xfa\xd4\xf3\xa9\xeb\xf9\xbe\xcf\x28\x65\x94\x87\xc0\x15\xa8\x8e\x79\x04\x04\x23\x08\xa2\xb1\x22\x79\xa5\xa9\x4b\x41\x69\x7b\xe5\xbc\x03\x20\x06\xa3\x48\x7f\x5d\x91\xf4\xd7\x3e\x4e\x2a\x93\x5e\xbe\x72\x65\x6f\x7f\xff\xda\x0d\x1b\x56\xac\x5e\xbd\x76\xe3\xc6\xee\x9e\x9e\x42\xa1\x40\x0c\x53\x6f\x49\xa1\x97\xd6\x46\x7d\xb8\xfc\x21\x68\x9f\xe3\x39\xbe\x4f\x7d\xdf\xd7\x67\x9c\x7a\x1c\x48\xc0\x4c\xcb\x21\x19\xbb\xd9\x72\x34\xa9\x47\xaf\x30\x4e\xac\x0c\x49\xca\x98\x2c\xcf\x62\xb8\x06\xe1\xba\x06\x42\xce\xb9\x58\x1a\x04\x4d\xbf\xa1\x2b\x42\x63\xaa\x51\x48\x4c\xf7\x5e\x75\x14\x54\x85\x29\x97\xcb\xcd\x66\x73\x6a\x6a\x2a\x99\xc5\x7c\x9d\x3e\x16\xa7\xe5\xa3\xab\x84\xcf\xd8\x00\x4b\xce\x6a\x5b\x8e\xc6\xd8\xeb\xf3\x35\x8e\x90\x32\x8d\x86\xdf\x80\xa6\x88\x2c\x3c\x2b\x9a\xa6\x69\x59\xa6\x61\x98\x08\x89\x6e\xc3\xb5\x93\x19\xc3\x6d\x87\x08\xa1\x7c\x3e\x9f\xcf\xe7\x3a\xbb\xba\x6f\xb8\xe9\x46\x00\xe0\x1c\x28\xa5\xcd\x46\xc3\x6e\x36\x8f\x1f\x3d\x3a\x39\x31\x7e\xee\xcc\x99\x8b\xe7\xce\x4d\x8c\x8d\x5d\xba\x70\xb1\x56\xad\xf0\x50\x50\x22\xc6\xb9\x0e\x87\xd0\x6a\x4e\x10\x56\x59\xca\x7a\x65\x0b\x1a\xd2\x3b\xce\x31\xe2\x18\x81\x69\x10\xcb\x22\x96\x69\xa4\x2c\xc3\x32\xc5\x7f\xc4\x34\x88\x69\x0a\x17\xac\x01\xfe\x11\x43\xe2\x1f\xc6\x62\x5a\x25\xc0\x4f\x5c\x61\x01\x7c\xd1\xa9\x16\xa8\xcc\x01\x14\x80\x89\xb9\x82\x80\x40\x1a\x6c\xe7\xe4\xc2\xcb\xb3\xe0\x85\x9e\xcf\x3c\x3f\xc0\x42\xd7\xa7\xbe\x4f\x5d\xcf\x77\xbd\x00\x11\x5d\xd7\x77\x3d\xea\xb8\xbe\xe7\x53\x9f\x52\x4a\x83\x96\x8d\x66\x1b\x34\x09\xe8\x97\x02\x7d\x34\x52\xa8\x88\xa1\x7e\x02\xa3\x4c\x87\x6b\xcd\xfc\xda\xfa\xf6\x6c\x2b\x16\x37\x6d\xdb\x56\x28\x14\xb6\xef\xde\x5d\xee\xec\xda\xb0\x79\x73\xb9\xab\x2b\x9f\xcf\x1b\xa6\xa1\x26\x2e\xfa\xf7\x45\x08\x11\x22\x60\x0f\xc9\xa5\x3e\x00\xe0\xbe\x4f\x1d\xc7\xa5\x94\x52\xea\x53\xca\xf4\x61\xa2\x84\x43\x8b\x1e\x92\x18\x11\x57\x8c\x13\xe3\x76\x0b\x63\xe7\xf7\x14\x47\x1f\x74\x0a\xbc\x21\x3a\xea\x17\x51\xf0\x75\x09\xd7\x35\x10\xba\xae\xab\x94\xa2\x49\x14\x4c\xce\x01\x93\x7d\x28\x89\x01\xaf\x62\x10\x06\x38\x13\x13\x13\x7a\x76\x10\xd5\x84\xcc\xf7\xee\xc2\x28\x18\xd3\xb4\x40\x54\xe7\xa9\xd7\x68\xe1\xa7\x49\xe2\xd8\x32\xc7\xf9\x34\x45\x2a\x8e\x22\x8b\x10\xc8\x29\x22\x56\x16\x25\x3a\xe2\x40\xcb\xc7\x15\x59\x14\x8a\x3f\xc5\xd2\x90\x61\x18\x85\xb6\x42\xbe\xd0\xd6\xd5\xd3\x2d\x4a\xcd\x39\x67\x94\xba\xae\xdb\x68\x34\x2f\x9e\x3b\x77\x79\xe4\xd2\xc8\x85\x8b\x97\x47\x2e\x8d\x5e\x1a\x19\x1b\xbd\x3c\x31\x3e\x5e\xaf\x56\x5b\x97\x53\x83\x46\x46\xa9\xf0\x49\x46\x10\x18\x04\x59\x26\xce\x64\xad\x74\xca\xc8\xa4\xad\x74\xca\xc8\xa4\xcc\x94\x65\xa6\x2c\x23\x65\x11\xcb\x34\x4c\x53\x79\x21\xc7\xc2\x17\xb9\xc0\xbc\xe0\x80\x0e\xa1\x6b\xc3\x21\xf9\xd3\x91\x4f\x76\x30\x38\x7d\x7e\x2c\x9b\x49\xf5\x75\xb5\x83\xc6\xca\x84\x7c\xd3\xd6\x05\x39\x63\x9c\x32\x26\x90\x8f\x32\x1e\xd0\x41\x2a\xce\x4c\x0e\xe8\xa0\x60\x87\x9e\x2b\x79\xa1\xeb\xbb\x3e\x75\x5d\xea\xb8\xbe\xeb\xfb\x8e\x40\x44\xc7\x73\x5c\xdf\x76\x3d\xc7\xf5\x3d\x8f\x0a\xcd\x2a\x0f\x9b\x45\xa2\x1c\x0a\x98\x22\xe8\x64\x31\xd8\x66\x18\xea\x4c\x55\x5f\x11\xd0\x25\x31\x0c\x5e\x2d\xdf\x9e\xb9\x5c\x7e\xcd\xfa\xf5\x9d\x5d\x5d\x2b\xd6\xac\x19\x5e\xbe\xbc\xa7\xaf\x6f\xeb\xce\x9d\x84\x90\x74\x26\xa3\x18\xa2\xec\x6c\xe2\x2d\xd1\xc2\x21\xe7\x53\x79\x88\xad\x3e\xae\x1b\x2c\xf5\x29\xa7\x4e\x20\x35\x16\x7a\xa7\x8d\x75\xef\x24\xeb\x4a\x0e\xb7\xab\x89\x03\x09\x30\x4b\x46\xf8\x5e\xe3\xe8\xf3\xd7\xd8\x00\x5f\x84\xc0\xd7\x31\x5c\xd7\x40\x58\xa9\x54\x74\xa5\x47\x74\x3a\x1e\x41\xc1\xd8\x23\x95\x82\x69\x9a\x4a\x82\xbf\x16\x21\x9b\xcd\x76\x76\x76\xc6\xb0\x50\x77\x05\x7e\xf5\x9d\xbb\xe5\xc8\x5c\x60\x32\xab\xc7\x5c\x20\x4e\x0c\x35\xaf\x58\xb0\xf9\x88\xa6\xba\x23\xd6\x41\xd5\xa1\x1f\x00\x20\x76\xa7\xa8\x60\x18\x86\xa4\x8c\x01\x2a\xc8\xc0\xa4\xf8\xe3\x62\x7b\x1e\x31\x48\xc6\xc8\xa6\x33\xd9\x72\x67\x79\xcb\x8e\x1d\x2a\x2f\x41\xa3\x6a\xb5\xda\xf8\xe8\xe5\xb1\xcb\x97\xc7\x47\x47\x2f\x5f\xba\x34\x36\x3a\x3a\x31\x3e\x7e\xec\xf0\xe1\xca\xec\x8c\x49\x90\x65\xe0\x4c\xda\xcc\x65\xb3\xf9\x6c\x2a\x9f\x4d\xe5\xb2\xa9\x6c\xc6\xca\xa4\xcd\x6c\xda\xca\xa4\xcd\x74\xca\x4c\xa7\x4c\xcb\x34\x4c\x09\x7b\x06\xc1\x04\x23\x84\x10\x21\xa2\xc7\x84\x1d\xc5\xf5\x7c\xc6\x58\x3a\x65\x01\x00\x63\xfc\xf2\xf8\x4c\x47\x29\x9f\xcd\xa4\xe6\x2a\xf5\x2f\x7e\xed\x89\x3b\x6f\xda\xb4\x62\xa8\x57\x81\xf7\x99\xf3\xa3\xb3\xd5\x7a\x7f\x4f\xc7\xc8\xe8\xf4\x9a\x15\x03\x3b\x37\xaf\x20\x98\x20\x04\x8e\xe3\x19\x06\x21\x04\xc7\x3e\x84\xe7\xd3\x3f\xf9\xdc\x03\x7b\xb6\xad\xde\xb9\x79\x25\xe3\x5c\x68\x4a\x05\x2e\x0a\x8d\xa8\x4f\xa9\xa0\x83\x82\x1a\x7a\x1e\x75\x05\x28\x7a\xd4\x71\x7d\xc7\xf1\x1d\xd7\xb3\x5d\xdf\x71\x7d\xdb\xf1\x1c\xc7\x6b\x3a\x9e\xed\x78\xb6\xe3\xb9\x1e\xf5\x28\x65\x34\xb0\x69\x52\x16\x46\x01\x1c\xbe\x96\xbe\x46\xad\x54\xaa\x6f\x60\xa0\x7f\x60\xa0\x7f\xc9\xe0\x92\xa1\xa1\xa1\xe1\x65\xfd\x4b\x06\x87\x57\xae\x2c\xb4\xb5\x19\x86\x81\x31\x0a\x4b\x02\x5c\x6e\xc5\x14\xb8\x89\xb5\xa5\xfc\xc8\xa1\x2e\x94\x52\x4a\x5d\x2a\x43\xac\xdf\x2e\x3c\x16\x62\x58\xd2\x52\x14\x7c\xaf\xd7\x10\x05\xaa\x64\x2e\xc9\x8b\x2b\xc6\xd1\x59\x6f\xb2\xfc\x7a\x65\x93\x75\x5c\x0c\xaf\x69\xb8\x7e\x81\xd0\xf7\xfd\x5a\xad\x26\xae\x51\x22\x24\x6f\xb6\x4c\xe4\xb5\x06\x42\x00\xc8\xe5\x72\x8c\xb1\xc9\xc9\x49\x75\x07\x45\xc9\xdc\xd5\x04\x7d\x2c\x25\x11\x31\x99\x72\x92\xf6\xa1\xe8\x26\x81\x18\x86\xa1\x79\x78\xa4\xfe\x4a\x2c\xbb\xf9\x5e\x49\xc6\x11\x66\x0a\x62\x97\xa7\x28\x89\x61\x18\x86\x61\x98\xe1\x3f\xa6\x61\x08\x2b\x38\x14\x07\xc7\x60\xb3\x05\x07\x50\x9c\x0f\x84\x15\x54\x7b\x47\x7b\x7b\x47\xfb\x9a\xf5\xeb\xa3\x05\x00\xce\xf9\xc5\x73\x67\xc7\x2e\x9e\xb3\x0c\x34\x3b\x79\xd9\x9e\x1d\xcb\xe7\x52\x06\x62\x95\xcb\x27\xb3\x29\x62\x99\x04\x38\x0b\x15\xab\xc1\x9e\x0a\xae\xbc\x94\x20\x84\x18\xe3\xff\xf8\xf5\x27\x87\x06\xba\xf6\x6c\x5b\x83\x10\x3c\xf6\xec\x91\x47\x9f\x3d\xfa\xe9\x9f\xba\xbf\x58\xc8\x7d\xed\x3b\xcf\x3d\xfa\xf4\x61\x62\x90\xdb\x77\x6f\xb8\xe7\x8e\xed\x5b\xd7\x0f\x67\x33\x29\x00\x78\xe8\xb1\x17\x19\x63\x77\xdd\xb6\xf5\xbe\xb7\xef\xa2\x8c\xfe\xd6\xff\xfd\x85\x86\xed\xee\x3f\x7a\x66\x64\x6c\xfa\x87\xee\xde\xc3\x39\xff\xdc\x97\x1f\xb1\x1d\xf7\xe7\x3e\x78\x0f\x07\x30\x08\x3e\x76\xea\xd2\x03\x0f\xbf\xd0\x51\xca\xdf\x71\xe3\xc6\x1f\xbc\x73\x67\x21\x9f\x31\x0d\xe3\xb9\xfd\x27\x66\x2b\xf5\x3b\x6f\xda\x64\x98\x04\x38\x34\x1d\xd7\x32\x0d\x04\x48\xd0\x47\x8f\x32\xea\x33\x57\x51\x43\xcf\x77\x3d\xea\x7a\xbe\xe3\x7a\x9e\x4b\x6d\xd7\x73\x1c\xdf\x76\x3c\xdb\xf5\x6d\xdb\x6b\x3a\x5e\xd3\x76\x9b\x8e\xd7\xb4\xbd\x86\xed\xda\xb6\xe7\x78\x3e\xa5\x94\x49\xc3\x9a\xb0\x07\x21\x40\x5a\xfd\x21\x74\xce\x19\xe2\x13\x68\x8f\x04\x58\x61\x8c\xd3\xe9\x74\xdf\xc0\x92\x35\xeb\xd7\x99\xa6\xd5\xd5\xd3\xbd\x6c\xc5\x8a\x8e\x72\xb9\xa7\xb7\x6f\xc9\xd0\xd2\xf6\x8e\x0e\xa9\x03\x00\xf5\xe1\x74\xda\x03\x81\x5d\x5b\x0c\xf3\x02\x7c\x65\x8c\xf9\x3e\x65\xd4\x0b\x3c\x1e\x25\x08\x1f\xb4\x1a\x3b\xfa\xd4\x10\x12\xf8\xa4\x5f\xbc\xba\xec\x4a\x9f\x14\x26\xe1\xed\x7b\x8a\xb3\xf0\x8c\x36\x56\x8b\xc5\x70\x2d\xc3\xf5\x0b\x84\xb5\x5a\x4d\x58\x9d\x24\x51\x70\x3e\x5c\xd4\x5f\x17\x7d\x4e\xf7\x16\xf8\xda\x85\x42\xa1\xe0\xfb\x7e\xd2\x48\x69\x61\xe2\xb5\xc0\xb8\x8d\x8d\x22\xfd\xa7\x0e\x7b\x90\x18\x8a\x7a\x0a\xc9\x74\x92\x31\x17\xce\x48\xdd\x59\x98\x6e\xaa\x38\x48\x1e\x64\x41\x29\x15\x67\xd6\xa8\x7a\x09\x83\x26\x23\x1a\x12\xbe\x3c\x62\x18\x99\x54\xe4\x02\x00\x20\x84\x97\x0c\x0d\x0f\x2e\x1b\xd6\x5e\x44\x28\xdc\x39\xc7\x67\xc6\x2e\xd2\xe6\x9c\x61\x10\xce\xd9\xf8\xb9\x13\x98\xd9\x06\xc1\x8c\xd2\xb1\x33\x47\x4d\xc2\x09\xc1\x88\xb3\x75\x2b\x97\x60\x1c\x28\xe8\xde\x76\xcb\x96\x3b\xf6\x6c\x34\x4d\xc2\x81\xf7\x74\x96\x0c\x83\x50\xc6\x9f\x3f\x78\xf2\x9e\x3b\xb6\xef\xda\xba\xea\x5b\x8f\x1f\x78\xfe\xc0\xc9\x75\xab\x96\xcc\x55\x1b\x08\x00\x10\x37\x08\xf9\x91\x7b\x6f\x7a\x66\xdf\x09\x84\xd1\x9a\x15\x03\x00\xfc\xeb\x0f\xbf\xd0\xd3\x59\x7a\xfb\xad\x5b\x46\x27\x67\xff\xd7\xdf\x3c\xf8\xa3\xef\xbc\xe5\xc2\xe5\xc9\x8b\xa3\x53\x17\x2e\x4f\x1e\x3b\x7d\xe9\xb7\x3f\xf5\xfe\x74\xca\xe4\x9c\x77\x95\xdb\x6a\x0d\x5b\x38\x34\x7f\xe4\x99\xc3\x5f\xfb\xd6\xf3\x6d\x85\xec\x5b\x6e\xdc\x74\xdb\xee\xf5\xdf\x7d\xe2\x50\xad\x61\xbf\xf3\x6d\x37\x34\x9b\x6e\x36\x6d\x64\x33\xa9\xe9\x99\xea\x6c\xa5\xb1\x7c\x49\x8f\x4f\x99\xeb\x51\xc7\xf5\x1c\x57\xfc\xf5\x6d\xc7\x73\x5c\xcf\x76\xbc\xa6\x1d\xfc\xd7\x68\xba\x75\xdb\x6d\x34\x9d\x7a\xd3\x6d\x34\x5d\xc1\x17\xa9\xdc\x1f\xa2\x16\xec\xd4\xde\x5b\x62\x18\xb9\x5c\xbe\xbd\x5c\xee\xea\xee\xee\xe9\xef\xcb\x64\x33\x9d\x5d\xdd\x43\xc3\xc3\x85\xb6\xb6\xb6\x62\x69\x60\xe9\xd2\x9e\xde\x3e\xd5\x25\x79\xa8\x6c\x0d\x2e\xf4\xf5\x60\x01\x72\xc9\xf1\xa8\x7a\x91\xef\xfb\xbe\xef\x0a\x92\xa7\xf6\xa5\xe8\x9f\x15\x69\x96\xd2\xf3\xa1\x45\xb2\x1b\xb7\x0c\xd1\xee\x34\x6f\x9c\x85\x7b\x75\x2c\x4e\x2c\xeb\x24\xee\xaa\x70\xc5\x38\x6a\xfc\x26\x5b\x40\xdd\xc1\x8b\xbb\xe9\x5f\x8f\x70\x9d\x02\x21\xe7\xbc\x5a\xad\x26\xa1\x2e\x79\xad\x4f\x3b\x63\xd2\x5c\xec\xb2\xb8\x36\x05\x2e\x95\x4a\xc2\x37\x29\x48\xfd\xe1\xc2\x59\xcf\x87\x82\xf3\x61\x67\x4b\x9c\x6b\xf9\x73\x3e\x68\x6c\x79\x27\x16\x1f\x25\x78\x24\x6a\xa5\x1d\x45\xad\xc8\x62\xb2\x18\xba\x5c\x90\x4b\x3e\x2e\x8a\x2a\x88\x04\x1c\xea\x18\x39\x8f\xb3\xab\x08\x3e\x22\x14\x11\x3a\x9c\x83\xbc\x09\x08\xa1\xf6\x9e\x41\x84\x06\xc5\xd3\x8e\xa5\x1b\x44\x2c\x00\xbe\xf2\xf6\xe0\xc2\xb5\xed\x25\x37\x9f\x35\x09\x22\x04\x33\xea\x8f\x9e\x3d\x4e\xb8\x6b\x1a\x04\x21\x74\xdf\xea\x1b\x97\xaf\xdd\x54\x9b\x99\xec\xed\x2a\x5a\xd9\x0c\x42\x68\xe3\x86\xd5\x97\x47\x27\x97\x2d\xe9\x36\x08\x46\x28\x38\xf1\x68\xeb\xfa\xe1\xad\xeb\x97\xa3\x20\x3d\xd8\xb0\x6a\x70\xb6\x5a\x4f\xa7\xcc\x81\x9e\x8e\x5f\xfa\xd8\x7d\x85\x7c\x66\xc5\x50\x2f\x42\xa8\x52\x6d\xf4\xf7\x76\xa4\x2c\x43\xb0\xb4\xe5\x4b\x7b\x97\x0f\xf6\x8a\x82\x61\x84\x01\xa1\xb9\x6a\xe3\xeb\x0f\xef\xbd\xe5\x86\x75\x6b\x57\x2c\x19\x9b\x9c\x45\x80\xbe\xf5\xf8\xfe\x33\x17\xc6\x7f\xfe\x27\xee\x39\x7b\x71\xfc\x3b\x4f\x1e\xfc\xa9\x1f\xbb\xab\xbd\x98\x07\xe9\x56\x87\x51\xe6\x33\xe6\x79\xcc\xf5\x7c\xdb\x11\xbc\xd0\x6b\x3a\x3e\x43\xc4\xf5\x78\xbd\xe1\xd4\x1b\x6e\xad\xe9\xfa\x9c\xb4\x77\xf7\x95\xca\x3d\x8e\x4f\xd3\xe9\x6c\xdf\xc0\x40\x77\x5f\x6f\xa1\xad\x98\xcf\xe7\x0b\x6d\x6d\xf9\xb6\xb6\x62\xa9\x24\x0e\x15\xd2\xbf\xbf\xb6\xf6\x07\x7a\x1f\xc4\x18\x01\x60\xb1\x9e\x27\xbe\xb6\xbc\x88\x03\x9e\x38\xc8\x45\xfc\x15\x5b\x1a\x74\xf9\x9e\x4a\xa5\x62\x1d\x26\xd9\xfd\x74\xec\x99\xaf\xdf\xce\x17\x47\x21\x56\xec\x91\x8e\x64\xfa\xa3\xf9\xd0\xae\x65\x1c\x68\x35\x66\x63\x17\x2d\x07\x72\x72\x16\xab\x17\x69\xbe\x8b\xc5\x70\x8d\xc3\x75\xba\x8f\xd0\x71\x9c\x0b\x17\x2e\xe8\x3b\x05\xd5\xb5\xba\x10\x72\x53\xed\x20\x14\x2f\x2a\x2c\xe4\x9c\x0b\xdf\xd3\xd7\xac\xcc\x8c\xb1\x91\x91\x11\xdb\xb6\x39\xe7\xa2\x78\xea\x54\xa6\x58\xd0\x77\x7a\x24\xc1\x1e\x6b\xc7\x5c\xe8\xe3\x53\x85\x05\x60\x2f\x89\x5b\xea\xba\x65\x52\xca\xc5\xfe\x7c\x11\x92\x89\x5c\x25\xbe\xce\x17\x92\x52\x26\x99\x88\xfa\xca\x0a\x23\xd5\x85\xde\x56\xa0\x7d\x6e\xf1\x47\x5d\x08\x5d\xab\xc8\xe4\xea\xcb\x36\x5f\x39\x6b\x73\x33\x8d\xb9\x09\x82\x21\x58\x5e\x44\x41\xba\x1c\x60\xfc\xc2\x29\xb7\x59\xc5\xc0\x09\x06\x8c\x31\x46\xea\xcb\xb5\xd8\x10\xa9\xdf\x60\x8c\x9f\x3e\x3f\x5a\xab\xdb\x3d\x9d\xa5\xbe\xee\xb0\xcb\x31\xce\x29\xa5\x84\x10\x61\x86\xca\xc4\x7f\x94\x33\x84\x53\xb9\x52\xf7\xc0\x32\x00\x65\xa1\x03\x94\x32\xd7\xa7\x94\xe3\x8e\xee\xfe\x74\x36\xb7\x60\x85\xf8\x3c\x4d\x21\xee\xeb\x9d\x11\x14\xc8\xc5\xa0\x8e\x07\x2b\x79\x54\x01\x9e\xd0\x6a\x8a\xbf\xb1\x46\x83\xc4\xb7\x4e\xa5\x52\xea\xce\x2b\x17\xf7\x57\x9f\xc2\xab\x0b\x2d\xb1\xbe\xa7\xfa\x70\x4b\x28\x8d\xc5\x11\x5e\x0f\x17\x4e\x3f\xb9\x9b\xfe\x0d\xb7\x27\xef\x8d\x98\xf2\x75\xca\x08\x6b\xb5\x5a\x4b\xa8\x88\xdd\x84\x79\x66\x97\x22\x5c\x1b\xbd\xa8\x0a\x18\xe3\x9e\x9e\x9e\x4b\x97\x2e\x79\x9e\x77\x45\x6c\x48\xce\x3d\x5b\x52\xc3\x85\x89\x60\xf2\xbe\xce\x89\xd1\xfc\xea\x53\x75\xa1\xec\x7a\x92\x89\x2f\x80\xa3\xf3\x31\x4b\x5d\x28\x2c\x80\x9a\xc9\x29\x36\x44\x45\x86\x90\xad\x10\x45\x4a\x90\x1f\x5d\xf7\x9f\x00\x00\x21\x91\x34\x0c\x82\x31\x12\xc7\x0a\x08\x83\x0d\x50\x3b\x1b\x40\x2b\x37\x6f\x7d\xa3\x75\x93\x22\x00\x9e\x6b\x6b\xcf\xb5\x95\xe4\xcf\x80\x7a\x8a\xb4\xdb\x7a\x57\xc8\x6b\xa4\x43\xaf\x1e\x07\x21\xd4\x32\xce\xf0\x9e\x2b\xc7\xb9\x52\x3a\xad\x43\xb8\x6f\x30\x02\xca\x5a\xa3\xab\x9f\x62\xca\x20\x03\x53\x07\x5a\x6a\x81\x69\x21\x92\x8b\x86\x6a\x0b\x7c\x7d\x14\xa5\x5c\x2d\xe7\x5b\xc9\x0f\x9d\xec\x3f\x28\xaa\x4b\x48\xce\xfc\x92\x3f\xaf\xe6\xce\x15\xf3\x6a\x59\x85\xf9\x86\x27\x92\x4b\xf5\x2d\xe3\xe8\x8f\x62\xcd\xa8\x57\x0d\x16\xc3\x35\x0f\xd7\x23\x10\x72\xce\x05\x10\x42\x94\x18\xa9\x90\xc4\x48\x75\x1f\x34\x91\x7a\xed\xdd\x14\x99\xa6\xd9\xdd\xdd\x7d\xe9\xd2\x25\x96\x70\xdf\xf5\xca\x83\x3e\x84\x92\x00\xa3\x3f\x9a\x0f\x81\x00\x22\x78\x93\x7c\x37\x16\x39\xf9\x22\x5c\x9d\x2c\x6b\x59\xc8\xe4\xc4\x79\x3e\x71\x30\x5f\x3a\x22\x6b\x2a\x7d\xb9\x09\x5d\xab\x9e\x7e\x6c\x5f\xa9\xce\x26\x43\xa7\x7c\xe2\x5f\x89\xa8\xb1\x2e\x94\xa8\x7d\xbc\x31\x00\x20\xd9\xb4\xd1\xd8\xaa\x46\x7a\xe3\x40\xcb\x10\xd5\x40\xc6\x1f\xb6\x8a\x89\xb4\x9f\x28\xfa\xb4\xc5\x72\x94\x58\x94\x63\xa1\x37\x59\x8d\xc1\xb1\xc0\x52\x85\xc9\x85\x3b\x75\x54\x9e\x1a\x5c\xfa\xe4\xec\x8a\x02\xba\x25\x54\xc4\xca\xd3\x32\x91\x18\xa0\xea\xd7\x3a\xe0\xe9\xf7\x5b\x22\x6b\x52\x0e\x24\xb3\xfb\x3e\xf2\x8a\xc5\xd1\x2b\x38\x5f\x23\xb4\x04\xbc\x58\xcb\xc4\x86\x83\xba\xbf\x08\x84\xaf\x4b\xb8\x1e\x81\x50\x28\x10\x62\xbb\x03\x63\x88\xa8\x63\x21\xb4\x12\xe5\xba\xbe\xf4\x5a\x86\x6c\x36\x5b\x2e\x97\xf5\x0d\x15\x57\x13\xf4\x41\x9b\x1c\xc0\x2d\xd1\x4b\x0f\x2d\x27\xcb\x2a\xa9\x24\x7c\xc6\x22\x24\x61\x6f\x81\x42\xb6\x44\x41\xd0\x40\x6b\x81\x8a\xb4\xcc\x4b\xc4\xd1\xa7\x0e\xfa\x5b\xfa\x57\x16\xf2\x45\x3d\x52\xaf\xe8\xd5\x14\x24\x66\xbe\x8a\xe8\xad\x14\x31\x6a\x94\xc0\xa9\xe3\xa8\xba\x1f\xbb\xd0\xb1\x33\x59\xd4\x58\xb8\x1a\xfc\x58\xf8\x0e\xd7\x42\xcc\xab\xad\xfa\xcb\x02\xef\x39\x5c\x5d\xa8\xb6\x8a\x35\x5a\x0c\x24\x92\x1f\x68\xbe\xcf\x17\xfb\x99\x7c\x94\x9c\x18\xe9\xd7\xf3\x01\x61\x0c\xbd\x92\xb9\xcf\xd7\x19\x16\x48\x27\xd6\x51\xe7\x03\xc8\x05\xf2\x5a\xe0\x4e\x2c\xb4\xac\xf5\x7c\x63\x4a\x7c\x9a\x05\xea\xb5\x88\x82\xaf\x57\xb8\x1e\x81\xb0\x5e\xaf\x27\x71\x0e\x12\xdd\x05\x25\x16\xdb\x40\xeb\x73\xaf\xa3\xd7\xda\xf6\xf6\xf6\x66\xb3\xb9\xc0\x62\xc0\xc2\x22\x26\x79\x47\xaf\x5a\xcb\x01\xb9\x30\x92\xc5\xe4\xa0\x9e\x4e\x4c\x4a\x5e\x11\x11\xaf\x18\x21\xf6\x15\x74\xe0\x99\xef\xf5\xd8\x4d\x94\x98\xf2\x27\x73\x11\x81\x69\x87\x7d\x2f\x10\xad\x65\x5e\xb1\x8a\x5f\x31\x85\x64\x48\x42\x48\xcb\xfb\x2d\xef\x2c\x1c\x41\x9f\x1f\xa8\x3b\x0b\xa4\xdf\xb2\x0c\xc9\x44\x20\x01\x12\x7a\x5e\x49\x30\x43\xad\x38\x50\x32\x4e\xb2\x84\x10\xfd\xee\xb1\x4f\xd9\x32\xc7\x96\x95\x8d\x65\xd7\x12\x7a\xe7\x2b\x0f\x24\x3e\xba\x9e\x57\x2c\x0b\x48\x7c\xfd\x85\xe3\xb4\x6c\x99\x58\xc1\xf4\xf2\x24\xe3\xc4\xf2\xd2\xaf\x17\xb1\xf0\x75\x09\xd7\x23\x10\x8a\xb3\x1d\xe6\xc3\xc2\x96\xb3\x27\x94\x98\x90\xbe\x8e\x40\x88\x10\xea\xe9\xe9\x19\x1d\x1d\xbd\xa2\x9b\x79\x58\x10\x14\x93\xa3\xbd\xa5\xd0\x5f\x18\xc9\x62\xf0\x39\x5f\x84\xe4\x60\x6e\x59\xaf\x96\xdc\xa2\x65\x22\xc9\x6a\xc6\xea\xd8\x32\xc7\x64\x9a\x7a\xe2\xc9\xac\x93\x4d\xb1\xb0\x1c\xb9\x1a\x14\x89\x65\x1d\x93\x86\xf3\xe5\xb5\x80\x98\x5b\x60\xc6\x90\x7c\x25\x19\x3f\x29\x8e\xe7\xfb\x3a\xb1\x04\xe7\x1b\x20\x49\x68\x69\x39\xf1\xd2\x1f\xe9\xfd\x70\xbe\x76\x48\x3e\x6a\xd9\x7b\x93\xb9\xfc\xff\xec\xbd\xd9\xaf\x66\xc9\x71\x27\x16\x99\x79\x96\x6f\xbb\xb7\xb6\xde\x58\x34\xd9\x22\x29\x8a\xd4\x8c\x64\x78\x0c\x7b\x30\x06\x6c\xf8\x1f\xf0\x8b\x1f\x0c\x18\x30\xe0\x79\xb0\x01\xbf\xf8\xc9\x80\x00\x3f\x18\xb0\xc7\x0f\x32\x06\x30\x06\xf6\x00\x7e\xf0\x00\x63\x8d\x07\xb2\x05\x59\x82\x3c\x90\x65\x4b\x83\xb1\x24\x4b\xd4\x36\x5a\x28\x89\x12\x29\xb6\xba\xc9\x66\xb3\xb7\xaa\xae\xaa\x5b\x77\xfb\x96\xb3\x64\xa6\x1f\xf2\xfb\xb2\xe2\x8b\x88\xcc\x73\x6e\xb1\xab\xee\xad\xe2\x0d\x74\xdf\xca\x2f\x4f\x64\x64\x64\x64\x64\xfc\x32\xf3\x9c\x93\x47\x9c\x52\xe4\x81\x9f\xf0\x40\xc2\x6e\x58\xb7\x8c\x6f\xa4\x06\x60\x9e\x27\xd5\xe3\x22\x28\xfa\x1d\x89\x93\x1e\xb1\x96\x6b\x7a\x9e\x74\xe5\x3e\xc3\xe4\xbd\xff\xfe\xf7\xbf\x6f\xad\x25\xbb\x55\xf8\x91\x51\xfc\xc0\x7d\xdc\x02\x25\x0e\xf7\x2c\xee\xd2\x5d\x88\x96\xcb\x65\xd8\x20\x55\xfb\x04\xe8\x03\x4c\xe4\x2a\xec\x96\xb9\x90\xb8\x51\x01\xe3\x16\x7f\xa9\x7c\x90\x10\x31\x3c\xcb\x97\x9a\x3e\x0f\xd6\x85\xc5\xa6\x50\x70\xb0\x60\xaa\x69\xe2\x84\x3a\x32\x34\x4d\x93\xc2\x48\x51\xe1\x4c\x5b\x38\x03\x87\x1f\x48\xaf\xb4\xc4\x9c\x31\x57\xf3\xc0\x8c\x8d\xc3\xc1\x66\x50\x87\xc1\x80\xce\xab\xe0\x33\x12\xf1\x27\xec\xfb\x67\x4a\x7f\x72\x29\x9c\x58\x4b\x90\x55\xd4\x04\xf6\x3b\x3d\x05\xd8\x04\x9b\xb9\x92\x99\x5e\xe3\x3c\x3c\x3d\xc8\x43\xa4\x65\x66\x30\x21\x22\x85\x47\xca\x45\xf9\x21\x1d\xce\x66\x12\xed\x79\x4d\xcf\x94\x2e\xbc\x22\x7c\xd6\xcf\xc5\x86\x6f\x89\xe1\x97\xf0\x30\x48\xe0\x9c\x4c\x10\x21\x28\x78\x29\xcf\xf2\xd6\x75\xcd\xef\x14\x66\xa6\xa5\xe2\x20\xc7\x33\x4a\x31\x3d\xf8\x93\x10\x1f\xb1\xa9\xd1\x9b\x62\x18\x09\x63\x62\xf0\xca\x40\x1d\x6f\x38\xce\x17\x61\x18\xa3\x7e\x66\x66\x4d\x82\xec\x18\xb8\xcd\xcc\x3c\x32\x41\x99\xd7\xce\xa7\x1d\x29\x7c\x1d\x23\x9f\xe0\x07\x8f\xc8\x24\xc8\x8a\x58\x42\x28\x85\x2b\xa4\x3a\xb1\x2e\x18\x81\x31\x29\x04\xcd\xe3\x1c\xc6\xb6\xd8\xd1\xdc\x74\x98\x87\x58\x46\xc4\xe9\x14\xce\xf1\x9f\x99\x2e\xc8\x30\xe4\xc7\x5d\x68\x08\xee\x3b\xae\xcf\xe1\xe1\xe1\x64\x32\xc1\x05\xaf\xc8\xdb\x05\x2f\xbd\xe4\x2b\xb7\x35\x8a\xf7\x45\xb9\x6b\xf2\x89\x18\x19\xae\x19\x5f\x7c\xce\x54\x96\xa5\xd6\x3a\xb5\x30\x1d\x19\x01\x07\xa3\x3c\xff\x89\xf9\x45\x83\xf0\xab\x19\xd3\x11\xe6\xd4\x25\xde\xa8\x31\x58\x42\x6a\x24\xd8\x4f\xea\xe2\x71\x90\xd4\xcb\x51\x47\xbc\x4a\x54\x15\xc3\x53\x2a\xe6\xa6\x84\x93\x98\x9e\x82\x3d\xb1\x38\x2e\xcb\x31\x1b\x5f\x4d\xd5\xc5\x31\x80\x03\x58\x0a\x4b\x52\x72\xb0\x28\x90\x28\x33\xd0\x44\x21\xb1\xbf\x38\x5a\xf3\xde\x79\xea\x74\x26\x02\x88\xbe\xf1\x83\xd4\xc5\xeb\x05\xc9\xc2\xd8\x5d\x45\x78\xc6\x3f\x9f\xf3\x1b\x5f\xd7\x14\xe9\xca\xd9\xbd\x69\x9a\xd4\xd8\xc3\xc4\x3d\xe9\x4a\xa1\x20\xec\xde\x6f\x7b\xba\x93\x4e\xc5\x99\x26\x0e\x19\x22\xd4\x11\x20\x11\x41\x94\xff\x24\xb1\x92\x8b\x15\x45\xe1\x4b\x38\x0a\x60\x3d\xa3\xf2\x20\x45\x0a\x52\x7b\x4a\x3d\xd2\x9c\x98\xc0\x6f\x40\x8a\x06\x1c\x93\xc9\xb1\x5c\xcc\x17\xfd\x8a\xdb\x27\x55\xef\x18\x0d\x33\xba\x41\x62\x8b\x38\xd5\x71\xb8\x08\xe1\x4c\x55\xc4\x67\x93\xf8\x12\xe1\x4c\xe9\xcf\x6b\x04\x34\x30\xb1\x6f\xe4\x05\xa6\x86\x3f\x81\xf6\x14\x0f\xfe\xc9\x81\x27\x65\x96\x1f\x9c\xc4\x19\x09\x56\x69\xf0\x66\x4d\xfc\x96\xdc\x35\x3d\x7f\xba\x72\x40\x48\x1e\xb6\x8c\xd1\x93\xfb\x2b\x0e\xac\x57\x90\x94\x52\x55\x55\x89\x40\xc8\xc7\x7f\x3e\xf4\x88\x41\x93\x8c\xb4\xd4\xdc\x13\x58\xc4\x4c\x49\xc3\x3f\x39\x1b\xd7\x5f\x54\x83\x58\x80\x34\x30\x15\x07\x39\x06\x47\x09\x3c\xca\xc7\x90\x2a\x96\x15\xe5\xf0\xf6\x92\x68\x95\xe1\xe1\x6a\xa7\x96\x53\x19\x1e\x3e\x2d\x10\x6d\x82\x83\xa9\x88\x79\xb8\x2e\x52\x63\xde\x91\x70\x45\x64\xd6\x98\x72\x30\x7e\x49\x04\x4b\xd8\xf7\x87\xc8\xc9\x3d\x30\x35\x3b\x49\xe9\x89\x29\x0a\x14\x01\x95\x57\x9a\xf1\xde\x54\xd7\x10\x1e\x71\xe8\x65\x78\x78\x2f\xc3\x7e\x1f\x45\xb5\xb9\xd8\x90\x13\x1e\x83\x48\x55\x77\x4d\xcf\x94\xae\x9c\xdd\x23\x10\x72\xf0\xe3\xa0\x88\x23\xc2\x15\x44\x44\xb2\xdd\x3f\x9e\xf2\x93\x77\xf1\x12\x48\x0b\x2c\x2e\x2d\x06\x59\x5c\x8a\x30\x67\xa6\xdb\x24\x34\x8f\x81\xcf\x28\x10\xf3\x88\x69\xa2\xad\x78\x09\x47\xba\xc8\xc0\x13\x44\x8e\x58\xd1\x48\x9e\x8c\xce\x62\xbc\x13\xdb\x45\xaa\x48\x19\x99\xb4\x8e\xcf\x03\x52\x32\x53\x3a\xa7\xe4\xc3\xfe\x42\x10\x5f\xc5\x3f\x09\xb6\xe1\x82\xb8\xea\x94\xbf\xf1\xe2\x79\x85\x31\x33\x26\xd2\x22\x1c\x07\x52\x3c\x29\x39\x51\x0d\xde\x76\xb1\x37\x49\x84\xc9\xf0\x10\x05\xf8\x48\x89\x07\x2e\x62\x51\x51\x0d\xa5\xd4\xf5\xbe\xe8\x25\xd2\x95\x03\xc2\x78\x6e\x48\xa4\x7c\xc8\x80\x6c\xec\xbe\x5c\xaa\xaa\x2a\x24\x46\x86\xaa\x0c\x3c\xc4\x10\x40\x42\x21\x24\x82\x11\xbe\x94\x8a\x47\xf9\xba\xc4\x9f\x62\x70\xe4\x0c\x38\xe8\xa7\x20\x4d\xb4\x89\xc8\x2c\x5e\xc5\x5b\xa3\x3c\xbe\x10\x39\x62\x62\x24\x0f\x69\xac\xa8\xcf\x98\xf8\x4e\x82\x35\x67\x1e\x93\x03\xcc\xe6\x3e\xfd\xcc\x8e\xf8\x33\x85\x2b\xfc\x27\x24\x86\x1e\xb9\xc4\x7b\x56\x54\x75\xd0\xcd\x32\x97\x38\xfc\x70\xc5\xc4\x4b\xe3\xe5\xc4\xb6\xa7\x78\xf0\xcf\x41\x7d\x7c\x76\xc2\x9a\xd2\xe7\xfa\x79\xd1\x4b\xa4\x2b\x37\x07\xe1\xa7\xf7\xa6\x9c\x89\x38\x28\x64\xc7\xed\xa5\x50\x58\x11\xe2\x51\xa1\xd8\xb6\x52\xa4\x4c\x3e\x49\x80\x34\xe9\xce\xb0\xf1\x7c\x40\x23\x5f\x0c\xe2\xa9\x00\x1a\x99\xd5\xfe\xc6\x9d\x62\x5b\x49\x3c\x16\xe0\xb6\x67\x90\x23\x1f\x3b\x62\x2d\xa2\x26\x79\x39\x1c\xc5\xf3\x3c\x1c\x72\x70\x3e\xec\x77\x19\xd1\x47\xb1\x1d\x33\x92\xc9\x35\x1c\xd4\x87\xfc\xe4\x7e\x85\x19\x44\x35\x52\x3f\xc5\xb6\xa7\xc4\x72\x53\xa4\x4a\x91\x4c\xdc\x2e\xcc\x90\x71\x95\x4c\x7f\x7d\x5a\x3c\x83\x76\x7e\x8a\xba\xc4\xde\x8f\x4e\x9b\x9a\x4d\x5e\x03\xe1\x25\xd2\x95\x5b\x11\xf2\x5b\xca\xa9\xb9\x27\xbe\x44\xd2\x57\x84\xe2\x8a\x30\x50\x26\x16\x0c\xe6\x73\x48\x23\xa1\x24\xfe\x1d\x59\x0b\x59\x39\xe1\x79\x2e\xa9\x31\x8f\x4c\x9c\x13\x47\xea\x18\xe3\x44\xc4\x15\x55\xe5\xf3\x1b\x48\x80\x10\x4f\x10\xe1\x51\x14\x69\x1d\xb9\x94\xe2\x11\x15\x80\xfd\xa0\xc6\x69\xb0\x2f\x78\x13\xb8\xf1\x79\xa6\xc8\x83\xab\x4b\x31\x44\xb6\xd4\x8c\x21\x0a\xe7\x57\x09\x44\xa5\x22\x38\xfe\x89\x4b\x71\x69\xa4\x8a\x98\x83\x5d\x85\xd7\x8e\x85\x13\x9b\x0c\xf2\xc0\xbe\x71\x30\x0f\xee\x7a\xd1\x2d\x2f\x5a\x17\xc7\x4b\x3e\x16\x44\x39\xfe\x7a\x6b\xf4\xb2\xe9\x05\x36\xbd\x42\x04\xd2\x80\xbc\x74\x22\x6f\x50\xe0\x01\x40\x86\xfd\xf8\x9f\x64\xa4\x61\x3c\x8b\x0c\x24\x91\x27\x8e\x5e\x62\x58\x1c\xf9\x53\x0c\x67\x29\x65\x48\x26\x69\x32\xd1\x07\x58\x58\x21\xd2\xc4\xe2\x62\xd5\xe3\x73\x52\xb1\x55\x64\xc3\xb0\x41\x12\x17\xaa\x2b\x66\xf2\x16\xa5\x00\x06\x87\xd7\x0c\xe6\x65\xdc\x8f\x37\x96\x88\x4d\x35\x27\x65\x19\x82\xf7\xa2\x9c\x41\x69\xa4\x46\x52\x4a\x94\x23\xf2\xf0\x06\x12\xbf\x4a\xd5\x9b\xa9\x6b\x4c\x4e\xcc\x0f\x37\x08\x33\x3a\x5f\x3f\x32\x7a\xb9\x74\x15\x81\x90\xbb\x35\x21\x3c\x8b\x04\xb6\x6f\x73\x75\x28\x1c\x7f\x13\x1e\x1c\x1d\x89\x82\x99\xd9\x34\xf9\x4b\x2e\x01\xdb\x85\x13\xa3\x61\x1e\x1d\x45\x50\xcc\x48\x10\xd1\x88\x14\xcf\x0b\xb9\x90\x3e\x38\x9f\x74\x7d\x9e\xf2\xa8\x90\xe2\x19\x29\x9c\xb0\xf1\xe6\xf3\xba\x78\xbd\x22\x27\x9f\x28\x88\x00\x46\xe4\x88\xed\xe2\x8b\x1e\xf2\x93\x48\xc3\x72\x08\xd8\x0f\x2a\xc3\x85\x63\x51\xd8\x2b\x38\x84\x93\xf6\x12\xb1\xb8\x2e\x11\xf5\x33\x3c\xa4\x21\x44\xe7\xd4\x20\xe2\xc5\x89\x0d\x07\x79\x70\xc3\x49\x5d\x98\xe7\x79\x7e\x45\xfc\x9a\x38\x5d\x39\xd3\xa7\xc2\x4a\x26\x07\xf6\x07\x1b\x8f\x05\x97\x45\x4a\xa9\xf8\x55\xee\x14\x65\x62\x34\x19\xde\x04\x2f\x39\x48\x70\x7e\xf2\x17\xa4\x00\x07\x68\x3b\x9a\xc7\x08\x22\x3f\x85\x4c\x9c\x9f\x17\xc4\x04\x28\x2a\xe5\xb1\x56\xa4\x54\xdc\xc1\xc2\x71\x22\xce\xc1\xc9\x9a\x20\xcf\x33\xd8\x64\x60\x3d\xc5\xd1\x85\xc8\x11\x5b\xca\xfb\x2b\x55\x51\x86\x01\x57\x84\xf5\x21\x2d\xca\xff\xc4\xca\x60\x39\x22\x70\x72\x9d\x33\xd2\x44\xfe\x54\x3a\x25\x87\xfc\x8c\x6c\x6a\x47\x19\x1e\x91\x52\x9d\x2e\x72\xe2\x5a\x44\x99\x19\x9e\xd4\x37\xba\x23\xc3\xf5\x0d\xc2\xcb\xa5\x2b\x07\x84\x64\x5a\x94\x72\x62\x32\x2c\xaf\x08\xf2\x71\xba\xd0\x1b\x14\xa9\x39\x23\x9f\xc9\xc2\xfe\xd4\x15\x58\x30\xcd\x4c\x26\x44\xbc\xc4\x97\xc4\xea\x78\xd5\xa4\x20\xd1\x47\xac\x9a\x08\x49\xf1\x70\xf9\x58\xa0\xdf\x7d\x7e\x48\x94\x89\x63\x10\x8f\xbf\xdc\xc2\x19\x1e\x2e\x50\xd4\x47\xbc\x2a\x76\x01\x41\x17\x72\x35\x55\x56\xac\x94\x17\x11\x75\x10\x1b\x98\xf9\xc9\x95\xc9\x33\x93\xaa\xb9\xf5\xf2\x42\x32\x72\xc4\x84\xe8\xc9\x63\xbc\x9d\x74\xbd\x4f\x2f\xac\x81\x79\x26\xf1\xc6\x94\xe3\xa5\x78\xa2\xc7\x8a\x2d\x8a\x8e\x7a\x0d\x84\x97\x4b\x57\x0e\x08\xc3\x03\x26\xd1\xab\x52\x41\x3c\xf2\x44\x7f\x12\xe7\x59\x97\x4e\xf1\xc1\xd1\xf0\x33\x33\x68\xf3\x03\x98\xfc\x55\x6c\xd7\x4e\x8c\xc8\x3c\x3e\xe6\xa3\x61\x20\x0e\x90\xa9\x26\x88\xfa\x93\x10\x43\x0a\xe2\x16\xf1\x5e\xc6\x99\x5c\x7e\x46\x07\xcf\x88\x37\x73\x50\x26\xb7\x92\x28\x56\x34\x48\x5e\x67\x11\x98\x49\xb2\x86\x2f\x97\x00\x00\x20\x00\x49\x44\x41\x54\x5d\xf9\x80\xcb\xdb\x9e\xa9\x37\x0a\xc4\x97\xf8\x4c\x05\xcb\x89\xcc\x83\xeb\xa7\x54\x13\x38\x11\xf5\xb8\xd3\x62\x1d\x44\x99\x6a\x7f\xe1\x4e\x94\x27\x93\x1e\x6e\x8a\x31\x3c\xbc\x5d\x79\x95\x44\xfd\xc7\x98\x02\xeb\x83\x2d\x1f\x14\xb8\x06\xc2\xcb\xa5\x2b\x77\x8f\x90\x3c\x69\x09\x69\xff\x23\xf9\x78\x24\x6b\xad\xf9\xfb\x88\x97\x42\x83\x5b\xa3\x79\x52\xec\xd6\x91\x18\x50\xc4\xf8\x12\xe6\x04\x64\x04\x02\x1b\x8d\x90\x0d\x58\xa9\x81\x9d\x92\x93\x09\x76\xa9\x1c\x5e\x8a\x07\x71\x52\x30\x15\xd0\x81\x59\xcc\xef\xdf\xc5\x21\x45\x62\x9c\x1d\xe4\x01\x06\x66\x44\xbe\xa8\x2a\x2e\xc2\xf5\xc1\x72\xb8\x19\xb1\x3e\x44\x0e\x0f\xe2\x44\x73\x5e\x5c\xf4\x22\xde\x29\x98\x5f\x74\x18\x72\x29\x45\x04\x81\x88\x3d\xf3\x65\x49\x73\x44\x8f\x22\x72\x2e\x9a\x4e\x11\xb7\x33\x6f\xef\x53\xa4\xf9\xad\x07\xa2\x8c\xd6\xfa\xfa\x91\xd1\xcb\xa5\x0b\x5b\xff\xa2\xe7\x7f\x5f\x54\xf2\x6a\xb5\x1a\xe4\x24\x11\x9c\x7b\x2a\xf1\xb3\x67\xad\x73\x86\x32\x9f\x24\x14\x63\x0d\xb0\xb8\x99\x42\x17\xcc\x8c\x85\xa4\xa2\x76\x06\x3b\x31\x10\x66\xea\x82\x7d\xcb\x73\x39\x22\xee\xf2\x06\x8a\x0a\xc0\x7e\xf4\xe4\xf2\x79\x48\xe5\x7a\x8a\x05\x23\x33\x07\xbf\x70\xe7\x86\x60\x21\x2f\x4e\xd6\x6a\xdc\x26\xa9\xa5\x12\x91\x20\xb6\x28\x05\x54\xa9\x8a\x78\x75\x29\x48\x03\x66\x58\xee\x72\xf9\xe2\x5c\x93\x14\x0a\x8a\x45\x38\xf2\xe1\x5e\xc0\x99\xd1\x20\xa2\xfc\x41\x5f\x22\x97\xf2\x88\x2b\x4e\x50\xf2\x89\xf1\x10\x9e\xaa\x71\x90\xe7\xe4\xe4\xe4\xe9\x84\x13\xba\xc4\x58\xf7\x42\x4b\x2e\xc6\x7f\xa8\xe2\x42\x72\x03\x3d\xc5\xf7\x35\x8c\x31\x62\x28\x89\x43\x08\x87\x24\x12\xc1\x63\x26\x00\xcc\x66\xb3\xb0\x1a\xbb\xdc\x6f\x82\x84\xf3\x03\xe3\xb7\xd4\xf3\x53\x72\x91\x78\x0c\x15\xc1\x06\x87\x80\x14\xe6\xf1\x70\x0f\x08\x6b\x39\x33\x11\xce\x7f\x12\x74\x49\x55\x2a\x32\x70\x66\xae\x1b\x48\xd8\xc0\x83\xa9\xa8\x33\x91\x2f\x02\x03\xfe\x4b\xd0\x22\x03\x06\xa9\x49\x86\xb8\x84\x12\xf5\x49\x45\x76\x5c\xa9\x88\x9d\x22\x3f\xee\x74\xd1\xa9\xf2\xed\x12\x85\xa4\xbc\x4b\x14\x85\x7f\xf2\xb6\x90\xab\x64\x5a\x40\x7a\x81\x18\x81\xb7\x8b\x17\xc7\x72\xf0\x44\x2a\xcf\x33\x28\x8a\x98\x9d\x73\xe2\x46\x71\x09\x98\x87\xdc\xd2\xe6\x45\xf2\xcf\x8b\x5e\x85\xaf\x14\xbd\xf4\x92\xaf\xee\x3d\x42\x90\xe2\x08\xc6\xc2\x54\x98\x50\x4a\x69\xad\xc7\x7c\x1d\xfe\x39\x90\xda\xed\xfe\xa7\x5a\x44\x32\x53\x70\xc2\x8b\x88\x13\x79\x51\x5a\x7e\xbd\x02\xbb\xe3\xca\xa2\x49\x39\x4f\x0a\x3e\x61\x17\x59\x52\xe8\x95\x62\xe0\xf2\x53\xc1\x4b\x54\xcc\xef\x53\x46\x72\x94\x4f\x84\x78\x46\x44\xf9\xcc\x34\x05\xf3\x13\x7c\x25\x3e\x99\x72\x51\xde\xa8\x88\x10\x98\x87\x14\xcc\xc0\x03\x48\x1b\x21\xa4\x0a\x7e\x95\x67\x12\x21\x29\x77\xc5\xc0\x49\xd4\xe6\xcb\x29\x40\xee\x2a\xfa\x2d\xaf\x2b\xef\x4e\x44\x5b\x51\xe7\xd8\x89\x79\x1e\xdc\x8f\x18\x47\xa3\xaa\x29\x67\xe0\x2a\xe1\x1a\x09\x4f\x7c\x89\x10\x0b\x24\x1a\x8a\x36\xb9\xa6\xe7\x46\x57\x0e\x08\xf9\x17\xe7\x09\x03\x09\x64\xb0\x3f\xc1\x0f\x14\xee\x11\x8e\x09\x91\xcf\x81\xf0\x6d\x70\x11\x51\x52\x05\x79\xd4\x20\x83\x59\x34\x11\x1f\xa2\xf9\x2a\xb8\x1a\xe2\xb0\xcc\x30\xa4\xfa\x28\xff\x53\x84\x22\x62\x19\xde\x34\x02\x1e\xa9\x46\x65\x70\x8e\x6b\x85\x13\xa9\x82\x99\xba\x20\x6d\xe7\x91\xa0\x42\x78\xf2\xe0\x77\xa1\x9f\x62\x71\xa2\x73\xaa\x0a\xd1\xfd\xc8\x88\xcb\x68\x98\xb7\x18\x69\x20\xe9\x82\x41\x21\x9c\x99\xeb\x93\x41\x2f\x9e\xf8\x54\xe4\xe0\x9f\xf9\x59\x0b\x29\x7e\xfd\x06\xe1\xa5\xd3\x55\xbc\x43\x5b\x55\x55\xf8\x06\x05\x8e\x98\x98\x01\xc7\x29\xe7\x5c\xd8\x4d\xe5\xf3\x3b\x6b\xed\x55\xb8\x05\xcd\x1f\xff\x49\x11\x0f\x3d\x38\x40\x90\x06\x42\xc2\x32\x29\xc9\xa9\x9f\x99\x58\x1f\x07\x30\x0e\xd0\xe4\x67\xa6\x0a\xb5\xbf\xb9\x47\x7e\x8a\x15\x29\xb6\x76\xf4\x68\x31\x11\x73\x62\xc3\x33\x81\x12\xd7\xa8\xa4\x5d\x2c\x95\xde\xdc\x23\x3c\x44\x67\xd2\x11\x1c\x3c\x44\x39\x5c\x5b\x9c\x49\x22\x32\x6f\x35\xaf\x2b\xd5\x3a\xde\x2e\x2c\x96\xd7\x8b\x75\x1e\x6c\xa6\x58\x17\x37\x29\xe1\x01\xe6\x72\x23\x79\xb0\x4d\x44\xf5\x32\xfd\xf5\x29\xf2\x88\x9c\x23\xe5\x00\xfb\x76\x26\xe7\xb9\x06\xc2\x4b\xa7\x2b\xd7\x01\x4a\xa9\xaa\xaa\x78\xf4\xc1\xe1\x0f\xff\x24\x60\x10\x17\x85\xc6\x98\x2b\xb2\x3b\xfa\x74\x0f\x46\x93\xf8\x98\x61\xe0\x00\x79\x21\x39\x62\x8c\xce\x23\x13\x24\x42\x2a\x29\x3b\x18\x59\x22\x7f\x9c\x41\x93\xfe\xe5\x69\xa2\x36\x57\x8c\x30\xe0\xb9\x79\xa6\x21\xb0\x1f\x79\xa3\x17\xa5\x14\x26\x92\x45\x1e\xae\xf3\x20\x34\x92\xab\x24\x07\xf7\x72\xa6\x6a\x60\xd6\x4e\x69\x82\xe7\x34\x62\x04\xe7\x7a\x12\x2b\x89\xda\x8a\x3c\x44\x13\x8e\x28\xa2\x92\x1c\x29\xb1\xc0\xbc\xce\x98\x27\xaf\x73\x46\x0e\xf6\x22\x52\xfb\xc8\xba\x78\x74\x22\x3c\x5a\xeb\x7c\x6f\x5e\xd3\x73\xa0\x2b\x07\x84\x00\x30\x9d\x4e\x21\xbd\xf5\x17\x33\x39\x16\x62\x7f\x0a\xb7\x09\x53\x81\xe6\x79\x52\x59\x96\x19\x0c\x10\xd3\x83\x84\x8d\x90\x11\xcb\x41\x2b\x10\xc1\x06\x8e\x3a\x29\xf0\xc0\x12\x52\xd3\xf9\x0c\xb2\xf2\x4a\x79\x1a\x57\x91\xb1\x1b\x11\x48\x74\x16\xdd\x23\xa5\x12\x69\x3b\x91\x90\xe7\xe1\x02\x89\x1d\xf0\xa5\x4c\x8e\xd8\x22\x92\x89\x71\x8b\xd4\x9b\xaf\x0b\x13\xe1\xc4\x0a\x88\x20\xe1\xd1\x34\x25\x25\x76\x0c\x8f\x98\x2f\xfa\xa4\xc8\x83\x1b\x95\xaf\x8b\xf0\xc4\x76\xf1\x52\x9c\x87\xc8\x21\xee\x9d\xc2\xfb\x4c\x5d\x7e\xf7\x2a\x7d\x86\xe7\x7a\x39\x78\x15\xe8\xf2\x77\x0e\x39\x4d\x26\x13\x31\x94\xf3\xb8\x96\x8a\x17\x31\x71\x15\xde\x26\xc4\x1f\x9e\x16\x87\x1c\x21\x32\xfc\x62\x29\x1e\x04\x45\xc8\xe1\x15\x71\x36\x1e\xac\xb1\xf0\x8c\x58\x9e\x9f\xaa\x3d\x23\x81\xb4\x85\x44\x9c\x41\x21\xfc\xfb\x24\x19\x4d\xf8\xd5\x58\x17\x0f\xa6\xa2\x3e\xb8\x60\x0c\x61\xb0\xdf\x29\x20\x45\x3a\x62\x64\x1e\x55\xc5\xae\x4c\x21\x0d\xd1\xd9\xb3\x15\x15\x69\x0b\x29\x9b\xc2\x3c\x51\xe1\x28\x2a\x15\xfd\xf1\x5f\xa2\x21\x69\xb8\x58\x2f\x49\x64\x06\x45\x46\x01\x5c\x85\xa8\x2d\xaf\x85\x9b\x48\xd4\x44\x9c\x58\xe4\xed\x93\xb1\x61\xea\x4c\x99\x48\xd7\x40\x78\x15\xe8\x2a\xf6\x41\x51\x14\x45\x51\x70\xc0\x8b\x0c\x04\x02\xc9\x37\x5a\x23\x9b\xd6\x3a\x1c\x78\x7d\xb9\xa4\x12\xc7\x46\x88\xc8\x94\x22\x0e\x54\xa2\x28\x11\x44\x45\xf9\xd8\xb6\xfc\x12\x47\xbb\x54\xa8\xe5\x21\x83\x63\x03\x16\x22\xd6\xc8\x79\xb0\xfc\xcc\xd4\x41\x54\x95\x24\xb0\x9e\xf8\x2a\x21\x5c\x97\x18\x07\x79\x03\xb9\x4f\x82\xd4\x3b\xf8\x6a\x48\xa8\xec\x62\x97\x67\x46\xe5\x49\x8d\xc4\x38\x04\x96\x46\xca\x17\xe1\x9c\xd4\xcb\x0b\x72\xb3\x64\x1c\x83\x14\x4c\xcd\x06\xc6\x10\x5e\x4e\x91\xa5\x15\xd1\x8a\x5c\xc5\x45\x32\x3c\x83\x72\x20\xed\x1e\x0a\x11\xec\x0c\x8b\xdf\xa6\xe7\x04\xd7\x40\x78\x35\xe8\x2a\xf6\x81\xd6\xba\xae\x6b\x12\xa9\x49\xf4\xc1\x57\x23\x16\x62\x4f\x55\x4a\x69\xad\x2f\x3a\xcc\x9e\x11\x8d\x3c\x2e\x27\x52\x2a\xa6\x88\xd1\x1c\xd2\x77\x59\xc4\xba\xc4\xb0\x85\x8b\x67\xa0\x45\x44\x4d\xac\x67\x26\x5c\x8a\x75\x01\xeb\xd9\x3c\x33\xa0\x4e\x17\x15\x23\xb1\x9b\x33\xa7\x88\x33\x47\xd0\x02\xe6\x87\xd8\x86\xa4\x2d\x1c\x36\x38\x62\x41\x1a\x27\xb8\x41\x52\x66\x49\x5d\x22\x42\x78\x26\x87\x37\xdc\x71\x62\xd7\x60\x1e\xde\x5e\x6c\x22\x2e\x87\x67\x8a\x3c\x5c\xd5\x14\x73\xbe\xac\xf8\x33\xe5\x72\x79\x9e\x14\xe0\x41\x62\xae\x29\xaa\x44\x36\x30\x08\xcf\xf5\x0d\xc2\x2b\x42\x57\x11\x08\x41\xba\x4d\x48\x22\x14\xec\xbf\xfd\xe6\xf7\x67\x5e\x51\xce\x15\xf1\x33\xfc\x72\x24\x27\x31\x0a\x88\x97\x32\x03\x55\x9c\xcc\x7a\x69\x67\x89\xff\x25\x21\x20\xc2\x2a\x19\xdb\x21\x9a\x8b\x01\x0e\xa4\x40\x20\x06\x6b\x2e\x07\xf6\xfb\x97\x90\xc8\x43\x4c\x14\x05\x12\x06\xd1\x8c\x79\x9d\x33\x3c\x8a\x6d\xf4\x0d\x16\x27\xb6\x12\x4d\xc7\xfb\x22\x26\x52\x7d\x2a\x5e\x1a\x63\x7f\x1c\xbe\x49\x57\x8a\x91\x9d\x28\x96\x59\xe4\x91\x2a\x48\xbe\x92\xf6\x81\xc9\x25\xa2\x3f\x59\xe7\x71\x1e\x22\x21\x65\x7f\xbc\xd4\x13\xfb\x2b\xcf\x83\x9b\x80\xe5\x8b\xfd\x9e\xfa\x99\xb1\xf3\x15\x09\x50\xd7\x74\x45\x81\x70\x36\x9b\x71\xef\xe7\x23\x93\x13\xd9\x06\xb9\x22\x87\xf8\xe1\xe7\x60\xf3\x94\x1a\xcf\x21\x21\x46\x90\x54\xc1\x54\xe4\x22\x9c\x3c\x02\xa6\x98\x45\x86\x7c\xa6\x18\x2f\x32\x61\x6b\x30\x21\xd6\x2b\x0a\xe4\x6d\x27\x1e\x95\x29\xce\x57\xde\xe2\xdf\xd4\x25\x62\x7f\xb1\x6b\x22\x27\x0e\xf7\x99\x59\xcb\x48\x39\xb1\xed\xa9\xae\xe4\x1d\x4d\x38\x53\x7b\x80\x4f\x41\x62\x17\xf0\x1a\x53\x94\x72\x7b\x60\xfa\x73\xf4\xe5\x3e\x40\x36\x2d\xc5\x36\x62\x1e\xae\x06\xe6\x49\x35\x90\xc8\x8f\x4f\xca\x10\x7e\x1c\xa0\x46\x58\xe2\x9a\x9e\x39\x5d\xd1\x6e\x28\xcb\x92\xac\xa2\x70\xf0\xc2\x09\xb7\x4f\xc0\xbc\x33\xbe\xa1\x7f\x89\x44\xee\x11\x66\xc2\x50\xa0\x41\x85\x53\x58\xc2\xcb\x8a\x08\xc1\xb7\xc2\x52\x20\x41\x2e\xa5\x14\x16\x41\x05\x07\xe5\x94\xd8\x4c\xbc\x26\x09\xb1\x14\xaf\x8e\xeb\x4c\x88\x33\x73\xc9\xa4\xc9\x64\xf9\x45\xca\x8a\x62\x33\x35\x12\x21\xc4\xb6\xa9\xee\xe3\xd6\x48\x75\x07\xd6\x59\xac\x2b\x65\x81\xf1\x3c\xe3\x19\x80\x19\x13\x98\x8b\x0e\xe2\x2e\x37\x0b\x47\x23\x2e\x44\xf4\x2e\x90\x2c\x39\x9e\x47\x84\x34\x5e\x30\x52\xea\xc1\xae\x48\xd7\x40\x78\x45\xe8\x8a\x76\x83\x52\x6a\x3e\x9f\x87\x34\x8f\x50\x91\xc2\xee\x68\x80\x40\xec\xb5\x0a\xd1\x55\x58\x14\x1a\x63\x8c\x31\x83\x6c\xe3\xe3\x7b\x66\xb4\x63\x23\x88\xe3\x99\x18\x0a\x97\xc2\xc3\x3b\x03\x1b\x1c\x30\xb8\x04\x40\x88\xeb\xb3\x37\xc9\x48\xff\x66\x2a\x4a\xb5\x74\xd0\x6e\xb0\xbf\x3e\xcb\xf0\xc0\xbe\x8f\xf1\xaa\xb1\x9e\xbc\xc9\xbc\xed\xbc\xbd\x9c\x48\xef\x90\x84\x4a\x3c\xf1\x48\x7e\x66\xcc\x08\x92\xe7\x90\xfc\xf1\xdd\x2d\x36\x2a\x25\xc7\x4b\xd0\x9e\x52\x35\x95\x2f\x36\x93\x57\x94\x92\x43\xf8\x31\x70\x7a\x89\x38\x8f\xc8\x99\xd2\x07\xff\x8c\x87\x0c\xa7\x78\xae\x81\xf0\x8a\xd0\xd5\xed\x86\xf9\x7c\x4e\xe0\x8d\x0c\x92\xe8\x6a\x31\x11\x17\x85\x98\x94\x52\x45\x51\x8c\xc1\xa1\x67\x4a\xf1\x79\x19\xcf\x82\xd4\x18\xf2\x2c\x36\x85\x84\x88\x88\x7e\x3f\x94\x90\xf1\x2c\xae\x15\x70\x1a\xc7\x02\x52\x0b\x4f\x93\xa9\xb1\x67\xf1\x28\x25\x1f\xab\x27\x82\x04\xe1\x8f\x24\xde\x0c\xe6\x56\xe5\x32\x45\x1b\x92\xb8\x16\xf5\xc9\x6f\x91\xf1\x25\x35\x48\x5d\x40\x6a\xc9\xe8\xc3\x05\x8a\xcb\x50\x9f\xde\x06\x84\xb4\x25\x71\x73\x88\x1a\xa9\x9e\xcd\xf0\x70\x58\xca\xc8\xc9\x7b\xce\x98\x5e\x13\x75\x26\x1d\x44\xb4\xe2\xdd\xc7\xd5\x8e\x75\xa9\x7d\x12\x79\xb8\x9c\x68\x4c\x9c\xc3\x95\x8f\x0f\xf1\x11\x9e\x90\xb8\xbe\x41\x78\x75\x48\x1d\x1d\x1d\x5d\xb6\x0e\x32\x79\xef\xdf\x7f\xff\xfd\xbe\xef\xb5\xd6\xe1\x55\x3c\x9c\xc0\x3f\x8d\x31\xc5\x3e\x45\x09\x91\xac\xb5\x6d\xdb\x3e\x1d\x08\x7d\x2a\xf4\xf8\xf1\xe3\xd3\xd3\x53\x32\x12\x52\xc3\x23\x14\x21\xa1\x10\x13\x07\x98\x38\x6e\x53\xf8\x31\x18\x8b\xcb\xb2\xe4\x81\x20\xa5\xc0\x18\xb6\x91\x97\x06\x7f\x12\xea\xba\x2e\x9c\x19\x34\x52\xab\x0c\xcf\x60\x18\xca\x30\xa4\x20\x47\xcc\xc1\x75\x8d\xc1\x89\xfc\x4f\x85\x1e\xdb\x19\x29\x61\x64\xf1\x0b\x89\x7d\x3a\x39\x55\x55\x91\x4b\x19\x4b\x0e\x1a\x6d\x3c\x7d\x8a\x90\x33\x52\x94\x73\xae\x69\x9a\x0c\x43\x51\x14\xe3\xcf\x5f\xbc\xa6\x67\x4a\x17\xde\x33\x7c\x9e\xdf\xd7\xd8\x6c\x36\x1f\x7d\xf4\x11\x48\x9b\x33\x9c\xf0\x9d\xc2\xf8\x2d\xa7\xe8\xb2\xc6\x98\xb2\x2c\x27\x93\x49\x7e\x69\xf8\xec\xbe\x09\xb2\x5c\x2e\x43\xc2\x67\x9f\x8f\x18\x24\x52\x3c\x95\x20\x45\xc6\xc8\xf1\xec\xbd\x2e\x71\x69\x92\x12\x35\x06\x8f\x45\xe1\x62\x41\x2e\x27\xd3\x22\xae\xb9\x98\x29\xfe\xcc\xf0\xf0\x4b\x80\xec\x26\xae\x66\xa2\x40\x22\x1c\x63\x83\x28\x3f\xa5\x06\x91\x86\x9b\xcf\x6b\x49\xb5\x8b\xa7\x33\xaa\xa6\xf2\xf3\x8a\xe5\xd5\xc3\x3d\x82\x3b\x28\xd5\xc0\x88\x82\xdc\x7a\x62\x41\xde\x47\xa4\xb1\x29\xb3\x67\xe4\xa4\x78\x88\x56\xa2\x0f\x84\x44\x3c\xcd\x83\xb0\x45\x9e\x1b\x37\x6e\x4c\x26\x13\xc8\xd2\x15\xf9\x4a\xd1\x4b\x2f\xf9\xea\x6e\x8d\x02\xc0\x9d\x3b\x77\xc2\xbb\x80\x18\x05\xc3\x25\x9c\xe3\xd9\x23\x33\x9e\x9d\xf9\xa4\x94\x32\xc6\x34\x4d\x93\x8a\xe6\xcf\x9a\xf2\x6f\x50\x60\x12\x47\x57\xbc\x44\x82\x5a\x4c\xc4\xf6\x62\x20\x21\x6c\xf9\x2a\x08\xec\x81\x14\x56\x70\xf1\xd8\x1d\x44\x25\x1c\x52\x79\x08\xc0\xe9\x4c\x41\x72\x35\x85\xa6\xf9\x16\x45\xb1\x22\x0f\x37\x14\xd1\x8d\x57\x91\x42\x41\xa2\x7c\x46\x9f\x8c\x7c\x91\x33\xc3\xc3\x81\x81\x4b\x20\xa3\x40\x14\xc5\x11\x28\x6f\x93\x14\x4f\xc6\xe5\x52\x02\xe5\xb6\x8d\x56\x4c\x84\x4f\x02\xb7\x22\x52\x02\x33\x17\x97\x93\xe2\x11\xbb\x1e\x90\x0f\xc4\x04\xff\x0a\x29\xe6\x81\x8b\x1c\xc7\x7f\x4d\xcf\x9a\xae\x34\x10\xd6\x75\x7d\xeb\xd6\x2d\x2f\x11\x48\xab\x43\xe7\x9c\xb5\x16\x3f\x3e\xca\x03\xc1\x65\x61\x61\x51\x14\x99\x1b\xe3\x19\x95\x30\x9c\x64\xe2\x0b\x86\x25\x51\x38\x09\x07\x04\x84\x7c\xe2\x45\xcc\x0c\xa5\xd0\x02\x27\xf2\x01\x31\xf5\x93\x20\x3a\x86\x1f\x02\xae\x1c\x6b\x71\x3e\xf7\x96\xc1\x46\x0d\x32\x63\x7d\x48\x29\x92\x89\x7f\x12\xb3\x10\xf9\x19\xf8\xc9\xcb\x49\x55\x9d\xd2\x3c\x35\x27\xc0\x8a\xc5\x6e\x4d\x35\x93\xf0\x88\x72\x80\xa1\xc8\x18\x1e\xdc\x16\xd1\x19\x52\x58\xc5\x87\x79\x6a\x06\x80\xe5\xf0\x96\x66\xe4\x60\x1e\x6c\x4f\xa2\x33\xae\x0b\x3f\xc4\xce\xe5\xd4\x75\x7d\xfd\xa4\xcc\xd5\xa1\xcb\x7f\xc7\x2e\x4f\xaf\xbf\xfe\xfa\xe3\xc7\x8f\x07\xf1\x2f\xf8\x59\x58\x3e\x5a\x6b\xe3\x4f\x32\x02\x8d\x31\x5d\xd7\x29\xa5\xc2\xc7\xeb\x9f\x33\x95\x65\x89\xef\x19\xf0\x40\x23\x12\x99\x84\x92\x00\xca\xe3\x32\x61\xe6\xf3\x65\x48\xc4\x5c\x8e\x31\x9c\x21\x2f\x21\xa5\x6d\xaa\xba\x8c\x9c\x3c\x64\xe2\x9c\xf1\xf0\x06\x89\x10\x2c\xca\x51\xd2\xca\x3b\x46\xbd\x41\x18\xe3\xc5\xfd\xfe\x2e\x05\xd7\x87\x47\x58\x3e\x59\x49\x39\x4c\x8a\x8d\x7b\x0b\xa0\xd0\xcc\x15\x16\x5b\x4d\x2a\x52\x89\xf5\xd3\x18\x7d\xb8\x28\xb1\x39\xc0\xac\x2a\xc2\x0f\xa4\xfb\x22\xc5\xc3\xed\x93\x2a\xc2\xf5\xcc\x88\x15\x13\xa9\x81\x19\x12\xd7\xcb\xc1\x2b\x45\x57\x7d\x4a\x32\x9d\x4e\x6f\xdc\xb8\xe1\xd1\xd3\xa1\x38\x5e\x63\x2c\xc4\xcb\xc1\x90\x26\x23\x24\x50\x51\x14\x5d\xd7\x85\xef\x1d\x3e\x4f\x52\x4a\x61\xd7\x1f\x13\xbe\x09\x5b\x0a\x0c\xc8\x80\x14\x67\xd9\xc4\x6e\x99\x5a\x70\x59\x91\x87\x84\x6c\x2c\x3f\x23\x6a\x8c\xb4\x98\xcf\x43\x9b\xa8\x30\x8f\x35\xe4\x52\x8a\x07\x90\x41\xb8\x65\xf8\x8c\x21\xf2\x70\xcc\xe3\x90\x23\xe2\xa2\xd8\x3a\xbf\xbf\xb4\x22\x8e\x3d\x38\xa5\x88\xbd\x9f\xb7\x55\xf4\xfc\xf8\x73\x50\x14\xef\xaf\x4c\x3e\x31\x54\x4a\x08\x66\x4b\x75\x87\xd8\xd2\xc1\x46\x29\x44\xb8\x88\xc8\x43\xaa\xc3\x57\x39\x1b\x97\x36\x92\x07\x00\xf8\x71\xff\x6a\x9f\x2e\x65\x2e\x7e\x4d\x29\xba\xea\x40\xa8\x94\xba\x7b\xf7\xae\xda\x2d\x7d\x38\x1c\x12\x50\x24\x88\x08\x6c\xbb\x23\x3c\x65\xba\xd9\x6c\x9e\xff\xd7\x0a\x53\x73\xc0\x3c\xda\xe5\xf9\x03\x91\x10\x20\xca\xc4\x97\x32\x6c\x63\x28\x15\xf4\x33\x58\x98\xa9\x28\xf5\x53\x94\x86\x23\x66\xe8\x59\xc2\xc0\x83\x6f\x46\x14\x97\x09\xe9\x60\x2d\x5e\x22\x21\x15\x86\x56\x7e\x79\x95\xc4\xf0\x0a\x12\x02\x65\x4c\x0d\x43\xdd\x9a\x31\x51\x5e\x0e\x31\x54\xbe\x6a\x52\x36\x55\x69\x7e\x56\x91\x91\x93\xd7\x7c\x0c\x0f\xef\x8b\x41\x2f\x15\x79\xc4\x5a\xc2\x36\x55\x4a\x8e\xda\x9f\x16\x5f\xd3\xa5\xd3\x55\x07\x42\x00\x98\x4e\xa7\xaf\xbc\xf2\x0a\x47\x41\x8f\x6e\x47\xe3\x37\xeb\x23\x16\x06\x02\x36\x89\x0b\x58\xb8\x5a\xad\x9e\x33\x16\x8e\x9f\x03\x8e\x89\x92\x63\x62\xab\x18\xd3\x55\x7a\x67\x09\x17\xcc\x04\xa3\x54\x3a\x56\x27\xe6\xf3\x74\xaa\xa5\xa2\x6e\x5c\x0e\x8f\xcb\x24\x93\x24\x48\x60\x52\x68\x63\x59\xac\x8b\xc7\x3e\x9c\x93\xd2\x8d\xd7\xeb\x77\xcb\x3b\x9c\x9f\x0a\xfa\x62\x54\xe5\xfa\x88\x38\x4d\x4c\x91\xca\xc7\x97\xf8\x14\x8a\x57\xcd\x99\x39\x3d\xb5\x9c\x94\x4c\x9e\x9f\x72\x18\x6e\x5b\xde\xf6\x14\x0f\x36\x66\x74\x0f\xd1\x7f\xf2\x3c\xd8\xc1\x02\xe1\x4f\xe2\x70\x39\xe4\x55\xa5\x6b\xba\x74\x7a\x01\x80\x10\x00\xee\xde\xbd\x1b\x3e\xcc\x14\x1f\x0a\x8d\x7e\x16\x13\xc1\x3b\x39\x16\x92\x07\x67\x02\x05\x2c\x5c\x2e\x97\xcf\x73\x8f\x74\xfc\x7b\xfd\xf9\x41\x92\x8a\x11\x78\xac\xa6\x78\xc4\x44\x24\x7e\x1c\x41\x2a\x9e\x12\x39\xa9\x30\xe4\xf7\xb7\x13\xf3\xcb\x1a\x31\xb8\x88\x3c\xe2\x9a\x2c\xa5\x0f\xce\xc4\xae\x22\x86\xc5\x94\x7d\x52\x46\xe3\xf6\x11\xe1\xca\xb3\x6d\xd5\x8c\x1c\xf1\x52\x7e\x1a\x94\x87\x01\x9c\x99\x07\xaa\x58\x97\xc8\x2f\x56\x3d\x52\x67\x11\xf8\x31\xa5\x2a\x1d\x44\x4d\xcf\xa6\x05\x7c\x29\x96\xe2\xe1\x3a\xc4\x19\x33\xd9\x49\x1a\xe4\xc1\x24\x3e\x26\x83\xe5\xd4\x75\x7d\x0d\x84\x57\x8a\x5e\x0c\x20\x2c\x8a\xe2\xf3\x9f\xff\x3c\x3e\x44\xc6\xb3\x33\x65\x62\x74\xe3\x37\x0b\x39\x16\x86\xf7\xf1\x8b\xa2\x58\xad\x56\xf9\x97\x5e\x3f\x5d\x0a\x87\x8e\x66\x22\x08\xcf\x14\x63\x34\xa6\x54\x88\x4c\xe5\x64\x46\x60\x06\xf6\x80\xcd\xa3\x07\x39\xb9\xce\x29\xdd\xe2\x84\x5d\xc4\xaa\xc1\x16\xe5\x73\x32\xe0\xc7\x9b\x23\x96\xe2\x97\x44\xc5\x38\x33\xf9\xcb\xb1\x30\xdf\x40\xb1\x76\x5e\x5d\x4a\x79\x9c\xe6\x90\xcc\xf5\x04\x04\x21\x98\x9f\x88\x15\x79\x52\xd5\x89\xc6\xe1\x3f\x45\x21\xf9\x74\x24\x32\xf3\xc3\x09\x92\x29\x02\x5b\x46\x99\xbc\x9f\x8b\x7d\x14\xcc\x32\xf8\x3d\xf0\xeb\x1b\x84\x57\x8d\xae\xfa\x53\xa3\x91\x6e\xdd\xba\x75\xe7\xce\x9d\xa3\xa3\x23\x3c\xcf\xc2\xbe\x18\xd1\x2e\xfc\x24\xbe\x88\xe7\x71\x81\xc2\x61\xdc\xde\xfb\xcd\x66\x63\xad\x9d\x4e\xa7\xcf\x7a\x8e\xa6\x94\xaa\xeb\x3a\x83\xbb\x5e\x5a\x43\x64\xd2\xb0\x1f\xfb\x52\x3c\xbc\x16\x60\x11\x10\x18\x54\x44\x39\x38\x4a\x92\x50\xc8\x79\x06\xf3\xc5\xf6\x72\xb1\xbc\x16\xa2\x27\x9f\xf5\x8b\x55\x44\x22\x46\xcb\xac\x53\xc7\x10\x36\x05\x17\x12\xdb\xce\x2d\xc0\xd7\x37\x9e\xdd\x53\x24\x69\xdc\x5e\x91\x27\xb2\x45\x39\x29\x64\xc5\x9c\xa2\x56\x19\x18\x83\xfd\x1e\xc9\xcb\xe1\xa5\x14\xda\x9c\x14\x41\x94\x0b\x17\xad\x21\x2a\xc0\xc1\x9e\xdb\x6a\x90\x07\xd7\xc8\x75\x26\x94\xe2\x51\xbb\x37\x91\xf8\xa8\xc1\x65\xc5\x2f\x75\x5f\xd3\x25\xd2\x0b\x03\x84\x00\xf0\xf9\xcf\x7f\x7e\xb9\x5c\xb6\x6d\xab\x94\x8a\xaf\x4c\x84\x43\x64\xc4\x23\x46\xf1\x8b\x71\xd6\xda\x80\x7c\x78\x5c\x69\xad\xcb\xb2\xd4\x5a\xf7\x7d\x7f\x7a\x7a\x1a\x8f\xf9\x7e\x76\x74\xd1\x99\x20\x06\x7b\x11\xff\xf0\x30\x1b\xe4\xc1\x03\x72\x0c\x90\x8c\x44\x53\x51\x42\x1e\x5d\xb0\xce\x79\x86\x31\xda\x8a\x50\x04\xe9\x3b\xa0\x79\x05\x38\xb6\x71\x14\x49\x4d\x35\x70\x3e\x4e\xa4\x20\x3f\x35\xd7\x21\x3c\xbc\x8b\x39\x18\x70\x13\x11\x88\xe5\x28\x35\x32\x87\xd7\x82\x05\xe6\x67\x5d\x1c\xd4\x45\x43\x65\x66\x42\x44\x1f\x51\x4e\x7e\x96\x20\x66\x0e\xce\x7e\x78\xdb\x89\x1a\x29\x9e\x88\x82\xc4\x3e\x31\x11\x0e\x86\xcc\xd7\x7e\x4d\xcf\x99\x5e\xa4\xfe\x30\xc6\x7c\xe9\x4b\x5f\x82\x9d\xab\xe1\x73\x64\x00\xc0\xa3\x47\x46\xe3\xdd\x41\xbf\xdb\x29\xed\xfb\xbe\xef\xfb\xe8\xa0\x91\xc2\xcd\xc2\xb2\x2c\xc3\x2d\x43\xc8\xae\x2a\x7e\x70\x8a\x07\x2d\x8a\x94\x1a\xf9\x79\x1e\xce\x4f\x42\xea\xf8\x16\xf1\xf9\x2f\x09\xac\x44\x8d\x18\x05\x44\xf5\x06\xeb\xe5\x21\x2c\x53\x84\xd4\x32\x08\xea\x19\x14\xcc\x93\x18\x94\x49\x5d\xfc\x52\x66\xc1\x41\x22\xe9\x0f\x12\xb5\xb9\x9c\x31\xc5\x45\x4a\x01\x39\x4e\x88\x80\x3d\x28\x47\x5c\x45\xa5\x26\x2b\xb0\x0f\x15\xa4\x2e\xcc\x93\x99\xf0\x3d\x8b\x31\x9b\x9a\x40\x88\x97\x30\x8f\x4b\x7f\x83\x30\x24\xae\x51\xf0\x0a\xd2\x8b\xb4\x22\x04\x80\xe9\x74\xfa\xc5\x2f\x7e\xf1\x9d\x77\xde\x89\x21\x38\x2c\x0d\xe3\x48\xc0\x4b\xc3\x70\x95\x7c\x83\x29\x4c\xc7\xf0\x60\x0b\x3f\x03\x28\x06\xc8\xe4\x83\xf6\xd3\xa2\x70\x63\xf2\x29\x9e\xd0\x51\xd2\xaa\x0e\x24\xa8\xc3\xca\x93\x78\x81\xc3\x0d\xe1\x4f\x49\x23\x65\x07\xeb\x25\xe9\x7c\x84\x12\xd9\xc4\xb5\x11\xa9\x0e\xff\x54\xfb\x8b\x66\x91\x27\x10\x87\x4f\x31\xac\x63\x39\x6a\x7f\x09\x28\xa2\x1d\xb9\xca\x85\xf3\x34\x2f\xf2\x29\xf2\xe0\x05\x4a\xaa\x2c\xec\xfb\x09\xef\x14\xc2\x23\x1a\x81\x57\x8a\xeb\x22\x45\x44\x1b\x12\x51\x29\xc5\x48\x73\x38\xbf\x28\x21\xd3\x35\x19\x9e\x4c\x6f\xe6\xfd\x27\xf2\x90\x7d\x51\x60\x4e\x78\xe9\x5f\xc2\xb9\x26\x4e\x2f\x18\x10\x02\xc0\xcd\x9b\x37\x5f\x79\xe5\x95\x47\x8f\x1e\xc5\x1c\xb2\xb0\xf0\xec\x45\x8b\xb0\x52\xc4\x88\xc8\x0f\x9d\x89\x39\x4a\xa9\xf8\xac\x0d\x91\xfc\x83\x93\x52\xaa\xaa\xaa\x8b\x02\x21\x8e\xbc\x62\xf8\x86\x44\x64\x49\x01\x18\x8f\x38\x22\xbe\xf2\x05\x01\xe7\xc1\x0a\xa4\x42\x2d\x01\x2a\x3c\x47\x8e\x11\x13\xa4\x08\x88\xf3\x53\xe0\x9a\xc7\x5a\x71\x79\x31\x58\x50\x04\x12\x5e\x30\xbf\x32\x48\xb5\x85\xf4\x26\xe7\x11\x35\x21\xfc\x31\x3f\x9a\x94\x3b\x49\x64\x80\x44\x27\x8a\x39\xbc\x5b\x49\x5a\xc4\x66\x5c\x4a\x9c\x34\x64\xda\x95\x6f\xaf\xe8\x66\xa9\xc6\xf2\x52\x29\x00\x4e\xf1\x64\xc0\x5e\x6c\x17\xe7\x21\x47\x15\x92\x52\x9f\x7a\x48\xb9\xa6\x4f\x85\xae\xee\x67\x98\xf2\xf4\xf8\xf1\xe3\xe3\xe3\x63\x83\x08\x2f\xec\xa2\xc3\x85\x74\xd8\xff\x8c\x14\x5e\x63\x08\xf3\xb2\x38\x8c\x31\x05\x20\x0c\xfb\xab\x31\xca\x7c\x5a\xee\x7b\x7e\x7e\x1e\x1e\xf9\x89\x32\x15\x22\x40\x3b\x27\x78\x6c\x13\x21\x1c\x15\xc8\xd8\xce\xc4\x7d\x1e\xe5\x71\xba\x28\x0a\x31\xe8\x8b\xa2\x2e\x94\xce\xa0\x78\x9e\x87\x88\xea\xba\x2e\x3c\x09\x45\x8c\x20\x0a\xcf\x54\x97\xe9\xd0\x41\xcc\xc8\x03\x1e\x01\xfb\x94\x4c\x40\xd0\x92\x2a\xce\x79\x52\xcc\x29\x40\x7d\x6a\x9e\x41\xc4\x15\xed\x40\x78\x38\x73\x78\x85\x2e\x65\x40\x51\x38\xd6\x84\x40\xd1\x60\x4f\xfd\x20\x44\x06\xc2\xa0\xe4\x80\x82\xf9\x69\x6e\xdb\xb6\xce\xb9\xc9\x64\x52\x55\xd5\xa5\x7f\x30\xfc\x9a\x22\x15\xe3\x3f\x54\x01\x57\xe9\xfb\x1a\x5f\xf8\xc2\x17\xee\xdf\xbf\xff\xe1\x87\x1f\x86\x9f\xc1\x47\x31\xb6\x05\xc2\xe7\x3b\x04\x0a\x4b\xbd\xf8\x09\x43\x1e\x0e\xfc\x6e\x7f\x23\xc0\x67\x80\x43\xa5\x54\x5d\xd7\x75\x5d\xe3\x6d\x8d\xa7\xb3\xc6\x74\x3a\x15\x27\x1f\xf9\x19\x74\xd4\x0d\x50\x5c\x10\x25\x0c\xce\x85\xc5\xb2\x51\x42\x1e\xae\x20\x8d\x70\x19\x4d\xa2\x3e\x19\x51\x84\x87\xe3\x7a\x4a\x9f\x58\x70\x24\x94\xe2\x4c\x95\x9e\xfb\xc3\x3e\x3c\x90\x04\x66\x16\x1b\x45\xc4\x8a\x7d\x91\x69\xcb\x85\xf4\xc4\xf5\x66\xf4\x11\xd5\xe6\x38\x47\xea\xcd\xf4\x5a\xa6\x15\xdc\x80\xe3\x85\x88\xa6\x26\xe0\xca\xcd\x3b\xde\x50\xa9\x7e\xcc\xf0\x0c\x76\x7d\xe4\xe1\x27\x3b\xf2\x26\xf7\x7d\x7f\x72\x72\x62\xad\x2d\x8a\xa2\xae\xeb\xe9\x74\x5a\x55\x55\xe6\xc6\xe1\x55\xf8\x4a\xd1\x4b\x2f\xf9\x45\x9d\x92\x28\xa5\x5e\x7f\xfd\x75\xa5\x54\xc0\xc2\x38\x98\x45\x7f\xc2\x70\xa8\xb5\x8e\xcf\xd4\xf4\x7d\x1f\x56\x87\x7c\xc0\x87\x25\x66\x28\x18\x12\x9b\xcd\x66\xbd\x5e\x17\x45\x11\x66\x73\x4f\x3d\xf1\x2c\xcb\x32\xb5\x3b\x4a\x62\x2e\xc9\x8f\x69\x3e\xd4\xe3\x10\xc5\x83\x36\x5e\xc2\x3c\xb8\x96\x28\x53\xc4\x00\xd8\x8f\xe9\x84\xc4\x45\x0f\x51\x12\x47\x5b\x2e\x27\x03\xc6\xa4\x51\x90\x08\xfa\xdc\x26\xa2\x59\x78\xbe\x58\x17\x30\xfb\x8f\x04\x06\xae\x6a\xac\x11\x12\xc6\x21\x89\x14\x5a\x70\xfe\xa8\x43\xec\x6b\xe2\x1b\x44\x1f\x0c\x72\xc0\xba\x3e\x53\xaf\x68\x84\x4c\x8f\x67\xd4\xbe\xe8\x55\xde\xde\xbc\x9c\x94\x23\x89\x96\x21\x39\x79\x1e\x60\xa3\x26\xc5\x16\x33\x63\xa8\x81\xc4\x44\x30\x2c\x04\xe3\x86\x53\xdb\xb6\xab\xd5\xca\x7b\x5f\x55\x55\x5d\xd7\xb3\xd9\xec\xfa\xcd\x8a\x4b\xa1\x17\x15\x08\x01\x40\x29\xf5\xda\x6b\xaf\x95\x65\xf9\xbd\xef\x7d\x8f\x4f\x1b\x39\x91\xf7\xf1\xc3\xa7\x2a\xc2\xea\x30\xbc\x5f\xcf\x7d\x3d\x64\x7a\xf4\x84\xaa\xb5\xf6\xec\xec\x0c\x00\xaa\xaa\xba\xe8\x4d\x44\xef\xfd\x7a\xbd\x3e\x3b\x3b\x8b\x77\x11\x06\xc7\x39\x2e\x0b\xd2\xbc\x15\x83\x1f\x2f\x92\x9a\xc0\x0e\x56\x44\x28\x56\x44\x74\x88\xe9\x0c\xc8\xa5\x70\x14\xf6\xa3\x2d\xaf\x31\x55\x96\x08\xc9\x60\x64\x1e\xce\x39\x7a\xf1\x45\x15\xc7\x42\x2c\x59\x5c\x37\x60\x06\x22\x41\x44\x56\xae\x8f\x28\x27\x15\x8e\xf3\x2e\xc4\x67\x3f\xd1\x63\x53\x4d\xcb\xf3\xf0\xb9\x02\xd7\x2d\xd5\xf0\x54\x0e\x9f\x43\xa4\xe4\x90\x1a\x89\x3e\xbc\x3b\x52\x73\x1a\x51\xfe\xe0\x38\xe2\x7a\x92\x22\xf8\x4b\xbc\xa2\x0d\x95\x52\x65\x59\x92\x87\xde\xc3\x8d\x98\xbe\xef\x57\xab\xd5\xf9\xf9\xb9\x52\x6a\x32\x99\x4c\xa7\xd3\xeb\xef\x34\x3d\x4f\x7a\x81\x81\x10\x00\x94\x52\xb7\x6f\xdf\xae\xaa\xea\xbb\xdf\xfd\x6e\xd8\x7c\xaf\xaa\x2a\xff\x50\x56\x7c\xca\x34\xac\xf3\xc2\xdf\xb0\x28\x8c\x37\x17\x79\x2d\xf1\x5e\x63\x5c\x50\x76\x5d\x17\x9c\x38\xe6\xa7\xbc\xd6\x39\xd7\x34\xcd\x72\xb9\xfc\xe8\xa3\x8f\xc2\x7e\x48\x78\x3c\x35\xa3\xe4\x18\x6c\x13\x79\x14\x5b\x07\x88\x53\xe6\x14\x72\x60\xc9\x1c\xed\x08\x38\x8d\x87\x64\x22\x87\xe8\x89\xa5\xe5\x63\x22\x37\x45\x4a\x7f\xb1\xbd\x24\x30\xa5\x50\x10\x27\x44\x7d\x48\x1c\x14\x43\xfc\x98\x34\xd7\x47\x6c\x60\xa6\xed\x19\x43\xe5\x5d\x88\x37\x3f\x25\x30\x85\x13\xb8\xed\x5c\x1f\x92\x9f\x42\xc1\xc1\x96\x12\x6f\x1f\x04\x72\x82\x85\x5c\x0e\xc7\xef\x31\x3c\xc4\x6f\x53\x60\xec\x76\x47\x1f\x8b\xfa\x00\x40\x59\x96\xe1\xa8\x48\xbf\x7f\x3c\x16\x39\x15\xb2\x6d\xdb\xf5\x7a\xed\xbd\xaf\xeb\x7a\x32\x99\x2c\x16\x8b\xeb\x65\xe2\xb3\xa6\x17\x1b\x08\x03\x2d\x16\x8b\xaf\x7e\xf5\xab\xef\xbe\xfb\x6e\xd8\x64\x28\xcb\x12\x9f\x69\x4b\xc2\x22\x1e\x4b\x01\x08\xad\xb5\x01\xc6\xe2\x13\x37\x04\xd2\xb0\x84\xc8\x10\xbd\x39\x50\x3c\xbf\x3b\x32\x38\xe7\xd6\xeb\xf5\x7a\xbd\xde\x6c\x36\xe1\xad\x89\x70\x8b\x31\x08\x3f\x39\x39\xc9\xb4\x68\x0c\x0c\xa4\x98\x49\x08\x10\xd3\x38\x4e\xa5\x90\x12\x8f\x79\x9c\x29\x4a\x1e\xd4\x93\x44\x3d\x8e\xb8\xa4\x3a\xde\x6b\xf9\x7c\x60\x36\x11\xa7\x0b\x22\x52\xe6\xf1\x9b\x73\x66\xc2\x25\xf1\x3a\x9c\xcf\xab\xe0\xca\xa7\xa0\x0b\xb7\x2b\xa5\x92\xa8\x03\x4f\x8b\x00\xcf\x2d\xc0\x7d\x23\x33\x15\xe0\x58\xc5\x05\xf2\xe2\x04\x3b\xc5\x82\xe4\xa7\xd8\x34\x60\x7d\x91\xf1\x67\xb1\xc8\x18\x1e\x02\xc3\xbc\x51\xc0\xde\x20\xe4\x3c\xe1\x5e\xa0\x47\x44\xce\x86\x24\x88\xd8\xf7\xfd\xf9\xf9\xf9\x5b\x6f\xbd\x35\x99\x4c\x0e\x0f\x0f\x6f\xdc\xb8\x71\x7d\x36\xdb\x33\xa2\x97\x01\x08\x01\xa0\xaa\xaa\x2f\x7f\xf9\xcb\xf7\xee\xdd\xbb\x7f\xff\x3e\x00\x78\xef\xc3\xcd\xbf\xb8\xe1\xc9\xc7\x46\x9c\xbe\xa9\xdd\xa3\x31\x71\x79\xa7\xd0\xea\x30\x15\x3a\x63\x59\x0c\x8d\x6e\xf7\x1d\xc4\xb0\x64\xec\xfb\x5e\x29\x35\x9b\xcd\xe2\x73\xad\x51\x1f\x63\x0c\x3f\x0d\x67\x90\x70\xec\xc8\x40\x14\x56\x32\xf5\x33\x45\x79\xb6\x14\xba\x90\xd0\x96\x92\x43\xe2\x66\xbe\x3a\x31\x9c\x89\x72\xc6\x60\x4c\x48\xa4\x00\x83\x30\xf3\x60\x9a\x07\xcb\x7c\xf8\xce\xcb\xe1\x05\x53\x40\x9b\x92\x26\xaa\x8a\xe7\x3a\x84\x81\x20\x10\x97\x26\xc2\x76\xa6\x69\x04\x1b\xc6\x4f\x2c\xa2\xcc\xd4\x25\x51\xd5\x14\x0a\x8a\xd8\x86\x79\xb8\xb4\x41\x78\xce\x54\x4d\x3a\x6b\xf0\x7c\xd1\x70\x8e\x15\x20\xcf\xe7\x70\xe8\xd8\xf9\xc9\x61\x92\xdd\xf7\xfd\xa3\x47\x8f\xee\xdf\xbf\x5f\x55\xd5\xe1\xe1\xe1\xcd\x9b\x37\x27\x93\xc9\x85\x8c\x7c\x4d\x79\x7a\x49\x80\x10\x00\xb4\xd6\x77\xef\xde\x3d\x3c\x3c\xfc\xde\xf7\xbe\xd7\xb6\x6d\xf0\xa7\xb8\x69\x19\x43\x43\x1c\x2d\x64\xd8\xc7\x44\xbc\xf3\x87\x09\x58\xe0\x26\xe1\x35\x52\x60\x0e\x4e\x1f\xee\x8a\x7b\xe9\xa1\xea\xb0\x64\x24\x4d\xe0\x61\x9a\x04\x32\x9e\x08\x24\xf2\x10\xa8\xc8\x83\x3a\xc9\x89\xf3\x56\x1e\x8e\x53\xc5\xb9\x1c\xc5\xd6\x0a\x38\x1f\x07\x14\x12\xbc\x52\xd8\x90\x22\x51\x07\xde\x6a\xfc\x13\x37\x4a\x44\xa6\x14\x26\xf1\x50\xa8\xd8\x32\x82\xa0\x29\x87\x5e\x5c\x96\xd4\xcb\x4d\xc4\xcd\x95\x52\x98\x0b\x49\xd9\x0a\x4b\x13\x39\x79\xed\x19\x80\x11\xdd\x83\x57\x44\x98\x31\x03\xb1\x0c\xa9\x97\xfc\xcd\x37\x56\x64\x20\x0a\x03\x73\xd7\x7c\x29\x91\x07\xdb\xc7\x7b\x1f\x5f\xb5\x4a\x8d\xcd\x70\xd7\x06\x8f\xc1\xe8\xf9\x04\x05\x23\xc5\x17\xa0\xf1\x81\x59\xc7\xc7\xc7\x0f\x1f\x3e\x2c\x8a\xe2\xc6\x8d\x1b\x37\x6f\xde\x7c\x0e\x87\x24\xff\x30\xd0\xcb\x03\x84\x81\x16\x8b\xc5\x8f\xff\xf8\x8f\x7f\xf4\xd1\x47\x9f\x7c\xf2\x49\x78\x40\x2b\xac\xbd\x42\x64\xe7\x7b\x9e\x29\xe7\x26\x28\x28\xc2\x21\x19\xf3\xdc\x8f\x39\xc5\xad\x8f\x4f\xb1\xc9\x3c\x32\x62\xad\x60\x3f\x92\xf2\x04\x87\x28\x1e\x35\x52\x02\xc5\xaa\x89\x59\x08\x48\xa4\x04\x42\x22\x9e\xa6\x42\x30\x91\x49\xca\x12\x1d\xb8\x58\x22\x90\x07\x62\x51\x67\x91\x8d\xa8\x87\x5d\x85\xd8\x36\x23\x87\x00\x83\xc8\xcf\x0d\x2e\x42\x2c\x97\x2c\x02\x67\x4c\x8b\x20\x81\x25\x73\xac\x12\x3d\x4a\xd4\x96\x08\x24\x86\x22\x56\x12\x5b\x91\x8a\xf2\x29\x7f\x8e\x3a\xa7\x5c\x25\x23\x36\x63\x28\x91\x62\x5d\x61\xec\x63\x43\x71\xc5\x26\x93\x49\x88\x42\x20\x01\x21\xec\x5e\x20\xc6\xa0\x18\xd7\x85\x31\x8d\x5f\x71\x0e\x88\x58\xd7\x75\x40\xc4\xeb\x5d\xd3\x1f\x84\x5e\x36\x20\x04\x00\x63\xcc\xe7\x3e\xf7\xb9\xdb\xb7\x6f\xbf\xff\xfe\xfb\xab\xd5\x2a\x3e\xaf\xac\x11\xe1\x68\x25\x62\x43\x10\x45\xa2\x00\x8e\x29\x1c\x11\xf1\xb0\xe7\x44\x94\xf4\x89\xc9\x23\x49\x10\x12\x43\x0f\x1f\xbd\xf9\x10\x90\x21\x0e\x5d\xe4\x67\x2a\x66\xf1\x1a\x49\xbe\x08\x66\x29\x70\x1a\xa4\x4c\x73\x52\x08\xca\x2b\xc2\x66\xcc\x9b\x74\x50\x87\x0c\x20\x0d\x8a\xba\x50\xbd\x99\xf0\x9d\x42\x9a\x41\x09\xc4\xa5\xb1\x93\x67\xf4\x49\xf1\xa8\xfd\xb5\x2c\xe7\xc9\xf7\x1d\xe9\x91\x7c\x0e\xce\xe7\x75\x91\xd9\x86\x58\xf6\xa9\x89\x54\xca\xf7\x45\x89\x1a\x61\x8b\x28\x22\x74\x2a\x8c\xc4\x58\x11\x1f\xe5\xf3\xfb\xfb\xa5\x61\x5a\x1f\xa8\xaa\xaa\x70\x1f\xf1\xe8\xe8\xe8\x93\x4f\x3e\x09\xaf\x75\xcd\x66\x33\xf2\x7a\xf4\x35\x8d\xa1\x97\x10\x08\x03\xcd\xe7\xf3\xaf\x7c\xe5\x2b\xc7\xc7\xc7\xef\xbf\xff\x7e\x78\xff\x2f\x9e\x2c\x13\x3c\x4c\xed\x08\xa4\xdd\x18\xd8\x8f\xa4\x7c\x24\x93\x09\x2f\x48\x28\x22\xa2\x20\x1e\x0c\x99\x29\x33\xa7\x41\xb0\x21\x3f\x31\xd2\x8b\x45\xb0\x0e\x1c\xc5\x01\x8d\x76\xde\x52\xb1\x20\xa9\x82\xe0\x1c\x8f\x44\x9c\x87\x08\xe4\xb5\x3c\x5d\x41\xde\x04\xd2\x0b\x04\xe0\x45\x34\xe5\x93\x00\xe2\x36\x29\xf5\x08\x4c\xa6\x84\x63\x39\x62\xa5\x5c\x5b\x60\xb8\x22\xb6\x28\x55\x90\x08\xc9\x18\x6d\x64\x13\x32\x6d\xe7\x69\xd1\x7a\xbc\x5d\xbc\x2e\x11\x23\x89\x0e\x62\xbf\x64\x9a\x80\x1b\x02\x09\x37\x48\x59\x0f\xd0\x7b\xf4\x29\x39\xe1\x2b\x37\x62\x97\x61\xb6\x48\xd1\x1f\x3c\xba\x4f\x41\x56\x87\x81\xc2\xfb\x18\xe1\x3e\xe2\x72\xb9\x3c\x3d\x3d\xad\xaa\x6a\x3e\x9f\x4f\xa7\xd3\xeb\x43\x4d\xc7\xd3\x4b\x0b\x84\x00\xa0\x94\xba\x75\xeb\x96\x73\xee\xfc\xfc\xfc\xe4\xe4\xa4\x69\x9a\xf0\xf4\x26\x39\x92\x4d\x1c\x30\x31\x34\x70\x99\xe2\x4f\x1e\x91\x79\xec\x4e\x21\x59\xbe\x09\x90\x18\xab\x98\x47\xbc\x9a\x8f\x0e\xa4\xc9\x38\x8a\xa5\x82\x2c\x61\xe6\x0a\xe0\x7a\x53\xb0\x41\xc2\x44\x2a\xe2\xa7\x2a\x15\x85\xe7\x03\x16\xb1\x49\x8c\x2f\xbc\x39\xa9\xce\x4d\x99\x62\xd0\x3e\xb8\xed\x99\x5a\xb8\xb6\x29\xc9\x29\xe1\x80\x5c\x85\xfc\xcd\x28\x40\x4c\x3d\xc8\x43\x3a\x7a\x8c\x1c\xa2\x76\x18\x6e\xb8\x14\x46\x26\x22\x39\x93\x43\x90\x9e\xf3\x70\xc9\x22\x00\x93\x76\x11\xa7\xca\xf0\x60\xc2\xfb\xa2\x29\x39\xfc\xd9\x16\xce\x83\xb5\x8a\x88\x88\xd3\x71\x81\x88\x57\x8a\xe4\x3e\x62\x40\xc4\xd3\xd3\xd3\x93\x93\x93\xba\xae\xe7\xf3\xf9\xf5\xfb\x88\x63\xe8\x65\x06\xc2\x40\x5a\xeb\xc3\xc3\xc3\xc5\x62\x11\x5e\x66\x5f\xaf\xd7\x4a\xa9\x00\x87\xe1\x95\xbe\x31\xd1\x27\x92\x38\xe3\x03\x16\x95\x60\x3f\xee\xf3\xc1\x93\x02\x5a\x91\x52\xf3\x50\x51\xab\x14\xcf\x48\xe2\x30\xc9\xa1\x0b\xcf\x58\x53\x4d\xc8\xe8\x80\xa3\x46\x14\xcb\x9b\x93\xc2\xa1\x0b\xc1\xb3\x58\x2f\x24\xc2\x10\x97\x16\x5b\x9a\x6a\x8b\x58\x35\x09\xd0\x22\x61\xc9\x29\x35\x48\xed\x17\x35\x88\xa8\x61\x0a\xec\x33\x08\xc7\x79\x78\xed\x83\x39\x23\xe5\x64\x54\x1d\xe4\x11\xdd\x52\xac\x8b\x97\x7d\xba\x76\x05\x0a\x0f\x87\x67\xda\xa5\x94\xaa\xaa\x2a\xda\x81\xd4\x4e\x50\x90\x18\x1f\xd0\x1c\x1a\xc3\xa1\x67\x6f\x22\x86\xbf\x61\x81\x18\x11\xf1\xd1\xa3\x47\x5a\xeb\xe9\x74\x7a\xfd\x32\x62\x9e\x5e\x7e\x20\x0c\xa4\xb5\x9e\xcf\xe7\xb3\xd9\x2c\x6c\x20\x9c\x9f\x9f\x6f\x36\x1b\x7e\x60\x37\xb0\x45\x46\xa0\x54\xa6\x08\x8a\x91\x08\x16\x12\x50\xe4\x13\xcc\x0c\xae\x60\x81\x79\xe6\x14\x22\xe2\x9f\x79\xa4\xcc\x83\x37\x91\x30\x52\x67\x1e\x16\xc5\x46\xa5\xda\x72\x51\x1e\x11\x99\x60\xdf\x38\x22\x33\x5e\x2e\x44\x97\x20\x4d\x48\x35\x99\x3b\x89\x88\x88\x1c\x9e\x61\x7f\xa9\x24\xea\x2c\xc6\x77\x32\xa5\xc8\x74\x04\x16\x42\xda\x12\x6b\x1f\x83\x1f\xc4\x69\x53\x1e\xc8\xa7\x32\xa9\x76\x89\x42\x70\x2d\x7c\x96\x20\xfa\x21\x37\x51\x5e\x0e\x6f\x08\xf7\x9f\x31\x3c\x71\xbb\x92\xeb\x13\x79\xc2\x03\xe4\x29\xc9\xbc\x07\xf9\x2c\x30\xce\x3e\xfd\x8e\x00\x80\xdc\x41\xf4\xe8\xe1\x9a\x70\x70\x87\xb5\xb6\xaa\xaa\xbe\xef\xd7\xeb\xf5\xf9\xf9\x79\x55\x55\x8b\xc5\x62\x36\x9b\x8d\x99\x39\xfd\xb0\xd1\x0f\x0b\x10\x06\x52\x4a\x95\x65\x79\xf3\xe6\xcd\x1b\x37\x6e\x74\x5d\x77\x7e\x7e\xbe\x5a\xad\xd6\xeb\x35\x79\x95\x9e\x47\x25\x18\x0a\x67\x83\x6c\x18\x0e\x63\x3a\x3e\x45\x26\x96\xc5\xf9\x7c\x34\x12\x60\xe3\xa3\x25\xa5\x09\x89\xd7\x64\x78\x03\x0a\x28\x1c\xaa\x89\x9e\x79\x14\xcc\x44\x43\xa2\x92\x18\xa6\x79\xb0\x10\xd5\x26\x71\x04\x1b\x41\xd4\x24\x65\x3d\xd2\x34\x8c\x85\x29\x54\xc0\x0d\x21\xfc\xa2\xc5\x38\xb8\x82\x64\x7f\x51\x93\x94\x7d\x08\x33\xd7\x8a\x34\x3f\xd5\xf0\x14\xa5\x8c\x93\x2f\xc5\x79\xf8\xcc\x63\x50\x48\x06\x20\xb9\xb4\x14\x14\x41\xda\xc2\xc4\xb5\x52\x43\x9e\xd7\x85\x49\x7c\x89\x9e\x68\x12\xf6\x45\xb9\x3f\x8b\x5e\x0a\x52\xff\x02\xea\xc4\x18\x43\x42\x1a\xc3\xa1\xda\x1d\xe5\x11\x0f\xcc\x0a\xbb\xa6\x65\x59\x86\x05\xe2\xd1\xd1\xd1\xf1\xf1\xf1\x7c\x3e\x5f\x2c\x16\xd7\xdf\xbe\xc0\xf4\xa2\x7e\x86\xe9\xd3\x22\xef\x7d\x40\xc4\xf3\xf3\xf3\xf8\x42\x3d\x48\xdf\x42\x82\xec\xd8\x86\xf4\x0c\x17\xfb\x3a\x81\xc3\x70\x37\x3b\x06\x47\x02\xc3\x64\x6e\x9b\x1a\xcc\x38\xc4\xe3\xc1\xc6\xf1\x80\x30\x73\x0d\x63\xc1\x78\x02\x0e\x48\x91\x85\x0b\x17\xdb\xc8\x8b\x88\x02\x33\xf9\xa2\xaa\xde\xfb\xb6\x6d\x07\x9b\x40\xec\x90\x91\x1f\xe8\x07\x4f\x67\x80\x73\x8c\x90\x41\xfe\x8b\x6a\x15\x73\x38\x0c\x67\x98\x33\xb5\xa7\xa0\x57\xc4\x6c\xfc\x37\x16\x8c\x7e\xc5\x0d\x95\x4f\x13\x6c\x10\xa1\x9d\x6b\x28\x4e\x20\x20\xd1\xf5\x99\x69\x01\x76\x21\x32\x2a\x83\x2b\xe6\xd9\x5e\x7d\xf5\xd5\xb8\x2d\x99\x1f\x80\xe4\x67\xc6\xc3\x01\x85\x11\x12\x55\xc8\xab\x17\xf8\xb4\x9a\x00\x87\xe1\x43\x66\xd3\xe9\xf4\xe0\xe0\x60\x32\x99\x88\x4d\xfe\x61\xa3\x0b\x4f\x0a\x5e\xb8\xef\x6b\x0c\x4a\x5e\x2e\x97\xcb\xe5\xd2\xef\x9e\xec\x8a\x87\xc2\xc4\x11\x1b\x39\xc7\x4f\x8d\xf1\x90\x8b\x99\x04\x21\xbc\xf7\xd6\xda\xb2\x2c\x45\xcc\xe0\x23\x8a\x4c\x2a\xc5\x71\x9b\x41\x41\x22\x5f\x4c\x13\x21\xf8\x27\x1f\xc0\xb8\x22\xce\x43\xb0\x99\x34\x8d\xe4\x93\x34\x64\x37\xeb\x88\xda\x44\x31\x62\x25\xd8\x0f\xa6\xa4\x5d\xa4\x8d\x79\x7d\xb8\x0e\x44\x19\xce\x33\x46\x0e\x41\x4d\xb1\xeb\x2f\x9a\xe6\x0d\x4c\x55\x1d\xf3\x9f\x02\x03\x44\x99\xbc\xaf\x21\x0b\xa2\x23\xa7\x23\x83\x18\x1c\x7f\x8a\xa0\x98\xd7\x99\xb8\x07\x71\xa7\x94\x7c\x90\x1e\x93\x89\x05\x23\x1b\xde\x17\x4d\xf9\x0f\xf6\x4c\x3e\xf4\xc4\xaa\x71\x66\x1c\x4d\x38\xa1\xd0\x71\x57\x6e\xf7\x99\x01\x63\x4c\x38\x81\x32\x20\xe2\x83\x07\x0f\x8c\x31\x87\x87\x87\xf3\xf9\x3c\xe5\x00\x91\x5e\xbe\xc8\x8f\xe9\x87\x7a\x75\x7c\x74\x74\xf4\xe0\xc1\x83\xcd\x66\x53\x96\xe5\x7c\x3e\xc7\xa7\xb2\x85\xa3\x6f\x9b\xa6\x09\x67\x79\x07\xfe\x91\x40\x48\x22\x8b\x88\x73\xe1\x6f\xd8\xb8\x48\x49\x48\xc9\x4f\x31\xc7\x9f\xa9\xf1\x46\x78\x44\x78\x20\x3a\xa7\xa0\x34\xcf\x83\x75\x18\x9c\xff\x42\x62\x6c\x13\xe6\x41\x53\xa4\x62\x16\x8c\xb3\x67\xa6\x2b\x71\x6c\x4d\x95\xc5\x3c\xa4\xed\x5c\x9f\x48\xc4\x2c\xa1\x3b\x52\x3c\x29\x06\xa2\x61\x1e\x26\x33\x98\x44\x04\x12\xdf\xe0\xf0\x23\x9a\x45\x6c\x7b\xaa\xa2\x0c\xa4\x89\x24\xea\xc0\x7d\x58\xb4\x40\x4a\x67\x3c\x6d\x12\xe5\xf0\xd6\xc5\xf1\x1b\xf6\x90\x48\xa5\xa4\x21\xf1\x79\x51\x02\x99\x19\x1d\x48\x75\x58\xed\x98\x4f\x6a\x8c\x2a\x89\xb8\x18\x8f\x13\x09\xa0\x18\x9e\x13\x8c\x2f\x5d\x1c\x1f\x1f\x1f\x1f\x1f\x1f\x1c\x1c\x1c\x1c\x1c\xfc\xd0\x3e\x5f\xfa\xc3\x08\x84\xd6\xda\x00\x81\xe1\x96\x32\x81\xc0\x40\xc6\x98\xba\xae\x0f\x0f\x0f\x61\xf7\xf9\x88\x76\x47\xe1\x89\xe8\x6a\x80\x00\x00\x20\x00\x49\x44\x41\x54\xe5\xd9\xfc\x38\xe7\xb1\x20\x15\x43\x83\x5f\x8e\xd4\x3c\x1f\xb6\x78\x26\xff\x39\x26\xdc\x88\xd2\x32\x05\x49\xec\xc3\xc3\x52\xe4\x24\xe3\x7f\x90\x47\x6c\x14\x8f\x59\x29\x3c\xbe\x50\x1b\x53\xeb\x00\x51\x48\x5e\x1a\xa7\x41\x30\xe0\xcb\x8b\xbc\x02\xa9\x28\x19\xe3\x2c\x31\x26\x91\x46\xc4\x8e\x07\xc8\x8c\x9c\xbc\x1d\xc6\x5b\x80\x5c\x1d\x63\x5e\x48\xec\x13\xc4\xd9\x03\xc1\x15\xb1\xf8\x98\xd6\x29\xb4\x1c\x1c\x54\x29\xee\x3d\x8a\x02\xf3\x33\xce\x31\x08\xcd\xcd\x85\xe1\x10\xe7\xa8\xdd\x1d\x44\xef\x7d\xbc\x7d\x18\x1f\xa8\x59\xad\x56\xa7\xa7\xa7\xf3\xf9\xfc\xf0\xf0\xf0\x87\xf0\xf6\xe1\x0f\x57\x83\xfb\xbe\x7f\xf8\xf0\xe1\xa3\x47\x8f\xbc\xf7\x65\x59\xd6\x75\x1d\x3f\xcc\x8b\x37\x42\xe3\xc8\x09\x7f\xc3\xb7\xec\x17\x8b\x45\xc8\xb1\xd6\x76\x5d\xd7\x22\xf2\xbb\x2f\xb0\x40\xc2\x47\xf1\x38\x24\x1e\xdf\x75\x5d\xf8\x32\x4b\x64\x08\x2f\x3b\x06\xce\xb8\xad\x11\x98\x53\xc3\x46\x44\x8e\x14\x54\xa4\xa0\x05\x73\x92\x74\x66\xc0\x67\x46\x72\x2c\x1b\x1b\x8e\x91\x52\xb1\x95\x04\x2e\x45\x30\x09\xdb\x87\x34\x10\x4b\x16\x2d\x13\xf3\x49\x59\x51\xd5\x14\x36\xa4\x62\x3d\xb7\x0f\x99\xa7\x13\x05\x44\xdd\x52\x32\x79\x04\xe7\x94\x41\x11\xb1\x88\x88\x9a\x22\xdb\x60\x67\x89\x42\x30\x0c\xe7\x79\x60\xbf\x53\xc4\xab\x62\x43\x78\xbe\xc8\x49\x20\x24\x1a\x13\xf6\x7b\x2d\x33\x1b\x10\x7d\x29\x66\x3a\xf4\xd1\x25\xcc\x83\x73\xe2\x77\x97\x20\x41\x22\x28\x66\x38\xf3\xd5\x11\xdf\x0b\x14\x0e\x38\xf5\xfb\x1f\x9e\xc3\x5f\x63\xb5\xd6\x86\x35\x62\xdf\xf7\x9b\xcd\xe6\xfc\xfc\x7c\x36\x9b\x1d\x1e\x1e\x86\x57\x3e\x7e\x48\xe8\x87\x05\x08\xc3\x86\xf8\xa3\x47\x8f\x00\x20\xec\x92\xe3\x17\x27\x60\x1f\xfc\xc8\x80\x21\x7f\x03\x2e\xe2\xb3\x6e\xfb\xbe\x6f\xf7\x29\x78\xa7\xdb\x7d\xae\x9a\x8f\x49\xec\xbe\x0e\x7d\xd5\x1a\x00\xe2\x02\x31\x3e\xc8\x1a\xce\xad\x18\x33\x8d\x25\xf9\x80\x86\x84\x88\xca\x44\x19\xb5\xbf\x8c\x20\x63\x2f\x15\xe3\x78\xa5\x24\x4d\x2a\x12\xf3\xf3\x88\x2b\x82\x3a\x97\x33\xa8\x0f\xef\x02\x6e\x1f\x2e\x2a\x35\xa1\xc9\xc7\x6b\x48\xf8\x4f\x5e\x8e\x58\x17\x41\x44\x31\xdc\x73\x05\x38\x00\x70\x3d\x45\xdd\x08\x50\x71\xe1\xc4\x7a\xa2\xe5\x71\x97\x71\xf7\xe3\xb5\x13\xef\xc2\xf9\xb8\x45\x91\x47\xd4\x47\xe4\xe1\x70\xcb\xeb\x22\x76\xcb\x78\x94\xda\x2d\x07\xc5\x1b\x84\xa4\x8a\xe9\x74\x4a\x72\xb0\x3e\xdc\xce\xa4\x5d\x44\x67\x6c\x70\x3e\x53\x11\x4d\x4d\x86\x49\xc8\x89\xeb\xc2\x90\x13\xee\x1d\x62\x38\x6c\xdb\xf6\xde\xbd\x7b\xd3\xe9\xf4\xc6\x8d\x1b\xf8\x93\x76\x2f\x31\xbd\xfc\x40\x68\xad\xfd\xf8\xe3\x8f\x1f\x3e\x7c\x08\x00\xe1\xdc\x51\xb2\x11\x0a\x2c\x10\x10\x9f\x26\xa1\x84\xa7\x03\xb2\xce\xe7\x73\x40\xce\x17\xbf\x28\x16\x1e\xbd\x09\x7f\xc3\x99\xb9\x24\xe4\xc5\x47\x66\x78\xb0\x88\x41\x30\x6c\xe8\x93\xd0\xe0\x9c\x75\xd6\x39\x67\x21\xe4\x28\x65\x8a\x22\x14\x12\x27\xb3\x23\x49\x1c\xdb\xa9\x78\x87\x4b\x89\x78\x26\xc6\x9a\x54\x0c\x52\x08\x2c\x33\xad\xe0\x83\x3f\xaf\x15\x29\x2b\x0a\x24\x7f\x39\x0f\x2f\x22\xca\x4c\xe5\x88\xba\x89\xfa\xa4\x60\xe3\xa2\x15\x65\xe2\xb8\x78\x95\x03\xc0\x18\xe1\xa2\x86\x04\xb0\xc7\x5b\x03\x27\x38\xea\x73\xef\x12\xeb\x4d\xf1\xe4\x95\x4f\xc1\x09\xa7\x30\xba\x53\x72\x70\x0e\x3e\x50\x86\x78\xaf\x98\xc3\x9b\x40\x8a\x67\xe6\xaf\x22\x5b\xbc\x8a\x27\xb8\x18\x4a\x03\x28\x06\x3b\x47\x38\x34\xc6\x04\x38\xfc\xf8\xe3\x8f\xe7\xf3\xf9\xcd\x9b\x37\x5f\xfa\xcd\xd2\x97\xb9\x79\xe1\x70\xb5\xe3\xe3\x63\xa5\x54\x55\x55\x78\x15\xc8\x5f\x54\x10\x11\x11\x46\xf8\x3a\xbf\x14\x84\x07\xd7\xc1\x97\xd6\xe7\xa7\x7f\xf9\x87\x5f\xfb\xd3\xdf\xfd\xf5\x12\xec\x9d\xd7\x3e\x73\x78\xe7\x8d\xfa\xe0\x76\x31\x3b\x98\x1f\xdc\x28\x6e\xdc\x02\xf6\xba\x02\x1e\xcc\x61\xbf\xb4\xef\x7b\x6b\x7b\xdb\x75\x7d\xd7\x3a\x27\x2c\x13\x95\xd2\x45\x59\x15\x65\xa5\xd0\x89\x39\xb0\x3f\x9d\x84\x04\x50\x91\x4c\x3e\xcc\x48\x5d\x64\xe8\x62\x9e\x31\x45\x52\x72\x70\x3e\x97\x23\x46\xa8\xc1\xea\x44\x4a\x75\x1f\x59\x63\x91\x9f\x84\x13\x7b\x0e\x89\x5c\xe2\x72\x61\x0c\x0f\x2f\x42\x84\x93\xae\xb9\x90\x70\xd2\x41\xdc\x0e\xe2\x2a\x84\x0b\x4c\x09\x49\x55\xaa\x76\x84\x57\x3f\xa9\x26\x00\x5a\xbe\x70\x9e\x48\x1c\xf3\x94\x34\xc1\x12\xe5\xa4\x24\xf3\xa6\x61\xb6\xe8\x66\xf1\x56\x08\x9f\xab\xc5\x9c\x30\xed\xce\x38\x21\x31\x2f\x30\x07\xe3\xf2\xc5\xba\x32\xf3\x4e\xdc\x40\x8e\x9d\x0a\x7d\x75\x2e\x22\x62\x58\x20\x86\x05\x43\xdf\xf7\x4d\xd3\x7c\xf4\xd1\x47\xb3\xd9\x6c\x3e\x9f\xbf\xc4\x9b\xa5\x2f\x27\x10\x7a\xef\x97\xcb\xe5\xf1\xf1\x71\x38\xa3\x3d\xec\xd4\xa7\x20\x50\xfc\x89\xff\xf2\x41\xc8\xfd\x15\xe7\xf3\xbf\x27\x8f\x3e\xf9\xd3\xdf\xfc\xbf\xde\xf9\xfa\xd7\x56\xe7\x67\x9d\xd3\x8b\xf9\x41\x77\xf2\x68\xd9\x75\x27\xf7\x3e\xae\xa6\xb3\x66\x71\xd0\xbd\xfe\xd9\x5b\x5f\xfc\xf1\x20\xc4\x5a\x8b\x37\x6c\xa3\xaf\x77\xed\xa6\x6d\x36\x1d\x7a\x8a\x15\xd8\x88\xf5\xde\xb5\xcd\xa6\x6b\x9b\xa2\x28\x4d\x59\x69\x63\xf8\x18\x10\xa7\x9c\x3c\x18\x71\xd0\x12\xa3\x15\x19\x66\x19\x94\x8a\x69\xa2\x40\x86\x9f\xe7\xe3\xfe\x12\x43\x15\x32\x45\xf2\xa6\x54\x3e\x41\x1a\xcb\x13\xa2\x6e\x9c\x93\x64\x72\x25\xb9\x61\x79\x2d\x63\x4c\x81\xd3\x22\x03\x69\x1d\x61\x13\x2d\xc6\xb5\xc5\x2d\x4a\x21\x31\x29\xcb\x9b\x43\xf4\x49\x79\x20\xe1\xe1\x5a\x11\x9d\x49\x5d\x29\x1e\xc2\x4c\x5c\x31\xa3\x33\x6e\x29\x41\x41\xb1\x15\x1e\xed\x8b\x12\x6b\xe4\x13\xe2\xd0\xe0\x1a\x92\xda\x53\x7e\x2e\x82\x7d\xac\x28\xfc\x0c\x37\x0b\x39\x22\x86\x50\x19\xe0\xb0\xeb\xba\xa6\x69\xde\x7a\xeb\xad\x3b\x77\xee\xbc\xf6\xda\x6b\x2f\xe5\xea\xf0\x25\x6c\xd2\x6a\xb5\x3a\x3e\x3e\xee\xfb\xbe\x2c\xcb\xe9\x74\xca\x9f\x08\x25\x71\x2a\x85\x5e\xa9\x4c\x4c\x83\xa5\x36\xab\xf3\x7f\xf9\x6b\xbf\xf8\x17\x5f\xfb\xd5\x42\xf9\xe9\x74\xfe\xca\xed\xd7\x94\xa9\x94\xa9\xaa\x7a\x0e\xaa\x28\x4d\xb9\x59\x6f\xbc\x75\xab\xe5\xea\xe0\xee\x9b\xe5\x74\x1e\x24\x84\x9b\xd8\x5b\x81\xde\x37\x9b\x55\xbb\x59\x87\xe1\x67\xb4\x56\x00\x36\x62\x61\x70\xe8\xe0\xd5\x2a\xd4\x0e\x00\xbe\xef\xbb\xbe\xef\xb4\x29\xca\xaa\xd6\xbb\x9b\x8e\x99\x71\x1e\x49\xe4\x11\x71\x2b\x2f\x87\xf3\xf0\x78\x9d\x61\x16\x15\x48\x61\x64\x6a\x16\xcf\x9b\x93\x8a\xcb\xf9\xda\x53\xfa\xa4\x5a\x21\xb6\x54\x6c\xbb\x28\x27\x05\x3f\xfc\x67\xaa\x2e\x18\x61\x79\x92\x93\xe2\x11\xe3\x6c\xde\x56\x3c\x1f\x4b\x00\x36\xe8\x08\x8f\xd8\x52\xdc\x96\x98\xc9\xf5\xe1\xee\x91\xb2\xcf\x60\xbb\x32\x8a\xc5\x8f\x2e\xe5\x6d\x28\xee\x8b\xa6\x5a\x2a\xce\x48\x38\x80\xf1\xba\xb8\xaa\xa9\x89\x3b\x01\xce\x88\x88\x78\x8a\x10\xff\x06\x20\x0c\x88\x18\x96\x86\x5d\xd7\x3d\x7a\xf4\xe8\xe8\xe8\xe8\xf5\xd7\x5f\xbf\x7d\xfb\xf6\x4b\xf6\x69\x8b\x97\x0a\x08\xdb\xb6\x7d\xfc\xf8\x71\xd3\x34\x45\x51\x84\xef\x72\xc5\x55\x20\x1e\x7b\xe3\x21\x30\xd2\x18\x87\x66\x7f\xfd\xdb\x7f\xf6\x87\xbf\xf1\x7f\xfc\xcf\xcd\xe9\xd1\x7c\x71\x50\xd7\x33\x0b\xa6\x9e\x1d\x94\x65\xa5\x74\x61\x9d\x5f\xaf\x36\xc6\x74\xcb\x4d\xf3\xa8\xeb\x17\xd3\xc9\x83\xb7\xbf\xf5\x99\x9f\xfc\x37\x42\xf1\xf8\x4e\x45\xdf\x75\xab\xf3\x53\x67\xfb\x00\x72\x1e\x40\x85\xad\x57\xa5\xc2\x68\xdc\xcd\xcc\xc1\x7b\xaf\x40\x01\x80\x07\x0f\x5e\x29\xe5\x01\xc0\xf6\x9d\xb3\xbd\x29\x8a\xa2\xac\xe3\x66\x29\x9e\x0f\x12\x22\xa3\xd1\xb3\x9b\x34\x98\x87\x0b\x11\x81\x8a\xac\x7b\x22\x4f\x46\x4e\x4a\x1f\x5c\x11\xb0\x61\xcf\xa7\xcc\x19\xad\xc6\xcf\x06\x52\x58\x25\x32\xf0\x88\x46\x18\xa2\x49\xc5\x56\x8f\xac\x51\x04\xfe\xd4\x2c\x67\x90\x27\x53\x69\x46\x60\x9e\x5f\x5c\x8b\x88\x5a\x29\xb6\x5e\xe1\x15\x8d\xb4\x36\xbe\xaa\xd8\x92\x2b\xd5\xa2\xd4\xaa\x0e\x98\x47\x85\x34\xfe\xe2\x12\x6f\x4e\x4c\x84\xaf\x20\x65\xe6\x6d\xb8\x76\x62\x37\xcc\x96\xa9\x8b\x34\x2a\xf2\xa7\x86\x21\x81\x3a\x52\x76\x0c\x1c\x96\x65\xd9\x75\xdd\xfd\xfb\xf7\x1f\x3d\x7a\xf4\x99\xcf\x7c\xe6\xf0\xf0\x30\x3f\x8e\x5e\x20\x7a\x49\x80\xd0\x5a\x7b\x72\x72\x72\x7e\x7e\x1e\x9e\xe7\x0c\xb7\x03\x9f\x0e\x02\x71\x0e\x9f\x91\x11\x06\xfe\x33\xfc\xed\xbb\xf6\x5f\xfc\xfc\x3f\xfe\x8b\xdf\xfe\x95\xba\xae\xa7\xf3\x1b\xf5\x74\x51\x55\xd3\xe3\x65\x33\x81\xa2\x36\x35\x00\x34\xdd\xe6\xf4\x7c\x6d\xb4\x6a\xfb\xbe\x2a\x8a\x59\x5d\x3e\x7c\xf7\xaf\xef\x7c\xe9\xab\xf5\xfc\x00\x76\x20\xd4\x77\xed\xea\xec\xc4\x79\x07\xa0\xc0\x83\x02\x50\x01\x0b\x95\x0a\xa7\xc0\x59\xeb\x02\x40\x82\xdf\x29\xe3\x41\x29\xe5\xb7\x7c\x10\x06\x97\xed\x3b\xdb\xf7\xa6\x2c\xcb\x6a\x92\x1a\x75\xb8\x21\x78\x54\x93\xd0\x00\xfb\xc1\x22\x35\xea\x32\x32\x71\x7e\x2a\xa0\x0f\x42\x97\x88\x07\x62\xd3\xf2\x51\x7e\x90\x06\xe1\x21\x15\x43\x79\x71\x32\xab\xe0\x97\x78\x15\xa2\xb4\x14\x6c\x88\xaa\xa6\x18\x78\x27\x8a\xcd\x24\x6a\x8b\x6e\x2f\x56\x9a\x5a\x63\x91\x26\x64\xea\x1d\x54\x29\x25\x73\xcc\x52\x89\x37\x7c\xa4\x1b\x03\x40\x78\x89\x3e\x0f\xae\x00\x10\xce\x6a\xe1\x2e\xca\x7d\x9e\x20\x31\x97\x2c\xe6\x10\xc7\x03\x66\x76\xdc\x3a\x31\x3f\xef\x75\x61\xa7\x14\xef\x97\x86\x5b\x36\xe1\x0e\x62\xd7\x75\xef\xbd\xf7\xde\x62\xb1\xf8\xec\x67\x3f\x5b\xd7\x75\xc6\x6e\x2f\x0a\xbd\x0c\x40\xb8\x5c\x2e\x8f\x8e\x8e\x94\x52\x75\x5d\xe3\xdb\x81\x17\x85\xc0\xd4\xf8\xc1\x3f\xc5\x58\x46\xa4\x2d\xcf\x4e\x7f\xfe\x1f\xfe\xb7\x1f\xbd\xfd\x67\x37\x0e\x6f\xaa\x62\xda\x43\x6d\xca\xf9\xb2\x75\x1e\x8a\xaa\xac\x94\x52\x6d\xd7\x2d\x57\x9b\xba\x2a\xea\xaa\xf2\xab\xf5\xe1\x62\xae\x94\xf2\xce\x3e\xf8\xeb\x6f\xfe\x2b\x7f\xeb\xef\x04\x99\x6d\xb3\xd9\x2c\xcf\x76\xce\x1a\x96\x82\x5b\xf2\xde\xab\xad\x32\xf0\x64\x8c\x84\xf9\xe0\x0e\x32\x3d\x80\xf2\x61\xa5\x08\xa0\x40\x81\xb7\x5d\xeb\xfa\xbe\x9c\x4c\xb5\x36\x51\x6d\x32\xdb\xc5\x69\xf2\x57\xb4\x7c\x6a\x20\xa5\xfb\x4a\x28\x2e\x8e\x58\x4c\x78\xe8\x8e\xaf\xeb\x42\x9a\x8c\xd1\x8d\xcb\x14\x1d\x80\x5c\x12\x7f\x02\xc3\x45\x91\x27\x2f\x16\x6b\x98\x81\x0d\x5e\x29\x49\x13\x39\x83\xdd\x01\xac\x47\x44\x54\xe3\x65\x07\x7b\x96\x84\x69\x60\x16\xe6\xc5\x33\x09\xe2\x33\x3c\x11\xd3\x04\x1b\xc4\xae\x0f\x3f\xc9\xa6\xa8\xc8\x03\x00\x65\x59\x92\xef\x2e\x8d\xe9\xc4\x0c\x16\x92\xba\xd4\x3e\x8e\x8a\xa5\x06\x89\x0f\x6d\xac\x03\x19\xfe\x18\x17\x23\x1c\xae\x56\xab\xb7\xde\x7a\xeb\xf5\xd7\x5f\x7f\xf5\xd5\x57\x5f\xf4\x23\x69\x5e\x6c\x20\x0c\x1f\xdc\xda\x6c\x36\xf8\x89\x98\x70\x77\x0d\x83\x16\xc7\xbf\x4c\x88\xc9\xbb\x2c\x2f\x4b\x12\xcb\xd3\xe3\x9f\xf9\xef\x7e\xea\xc1\xf7\xdf\x5e\x2c\x0e\x8b\x72\x36\x9d\xdf\x98\x4c\x66\xab\xb6\xef\x3a\x77\xe7\xc6\x61\x59\x14\xde\xfb\xb2\x28\x6e\x1d\x2e\x8c\x31\x5a\xa9\xd2\x98\xb2\x28\x82\x8c\xe3\x0f\xbe\xfb\xda\x8f\xfd\xcd\xc9\xc1\x0d\x00\x58\x9e\x9d\xc0\xee\x68\xf9\x27\x4e\x09\x5e\x79\xe5\xd5\xb6\x3a\xad\xb5\x75\x0e\xc0\x83\x57\x5b\xe0\x53\xe0\xbd\xdf\xfd\x13\x57\x8a\x2a\x70\x78\xef\xda\xf5\xaa\xa8\x6a\x53\x3c\x79\x37\x28\xb5\xa0\x21\x69\xd8\x8d\x93\xc1\x34\xb6\x06\x07\xda\xfc\x22\x92\x04\x0e\x9e\xe6\xfc\xb8\x52\xb2\x10\xcc\x97\x4d\x49\x13\x73\xc4\xc0\x97\x2a\x25\x32\xa4\x82\xec\xe0\xcc\x7d\x0c\xff\xc8\xb2\x19\xb5\x49\x4b\x53\xc1\x9a\x0b\xe1\x81\x1e\xe7\x0f\x1a\x84\xab\x2a\x22\x87\xb8\x8e\x49\xe9\x33\x66\xd1\x93\x92\x93\x1a\x0e\x00\x10\xce\xad\x26\x3e\xc6\xeb\xf2\xde\x2f\x16\x0b\x11\x20\x33\x7d\xc1\x79\x32\xae\x9b\x1a\x0b\xe3\xfd\x9c\xcf\x7a\x45\xce\xf8\x79\x9c\x80\x82\xb0\x0b\x80\x7a\x47\x5d\xd7\xdd\xbb\x77\xef\xe8\xe8\xe8\x73\x9f\xfb\x5c\x38\x72\xe4\x05\xa5\x17\x18\xc6\xcf\xcf\xcf\x3f\xfc\xf0\xc3\xae\xeb\x26\x93\x49\x5d\xd7\xf1\x1d\x41\xf2\x5c\x0c\x21\x7c\x15\xb2\x8b\x3c\x92\xce\x53\x10\xbb\x59\x2d\xff\x97\x9f\xfe\xa9\x8f\xbf\xfb\xed\xa2\x98\x80\xaa\xad\x2f\xac\x55\xce\xa9\xba\x28\x5f\xbd\x75\x58\x57\x65\x14\x57\x95\xa5\xd1\x3a\x24\x94\x52\x21\xd7\xf6\xfd\x7b\xdf\xf8\x13\x00\xe8\xdb\xc6\x76\x9d\xdf\xbd\x71\xe8\x7d\x80\xb1\x00\x6d\x4f\xd6\x86\x3b\x0d\x15\x80\x07\x78\x32\x06\x7c\xc0\xbf\x27\x03\xc9\x2b\x50\xc1\xf3\x3d\xf8\xbe\x6d\xba\x76\xc3\xa1\x8b\xa7\x09\x0f\x9e\x2d\x62\xcb\xe4\x21\x70\xa7\x92\x70\x5f\x84\x50\x06\xf6\x30\x8a\xf0\xba\x78\x71\x4e\xa4\xc7\xc5\x04\x57\x95\xb7\x5d\xac\x82\xe4\x90\x22\x29\x68\x57\x89\xb9\x3f\xc9\xe1\xd3\x76\xde\xba\x14\x22\xe6\xf5\x04\xa9\xc7\xa3\x10\x7e\x95\xc8\x1f\xdf\x5f\xbc\x6a\x3e\x65\x11\xd5\xf3\x3b\xe2\x4d\x4e\xe9\x89\x55\xe2\x7a\x72\x9e\x58\x0b\x30\xdf\x26\xb5\x60\x24\xe0\x9e\x13\x13\x65\x59\x4e\x26\x13\xdc\xc0\x8c\x3e\xb8\x78\x84\xe7\xa8\x4f\xca\xeb\x44\x1d\xf8\xb0\xca\xe8\x99\xf9\xcb\x29\x2e\x01\xc3\x4e\x5b\x48\x84\x55\x6f\x5d\xd7\x93\xc9\xc4\x5a\xfb\xce\x3b\xef\x7c\xf0\xc1\x07\x23\x91\xf8\x0a\xd2\x85\x57\x84\x17\x3d\xff\xfb\x59\x48\x0e\x27\xa5\x85\x85\x60\xc0\xbf\xc1\x85\x60\xaa\xe3\x23\x89\x03\x92\x14\x4c\xe5\x84\xbf\xb6\xef\x7e\xee\x7f\xfc\x7b\x1f\xbc\xfd\x4d\x53\x54\xad\xd5\xaa\x03\xdd\x39\x6d\x3a\x63\xda\xba\xae\xf7\xc6\xb3\x52\x1e\xb6\xb8\x04\x4a\xc1\x76\xb5\x07\x9b\xb6\x7b\xfc\xce\xb7\x3f\xf3\x95\x9f\x28\xea\x1a\x00\x9c\xf7\x2a\x06\xd3\x27\x71\xca\x03\x28\x1f\x96\x7d\x4a\x19\xad\xad\x73\x3b\x74\x0c\x0b\x3f\x88\x83\xc2\xc7\x1f\xdb\xc4\x96\xc9\x76\x1d\x00\x84\x5b\x86\x64\x25\x91\x01\x30\x9c\xc9\xad\xc7\xe3\x75\x66\xde\xca\x01\x60\x70\xa6\x4f\xd2\x79\x1e\x92\xc3\x2f\x01\xdb\x8e\xe3\x5d\xfc\x64\x16\x22\x05\xf1\x54\x64\xe1\x11\x90\x34\x93\xcb\xe1\xb6\x22\x41\x53\xa4\xfc\xa5\x31\xee\x1d\x39\x39\x76\x72\x1e\x52\x3c\xd5\xd7\xa9\xde\xf1\xde\xe3\xdd\xb3\xc8\x90\x59\x8e\x90\x7e\x89\xaa\xf2\x4a\x71\x91\x31\x62\x33\x3c\x29\xcb\xfb\xdd\x4b\xf4\x83\x44\x96\x83\x91\xb8\x6d\x33\x9e\x8c\xc7\x88\xd8\x4c\xb5\x3f\x6b\x11\xbd\x08\x4b\x8b\x15\x61\xaf\xe6\xc6\xcc\x28\x13\x1e\x99\x51\xfb\x14\x71\x31\x3e\x53\xfa\xea\xab\xaf\x5e\xf4\xd3\x4e\x57\x01\x53\x8a\xf1\x1f\xaa\xb8\x90\xdc\x40\x9f\xfa\xf7\x35\xbc\xf7\xcb\xe5\xf2\xd1\xa3\x47\x5a\xeb\xc9\x64\x52\x55\x55\xfc\xca\x3c\xc6\x3c\x8e\x7f\x24\x5a\x45\x81\xa9\x78\x21\x16\x11\x85\xc4\xc4\xaf\xff\xe2\xff\xfa\xad\x3f\xfa\xed\xde\x6a\x67\x7d\xe9\x9c\xd2\xce\xb4\x9d\xd1\x26\x2c\x52\x83\x0f\x05\x3d\x9f\x4c\xf7\x94\x52\xbb\xb4\xb5\xee\xf8\xec\xbc\x2c\xcc\x5b\x7f\xf4\x3b\x5f\xfd\xb7\xfe\xdd\x00\x77\xe1\xf1\x51\xbc\xd9\x09\xd8\x89\x91\x92\xde\xfb\x27\x38\xb8\xe3\x7a\xf2\x63\xdf\x8a\x00\xca\x76\x9d\xd6\xa6\x28\xe9\x1b\xb2\x24\x0a\x78\xf6\xf5\xe0\x98\x9f\xeb\x27\x26\x8a\xa7\x49\x2d\x7b\x7a\xef\x46\x35\x8e\xd1\x1c\x7e\x08\x92\xf1\xba\x48\x34\x07\xa9\xd7\x00\x75\x68\x66\x0d\x91\x0a\xdc\x19\x5f\xca\xc8\x21\x9c\x99\x49\x80\x18\xdd\x46\x82\x1c\xce\x11\x2d\x13\x63\x5c\x06\x96\x52\x3c\xbc\x69\xa4\xbf\x48\xa5\xa9\xbe\x10\x3b\x94\xf7\x05\xb0\x2e\xc0\xbd\x2f\x36\x3f\x35\xa5\x4b\xf1\x10\xe5\x49\xed\xdb\x87\xb4\xa5\x09\x1c\xce\x09\x0f\xeb\x71\xb1\xbc\x6a\xa2\xd2\x60\x2f\x47\x7e\x8e\x64\xc4\x01\x88\x65\x78\x77\x60\x39\xdc\x32\xc4\x0e\x91\x42\x1c\xc0\x7d\x14\x9e\xa0\x89\x69\xad\x75\xdf\xf7\xf7\xee\xdd\x3b\x3c\x3c\xfc\x91\x1f\xf9\x91\x91\xef\x57\x5c\x3a\xa6\x04\x7a\x91\xee\x11\x86\xaf\x46\xac\x56\xab\xa2\x28\xe2\x49\x31\xe2\xa3\xa1\x19\xfc\xcb\x44\x9c\x0b\xfd\x25\x12\xbe\xf7\xed\xbf\xf8\xf5\x5f\xfc\x27\x5d\xe7\x57\x4d\xef\x95\x9a\x82\x2d\x8a\xce\x18\x63\xb4\x29\x8a\x56\x81\xea\x7a\xab\x8c\x9e\x4e\x6a\xad\xb5\x73\xde\x3a\xd7\x76\xbd\xd6\xaa\x2c\x8a\xd9\xa4\xd6\x4a\x1d\x9f\x9f\xdb\xbe\x77\xd6\xde\x7f\xf7\x3b\xaf\xff\xc8\x97\x0e\x5f\x7d\x23\xee\xda\x28\xb5\xdb\xed\xdc\x11\x1a\x36\xdb\x45\xe1\xf6\x07\xe0\xf1\xb4\x73\x74\xd8\x3e\x5c\x13\xf7\x56\x15\x80\x07\xdf\x35\x1b\x6d\x0a\x8c\x73\x8a\x4d\x1e\xc9\xcc\x94\x0f\x0f\xd8\x1f\x3f\x44\x8e\xc8\x49\x02\x2b\x0f\xa6\xb0\x1f\x55\x53\x13\x5e\x3e\xd4\xc5\xa0\x4f\x18\x78\x98\x10\x61\x98\xab\x4d\x1a\x0b\x2c\x8c\x8a\x0c\xa2\xc5\xf0\xa5\x14\x43\x9e\x0d\xc7\x23\xb1\x08\xd7\x39\xd5\x9c\x14\x5c\xa5\x78\x52\x62\x07\xeb\x4a\xd5\x2e\xda\x4a\x94\x43\xdc\x46\xf4\x31\x32\x91\x02\x06\x00\x19\x1e\x60\x1e\xa8\xd0\x7a\x88\xab\xc1\x13\xf1\x68\x7e\x91\x87\x54\x11\xdb\x22\xba\xfd\xe0\x25\xd8\xf7\xc3\xd4\x28\x26\xfa\x90\x1c\x51\xbd\x4c\xdf\x11\x30\x06\x74\x24\x72\x58\x1d\x6a\xad\x97\xcb\xe5\xdb\x6f\xbf\xfd\xe6\x9b\x6f\xc6\x23\x05\xae\x3e\xbd\x30\x40\xb8\xd9\x6c\x1e\x3e\x7c\xe8\xbd\x0f\x8f\x86\x86\x8f\xe8\xa6\x0e\x4b\xc3\x69\x18\x31\xc8\x33\xfc\xa9\xbf\xb1\x38\x00\xb4\x4d\xf3\x4b\xff\xe8\xbf\x6f\x9a\xe6\x6c\xd5\x6d\x3a\x30\x85\xd2\xa6\x8d\x0b\x41\x0f\x70\xba\x5c\x1f\x1e\xcc\x8b\xa2\x6c\xda\xce\x6d\x17\x72\xaa\x2c\x4c\x59\x94\x55\x61\x14\x80\x73\x16\xbc\x9b\xd6\x65\x5d\x16\x6d\xdb\xdd\xff\xf6\x37\x0e\xee\xbc\xaa\x8d\xf1\x00\xe1\x5b\x51\x19\xcb\x3c\xd1\x47\x6d\xef\x20\xa2\xf0\xa0\x00\xed\x96\xc2\x93\x27\x49\x15\x80\x02\x00\xdb\xb5\xba\x1e\xde\xc7\xe0\x03\x09\x53\x6a\xea\x8d\xd5\x13\x33\x45\x38\x21\x71\x39\x1f\xfb\xc4\x68\xc8\x83\x08\xce\x14\xa3\x6d\xaa\x67\x45\xca\xcb\x14\xc5\x72\x4d\x44\x9f\x4c\x29\x90\xd1\x99\x17\xcf\x68\xce\xaf\x92\x6e\x15\xe7\x01\x99\xba\xc4\x9c\x14\x12\xa7\x06\x60\x4a\x60\x9e\x41\x5c\x12\xf1\xb0\xce\x45\xe5\x79\x44\xfd\xc9\xa6\x68\xca\x01\x8c\x31\x61\x57\x30\x33\x43\x12\x5b\x2a\x3a\x0c\xbf\xc4\x15\xe6\x88\xce\xdb\xc5\x47\x2e\x09\x7a\xa9\x89\x63\x0a\x95\xe3\xd4\x59\x84\xc3\xb0\x3f\xd7\xb6\xed\xdb\x6f\xbf\xfd\xd9\xcf\x7e\xf6\xf6\xed\xdb\x79\x87\xbc\x22\xf4\x02\x00\xa1\xf7\xfe\xec\xec\xec\xf8\xf8\x38\x7c\x23\xf0\x42\x0b\xc1\x31\x71\x50\x2c\x98\xf9\x4b\xe4\x38\x6b\xff\xe0\x37\x7e\xf5\xdd\xb7\xfe\x72\xb5\xb1\xc7\xcb\x46\x81\x51\xbd\xef\x9c\xb7\x1e\xac\xf3\x5a\xeb\xce\xda\xba\xae\x35\x80\x77\xae\xb3\xae\xac\x8a\xc2\x98\xba\x2a\xeb\xb2\xa8\xab\xca\x3b\x67\xfb\xde\x79\x37\xaf\x2b\x67\xad\x75\xd6\x28\x7f\xf6\xe0\xde\xc3\xf7\xbe\xf3\xda\x17\x7f\x2c\xec\x9f\x86\xdd\xf9\xfd\x77\x28\x9e\x98\x07\x00\xb4\xd6\xce\x5a\xbf\x35\x17\xc4\x97\x0b\x21\xbc\x4b\x01\xd1\x9b\xb7\x0f\x9c\x46\xac\xb4\xb6\x2f\x12\xfb\x93\x38\x11\x87\x44\x06\xf3\xc4\xe1\x97\x1f\x93\x64\xa9\xc7\xaf\x8a\x75\xc5\xbe\xc0\x47\xcd\x89\x55\xe3\x41\x9e\xc1\x4b\x02\x57\x78\x78\xa7\xc6\x30\x87\x67\xde\xae\x31\x3f\x33\xa8\x9f\x0f\x4f\x17\x2d\x92\x49\x73\x9b\x5c\x54\x8e\xd8\x84\x94\x01\x33\x42\xc4\xb2\xa9\x34\xc7\x0c\xd1\xe5\x80\xf5\xfe\x20\x0f\xf7\x84\x40\x5c\x0e\xec\xbb\xe5\x62\xb1\x88\x8f\x79\x8b\xe6\x4d\x51\xc6\xed\x45\xe6\xcc\xb8\x13\x75\x1b\x33\x4e\xc9\xf8\x12\x67\xae\x98\xf0\xd9\x6c\x20\xf9\x43\xd7\x75\xef\xbf\xff\xfe\x6a\xb5\xba\x7b\xf7\xee\xd5\x3f\x86\xe6\xaa\x03\xa1\x73\xee\xe8\xe8\xe8\xfc\xfc\x3c\xbe\x23\x18\x57\x5a\xc0\x30\x8c\x8c\x10\x82\x5e\x04\xc6\xc4\x41\x35\x08\x81\xc4\x21\x9c\xb5\xcd\x66\xfd\xcf\x7f\xe1\x9f\xae\x1b\xfb\xe8\x74\xb3\x69\xed\xa4\x54\xde\xfb\xae\x71\xce\x79\xe7\x7d\x55\x16\xf3\xe9\xd4\x3b\x77\xff\xe8\xf8\x60\x36\x2b\xca\xa2\xd4\x75\x59\x98\xd5\x7a\x5d\xe8\xb9\xed\x7b\xe7\x9c\x73\xd6\x39\xeb\xac\xb5\xfd\xf6\x7f\xdb\xf7\xef\xfd\xd9\x1f\xde\xba\xfb\xf9\x72\x32\x81\xdd\x6d\x6a\xe0\x5b\x31\xde\x83\x52\x1e\x40\x03\x38\xb5\xbd\x8b\xa8\xc2\x33\xa2\x00\xbb\x97\x26\x82\xda\x58\xeb\x27\x88\xea\xf7\x8f\x2d\xdd\x66\xa6\x67\x97\x3c\xa0\x8b\xd3\x46\x60\xc3\x55\xb4\x1e\x01\x2a\x6c\x6a\x22\x56\x94\x4f\xa4\x91\x22\x62\xc7\xf1\xd9\xb1\xa8\x1e\xd7\x53\xe4\xe4\xfc\x62\x03\xc7\x5c\x25\x81\x98\xab\x4a\x6a\xcc\xe8\x20\xa6\x79\x04\x87\x7d\xfb\x93\x1a\x33\x3c\x62\x2d\xc4\xec\xe3\x8d\x90\xe7\xe1\x5e\xc4\x31\x83\x78\x11\x2f\x45\xa6\x44\xa2\x64\x8e\x73\x31\x1d\x3f\x34\xc1\xe5\xe0\x9c\xa2\x28\xc2\xc3\xa2\xa2\x57\x73\x63\xe2\x04\x6f\xbb\x08\xea\x98\x99\xcb\x81\x7d\xe4\x1b\xb4\xa1\xa8\x89\x58\x05\x64\x07\x4e\x0c\x4d\x58\x7e\xa4\xc7\x8f\x1f\xaf\xd7\xeb\x37\xdf\x7c\xf3\x8a\xbf\x77\x7f\xa5\x81\x30\x7c\x44\x30\xbc\x20\x41\x0e\xce\xe6\xd0\x95\x01\x33\xd8\x1f\x3f\x98\x93\x30\xf3\xb2\x19\x09\xce\xda\xb6\xd9\x7c\xe7\x5b\x7f\x7e\x76\xff\xfb\xbd\xf5\xd6\xfa\x72\xb7\x69\xe0\xac\xb3\xc6\xf6\xbd\xed\xba\xae\x31\xc6\x3a\x5f\xd7\x55\x59\xe8\xc2\xe8\xd5\x66\x3d\xf1\x55\x55\x98\x42\x43\xdf\x77\x6e\xfb\xb9\xa6\x2e\x7c\xa1\x69\x9b\xd3\xf7\xeb\xd5\xf2\x7b\x7f\xfe\x87\x5f\xfe\xdb\xff\x0e\x28\xe5\xbd\x77\xd6\xc6\x13\xb4\x01\x60\x07\x82\x00\xde\x2b\x00\xaf\x60\x7b\xe3\x1a\x20\x40\x63\xe0\xf2\x6a\x7b\xee\x5a\x7c\x81\x42\x3d\x59\x2d\xaa\xad\xa0\xec\x94\x39\xa4\xc9\xdb\xb2\xf9\xb8\x16\xc7\x12\x97\x0c\x6c\x72\x9a\x1a\x5d\x78\x58\xc6\x7e\xc1\x5a\x05\xe2\x71\x39\x0a\xe4\x30\x9c\x47\x41\x22\x47\x6c\x1a\xe7\x19\xcc\x11\x03\x5c\x9e\x47\xbc\x04\x52\x60\x15\x6b\x17\xd3\x5c\x1a\x61\x10\x91\x8c\x9b\x74\xa4\x1c\xc2\x40\xc6\x57\x86\x07\x98\xa1\x32\xcd\xc9\xb4\x2b\x12\x97\x93\x71\x0c\xc2\xa3\x94\x72\xf8\x15\xa6\xac\x7d\xc2\xc3\xa2\xa2\x3e\x64\x8d\x98\xe9\x74\x51\x32\x51\x89\x8c\x4d\xd1\x43\x52\xb3\x07\xee\x3f\xe2\x5c\x93\x48\x20\x53\x5e\xae\x33\x79\xce\x80\x04\xd8\xa6\x69\xde\x79\xe7\x9d\x37\xdf\x7c\xf3\x2a\xbf\x68\x78\x75\x81\xb0\x6d\xdb\x07\x0f\x1e\x84\xcf\x47\x84\x77\x24\xc2\x06\x74\xb4\x2f\x64\x81\x10\x46\xc4\x17\xe2\xb8\xfc\x67\x46\x8e\x73\xae\x6d\x9b\xf3\xf3\xb3\x6f\xfe\xd1\xd7\xd6\x4d\x7f\xbe\xea\x9c\xf3\x0a\x54\xdb\x5b\x07\x30\x9f\xd4\x95\xd1\x0a\x7c\xdb\x75\x45\x51\x28\x80\xde\xe8\x4d\xb3\x29\x6d\xb1\x6e\xbb\xcd\xa6\xbc\xb1\x98\x35\x1a\x14\xc0\xf6\xa3\x85\x7d\x6f\x6d\xdf\xb6\x9d\x02\xdf\x77\x6d\xc0\xc6\xb7\xff\xf8\x77\x5f\xfb\xc2\x8f\xdd\x78\xed\x0d\xd8\xbe\x4a\xe1\xc2\x7b\x9f\xd1\xab\x61\xb7\xb0\x0b\x6f\x57\xe8\x30\x6e\x43\xae\xda\xbd\x3c\xa1\x76\xfb\xa0\x7e\x97\xda\x3e\x51\xb3\xdd\xee\x8f\x8d\x8d\xe8\x15\x29\x33\x89\x26\x73\x4f\x71\xec\xf1\x88\xc3\x85\xe7\x67\xe5\xa2\x1c\x3e\xf2\x89\xd8\x4c\x10\xc9\xe8\x73\x21\x12\x23\x5a\x26\xca\xe4\xa3\x1e\x06\x06\x2e\x41\x2c\xce\xe5\xa4\x30\x12\xe7\x8f\x44\x32\xd8\x1f\x47\x19\x99\x29\x1e\x6e\x70\x8c\x04\x29\x1e\x2e\x5f\x6c\x14\x31\x02\x0e\xc1\xb8\x78\x6a\x2a\xc6\xfd\x39\xc5\xe3\xd1\xc9\xa2\x44\x79\xa2\x79\x78\x77\x50\xac\x1d\x4b\xe3\x46\xc8\x10\xe9\x11\xb1\xde\x48\xe2\x04\x8b\x30\xc4\x96\x8e\xc4\x3c\x51\x72\x2c\x42\x24\xe0\x5d\xab\x90\x19\x57\xd2\x4a\xa9\xae\xeb\xbe\xfb\xdd\xef\x7e\xee\x73\x9f\xbb\xd0\x4b\x0a\xcf\x93\xae\x28\x10\x6e\x36\x9b\x4f\x3e\xf9\x44\x6b\x4d\x3e\xa2\x44\x70\x0e\x03\xd8\x78\x0c\x13\xe1\x33\xf3\x17\x24\x77\xe9\xda\x76\xb5\x3c\x3f\x3e\x7a\xf4\xf6\xb7\xfe\xf2\xf8\xbc\x6d\x5a\xdb\x5b\xe7\x3c\x58\xef\xaa\xa2\x00\xef\x9d\x75\x60\xac\xb5\xb6\x69\x9a\x4d\xd3\xa8\xcd\xa6\x5a\x55\x45\x61\x8a\xa2\xa8\x2b\x3b\x2d\x75\xa1\x7c\xd8\xf6\x0c\xcb\xc1\x93\xf3\x95\x06\x67\x14\x74\x6d\x6b\x6d\x1f\xe0\xf1\xcf\x7e\xe3\xff\xfe\xb7\xff\x83\xbf\xab\x75\xe1\x21\xbc\x4a\xa1\x14\xc4\xb3\x1e\x60\x0f\x0b\x01\x94\xd6\xe0\x9c\x82\x78\xe6\xb6\x07\x80\xed\x33\xa3\xdb\x7b\x85\x31\x7b\xeb\xc7\xa6\x28\xb1\xd9\x09\x78\x90\x71\x9b\x8a\x38\xdc\x44\xe2\x50\x21\x69\x32\xce\xc9\x78\xc3\xe3\x56\xc4\xd4\x54\x90\xcd\x47\xc3\xf1\x09\x3e\xf8\xb9\x92\xa4\x14\xc7\x06\x11\x2d\x32\x00\x83\x35\xcf\x08\xc9\x08\x4c\x15\xc4\x8d\x22\x6d\xe1\x9d\xc5\x55\x4a\x0d\x2b\x12\xee\x07\x01\x72\x90\x67\x30\x9a\x63\x09\x78\x12\x46\x98\x53\xc0\x96\xea\x47\x91\x87\x7c\x7d\x37\x23\x9f\xac\x75\xa2\x9e\x29\x27\x24\x06\x11\x13\xb8\x81\xb0\xef\xcf\x5c\xab\x94\x4c\x2c\x87\x30\x73\x53\x8c\x41\x68\x3c\x24\xb1\x84\x78\x36\x37\xfe\x8b\x4b\xb5\x6d\xfb\xde\x7b\xef\xf5\x7d\xff\xca\x2b\xaf\x0c\x0e\x81\xe7\x4f\x57\x11\x08\xd7\xeb\xf5\x27\x9f\x7c\x62\x8c\xc9\x7c\x50\x3e\x52\xfc\x09\x09\x0c\xc3\x94\xe2\x17\x0b\x92\x04\x1e\xed\x7d\xd7\xad\x57\xcb\xd3\xe3\xc7\x47\x0f\x1f\xbc\xff\xde\x07\x4d\x6b\x95\x52\x55\x61\xbc\x87\xd6\x42\x98\x1f\x59\x6b\xbb\x5e\xa9\xa6\xe9\xfa\x7e\xf7\xd1\x67\x5b\x95\x45\x59\x16\xb5\xd1\xde\xf6\xcd\xc6\x6d\x81\xd0\xf6\x5d\xd7\xad\x57\xe7\x93\xd2\x74\xce\xf6\x5d\xd7\x77\x5d\xdf\xf7\x6d\xd7\xff\xf5\x37\xfe\xf4\xee\x57\x7e\xf2\x47\xff\xb5\x7f\x13\x40\x39\xef\x95\xf3\x5a\x63\x3c\xde\x1e\x2d\x1a\xf6\x3c\xa3\x3b\x86\x0b\xbb\x43\x47\x77\x1b\xa2\x7e\x87\x9b\xe1\xa4\x36\x0f\xda\x68\xfc\x1e\xa1\x92\xf0\x46\xb4\x61\x1c\xe1\x99\x22\x64\x34\x92\x31\x8c\xc1\x8f\x07\xe2\xc1\xb8\x9c\xe9\xa6\x9d\x65\x92\x4b\xb1\xf1\x89\x54\xac\xcc\xd4\x9b\xaa\x5d\x94\x90\x17\x38\x3e\x58\x44\x33\x0e\x16\xe1\x93\x1b\xee\xdb\x3c\xf8\xa6\x1a\x98\xea\x7d\xc5\x26\x07\x9e\xed\xae\x73\xf9\x22\x98\x45\x67\x10\x75\x20\x09\xb1\x6c\x86\x3f\x33\xd5\xf3\x3b\x12\x4d\x47\x74\x0e\x5b\x56\x19\xe1\x8a\x81\x1c\xaf\x1a\x12\xce\x40\x72\x62\x7e\xa6\xd5\xb8\x22\x4e\x6a\x1f\x68\x89\x7d\x78\x41\xae\xbc\x92\xb0\x10\xc2\x23\x7b\x08\x05\xd5\x3e\x85\x82\x1f\x7e\xf8\xa1\xb5\xf6\x8d\x37\xde\x10\x75\xbb\x44\xba\x72\x40\xb8\x5a\xad\x3e\xf9\xe4\x13\xfc\xa6\xe0\x0f\x88\x82\x38\xbe\xa4\x8a\x90\x52\x62\x22\xf6\xba\xed\xfb\xcd\x66\xbd\x3c\x3f\x3d\x79\xfc\xf8\xe4\xf1\xc3\xf3\xd3\xa5\xf7\xdb\x8f\x42\x00\x78\xbd\xf3\x8c\x80\x85\x67\x5d\x6f\x4c\x31\x9b\xd4\xe0\xbd\x87\xde\x3b\xeb\x9d\x3d\x73\xae\x54\x7e\x52\x15\x0a\xa0\xb7\xfd\x7a\xd3\x78\xdb\x17\xca\xb7\xcd\x26\x6c\x93\xf6\x7d\xdf\x5b\xd7\xf6\xb6\xb5\xf6\xb7\x7f\xe5\x97\xee\x7e\xe9\x2b\xb3\x83\x1b\x4a\x81\x73\x4e\x29\x08\x1f\x9f\xd8\xe9\x13\x6e\xfd\x6d\x55\x08\x5e\xa8\x02\x46\xaa\xed\x1e\xa8\xf2\xe0\x21\xfa\x3e\xa8\x90\x01\xaa\x9a\x4c\x33\x03\x86\x13\x76\x7a\x3e\xc8\x79\xd4\x18\x1c\x8d\x62\xe0\x16\x07\xa4\x18\xd4\x78\x28\xe1\x81\x80\xf3\x8c\x6c\x23\x89\x38\xdc\x25\xb8\xfe\xa4\x6c\xa6\x8d\x44\xd4\x53\x94\x15\x85\x8c\xe1\xe4\x03\x84\xf0\xa4\x42\xb3\x08\x48\x8a\x4d\x77\xf2\x4a\x8a\x6b\x32\x2e\x99\x0f\x4f\xcc\x43\xfa\x82\xb8\xa5\xb8\xea\xe2\x3a\x8b\x9a\x60\x0a\x9b\xa2\x84\x07\xbb\x7a\x2c\x15\xee\x0e\xf2\x7a\x71\x75\xbc\x7f\x45\x23\x70\x7d\x08\xf6\x60\x66\x8e\xb5\x23\xbb\x35\x23\x90\x33\xc7\x4b\x9c\x87\x0b\x89\x28\xe8\xd1\x66\x29\x6e\x08\x00\xdc\xbb\x77\xcf\x39\x77\xf7\xee\x5d\x51\xd5\xcb\xa2\xab\x75\xd6\xe8\x7a\xbd\x7e\xf0\xe0\x41\x38\xc5\x8e\xa3\x60\x8a\x60\xc4\x38\x14\x8b\xf0\x4c\x60\xc3\x8c\x08\xb7\xd6\xb6\xcd\x66\xbd\x3c\x3f\x3b\x3d\x39\x3b\x79\x7c\x76\x7a\x0a\x61\xd3\x71\x57\x97\xf5\xde\xe8\xad\xdf\x38\xe7\xba\xde\x36\x6d\xbb\xde\x6c\x94\x77\x1a\x7c\xa9\xc0\x80\x5f\xaf\xd7\x8f\x4f\x4e\x97\xcb\xe5\xe9\xd9\xd9\xd1\xe3\xe3\xd3\xb3\xb3\xae\xdd\x34\xeb\xd5\x66\xbd\xde\x6c\x36\x4d\xdb\xb6\x7d\xdf\xf4\x7d\xef\x9c\xf7\xea\xe4\xe1\xa3\xdf\xfd\xd5\x5f\x06\xbf\x7d\x46\x39\x2c\xf8\x76\x03\x12\x00\x3c\x1e\x35\x4a\xa9\xed\xf3\xb4\x80\x6f\x11\xee\xef\x93\x80\x57\x4a\xd5\xd3\x99\xd6\x26\x83\x46\x7c\x34\x8a\x86\x25\xe9\x54\x47\x0c\x42\x51\xc6\xfe\xc0\x62\x25\x0f\x6d\xbc\xde\x0c\x4f\x26\xc1\xdb\x2e\x0a\xe7\x3c\xb0\x1f\x1f\x15\x43\x94\x94\x73\x62\xe6\xbc\x1b\x47\x39\xe2\x42\x87\xeb\x20\x9a\x22\xdf\x95\x22\xda\x11\x21\xe2\xcc\x83\xb0\x91\x31\xc5\x8b\x8b\x6c\x99\x86\x67\xf4\x21\x3f\x53\xbe\x27\xf2\x13\x84\x8b\x69\xb2\x29\x8a\x13\x24\x86\x84\x8f\xbe\x81\xd4\xc5\x7e\x47\x6a\x1f\x48\xc8\xc4\x11\x27\x44\x7d\x94\x04\x63\x38\x91\xea\x2f\x4e\xa9\x52\xa9\x11\x81\x6b\x4f\x75\x34\xae\x8e\xd7\x1b\x5f\xb4\x0f\x9f\x33\x0c\x74\xff\xfe\xfd\x8f\x3e\xfa\x88\xeb\x7c\x89\x74\x85\x56\x84\x9b\xcd\xe6\xde\xbd\x7b\xd1\x58\x1c\x05\x41\x1a\x39\xa9\xde\x4d\xf5\x10\x48\xbd\x0e\x92\x5b\x90\x44\x40\xb6\xbe\x6d\x37\xeb\xd5\xf2\xfc\x6c\x79\x76\xba\x3c\x3f\xdb\x2c\x57\x93\xd9\xf4\xf4\xf4\x04\x00\xbc\xf7\x6d\x6f\xc1\x3f\x59\x14\x5a\xeb\xc0\x3b\xa5\x74\xa9\x55\xdf\xf7\x65\x61\xbc\xed\xd7\x5d\xeb\xbc\x2f\xc0\x9e\xf4\xed\xa6\x6d\xa7\x95\x29\xc0\x37\x1b\xdb\xf7\xd6\x86\x17\x29\xbc\x5f\xb7\xb6\xb3\xae\xd4\xba\x77\x7e\xd5\x76\xff\xf2\xb7\x7e\xf3\x47\x7f\xf2\x6f\x7d\xe1\xc7\xff\xa6\x52\xca\x3b\xef\x95\x07\xa5\xfc\xf6\xdc\x35\x50\xdb\x05\x5e\x80\x38\xd0\xc6\x6c\x5f\xb0\x4b\xc4\x3c\xa5\x54\x3d\x9d\x87\xbb\x83\x64\xa2\x47\x2c\x10\xf3\x45\x1e\x1c\x04\xd5\xfe\xbd\x1f\x32\x71\xce\xcc\x37\x89\x9d\x2f\xf4\x53\xb1\x59\x70\x0c\x22\xe4\x12\x4f\x88\xd2\x78\xdb\xc5\x10\x03\xc8\x79\x08\x0e\x71\xe3\x10\x1b\x8a\xa2\xf2\xfa\xe0\x74\x6a\xd9\xc1\x15\xc3\x3c\x5c\x19\x18\xd7\x11\xe2\xd5\x3c\xcf\x48\x4a\x2d\x74\x52\xb5\x64\x7a\x70\x0c\x0f\xaf\x05\xd2\x3d\x12\xb1\x6a\x90\x94\x52\xf1\x64\x51\x71\x95\x26\xd6\x88\xe5\x13\x50\x8c\x12\x52\x61\x8d\xb7\x37\x53\x9d\x58\x24\x33\x13\x12\x57\x8d\x30\xe4\x36\x5c\x81\x40\xdb\xdb\x34\x00\x6a\x37\x3b\xc7\xba\xdd\xbf\x7f\x5f\x6b\x7d\x75\xf6\x48\xaf\xca\x8a\xb0\x6d\xdb\x80\x82\xf8\x10\xed\xd4\xd3\x31\x31\x2d\x42\x1a\x49\x70\x1e\x5e\x96\x07\x1d\xee\x8b\x00\xd0\xdb\xbe\x69\x36\xab\xd5\x72\xb5\x3c\x5f\x2f\x97\x9b\xcd\xa6\xed\x9a\x83\x9b\x37\x23\x83\xd1\xba\x2e\x0b\x80\xed\x60\x02\xef\x15\x80\x73\xae\xeb\xbb\xae\x6d\xdb\xb6\x5d\x6f\x36\x67\xcb\x95\xed\x5a\xd7\x77\xeb\xf5\xaa\xef\xda\xd5\x6a\xbd\xd9\x34\x9b\xa6\x6b\xba\xbe\xe9\xed\xa6\x77\xcb\x4d\x7f\xbe\xe9\x9c\x83\x75\x67\x4f\xd6\x4d\x6b\x5d\xd3\xf6\xbf\xfa\xf3\xff\x5b\xb3\x5e\x05\xa1\xd6\x59\x78\xe2\x8b\xde\x6f\xdf\xa3\xd8\xfe\x02\x00\x6d\x0c\xc0\x76\x91\xfa\xa4\x69\xe1\x9e\xb6\x31\x93\xf9\x41\x7c\x46\x46\x0c\x37\xd1\xb3\xc5\xb9\x2a\xb0\x39\x2c\x24\xc6\x5e\x0a\x2a\x70\x2d\x62\xff\x66\x22\x5a\x06\x7e\xc8\x25\x52\x91\xc8\xcc\x7f\x8a\x6d\xe4\x02\xf1\xe0\xe7\x7e\x85\x33\x31\x08\x01\x73\x3f\xd8\xb7\x2d\xd7\x2a\xef\xf3\x44\x4e\x2c\x88\xed\x93\x6a\x29\x21\x1e\x9d\xb9\x49\x39\x42\x64\x5c\x02\xa7\x53\x72\x38\x0c\xe4\xf5\x89\xf9\x29\x4a\x31\xa4\x6c\x82\x19\x22\x4f\x7c\x52\x34\x2f\x1c\x00\xe2\x1b\xf4\xf1\xaa\x62\x6b\x3e\x62\xb4\x68\x10\xd1\x61\x06\x9b\xc0\x33\xb9\x01\x79\x17\x63\x05\x88\x47\x71\x1e\xd1\xa3\xa2\x7a\xbc\x52\x8f\xba\x98\x34\x2d\x1e\x37\x13\x7f\xc6\xa5\x61\x55\x55\x1f\x7f\xfc\xf1\xc3\x87\x0f\xe1\x6a\xd0\x95\x58\x11\xb6\x6d\x7b\xff\xfe\xfd\xf0\x69\x0f\xf2\xb2\xa0\x38\xec\xc5\xbe\xe4\xdd\x2f\x16\x11\x7f\xc2\x7e\xf7\xb7\x9b\xcd\x7a\xb5\x3c\xfa\xe4\xde\xc9\xd1\xc3\xe5\xc9\xe3\xd5\xd9\x69\xd7\xac\xda\xcd\xaa\x6b\x1b\x05\x0e\x00\xda\xb6\xe9\x7b\xdb\xf6\xb6\xe9\xfa\xc5\x62\x56\x57\xe5\xa6\x69\x41\x81\xd1\x6a\x3b\x12\x00\x14\x80\xf3\x5e\x2b\x70\x0e\xac\x75\x9d\xf7\xce\x59\xeb\xbc\xf3\x7e\x62\x60\xd3\x38\xa5\x94\x51\xaa\x77\xbe\xed\x3c\x80\xb7\xce\x5b\xef\x03\xfe\x79\x80\xd6\x5a\xa5\xc0\x6c\x9f\x48\x86\xf7\xdf\x7f\xff\x5f\xfc\xb3\x5f\xfa\xf7\xfe\xc3\xff\x08\xf0\x1d\x0e\xef\xfd\x2e\xd8\xee\xda\x0c\x10\x8e\xc9\x76\xce\x39\xb7\x5d\x33\xee\x5a\x58\x56\x93\x6a\x32\x05\xb6\x23\x44\x8c\x46\x3c\x1b\xa4\x80\x95\x92\x40\x7e\x12\x21\xa4\x08\x36\x3e\xcf\xc4\x3f\xc9\xe0\x8c\x99\xe1\x4b\xa1\x31\xd3\xb3\x55\x20\xef\x65\x2f\xcd\xd9\x53\x3c\x44\x1f\x85\x8d\x2f\xad\x02\xc5\x1a\x45\x6b\x88\x75\xf1\x4b\x5c\xe0\xe0\xa5\x41\x1b\x8e\x69\x63\x6c\x51\x66\x7c\xf1\x76\xe5\xab\xe0\x7e\x15\x79\xfc\xfe\x72\x8a\xa8\x2d\x46\x64\xee\x84\x44\x0d\xce\x83\xbd\x28\x44\x00\xee\x93\xe4\xf5\x79\xd1\x08\x21\x27\x9c\xaf\x9d\x32\x42\xc6\x74\x44\x0d\xa2\x4f\xca\xbc\x5c\x1f\x11\xba\xb8\x19\x53\xb6\xc2\x46\x13\x87\x33\xd7\x07\xf7\x14\x11\x92\x1f\x56\xfc\x45\x64\xe7\x5c\x51\x14\x1f\x7c\xf0\xc1\xab\xaf\xbe\x3a\x9b\xcd\x78\xab\x9f\x33\xa9\xa3\xa3\xa3\xcb\xd5\xc0\x39\x77\xef\xde\xbd\xbe\xef\xf1\x72\x90\xbf\x35\x2f\xa6\xc9\x5f\xfc\x33\x93\xe0\xa5\xac\xed\x8f\x1e\x3c\x78\xfb\x9b\xdf\x78\xe7\x5b\x7f\xf1\xe1\xbb\xdf\x3d\x79\xf8\xa0\x6b\xd6\x75\x3d\x99\x4e\x26\xa6\x28\x5a\xeb\xaa\xaa\x5a\xcc\x67\x65\x51\xdc\x3c\x5c\x68\xad\x5c\xdf\xd9\xbe\xb1\x7d\x73\x7e\x76\xd2\xb6\xeb\x66\xbd\x39\x3e\x3d\x7b\xf4\xf8\xfc\xf8\x6c\xb3\x69\xfa\xb6\xb7\x46\x2b\xb3\xeb\x7b\xad\x94\x56\x5b\xdd\x7a\xeb\xea\xc2\x78\xf0\xbd\xf3\xa5\x56\xb3\xba\x68\xba\x70\x7c\x3b\x38\x0f\xce\xfb\x70\x1e\x8d\x07\xf0\xe1\x09\x17\x0f\xde\x43\xd3\xf5\xbd\xf3\x55\x59\xfc\xa7\xff\xc5\x4f\xfd\xe8\xdf\xf8\x89\xe0\x9b\x85\x29\x94\x0a\xef\xce\x23\xc7\xdb\x25\xbc\xf3\xd6\xda\x80\xc7\xa0\x94\x29\xca\x0a\x7d\x9b\x3e\x12\x09\x79\xd8\xef\x49\xfa\x89\x2b\xe3\xd9\xa8\x8a\x75\x0b\xb3\xc8\x54\x4e\xe6\x2a\x0f\xc1\xa9\xe2\x7e\xff\x1d\xaf\x0b\x55\x3a\x92\x32\xc3\x3b\x32\x88\x97\x52\x9c\x23\x7f\xe6\x19\x9e\xee\x12\xce\x19\x29\xe1\x29\x2a\xcd\xa4\xe3\x21\x5b\x83\xfc\x22\x16\xc6\x9f\x62\xa4\xe6\x48\x90\xe1\x89\x69\x8e\x04\xe1\x50\x0b\x18\x47\x37\x6f\xde\x24\xa7\xa5\x64\x5c\x85\x13\xe1\x49\x81\x3d\xe7\x1c\x43\xa9\x81\x8c\x73\xb0\xad\x44\x7e\x9c\xc8\x8c\x53\x9c\x19\xa5\xc5\x74\x38\x91\x20\x20\x5f\xf8\x1b\x9e\x22\xec\xfb\xbe\xeb\xba\xae\xeb\x9c\x73\x6f\xbc\xf1\x46\x7c\xec\xf6\xb2\xe8\xc2\x40\xf8\xe9\x7e\x05\xc3\x7b\xff\xf0\xe1\xc3\xe5\x72\x99\xf9\xb2\x20\x81\xc0\x3c\xfe\xe1\xbf\xbc\x38\x29\xe2\x9c\xfd\xe0\xdd\xef\xfe\xde\xaf\xff\xf3\x3f\xf9\x9d\xaf\x7d\xf0\xbd\xef\x80\xf7\x65\x59\x4c\xea\xba\xae\xeb\xaa\xac\x26\x93\x7a\x52\xd7\x65\x59\x9d\x37\xcd\x7c\x36\xab\xca\xf2\xe6\xe1\x41\x5d\x57\x5a\x6b\x50\x0a\xbc\xf7\xde\x76\x5d\x7b\x74\x7c\xbc\xa8\x94\xeb\x37\x5d\xbb\x39\x3d\x3f\xbf\xff\xe8\xe4\xf1\xc9\xea\x7c\xd9\x76\x9d\x05\x80\xde\xf9\x22\x60\x3a\x00\x00\x68\xa5\x94\x02\xeb\x9c\xf3\x7e\x52\x18\xad\xd5\xaa\xed\x3d\x80\xd1\xca\x28\xe5\x3c\xf8\x1d\x0a\x46\xfb\xf4\xce\xf5\xce\x69\xa5\x7a\xeb\x3f\x73\xf7\x33\xff\xf9\x7f\xf5\xf7\xa6\xf3\xb9\x0f\xc1\x45\x1b\xd8\x36\x6a\xdb\x26\x80\x70\xa3\x50\x01\xda\xe1\x31\x45\x39\x99\x1f\xa8\xfd\xe9\x1b\x41\x9a\xbc\xa3\x7b\xef\xbd\xb3\xde\x39\xef\xec\xde\x98\xf0\xa0\x74\x7c\x71\xc3\x68\x74\xa2\x20\x09\x49\x64\xe2\xcf\xdd\x40\xcc\xe1\x45\xf0\xcf\x30\xa8\x44\x39\x4a\x9a\xba\x8a\x55\x47\x12\x79\x14\x9b\x5f\x83\x14\x8e\x45\x69\x99\x9f\x63\x78\xc4\x9f\x29\x7d\x2e\x5a\xf0\x07\xaf\x2b\x13\xa3\x09\xe4\x90\x91\x98\xe2\x81\xc4\x2a\x0a\x8f\x5f\xd1\xec\xe2\x1a\x25\xcf\x23\x6a\x8b\x3f\x40\x8f\x87\x06\xe6\x8c\x57\x27\x93\xc9\xe1\xe1\xa1\xa8\xf6\xe0\x24\x4c\x54\x80\xeb\x36\x12\x50\xc5\xc6\xe2\xfc\x14\xe0\x61\x06\xfc\x37\xc6\x07\x22\x6d\x24\x64\xe2\xbf\x91\x30\x1c\x72\x2c\x2c\xcb\xf2\xcb\x5f\xfe\x72\xfe\xd3\x02\x81\x9e\xdd\x37\x9b\x2e\x79\x6b\xf4\xfc\xfc\x7c\xb9\x5c\xe2\x97\x05\xc9\x33\xa2\x81\x8d\xff\x84\xc4\x50\x4c\xa1\x20\xb9\xda\x6e\x36\x7f\xfa\xbb\xbf\xf5\xff\xfc\xc2\xff\xfe\xcd\x3f\xfd\x7a\xdb\x75\x5a\x6b\x63\x74\x59\x56\xde\x03\x28\x65\xb4\x2e\x0a\xa3\x95\xd2\x4a\x15\x46\xdf\x5a\xcc\xeb\xaa\x2a\xab\x52\x83\xb7\x5d\xe7\x94\xf2\x00\xce\xbb\xf0\x35\xa5\xaa\xac\xc1\x98\xd9\x64\xe6\x6d\xe7\x74\x3d\x99\x2e\xbe\xfc\xa6\xdf\x6c\x56\x1f\xdc\x3b\x7e\xef\xe3\xc7\xcb\x65\x63\xb5\xae\x8b\x42\xeb\xdd\x93\x9c\x3e\xac\x11\x55\xe7\x7c\xdf\xd9\xa6\xb7\xe1\x5b\xf5\xfd\xce\xf7\xe2\xb6\x2a\x00\x28\x80\xce\xba\xd2\x18\xe7\x9d\x07\xff\xf0\xfe\xfd\x5f\xfd\x85\x9f\xfb\xf7\xff\xee\x7f\x02\xfb\x60\xb6\xfb\xb6\xd2\x96\x02\x12\x86\x43\xd7\xbc\xf7\x7d\xdf\xad\xce\x4e\x26\xb3\xb9\x36\x85\x18\x68\x08\x7e\xe0\xb4\xb3\xb6\xef\x5a\xe7\xac\x02\x50\x5a\xab\x9d\x7a\xdb\xe3\x69\xc2\xee\xac\x07\x0f\xbd\xb3\x3d\x74\xca\x14\x85\x31\x05\xec\x77\x16\x41\x41\x12\x2c\x44\x88\xc2\xd1\x21\x85\x3a\x24\xb6\x0e\x06\x0e\x11\x14\xb9\x32\x98\x87\x3b\x4f\x4a\x93\x4c\xbd\x9c\x93\xa8\x9a\xaa\x82\x68\x02\x2c\xe6\xa6\x38\x39\x86\xa5\x30\x26\x13\xeb\x53\xad\x20\x3c\x19\xc9\xf9\x36\x8e\x69\x1a\xe6\xe1\xfd\x45\x72\xc4\x3e\x15\x2f\xf1\xd6\x79\xb4\xc1\x80\xdb\x25\xe6\x68\xad\xe3\x2b\x13\xc4\x08\xdc\x57\x53\x72\xb8\x31\xf1\x88\x16\x91\x3b\xd3\x52\xb1\xf7\xb9\x35\x9e\x2b\xe3\xc1\x00\x00\x20\x00\x49\x44\x41\x54\xb0\xb5\x49\x82\x58\x66\xb0\xae\x94\x27\x88\xa3\x95\x3f\x38\xe3\xbd\x37\xc6\x84\x26\x37\x4d\xf3\xe1\x87\x1f\x7e\xfe\xf3\x9f\xcf\x8f\xa3\x67\x4a\x97\x09\x84\x5d\xd7\x1d\x1d\x1d\x85\x7b\xa7\xe2\xad\x41\x90\x20\x90\xfc\x24\x89\x54\x91\xc8\xe3\xac\xfd\xfa\xd7\x7e\xe3\xff\xfc\x99\x7f\xf4\xd7\xdf\xfe\xab\xa6\xeb\x23\xaf\x02\xa5\x00\xba\xde\xda\xd5\x46\x29\x3d\xa9\xeb\x22\x7c\x4e\x50\xeb\xaa\xae\xaa\xa2\x2c\xcb\x72\x27\x07\xbc\x07\xe7\x7c\xd3\xb6\x5d\x6f\x01\x60\x32\x99\x16\x5a\x17\x13\x28\xaa\x29\xf8\xde\xf6\xcd\xb4\x59\x4d\x26\x93\xd7\xef\x1c\x7c\xf7\x83\x87\xef\x7e\xf4\xb8\xb5\xb6\xf0\xca\x68\xad\xc1\xfb\xed\x7b\x7d\xd0\x5a\xd7\x59\x57\x1a\x6d\xb4\x0e\x00\xbc\xfd\x70\x20\x80\xf3\xb0\xe9\xfa\xb0\x94\x74\xde\xf7\xd6\x5a\xef\x15\x80\xd1\xea\xeb\xbf\xf7\x3b\x5f\xfa\x1b\x3f\xf1\xaf\xfe\xed\xbf\x03\x00\xd6\xd9\x42\x29\xa5\xb6\xe7\xc5\x84\x16\x3f\x39\x54\x74\xd7\x70\x0f\xe0\x9d\x5d\x2f\xcf\xaa\x7a\x5a\xd6\x93\x90\x8f\x27\x80\xc4\x80\x81\x6c\xdf\x75\x6d\xe3\xe3\x59\x8b\x3b\x8e\x2d\x16\x7a\x34\x0c\x00\x42\x2d\x00\xbe\xef\x3a\xdb\xf7\xa6\x28\x4d\x51\x44\xb1\x64\x94\x82\x34\x38\xc9\x10\x1a\x44\x35\x4c\x3c\x76\xe7\x61\x8c\x64\x8e\xe1\xc1\x81\x43\xf4\x40\xae\x33\xd1\x9f\x5f\xca\x37\x90\x44\x46\xa2\x86\x28\x9c\xff\x85\x7d\xe3\x8f\x51\x98\xb7\x2e\xaf\x79\x3e\x07\x47\x5e\xde\xde\x94\xc2\x9c\x07\xeb\xcc\x99\x49\xed\x83\x3c\x84\xbc\x74\x88\x4c\x4a\x7f\xa5\xd4\x62\xb1\xc0\x9f\x53\xe0\xa3\x09\xd2\xf6\xe7\x13\x14\x2c\x81\xd7\x85\x73\x52\xfd\xc5\x0d\x95\xa9\x1d\x33\x70\xc5\xc4\xc9\x62\x4a\x2c\x69\x3b\x97\x9c\x9a\x56\xaa\xdd\xb7\x9c\x8c\x31\xe1\x66\xe1\xd1\xd1\xd1\xc1\xc1\xc1\xed\xdb\xb7\xe1\x92\xe8\xd2\x80\xd0\x7b\xff\xe8\xd1\x23\xa5\x14\x7e\x46\x34\xde\x17\x84\x21\x08\xc4\xc4\x79\xf0\x90\xc6\x1d\xf0\xc9\x87\xef\xff\xec\xff\xf0\xf7\xff\xf8\xf7\xbe\xb6\xda\xb4\xd6\xfb\xa6\xeb\x4b\x63\x8c\x51\x85\x2a\x8d\xd1\x45\x61\x8a\xa2\x54\x5a\x1b\x13\xbe\x26\xaf\x8b\xa2\x28\xc3\x7f\x65\x61\x8c\x6e\xda\xbe\xb3\xb6\xaa\xca\xd9\x64\x52\x16\xc5\x6a\xd3\x34\x5d\x37\xad\xea\xb6\xeb\xad\x36\x55\x35\x9d\x95\xb5\xb3\x5d\xd3\x14\xbd\x53\x87\xe5\xa4\x2a\x27\xd3\x49\xfd\xc6\x9d\xc5\x5f\x7e\xe7\xfe\xe9\xb2\x0d\x9f\x8f\x02\xe5\x9d\x87\xde\xb9\xde\xf9\xc2\x68\x6d\xb4\xdf\xc2\x55\xc0\xe2\xe0\x4f\xdb\xcf\x4a\x38\xe7\x95\x52\x61\x75\x68\xb4\xee\xac\xeb\xbb\xfe\x97\x7e\xf6\x9f\x7e\xee\x0b\x5f\xbc\xf5\xea\x6b\x00\x60\x9d\x35\xda\x28\x15\x5e\xa1\xd8\x16\xdd\x7e\x85\x10\x9f\xc4\x0d\x00\xde\xb7\x9b\x95\xf7\xae\x9a\xcc\x88\xe9\x88\x37\x7b\xe7\xda\x66\x63\xfb\x2e\xb0\xc4\x0e\x0b\x05\xc0\xef\x0e\x2d\x8d\xd8\x00\x3e\xdc\x2b\xf4\x7e\xdb\x14\xdb\xb7\xce\xd9\xb2\xac\x20\x31\x97\x27\x3f\xc9\xbc\x12\xf6\x47\x35\xf6\x99\xd8\xad\x62\xd0\xc9\xe0\x7a\x66\xba\x0a\x2c\x2e\xf0\xa8\x9d\x0a\xd3\x99\x25\x5a\xe6\x12\x6f\xf5\x60\x75\x18\x80\xc5\xd6\x89\xf9\x83\x4d\x16\x15\xce\x28\xc6\x97\x1d\xf9\xe2\xdc\x92\xf9\x25\x5a\xaa\x23\x32\x38\x8a\x43\x30\xd7\x39\xc5\x83\x29\x6e\xdc\x89\xc6\x21\x5e\x5a\xd7\x75\x3c\x56\x34\xe3\x81\xe2\xe4\x4c\x4c\x63\x0b\x70\x38\x24\x72\x52\x42\x44\xcb\xa8\x04\xbe\x12\xe8\x22\x05\x79\xbe\x98\x09\xcc\x32\x38\x9d\xef\xdf\xb8\x28\xf4\xde\x17\x45\xe1\xbd\x77\xce\x7d\xf8\xe1\x87\x8b\xc5\xe2\xb2\x6e\x16\x5e\xda\xeb\x13\xe7\xe7\xe7\xeb\xf5\xda\xec\x88\x03\x58\xe4\x24\x10\x98\x0a\x2e\x9c\x8d\x70\x7e\xe3\xf7\x7e\xeb\xbf\xf9\xcf\xfe\xe3\xdf\xfe\x8d\x5f\x3f\x5f\x37\xde\x7b\x05\xa0\xb5\xf2\xe0\xb5\x52\x46\x2b\x05\xe0\x9c\xd7\x5a\x4d\x27\xf5\x62\x3a\xa9\xab\xd2\x14\x45\x61\x4c\x38\x1d\xb4\x28\x0a\xef\xa1\x77\x6e\x31\x9b\x1d\xce\x66\xa5\x31\x65\x51\xbc\x76\xeb\xe6\x62\x3a\x75\xde\xf5\xd6\xad\x9b\x76\xd3\xb4\x00\x4a\x9b\xaa\xf3\xba\xb1\xba\x9a\x1c\x94\x93\xc3\xa2\x3e\xb8\x7d\xfb\xf6\xbf\xfe\xd5\xcf\x7e\xe6\xce\xac\x75\x6e\xe3\x5c\xeb\x60\x6d\x5d\xeb\xc0\x14\x85\x57\xda\x29\xe3\x94\x76\x4a\xbb\xb0\x74\x03\x15\x10\xb1\x34\xa6\x2c\x8c\x52\xaa\x32\x1a\x00\xb4\x52\x75\x11\xd4\x84\xe5\xd9\xc9\x2f\xfc\xcc\x3f\xee\xbb\x0e\x00\xbc\xf7\xe1\xf1\x1a\xb5\x03\xa6\xb0\x7c\xdb\xfe\x8a\x1b\x11\xb0\xf5\xd0\xb6\xd9\x74\xed\x06\x12\x43\x0b\x00\xfa\xae\xdd\xac\xce\x9d\xed\x76\xa6\x7b\x72\x56\xc0\x76\x75\x18\xfa\xe8\x09\x42\x86\x4a\x77\x6b\x97\x28\xd6\xd9\xb0\xa0\x84\x44\x84\xc2\x5d\x23\xf6\x2f\xee\x53\x4c\xb0\x1f\x8e\x53\x65\x9f\xe8\x96\x18\x90\x98\x38\x54\xa7\xc2\x84\xa8\x0f\x30\xb7\x24\x97\xc4\x99\x75\xca\x2c\x5c\x14\xcf\x14\x55\xe2\x57\xc9\xfa\x95\x54\x41\xe0\x81\x9b\x54\xb4\xa7\x68\x96\x54\xc3\x71\x66\x6a\x39\x9b\x11\xc8\x9b\xb3\x37\x63\xcb\x02\x36\x4e\x64\x78\xe2\x9d\x66\xd2\xa1\x58\x99\x48\x5a\xeb\x78\x6b\x50\x54\x3b\xd3\x34\xde\x8f\x98\x39\x34\x4d\x5d\x10\xba\x52\xee\x27\x02\xbf\x92\x66\x45\x62\x67\x41\xa2\x0b\xb8\x1a\x62\xa7\x8b\xea\x71\x9f\x8f\x5f\x56\x0f\xef\x54\x58\x6b\x3f\xfa\xe8\xa3\x0c\xba\x3f\x53\xba\x1c\x20\xb4\xd6\x3e\x7e\xfc\x38\xa2\x60\xb4\x08\x31\x22\xe9\x86\x54\x9a\x30\xf3\x34\x00\xfc\xc1\xaf\xfd\xf2\xff\xf4\x5f\xff\x97\x1f\x7d\x7c\x6f\xd3\xf5\x6d\xbf\xfd\x86\xad\x02\x55\x68\xad\x15\x00\x78\xeb\x7d\x61\x74\x69\x8c\xf7\x6e\xd3\xf5\x5e\x41\x59\x18\x53\x98\x00\x87\xf1\x0b\x88\xeb\xa6\xf1\x00\x41\xd9\xc2\x98\x5b\x07\x07\x93\xba\xbe\xb9\x58\x54\x65\xb1\x69\x3b\xeb\x9c\x02\x98\x54\x13\xe7\xcd\xe9\xba\x37\xe5\x4c\x15\xd3\xb2\x9e\x1f\x1e\xde\xf8\xf2\x9b\xaf\x7e\xe1\x8d\x83\xce\xf9\xc6\x79\xa7\x74\x51\x96\x5e\x69\x0b\xe0\x00\x5a\xeb\x3b\xeb\x9b\xde\x79\x88\xe7\xc4\x28\x63\xb4\x02\x55\x18\xad\xb5\x2e\x8c\x29\x8d\x71\xde\x17\x5a\x4f\xcb\x62\x52\x14\xdf\xfb\xeb\xbf\xfa\xcd\x5f\xf9\xe5\xd0\x76\xe7\xc2\x43\x36\x00\x00\x3b\x9c\xf2\xbb\x53\x48\x77\x9e\x0a\x10\x21\xaa\xdd\xac\xbd\x77\xc0\x46\x42\x58\x32\xb6\x9b\x35\x9d\xdf\xed\x6c\x88\xea\xd8\x99\x1d\xfb\xfa\xee\xdc\x53\x24\xcf\xf5\x5d\xe3\x1c\xfd\xba\x37\x19\x5a\x3c\x7c\xa4\x02\x0a\x19\xab\xe2\x55\x31\x90\xe1\x84\x22\xcd\xc9\xf2\xa8\x7d\x7a\x62\x93\x84\xb6\x3c\x88\x8c\xc9\xe1\xda\x66\xb6\xa4\xc4\xfc\x4c\x59\xac\xa4\x18\x64\x49\xa9\xcc\xc2\x85\xcb\xe4\x15\x65\x16\xf4\x84\x27\x13\xd6\x33\xb5\xf3\x5e\xc8\x84\xce\x41\x1e\x2f\x7d\x5f\x42\x34\x63\xf8\x19\x5f\x1c\x04\x09\x95\xb1\x1c\x9c\x89\x95\x1f\xac\x8b\x1b\x21\xf6\x9d\x4a\xac\xef\xc9\xa0\xc8\x8c\x02\xc5\xa6\x83\xf8\x67\xca\xeb\x80\x39\x36\x67\x10\x17\xb5\x5c\x07\x32\x10\x30\x16\x1a\x63\xc2\xa7\x67\x53\xc5\x9f\x29\x5d\x0e\x10\x9e\x9c\x9c\x84\x45\x71\x66\x47\x94\xe7\x40\xa2\xcb\x33\xcc\x21\xf1\xe7\x5f\xfb\xf5\x7f\xf2\x0f\x7e\xfa\xc1\xf1\x89\xf3\xde\x68\x65\x9d\xb3\xce\x2b\x05\xce\xb9\xa6\xeb\x57\x6d\x6f\x9d\x2b\xb4\x52\x0a\xca\x42\xcf\xeb\xfa\x60\x5a\xdb\xde\x35\x5d\x57\x16\x45\x51\x18\x6d\x74\xdb\xf7\x9b\xae\xbb\x7d\xe3\x60\x3e\x9d\x98\xf0\x96\xa8\x52\x5a\xab\xba\x2a\xef\xdc\x38\xac\xab\xe2\xf6\xe1\xe2\xd6\xe1\xc2\x68\x0d\x0a\xaa\xb2\xb8\x73\xf3\xd0\x39\x70\x5e\xdf\xba\x71\x6b\x3a\x3d\xd4\x66\x52\xd7\xf3\xbb\xaf\x1e\x7e\xe5\xee\x81\x75\xdb\x13\x64\xc2\x66\xe6\xba\xeb\x3d\x80\x03\x70\xde\x5b\x0f\x18\x0b\xbd\x52\x7e\xb7\xf4\x6a\xad\x6d\x7b\xa7\xc2\x9b\x85\x4a\x19\xa5\x7e\xef\xff\xfd\xb5\xef\x7c\xeb\x9b\xa1\xd5\xd6\x5a\xd8\x9d\x27\xea\xc3\xfe\xe4\x76\x8d\xe8\x15\x3c\x39\xd6\x21\xfa\x7b\xdf\xb6\xd1\x5c\x21\xe1\x9c\x5d\x2f\xcf\xc2\x2a\x13\x9e\xec\x7a\xc2\xee\xa7\xdf\x4f\x3d\x59\xf9\x41\x1c\xa8\xe0\x3d\xc4\xbb\x9c\x4f\xd8\x6d\xd7\xe2\xcf\xff\x92\x19\x7a\x1c\x3c\xe2\xd0\x4d\x0d\x69\x8e\x22\x78\x10\x72\x7f\x00\x29\x3a\x88\xe3\x9c\xf3\xe3\x00\x47\x0a\x62\x9e\x4c\x3e\x51\x8f\xc8\x11\xd7\x49\xa2\xce\x9c\x3f\x85\x79\xbc\xed\x44\x2c\x97\x99\xb9\x24\xea\x93\x52\x03\x4b\xc0\x30\xe0\xd9\xfe\x18\x96\x2f\x2e\x35\x30\xff\x60\x78\xcd\x60\x4f\x8a\x07\xd8\x81\xa2\xb0\xdf\xdd\x38\xa1\x94\xaa\xaa\x2a\x7c\x7a\x57\x34\x1d\x29\x82\x29\x85\xc7\xdc\xb5\xb0\xf2\xbc\xf7\xb9\xaa\x5c\x8e\x58\x97\xda\x5f\x8e\xfb\xc4\x3e\x01\x48\x1e\x02\x92\x57\xf0\x06\xf2\x3e\x22\x5d\x80\xf3\xc9\x70\x0b\x28\x10\xb0\xf0\xb2\x16\x85\x97\x00\x84\x7d\xdf\x9f\x9e\x9e\x92\x4d\x51\x72\x94\x5a\x20\x92\x23\xf6\x41\x86\x39\xa4\xef\x7f\xff\xdd\x9f\xfd\x07\x3f\xfd\xe0\xf1\x69\x6f\x9d\xf7\x60\xb4\x9e\x94\x85\xd1\x0a\x00\xa6\x55\x61\xb4\xd2\x0a\xc0\xfb\xd2\xe8\x52\x2b\x05\xa0\x15\x14\x5a\xcf\xea\xb2\x69\x3b\xe7\x5c\x78\x4f\x62\xd3\xb6\x9b\xa6\xe9\xba\xde\x3a\xb7\x5c\x6f\xfc\xf6\xd9\x11\xa5\x94\x0a\xc8\xa4\xb5\x0e\x89\x90\x59\x97\xe5\x9d\x9b\x87\x85\x31\x7d\xef\xfb\x1e\x7a\x57\x38\x28\xb5\xa9\x5f\xb9\x31\xfb\xca\x67\x0e\x9c\xed\x9b\xae\x5f\x87\x17\xe9\xc3\xbe\xa5\x02\x07\xd0\x59\x17\x50\xc4\x2b\x05\x4a\x39\xf0\xad\xb5\x9b\xde\x76\xce\x55\x85\x09\x4b\x57\x00\x50\x00\xc6\x98\xaa\x28\xfe\xbf\x7f\xf6\x8b\xcb\x93\x93\x90\x69\xc3\xc2\x6b\x3b\x42\x40\xed\xde\xa4\x0f\xaa\xee\x8d\x55\x80\xb0\x4a\x8b\x31\xce\xf6\xdd\x66\x79\xe6\x9c\x8d\xea\x6c\x95\x52\x41\x24\x8b\x92\xc2\x64\x39\x86\x83\x38\xde\xb6\xff\x7a\x0f\x7d\xd7\x78\xef\x52\xa1\x36\x43\x04\x60\x70\xa6\x28\x61\x8c\x70\x32\x0e\x45\xf9\x04\x03\x32\xb5\xe0\x1c\x91\x93\x3b\xa4\x58\x97\x28\x59\x8c\x65\xa2\xce\x20\xb5\x3d\x1f\x13\xc5\x7a\xb9\x3e\x62\x94\x27\xa6\x13\x9b\xaf\xf6\x89\x37\x3c\x65\x13\xac\x64\x26\x9f\x80\x81\x18\x25\x52\x1d\x17\x12\xfc\x40\x51\xac\x2d\xef\xbb\x83\x83\x03\x40\xb6\x25\x70\x22\x96\xe5\xeb\x3f\xcc\x90\xf1\x40\x11\xea\x14\x7a\x7e\x2a\x32\x44\x09\xb8\x5b\xbd\xb4\x3e\xc3\xaa\xc6\x2a\x78\x3f\x8a\x16\x13\xaf\x66\xe6\x70\x9c\x44\xf3\xaa\x5d\xe4\x8f\x70\xb0\x5a\xad\x4e\x76\x31\xed\x79\xd2\x25\x00\x61\x68\x67\x98\x02\xc4\xa5\x31\x66\xe0\x83\x27\xef\xdc\xe2\x08\x0c\x69\xdb\xf7\x3f\xf7\x0f\xff\xfe\xbb\x1f\xde\xeb\xac\x03\x88\xa7\x8e\x41\x58\xbd\x80\x52\xd3\xaa\x98\xd7\x65\x69\x34\x78\x07\xde\xc1\x0e\x0c\x8c\x56\x8b\x69\xbd\xda\xac\xc1\xfb\xbe\xeb\xda\xb6\x2b\x8b\xa2\x77\x76\xb5\xd9\x74\xb6\xdf\x34\xed\x2e\xfa\x43\x38\xcc\x05\x82\x5b\xf8\x2d\x39\xe7\xbc\x73\xe0\x7d\xd3\xb6\x9b\xa6\x6d\x7b\xd7\x76\xaa\xed\xb5\xf5\xfa\xce\x41\xfd\xc5\xd7\x16\x4d\xd7\xb6\x6d\xdf\xf7\xe1\x2b\x86\x61\x44\xe9\xaa\x2a\x76\x3b\x9a\xe0\x01\xbc\x87\xb2\x28\x8c\x56\x85\xd6\x0a\xa0\xda\x3e\xc2\x63\x66\xd3\xe9\xad\x9b\x37\x5e\xb9\x7d\xab\x2e\xf4\x37\x7e\xff\x6b\xde\xda\x70\x8f\xce\xf9\x70\xc4\x28\x60\x30\x0b\x84\x17\x85\x4f\x3e\x60\xaf\x94\xf7\xbe\x6b\x9b\xcd\xea\x7c\x2f\xee\xa8\x38\xfc\x60\x97\xf0\x4a\x29\x8f\xda\xe8\xe2\xa7\xbb\x77\x9c\xdb\x91\x09\xd1\x1a\x10\x75\xf0\x1e\xfa\xb6\x0d\x58\x88\x7b\x8a\x0c\x24\x1e\xcb\xf0\x60\x26\x51\x83\x88\x22\x5d\x9f\x17\x38\x3e\x91\x09\x10\x62\x04\x84\xac\xaf\x72\xc2\x65\x79\xe8\x27\x32\x53\xaa\x8a\x11\x2a\x65\x1f\xd8\x37\xa0\xd8\x05\x62\xd9\x7c\x4b\x07\x89\x37\x81\x74\x6e\xd4\x1c\xb2\xa6\xe0\x44\x62\x7a\x9e\x39\x56\x3a\xfe\xc5\xf9\x40\x87\x87\x87\x61\xd6\x2e\x56\x4d\x34\xc7\x2a\x61\x54\xe3\xf0\x96\x92\x33\x98\x10\xfb\x6e\xd0\xab\xf3\x2e\x9d\xe1\x14\x4b\xe5\x1d\x20\x33\xdf\xc2\xc2\x23\x45\x38\xb8\x77\xef\xde\xf3\x5f\x14\x3e\xef\xa7\x46\x9d\x73\x67\x67\x67\xf8\xa6\x20\x21\xcc\xcc\xbb\x56\xed\xaf\xeb\x09\x03\xff\xf9\xed\x3f\xfe\xfd\x3f\xfe\x83\xdf\x5f\x35\x5d\x58\x02\x3a\xbf\x45\x7e\xa5\x94\x07\x50\x3e\x7c\xac\x28\x20\x8f\x07\xef\xbc\x77\xde\xd9\x90\xa8\x8d\xae\xaa\xb2\x69\x1a\xaf\xf4\xe1\x7c\x52\x95\x55\xdb\xf7\x7d\xd7\x03\x40\xdb\xf5\x55\x61\x76\xef\xc1\x40\x40\xa0\x78\x94\x8c\x73\xae\xef\xfb\xae\xeb\xdb\x2d\x75\x4d\xd3\xb5\xbd\x5b\xb7\xb6\x6f\x5d\xa1\xe0\x8d\x5b\xd3\x07\xa7\xeb\x77\x1f\x9c\x75\x7d\x5f\x15\xa6\x56\xde\x5a\x55\x1b\x5d\xba\xa0\xfc\xd6\x09\xb4\x02\xf0\x6e\x62\x74\x6b\x5d\x6f\x7d\x51\x15\x93\xba\x9e\x4e\xea\xf9\x6c\x3a\x5b\x2c\x0e\x5f\x79\xf5\xd6\x1b\x77\xe7\xaf\xbe\x76\xfc\xf8\xf1\xad\x3b\x77\xc0\x83\x73\x4e\x19\xa5\x94\x02\xbf\x5d\x08\x62\x77\x8a\xaf\xf2\x78\xf0\xf1\x33\x84\x5d\xdb\xb4\xeb\x25\x40\xfc\x36\x13\x00\x80\xf2\xca\xef\xd4\x50\xf0\xe4\x69\x19\xe5\x01\xdf\x1d\x84\xfd\x80\xe5\x77\xac\xdb\xbd\xd3\x27\x30\x1c\x2c\xed\xfb\xae\x2d\xca\x27\x27\x71\xa8\x11\xb7\x3d\x60\x7f\x8d\xe2\xd9\x3e\x1b\xf1\x99\xd4\xe6\x0c\x29\x4b\x14\xc8\xf0\x88\xa2\x38\x11\x39\x51\x38\x5f\x34\x70\xb1\xf9\x20\x8e\xe5\x60\xfe\x14\x89\x71\x27\x55\x17\xec\xdb\x19\x37\x27\x5e\x22\x0a\x64\x5a\x4d\x94\x14\xc1\x98\x28\x4f\x3a\x14\xff\xc5\x6a\xf0\x8a\x44\x09\x63\xec\x13\x88\x1f\xc5\xc0\x0b\x62\x73\x4d\xa7\xd3\xaa\xaa\xb0\xbb\xe2\x40\xc4\xf5\x14\x2d\x4f\x5a\xca\x6d\x98\xf1\x5e\xde\x76\x9e\xc8\x37\x9f\x0c\x9c\x94\xd8\x31\x84\x7b\x2a\x42\x3b\x6f\x85\xda\x87\x6a\xec\x45\xc4\xc1\xe2\x67\x9b\x8c\x31\xd6\xda\xe5\x72\xb9\x5c\x2e\xc9\xb7\x8e\x9f\x35\x3d\x6f\x20\x0c\xf7\x42\xf9\x93\xa2\x91\x78\xa6\xc8\x80\x4d\xcf\xf9\xc3\x4f\xe7\xdc\xaf\xfc\xfc\xcf\xde\x3f\x59\x1a\xa5\x0c\x28\xa5\xc0\x3b\xbf\xee\x6d\x65\x8c\xd1\x28\x04\x84\xbf\xde\x7b\xe7\xbc\xb5\xde\x5a\x70\x2e\x9c\xa2\xe2\xac\x5d\x37\x6d\xef\x7c\x55\x18\x6f\x8c\xed\x7b\xef\x5d\xf8\x3e\xd2\xf9\x6a\x7d\xb8\x98\x5b\xeb\xce\xd7\xeb\xae\xb7\xce\xfb\xba\x2c\x94\x52\x5a\xab\xbe\xb7\x4d\xd3\x06\x09\x6d\xdb\xb6\xdb\x03\xb7\xdb\xb6\xb5\xeb\x4d\xaf\xa1\x9f\x4f\xf4\x57\x3f\x7b\xf3\x74\x63\x1b\xeb\xb5\xd6\x4a\x99\x59\xa1\x17\x65\x61\x14\x74\xce\x29\xd0\xe5\xee\x9d\x8a\xed\x24\x54\x6b\x6d\x4c\x55\x55\xf3\xc3\x83\xf9\xcd\x5b\x07\x77\x5e\x99\xdf\xba\xbd\x38\xb8\x31\x3f\x3c\x9c\xcd\x17\xa0\x94\x73\x4e\x6b\x03\xde\x5b\x6b\x0b\x13\x4e\xfd\x86\xf8\x91\xc4\xe0\x8d\xc1\x2a\xde\x83\x29\xca\x00\x84\x5d\xbb\x69\xd6\xcb\xad\xd1\x00\xed\xb7\x6c\xdf\xc8\x57\x7e\x0b\x62\x3b\xdc\x43\x36\xde\xc1\x24\xc0\xf6\xab\xbf\xdb\xe3\x6c\x76\x1f\x7f\x42\xe3\xca\x7b\x0f\xa0\x14\x38\x6b\xad\xea\x0d\x3a\x3f\x22\x33\x6e\x39\x3c\x90\x1e\x27\xce\xc0\x5d\x85\xc0\x27\x89\x5c\x3c\x40\x13\x1e\x2e\x27\x13\x9d\x53\xe1\x8f\x6b\x35\xe6\x2a\x89\xa7\x99\x5a\x32\xd1\x4d\x54\x66\xd0\x9e\xfc\xd2\xf8\x06\x8a\x13\x1a\xc2\x2f\x36\x2d\xdf\x8a\x14\x46\x8a\x2a\x71\xb3\xf0\xc9\x4d\x40\x41\x5e\x29\xc9\x89\x89\xa2\x28\xe6\xf3\x39\x31\x1d\xaf\x85\xe8\xc0\x17\x6d\x99\xba\xc4\x1c\xb1\xc9\x62\xef\x64\x94\x4f\x15\x4f\xcd\x2f\x61\xdf\xc3\x79\x2f\xe0\x06\xf2\x76\x91\x82\x5c\x49\x62\x3a\x40\x01\x1f\x3f\x38\xf3\xe0\xc1\x83\x97\x19\x08\xbd\xf7\xe7\xe7\xe7\x78\x53\x54\x21\x22\xcc\x99\x51\x01\x09\xbc\xc4\x39\x4a\xa9\xd3\xa3\x87\x7f\xf9\xf5\x3f\x71\xce\x95\x45\x61\x9d\x37\x5a\x29\x15\xce\x6a\xb1\x5a\x17\x6a\xbb\xa1\xb7\xc5\x0c\x1f\x90\xd0\x59\xef\x6c\xdf\xb7\x7d\xa7\x7b\xa3\xbd\xf7\xcb\x4d\x57\x95\xa5\xed\xda\x16\xbc\xd1\xfa\x60\x52\x97\x65\xd1\xf4\x56\x29\xb0\xd6\x6a\xad\xe6\x93\xba\xe9\xfa\x75\xd3\xae\xd6\x8d\xf3\xde\x3a\x5b\x68\x6d\x14\x34\x6d\x7b\x7c\x7a\x56\x28\xe8\xba\xae\x69\xdb\xa6\x6d\x37\x6d\xdb\xb4\xbd\xb3\x9d\xb3\xfa\xc6\xa2\xfc\xca\xdd\x1b\xef\x9f\xd8\xb2\x2a\xeb\xa2\x98\x16\xc5\xac\x2c\xb4\x73\xb5\xb3\x93\xb2\x2c\x0a\x53\x94\x25\x68\x0d\xa6\x28\x27\x93\x72\x3a\x29\xa7\xf3\xc9\x62\x31\x9d\x2d\xa6\xf3\xf9\x74\xbe\x98\xcd\xe6\x93\xd9\xac\x9e\x4c\xea\x7a\x52\x4f\x66\x45\x3d\x51\xce\x59\x6b\xc1\x6f\xdf\x2c\xdc\x37\xdc\x16\x9f\xb4\x36\xce\xf9\xe9\xfc\x40\x29\xd5\x36\x9b\x66\xb5\xdc\x5d\xd9\xae\xda\xe4\x21\x8d\x11\x30\xc0\xe4\xde\xe2\x6f\x67\x6f\x84\x8d\xa9\x8e\x74\xb6\xd3\xfb\xfb\x4b\x7c\x74\xc5\xfe\x8d\xf3\x4d\x90\x66\xac\x83\x61\x17\xd0\x48\x23\x6c\x17\x4a\xa4\x5a\x33\xc8\x89\x2f\xa5\x50\x07\xe7\xa4\xf0\x4f\x2c\x45\x6c\x28\xe6\x8c\x94\x9f\x11\x95\x82\xab\x0c\xfc\x70\xb6\x4c\xa3\x52\xc5\xc5\x96\xa6\x6c\x28\x82\x07\xff\x19\x12\x61\x47\x7f\xb0\x2f\xb0\x3e\x07\x07\x07\xf8\x2b\x42\xbc\xf9\xa9\x35\x10\x4e\x10\x07\x26\x72\x46\xea\xc3\xd7\x91\x1c\x84\x46\x26\xe2\xf8\x0a\x6a\x10\xf0\x13\x2b\xe5\x8a\xe5\xd7\x91\x83\xab\x4c\x6c\x99\xa0\x46\x80\x06\x6b\xed\xf1\xf1\xb1\xb5\x16\x9f\x5a\xf0\xac\xe9\xb9\x02\xa1\xb5\xb6\x69\x9a\x70\x44\x4b\x6c\x39\x36\xba\x88\x6d\x30\x34\x67\x4c\x0d\xfb\x6f\xfd\xd9\xd7\x97\x9b\xc6\x68\xbd\xbd\x81\xe5\xc0\x03\x38\xef\xab\x22\xa0\xa0\x07\xa5\x5c\x38\xe8\xc5\x6f\xef\xc9\x79\xe7\xda\xae\xf1\xe0\x4b\x63\x3a\xa5\x00\x6a\x03\xce\xdb\x7e\xb3\xd9\x94\xd6\x16\x65\x69\x8c\xb1\xbd\xaf\x4d\xa1\x8c\xb2\x7d\xe7\xb4\xd6\xda\xcc\xea\x0a\x00\x8c\xd1\xbd\xb5\x5d\xeb\xbb\xae\xeb\x01\xc0\x7b\xa3\xd4\xa6\x69\xba\xae\x3d\x5b\xad\x97\xeb\xf5\x6a\xbd\x71\xb6\xf7\xce\xad\x9b\xd6\x68\x98\x57\xfa\xd6\x41\x55\x2f\x0e\x67\xd3\x49\x5d\xd7\x55\x5d\x97\x65\x78\x55\xc3\x68\x1d\xde\xdc\x28\xcb\xb2\x2a\xab\xaa\xae\xeb\xaa\x9e\x4e\xa6\xd3\xc9\x74\x36\x99\x4e\xcb\xaa\x2e\xab\xaa\xaa\xeb\xaa\x9e\xd4\xf5\x24\xfc\x34\x46\x2f\x4f\x8f\x9d\xdd\xee\xf9\x18\x63\x9e\xac\xe6\x76\x0e\xa9\x8d\x99\x1d\x1c\x28\xad\xbb\xb6\x69\x56\xe7\x7e\x77\x18\x4d\xa0\xdd\x2d\xbe\x90\xc6\x4e\xac\xe2\xed\xbf\xd0\x1b\xe0\xc1\x6f\x3f\x82\xa8\x9e\xb0\xe0\x9f\xbb\x67\x74\xa2\x1c\xbf\x7d\x7e\xc7\x3b\xdb\xc7\x8f\x40\x89\x2b\x8f\xcc\x14\x3b\xcf\x43\xa0\x91\x4b\x20\x99\x79\x1e\x71\x5e\x0c\x09\x22\xe1\x03\xa7\x09\x24\xc4\xe8\x93\x2f\x0e\xcc\x38\x84\x07\xff\xe4\x38\x47\x62\x3d\x09\xbb\x19\xc9\x44\x2c\xc1\x4e\xb2\x74\x48\x5d\x8a\x75\x79\x74\x56\x3b\x37\xa3\x18\xcd\xb9\x02\xd8\xa4\xa4\xbf\x48\x29\xb1\x08\x36\x3b\x59\x0b\x12\x51\xe2\xd4\x6a\xb1\x58\x84\x33\x30\x33\x73\x32\x02\x69\x04\x7d\xb9\xcc\x94\x1c\xde\x34\xd1\xf7\x44\x3f\x1c\x44\x9d\x41\xb1\x29\x3f\xcf\x03\x1e\x1e\x2c\x24\x11\xcd\x8e\xe5\x70\xe3\xab\x7d\x0a\x0b\x24\x6b\xed\xc9\xc9\xc9\xf3\x3c\x68\xe6\xb9\x02\xe1\x6a\xb5\xe2\xf8\xc7\x49\x04\xb6\x4c\x3e\x30\x10\x0d\x89\xef\xbc\xf5\x57\x5a\xeb\x49\x59\x74\xd6\xf5\xce\x86\x77\x27\x7c\x58\x11\xaa\xed\x83\xa3\xde\x7b\xe7\xc1\xf9\xd0\x39\xde\x39\xd7\xb5\x5d\xd7\xdb\xb2\x30\x21\xf4\x17\x46\x17\xda\xd8\xbe\x03\xef\x42\x10\xd7\x5a\x9b\xf0\xe2\x87\x31\xc6\x14\x5e\x3b\xaf\x8d\xb3\x76\xb3\xd9\x4c\xeb\xba\x0f\x42\xba\xee\xec\x7c\x59\x68\xe5\xbd\xdb\xb4\xed\xd9\x6a\xbd\xde\x6c\xfa\xbe\xd7\xde\x83\xf7\x4d\x6b\x8f\xce\x9a\x3b\x37\xea\x83\xd2\xeb\xe9\x74\x7e\x70\x38\x5f\x2c\xa6\xd3\xe9\x64\x32\xa9\xca\xaa\x28\x0b\x6d\x0a\x63\x4c\x51\x94\x45\x59\x56\x55\x5d\xd5\x75\x59\x55\x65\x55\x15\x65\x55\x94\x65\x59\x54\x65\x5d\x55\x55\x5d\x96\x55\x51\x96\xa6\x2c\x0a\x53\x6a\x63\x0e\x6e\xdc\x3e\x3d\x7e\x04\x6e\x3b\xe6\xc3\x66\x69\xdc\x20\x2d\xaa\x7a\x3a\x3f\x50\x4a\x37\x9b\xf5\xfa\xfc\x14\xb6\xb0\xe5\xf1\xda\x4e\x41\x7c\x0f\x31\xac\xee\x14\x3c\xd9\x59\xdd\xad\xf8\xc8\x0a\x71\xd7\x03\xbb\x7d\xd2\xdd\x3d\x42\xb5\x43\x53\xa5\xc0\xfb\xd8\x57\xc1\x86\x3c\x58\x87\x04\x89\xbc\x31\x93\x77\x37\xf9\x9b\xc1\x54\xf1\xea\x20\x8f\xe8\x75\x62\xbc\x16\x13\x78\x9e\x9b\x92\x96\x91\xcf\x35\x4c\xe1\x1c\x30\xf0\xc8\x57\x47\xae\x0e\x36\x24\x56\x81\xdb\xc2\x95\xe1\xbd\xc6\x9b\x96\x81\x6a\xa2\x0f\x69\x78\xc6\x6e\xc4\x38\x9c\xa2\x40\xbe\x23\x4a\x66\x00\xbc\xae\x30\x24\x33\xfa\x10\xe7\x11\xd7\x55\xdc\xc1\xc6\xd4\xce\xa7\x32\x31\x91\x91\xc3\x99\x79\x22\x74\x16\x86\x22\x72\x55\x9c\xab\x71\xe3\x93\x52\x62\x4b\x31\x27\xfe\x1b\xd9\x22\x0f\xa6\x80\x0e\xc7\xc7\xc7\x57\x1a\x08\x2f\x7a\xfe\x37\xa6\x08\x84\x84\x38\x67\x2a\x1f\x33\x40\x7a\x78\x04\xfa\xe4\xde\xbd\xce\x3a\xeb\x7d\xef\x9c\x52\xaa\x50\x4a\x2b\x65\x4c\xe8\x27\xb0\x6e\xfb\x84\x4b\xd7\x3b\xad\xb4\xd3\xe0\x9c\xb7\xca\x69\xa5\x95\xf7\x5d\xd3\x68\xf0\xce\x5a\x63\x8c\x31\x5d\x59\x96\xa6\x28\x4c\x51\x9a\xbe\x37\xc6\xe8\x7e\x0b\x84\x45\x59\x06\x3c\x2c\x8d\x2a\x8d\x5e\xad\x57\x4d\xdb\x57\x46\x83\x55\x55\x61\x9a\xa6\x69\xdb\xb6\xeb\x3a\xe7\xac\xf7\xce\x5a\xab\x14\x80\xf7\xa5\xd1\xd6\xfa\xbe\xf7\x37\x17\x6a\x63\xf4\x64\x3a\x5b\x1c\x1c\x1e\x1c\x1e\xce\x66\xf3\xc9\x74\x5a\x55\x75\x51\x14\xda\x14\x01\x0d\xc3\xb1\x0b\xa6\x28\x8b\xb2\x28\x8a\x2a\xfe\x35\x45\x59\x14\x85\x36\xc6\x68\xa3\xb4\x06\x00\x53\x56\xd3\xc5\xe1\xea\xf4\x64\xfb\xe0\x8c\x52\x01\x8e\x4c\x61\xea\xd9\xa2\xaa\x27\x00\x60\x6d\x1f\xef\x0b\x06\x83\x45\xc3\x45\x57\x55\x0a\x85\x24\xbc\x6a\xc4\xc6\xf6\x11\xfb\xb6\xbf\x62\x4a\x29\x00\x1c\xd1\x76\x2b\xc5\x9d\xf8\x27\x58\x08\x09\xf8\x11\x47\x29\xfe\x19\xd3\x99\x88\x9f\x0a\xb5\x29\x87\x19\xc3\xcc\x4b\x89\x6a\xe7\x15\x03\x09\x81\x32\xba\xa5\xfe\x72\x39\xa2\x49\x79\xa9\x54\x26\xd1\x59\x9c\x94\xe4\x95\x11\x45\x71\x69\x29\xc9\x22\x12\xe0\xae\x1f\xa3\xa1\x68\x4f\x71\x47\x94\x4b\xc6\x45\xca\xb2\xc4\xb7\x06\x33\xd6\x10\x2b\xe5\xd6\x8e\x48\x90\x6a\x7b\xa6\xa5\x58\xc2\xa0\x3e\x99\x1c\x6e\x40\x60\xc6\xe4\x3a\x13\x0d\xf1\x3a\x0f\xeb\x23\x26\x52\x33\x1b\xde\xa2\x98\xa9\x94\xd2\x5a\x9f\x9c\x9c\xfc\x20\x58\x13\x68\xbc\x84\x62\xfc\x87\x2a\x2e\x24\x37\x10\x16\xee\xbd\x7f\xef\xbd\xf7\x94\xf4\xca\x60\x1e\xf3\xf2\x3c\x62\x7e\xb0\x78\xb3\xd9\x54\x55\xd9\x77\x5d\xa9\x75\x58\x0b\x06\xb2\xce\x35\xbd\xf5\xde\x87\xaf\x40\xf4\xce\xf9\xce\x1b\xad\xb4\x53\x5a\x79\xef\xad\x31\x6e\xdd\x78\xe7\x6c\x59\x74\xe1\x80\xb5\xbe\xef\xca\xb2\x34\xa6\xd3\xc6\x94\x55\xd5\xdb\x66\x32\xa9\x8c\x29\x9c\xb5\x61\x75\xe8\x3c\xac\x56\xeb\xb3\xd5\xca\x39\x5f\x15\xa6\xef\xba\x4d\xd3\x74\x6d\xdb\x75\x5d\xdf\xf7\x85\x52\xb5\xd1\x60\xf4\x72\xd3\x28\x00\xa3\x95\xed\xfd\xf9\xaa\xab\x4a\x53\xcd\xbb\xa2\x2c\x26\xd3\xe9\x7c\xbe\x38\x38\xbc\x31\x9d\xcf\xeb\x7a\x52\x14\x85\xd2\x46\xc7\x97\x6b\x8a\xc2\x98\xc2\x6c\x0f\x65\x2d\x4c\x51\xe8\x70\x93\x55\x69\x85\x4e\xed\xf3\xde\x97\xd5\xa4\x9a\x76\xed\x7a\x09\x5e\x59\x6b\xab\xaa\x9e\xcc\xe6\x55\x3d\x0d\x6c\xce\xb9\xd5\xd9\x89\x77\x6e\x7b\x06\x29\x1e\x30\x3e\x6c\xa4\x6e\xc1\xcf\xa3\x8d\x52\x45\x4d\x0b\x00\xa0\xb4\x02\xd8\x7b\xb8\x74\xe7\xdd\x88\x09\xb0\xb0\x18\x10\xc1\x5a\xab\x8d\x30\x03\x23\x63\x5b\x84\x40\x31\x30\x91\x21\x07\xbb\xe1\x44\x66\xc4\xa2\xe7\x64\x78\xf0\xc8\x07\xc9\xd3\x44\x68\x01\x14\x7d\xf8\xe4\x7a\x8c\xab\xe3\xb2\x99\x22\x1c\x4d\xe3\x7c\x5f\x2c\x45\x20\x93\xff\x24\x33\x7a\x11\x5c\xf3\xa6\x18\x64\xcb\xa8\x84\xe5\xf0\xe6\x13\x33\x92\x39\x07\x8e\xad\x38\x33\xfc\x24\x47\x89\xa6\xe4\x60\xc5\x8c\x31\x07\x07\x07\x62\xa3\xb0\xaa\x7c\x7d\xc3\x57\x45\x62\x94\x23\xbe\x2a\xe6\x73\x1e\xae\x06\x6e\x7e\xca\x87\x81\x91\x28\x07\xe7\xa4\x3a\x8e\x63\x18\xf9\x2b\x3a\x06\x36\x3e\xb7\x21\x20\x7f\xc3\xe4\xbd\x0f\x5f\x68\x22\x02\x3f\xdd\xef\x00\x46\x7a\x7e\x5b\xa3\x9b\xcd\xc6\x5a\x5b\x55\x95\x08\x81\xa2\xe9\x9f\x62\x20\xe1\x4b\x46\xeb\xf9\x64\x02\xd6\x6e\x36\x9b\x70\xce\xb5\xd9\x1e\x2b\xaa\x8c\x02\x63\x74\x28\x5b\x16\xc6\x28\xb0\xce\xf7\xd6\x85\xef\xe2\x1a\x0d\x46\xf7\xa7\xeb\x76\x51\x97\xd3\xaa\x34\x85\x29\x8a\xa2\xef\xb6\xa0\xe8\x9c\xed\xac\x6f\xba\xe6\x60\x3e\x73\xb6\x37\xb6\x50\x5a\x2b\xa5\xbd\xed\xdb\xb6\x6d\xba\xee\xb8\xeb\xfb\xae\x6f\xda\x16\xbc\xd7\xe0\xfb\xbe\x77\xce\x5a\xeb\xc2\x26\x63\x6f\xed\xff\xcf\xdc\x9b\xfd\xe8\x92\x5c\x77\x62\xe7\xc4\x92\xdb\xb7\x55\xd5\xad\xba\x7b\xf7\x65\xdf\x6e\x36\x47\xa3\x0d\xb2\x25\x8c\xc7\x80\x01\x3f\xd8\x80\x0d\x8c\x5f\x0c\xf8\x65\x9e\x0c\x18\x7e\xf4\x1f\x64\xf8\xc5\x80\x05\xcf\x00\x03\xc8\x63\xc8\x32\xb4\x8c\xec\x19\x8f\x34\x92\x28\xb6\x48\x8a\x8b\x9a\xa4\x48\x35\x79\xbb\xef\x56\xf7\xd6\xfa\x7d\x5f\x66\xc6\x76\xfc\x10\x99\xf9\x65\x45\x64\x66\x55\x2f\xbc\xdd\xc1\xdb\xc5\xf8\x22\x4f\x9c\x88\x38\x11\x71\x7e\x71\x62\x25\x62\x0c\xb1\x36\xee\xf4\xa2\xbe\x35\xab\x18\xa2\x10\x32\xcd\xf3\x7c\x36\x9f\x2d\x16\x79\x5e\x08\x99\xb0\xde\x26\xaa\xf6\x2f\x67\x8c\x61\x83\x7f\x08\xb0\x1b\x9d\xf5\x9b\x63\x92\x15\xce\x1a\x04\x90\x59\x91\xa6\x99\x90\xbb\x05\xb9\xed\xfa\xdc\x59\x03\xbd\x71\x7a\x20\x33\xc4\x66\x26\xb4\xad\x15\x68\x4f\xd8\xef\x0c\xc3\x26\xa2\x5f\xf3\xf3\x01\x1d\x64\xf6\xa2\xd3\xae\x95\x7b\xce\x0d\xc6\x22\x22\x90\x03\x20\xc4\xdd\xe1\xd1\xc1\x7a\x9c\x86\x40\x1c\x1f\x44\xf7\x39\x74\xfa\x3d\x50\x16\x81\xc6\x8c\x69\x06\xd1\xeb\x26\x30\x36\x06\x7b\x37\xd1\x8f\xfd\x90\x09\xf8\x8c\x21\x36\x50\x82\x63\x92\x1c\xe4\x1f\x97\x37\x48\x68\x10\x5c\xfb\xb1\x82\xb2\x4c\xf4\xe5\xf8\x6f\x9c\xc3\x41\x26\x13\x3c\x03\x2c\x0c\xf4\x7b\x77\xde\x75\x0c\xcc\x62\xb6\x00\xb0\x58\x2c\xba\x53\x83\xd7\x16\x2a\xfe\x39\xd1\x4e\x02\x9a\x41\x70\x8d\xf9\x4c\x00\x5e\x3c\x14\x88\x9b\xfa\x18\x52\xc6\xcd\x66\x0c\x38\x03\x0e\x41\x72\x13\x4d\x68\x8c\xd5\xe0\x27\xef\x3a\x4b\xc9\x6f\x28\xb9\x96\xe7\x17\xe2\xde\x1c\x10\x6e\xb7\x5b\xef\xe9\xc3\x7e\x9f\xe0\xe6\x1d\x60\xda\x75\x82\x3e\x3a\x3a\x62\x9c\x4b\x29\xab\xba\xd6\xc6\x00\x00\x63\xcc\x38\x32\xd6\x12\x00\x11\x4a\xce\x89\x08\x10\x89\xc0\x38\x52\x46\x33\x86\x09\x67\x89\x10\x0c\xb1\x36\xe6\xb2\x22\x4b\x8e\x2b\x26\x38\x4b\xa5\x10\x42\xca\x44\x5a\x6b\x91\xb1\xba\x72\x92\xa1\x10\x82\x5b\x81\xc8\x00\xd1\x1a\x6b\x8d\xae\xab\x4a\x6b\xa3\xb4\x41\x20\xad\x8d\xb3\xfe\x05\x4a\xff\x92\x12\x11\x91\xe4\x5c\x72\x06\x80\x40\x50\x6b\xbb\x59\x97\xb7\x9c\xe3\x9c\x4b\x99\x64\x59\x9e\x17\xb3\xa2\x98\xc9\x24\xf1\xe0\xda\xb6\x09\x86\xcd\xb5\x6e\xd0\x81\x54\xd7\x22\x83\x41\x19\x11\xc9\xb4\x48\xd2\xd4\xef\x53\xe8\x36\x5f\x55\xdb\xb5\x51\xb5\x17\x29\x01\xf8\xdd\x59\xb1\xec\x00\x77\xab\x82\x6d\x13\x1f\xac\x85\x9d\xb9\xd8\xf3\xed\xa2\xef\x7e\xb6\x76\x66\x9f\x05\x39\x87\x3c\xbc\xcc\x61\xa2\x1f\xc2\xd5\xbe\x17\x78\x02\x9a\x40\x2f\x5c\x1b\x6b\x8c\xe6\xe6\xdd\x1b\x26\x1b\xea\x60\x7e\xfa\x79\xbe\x16\x14\x21\x42\xfa\x6b\x91\x63\x22\x95\x78\x60\x31\x51\x90\xfe\xcf\x2e\x62\x5c\x53\x83\xfc\x27\x92\x0e\x52\xe9\xc3\x6d\x8c\xe8\x81\xaa\x1d\x1c\xd3\xe0\xd5\x01\x8d\xff\x14\xcc\x88\xde\xb0\xd4\xf3\xf9\xdc\xeb\xdf\x69\x54\x18\xf3\x4f\xe4\x39\x2e\x57\xff\x53\x50\x2f\x7d\xcf\xe0\x48\xb1\xcf\x3c\xae\xb5\x00\x3b\xe3\x92\xf6\x51\xcd\x07\x0e\x3e\x73\x3d\x58\xd8\xc0\x05\x94\x71\xa1\x62\x7f\x9c\xdb\x20\x04\x11\x75\x7b\xe3\xe3\x1b\x70\x6f\xd4\x22\x1c\xc4\xbf\xbe\x8b\x3f\x0d\xb6\xfe\x31\x0e\x5d\x07\x40\x44\x6b\xcc\x37\x7e\xe3\x37\xbf\xfb\xe7\xff\x96\x9c\xad\x6a\x09\xad\xa0\x39\xa2\xb6\xfe\x96\xb2\xf6\xd9\x78\x22\xe5\x9f\x80\x77\x8e\x13\x22\xa0\xb4\xc4\x19\x08\xc6\x1d\xb9\x5a\x5b\xc9\xbd\x59\x44\xd6\x39\x6b\x8d\x90\xc6\x4f\x53\x6e\x36\x6b\x07\x6c\x96\x67\x42\x08\x47\xb8\xad\xea\xcd\x7a\xab\x8d\x51\xda\x1a\x6b\x10\xa0\x56\xba\xac\x6b\xe7\x9c\x64\x6d\x2f\x05\x60\xe8\xdf\x2c\x6a\x72\x64\x8c\x75\xce\x20\x02\xe3\x42\x24\x49\x9a\x65\x69\x96\xcb\x24\x41\x6c\x4e\x7b\x20\xa2\x17\x0c\xd1\xae\xc1\x0d\x7a\xfa\xae\x2c\xcb\x3c\xcf\xfd\x49\x55\x6b\xad\xb3\xba\xde\x6e\x00\x1a\x80\xf2\x2f\x1f\x76\x47\xec\x77\x02\x84\xe6\x92\x01\x9f\x18\x5c\xb9\xac\xbb\xab\x0b\x1f\x8e\xd0\x11\xf7\xa2\x83\xa7\x21\x68\xf1\x11\x90\xfa\x95\xd5\x54\xa5\x73\x96\x0b\x39\x06\x57\x13\x70\xd8\xaf\xeb\x2e\xbc\xd3\x80\xb1\x12\x09\xb4\xf0\x60\xcb\x99\xa0\xb9\x36\x6e\x97\xe1\x41\x55\x35\x98\xf9\x41\xa4\xb9\x61\x42\xfd\xc2\x0e\xe6\x3f\xd0\x8c\xd7\xfe\xbc\x16\x5f\x07\xd9\x8e\x81\x77\xcc\x30\xc0\x83\xb1\xa2\xc5\xe0\x37\x56\xf6\x98\xcf\x20\x24\x53\x74\x77\x4c\x90\xc4\x20\x4a\x11\x51\x51\x14\xc1\x06\x99\x09\x4f\x1f\x6c\xc6\xf2\x1c\x84\x04\xd9\x18\x6c\x7b\x13\x20\xda\xb5\xf3\x58\xce\x71\x72\x01\xf3\x20\x95\x98\x26\x80\xcf\x40\x08\x41\xe9\x82\x40\x3f\xe6\xe8\xde\xf1\x08\x8a\x3c\x01\xa2\x81\xb8\xba\x5e\x4c\x44\xc6\x98\x89\x28\x5f\xac\x7b\x73\x40\xa8\xda\x8b\x9e\xaf\x75\xd3\x5d\x6b\xcc\xdf\xeb\x24\xe0\x9c\x55\xaa\x7e\xf8\xee\xfb\x8b\xe5\xaa\xac\x2a\x29\xb8\xd1\xbb\xe1\x0f\x47\x66\xa9\xbd\xc4\x85\x80\x80\x04\x63\xfe\xcd\x3f\xc1\x18\x22\x68\xeb\xac\x43\xc6\xfc\xde\x47\xb4\x8e\x1c\x39\xeb\xfc\x81\x7b\x67\x8c\xf1\x1b\x58\x18\xe7\xb5\x05\xa5\xea\x44\x4a\xce\xf8\xe9\xa6\x54\xda\x26\x82\x13\x03\x70\x60\x9d\xab\x95\xd2\xda\x20\x80\x03\xf4\x0d\x45\x30\x66\x9c\xe3\xac\x79\xbf\x0f\x9a\xab\x38\x0d\x10\x71\xc6\xb8\x10\x42\x48\x21\x13\x21\x93\xa0\x05\xf7\x41\x0e\x7a\x9a\x37\x86\xc0\x2e\x7c\xbb\xdd\x16\x45\xc1\x18\x33\x46\x6f\xce\x4f\xb1\x11\x66\x2b\x3a\x40\x60\x80\x74\xb5\xd1\xb7\x28\xd7\x49\x97\xa8\x9b\xe3\xec\x4b\x9b\x3a\x1e\xbd\x1f\xe1\x66\x52\x44\xec\xa6\x59\xfb\x88\x89\x88\xe4\x76\xc8\x31\xd6\x43\x06\x3f\x05\x1d\x7e\x7a\x60\x14\x44\x9c\xd0\xe6\x63\x34\xfd\xcc\x04\xfe\x09\xe2\x98\xe6\x26\xa5\x80\x9e\xa9\x14\x97\x7d\x0c\x81\x62\x45\x06\x23\xfd\x02\x7a\x6a\x74\x22\x89\x89\xcc\x8f\x45\x0c\x52\xec\x07\x4e\x8c\x0f\xfa\x3a\x3d\xa0\x87\x4f\x59\x5f\x41\x5a\xdd\x74\x68\x9f\x5b\x9f\x6c\x0c\x21\xd2\x34\x9d\xcd\x66\x7d\xfe\x01\xe7\x09\xcf\xa0\xe8\x26\xda\x46\x9c\xbd\x98\x6d\x2c\x96\x31\x31\x76\x4c\xc6\xe4\x16\x30\x1f\x84\xd8\xc1\x54\x62\x19\x06\x81\xd4\xbe\xe0\x11\xc8\x3c\x2e\x57\xcc\x67\x50\x2c\xd0\x76\x84\x81\x29\xab\x5f\x9a\x7b\x73\x40\x68\x8c\xe9\x3a\xe1\xcd\x5d\xd0\x31\xa6\x35\x14\xb4\xdd\xc0\x68\x53\xd7\x15\x00\x3c\xfe\xd5\x5f\x3f\x3b\x3d\xc9\xd2\x4c\x29\xed\x6b\x4b\x59\x07\x00\x92\x37\x07\x38\x1c\x90\x75\xc4\x05\x72\x64\x0c\xd1\x3a\x40\x04\xe3\x1c\x43\x44\x42\x65\x0c\x02\x14\x89\x10\x9c\x6d\xac\x4d\x04\x2b\xa4\xe0\x8c\x31\xeb\x84\xb1\xfe\x00\x85\xaa\xd4\xd9\xe5\x66\x9e\xa5\x56\xdb\x5a\x69\xa3\x19\x47\x74\xd6\x1a\x63\x25\x42\x0d\x04\x44\xce\x79\x88\x01\xce\x50\x59\x52\xd6\xa5\xc2\xc3\x2c\x30\x21\x9a\x61\x14\x43\xbf\x18\x88\x0c\x83\x96\xdd\x49\x20\xc6\xc2\xee\x67\xbf\xf3\x77\x21\x9b\xcd\x66\x36\x9b\x6d\x2f\xcf\xad\x31\xcd\x9d\xae\xd8\xd8\x74\x44\x04\x08\x8c\x33\x6b\x6c\x5f\xaa\x3e\xe1\x06\x13\x09\x71\x37\x13\xdb\xb7\xfd\xfa\x3d\x9c\x30\x44\xc0\x0e\xfc\xfc\xb5\xa9\xcd\xe8\x24\x20\x88\x2b\xae\xaf\xad\xa0\xd7\x8b\x06\x6b\xbf\xd3\x68\x31\x87\xe9\x76\x72\x73\x4f\xac\x32\x02\xcd\xd2\x11\x0f\x6a\xae\xa0\xb5\xc7\x05\xec\xc8\x06\x55\x3c\x5c\x6d\xdb\x37\x0c\x89\xb1\x2a\xc8\x43\x2c\x93\x40\x27\xc6\xd2\x88\xdd\x44\xa2\x7d\x9e\x7d\x4f\x5c\x77\xb1\x60\x3f\xb3\xa7\x9f\xff\xe0\xfa\xb4\x41\x2d\xdc\x05\xf6\x7f\x4a\x29\xa7\xdf\x1a\x9c\x00\xf5\x8e\x20\x86\x8d\xb8\x25\x04\x6e\x10\x69\x06\x09\xe0\x6a\xd9\xe3\x36\x09\x9f\x5e\x80\x7d\xf8\x0c\x14\xce\x18\x30\x07\x2e\x40\xc1\x41\xe2\x89\xce\x3e\xe6\x3e\x03\x58\x7c\x1e\xf7\x46\x81\xd0\x7b\xb0\xe7\xc6\x88\xe3\x4e\x12\xfc\x8d\xe3\x76\x51\x9c\xb5\x5a\x2b\x55\x57\x75\x5d\x7e\xed\x1f\xff\xfa\x87\xdf\xfe\x96\x31\x96\x73\x0e\x44\xd6\xb9\xb2\xaa\xcb\xaa\xf2\xa6\x8e\x3f\x63\x67\xc9\x79\xcd\x8f\x88\x0c\xc1\x11\x10\x81\x03\xf2\x76\x0b\x00\x5d\x54\xaa\x48\x24\x00\xad\x2b\x43\x0e\x12\xc1\x38\x43\xc3\x18\xb7\xc8\x98\x7f\x1d\x09\xb7\xa5\x45\x60\x46\xa9\xd2\xba\x54\x0a\xeb\x9c\xb1\x4e\x1b\x4b\x8e\x18\x03\x6a\xcf\xec\x23\x62\x26\x05\x11\x01\x20\x01\x08\xce\x79\x92\x74\xbd\xa7\xc9\x12\x0d\xf4\x8d\x6e\xe7\xdb\x20\x10\x8e\x85\x3b\xe7\x2e\xce\xcf\xc8\x28\x40\x70\xe4\x90\x10\x01\xfa\xf3\x9b\x00\x18\x2c\x16\xb6\x6b\x7a\x44\x80\x88\x84\x57\x6e\x4b\x03\xe8\x5d\x22\xda\xf4\xf0\x1e\x01\x5d\x69\xf1\xbb\x93\x85\xbe\x7a\x06\xbb\x47\xa0\x1f\xfb\xa5\x8e\x51\x64\x0c\x14\x63\x20\x81\x48\x01\x05\x5d\x7a\x50\xaf\x0d\x76\xfb\x41\x48\x0b\xfc\x83\x19\x0e\x42\xe2\x9f\x30\xd4\xb6\x27\x20\x7c\x2c\x70\x02\xde\xba\x90\x41\x11\xf5\x3f\x5d\x9b\xca\x58\xc4\xb1\x44\xfb\x6e\xac\xee\x06\xe9\xc7\x94\x69\x3f\xa1\x98\xc6\x87\xf7\xa7\xe6\xfa\x69\x8d\x49\xb5\xfb\x2a\x84\x58\xad\x56\x83\xa0\xd2\x4f\x2b\x08\xb9\x49\x65\x05\x88\x78\x13\x71\x8d\xf1\x19\x2c\x57\x3f\x89\x4f\x25\xc3\x89\xf0\x40\xb0\x63\x3d\x17\x00\x8c\x31\xd7\x42\x5a\x9f\xe7\xa0\xd6\xea\x74\x57\xc7\xfc\x4d\x42\xa0\x77\x6f\xfa\xae\xd1\x1b\xba\xc1\xce\x19\xb4\x9e\x8e\xa0\x4f\xe9\x9c\x35\xc6\xa8\xba\xae\xab\xba\xdc\x6c\x5f\x3e\xf9\xf9\xfe\x72\xb5\x37\x9b\x7b\x1a\xbf\x3e\xe7\x9c\x3b\x39\x3f\x7f\x7d\x72\xf2\xea\xe4\x44\x69\x8d\x00\x8e\x88\x01\xb8\xd6\xe8\x21\x00\xed\xc8\x35\x8f\x1f\x31\x5f\x7b\x96\x08\x01\x2a\xd3\x3c\xdd\x22\x18\x71\x86\x8e\x2c\x63\xc8\x91\x29\x6d\x08\x00\x89\x6a\xad\x8d\x31\x7e\xf9\x8d\x1c\x71\x04\x6c\xae\x5d\x69\xea\x9a\x21\x00\x32\x6f\x48\xa5\x69\x02\x52\x32\xc6\xb0\x37\xb3\xe8\xef\x7b\xeb\x8b\x82\xda\xc9\xf7\x3e\xda\xf5\x43\xc6\x80\x10\x00\x1c\x11\xa2\x40\xb2\x00\xe4\x6f\x5f\x6b\x84\xd6\x93\x2a\xe3\xcc\xd9\x76\x10\xdd\x66\xd8\x53\xb5\xb6\x61\x67\xd2\x35\x60\xd7\x69\x01\xff\xc9\xe7\xb7\x5f\x5b\x3b\xc0\x6c\x8b\xe1\xf1\xb7\xdf\x6b\x06\x81\x07\xae\x76\xd4\xee\xd3\x84\x12\x89\x51\x6d\x0c\x72\x3e\x27\x4d\xf0\x33\xce\xdb\x20\xdb\x6b\x3f\x0d\x46\x9f\x16\xcb\x0d\x43\x62\xa1\xf5\x05\x75\x13\x25\x3e\x96\xb7\x38\xe2\x34\xbc\x05\x25\x1a\xc3\xa7\x18\xdb\xe2\x46\x32\x48\xd3\x6f\xf3\xfd\xc2\x06\x59\x0a\xaa\xcc\xd3\x70\xce\x97\xcb\x25\x6b\x4f\x22\xc5\xd9\x9b\xce\xe7\xa0\xac\x02\x28\x0a\xd2\x9d\xe6\x1c\x8b\x77\x10\x8a\x60\xbc\x46\xe2\xc0\x6b\xa1\x31\xc6\xd4\x40\x14\x41\x26\xa1\x7d\xc7\x2a\xa0\x0c\x3c\x30\x24\xfc\x18\xfc\x02\xd7\xd7\x66\x6f\x06\x14\xdf\x1c\x10\x4e\x97\x3c\xa0\x8c\xbb\xdf\x98\x64\x83\x51\x92\x35\x56\xab\xba\xaa\xca\xcb\xb3\xd3\x6f\xff\xe9\x1f\xbe\xf8\xd9\xdf\x73\xc6\x98\x6c\x8e\x6f\x5b\x47\x04\xc4\x39\x2f\x8a\xd9\xde\x6a\xef\x1b\xef\xbe\xfb\xf1\xb3\xa7\x1f\x7d\xfc\x89\xd2\xda\x38\xa7\xad\x13\x8c\x09\x86\x8e\x40\x59\x8b\x00\xca\xda\x14\x05\x02\x1a\xd7\x25\x04\x95\xb1\xd8\x1c\xc3\xf0\xf9\x41\xc9\xd9\x56\x19\xe3\x48\x72\xc6\x11\x95\x75\xdc\x35\x45\x65\x08\xad\x17\xfc\xd9\x0c\xc9\xdb\x49\x51\x44\x91\x66\x32\x49\xb3\x2c\x13\x52\x36\xa7\x23\x00\xfb\x33\x8d\x31\xc2\x41\x8b\x82\x01\xec\xc5\xf4\xdd\x4f\xe7\x27\x41\xd1\x01\x91\x75\x96\x03\x40\xfb\xb6\x21\xb5\x03\x0e\xc6\xd0\xb9\xab\x93\x45\xbb\x3c\x00\x62\x1f\xd5\x88\x08\xe3\x4f\x2d\x1c\x36\xa6\x66\x1b\xb8\x0b\x85\x26\x2d\x00\xf2\xe6\xf7\xae\x42\x83\xfa\x0d\x5a\x42\xd0\xaf\xe2\x76\x12\xab\xd4\xb1\x28\x37\x74\x63\x0d\x2c\x4e\xb7\x1f\x65\x90\x26\xe0\x39\x06\x2d\xd7\xe6\x24\x8e\x3e\x86\x82\xd3\xba\x23\x06\xda\xa0\x7f\x4d\x83\x59\xcc\x6a\x0c\x5c\x7d\xbb\x0a\x64\xd2\x8f\xdb\xaf\xdc\x31\x99\x8c\x95\x37\xa0\x81\xb6\xa9\x0f\x6a\x89\x41\x3e\x1d\x0d\x63\x6c\xb9\x5c\x0a\x21\xba\x9c\x8c\xe5\xb9\xe3\x33\xd8\x26\xc7\xda\xdb\xb5\xc3\x8b\xc1\x84\x6e\x5e\xf6\x40\x7a\xd3\x34\x63\xd5\xfa\x19\xba\x09\x11\x79\x20\xec\x23\x68\x5f\xf2\x9f\xad\xeb\x7d\x59\xee\xcd\x01\x61\x27\x9d\xbe\x9a\x1e\x6b\x25\x63\xbd\x7d\xac\x01\xa1\x5f\x1a\x34\xba\x2e\xcb\xcd\x66\xfd\xfa\xf9\xd3\xbf\xfc\xfd\xdf\xbb\x78\x75\xcc\x85\x40\x00\x7f\x0a\x01\x10\x99\xa3\x8b\xed\x36\x4f\x92\xbd\xf9\xac\xac\xf5\x2c\xcf\xbf\xf1\xf8\xdd\x47\x0f\x1f\xfc\xf4\x17\x4f\x3e\x7a\xf2\x71\xa5\x0d\x10\x20\x32\x63\x1b\x73\xd0\x58\xc7\xc0\x0a\xce\xba\xab\xc6\x10\xc0\x3f\xcf\x6e\x1d\x19\xe7\xac\x75\x8c\xb1\x5c\x72\x86\x48\xe4\xac\x73\x0c\x18\x47\x74\xed\xd1\x74\x63\xc9\x92\x93\x8c\xf9\xbe\x6f\xad\x63\x88\x9c\x01\x20\x4a\x29\x79\x9e\xcf\x66\xc5\x6c\xb1\xca\xf2\x42\x26\x09\x13\xdc\x6f\xd1\xe9\x97\x6e\x10\x05\xfb\x5f\xa7\x11\xb1\x17\x7a\x05\x0b\x91\xb1\xf6\x2c\x20\x21\x00\x30\x86\x64\xbb\xa6\xdb\x80\x97\x97\xb6\x2f\xfa\xd5\x61\x2b\xec\xae\xdd\x6e\xf6\x88\x36\xe8\x48\xad\x19\xd9\x9f\x50\xf2\x75\xd7\xe3\xec\x8f\x85\x0c\xa2\x05\xf5\x23\x46\x3a\x7a\x87\xd3\x11\xa2\xc4\x9f\x82\xae\x78\x73\x9a\x69\x00\x0e\xb0\x04\xc7\x07\xec\x71\x56\x63\x8d\x36\x56\x10\x88\x5a\x7b\xb1\xd1\x07\xce\x00\x00\x20\x00\x49\x44\x41\x54\x00\xfc\x83\x45\x8b\x63\x05\x34\x13\x50\x0d\x57\x05\x3e\x58\x9c\xc1\x9c\x8c\x81\xeb\x84\x1c\xc6\x06\x2e\x71\x4e\xc6\x6a\x1c\x7a\x95\x15\xf0\xe9\x4b\x63\x0c\x14\x3b\x9a\xc5\x62\x21\xa5\x8c\x4b\xd1\xa7\xb9\x89\x67\x50\x50\x83\x75\x31\x88\x6a\xd7\x82\x59\x20\x84\x09\xb0\xbf\x49\x9e\x03\xfa\xb1\xe2\x04\x21\x81\xa8\xe3\xbf\x83\x4d\xba\xef\x6e\x82\x8e\xdd\x32\x90\x10\x62\x8c\xcf\x17\xee\xde\x1c\x10\xfa\xad\xfc\x81\x5a\x0f\x5c\xbf\xfd\x4d\x88\x20\x68\x79\xe4\x9c\x25\x67\xb4\xae\xca\x72\xb3\xbe\x3c\x3d\x7e\xf9\x57\xbf\xff\x7b\xeb\x93\x57\xdc\xab\xdb\xf6\x6f\xa5\x94\xb5\x0e\x00\xd2\x24\x49\xa4\x50\xc6\xfa\x2f\xb3\xbc\xf8\xd5\xf7\xbf\xfe\xf6\x83\x7b\x3f\xfc\xc9\x4f\x9f\x3d\x7f\xe9\x1c\x19\x67\xad\x73\xda\x22\x43\xac\xad\xe5\x0c\xad\x23\x44\x7f\x8a\x1d\x9b\x57\x70\xdb\x31\x6f\xad\x0d\x10\x08\xce\xfc\x13\xf2\xfe\xd8\x81\xcf\xa5\x25\xd2\xd6\x12\x91\x64\x0c\x11\x18\x60\x2a\x05\x02\x20\xa2\x10\xbc\x58\xcc\xd3\xc5\x62\xb5\x77\xb0\x5c\xed\xe5\xb3\x59\x9a\x65\x52\x48\xc6\x98\x3f\x69\x1e\xb7\xb9\xbe\xdc\x62\xd8\x1b\xf3\x74\x3f\x8d\x23\x62\x28\x18\x78\x2c\x04\x00\x6c\x0c\x50\x8f\x55\xc8\x38\x77\xb6\xc3\xc2\xb6\x4d\x37\x52\xee\x60\x11\xfb\xd9\x02\x6f\xdf\xf5\xb2\x89\xd8\x9e\x9d\xf0\xfd\xa7\xcf\xe4\xca\xf0\x99\xc5\x39\xbc\xa1\x7e\x1f\xd4\x1d\x83\x60\x73\xad\x1a\x9a\x0e\x99\x60\x18\xa3\x57\x4c\x36\x81\x34\x83\x69\x8d\x95\xb4\x8f\x3a\x1d\x65\x8c\x9d\x13\xa9\x07\x1a\x70\x4c\xce\x83\xa5\xeb\xc0\xa6\x9f\x87\x69\x0c\xf0\xfd\x62\x4c\x02\x63\x6e\x4c\x2f\x8f\xd1\x74\x21\x41\x7e\x06\xf9\x0c\xd2\x20\xe2\x62\xb1\xf0\x0f\x0d\x06\x34\x37\xcc\x73\x5c\x04\xb8\x2a\xed\x41\xb8\x1a\xa3\x19\xf4\x5c\x8b\x94\x41\xd5\x0c\xba\xb8\xc6\x63\x3e\x10\x55\xc1\x44\x19\x83\x58\x30\x52\x23\x9d\x9c\xc7\x92\x1e\xcb\x95\x0f\xef\xcc\xf4\xb1\xe8\x5f\xa0\xfb\x12\x2c\xc2\xab\x6f\x9b\xef\xdc\x4d\xaa\x21\xa0\x27\x22\x72\xce\x5a\x6b\xb4\xae\xca\xcd\x7a\x7d\x79\x71\x76\xfa\xdd\x3f\xfd\xa3\xf5\xc9\xab\xe6\x56\x96\xf6\xb1\x27\x00\x28\xd2\xd4\x58\x57\x64\x19\xe7\xac\x52\x3a\x91\x12\x00\x19\xa2\x03\xd8\x6c\xeb\x3c\xcb\x7f\xe5\xfd\xf7\x0e\x0e\x0e\xfe\xf0\x2f\xff\xe6\xe9\xc9\xb9\x9f\x4f\x44\x40\xc9\xd9\x5b\x07\x8b\xfd\x22\x23\x80\x22\x91\xbe\x24\x00\x80\xcd\x9a\x22\x63\x0c\x4a\x6d\x84\x63\x09\xe7\xd8\x2f\x26\x11\x11\x58\xe7\x04\x67\x00\x60\x9c\x23\x22\xeb\x28\x11\x5c\x72\x3e\x9b\xcd\x93\xbd\xfd\xbd\xbd\xfd\xbd\x5b\xb7\xe6\xab\x55\x31\x9b\xa7\x59\x26\x64\xc2\xb9\xe8\xb7\xb0\x58\x50\x41\x60\x8c\x91\xd0\x6b\x85\x01\x5e\x1a\xeb\x9c\x83\x84\x23\x00\x39\xe7\xbc\xad\x8c\x0d\x98\x11\x02\x36\x4b\x9b\x04\x80\xfd\x57\x78\x7d\xfd\x35\xc0\x87\xad\x7f\x97\x7a\x9b\xe3\x16\xf5\xbc\x69\xd8\x9e\x47\x44\xec\x32\x85\xcd\x9a\x22\xfa\x33\xfe\x31\x16\x4e\x7b\x06\x95\x60\x93\xbb\xeb\x86\xea\x1d\xd9\x98\x27\xa0\x99\x56\x67\x30\xd2\xc9\x27\xa0\x37\x50\xd3\x81\x0b\x92\x88\x51\x76\xd0\x8d\xb1\xea\x67\xec\x5a\x50\x9f\x46\xd9\x31\x26\x31\xb8\x5e\x9b\xf3\x41\x7d\x3d\x21\xe7\x89\x3a\x82\x11\x53\xbe\x13\xf2\x60\x72\x7d\x1a\x00\x98\xcf\xe7\x69\x9a\x8e\xe5\x07\xae\x56\xca\xd8\x08\x60\x6c\x84\x31\x56\x6b\x71\x2b\x8a\x8b\x13\xb4\xf3\x8e\x20\xae\xd6\xb8\x80\x7d\x4f\xfc\xe9\xda\x76\x35\x81\x97\x83\x65\x19\x44\xc1\xcf\xe6\x28\x72\x49\x92\xf8\xd7\x7a\x3f\x33\xcf\x9b\xbb\x37\x07\x84\xfe\xd6\x4c\xbf\xb9\x39\x50\xd0\x13\xae\xab\xfe\xa0\x93\x90\x73\x8e\x9c\x35\xd6\x18\xad\x95\xaa\xca\xed\xe6\xf2\xf2\xe2\xe2\xf4\xe7\x3f\xfc\xfe\xb3\x8f\x7e\xc6\x10\x8b\x2c\xe3\xdd\x2d\x65\x88\x96\xa8\xac\xd5\x2c\x4b\x19\x63\xeb\xb2\x52\xda\xec\xcd\x67\xcc\xaf\xf3\x39\x62\xc8\xb6\x95\xca\x92\xe4\xfd\x47\x0f\x8f\x6e\xed\xff\xde\xbf\xfb\xab\xbf\xfd\xfb\x9f\xfb\x84\x4a\x0d\x3f\x78\xfa\xfa\xee\x6a\xf6\xf8\x68\xcf\x92\x7f\x35\xbe\x51\xe8\x1e\x13\x38\x47\x4b\x50\x5b\x67\xc8\x0a\xc6\x64\xb3\x02\xe8\xd7\x23\x21\x4f\x24\x00\x10\x40\xad\x0d\x22\x26\x9c\x33\xc6\xe6\xf3\x59\x76\xeb\x60\x79\x70\x70\x70\x74\x7b\xef\xe0\x70\xb1\xdc\x2b\x8a\x79\x9a\xe5\xfe\x99\xa7\xb1\xae\x02\xbd\x5e\xd7\x1f\x4c\x7c\xaa\xc6\xa7\x8d\x25\x62\xa9\x60\x04\xcd\x1c\xc4\x95\x07\x02\x11\x11\x19\x80\xeb\xf0\x0c\xa9\x7f\x00\x10\x3c\xbe\xb5\x45\x6f\x7b\x5d\xef\x88\x3d\x74\xf3\xa4\x18\xcc\xa8\xee\x36\x91\xb2\xf6\x96\xf0\x60\xa4\x1c\x8c\x31\xfb\x2e\xe8\xe1\x83\x45\x9e\xd0\x11\x37\x19\x5a\xc5\x34\x37\x01\xcb\x09\x3e\x37\x51\x3d\xf1\xc8\x2f\x50\xb8\x83\x64\x31\x68\x8d\x61\xcc\x58\xd9\xc7\x00\x3b\xce\x49\xc0\x7c\x8c\x60\x30\xfc\x26\x59\x8a\xb3\x37\xad\xf1\xe3\x01\x5f\xc0\x07\xaf\x0e\x80\xc6\x68\x66\xb3\x59\x96\x65\x71\x0b\x0c\x0a\x12\x03\x5e\x7f\x34\xd3\x87\xd5\x41\x14\x8c\x45\x11\x54\xd9\x84\x1b\x14\x63\x9c\x74\x50\x84\x80\xc9\x20\xbe\xc6\x1d\x6d\x7a\xcc\x07\x91\x18\x27\xb2\xdd\xcf\x61\x3f\xd1\xb1\xe8\xfd\x3c\xf4\x71\x81\x88\xd2\x34\x7d\x63\xaf\x12\xbe\x51\x20\x14\x42\xf8\xed\xb6\x41\x99\xbd\x1b\xeb\x9c\x10\xdb\xdd\xce\x39\xe7\x1a\x0c\x54\x75\x55\x96\x9b\xf5\xc5\xe5\xf9\xf9\xd9\xc9\xf1\x47\xdf\xfb\x8e\xb3\xf6\x74\xb3\xe5\x8c\xcd\x8b\x82\xb7\xd7\xd6\x09\xd6\xec\x44\x41\x44\x29\x78\x91\xa5\xa2\x7d\x29\x4d\x72\xbe\x9a\x15\x27\x97\x6b\x44\x26\xb8\xb8\xb5\x9c\xff\xf7\xff\xf5\x7f\xfe\x7f\xff\xc5\xdf\xfc\x9b\x6f\x7d\xaf\xcb\xc6\xf3\xf3\x8d\x60\xec\xbd\x3b\x07\x8d\x86\x77\xd4\x9d\xf6\x73\x80\x16\x49\x26\xc2\xdf\xe2\xe6\x1f\xc5\x45\x20\x06\x58\x69\xcd\x19\xf7\x77\xd6\x00\x00\x43\xcc\x52\x39\x2b\x8a\xe2\xe0\xd6\xe2\xd6\xd1\xe1\x9d\x3b\x07\x87\xb7\x57\x7b\x07\xb3\xc5\x22\x2f\x9a\x7b\x41\x59\x74\xf1\x58\xe0\x74\x5d\x5d\x1e\x3f\x3f\x7b\xf9\x74\xf3\xfa\xb8\x5e\x9f\x5b\x55\x21\x39\xad\x55\x59\xeb\xa4\x98\x89\x34\x2f\x16\xab\x7c\xb9\x97\x2d\xf7\xb3\xf9\x32\x5b\xac\x98\x08\x2f\xeb\xd3\xc6\x12\x41\x96\xb0\x66\x8e\xd7\x5a\xc6\x39\x36\x28\x85\xc0\x00\x1c\x76\x15\x83\xed\x0c\xe7\xae\x93\xf8\x26\x0b\xcd\x4b\x4b\x1d\x5c\x02\x44\xda\xdc\x63\x65\x0f\x4a\x3d\xb9\x7f\x8f\x30\x50\x58\x41\xe7\x19\xec\x6c\x83\x7a\x07\xaf\x0e\xf3\xe3\x28\x31\xf1\xb5\x9e\xe9\x2a\xe8\x88\x83\xfc\xf4\x0b\x12\xd3\x04\x7a\x6d\xa2\xe5\xc7\x0c\x07\x43\xc6\x20\x64\x30\xd6\xb5\x58\x38\xad\x9d\x07\x41\x71\x30\x64\x62\xf4\x30\xc6\x6d\xac\x42\x83\x58\x9d\x7e\x1c\x1c\x37\x04\xc3\x82\x31\x00\xf0\x7f\x8b\xa2\xc8\xf3\xbc\xcf\x36\xa6\xe9\x33\x1c\xf3\x4c\x8c\x00\xa6\x8b\xdc\x2f\xd4\x74\x12\xd3\x7c\xc6\x08\x06\x45\x14\x70\xb8\x16\xcf\xc6\x3c\x7d\x9a\x89\x4e\x77\xf3\xe4\x02\xfc\xf3\xc6\x52\x92\x24\x8c\x31\xa5\xd4\x9b\xb9\x6e\x54\x7c\xfe\xa7\x2e\x26\x5c\x9f\xb9\xb5\x56\x08\xa1\x94\xea\x8b\x6f\xb0\xb2\x3b\x37\xa4\x98\xc8\x39\x7f\x7f\xa7\x35\xaa\xae\xeb\xba\xae\xca\xed\x76\xbd\xbe\x38\x3f\x3f\x3b\x7b\xf2\xf7\x3f\x39\x7e\xf9\xd2\x3f\xad\xf0\xe2\xe4\x94\x31\xb6\x9c\xcd\x10\xd1\x3a\x12\x1c\xe7\x7e\x00\x88\x98\xa7\x29\xf6\x52\x37\xd6\x72\xc6\x96\xb3\xe2\xe5\xd9\xf9\xab\xf5\x56\x72\xcc\x12\xf1\x5f\xfd\x27\xbf\x55\xd6\xea\xcf\xbf\xf7\xa3\x2e\xe1\x8f\x4f\x2f\xf3\x44\xde\xdd\x5b\x30\x86\x04\xa8\x95\x15\x9c\x03\x02\x63\x0c\x18\x02\x63\x49\x92\x10\x80\x7f\xd3\x01\x81\x80\x01\x13\xa0\xc8\x25\x08\x08\x98\x4a\xc1\x90\x15\x59\xb6\x3c\x3c\x9a\xdf\xbe\x73\x70\x78\x74\x70\x74\x67\x6f\xff\x60\xbe\x5c\x16\xb3\x79\x96\xe7\x32\x49\x84\x10\xfd\xab\xa8\x3b\x67\x54\xfd\xf2\x17\xff\xf0\xea\xe7\x3f\x39\x7f\xfa\xf3\xd7\xcf\x3f\x49\x19\x0a\xde\xbc\x89\x88\x88\x04\x40\x44\xc2\x3a\x77\x51\xd5\xe4\x36\x1f\x6b\xad\x95\x31\xc6\x18\x47\x88\xe9\x7c\xb5\xbc\x7d\x6f\x75\xef\xad\x83\x07\x5f\x9b\xdf\xba\xdd\x30\xb4\x76\x5b\xb9\x3c\x15\xbe\x8b\xb4\x58\x88\x00\x80\x80\xc8\xb8\xb5\x16\x5b\xe3\xaf\xeb\x49\x4d\x45\x50\xff\xfd\x25\xd8\x5d\xbc\xdd\xfc\x68\xa9\xa8\xb5\x10\xdb\xa3\x21\xfe\x1b\xe3\x9c\x8b\x66\xf8\x15\x0f\x66\x03\x3d\x3e\xa8\x1c\xc7\x20\x67\x10\x1a\x27\x14\xf4\xb5\xba\x3b\xd6\xc8\x83\x98\x37\xa1\x07\x07\x29\x63\x95\x74\x93\x02\x06\x3c\xe3\x90\xb8\xb0\x13\xa0\x38\xa8\xd4\x02\xb6\x71\xd9\xc7\xba\x6a\xff\x53\x87\x10\x13\x5f\xe3\x74\x63\x6e\x01\x3e\x0d\xfe\x1d\x93\xc9\x34\x4d\x9e\xe7\x45\x51\x04\xa9\x8f\xc1\xcf\x20\x0c\x74\xfc\x07\x29\x07\xb1\x39\xc0\x86\xb8\x5c\x30\xd2\xba\x06\xe5\x36\x98\xd6\x58\xd2\x83\x94\x1d\xcd\x44\xb9\x26\xb0\x30\xf0\x4c\x34\xa7\x31\x61\x8e\x21\xa8\x77\xce\xb9\xd9\x6c\xa6\xb5\xee\x1e\x76\xee\xdc\x2f\x09\xb0\x3e\xb5\x45\xf8\x99\x5f\xc1\x60\x8c\x75\x6f\x3d\x4f\xcf\x8e\x8e\x35\x29\x2f\x27\x6b\x8d\xd6\xda\x68\xad\x54\x5d\x97\x65\x59\x6e\xb6\xeb\xcb\xcd\xe5\xe5\xfa\xe2\xfc\xe3\x9f\xfe\xfd\xd9\xc5\xc5\x2c\xcf\x01\x91\x21\x9c\x9c\x9d\x49\x21\x8a\x3c\xdf\x54\x65\x91\xa6\xa9\x9f\xa5\x24\x28\x55\x9d\x27\x89\xb6\x6e\x53\x96\x8c\xf3\x4d\x59\x01\xa2\x05\xfa\xd1\xd3\x17\x97\x55\x85\x8e\x12\x8e\xab\x22\xfb\x47\x8f\x1e\x7c\xeb\x47\x3f\xab\xd5\xee\xe2\xd7\x9f\x1d\x9f\xe6\x89\x9c\xe5\xa9\x23\x70\x44\x5c\x70\x47\xa0\x8d\x15\x7e\x53\x68\x77\x77\x69\x83\x0e\xc0\x85\x30\x4a\xd5\x4a\x67\x42\xcc\x93\x64\x39\x2b\xd2\xdb\x77\x16\x77\xef\xed\xdf\x3a\xdc\xbf\x75\xb8\xb7\x7f\x6b\xbe\x58\x15\x8b\x45\x31\x9b\x27\x59\x2e\x65\xc2\xd8\x95\x49\x00\x55\x95\x9f\xfc\xe8\xfb\x1f\x7d\xef\x83\x17\x1f\xfd\x38\xe3\x2c\xcf\x52\x07\x08\x80\x59\x9e\x71\xc6\x1c\x81\x76\x8d\x53\xd6\x6a\x6d\xb5\x75\x8e\x1c\x10\x91\x03\x8e\x82\x0b\x22\x67\xab\xf3\x93\xed\xe9\xcb\xa7\x3f\xfc\x1b\x02\xcc\x57\x07\x6f\xff\xe6\x3f\x79\xeb\x37\xff\x09\xe3\xdc\x3a\xb7\xa9\xd4\x2c\x95\xc0\x10\xae\xd8\x85\x08\xe8\xaf\xe4\x36\xd8\x80\x57\x7b\x04\xc2\x57\x44\x1f\x06\x1b\x64\xa4\xab\x47\x3e\x00\xda\xe9\x63\xea\x3d\xfc\xeb\x29\x64\x92\x06\x75\x3d\xa8\xf5\x60\x12\xde\x06\xdb\xdb\x20\xec\xc1\xa4\x42\x81\x5e\x8f\x9d\xe0\x33\xd8\xab\x63\x6c\x1b\x53\xa6\x5d\x60\x80\x46\x5d\xa1\xc6\xf2\x1c\xd3\x07\x6e\x1a\x20\x03\x9a\x31\x34\x9a\x88\xd2\xcf\xe1\x20\x00\x0f\x0d\x55\x87\xc7\x07\x83\xaa\xb9\x5f\xb3\x83\xea\x1b\x7a\x72\xeb\x20\x76\x42\x53\x43\x5b\x4d\x83\x34\x1e\x05\xfd\x25\x6a\x01\x4d\x5c\x71\x71\xdb\x1b\xcb\x33\x5c\xad\xaf\x41\x21\x04\xfe\xb8\x2c\x71\x36\x06\x41\x74\x30\x62\xf0\xb5\x2f\xde\x60\x70\x30\x86\xa6\x41\xce\xc7\x80\x2d\xf0\x74\x47\x99\x07\x29\x01\xa0\x7f\x34\x33\x76\x41\xb9\x3a\x08\xf4\x1e\x0f\x84\xf7\xee\xdd\xeb\x63\xe1\xe7\x79\x07\x70\xda\xbd\xb9\xa9\xd1\x24\x49\xd6\xeb\xb5\x10\xc2\x4f\xfb\x3a\xe7\xfa\x62\x1a\xd3\x08\xde\xed\x84\xe4\xac\x31\x46\x2b\xa5\x55\xad\x54\x5d\x55\x65\x55\x96\x65\xb9\xdd\x6e\x37\xe5\x66\xf3\xe2\x93\x27\xe4\x0c\x39\xcb\x39\x77\xd6\x96\xd6\x7e\xfc\xfc\xf9\x83\x3b\x77\xb2\x24\x71\xd4\x1c\x39\x78\x7d\x79\x79\xba\xde\x56\xc6\xbc\x3c\xbf\xb8\xd8\x6c\xb5\x31\x49\x22\xad\x75\xc8\xb0\xaa\x6a\xe7\xc8\x18\xa3\x94\xfe\x49\x59\x29\x55\x4b\x86\x75\x2f\x1b\xd6\xd1\x4f\x5e\x9c\xfc\xca\x83\xdb\x1e\x1f\xac\x73\xfe\x78\x21\x63\x4c\x19\x9b\x4a\x8e\xd8\x58\x40\x44\x40\xce\x71\x67\x33\x04\xe0\x7c\x91\x26\xab\xe5\x72\xfe\xe0\xc1\xe2\xf6\x9d\xd5\xde\xc1\xde\xc1\xe1\x72\x6f\x7f\xb6\x58\x14\xf3\x45\x31\x9b\xa7\x59\x9e\x24\x09\x6f\xf7\x0a\x3b\x6b\x7f\xf1\xe1\xf7\x7e\xf2\xc1\x7f\x38\xff\xc5\x4f\xc0\x59\x99\x24\x07\x8b\x59\x22\x25\x20\x3a\x47\x8e\xe0\x62\x5b\x67\x89\x74\x44\x9b\xb2\x3e\xdb\x94\x59\x22\x01\xc0\x58\xa7\x8c\xa9\x94\x51\xda\x00\x00\x39\x07\xe0\xcf\x35\x92\x64\x28\x19\x63\x44\x9b\xd3\x57\x3f\xfc\x7f\xff\xaf\xd7\x4f\x7e\xf6\x5b\xff\xcd\x3f\x47\x44\x6b\xed\xba\xd2\x45\x26\x39\xf6\xb1\xb0\x31\xe1\x38\x17\xd6\x1a\x7f\xd3\x8d\xc7\x42\xdc\xd5\x46\x3c\xc3\xe3\x43\xba\x96\xdd\xce\x9a\x36\x57\xd3\x60\x8b\x82\x19\x22\x23\x72\xed\x5d\xa3\x8d\x8a\x6b\xea\xdc\x77\x71\x64\x83\xca\x77\x10\x9f\x06\x81\x27\x76\x01\xd0\x0e\x6a\xf0\x41\x9d\x3e\xd8\x20\xc7\xd4\xe2\x84\xea\x1f\xc4\x80\x18\xa2\xfa\xbd\x60\x10\x12\xa6\x71\xe8\x86\x21\x31\x87\xfe\xa7\x69\x6d\x3e\x16\x37\x28\xd4\xa0\xa6\x9e\x40\xc1\xb8\xec\x7d\xcf\x18\x50\x05\x9e\x00\x9c\x62\x9a\x00\x05\xc7\xf8\x5c\x9b\xc3\xb1\x11\x40\x5f\x86\x37\x69\x99\x41\xd2\x83\xa2\x88\x2b\x25\x66\x32\x08\x7e\x81\x27\x6e\x5a\x63\x05\xef\x64\x3e\x26\x9f\x8e\xc0\xbb\x98\x61\xe7\x3a\x0c\xeb\xc7\x1d\xc4\xbf\x9d\x82\x77\xce\x6f\x90\xc9\xb2\x6c\xbd\x5e\xc7\x16\xe1\x2f\xc9\xbd\x39\x20\xcc\xb2\xec\xe4\xe4\x24\x4d\xd3\xcd\x66\xd3\x15\xd8\x9f\xa9\x18\xec\x36\x61\x53\x70\xce\x39\x67\x8c\x35\xc6\x43\xa1\xaa\xeb\xda\x1b\x85\x75\x59\xd6\x55\x79\x7e\x7e\xfa\xea\xf8\x45\x2a\x13\x86\xc8\x18\xf7\x4b\xac\x65\x5d\xfd\xec\x63\x7d\xb0\xda\x3b\xd8\xdb\x33\xce\x9d\xae\xb7\x7f\xf7\xf1\xb3\x97\x67\xe7\x8c\x33\x6b\x5d\xad\x54\x59\xd6\x82\x33\xad\x8d\x7f\xa8\xd6\xdf\x53\xaa\xb4\xd6\x5a\xd7\xaa\x8e\x6f\x7d\x2d\x95\xfe\xe8\xf8\xe4\xd1\xd1\xbe\xbf\x83\xdb\x6f\x59\x61\xcc\x69\x6b\x39\x47\xc1\x98\x32\xba\xd6\xc6\x68\xc3\x11\x12\xc1\x73\x29\x8b\x2c\xcd\x6e\x1d\x1c\x3c\x7e\xbc\x3a\xb8\xb5\x5c\xed\x2f\xf7\xf6\x17\xcb\x55\x31\x9f\x17\xb3\x79\x5e\xcc\xd2\xbc\x90\x52\x0a\x21\x11\xe0\xf2\xe4\xd5\x8f\xbf\xf9\xff\x7d\xf4\xed\xbf\xb4\xf5\xd6\x21\x2f\x8a\x5c\x08\x71\xb1\xad\xaa\x6d\x2d\x85\xc9\x93\xa4\x43\x9a\xcb\x6d\xe5\xaf\x02\xd7\xd6\x6e\x2f\x14\xe7\x5c\x69\x53\x1b\x5b\x2b\x5d\x69\x63\xad\x23\x22\x3f\xbd\x99\x4a\x9e\x72\x96\x08\x96\x72\x94\x9c\x49\x86\xcf\x7e\xfc\x83\xbb\x3f\xfe\xde\xbd\x6f\xfc\x86\x17\xfb\xa6\x54\x79\x2a\x13\xce\x08\xc0\x59\xcb\x18\x83\xf6\x28\x63\x1f\x0b\x1b\x93\xae\x81\x43\x24\x22\x6c\xe1\x8b\xba\xbb\x4b\x7b\xb6\x5f\x63\x46\xfa\x8f\xe8\xa5\xc4\x9c\xd1\x5a\x55\x5d\xfd\x7a\x7c\x85\x5d\xbd\x63\xf7\x5f\xfb\xec\x22\xf7\xf7\xa3\x02\x0c\xab\xf2\x40\x6b\x8f\x81\xdc\x20\xe4\xc4\x9e\x69\x4d\x3d\x18\x71\x30\x57\x83\x79\x0b\x3e\x4d\x44\xec\x38\x0f\x26\xdd\x05\x4e\x23\x65\x80\x0a\x71\x17\x8b\x99\x77\x1a\x33\x66\x38\x96\x93\x58\x56\x71\xd9\xa7\x85\x73\x13\x4f\xe7\xef\x97\x3d\xce\xd5\x04\x0d\x22\x16\x45\xe1\x51\x70\x0c\xcc\x06\x4b\x1a\x8b\x6b\xac\xbe\x26\x4a\xd1\x97\x6a\xcc\x7f\x02\x89\xc7\x86\x26\x71\x7e\x6e\xd8\xc2\x3f\x6d\x1e\xc6\x1c\x5d\xbd\x68\x7b\x30\x62\x80\x61\x71\x4d\xf5\x7f\x76\x8f\x57\xf8\x95\xaf\xee\xba\xbb\x37\xe6\xde\xe8\x39\xc2\xe6\xd1\x06\xc6\xba\xbd\xa3\xce\xb9\xb8\x8b\x0e\x74\xaa\x46\x46\xd6\xef\x90\x31\xc6\x68\xad\xb5\xaa\x8d\x52\x4a\x29\xa5\x95\x56\x7a\x7d\x7e\x76\x79\x79\xe1\x8a\x99\x9f\x83\x65\x8c\x71\xc6\x2b\x6d\xcc\xc5\xfa\xd5\xd9\xc5\xd7\x8c\x5e\xcc\x17\x4f\x4e\xce\xce\x36\x5b\xc6\x98\xb5\x4e\x29\x0d\x44\x44\xce\x68\xb7\x2d\x4b\x67\xad\x36\xc6\x68\x63\xac\xf5\xff\xef\x9c\x4b\x90\x39\x81\xca\xda\x7e\xcd\x9d\xac\xcb\x42\xf2\xc3\x79\xa1\x2b\x8b\x8c\xd5\x8e\xca\x5a\x29\x6b\x36\x15\x07\x40\x99\xc8\x54\xca\x44\x4a\x70\x2e\xcb\xb3\x5b\x87\xb7\xee\xdd\xbf\x77\x70\x74\x7b\xb1\xdc\x5b\x2c\xf7\x16\xab\x55\x51\xcc\xb3\xd9\xac\x28\x66\x59\x51\x78\x5b\x90\x31\xf6\xea\x93\x9f\xff\xf0\xdf\xff\xc9\xb3\x0f\xbf\x9b\x48\x91\xe7\x59\x32\x3b\x60\x8c\xd5\xda\x0a\xce\xe6\x59\x6a\x9d\x73\x8e\xca\x5a\x11\x80\xd2\x56\x5b\xeb\x2f\x32\x35\xd6\x5a\x43\x9b\x5a\x6d\x2b\x4d\x44\xb5\x31\x65\xad\xad\x73\x40\xa4\x8c\xdd\x6c\xb7\x55\x55\x27\x82\xcf\xb2\x64\x7f\x9e\x17\x89\xc8\x13\x99\x0a\x96\x4b\xfe\xfd\x7f\xf7\xc7\x77\xbf\xfe\xab\xfe\x30\x1f\x11\x6d\x2b\x65\xa5\xc8\x12\x01\x88\xfe\x4e\x00\x3f\xd7\x0b\x0d\x16\xb6\xa3\x81\xa6\x46\x08\x00\xbc\xdd\x48\x00\xd0\xbc\xb5\x0b\xd0\xeb\x6e\x44\xd0\xbe\xc5\xbb\x9b\x34\x25\x47\x16\xcd\x6e\xa6\xd4\x73\x6b\xbf\xd3\x15\xf6\x40\xce\x59\x70\x60\x0d\x78\x08\x6d\x9f\x26\xee\xb7\xa8\xe9\x91\x53\xdf\xdf\x6f\x51\x71\x63\xeb\xc2\x83\xb1\xf3\x20\x94\x06\x3f\x27\xf4\x63\x9f\x78\x30\x6f\x83\xb1\x02\x75\x3c\x06\x5d\x83\x46\x40\xfc\x69\x22\x4b\x83\xa5\x18\xe4\x39\xa8\x6a\xe9\xaa\xe1\x35\x58\x90\x6b\x0b\x1b\xb8\x40\x57\xc6\x45\x0b\x52\xbf\x39\x4d\x51\x14\x7e\x5d\xb0\x3f\x86\x18\xe4\xd0\x85\xf4\x1b\x46\x50\x1d\xb1\x70\xfa\x23\x86\x89\x42\x05\x72\xb8\xb6\x82\xfa\xd1\xe3\xfc\xf4\x6b\x2d\x34\x1b\x22\x13\x2d\xc6\xd4\xb8\xc6\xfb\x9f\x3a\x21\x04\x79\xe8\xfc\xfd\x6b\x3d\x62\xe9\x01\x40\x7c\x44\x2a\xf0\x07\x6c\x3b\x14\x24\xa2\xe5\x72\xa9\xb5\x4e\x92\x64\x4c\x3e\x5f\xb8\x7b\xa3\x77\x8d\xe6\x79\x5e\xd7\x75\x9a\xa6\x75\x5d\xfb\x09\x52\x6f\x11\xc2\x75\xc3\x67\x22\x72\xe4\xac\x6d\x5e\xb9\xb5\xc6\x58\xe3\xe1\x50\x19\xa3\xb5\xd2\xc6\xe8\xed\x76\x5d\x55\x15\x67\x9c\x73\x2e\x8c\xe0\x5c\x70\xc6\x88\x80\x21\x6e\xab\xed\x2f\x3e\xf9\xe4\xd6\xde\x7e\x9e\x24\x8b\x44\x9c\x55\xd6\x11\x21\x32\xeb\x6c\x96\xa6\x7e\xc6\x75\xbd\xd9\x92\x73\x1e\x64\x01\x40\x72\x51\x14\x49\x22\xe5\xa2\xc8\xb3\x34\x75\x40\x00\x58\x2a\x75\xb2\xde\xbc\xbe\xb8\x3c\xbe\x28\x57\x69\x52\xe4\x99\x43\x96\x08\x26\xa4\x58\x32\x2e\x04\x5f\x2c\x17\xf3\xc5\x3c\x95\x32\x4d\x64\x9a\x65\x45\x31\x2b\xe6\x8b\xd9\x62\xb1\x58\xac\xe6\xcb\x55\x31\x9f\xe7\x79\x91\x64\x79\x5e\x14\x59\x5e\x24\x69\x2a\x84\x78\xfe\xf3\x9f\x7e\xe7\x4f\xff\xe0\xf2\xe3\x9f\xe6\x79\xb6\x5a\x2d\xa5\x94\x5e\xdd\x3b\x22\xce\xd0\xb4\xc3\x2e\xeb\x9c\x36\x4e\x5b\x53\x29\x6b\xac\x35\xd6\xd5\xcd\xc3\x87\xd6\x5f\xf0\xbd\x2e\xcb\x52\x19\x63\x2d\x02\x94\x65\x75\x72\x7a\x5e\xd5\x35\x02\x70\x86\x97\x52\x5c\x9c\xcb\x45\x9e\x2e\xf2\xb4\xc8\xd3\x3c\x91\x95\xfa\xe4\xc3\x3f\xff\x7f\x7e\xe5\x3f\xfb\x2f\xbb\x86\x5b\x29\x6d\x9d\x2b\xb2\x84\x21\x3a\xe7\x00\x9a\x7b\x08\x00\x9b\xc3\x85\xbd\x2a\xf1\x3d\x1e\xfa\x8d\x1a\x42\x4d\x04\xd0\xc3\xc6\x36\x14\x00\x9a\x55\xc3\x5e\xb7\xc4\xde\xc7\xce\xd7\xd9\x94\xe4\x77\xa9\x3a\x6b\x9d\xb5\x88\x88\x2d\x22\xde\x64\xc0\x38\xa8\x71\x26\x20\xed\x26\x34\x81\x3d\x71\x6d\xd2\x37\xf9\x79\x6d\x7e\xba\x9f\xf1\xdf\x38\xe7\x83\x86\x42\x5c\x8a\x3e\xe2\xc6\x9a\x3d\x88\x15\x2b\xfa\x31\x71\x8d\x8d\x68\xe3\x11\x49\x9f\x26\x70\x71\x72\x81\xa2\x0f\x8a\x30\x4d\x33\x9b\xcd\xf2\x3c\x1f\xab\xb2\xa0\xec\x7d\x05\x3d\x48\x33\xc8\x61\xb0\xec\xd7\x36\x92\x41\xce\x83\xa2\x1e\x43\xd3\x9b\xd0\xdc\xc4\xf5\x95\x70\x0c\x7e\x10\x61\x58\x87\x58\x01\x87\xce\xd3\x3f\xf3\x30\x86\x85\x10\xc1\xa1\xc7\xc2\xd9\x6c\x26\x84\x38\x3d\x3d\xbd\x7b\xf7\xee\x0d\xf3\xff\xf9\xdd\x1b\x05\xc2\xf9\x7c\x7e\x7e\x7e\xbe\x58\x2c\x3c\x10\x9a\xf6\x6d\xa0\xfe\xa9\xc9\x81\x56\xe8\xaf\xaf\x76\xe4\xac\xb3\xce\x92\xb3\xd6\x1a\xe7\x1f\x3a\x32\xd6\x7a\x5c\x68\x5d\x55\x57\x88\x98\x24\xa9\x76\xb5\xe0\xdc\x91\xcb\x93\x84\x1c\x9d\x5c\x5c\x6e\xaa\x6a\x39\x9b\x0b\x21\x12\xb2\xc4\x19\x10\x70\x96\x64\x69\xa2\xb5\x16\x9c\x4b\x29\x19\x00\x39\xc7\x9b\x27\x71\x21\x95\x92\x21\x32\xce\x8e\xf6\x56\xcb\x59\x51\xa4\x69\x9e\x26\x42\x70\x44\xf6\xec\xe4\xe4\x17\xcf\x5f\xbe\x3a\x3b\xe3\x9c\xc9\x44\xa6\x69\x9a\x67\x69\x91\xe7\x59\x96\xe6\x79\x9e\x17\x45\x9e\x17\x79\x31\xcb\x67\xb3\xd9\x7c\x39\x9b\x2f\xfc\xbe\xd0\x34\xcb\xd3\x2c\xcf\xf2\x4c\x26\x59\x92\x24\xe7\xaf\x5e\x7e\xf0\xc7\xff\xe7\xf1\xdf\xff\x00\x85\x38\xd8\x5b\x49\x91\x28\x6b\x5f\x5f\x6e\x25\xe7\x69\x22\x11\xc0\x58\xa7\xad\x55\xc6\x6a\x63\x9d\x73\xd6\x91\x32\xf6\xb2\xac\xca\x5a\x57\x5a\x93\x03\x02\x30\xd6\x6a\x63\xad\x73\xd6\x91\x31\xe6\xf4\xfc\xa2\xdc\x56\xaa\x6e\x56\x36\x19\x22\x00\x1a\xeb\x6a\x6d\x19\x6a\xce\x38\x20\x72\xc4\x9a\xb3\xbf\xfd\xb7\x7f\xc4\x92\xec\xbd\xdf\xfe\xa7\x7e\x9f\x2a\x22\x2a\x6d\xac\x73\xf3\x2c\xe5\x9c\x11\x81\xb5\xce\xbf\x5d\x8c\x2d\x16\x76\x80\xe7\xbb\x06\x62\xff\x3e\xd2\xae\x3f\xef\xb0\xad\x0d\xf4\xe6\x1f\x36\xa8\xe6\xb1\xb0\x09\xf3\x81\xbb\xf3\xf9\x0d\xa0\x12\xb5\x77\xb4\x61\x17\x4c\x9d\xa5\xe8\x9c\x43\xc3\x84\xe8\xc3\xe1\xe0\x88\xb8\x0b\xbf\x89\x4a\xea\x5c\x5f\xc9\x06\x7c\x62\x4a\x18\x81\x81\x09\xd5\x39\x48\x33\x98\x68\x40\x1f\xe4\xf0\x26\xf9\x19\x4b\x3a\x90\xdb\x60\x12\xfd\x84\xc6\x38\x4f\xc3\xc3\x34\xe0\x8d\x85\xc4\x70\xd2\x4f\xeb\x53\xd1\x20\xe2\x62\xb1\x48\xd3\xb4\xfb\x1a\x98\x2f\x71\x11\x82\x8a\x18\x2c\xd4\xd8\xa0\x61\x30\xca\xa0\x88\x06\xf1\x2f\xa0\xef\xa7\x75\x6d\x7b\x98\xa0\x99\x46\xf1\x2e\xe9\x7e\x06\xae\xc5\xc2\xee\x14\xdc\x18\x87\xce\x1c\xec\x3e\x05\xf6\x5f\xc7\xaa\x33\x04\x8d\x31\x1e\x5c\xfd\x0e\x97\xba\xae\xbb\x23\x2e\x6f\xc0\xbd\x51\x20\x14\x42\x48\x29\xad\xb5\x69\x9a\x56\x55\xe5\xcf\x39\x78\xcb\xa3\xdb\x3b\x13\xb6\x8f\x66\x06\x95\x5c\x03\x87\x8d\xd4\xfc\x3b\xb9\xd6\x5a\xd7\xac\xd4\x39\xbf\xd2\xa6\xb5\x46\x44\x47\x84\x8c\x13\x38\x47\x54\x56\xb6\x36\x8e\x10\xad\x31\x48\xe4\xed\x89\x9c\x31\xc6\x84\x01\x14\x82\xe7\x59\x2a\xf7\xb8\x64\xcc\x18\x33\x4b\x13\xbf\x24\xc5\x18\x24\x5c\x48\xc1\x39\xb2\x59\x91\x49\xce\x8b\x2c\x4d\x84\x14\x82\x13\xd1\x2c\xcf\xfe\xa3\xf7\xdf\xdb\x54\xd5\xf7\xfe\xe1\xa3\x27\xaf\x5f\x67\x59\x3a\x9b\xcd\x66\xb3\xd9\x7c\xbe\x98\xcd\x17\xf3\xc5\x62\x36\x5f\xe4\xc5\x2c\xf7\xf3\x9f\x69\x96\xa4\x69\x9a\xe5\x69\x96\x25\x69\x96\x24\x29\x11\xfd\xf0\xcf\xfe\xcd\x0f\xff\xec\x4f\x6a\xa5\xb2\x2c\xe7\x5c\x10\xf2\xb3\x6d\x99\x49\x59\x29\xa3\x98\x05\x7f\x97\xa9\x71\xda\x5a\x6d\xed\xb6\x52\x8e\xc8\x39\xf2\x33\xa2\xce\x51\x55\xeb\x4d\xad\x8c\x71\xfe\xb2\xec\xba\x56\x97\x9b\xcd\x66\xbd\x2d\xab\x8a\x3c\xfe\x21\x7a\x44\xe7\x9c\x27\x89\xcc\xd2\x24\x4b\x13\x91\xa7\x49\x9e\x26\x59\xc2\x24\x5f\x6b\xfd\x57\x7f\xf8\xaf\x7f\xfa\xdd\x6f\xbd\xfd\x8f\x7e\x6d\xef\xf6\x9d\x7c\xb9\x27\xb3\x22\xc9\x8b\x0b\xeb\x66\x79\x92\x48\x09\x00\xfe\x26\x55\xbf\x4a\xc7\x9a\x39\x6a\x7f\x33\xe9\x0e\x05\x1b\xa0\xbb\xba\x35\x94\x00\x60\xb7\xa1\xa6\x37\x57\x03\x80\x04\x84\xed\x8d\xa4\xdd\xb4\x6a\xa7\xc2\xa0\x8b\x01\x70\x05\xc6\xda\x06\xe1\x5f\x86\x22\xb2\x46\x13\xb3\x9c\xcb\xee\x6c\xfe\x18\xae\x74\x2e\x86\x99\xfe\xb0\x7d\x2c\x4a\x30\x42\x1f\x53\x82\xd8\x33\xad\x26\x90\xac\xaf\x02\x02\x56\x83\x9c\x03\x28\x8a\xd3\xed\x97\x2b\xce\xcf\x60\x1e\x26\x4a\x37\x36\x9e\x88\x73\xd2\x2f\xef\x60\xb6\x27\xd2\x8a\xcd\x02\x68\x71\x2b\xd0\xad\xb1\x42\xbf\x39\x0d\x22\x2e\x97\x4b\x7f\x0a\x6d\xac\x61\x8c\x89\x7a\xda\x33\x31\xe0\x18\x6c\x72\x37\x09\x9f\x1e\x64\xc4\xa9\x4f\x37\x63\x88\xea\x2b\x88\x18\xc8\xb0\xef\xfa\xa8\x16\x43\x1d\x11\x39\xe7\x06\x5f\x5f\xea\xd8\x0a\x21\x62\x86\x5d\xf4\xbe\xbf\x63\xd8\x1c\x8a\xb3\x76\x3e\x9f\x27\x49\x52\x55\x55\xff\x85\xe4\x37\xe0\xde\xf4\x33\x4c\x7b\x7b\x7b\xc7\xc7\xc7\x8b\xc5\x42\x29\xe5\x4b\xce\xda\x33\xef\xc3\xfd\xa4\x95\x55\x8b\x88\xae\xfb\x4d\x44\xcd\x89\x0a\x20\x00\x48\xd3\xac\x28\x8a\xcb\xcb\x4b\xa5\x35\x11\x49\x29\x81\x04\x00\x12\x22\x90\x43\x02\x44\xa8\xeb\x1a\xb0\x79\x08\x90\x98\xe0\x32\x63\x04\x09\xe7\x45\x96\xe6\x52\x02\xc0\x2c\x4d\xb2\x44\xa6\x42\x70\xc6\x9c\x75\x8c\x21\x43\xdc\x9b\xcd\x00\x41\x1b\x53\x1b\x2d\x04\xb7\xce\x71\x86\xd6\xda\x3c\x49\x7e\xe3\x9d\x77\x6e\x2d\x97\x4f\x2f\x2e\xb2\xd9\x7c\xb9\x5a\x2d\x57\x7b\xcb\xd5\xde\x72\x6f\x6f\xbe\x58\x64\x79\x91\x24\xa9\x48\x92\x24\x49\x3d\x16\x26\x69\x2a\x84\xac\x37\xeb\x6f\xfe\xfe\xbf\xf8\xe8\xc3\xef\xef\x2d\xe6\xab\xc5\x9c\x00\x2f\xcb\xca\x58\x47\x0e\x2e\xb7\x95\xb1\xb6\x2c\xb5\xdf\x9c\x52\x6b\x53\x69\x6d\xad\x5b\x57\x6a\x5b\x29\x29\xb8\x75\xce\x5a\xa7\x8c\x2d\x95\xa9\x95\xb1\xd6\x29\xad\xab\xaa\xda\xac\xb7\x75\x5d\xbb\xb6\xe1\x13\x22\x43\x26\x05\x4f\xd3\x24\x4d\x93\x2c\xcb\xf2\x3c\xdb\x5b\x2e\x0e\xf7\x96\x8b\x79\x9e\x32\xb6\xc8\xe5\xf9\xe5\x5a\xd7\x55\x79\x71\xf2\xe1\x5f\xfc\x29\x59\x5b\xd5\x8a\x90\x1d\xdc\xb9\xff\x3b\xff\xec\xbf\x73\x77\xee\xe7\x89\x2b\xf2\x14\x9a\x95\x00\xf2\x77\xc1\x78\xf9\x7b\x1d\xe0\x2b\xa7\xa7\x45\x00\xa0\xbb\x6d\x9b\x10\x07\x1e\xeb\x6d\xb1\x90\x76\xcb\x82\x9e\x0f\xb6\x51\xfb\xf8\x81\x48\xd4\x57\x13\x2d\x48\x7a\xd4\x45\x20\x00\x72\x64\x48\x33\xd6\x1c\x4c\x1c\x54\xfd\x83\x43\xe3\x40\x17\x04\x51\x82\x58\x83\x28\x18\xeb\xa3\x41\xf5\xfa\xa9\x3e\x05\x29\xc6\x00\x1c\xf3\xe9\xf7\x97\x31\xce\x13\x90\x16\x33\x1f\x14\xd7\xa0\x64\x62\x86\x41\x59\x02\x4c\x8a\x15\x6b\xa0\xb2\xa7\x35\xf5\xa7\xa5\xf1\x2f\x2b\xf9\xdb\xb4\x03\x9a\x31\xb1\xdf\xd0\xf5\x25\x06\x51\x03\x0b\x3e\x05\x3a\xed\x86\x10\x3b\x98\xcf\x41\x28\x1d\x1c\x58\xc4\x64\x83\xd9\x0b\xea\x22\xf0\x04\x7f\xfb\x1e\xad\x75\x50\x17\xfd\xb4\x9a\xa1\xf3\xb8\x15\xd8\xf7\x77\xbb\x26\x3d\x16\x40\x7b\xe0\xe1\xf4\xf4\xf4\xd1\xa3\x47\xa3\x75\xf0\x4b\x70\x6f\x1a\x08\xfd\x64\xbd\xb5\xb6\x28\x8a\xf5\x7a\x6d\x8c\xf1\x47\x29\xba\x3e\x03\x57\x3b\x5b\x87\x74\x8e\x1c\x91\x23\x02\x47\xae\x79\xb2\x8f\xfc\x05\xd7\xcd\xb6\xfe\x24\xcf\x8b\xf9\x72\x53\x55\x75\xd5\xec\x4b\x74\xd6\xf9\x71\xa6\xd7\xa8\xda\xb9\x4a\x29\x29\x84\xe4\xbc\xd4\x5a\x26\x99\x35\x5b\x46\x08\xc6\x30\x63\x79\x9e\xce\xf2\x4c\x72\x9e\x09\x99\xa5\x32\x13\x52\x0a\xae\xb5\x39\xb9\x5c\x3b\x72\xd6\xb8\xb3\xf5\x06\x11\x9d\x73\x92\x73\x20\xda\x56\xd5\xa6\xac\x1c\xd1\xad\xc5\xfc\x60\x31\x3f\x56\x3a\x2d\x8a\xf9\x72\xb9\x5c\xed\x2d\x96\xab\xd9\x7c\x99\x17\x45\x9a\x65\x32\x49\xa4\x4c\x44\x92\x48\x21\xb9\x10\x67\x2f\x3e\xf9\xd6\xbf\xfe\x5d\xb3\xbd\xbc\x73\xeb\xe0\x74\x53\x82\xb2\xfe\xc2\x1b\x63\x1c\x22\x38\x02\x6d\x5c\x59\x6b\x6f\xd5\x95\x4a\x9f\x5e\x6c\x09\x40\x70\xb6\xa9\x6a\xeb\x1c\x02\x5a\x47\x95\xd2\x95\x52\x4a\x9b\xaa\xaa\x36\xdb\xca\x28\x45\xce\x01\x00\x67\xcc\x3f\x70\x24\x05\x4f\x13\x99\x65\x69\x96\xa5\x59\x96\x1d\xec\xaf\xee\xdf\xb9\x7d\x78\xb0\x3f\xcb\x52\xa3\xb5\xaa\x6b\xc6\x71\x35\x5f\x9c\x13\x69\xa5\x1c\x20\x81\x4e\x32\x3c\xbd\xdc\x6e\x9e\x7c\x74\xfa\xbf\xff\x2f\xff\xc5\x3f\xff\x1f\x0f\x6e\xdf\xd3\xc6\xcc\x67\xb9\xe0\xcc\x39\x20\xb2\xdd\x05\xe6\xae\xf7\xfc\x77\xe7\x3a\xf0\xc3\x2b\xa7\xed\x1b\x13\x31\xd0\xbc\x57\xba\x77\x4b\x07\xe0\xb7\xd7\x0c\xe3\x0a\xb5\xd3\xaa\x00\x1d\x2b\x24\x24\x20\xb2\x96\x88\x1c\x17\xb2\xaf\xc7\x63\x8d\x39\xa1\xd3\x63\xd8\x9b\xc6\xb9\x7e\x29\x06\x91\xa9\xcb\x43\x8c\x2e\x10\x69\xb4\xe0\xd3\x58\xac\x41\xe2\x58\x50\x5d\x48\x90\x9f\x6b\x3d\x83\xa5\x1b\xa3\x8c\x31\x2f\x2e\x57\x80\x82\x13\x3c\xbb\xaf\x7d\x3e\x83\xf9\xb9\x09\x0d\x00\x48\x29\x17\x8b\x85\x9f\x9d\x8b\x69\xba\x3c\x07\x4c\x02\x9c\x08\xca\x15\x37\x92\xd8\x05\xed\x7c\x90\x32\x00\x8f\x89\xfc\x04\xfe\xb8\x55\x4c\xd7\xe0\x60\xea\x71\xba\xd3\x65\x8f\xb1\xd0\xcf\x61\x06\xe1\xfd\x28\xde\x04\x1f\x4c\x28\xf0\xef\xac\x9a\x16\x08\xf7\xf7\xf7\xa5\x94\x75\x5d\x03\xc0\x9b\x9c\x17\x85\x37\x0f\x84\x88\xb8\xbf\xbf\xff\xfa\xf5\xeb\xd5\x6a\x95\x24\x89\xd6\xda\x18\xe3\x35\x6c\xa7\x02\x62\xf9\xf6\xe4\x4e\xdd\x26\x0d\x02\x68\xd7\x9c\x00\x01\x65\x92\xdc\x3a\x3c\xda\x6e\x2e\xc9\x5a\x6b\x8d\x36\xc6\x31\xaf\x9d\x7b\x0e\xd0\x6a\xed\x8c\x21\x64\xc6\x55\x42\xa4\x56\x6b\xed\xf4\x5a\x95\xb6\x92\x4e\xcd\x6c\x5d\xc1\x6c\x86\x54\xc8\x0c\x19\x82\x14\x7c\x9e\xa7\x17\x9b\xad\x75\x2e\x95\xc2\x11\x01\x51\x59\xd7\xd6\xda\x52\xa9\x4d\x59\x2f\x8a\xdc\x59\x2b\x84\x38\x12\xa2\x36\x9a\x31\xc6\xa5\x48\xd2\xac\x98\xcd\x66\x8b\x45\x96\x17\x42\x48\x21\x05\xe7\x02\x91\xbd\xfc\x87\x1f\xfd\xcd\xef\xff\x0b\xb4\x5a\x26\x89\x73\x94\x4a\xe9\x1c\x29\x63\xb5\x31\x56\x34\x2f\xda\x3b\x20\x07\xf4\xe2\xe4\x22\x4b\x12\x22\xf2\x1b\x44\x01\xc0\x3a\xb7\x29\x95\xb6\x16\x01\x36\x55\x55\x55\xaa\xaa\x95\xaa\x6b\x6b\x2d\x12\x79\x9b\xda\x6f\x97\x95\x89\xcc\xd2\x34\x4d\x93\xa2\xc8\xf7\xf7\x56\xf7\x6e\x1f\xdd\x39\x3c\x98\x17\x79\x22\x04\x03\xa8\x11\x19\x11\x03\xe2\x08\xab\xf9\xbc\xac\xaa\xb2\xae\xb4\x26\xe6\x30\x49\x65\xa9\xf4\xc9\xd9\xe9\x1f\xfd\xab\xff\xed\xbf\xfd\x1f\xfe\x27\x23\x64\x55\xd7\xcb\xf9\xac\xc8\x53\x22\xf0\x73\xd7\x3b\x2c\xec\xa6\x41\x7b\x76\x21\x63\x3c\x49\x33\x55\x95\x8e\xfc\xe6\x1a\xa4\x06\xdd\x76\x55\xd9\xe8\xc7\x66\x6f\xe8\xae\x59\x74\x9e\xa6\xf6\xb1\x07\x78\x44\xd8\x54\x34\x21\xe1\x8e\xb8\xfb\xee\x9c\x51\x35\x17\xcd\x34\x29\x44\x7a\x16\x7a\x0a\x08\xa3\xf1\x16\x5c\x55\x79\x83\x34\x63\x1a\x2d\xfe\x74\xad\x46\x8b\x69\xae\x55\xb2\x63\xc4\x41\xe0\x20\x04\xf6\xd3\xfa\xb4\x28\xdb\xc5\x1a\xfc\x39\x86\xc4\x83\xc5\x9c\x50\x88\x5f\x2c\x4d\x9a\xa6\xf3\xf9\x7c\x30\x27\x01\x7e\xf7\x8b\x10\xc8\x07\xae\x36\x03\x18\xaa\xd6\xb8\xd6\x02\x14\x1c\x94\xc9\x44\x20\x5c\x15\xe9\xa0\x60\xc7\x44\x11\x64\x20\x28\x7b\x9f\x2c\xc0\xbc\x41\x48\xee\x7b\xba\xbf\xde\xd5\x75\x1d\x53\x76\xdc\xfa\xfb\x3c\xfb\x64\x7d\x1d\xde\x77\xdd\xea\xa0\x31\x26\x4d\xd3\xd5\x6a\x05\x00\x27\x27\x27\x47\x47\x47\xd7\x36\xd1\x2f\xd6\x7d\x09\x2f\xd4\xcf\xe7\xf3\xb3\xb3\x33\xbf\x16\xea\x45\x80\xed\x5b\x49\xd0\x0e\x24\xa1\xd7\x1a\xfc\x31\xb5\xe6\xbe\x96\xb6\x4e\xb1\xa9\x7b\x44\xf4\x07\xce\x90\x31\x76\xeb\xde\xbd\x97\xcf\x9f\xd5\x4a\x53\xe5\x94\x71\x52\x00\x6b\x11\x90\xfc\xcb\x09\xc8\x04\x63\x9c\x71\x40\xb2\xce\x29\xa5\xad\x75\x69\xc2\x1c\x03\x55\xc3\x66\xbb\x91\x42\x64\x69\x5a\xe4\xc5\x62\x56\xcc\x8b\x62\x5e\x14\x59\x92\x78\x08\x34\xc6\x68\x6d\x2e\x95\x62\x88\xc6\xda\xcb\xed\x76\x5b\xa9\xaa\xae\x8a\x2c\x2d\xd2\x2c\xcb\x52\xbe\xdd\xa8\x93\x57\xec\xe8\xb6\x4c\x64\x92\xa6\x59\x96\xe7\xc5\x4c\x48\xff\x58\x2f\xfc\xe2\x07\xdf\xf9\xce\x1f\xfc\x4b\xce\x10\x18\xb7\x96\xac\x75\x1c\x99\x76\x1a\x80\x1c\xd1\xb6\x56\xda\xd8\x4a\x1b\xa5\x4d\x59\xeb\x75\x59\x5f\x6e\x6b\x5f\x42\x65\x8c\xd2\x46\x5b\x67\xac\xdd\x96\x95\xd2\xba\xae\x75\x55\xd7\xd6\x18\x22\x62\x88\xcd\x7d\xaa\x9c\x65\x69\x9a\x65\x29\x17\x62\x39\x9f\x1d\x1e\xec\xdf\xbd\x7d\x78\xe7\xf0\xd6\x3c\xcf\x13\xc1\x1b\x11\x00\x80\x23\x6b\x9d\x25\xc7\x00\x92\x24\x65\x0c\x91\x61\xc9\xb0\xac\x2a\x60\xdc\x81\x51\xd6\x3d\xfd\xf8\xc9\xf7\x3f\xf8\xab\x5f\xff\x9d\xff\xd4\x39\xf7\xea\xf4\xbc\x28\xd3\x83\xbd\x25\xe7\x8d\x2d\xe8\x2f\x4f\xb7\xd6\x62\xcf\xe2\xe3\x5c\x24\x69\xc6\x65\x62\xb4\x22\xf2\xa7\xe8\x09\xfc\x52\x22\x41\xeb\xb9\x3a\xca\xc1\x5d\xb7\xde\xa1\x4e\xd7\x4b\x77\xed\xc5\xf7\x9f\x36\xb5\x76\x7b\x0d\xb4\x77\x78\x63\xfb\x32\x94\xb5\x46\xa0\x40\x16\x5e\xd1\x1b\x2b\xbb\x31\x4f\x9f\x7e\x4c\x7f\x4d\xf3\x19\xc4\x98\x6b\x61\x35\x56\xd0\x63\xb1\xfa\x83\xc5\x6b\x99\x04\xb8\x18\x10\x8c\x41\x42\x9c\xc9\x41\x00\x98\x28\x6f\x50\x84\x69\xc5\xfd\x05\xd2\x00\x80\xdf\x20\xda\x97\xc0\x18\x9f\x38\x6e\xe0\xe9\x13\x0f\x0e\x6e\x62\x49\x0e\x56\xe2\x44\x12\x30\x5e\xf5\xd3\x69\xc5\x45\x98\x48\x31\x90\x46\x10\x38\xf8\x69\xec\xa7\x52\x6a\x6c\x42\x08\x00\xfc\xa1\x35\xb8\x6a\xba\x74\xfe\x20\xdd\xfe\x1e\x19\x3f\xd7\x7a\x74\x74\xc4\x18\x2b\xcb\x52\x29\x75\xf3\x1b\x61\xbe\x28\xf7\x25\x00\x21\x22\xde\xba\x75\xeb\xd9\xb3\x67\x52\x4a\x3f\x41\xda\x01\x21\x5e\xdd\x35\x43\x7e\xf2\x73\xf7\xc4\x9f\x8f\x0f\xfe\xc0\x75\x8b\x71\x8c\x71\xbf\xa5\x5e\xac\x0e\x8f\xf2\xd9\xa2\x54\x1a\x88\xd4\x76\xeb\x2f\x3f\x6b\x1f\x63\xf7\x49\x3b\x46\xdc\x01\x20\x02\x63\x5c\x20\x90\xd3\xaa\xb2\x96\x81\xb2\x94\x48\x21\x85\xac\x95\xba\xdc\x6e\x9f\xbf\xc2\xc5\xac\x58\xcc\x8a\x22\xcb\x91\xb1\xfd\xc5\x9c\x21\xd3\xc6\x9c\xaf\x37\x52\xf0\xf3\xcb\x8d\x75\x0e\x91\xea\xda\x9c\x9c\x5f\x30\xc6\xee\xde\xda\x5f\xcc\x66\xf5\xcb\x97\xaf\x67\x8b\xc3\xdb\x77\xb9\xdf\x17\x24\xa5\x4c\x52\x00\x7a\xf2\x83\x6f\x7f\xe7\x0f\xfe\x25\xe7\xcc\x18\x4b\x04\xda\x3a\xa5\x4d\xad\x4d\x6d\x4c\xad\x8d\x36\x56\x37\x1e\xa7\x8c\xf1\x07\xe2\xad\x73\xca\x58\xe7\x48\x69\x5d\x29\x5d\xd7\xca\x39\xab\x95\xae\x95\xb2\xc6\xba\x56\x21\x32\x44\x21\x44\x92\x26\x49\x9a\x64\x69\xba\x98\x17\xf3\xc5\xe2\xed\x7b\x77\xef\xdd\xbe\x35\xcb\x32\xc9\xb9\x57\x54\x08\x84\x08\x08\x30\xcb\x92\x59\x2a\xb7\x65\x95\x70\xa6\x8d\x76\xe4\x38\x17\xda\xd2\xba\x36\x86\x00\x19\x23\x42\x72\xf4\xa3\xbf\xf9\xeb\x5f\xfb\xed\x7f\xea\x87\x6c\x17\xeb\xcd\xb6\x2c\x8f\x6e\xed\x17\x79\x46\x80\x7e\x59\x97\x0b\xee\xb7\x2e\x89\x24\x4d\xd2\x8c\xb7\x57\x7b\x1b\xad\x9a\x03\x12\xbb\x73\x85\xd0\xda\x78\x91\x16\xde\xd9\x94\x08\xdd\xb1\xfd\x1d\xca\x35\x96\xe2\x15\xe4\x83\x9d\xbf\x1b\x25\x77\xf3\xb1\xc6\x18\x21\x59\x77\x4b\x43\x97\xdc\x84\x7e\x1f\xce\xd8\x75\x36\xc4\xae\x7d\x4e\x22\x68\x7f\xc8\xdc\xe7\xd0\x67\x3b\x98\xb7\xc1\x9f\xf1\xa7\x38\xe7\x01\x66\x74\x7f\x63\x5d\x19\xb8\xa0\x2c\x10\xe9\xe8\x3e\x41\x8c\x46\x81\x6e\x8d\x4b\x14\xa8\xd4\xc1\x52\x7c\x1e\x1a\xc6\x98\x7f\x62\xb7\xcb\x4c\x5f\xff\x0e\xa2\xf8\xa0\x82\xee\xe2\x06\xa0\x18\xc8\x2a\x80\xc9\xc1\xb2\x07\x79\x88\xc5\x32\x58\x29\x41\x9b\x19\xc4\xef\xc1\x31\xcd\x44\x43\x1a\x94\x5b\x5c\xfc\x3e\x4d\x3f\xd0\xfb\xb5\xd6\x4a\xa9\x41\xb6\x00\x20\x84\x88\xf7\xc8\xc4\x4c\xbc\xa7\x8f\x82\x7e\xb3\xe8\xe1\xe1\xa1\x7f\x18\xf2\xd5\xab\x57\xf7\xee\xdd\x7b\x33\x2f\x4e\xf4\xdd\x97\x00\x84\xd0\xde\x75\xb4\x5e\xaf\x97\xcb\x65\x9e\xe7\x65\x59\xb6\xcf\x25\x0d\x8d\x77\x00\xc0\xe3\x61\xa3\x02\xb1\xdd\xd2\xcf\x38\xe7\x1e\x05\x7d\x35\xa4\x79\x7e\xef\xed\x47\x75\x5d\x6f\xc1\xe5\xce\x6d\xaa\xca\x92\x43\x62\x00\xe0\x08\x00\xc0\x92\xe3\x12\xad\x85\x76\xb3\x23\x01\x12\x91\x71\x96\xb4\x25\x63\x0d\x67\xba\x48\x13\x64\x5c\x59\x67\xac\xde\x96\x5b\xce\x79\x22\x93\xcb\xf5\xda\x3f\xe7\x8b\x00\x75\xad\x00\x9c\xb1\x5a\x69\xcd\x10\xfd\x2a\xef\xd3\xe3\x57\xf9\xc5\xe5\x62\x3e\x77\xff\xf0\xd3\xed\x7b\xef\x1f\x1c\x1e\x79\x8c\x46\x80\x27\x3f\xfa\xc1\x5f\xfe\x1f\xbf\x9b\x4a\x5e\x2b\xa3\xb4\xa9\xb4\x41\x84\x5a\x5b\x6d\x6d\xad\xf4\xb6\xd6\x65\xad\xfc\x49\x89\x5a\x99\x5a\x1b\x65\x8c\xb5\x4e\xfb\x6b\x62\xea\xda\x18\xab\xb5\xae\x95\x32\xc6\x42\x3b\x1c\xe3\xed\x10\x20\xcb\x92\x2c\x4b\x93\x24\xc9\xb2\xf4\xf0\x60\xff\xc1\x9d\xdb\xb3\x59\x71\xb8\xb7\x9a\x67\x69\x0b\x81\x80\x40\x48\xde\x86\x6e\x64\xba\xc8\x33\x22\xcb\x90\x88\xac\x16\x1c\x00\xfd\x55\xda\x9c\x73\x8e\x48\x80\xe7\xcf\x9f\x5a\x63\xa0\xd5\x29\x4a\x9b\x27\x4f\x5f\xec\x2d\x17\x47\xb7\xf6\xd1\x1f\x77\x61\x32\x9f\x17\x32\x49\x9d\xbb\x3a\xca\x33\xa6\x35\x07\x5b\xf3\x0d\xa2\x4e\xe9\x1d\xc1\xee\x91\xa7\xd6\x02\xec\x76\x9f\xc2\xce\x7c\xf4\x28\xd9\x58\xf4\xde\x3b\xc0\xcc\xd7\x26\xa1\xd5\x0a\x93\xb4\x53\x16\xfd\xd1\x3d\x44\xe8\x15\x6b\x34\xda\xa5\x0b\xd0\x53\x3a\xd7\x8e\xdc\x63\xb6\x70\x55\x1f\x05\x6c\x07\x99\xc0\x88\xc6\x0c\x88\xa7\x3f\x0d\x82\xee\xa7\x52\xa3\x31\xf3\x20\xab\x01\x28\x0e\x66\x20\xd0\xf2\x83\xc8\xf1\x45\xd1\x24\x49\xb2\x58\x2c\xc6\xea\x34\x2e\x60\xbf\x96\xc7\x3c\x31\xf6\xc4\x72\x88\x65\x18\x4b\xbe\x9f\x62\x90\xbd\x58\x62\x41\x01\x63\x09\x8c\x31\x0f\x52\x99\x8e\x38\x28\xde\x18\x05\xfb\x48\x66\xad\xad\xeb\x1a\x46\x1c\x63\xac\xbf\x34\x38\x08\x81\x9d\x9f\xae\x6e\x13\x35\xc6\xcc\xe7\xf3\xe5\x72\x89\x88\xe7\xe7\xe7\x44\x74\x70\x70\x30\x96\xd0\x2f\xcf\x7d\x39\x40\x88\x88\x87\x87\x87\xbf\xf8\xc5\x2f\xaa\xaa\xca\xb2\xcc\x5a\xeb\x8f\x3d\x40\xdb\xd6\x3d\x28\x12\xed\x26\x43\x9b\x17\x61\x59\xf3\xb5\xb9\x6a\xa4\x41\x40\xc9\xb9\x94\x32\x91\x52\x1e\x3d\xbc\xbf\x39\x3f\xbd\x38\x61\x89\x10\x9c\xb3\xaa\xaa\xfc\x16\x1b\xed\x88\x21\x58\x07\x9a\x39\x62\x9d\x99\xe2\xfc\x3f\x44\x00\x42\x67\x1d\x03\xaa\x95\x7f\x6f\x97\x3b\xcb\x14\x11\xe3\x4c\x29\x55\x56\xa5\xe0\x5c\x08\x29\x78\x77\x79\x9b\x2a\x95\x62\x88\xe4\x13\x20\x3a\x5f\x6f\x2e\xb7\xa5\x31\xf6\xc9\x87\x3f\x78\xf0\xb5\xc7\x44\x64\x8d\x39\x7d\xf6\xf1\x9f\xfc\xee\xff\x4c\xd6\x68\x29\x2f\xb6\x95\xb6\x4e\x30\x06\x08\x95\xd6\xb5\x36\xe7\x9b\x72\x53\x2a\x6d\x8c\xb1\xa4\xad\xd5\xc6\x2a\x63\xea\x5a\x6d\xab\xda\x1a\x5b\xd7\xb5\x56\xda\x18\x03\x1e\xc8\xb1\xc1\x3f\x00\x90\x52\xe6\x79\x96\x65\x19\x17\x3c\xcf\xb3\x83\xbd\xd5\xc1\xfe\xde\x72\x3e\x5f\x14\xf9\x3c\xcf\xb2\x44\x3e\xa4\x1d\xce\x00\x00\x20\x00\x49\x44\x41\x54\xb2\x16\xff\x6a\xa5\x04\x67\x40\xb0\x29\xab\x2c\x91\x45\x9a\x20\x90\x2f\x32\xe7\x90\x70\x66\x84\x40\xc4\x2c\x91\xc6\xa2\xaa\x1d\x23\x60\x44\xcc\x91\x56\x75\x92\xe5\xd8\xbe\x7d\x48\x44\xaf\x4e\x4e\x2f\x2e\xd7\x8f\xde\x7e\xeb\xd6\xe1\x11\x36\xa3\x16\x14\x82\x77\x47\x6b\xc9\x59\x47\xee\xea\xa5\xdc\xcd\x2f\xda\x6d\x11\x6d\x17\x08\x7b\x46\x1d\xf9\x87\x9e\x7a\xfd\x98\xfa\x36\x60\xe7\xe8\xca\x7b\x18\xd0\xe3\xd7\x8e\x91\x80\x00\x9c\x35\x7e\xef\x0c\x5c\xd5\x50\x13\xba\xaf\x4f\x03\x43\x3a\x6e\x10\xd2\x62\x8d\xd9\x8f\x12\x10\x4f\x77\x87\x8e\x61\x8c\x40\x31\x34\x06\x0c\xc7\xb2\x31\x91\x4a\xcc\x6a\x10\x05\x27\xa2\x4c\x14\x19\x7a\xea\x35\xce\x5b\xac\x82\x3f\x0f\x0d\xf6\x5e\x16\x1c\xab\xd3\x8e\xc3\xb5\xe0\x37\x56\xe4\xbe\x67\x10\x59\x03\x39\x0c\xb6\xab\x38\x7b\xd7\xba\xb1\xa6\x15\xe4\x61\xb0\x52\x06\x11\x2e\xe6\x1f\xd3\x04\x60\xe6\x71\xab\x2c\x4b\x3f\x29\x1a\xb7\x19\x44\xec\x4e\x6a\x06\x11\x03\x7f\xc7\xcd\xa3\xa0\xd6\x5a\x6b\x2d\xa5\x3c\x3a\x3a\x02\x00\xad\xf5\xf1\xf1\xf1\xbb\xef\xbe\xfb\xe6\xcd\x41\xf8\x0c\x40\xf8\x45\xbd\x82\x21\x84\x38\x3a\x3a\x7a\xfe\xfc\xb9\x10\xc2\x4f\x90\x7a\x2c\xec\xd7\x25\x63\xcc\x5f\x63\xd9\x6a\x4d\x8f\x82\x1c\x59\x73\x9b\xa8\x47\x41\x21\xa4\x4c\x12\xa9\x93\x24\xc9\xb2\x5c\xdd\x7f\xfc\x58\x10\xf9\x27\x6e\x39\xc3\xaa\xaa\x8c\xb1\xc2\xab\x63\x04\xeb\x1c\x02\x19\x72\x00\x8e\x33\x04\x70\xd8\x9e\x8a\x23\x40\x4d\xd4\x5c\x9f\x4d\x54\xd7\x4e\x70\xbf\x06\xc7\x18\x63\x9a\x31\xc6\x54\x63\x86\x22\xb3\x8e\x8c\x35\x1c\x99\x25\xca\xa4\x4c\xa4\xd0\x96\xa4\x10\xd6\xb9\xe3\x8f\x3f\xd6\x75\x65\xb4\xde\xea\xb3\x3f\xfb\x57\xff\x6b\xca\x51\xa6\xb9\x36\x56\x70\x7e\xb6\xd9\x66\x89\xf4\x67\xe4\xcf\x37\xa5\xdf\x23\xba\xa9\x6b\xe7\x9c\xb5\xae\x52\xba\x2c\xeb\xb2\x2c\xeb\x5a\x59\x63\xbc\x10\xbc\x40\x04\x43\x40\xe4\x8c\xa5\x69\x92\xe7\x59\x9a\x26\x89\x4c\x96\xcb\xf9\xfe\xde\xde\x6a\xb1\x38\xd8\x5b\x3a\xeb\x18\x62\x91\x26\xb3\x2c\x65\xed\xcb\x47\x80\x64\x8c\xbd\x5c\x6f\x57\xf3\x5c\x72\x4c\x38\x22\x59\x6c\xd6\x5c\x89\x03\x80\x60\xb9\xe3\xb7\x57\xb3\x0b\x81\x97\x9b\x6d\xb9\x31\xce\x18\xc9\x78\x92\xa6\x42\x26\xfd\x0c\xf8\x2e\x57\x2b\xf5\xe1\x8f\x7f\x72\xfb\xec\xfc\x9d\x77\xde\xf1\x53\x19\xfe\x8e\x56\xdf\x3d\x9a\xdb\xe8\x3b\x73\xd0\x9b\x99\x7e\xe6\xb2\xad\x55\xea\xbd\xdc\x8b\x7e\xd7\x4c\x7b\xce\x9e\xb0\xb1\xd3\x5b\xca\xfe\xdd\xa3\x6d\x9b\xa0\x4e\x0f\xfa\xbc\x35\x28\xd8\x58\x84\x80\x00\xe0\x9c\xe3\x51\x8f\x0d\x06\xd1\x83\xf0\x36\xa8\xa4\x82\xc0\xf8\x67\xe0\x01\x08\x95\xe9\x34\x4d\xcc\x27\xc6\xb9\x41\xb6\xd7\x06\x76\xa9\x0f\x22\xe5\x58\x06\xe2\xe2\x0f\xb2\xed\x7e\x4e\xb3\x0d\xb4\xff\x20\x18\x7c\x36\x1a\x44\xec\xef\x0e\x0d\x44\x31\x28\x93\xc1\x02\x0e\xd2\x0f\x56\x59\x8c\xaf\x34\x64\xd8\xf5\xdd\x20\x24\x4f\x64\xe3\xda\xfc\x8c\x65\x6f\x30\x9f\x71\xba\x41\xce\xfb\x81\x63\x28\x48\x44\x1e\x05\xa9\x67\x46\x53\xcf\xae\xed\x50\x30\x46\xbe\x41\x14\xec\x0c\x41\x7f\xa1\xca\xbd\x7b\xf7\x7c\x4e\x9e\x3f\x7f\x9e\xe7\xb9\x73\xee\x0b\x7c\x68\xe9\xe6\xac\xc4\xa7\x5a\x96\xfc\x62\x5f\xc1\xd8\xdb\xdb\x73\xce\xbd\x7a\xf5\x6a\x7f\x7f\x7f\x3e\x9f\x5f\x5c\x5c\xf8\x39\xe8\x78\x54\x05\xb0\x83\x41\xc6\x18\xe7\xc2\x72\xeb\xaf\x2e\x95\x32\x31\xd2\x98\xd4\x24\x46\x1b\x6d\x8c\xd5\xc5\x62\x79\xf0\xf6\x23\xf8\xc5\xcf\x11\x11\x10\x04\x17\x55\x55\x29\xad\x9c\x23\xe1\x4f\x15\x12\x21\x80\xb2\x46\x5b\xe0\x08\x82\x21\xb6\xe0\x00\x40\x88\xe8\x0c\x69\x74\x86\x20\x15\xdd\x2b\xf7\xbb\xe7\xee\xbd\xbf\x32\x36\x11\x22\x95\x82\x00\x84\x90\xb3\x3c\x13\x42\x30\xc6\x17\x45\x2e\x80\xea\xaa\xd2\x5a\xfd\xf8\xdf\xff\xb1\xd9\x9c\x27\x52\x00\x81\x75\xee\xb2\xac\xb4\x71\x00\xe6\x62\x5b\x6e\x6b\xad\xb4\xd9\xd6\xca\x58\x07\x04\x4a\xdb\xf5\x66\x7b\x79\xb9\x56\xb5\xb2\xce\xb9\x76\x17\x8c\x2f\x37\xe7\x4c\x4a\xe9\xe1\x3e\x4b\x93\x22\xcf\x6f\x1d\xec\xdd\x3e\x3c\x3c\x3a\xd8\x9f\x17\xb9\xe0\xcc\x68\x73\xb1\xde\x4a\xc1\x8b\x34\x61\x00\x48\x80\x7e\x7b\x25\x41\x91\xca\xaa\xac\x9c\x31\x8b\x2c\x45\x24\x04\x07\x8d\x9d\xed\x2f\xad\x33\x4a\x2b\x70\x8e\xac\x29\xb7\x55\x55\xd5\x40\x20\xa4\xb8\xfd\xd6\x23\x21\x04\x5d\x15\x7c\xb7\x4e\xfe\xfc\xf9\xf3\x97\x2f\x5f\xbe\xf3\xce\x3b\x0f\x1e\x3c\xb8\xaa\x7d\x5c\x23\x4a\x88\xd4\x10\x00\xb4\xd6\xfd\x95\x1e\x88\xbd\x6e\xbf\x23\x6c\x69\x9a\x06\x40\xd8\x1c\x96\x80\x76\x39\xb1\x35\x01\x77\xad\xe3\x4a\xd3\x72\xd6\x76\xaf\x79\x40\x64\x54\xf5\xdd\xa7\xa2\x89\x7f\x76\xea\xa0\x3f\x48\x1f\x8b\x15\xd0\x8c\xa9\xe9\xc1\x88\xc1\xa7\x8e\xcf\x18\x0e\x05\x9d\x28\x50\xb2\x31\x42\x0f\xc6\x0a\x28\x07\x23\x0e\xca\x81\x26\x4d\x99\xcf\x4f\xc3\x18\x2b\x8a\xa2\x33\x04\xfb\x52\xdd\x8d\xb1\x46\xf6\xc5\xf4\x85\xd6\x57\xee\x41\x19\x27\x4a\xdd\xb9\xb1\x21\xcb\x20\xf1\xc4\xa7\x38\x3f\x63\xe3\x80\x20\xcf\x01\xc3\x31\xdc\x1d\x84\xe1\x41\xfc\x83\x21\x14\xf4\x27\xfc\xe2\x2c\x79\x14\xec\x37\xc5\xee\x53\xec\xa7\xab\xb6\xa0\xdf\x77\xf3\xf0\xe1\x43\x21\x04\x11\x9d\x9c\x9c\x54\x55\xf5\xd6\x5b\x6f\x4d\xc8\xcd\xbb\xcf\xfc\x0e\xe0\xb4\xfb\x72\xa6\x46\xbd\x43\xc4\x87\x0f\x1f\x6e\x36\x9b\x8b\x8b\x8b\xd5\x6a\xb5\x58\x2c\xfc\xc9\x42\x3f\x2f\xea\xa5\xdf\x5c\x61\x8e\x9d\x63\xc8\x19\x73\x9c\x73\x21\xb8\x73\xc2\x39\x69\x93\x34\xb5\xce\x3a\x6b\x9c\xbf\x6b\xcc\xfa\x4b\xaa\x1d\x3c\x7d\xca\x18\xdb\xca\x52\x0a\x59\x56\x65\xad\x6a\x6b\xac\x25\xbf\x57\x06\x04\x82\x71\x64\x88\x38\x32\x02\x22\x42\xe3\x48\x72\xc6\x10\x9c\x73\x88\x64\xad\xd3\xe0\xda\xb9\x58\x04\x64\xfe\x22\xd3\x06\x0d\x91\x91\x73\x9c\xa1\x94\x09\x01\xa6\x49\x82\xc8\x8c\x75\x67\xeb\x2d\x0a\x49\x44\x2f\x3f\xfa\xfb\xe3\x9f\xfe\x50\x70\x6e\x1c\x69\x63\xb5\xb1\x89\xe4\xa9\x15\xda\x58\x47\x54\xd5\xba\x54\xaa\xd6\xb6\xd6\xa6\x56\x5a\xd5\xf5\x7a\xbd\xa9\xab\xba\x95\x0c\x23\x04\xc6\xb9\x14\x22\x49\x84\x94\xfe\x38\x7e\x92\x66\xd9\x9d\xc3\x83\xfb\x77\x6e\xef\x2f\x17\x79\x9a\x4a\xce\xbc\xe5\xa7\x89\x38\x62\x26\x85\xe4\xac\x99\x14\x05\x44\x22\x00\x48\x38\x5b\x14\x69\xad\x14\x22\xcd\x52\x09\x00\x08\xce\x5b\x84\x8c\x01\x69\x7b\xb9\xd9\x1e\x9f\x5e\x68\xad\xd7\x9b\xad\x35\x4e\x70\x91\xcf\xe6\x77\x1e\xbd\xe3\x17\x38\xa9\xbd\x18\xbd\x83\x43\xdf\x01\xac\xb5\x3f\xfa\xd1\x8f\x3e\xf9\xe4\x93\xaf\x7f\xfd\xeb\x7e\x4e\x9f\x88\xfc\x71\xc6\xce\x8e\x6b\xab\x19\x76\xe7\x1e\xb0\xfd\xbd\xbb\x3c\x06\xa0\x5d\xfb\x6b\xe3\xee\x36\x82\x76\xf8\xe6\x19\xd0\x55\x95\xd8\x7e\xbf\xda\x73\x1a\x00\x1d\xd5\x50\x13\xad\xf1\x53\x11\x04\xfa\x31\xd0\x9e\x83\xaa\x73\x0c\x3f\x02\x86\x71\x72\x71\xc4\x89\xf0\xc1\x9c\xf4\x93\x0b\xb0\x70\x10\x29\x27\x42\x06\x09\xfa\xcc\xfb\x9f\x02\x08\xff\x42\x68\xb2\x2c\x9b\xcd\x66\xbe\x41\x76\x34\xb1\xae\x1f\xac\x82\x98\x6c\x42\xec\x71\xde\xfa\x51\x02\x28\xba\x96\x73\x10\x32\x08\x78\x83\x39\x9f\xa0\x99\x2e\x5a\x3f\x3c\xc6\xc8\xc0\x13\xe0\x9f\xf7\x6c\xb7\x5b\xbf\x34\x13\x34\x54\x00\x60\x8c\xf9\x81\x48\x1c\x37\xe0\x03\x91\x2d\xa8\xb5\x76\xce\xdd\xbf\x7f\xdf\xcf\x2a\x6d\xb7\xdb\x57\xaf\x5e\xdd\xbe\x7d\xfb\xcd\x3c\x46\x3f\xe8\xbe\x4c\x20\x04\x00\x21\xc4\xe3\xc7\x8f\x3f\xfc\xf0\xc3\xcb\xcb\xcb\xe5\x72\x39\x9f\xcf\xd7\xeb\xb5\x7f\xc5\xbe\x3b\x92\xd2\x54\xf9\x4e\x0f\x73\xce\x89\x04\x51\x73\xbf\x8c\x5f\xc1\x72\xed\x52\x9d\x17\x3f\x11\x11\xe3\x5c\xbc\x4c\xd9\xe9\xa9\x94\x42\x48\x91\xd4\xc9\xba\x2c\xad\xd2\x1c\x88\xc8\x21\x00\xc3\xdd\x7e\x45\xe3\x88\x21\x42\xff\xee\x14\x82\x5a\x39\xe1\x57\x2b\x11\xad\x23\x44\x4c\x25\x67\xc8\x18\x43\xce\x45\x9a\x24\xaa\x46\x63\xcc\x7c\x36\xaf\x95\xe6\x9c\x59\x82\x54\xca\x3b\x6f\x3f\x62\x9c\xff\xe4\x5b\x7f\x66\xad\xb3\x80\xc6\xb9\x4a\xe9\x4a\x1b\xbf\xff\xe5\xb2\xac\xfd\xbe\x50\x65\xac\xd2\xc6\x39\xb7\xd9\x94\xeb\xf5\xda\xf9\xb9\x50\x44\xf4\xd7\x9c\x72\x9e\x65\x69\x96\x26\x49\x22\xf3\x3c\xbf\xb5\xb7\x77\x74\x78\x70\x78\xb0\x57\x64\x69\x91\xa6\xac\x53\x03\x44\x1e\xd4\x97\x45\x9a\xa5\x89\x7f\xb1\xbe\x69\x9b\xce\x39\x67\x05\xc7\x59\x26\xf3\x84\x01\x11\x82\x3f\xde\xe7\xef\xe8\xb1\x65\x55\x9d\x9c\x5f\x3e\x3d\x3e\x3d\x5f\x97\xd6\x98\x4a\x1b\xe7\x00\x25\xc7\x2c\xbf\xf7\xf8\xeb\x5e\x0a\xfd\xfd\xd0\x18\xb9\xf5\x7a\xfd\xc1\x07\x1f\x1c\x1e\x1e\xbe\xf7\xde\x7b\x8b\xc5\x02\x88\x80\xae\x5c\xc0\xed\x71\xaa\x37\x8c\x84\xab\x18\xd7\xef\xcc\xd1\x78\xbc\x25\x22\xf2\x08\xb8\x7b\xfe\xb7\x43\x51\x6a\x66\xb5\xd1\x9b\xf2\xbb\x8f\x38\xba\x45\x62\x97\x97\xf1\x6d\x14\x83\x34\x41\xe0\x20\x70\x8e\xf1\x89\xc9\x02\x35\xda\xff\x3b\x18\x17\xc7\xd7\x23\x6f\xa2\x25\x6f\x82\xd3\x83\xc4\x9d\x3a\x1b\x44\xc1\xbe\x70\x06\xe5\xf6\xc5\xd2\x30\xc6\x66\xb3\x99\x9f\x8b\x0b\x44\x3d\x26\xb7\x31\x9a\x31\xd8\x80\xf1\x2a\x98\x90\x73\xdc\x3c\x06\x23\x4e\xc8\x30\x60\x18\xfc\x9c\xa0\x89\x5d\x90\x99\xc1\x9c\x4f\xa0\xa0\x0f\xf7\xeb\x82\xfe\xec\x7c\xbf\xed\x7d\x5a\x14\xf4\x9e\x0e\x05\x95\x52\x1e\x05\xef\xdd\xbb\x97\xe7\x39\x11\x69\xad\x9f\x3d\x7b\x36\x9f\xcf\x17\x8b\xc5\x74\xb9\x7e\xa9\xee\x4b\x06\x42\x00\xc8\xf3\xfc\xf1\xe3\xc7\x3f\xfe\xf1\x8f\x2f\x2f\x2f\x17\x8b\x85\xc7\x42\xad\x35\xb4\xc7\x33\x79\x7b\x06\x00\xae\x42\xa1\x37\x6b\xa0\xaf\x4f\x00\xb1\x79\x2f\x81\x31\xe4\x9c\x33\xc6\xb9\x2c\x8a\xed\xd9\x59\xba\x59\x57\xe5\x96\xb8\x2c\xac\x75\x56\x23\xc0\xa6\xaa\x13\x72\x88\x4d\x55\xb1\xf6\xa9\x58\x68\x16\xb1\x9a\x65\x36\xe3\xfc\xb4\x00\x00\x81\x71\xe0\xac\xe1\xde\x48\x44\xd8\x6e\x01\x11\x85\x4c\x36\xdb\x6d\x96\xe7\x79\x9a\x2f\x96\x8b\x6f\xfc\xf6\xef\xbc\xf7\x6b\xbf\x71\xfa\xec\xc9\xe5\xf1\x33\xce\x85\x23\xd0\xd6\xd6\xda\x28\xad\xb7\xb5\x2e\x95\xb9\xdc\x56\xb5\x36\x8e\x80\x08\x94\x31\x9b\x4d\x59\x56\x95\x36\x06\x89\xb8\xbf\xd5\x53\x88\xd9\xbc\x28\xf2\x4c\x4a\xb9\x5a\x2e\x6e\x1d\xec\xdf\xbf\x7d\xb4\x5a\xce\x8b\x34\x15\x8c\x35\xf7\x8b\x61\x63\xf0\x59\x6b\x05\x67\x45\x9a\x80\xc7\xf5\x66\x8e\x91\x80\x68\x5b\x97\xdb\xb2\x9a\x17\x59\x91\x08\x8e\x44\x40\xd6\xdf\xcd\xea\xac\x31\xa6\x2c\xab\x8b\xf5\xf6\xec\x72\x73\xb1\xde\x96\x55\x4d\x04\x9c\x73\x91\xc8\xbc\x98\x2d\x0f\x6f\xef\xdf\xbe\xe3\x07\x1e\x13\x15\x47\xed\x02\xe1\xf1\xf1\xf1\xab\x57\xaf\xee\xde\xbd\x7b\xff\xee\x6d\xc9\xaf\x3e\x42\x06\xd0\xbe\xeb\xeb\xab\xa8\x1f\xbb\x8f\x5e\x6d\x15\x36\xbb\x46\xfd\xa5\xa6\xfd\x63\x85\xcd\xc6\xd7\xde\x24\x69\x9f\x1d\x41\x53\x74\x1f\x09\x3d\xda\x06\xbd\xbd\xaf\x80\x82\x4f\xd7\xd2\x4c\x6b\xa2\xbe\x6e\xed\x47\x8f\x63\xc5\xda\x7f\x50\xaf\x05\x64\x31\x42\x74\xe1\x63\xda\xff\x86\x48\xdc\x91\x8d\xc1\x43\x5c\x84\x18\xa8\x62\x79\x7e\xb1\x34\xd4\x2e\x3f\xfb\x5b\xa8\x3a\x8d\x1c\x08\x79\x50\x62\x37\xf4\x04\x45\x9b\x1e\xe5\x8c\x49\x23\xce\xc6\x60\xc4\x78\xb0\x05\x23\x0d\xe6\x26\x79\x86\xa8\x0d\xc7\xfe\x20\xf0\xda\xbf\xce\xb9\xce\x16\x8c\xf9\x7f\x36\x14\xf4\x8b\x82\x7e\x46\xd4\xa3\x20\x00\x58\x6b\x3f\xf9\xe4\x13\xce\xf9\x9b\x3f\x41\x1f\xb8\x2f\x1f\x08\x01\x60\xb5\x5a\x1d\x1d\x1d\xbd\x7c\xf9\x12\x11\xe7\xf3\xb9\xc7\x42\xbf\x5b\xd7\x1b\xcb\x9c\x73\xf4\x38\x08\x0c\x9a\x8b\x93\x3a\xe7\xe7\x29\x9b\xd3\x14\xbc\xd9\x43\x23\x85\x90\x42\x26\x52\x26\x49\x92\x24\x59\x56\x6e\x37\xf9\x76\xcb\x4f\xcf\x55\x55\x02\x11\x43\x2a\xea\xda\x39\xc7\x18\x36\xe8\xe0\x9c\x7f\x83\x90\x88\x18\x22\x00\x68\x6b\xad\x23\xc1\x9a\xc6\xe7\x88\xac\x73\x82\x31\x64\xcc\x11\x14\x69\xc2\x19\x13\x42\x70\x21\x84\xcc\x0e\x0f\x0f\xef\x3d\xfa\xda\xa3\x6f\xfc\xca\xe1\xdd\xfb\x42\xca\x8f\x7e\xf2\x77\xce\x3a\x02\xab\xad\xd3\xd6\x6d\x6b\x75\xb6\xde\xd6\xda\xd4\xda\x38\x22\xdb\xdc\x94\x4a\xd6\xda\x5a\x29\x55\xd7\x40\xe4\x0b\x22\x13\x99\x66\x69\x51\x14\x87\x07\x7b\x0f\xef\xdf\xdd\x5f\xae\x0e\x56\x8b\x3c\x4b\xfd\x26\x5a\x04\x40\xa4\xf6\xba\x6a\xf0\x87\xfc\x04\x63\xab\x79\xe1\x6d\x41\x68\x37\xc2\xd4\x5a\xfb\x53\xf4\x55\x5d\x0b\xa4\x44\x30\x63\xed\xb6\xaa\xaa\x5a\xad\xb7\xe5\xe5\x66\x6b\x8d\x29\x2b\x75\xb9\x29\x6b\x6d\x90\x71\x21\x78\x92\xa4\xc5\x7c\x9e\xcf\xe7\xff\xf8\xb7\xfe\x63\xc6\x39\x36\xa7\x3f\xae\x00\x9b\x97\xb8\xf7\x37\x62\x71\xce\xff\x7d\xfa\xf4\xe9\xd3\xa7\x4f\x8f\x6e\x1d\x3c\xb8\x7f\x37\xcf\xb2\xc0\xe2\xa3\xc6\xba\xf3\x06\x78\xa7\x20\x00\xba\xc3\x83\xfd\xd1\x7a\x1f\x20\xbd\x87\x00\xba\xf2\xb5\x87\xe8\x5b\x7e\x3d\x92\xf6\xe7\x98\x5e\xfb\x3c\x9e\x58\x71\x0f\x7a\x26\xd4\x1f\xf4\x54\xd8\x04\xce\x05\x9e\x41\x48\x8b\xb3\x34\x98\x8d\x7e\x65\x05\x80\x17\x90\xc5\x79\x08\x50\xf6\x5a\x9a\x0e\x99\xe2\xf2\x7e\x66\x1a\x63\x8c\xdf\xa9\x21\x84\x48\x92\xc4\x5f\xf7\xec\x5f\xaa\xeb\xf3\xf9\x9c\x2e\x16\xc2\x20\x54\x43\xaf\xfa\xfa\xd1\x6f\x82\xb5\x7d\x89\xc5\xd5\x3a\x86\x01\x13\x65\x9c\x40\xc1\x69\x5c\x9c\xc0\xbf\xae\x47\x6f\x36\x9b\xe0\x95\xa5\x2e\x33\x42\x88\x2c\xcb\x3a\x56\x37\x47\x41\xbf\x47\x94\x88\xee\xdf\xbf\xef\x39\x78\x14\xd4\x5a\xbf\xf5\xd6\x5b\x5f\xca\x4e\xd1\xbe\xfb\x4a\x00\x21\x00\xac\x56\x2b\x6b\xed\xeb\xd7\xaf\x01\x60\xb1\x58\xf8\xf5\xc2\xee\xe4\x0a\x11\x71\xde\xdc\xa0\xc2\x88\xb7\x96\x1f\x32\xd6\x3c\x50\xc7\x39\x17\x5c\x08\x29\x65\x92\xc8\x24\x4d\xd2\x2c\xcd\xd2\x2c\xcf\xcb\xa2\xc8\x8b\x79\x31\x5f\x6c\xd7\x97\xe5\x66\x93\x2d\x57\xaa\xae\xac\xd2\x4e\xa9\xa2\xaa\x25\x67\xe0\x9c\xb1\xc6\x39\x57\x6b\x5d\x2b\xad\x8d\xf1\x08\x47\x40\xd6\xba\xda\x98\x84\x73\x6f\x35\x1a\xeb\x8c\x73\x8b\x3c\x67\x9c\x09\x91\x24\x59\x9a\xcf\x66\xf9\x7c\xbe\xd8\x3b\x58\x1d\xdd\x5e\xed\x1f\x64\x45\x91\x24\x99\x4c\x12\x00\x38\x79\xf6\x84\x5b\x43\x44\xda\x52\xa5\x4d\xa5\xb4\x23\x6a\x54\x34\x20\x22\x18\x63\xcb\x4a\x95\xdb\x4a\x55\x35\x10\x71\xc6\x18\x62\x92\xc8\xc5\x62\x9e\x65\xd9\x9d\xdb\x87\xef\xbc\xfd\x70\x7f\xb9\x28\xd2\x34\x95\x82\x37\x53\x7f\xd0\x4c\x7b\x36\x6b\x68\xe4\xac\x45\x22\x63\xcc\x66\xb3\x5d\x16\x19\xec\xba\x86\xd3\x5a\x6f\xaa\x92\x21\x24\x9c\x23\x12\x81\xe3\x48\x48\xae\xae\xaa\xb2\x2c\xcf\x2e\x36\x27\x97\x6b\xb2\x4e\x34\x92\x93\x69\x9e\xa7\x79\x9e\x64\xd9\xc1\xdd\x07\x07\x77\xef\x62\x73\x82\x85\x31\x36\xb0\x53\xa0\x1b\x83\xf8\x5b\x81\x7c\xa0\x1f\x4c\x3c\x7f\x79\xfc\xe2\xf8\xd5\xe1\xc1\xfe\x83\xfb\xf7\xe6\xf3\x59\x2f\x4a\xe3\xf1\xa6\x5a\x8f\x5b\x77\xbe\x82\xb0\xb3\x0c\x76\x5f\x3c\x2e\x0e\x82\x10\x75\xf3\xa2\xed\x74\x2c\xf9\x53\x18\x40\xe0\x9f\xd2\x9a\x56\x67\x70\x03\x95\x07\xe3\xca\x28\xc6\xb3\xce\x33\x48\x3f\x08\xab\x01\xd8\xc4\xc4\x10\x69\xc9\x09\x88\x8a\x89\x27\x98\x04\xfe\x20\xe4\x26\xb9\xea\x10\xab\x2f\xc3\x2f\x84\x86\x88\xb6\xdb\xed\xf1\xf1\xb1\x7f\x9d\x2e\xb8\xb8\xcb\x4f\xb2\xf9\x89\xa2\x80\x4f\x47\x03\x91\x9c\x63\x9a\x4f\x2b\xc0\xb8\xa9\xc0\x55\xb0\xe9\xa7\x35\x98\x8d\x41\x0f\x5c\x6d\x4b\x83\x35\x35\xd6\x1e\x06\xe1\x2d\x70\x31\x1c\x0e\xe2\x9f\xf7\x58\x6b\xb7\xdb\xad\x9f\xe9\x89\xf9\x48\x29\xfd\xbc\x74\xcc\xe1\x26\x28\x08\x00\x0f\x1e\x3c\x48\xd3\xd4\x7f\x7d\xf6\xec\x59\x55\x55\x77\xef\xde\x7d\x93\x0f\xf0\x8e\xb9\xaf\x0a\x10\x02\xc0\xfe\xfe\x3e\x11\x9d\x9c\x9c\x40\x8b\x85\x9b\xcd\xa6\xae\x6b\xe7\x5c\x2b\x29\xee\x2f\x8a\x21\xce\x91\x21\x73\xe4\x18\x67\x5c\x08\x69\xad\x91\xd2\xa4\x56\x6b\x63\x74\x96\x17\xaa\xae\x55\x5d\xd5\xfe\x5f\x55\x56\xa5\xff\xb7\xad\xcb\x6d\x55\x96\x75\x55\x2a\x55\x6b\xa5\xad\x35\x60\x1d\x39\x0b\xd6\xf9\x27\x70\xb5\x36\x59\x22\x11\x9b\xdb\xa3\x11\x11\x39\xe3\x5c\x30\xce\x85\x6f\x05\x79\x2e\xd3\x2c\x4d\xb3\x34\xcf\x93\x34\x4b\x92\x44\x26\xa9\x4c\x12\x21\xa5\x10\x92\x71\xce\x90\x69\x5d\xeb\xaa\x44\x24\x6b\xa9\x36\x6e\x5b\xab\xaa\x36\xd6\x92\x36\xb6\xd6\xa6\xd2\x46\x69\x5b\x2b\xb3\x2d\xab\xf5\xb6\x34\xc6\x20\x00\x43\x14\x82\xe7\x79\x9e\xe7\xd9\x3b\x8f\xde\xfa\xc6\xe3\xaf\xe5\x69\xba\xde\x6c\x0d\xd3\xb3\x44\x7a\x5b\x08\xa1\x59\x46\x43\x04\x04\x70\xce\xd5\x55\x4d\xce\x4a\xc1\x88\x6c\xa5\xea\x2c\x91\xac\x39\xb3\x40\x8b\x5c\x1a\xa3\x2a\xad\x8c\x65\xa8\xdd\x76\xab\xab\xaa\xbe\xd8\x6c\xcf\x2e\xb7\xc7\x67\x97\xdb\xaa\x56\xc6\x09\xc1\x13\x21\xfd\xe3\x50\x5c\x26\x28\x24\x71\x79\xef\xf1\x7b\xc8\x38\x6b\x2f\x2c\xf0\x7d\xc3\x4f\x49\x01\x00\x62\x63\x40\x43\xdb\x21\x3b\x7f\xe7\x9c\x73\x2f\x8e\x5f\xbd\x38\x7e\x95\x67\xe9\x83\xfb\x77\xef\xdd\xbd\xeb\x8f\x1c\x76\xdd\xb1\x3d\x68\xef\x59\x34\xf7\xc2\x34\xbf\x3b\x12\x80\x76\x7e\xb4\x33\x2d\xbb\xd7\x9b\x9a\xc1\x40\xb0\x2b\xa7\x7f\x62\x91\xf1\x2b\x4f\x7a\xc5\xda\x0a\x22\x15\x73\x13\x9a\x98\xe0\xda\xaf\x71\x78\x5f\x89\x4c\xf3\x89\x23\x8e\x01\xc9\x0d\x53\x0f\xca\x18\xeb\xcd\x00\x65\x83\x74\xfb\xae\x4f\x13\xab\xda\xcf\x4c\x53\x55\xd5\xf1\xf1\xf1\xf3\xe7\xcf\x01\xe0\xe8\xe8\xa8\x28\x0a\xbf\x3d\x2d\xd0\xfe\x71\x41\xe8\xd3\x18\x9d\x81\xac\x62\x14\x8c\xeb\x85\x6e\x60\xc0\x8d\x7d\xed\x0f\x2c\xba\xec\x4d\xa4\x05\x43\xad\x31\x18\x78\x8d\xc9\x73\xec\x53\x80\x94\x7d\xc4\xea\x7e\x1a\x63\xb6\xdb\x6d\x20\xc0\x8e\x26\xcf\x73\x7f\x77\xcc\x20\x0a\x06\x81\xfd\x23\xf3\x7e\x5d\x50\x4a\x79\xf7\xee\x5d\xff\x1e\x08\x11\x3d\x7d\xfa\x74\xbd\x5e\xbf\xf3\xce\x3b\x5f\xba\x2d\xe8\xdd\x57\x08\x08\x11\xd1\xef\x3f\x3c\x39\x39\x71\xce\x2d\x97\xcb\xd9\x6c\x56\x96\xa5\xb7\x0b\xbd\xf8\xfc\x75\x76\x1e\xa0\x80\x01\x07\x22\x12\xe4\x88\x64\x27\x76\x6b\xad\xb1\xfe\xdd\x7a\xa5\xfc\x5f\xa5\x6a\xad\x94\xaa\x6b\xa5\x6a\x55\xd7\x5a\xd5\xfe\x93\xd1\xda\x36\xd3\xa1\xce\x3f\x6a\xd1\xaa\xd6\xd6\x1c\xf2\xa7\x06\x19\xf7\x53\xa0\xde\xec\xf4\xf7\x68\x0b\x29\xa5\x4c\xa4\x90\xdc\xdf\x26\xca\xbc\x91\x46\xd6\x3a\x50\x80\x40\xda\x18\x4b\x68\xac\xdb\x94\xf5\xba\x54\xc8\x70\x5b\xeb\x4d\x55\x57\xca\x28\xdd\x4c\x97\x5b\xad\x7d\xc1\xfd\xb4\xfb\x6c\x96\xdf\x3e\xbc\xf5\xf5\x77\x1e\xed\x2f\xe6\x08\xa0\x6b\xa1\x95\xc6\xc2\x31\x64\xde\x32\x42\xa0\x4d\x59\xa5\x52\x48\xce\x38\xd2\xa2\x48\x32\xc9\x6a\xad\xad\xb5\xc6\x90\xe3\xc0\x38\xc3\xf6\x2a\x9e\x45\x9e\x58\xa7\xc9\x99\x8b\x8b\xfa\x7c\xbd\x79\x79\x7a\x61\xad\x2d\xcb\x5a\x19\xcb\x18\x2f\x32\x29\x65\x92\xe5\x79\x9a\xe7\x22\x49\x0c\x01\x21\xbb\xf7\xe8\x51\x3e\x2b\x98\xbf\xb6\x8e\x33\xce\x39\xb5\xb3\x25\x9d\xb6\xc2\x76\x43\x6f\x07\x84\x3e\xa4\x03\x42\x68\xf1\x72\x5b\x56\xdf\xfe\xee\xf7\xff\xfa\x83\x6f\xbf\xff\xde\xbb\xef\x3e\x7e\xa7\xdb\xe3\x40\xb4\xbb\x14\x0d\x5a\xbc\x03\xf0\x48\xb7\xdb\x11\x03\xd0\x01\x22\x34\xe7\x0d\x5b\x10\xbd\xaa\x3b\x20\xd0\xe7\x0c\x19\xbb\x7a\xe3\xe8\x4d\xb0\xea\x86\x21\x7d\xc5\x3a\xe6\x19\x8b\x05\x43\xf8\x17\x73\xfe\xb4\x9f\x06\x71\xb1\xaf\x67\x63\x04\x1d\xf3\x50\x64\x27\xf5\x95\x6f\x40\x36\x86\x73\x9f\x81\xa6\xae\xeb\x97\x2f\x5f\x3e\x7d\xfa\xf4\xec\xec\x2c\xcf\xf3\xdb\xb7\x6f\xcf\x66\x33\x29\x65\xbb\xd8\xc1\xbb\x9b\xa7\xfa\xf9\x09\xf2\xdc\xe5\x36\x08\x09\xca\x15\x14\x7c\x50\xb0\xf1\xa7\xe9\x44\x27\xd2\x1a\x94\xfc\x58\x63\x8b\x01\x32\x06\xe9\x09\x9c\xeb\xbb\x3e\xab\x00\xa5\xe0\x2a\x8c\x79\x8f\x52\xaa\x2c\xcb\xc1\x24\x18\x63\x79\x9e\x77\xfb\xe6\x82\x88\x81\x1f\x00\xfa\xba\x58\x29\xa5\x94\x2a\x8a\xe2\xce\x9d\x3b\x1e\xf3\xfc\x32\xca\xe5\xe5\xe5\xdb\x6f\xbf\x7d\x78\x78\xf8\x05\x9e\x1a\xfc\x3c\xee\x2b\x04\x84\xd0\x62\x21\x22\xbe\x7e\xfd\xfa\xec\xec\x6c\xb5\x5a\xf9\x61\x88\x1f\xa7\x78\x29\xfb\x8e\xd1\xf6\x08\x06\x00\x28\x1a\x6d\x4a\xae\x1b\x8b\x34\x55\x61\x8c\xf6\xab\xb4\xd6\x68\x6d\x8c\x35\xda\x68\x6d\x8c\xb6\xba\x79\xde\xde\xf9\x7f\xe4\xdf\xf2\xeb\x6f\xbd\xd9\x59\x39\xc0\xfc\xa1\x0d\xc6\x9b\xeb\x6c\x9a\x95\x48\xce\x39\xe3\x1c\x19\x43\x40\x9f\xa2\x36\xda\xb9\x1a\x19\x63\x49\x6e\x2e\x4f\x1d\x30\x6b\xac\xd1\xda\x3a\x6b\x0c\x95\x4a\xd7\xda\x6a\x63\x95\xd6\x55\x59\x6d\x37\x5b\x22\xf2\x80\x9b\xa6\x49\x31\xcb\xe7\x8b\xc5\xe3\xaf\xbd\xcd\x00\xad\x31\xe0\x88\x23\x24\x89\x64\x88\x8c\xfc\x5b\xb6\xe0\x9c\xad\x55\xb5\xad\xac\x64\x3c\x4d\x44\x26\x85\xd2\xb5\xb5\x56\x30\x36\x4b\xa5\x32\x7a\x5d\x9a\x79\x96\x70\x06\xd6\x39\xa5\x94\xd3\x7a\x53\x55\x67\x17\x9b\xf3\xf5\xf6\x74\xbd\xf5\x0f\xed\x3a\x60\x69\x9a\x48\x99\xc8\x24\x49\xf3\x42\xa6\xa9\x94\x09\xe3\x5c\x14\xf9\x72\x6f\x1f\x91\xf9\x21\xb8\x57\x3d\x7d\x2d\xdf\x01\x9e\x0f\x09\x20\xb0\x7b\x5a\xac\xff\x69\xb1\x58\x68\xad\xbf\xfb\xbd\x1f\x7c\xf3\xaf\x3f\x78\xe7\x6b\x8f\xbe\xf1\x8d\xf7\xef\xde\xb9\x8d\xd8\xdf\x48\xea\x45\xdd\xdf\xf3\xd4\xff\xff\x9d\xd1\x87\xb8\xdb\x3b\xd3\x55\x10\x40\xf7\x08\xc9\xee\x3f\xde\x6e\xc2\x0e\xd4\x4d\x3c\x2a\xff\x0c\x34\x13\xc8\x17\x7b\x20\x52\x64\x13\x34\x13\xaa\x79\x30\x56\xcc\xf6\x26\xf9\xe9\x72\x1e\x20\xdc\x04\x7c\xc6\x2e\x28\x4b\x60\x6d\xdc\x9c\xa6\x2c\xcb\x17\x2f\x5e\x3c\x7d\xfa\xf4\xf4\xf4\xd4\x39\xb7\x58\x2c\x1e\x3c\x78\x50\x14\x45\x92\x24\xbc\xe7\xda\xf1\x28\x1b\xcc\x73\xc0\x3f\xc0\x8f\x18\x21\x02\x71\xc5\x81\x83\x50\x1a\xa7\x3b\x36\xb8\x09\x64\xd8\x4f\x22\x46\xb5\x89\xa4\x07\x29\x07\xcb\xd5\x2f\xfb\x20\xce\x05\x79\x8e\x61\xac\xaa\x2a\x3f\x75\x19\x97\xce\x2f\x0a\x76\x39\xbc\x16\x08\xa9\x9d\xbb\xd6\xad\xdb\xdf\xdf\xef\x4e\x58\x39\xe7\x3e\xf9\xe4\x93\xf5\x7a\xfd\xf0\xe1\xc3\x3b\x77\xee\xc4\x55\xf3\x65\xb9\xaf\x16\x10\x02\x00\x22\xee\xef\xef\x33\xc6\x8e\x8f\x8f\x4f\x4f\x4f\xf7\xf6\xf6\x7c\xaf\x58\xaf\xd7\x7e\x27\x8b\x37\xae\x7d\xc7\x80\xa6\xa1\x20\x20\x30\x64\xfd\x8d\x1d\x44\x04\xe4\x7c\xad\x78\x60\xf4\xd0\xe8\xfc\xff\x8c\xb1\xce\x76\xa0\xe9\x9c\x6b\xeb\xb6\x77\x6a\x7b\x77\xd7\x33\x75\xa8\xd8\xbc\x73\xd1\x8c\x4f\x19\x00\x10\x90\xb3\xce\x5a\xad\x95\xb2\xce\xfa\x14\x57\x77\x1f\xbe\x3c\x7d\xe5\xc0\x39\x6b\x25\x47\x81\x50\x19\xa3\xb5\x31\xc6\x68\xa5\xca\x6d\x59\x6e\x4b\x6b\x2d\x01\x10\x80\xbf\x5b\x67\x7f\xb5\x7a\xf7\x6b\x6f\x2f\xf2\xc2\x59\x5b\x55\x35\x47\x4c\x38\x2b\x92\x84\x91\x33\xc6\x48\xce\x10\x81\x23\xed\xcd\x32\xe3\x9f\x04\x73\xc6\x39\x70\xd6\x10\x91\x32\x86\x29\x42\xa0\xb2\xda\xaa\xba\x2c\xab\xba\x52\x8a\xac\xdb\x56\xf5\xb6\x52\xeb\x6d\x55\x6b\x4d\x80\x42\x08\x44\x66\x1d\xc9\x34\xcb\xf3\x3c\x49\x33\x2e\xa5\x76\x0e\x1d\x21\xb3\x59\x96\x72\x6f\xf7\x72\xc1\x05\xf7\x4b\xaf\x9d\xc6\xec\x4e\xd3\xfb\x10\x3f\xd2\xe8\x3e\xf5\x81\x90\x31\xe6\x65\x8e\xed\x15\xea\xf7\xee\xdd\x2b\xcb\xf2\xe7\x4f\x3e\xfe\xe1\x87\x3f\xda\xdb\x5b\x7d\xfd\xdd\x77\xbf\xfe\xde\xbb\xab\xd5\x72\xa7\x25\xa1\x9b\xe8\xdc\xd9\x89\x80\x08\xdd\x89\xc3\x66\x43\x6c\x8b\x7c\x41\xb4\xf6\x07\x01\x71\x26\x18\xdb\xad\x1e\x51\x34\xc4\x86\x21\x1d\xfd\x39\x69\x02\x05\xd7\xd7\x8c\xb1\x1a\x0d\x54\x6a\x5f\xb9\xf7\xa3\xc7\x38\x34\x8d\x76\x30\xa4\x34\x07\x21\x7c\x8c\xf3\x60\xe9\xe2\xa4\xfb\x1e\x68\xc7\x8b\xd3\x08\xd4\xa7\x21\xa2\xcb\xcb\xcb\x67\xcf\x9e\x3d\x7d\xfa\xd4\xdf\x2d\xe9\x1f\xd1\x3d\x38\x38\xf0\xa3\x5e\xef\xf8\x88\xc3\xf6\x48\x4f\x5c\x2e\x8c\x76\xf9\x4f\x0c\x56\x06\xcb\x05\x51\x7d\xf5\xab\xb8\x3f\x80\xa0\xab\xf6\x56\x80\x9a\xb1\x04\x06\x23\x06\x5f\xfb\xc5\x19\xa4\x89\xfd\x83\x40\x3b\x06\x7e\xfd\xbf\x9d\xc7\x1f\x93\x88\xb7\xc6\x78\x97\x65\xd9\xe0\x25\xa2\x63\x9e\xce\x16\xf4\x10\xe8\x9c\xbb\x7b\xf7\xae\x3f\xf4\x09\x00\xc6\x98\x27\x4f\x9e\x94\x65\xf9\xf0\xe1\xc3\xee\x42\x99\xaf\x88\xfb\xca\x01\x21\x00\x20\xe2\xde\xde\x9e\x10\xe2\xc5\x8b\x17\x27\x27\x27\xab\xd5\x2a\xcb\xb2\xd5\x6a\xb5\xd9\x6c\xaa\xaa\xb2\xd6\xfa\x77\x1d\xfa\x83\xc4\x58\xe9\x30\xc6\x10\x39\x00\xca\xa6\x92\x1c\xf8\xd7\x7d\x1d\xf9\xf7\xee\x9d\xff\xd1\x5e\xa4\xd9\xd1\x40\x33\xd3\x46\xed\xb1\xee\xde\x64\x5d\x03\x8c\x7e\x2b\x06\x36\x15\x6f\x8c\xd1\x9a\xc8\x81\xef\x87\xce\x59\xa3\xf7\xdf\x7a\xe7\xd5\xcf\xfe\xce\x94\x25\x38\x87\x44\xcc\xdb\xab\xd6\x54\x55\xbd\x5e\x6f\x7d\x29\x00\x80\x23\x32\x2e\xb2\x3c\x9b\xcd\x8b\xf7\x1e\x3f\xba\x7f\x74\xb8\x9a\xe5\x5a\xa9\x79\x96\xb6\x86\xa0\xb3\xce\x6e\xab\x32\x93\x3c\x95\x1c\x11\x25\x03\xc1\x18\x08\x69\x9d\x65\x08\x8b\x22\xb1\xd6\x96\x55\x5d\x6e\xb7\xd6\xda\x8b\xcd\x76\x53\x56\x65\xa5\x81\x48\x69\x5d\xd6\x4a\x69\x0b\xd0\xcc\x75\x0a\x21\x45\x92\x64\x8c\x49\x99\x30\x99\xa4\x79\x86\x8c\x33\x47\xc6\x59\x40\x96\xe5\xb9\xb7\x0e\xa5\xbf\xc6\x46\x0a\xc6\x76\x6f\x26\x77\xce\xf7\x52\x2f\xf9\x3e\xf8\x75\x7d\x00\xdb\x6b\x68\xba\x40\x3f\x6e\xc8\xf3\x7c\xb3\xd9\xbc\x7e\xfd\xfa\x9b\xdf\xfa\xe0\x9b\xdf\xfa\xe0\xd6\xad\x83\xf7\x1e\xbf\xf3\xee\xe3\xc7\xfb\xfb\x7b\x40\xed\x69\x15\x6a\x77\x02\xb5\x6a\xa1\x91\x7c\xb3\xb7\x74\x77\x37\x0d\x41\x07\x89\x3b\xbc\x44\x64\x32\x49\xe1\x66\xb3\x5e\x9f\x99\x66\x42\xf3\x5e\x4b\x3c\xc8\xb6\xff\x29\xc0\xd4\x20\x7a\x80\x9a\x5d\xea\x41\x72\x71\x89\x06\x21\x61\x10\x24\x26\xe0\x33\xce\x61\x90\x81\x09\x1a\xe7\xdc\xf1\xf1\xf1\xb3\x67\xcf\x9e\x3f\x7f\xbe\xd9\x6c\x7c\x41\xfc\x13\x74\xfe\x69\x52\x0f\x7e\x7d\x08\xf4\x7d\xdc\xbf\xe3\xb2\xbb\xc8\x22\xea\xf2\x31\xe6\xc5\x03\x91\x89\x02\x4e\x7f\x1a\xac\xe2\xc0\x13\x54\xcd\xe0\xb0\x60\xd0\xc5\x95\x3b\x98\x87\x41\x08\x04\x08\x61\x6f\x30\x70\x0c\xff\xbc\xc7\x18\x53\x55\x95\x1b\x7a\x59\x89\x73\x9e\x65\x19\x8b\x9e\x55\xea\x7e\x06\x21\xdd\x34\x5c\xb7\x35\x46\x4a\xf9\xe0\xc1\x03\x6f\xb7\x00\x40\x5d\xd7\x4f\x9e\x3c\x51\x4a\xbd\xfd\xf6\xdb\x77\xee\xdc\xf9\x4a\xa1\x20\x7c\x35\x81\xd0\xbb\xf9\x7c\x2e\x84\x78\xf6\xec\xd9\xd9\xd9\xd9\x6c\x36\x9b\xcf\xe7\xb3\xd9\x4c\x29\xe5\xb7\xf6\x3a\xe7\xa4\x94\x7e\xc9\x90\x45\xc7\xdd\xda\x16\x86\x00\xd4\x0e\x21\x19\x00\xb4\x0b\x47\x4d\x3b\x21\x6a\x4e\xe0\xc3\x0e\x00\x89\x9a\xbb\x2b\xa9\xbd\xcc\x0b\xa0\xb1\x4f\xda\x56\xdb\x1e\xfd\xf6\x76\xa0\x06\x74\xd6\x02\x22\x39\x72\xd6\x1a\x63\xac\x31\xc0\x70\xef\xbd\x5f\x3d\xfe\xfe\x07\x0c\x9a\x57\x70\x19\x39\xab\xcd\x66\xbd\xae\xca\xda\x3a\x07\x00\x8c\x31\x21\xc4\x72\xb9\x58\xad\x16\xef\xbf\xfb\xb5\x77\xdf\x7a\x98\x0a\x9e\x70\x96\xf3\x8c\x01\x20\x39\x7f\x05\x8c\x40\x5a\x15\xd2\x39\x22\xb2\x08\xe8\x8d\x4e\x6d\xcc\xe5\xa6\xbc\xdc\x96\x89\xe0\x75\xad\x2b\xa5\xca\x4a\x11\x51\xad\x4d\xa5\x94\x52\xc6\x38\xe7\x1c\x21\x32\xc6\x39\x22\xf3\x7a\xa5\xb9\x94\x35\x49\x09\xb1\xb6\x36\x23\xe4\x84\x17\xdb\x0d\x93\xec\xe8\xd6\x9d\xd9\x7c\x59\xe4\xb3\x34\xcb\x64\x92\x08\x99\x48\x21\x91\x31\xea\xdd\x26\xda\x0e\xeb\xb4\x35\xde\x28\x35\xd6\x1a\xdb\xd9\xd9\x5a\x69\x55\x39\xa3\xad\x31\xed\x35\xd8\x48\xc0\x08\x19\x17\x92\x33\x64\xc8\x17\x8b\x85\x5f\xf7\x3d\x39\x39\x39\x39\x39\xfd\x8b\xe3\x57\xff\xe1\x2f\xbf\xb9\x5a\x2d\xdf\x79\xf4\xe8\xd1\xdb\x6f\xdd\xbf\x7f\x4f\x26\xc9\x55\x3d\xe4\x37\xd2\xb4\xfb\x44\x3b\x60\x6c\x36\x8c\xfa\xfb\x6a\xda\x9a\x42\x4c\xd2\x0c\x7a\x68\x1d\x80\x13\x45\xb6\xc2\xe7\xa1\xe9\x7e\x06\x9e\x5e\xf3\xdb\x35\xb5\x41\xa5\x7c\x13\x9a\xbe\x27\xd6\x8f\x63\x88\x7b\x45\x84\xd7\xd9\xaf\x5d\x60\x1c\x3d\x40\xc1\x40\x14\x41\x60\x4c\x43\x44\x97\x97\x97\xcf\x9f\x3f\x7f\xfe\xfc\xf9\xf1\xf1\x71\x37\x48\x12\x42\xcc\x66\x33\xbf\x09\xa0\xbd\x31\xb8\x41\x41\x3f\x0b\xda\xb7\x0b\xfd\x5f\x1f\xee\x1b\x61\xd7\xe5\x6f\x52\xe4\x41\x14\x09\x86\x14\x41\x15\x04\x42\x86\x11\x17\xd4\x5a\x07\x63\x83\x28\xd8\xcf\xd2\x44\x15\xc7\x79\x88\xd1\x2e\xc6\xe3\x41\xff\xc4\x5f\xef\xfc\xea\xdd\x20\x8e\x26\x49\xe2\xf7\x27\x8e\x21\x68\xe0\xe9\x1b\x82\x4a\x29\x6b\xed\xde\xde\xde\xe1\xe1\x61\x27\xff\xf5\x7a\xfd\xc9\x27\x9f\x38\xe7\x1e\x3f\x7e\x7c\x78\x78\x38\x26\xd2\x2f\xd1\x7d\x75\x81\x10\x00\xb2\x2c\x7b\xf8\xf0\xa1\x1f\x42\x6a\xad\xfd\xc8\x31\x49\x92\x8b\x8b\x8b\xd8\x34\x8c\xe1\x30\x70\xbd\x16\xd6\x78\xe3\x39\x96\x9d\xbf\xf5\x78\x43\x24\x38\xc0\xed\xa7\x5a\xc1\x80\xb3\x16\x7c\x6b\xb0\xd6\x59\xd3\x0e\x87\x94\xd1\x46\xcc\x97\xf9\xfd\xb7\xed\x93\x7f\x48\x38\x2a\x04\x74\xb6\xae\x4a\x70\x0e\xb1\x79\x43\x23\x4d\x92\xc5\x62\x7e\xeb\xd6\xfe\xaf\x7e\xe3\xeb\x6f\xdf\xbd\x93\x4b\xc1\x01\x3c\xf2\x9c\x6f\xd7\x99\xe0\x45\xca\x09\x00\xc8\x79\x33\xb3\xac\x6b\xa5\x4c\x59\xd5\xdb\xaa\x26\xa2\xb2\x56\xa7\x97\x5b\x65\x0c\x47\xd4\xc6\x38\x47\xb6\xb9\x13\xc0\x1b\xac\x1c\x18\x11\x22\x6b\x76\xf5\x48\xc6\x99\x94\x89\x48\x12\xc6\x05\x17\x22\x43\xc6\x18\xbb\xd8\x6e\x81\xd1\x6a\xb5\x5a\xed\x1f\x2c\x97\xab\x62\x3e\xcf\xf3\x22\x4d\xd3\x24\x4d\x84\x90\xb8\x9b\x11\x25\x6b\x9c\xd1\x5a\xa9\xba\xda\x6e\x2e\xce\xce\x4e\x9e\x3f\xbd\x3c\x7d\x55\x6f\x36\xb6\x2e\xc9\x68\x70\xd6\x11\x09\xc1\xf3\x54\x22\xc2\x2c\xcf\x38\x07\x24\x67\x8d\x32\xba\x56\xaa\x32\x8e\x88\x09\x0b\x7c\x63\x85\xc8\x17\x62\xb6\xf7\xe0\xde\xdd\x4a\xe9\x8b\x8b\x8b\xcb\xcb\xf5\x77\xbf\xf7\xfd\xef\xfc\xed\xf7\x38\xe7\xf7\xee\xde\x79\xeb\xe1\x83\xb7\x1e\x3e\x38\x3c\x3a\x92\x52\x36\x5b\x63\xda\x1a\xf0\x2a\x07\x3a\x1b\x70\x37\xb3\x4a\x88\x28\x93\x8c\xf5\x76\xa0\x05\x38\x31\xa8\xd1\xae\xa5\x19\x44\xa0\x31\x9d\xd5\x31\xa1\x71\x9b\x2c\x56\x97\x13\x34\x13\x79\x18\x8c\x38\x98\xf9\x41\xfe\x7d\xe6\x83\xb8\x18\x30\xe9\x62\x05\xe3\x80\x98\xc6\x39\x57\x55\xd5\xcb\x97\x2f\x5f\xbc\x78\xf1\xf2\xe5\xcb\xce\xf8\xf3\xf8\x97\x65\x99\xbf\x34\x23\xc0\xb9\xbe\xeb\x87\xf4\x51\xb0\x3b\x28\xdc\x47\x9d\x20\xf5\x41\x81\x4c\xc0\x5b\x17\x6b\xba\x4e\x27\xe4\xd3\x4f\xab\x2f\xdb\x38\x89\x38\xf5\x41\xe6\x31\xcd\xcd\x51\x30\x4e\xba\xff\xb7\xf3\xf8\x3a\xea\x4f\x87\x76\x39\xe7\x9c\xa7\x69\x3a\xb1\x2f\xa6\xf3\x78\x7f\xdf\x10\xf4\xbb\x43\x39\xe7\x7e\xa1\xb7\xe3\x70\x72\x72\xf2\xf2\xe5\x4b\xc6\xd8\xfb\xef\xbf\xef\xdf\xa0\xff\x0a\xba\xaf\x34\x10\x02\x80\xb7\xaf\x8f\x8f\x8f\x2f\x2e\x2e\x5e\xbf\x7e\xbd\x5a\xad\xfc\x74\x4a\x55\x55\xdb\xed\xd6\x57\x83\x37\x0d\x89\xa8\xbf\xcd\x7a\x6c\x38\x7f\x6d\x8a\xfd\x8e\x31\xda\xf4\xc1\xfa\x39\x55\xd7\x1e\x95\xd1\x7e\x1b\x8e\xd6\xc6\xf8\x7f\x86\xac\x15\xab\x03\xb1\x59\xdb\x57\x2f\x90\x9c\x56\x3a\xe5\x6c\x9e\x49\xc1\x99\x76\x94\x24\xc9\x7c\x3e\xbf\x7d\xfb\xf0\x9d\xb7\x1f\xde\x3b\xd8\x4f\x10\x54\x55\xce\x53\x09\xce\x30\xb2\x12\xad\xd2\x8a\x2c\x2a\xa5\x8c\x75\x55\xad\x36\x65\x55\xd5\x6a\x5b\xab\x6d\x55\xd7\xca\x58\x6b\x1d\x01\x11\x55\xda\xa4\x52\x32\x86\xcd\x8d\x3a\xed\xb4\xb0\xf5\xcb\x9a\x8c\xcb\xa4\xb9\x56\x40\x48\x69\x1d\x59\x42\x02\xe4\xc0\x84\x10\xff\x3f\x7b\x6f\xf6\xac\x49\x72\xdd\x87\x9d\x5c\x6b\xf9\xb6\xbb\xf4\xed\xbe\x3d\xd3\x18\x0e\xc0\x01\x41\x8a\xbb\x45\x82\xa2\x69\xcb\x32\x65\x52\x0a\xdb\xe1\x8d\xb6\x42\x96\xed\x07\x3b\xfc\xe2\x7f\xc0\x6f\xb6\x23\xec\x07\xeb\xc9\x11\x0e\x87\x1c\x0a\x85\x4d\x5b\xa6\x22\x6c\x92\xa6\x48\x4a\x16\x68\x09\xa4\x48\x90\x20\xc1\x1d\x20\x00\x1a\x18\x02\x98\x01\x38\x5b\x77\xdf\xfd\x5b\x6a\xcb\xe5\xf8\xe1\x7c\x95\x5d\xb7\xb6\xfb\x75\x63\x00\xcc\x72\xcf\x4c\x7f\x37\xab\x2a\x2b\x2b\x2b\xab\xea\xfc\xf2\x9c\x3c\xcb\xd9\xf2\x12\x38\xdb\x5b\x2c\x0e\xee\x1c\xed\xed\x1f\xcc\x16\x8b\x74\x32\x4d\xd2\x34\x8e\x13\xa5\x94\x10\x14\xc5\xce\xa3\x77\xa6\x2c\x2f\xcf\xce\x5e\x7d\xf9\x4f\x5f\xfb\xd2\xcb\x67\x0f\xdf\x28\xd6\xeb\x48\x93\xcf\xa6\xa4\xa9\x09\x17\x22\x2b\xab\x08\x19\xe7\x98\x26\x89\x90\x09\x17\x9c\x73\xa6\x13\xce\x18\x1a\x53\xe6\x45\x31\x8d\x78\x55\x6c\x26\xf9\x66\x7d\x75\xfa\xf0\x2b\x57\x59\x69\x93\xd9\x41\xbc\x7f\xbc\x77\x74\x1f\x85\xde\x6c\x36\xc6\xda\xd7\xdf\x78\xf3\xb5\xd7\xdf\x40\xc4\x38\x8e\xee\xdd\xbd\xfb\xfc\xf3\xcf\x3d\x78\xee\xb9\x3b\x47\x47\x91\xd6\xd7\x66\x2d\x21\x8e\x5b\xfd\x5c\x74\x14\x73\x21\x7b\x79\x62\xeb\x09\x8e\xb0\xbc\x5d\xea\xec\xf8\xfe\xf4\xbf\x36\xc3\x9c\x74\xa8\xce\x8d\xf8\x07\x7d\xd2\x4c\x77\x1c\x7a\xaf\xd8\x3d\xe5\xc9\xdc\xa2\x4f\x43\x3b\x54\x87\xd6\x99\x4e\x4f\x4f\x1f\x3f\x7e\x7c\x7a\x7a\xba\x5c\x2e\xa1\x16\x7d\x08\xc0\xa2\x28\x22\x8d\x0e\x31\xd9\x5e\xfc\xa3\x9a\x4d\xe4\xeb\x1a\xcb\x34\xb5\xa3\x23\x43\x3d\x84\x82\x2d\x86\x30\x34\x03\xe8\x85\xae\xa1\x07\x31\x32\x86\xdd\x49\x43\x6f\xb3\xbd\xb8\xd8\xac\x33\x54\x68\x6e\x0e\x81\x1f\x74\x00\x2c\x84\x77\xe9\x5e\x2b\x8a\xa2\x11\x07\x89\xee\x1e\x62\xbf\x21\x64\x8c\xb5\x76\x3e\x9f\x87\x18\x31\x88\xe8\x9c\x7b\xf8\xf0\xe1\xd5\xd5\x55\x1c\xc7\x2f\xbd\xf4\x12\xa1\xe3\x3b\x93\x18\xf9\xed\xbd\xc3\x09\x11\x97\xcb\xe5\xe9\xe9\x29\x39\xd8\x4e\xa7\x53\xb2\xc8\x58\xaf\xd7\xce\x39\xad\x35\x61\x61\x53\x34\x64\x35\x41\x47\x7d\x31\xf2\x6a\x86\x9d\x5d\x38\x0c\x35\xbd\xf7\x8e\xfc\x33\xaa\xb2\x2a\xca\xb2\xc8\xf3\x3c\x2b\xf2\x4d\xbe\xd9\x64\x9b\x4d\xb6\x59\x67\x9b\xf5\x26\xdb\xe4\x9b\xd5\x66\xb5\xca\x36\xab\xcd\xc3\x37\x97\x8f\x1e\xad\xb2\xa2\xa8\xec\x55\x56\x54\x1e\x93\x24\x9e\x4e\x26\x77\x8e\xee\x7c\xe0\xf8\xee\x24\x8a\xd7\x59\xc6\xbc\x93\xdc\xa5\x4a\x5e\x65\x99\xb3\x4e\x72\x96\x15\xa5\x31\x36\x2f\x8d\x71\xd6\x5a\x5f\x56\x95\x75\xde\xba\xda\x81\x8f\x31\xd2\xd0\x96\xd6\x29\x29\xa4\x10\x8c\xf3\x60\xc8\xc3\x18\x43\xc6\x2a\xe7\xb9\x10\x69\x1c\x27\x49\x2c\xa4\xe2\x9c\x7b\x04\x32\x77\xad\x8c\xbd\x58\x2f\xb5\x56\x8b\xc5\xe2\xe0\xce\xdd\x83\x3b\x47\xfb\x87\x47\xf3\xbd\xfd\xd9\x62\x31\x99\xce\xe3\x24\x55\x5a\x01\x80\xa9\xcc\x66\xbd\xfc\xca\xe7\x3f\xfb\x27\x9f\xfa\xad\x57\x5f\xfe\x82\x35\x46\x08\xa1\xb5\x52\x4a\xc5\x51\x14\x69\xad\xb5\x56\x52\x52\xb1\xb2\x56\x2b\x2d\xa5\x4c\x93\x98\xa6\xed\xc0\x28\xb9\x15\x72\xc6\x8a\xb2\x88\xb5\x88\x25\xf3\xae\xbc\xbc\xba\x5a\x6f\xd6\x92\xa3\xad\xca\xcb\x65\xf6\xf0\x2c\x13\x93\x83\xe7\x3f\xf2\x3d\x93\x3b\xf7\xb2\x3c\xdb\x6c\x32\x8a\x40\x11\x28\xd2\xfa\xf0\xf0\xe0\xf8\xf8\xde\x73\xf7\xef\xd3\xda\xbb\x92\x92\xb1\xda\xa3\x90\x73\x1d\xc5\x2d\x03\x19\xe8\x63\x6a\xad\xf2\xdb\x52\xa7\xfb\xe6\xf4\xd6\x19\x92\xa2\x46\x68\x88\x29\x0f\x81\xdf\xd0\x29\x6c\x40\x92\x6b\x55\x6e\x6d\x36\x0b\x70\x9d\xa7\xd3\x1e\x63\xcc\x7a\xbd\x3e\x3d\x3d\x3d\x39\x39\x39\x3f\x3f\x5f\xaf\xd7\x61\x26\x1a\x20\x30\x8a\xa2\xc9\x64\x12\xac\x40\x03\xbc\x05\x15\x68\x13\xe7\xba\x9b\xfc\x89\xff\xd2\xb5\xdf\x30\x25\xea\xde\x7e\xb7\xdb\xa1\xdc\xad\x33\x34\x14\xad\x46\x86\xc6\x76\xe8\x09\xee\xf2\xac\x47\x5e\xa1\x71\xe4\xeb\x2d\xf7\x82\x5f\xf3\x37\x48\x6f\x04\x57\xdd\x13\x29\x70\x4f\xf3\xae\x5b\xf0\x19\x0a\xa1\xa9\xe6\x8a\x60\x55\x55\x42\x88\x7b\xf7\xee\xa5\x69\xca\x6a\x35\x7b\x9e\xe7\x6f\xbe\xf9\x66\x51\x14\x93\xc9\xe4\xde\xbd\x7b\xad\xfc\xf5\xef\x34\x7a\x6a\x20\xfc\x06\x65\xc1\xd8\xa5\xe5\xcd\x66\xf3\xea\xab\xaf\x66\x59\x26\xa5\x5c\x2c\x16\x64\xce\x54\x96\x65\x96\x65\x42\x08\x82\xc3\xa6\xf2\xa4\x85\x85\xad\x37\x78\xfc\x65\x1d\x02\x42\xdc\x5a\xc3\x90\x9f\x62\x59\x95\x45\x91\x17\x79\xbe\x29\xf2\xac\xc8\xb2\x3c\xdb\xe4\x59\x96\x65\x9b\x2c\xdb\xe4\xd9\x3a\x5b\x2e\xb3\x6c\xb3\x5e\x2e\xf3\x8b\x33\x77\x79\x5e\x54\xb6\xb0\xce\x01\xa4\x49\x72\x7c\x74\x67\x7f\x3e\x07\x00\x63\xcc\xe9\xe5\x95\xf7\x96\x01\x92\xa3\xbb\x12\xdc\x7b\x6f\xc8\xb9\xa3\x39\x71\xdb\xde\xc3\x36\xb9\x1f\xb9\x38\x94\xc6\x46\x5a\x71\x2e\x1c\xa2\x56\x52\x0a\x59\xbb\x3e\x08\x2e\x04\x30\xc6\x85\x20\x05\xb2\x47\x28\x8d\x99\x24\xc9\x32\xdb\x64\x55\x91\x26\xf1\x7c\xb1\xd8\x3f\x38\xda\x3f\xbc\xb3\x77\x70\x38\x5b\xec\xcd\xe6\x8b\xc9\x74\x16\x27\xa9\xd2\x11\x30\x28\x36\xeb\x3f\xfd\xdd\x4f\xfe\xde\xaf\xfd\xd3\x37\xdf\x78\xdd\x3a\x4f\x22\x27\x25\x84\xe2\x42\x2a\xa5\x66\x69\x3a\x4d\xd3\x28\xd2\x04\x84\xaa\xf6\xae\x14\x42\x00\xe3\xc0\xc0\x23\x7a\xef\xad\x47\x6b\x9d\x47\x3f\x4b\xe3\x44\x4b\x86\x6e\x9d\xad\x19\x5a\xe6\x4d\x59\x66\x59\xb6\x59\xae\x36\x27\x17\xeb\x47\x67\x79\xba\x7f\xf7\xc3\x3f\xfc\xa3\xb3\x83\xa3\xa2\x2c\x36\x9b\x6c\xb3\xd9\xd0\x7a\x43\xf8\xf6\x10\x91\x73\x36\x9b\xce\x0e\x0f\x0f\xef\x1f\xdf\x3b\x3e\x3e\x3e\x3a\x3a\xda\x3b\x38\x6c\xe6\x05\x6d\x51\x73\xd2\x3d\x3e\xdf\x1f\xaf\xd3\x4b\xdd\xe9\x7c\xb3\x9d\x71\xbc\x1c\x02\xa7\xe6\xe9\x30\xcc\xeb\xbb\x1c\xb9\xb7\xc1\x6e\x4f\xc6\xe1\x7c\x68\x12\xd8\xea\x50\x9b\x00\x00\x20\x00\x49\x44\x41\x54\x00\xb5\x61\xc5\xc5\xc5\xc5\xd9\xd9\xd9\xd9\xd9\xd9\xd5\xd5\x55\x51\x14\xad\x0f\x2d\xe8\x3f\xd3\x34\x25\x13\xd0\x00\x5d\x5d\x51\x2f\xe0\x5c\x77\x33\x48\x7e\xbd\xe5\x56\x57\x7b\x07\xb9\x77\xf4\x7a\x1f\xc4\x78\x85\x91\xb3\x86\xa6\x08\xbd\xa3\xda\x7d\xac\xdd\xca\xe3\xc8\x37\x72\x74\x17\x20\x24\x97\x3e\x12\x04\x9b\x47\x39\xe7\xba\x56\xb7\x74\xcf\xea\xdd\xd3\x14\x04\x8d\x31\xd6\xda\xc5\x62\x71\x78\x78\xc8\xeb\x6c\xea\xde\x7b\x52\x87\x22\x22\xf9\x4e\x8c\xaf\x5b\x7d\x0b\x31\x25\xd0\x3b\x1a\xa5\x5b\x34\x99\x4c\xbe\xeb\xbb\xbe\xeb\xb5\xd7\x5e\x7b\xfc\xf8\xf1\xd9\xd9\x19\x29\x5b\xe2\x38\xd6\x5a\x67\x59\x46\x46\xc0\x14\x90\x90\xa6\x9c\x74\x56\x77\xa2\x17\x68\x64\xce\x1e\x9e\x3d\xaf\x7d\xe9\x68\x13\x6b\x07\xc5\x6d\x10\x59\x63\x9d\xb3\xde\xb9\xed\x02\x1d\x02\x00\xd9\x3f\xd2\xa4\x58\x0a\xc1\xa5\x52\x62\xb6\x60\x88\xfb\xc5\xda\x7a\xf4\xc0\x92\x24\x99\x68\x5e\xe6\x9b\xe5\x7a\x73\x7a\xb5\xac\x8c\x01\x44\xeb\x5c\x56\x1a\x8f\xa0\x84\xe4\x9c\x91\xb2\x93\x31\x46\x00\x18\xac\x28\xad\xf7\x5a\x4a\x04\xe6\x01\x94\x90\x11\x97\x5a\x49\x43\x90\xc9\xa5\x8a\x22\x21\x04\x17\x82\x73\xc1\x39\x73\x1e\x90\x01\xe3\x42\x08\x29\x38\x5b\xe5\xf9\xfa\xe2\x5c\x48\xbe\x98\xcd\x16\x7b\x7b\x8b\x83\xc3\xbd\x83\x3b\x7b\x7b\xfb\xd3\xf9\x62\x32\x9b\x4f\x26\xb3\x38\x49\xa5\x52\xde\xbb\x57\x3e\xff\x99\x4f\xfc\xe2\xcf\xfe\xf9\x57\xbf\x5a\x5a\x6b\x9c\x97\x9c\x03\x63\x82\xbc\x29\x19\x67\x8c\x19\xe7\x0b\x63\x52\x40\x21\x84\x92\x52\x29\x19\xd5\x72\xb9\x73\xde\x3a\x17\x69\xa5\x85\x70\xde\x67\xcb\xb5\xb1\x36\x8e\xb4\x14\xd2\x79\x16\xe9\xf8\x60\x2f\xf6\xde\xd8\xaa\xe4\x52\x2b\x1d\x47\x51\x92\x26\xf1\x7c\xb2\x7e\xfd\xd1\xd9\xa7\x3f\xfe\xff\x7c\xfb\x0f\x7e\xf4\x03\xdf\xf9\x3d\xd3\xc9\x14\x01\xaa\xaa\xca\xb2\x6c\xb3\xd9\xe4\x79\x1e\xc4\xc4\xd5\x7a\xbd\x5a\xaf\x5f\xfd\xea\x57\x11\x51\x08\x31\x9b\xcd\x0e\x0f\x0f\xef\xdd\xbb\x77\x7c\x7c\x7c\xf7\xee\xdd\xd9\x6c\xd6\xd4\xc0\x74\x27\x3d\x43\xdc\x7f\xa8\x4e\x2f\xba\x0c\xe1\x10\x74\x18\xf4\x10\x22\xb6\xe6\x58\xdd\x06\x87\x18\x7d\xef\xe4\x6c\xa8\xc1\xd6\x21\x1a\xc0\xde\xfb\xed\xf2\x59\x63\x4c\x96\x65\x97\x97\x97\x17\x17\x17\xe7\xe7\xe7\xcb\xe5\x32\xcf\x73\xac\xcd\x4c\x18\x63\x34\xc7\x27\x88\x8a\xa2\x28\x8e\xe3\x24\x49\x9a\xc2\x5f\x57\xb6\x6b\x09\x76\xbb\xc0\x5e\x8b\xc6\x61\x6f\x08\x5d\x86\xe6\x1c\xad\x51\xba\x11\xae\x5a\x53\x9f\x91\x99\x44\xb7\xf2\x50\xcd\x56\x9d\xa7\x82\xc3\xde\xcd\x16\x86\x21\x22\xc1\x55\xeb\x14\xce\xf9\x76\xda\x5a\xb7\xd0\x8b\x7c\xcd\xcd\xae\x69\xa8\xd6\xfa\xfe\xfd\xfb\x71\x1c\x87\x66\xab\xaa\x7a\xf3\xcd\x37\x37\x9b\x0d\xe7\xfc\xf8\xf8\x78\x3a\x9d\x0e\x8d\xc0\x3b\x8a\xde\x4d\x40\x08\x00\x42\x88\x17\x5f\x7c\x51\x08\x71\x72\x72\xb2\x5e\xaf\x8b\xa2\x20\x0b\x9a\xe9\x74\x4a\xdf\x6d\x96\x65\x24\x00\x85\x19\xe8\x8d\x73\xfc\xde\x59\x70\xa0\xe0\x3f\xb0\x7d\x0f\xea\x38\xea\x8e\xfe\xf7\x8e\x44\x16\xac\xd3\xe9\xb1\x66\xf4\x53\xa5\xa4\xd2\x51\x64\xac\x35\xc5\x74\x2e\x98\xd7\xb6\xe2\x42\x28\xc9\xab\xa2\x38\xbf\x5a\xbd\x76\x72\x7e\xb1\xde\x70\xce\x05\xe3\x82\x33\x8f\xc8\x85\x72\xc8\xb4\x94\x91\xe2\x50\x23\x61\xd0\xf3\x7a\x04\x87\x50\x79\x4c\x63\x4d\xc1\x53\xb4\x10\x52\x08\x09\x10\x01\x8b\x94\x52\x5a\x51\x50\x18\xf2\xfe\xd7\x75\x80\x1c\xe7\xfd\xd5\x6a\x65\xbc\x4d\xd2\x78\x3a\x9d\x2c\xf6\xf6\xe7\x7b\x07\x8b\xfd\x83\xf9\xde\xde\x64\x3a\x9f\x4c\x67\xe9\x64\x1a\xc5\x89\x10\xb2\xcc\xb3\x4f\xfc\xd2\xcf\xfe\xfe\x6f\xfc\xda\x26\x2f\x69\x48\x9c\xf3\xde\xa3\x94\x5c\x0b\xc1\x18\x13\x82\xc7\x91\xd6\x5a\x47\x51\x14\xd5\x96\x4a\x14\x74\x47\x49\xc9\x38\x2f\xad\x15\x42\x30\xc6\xb5\x52\x08\xb8\x3f\x9f\x9d\x5f\x2d\x9d\xf7\x9b\xbc\xe0\x9c\xc7\x91\xe6\x42\x70\x2e\x4b\x83\x95\x37\xb3\x49\x22\xa4\x16\x2a\x92\x4a\x09\xc1\xde\x7c\xbc\x7a\xe5\x8f\x3e\x95\xad\x57\x1f\xf9\xa1\x1f\x95\x52\xa5\x69\x9a\x26\xc9\xc1\xc1\x81\x73\x8e\x44\xff\x3c\xcf\xc9\xf9\x37\xcc\x6d\x97\xcb\xe5\xd5\xd5\xd5\x2b\xaf\xbc\x42\x8f\x38\x49\x92\xd9\x6c\x76\xe7\xce\x9d\xa3\xa3\xa3\xa3\xa3\xa3\xc3\xc3\xc3\xe9\x74\x9a\xa6\x69\x73\xce\xbb\xcb\xc4\xbc\xc5\xc5\x86\xde\x9f\x2e\x5c\x75\x45\xae\x91\x17\xaf\x7b\x89\x2e\xbe\x76\xdf\xcc\x5e\xe0\xec\x36\x18\x0e\x35\xf7\x0f\xf1\x6e\x0a\x6f\xbd\x5e\xaf\xaf\xae\xae\x2e\x2f\x2f\x2f\x2f\x2f\xb3\x2c\x2b\xcb\x32\x5c\x9a\xd5\x3e\x33\x50\x1b\x3c\x2b\xa5\xe2\x38\xa6\x99\x68\xb0\xdf\x1e\xd2\x67\xb6\x80\x6d\x17\xcc\xeb\x42\x60\x77\xb2\x32\x72\x5f\xad\x31\xe9\x4e\x65\x86\x9a\xea\x85\xba\xde\x79\x49\xef\x23\x1b\x99\x51\x75\x4f\xef\xed\xd2\x33\x60\xe1\x10\x10\x36\x05\x41\x68\xbc\x48\x64\xac\xd4\x6a\xa7\x05\x9f\xad\x43\xfe\x7a\x12\x09\xc6\xd8\x9d\x3b\x77\x16\x8b\x45\xf3\x1d\x3b\x3f\x3f\x7f\xf4\xe8\x91\x73\x2e\x4d\xd3\x6f\x6d\x7e\xc1\xa7\xa5\x77\x19\x10\x12\x4d\xa7\xd3\x24\x49\x68\x59\xfe\xec\xec\x2c\x4d\xd3\xd9\x6c\x46\xaa\x51\x62\x97\xd6\xda\x60\x50\xda\x84\xc3\x16\xf5\x72\x93\x5e\xce\x88\xf5\xbb\xe0\xc8\x63\xc0\xda\x90\xb3\x02\x11\xa1\x4e\xc8\xbe\x8d\x4b\x26\xa4\x54\x52\x59\xed\x22\xeb\x6c\xec\x9d\xf3\x1e\x01\xa0\x82\x85\x5a\x5d\xa4\x0c\x9c\x73\x6f\x9c\x9c\x7f\xf5\xe1\x09\x25\xa3\x10\x9c\x3b\xfa\x14\x81\x2b\xcd\xe3\x6d\xf2\x26\xf4\x88\x49\xa4\xa8\xf3\x9c\x73\xc6\x39\x22\x98\xb2\x52\x14\xe6\x4d\x08\xe0\x5c\x52\x74\x1b\x46\x8e\x12\x82\x34\xa2\x9c\x73\x63\x9d\x71\x56\x08\x29\x25\xdb\x64\x9b\xcc\x94\x5a\xc9\xfd\xe9\x7c\x3a\x9f\xcf\xe6\x7b\xf3\xbd\xfd\xc5\xde\xfe\x74\xb6\x48\x27\xd3\x64\x32\x49\x27\x13\x1d\x25\x5c\x88\xcd\xe5\xf9\xc7\xfe\xf7\xbf\xfb\xa7\x9f\xfb\x5c\x56\x56\x8c\x31\x5a\x76\xe3\x9c\x29\x21\xa4\xe0\x9c\x53\x7e\x27\xf4\xde\x5b\xe7\x35\xc0\x16\xeb\x55\x30\x77\x97\xd6\x3b\xeb\x9c\x14\x32\x89\x35\x67\x1c\x00\x26\x89\x00\x80\x55\x96\x4d\x92\x24\xcb\x8b\x8b\xe5\xfa\x70\x31\x13\x5c\x30\x2e\x8c\x67\x96\x29\xae\xa6\xe5\xa6\xe2\x32\x39\xd8\x03\x00\x50\x72\xf3\xe6\xcb\x9f\xe3\x42\x7e\xe7\x5f\xfc\x11\x21\x38\x13\x52\x32\x86\x88\x64\x70\x41\x5f\x63\x55\x55\x45\x51\x50\xf8\xbd\xb0\xec\x41\x0f\xae\x28\x0a\xb2\x5a\x84\x5a\xa0\xd7\x5a\xa7\x69\xba\xbf\xbf\x7f\x78\x78\x78\x78\x78\x78\x70\x70\x40\x99\x2f\x93\x24\x69\xf1\xd6\x2e\x74\x0d\x21\x59\x2f\x5b\x0c\xaf\xca\x88\x28\xd0\x9d\x96\xf5\x5e\xb1\xf5\x1e\x0e\x61\x5e\x57\xfe\xe8\x36\xdb\x6d\x07\x11\xf3\x3c\x27\xd8\x5b\xd6\x94\x65\x99\x31\xa6\x19\x39\x88\xd5\xae\xeb\xa1\x2c\xa5\x8c\x6a\x6a\xf9\xf6\xf5\x42\x5a\xf3\xeb\x1b\xc2\x3c\x51\xfb\xc8\xb7\x30\xaf\x75\x62\xab\xff\x43\x28\xd8\x0b\x42\xe3\xd3\x91\x6e\xfd\x91\x47\x36\xc4\x31\x7a\xe1\xad\xd5\xc9\x26\xf5\x22\x1c\x0c\xa0\x5d\x78\x88\x4f\x05\x81\x78\x5d\x10\x0c\x4d\x09\x21\x02\x3e\x75\x61\xaf\xb7\x10\x74\xa1\xc1\x4d\x7e\xb1\x58\x1c\x1c\x1c\x88\x86\x91\x76\x59\x96\x6f\xbd\xf5\xd6\x7a\xbd\xe6\x9c\xdf\xb9\x73\x67\x6f\x6f\xef\xc6\x01\x7f\x47\xd1\xbb\x12\x08\x01\x40\x08\x71\xf7\xee\xdd\xe9\x74\x7a\x72\x72\x92\x65\x59\x51\x14\xa4\x13\x8b\xe3\x38\x8a\x22\xda\x43\x70\x18\x0c\xb5\x59\x4d\xad\xa6\x46\xe0\x10\x1a\x6f\x73\x1d\xb6\xcd\x7a\xef\x7c\x1d\x93\x66\x9b\xf5\x08\xea\x0f\x56\xd4\x0e\xc0\xde\x6d\x5d\xf6\x91\x72\x27\x31\xce\x99\xe0\xa2\x14\x62\xb9\xbe\xba\x7c\x7c\xf2\xda\xe3\xb3\xc2\x6c\xc3\x6d\x3b\x47\x0d\x31\xc6\x81\x39\xaf\x94\x8c\xa3\x98\x0b\x5e\x59\x27\xa4\x92\x52\x90\x45\x28\x5d\x03\xc9\x1c\x53\x48\x47\xf1\xc0\x95\x7e\xc2\x32\xea\xd8\x68\x8c\x71\xc5\x85\x75\xae\x34\xd5\xba\xb2\x52\x8a\xc5\x7c\x36\x99\x4e\x67\xb3\xf9\x74\xbe\xd8\x2e\x07\x4e\x66\x71\x9a\x26\xe9\x34\x4e\x53\xad\x35\x63\x7c\x73\x75\xfe\xb1\xff\xf5\x7f\x7a\xf9\x8b\x2f\x13\x3c\x57\xc6\xc5\x4a\x0a\xce\x10\xc1\x38\xef\xd1\x0b\xc1\x39\x47\x29\x78\xac\x55\x14\x69\xc1\x59\x65\x6c\x12\x63\x1d\x87\x95\x3b\xef\x81\xb1\x59\x9a\x56\xc6\x32\xa0\x2c\x4e\x80\x08\x93\x38\x16\x9c\x25\x51\x14\x29\xe9\xbc\x67\x9c\x23\x60\x1a\xc7\x95\xb1\xcb\x4d\x31\x49\xf4\xfe\xde\x61\x55\x6c\x8a\x5c\x4c\x27\x86\x26\x0d\x67\x5f\xf9\xfc\xc9\xdd\xbb\xc7\x2f\xbe\x44\xa1\xec\xc8\xa3\x31\x7c\x93\x51\x14\xa5\x69\xba\x85\x64\x6b\x8d\x31\x65\x59\x16\x45\x41\xae\x51\x2d\x2d\x90\x31\x86\x44\x9c\x57\x5e\x79\x05\x1a\xe8\x18\xbc\xb9\x17\x8b\xc5\xde\xde\xde\x62\xb1\xa0\x57\x28\x4d\x53\x9a\x2c\x77\x25\xad\x6e\x21\x5c\x65\x88\x4b\x0e\x9d\xde\xaa\xd6\xdb\x60\xeb\x45\xed\x45\xb5\xee\xe9\x61\x8f\x73\x8e\xa6\x0b\x79\x9e\x6f\x36\x9b\xcd\x66\xb3\x5e\xaf\xd7\xeb\x35\xe9\x99\x43\xc0\xd8\xf0\x51\xb0\x5a\xdb\xd9\x44\x3e\xdd\xa0\x2e\xb0\x75\x49\x6c\xd5\x06\x3d\xf0\xd6\x4b\xad\x6a\xbd\xa0\xd8\xbd\xd9\xee\x20\x77\xc7\xaa\xf5\xfd\x86\xb1\xed\xa2\xe9\xd0\xec\xa4\xdb\x60\xef\x15\xc7\x41\xba\x7b\x56\x17\xed\x46\xca\xd0\x80\x25\x18\x00\x3f\xe8\x40\x17\x89\x6e\x2d\xd3\x50\x9a\xbb\x34\xbb\xb7\x3b\x04\x06\x14\x9c\xcf\xe7\x87\x87\x87\xc1\xcb\x90\x5e\xb3\xb3\xb3\xb3\x90\x2a\xe4\xc5\x17\x5f\xac\xaa\xaa\x3b\x4a\xef\x70\x7a\xb7\x02\x21\x00\x30\xc6\x68\x8d\x90\x96\x31\xae\xae\xae\xb2\x2c\x23\x4d\xe9\x64\x32\xa1\x38\x26\x79\x9e\x37\x35\xa5\xbd\x70\xc8\x3a\x01\x32\x7a\xa7\xf9\x88\x7e\x1b\xcc\xd4\x39\xef\x3c\x6e\x93\xce\x6e\x75\x23\xdb\x18\xa4\x52\x2a\xbf\x05\x41\x40\x64\xc0\x9e\x64\x4a\xa4\xfc\x88\x65\x59\xe9\x68\x1e\x4f\x8f\x93\xe9\xd9\xc9\xe9\x6a\xb9\xb4\x55\xe5\x10\x19\x80\x14\x4c\x08\x1e\x29\x89\xc0\xa4\x52\x51\x14\x69\xef\x39\x63\x52\x08\x60\x0c\x00\x1c\xa2\x07\x98\x4d\x27\x8c\x31\x4a\x70\x4f\xb7\xc6\xf9\x13\x63\x51\xc2\x4b\xe7\x7d\x61\x2a\xe3\xac\x52\x72\x12\xcf\x92\x74\x32\x99\xcd\x26\xd3\xf9\x74\xb6\x98\xcd\xe7\x64\x11\x13\xc5\x49\x92\x4e\xa2\x24\x96\x52\x03\x40\x99\x67\x9f\xf8\xd9\xbf\xff\xf2\x17\x5f\xce\x4a\x03\x80\x92\x73\x26\x19\x65\x01\x96\x82\x1b\xeb\x3c\x82\x76\x3e\xd6\x8a\x03\x70\x06\x82\xb3\x58\x2b\x1d\xa9\x4d\x51\xce\x67\x53\xe2\x8e\x85\xb1\xa5\x31\x77\xf6\x16\x4a\x4a\xe3\x9c\x10\x5b\x2e\x26\x04\x4c\x92\x04\x00\xe3\x48\x41\x23\xa6\xf6\xde\x6c\xaa\xa4\x70\xd6\x71\xce\x19\xd7\x9e\x69\x26\xe2\x38\xb2\xfb\x73\x27\x85\x79\xf3\xf3\x7f\xb0\x77\x74\x6f\x32\xdf\x63\xb5\x59\x2c\xd4\xe6\x6a\xf4\x89\x86\x0f\x95\xbe\x40\xbc\x9e\x08\x3b\x10\x7d\xc6\xf4\x79\x07\x85\x2a\x7d\xd5\xab\xd5\xea\xf5\xd7\x5f\x0f\x5f\x3e\xaf\x85\x98\x38\x8e\x49\x6a\xa4\x75\x68\x22\x32\x00\xa1\xc5\xb0\x28\x8a\x7a\xc1\xac\xf7\xe5\x19\x39\xda\x2b\xd9\xb4\xd0\xb1\x59\xa7\x79\x88\x34\x54\x65\x4d\x01\xf3\x02\x51\xe6\x96\xf0\x6e\xb3\x5a\xb7\x49\x24\x1a\x41\x0a\x89\x68\xca\x48\x2f\x15\x59\xd2\x07\x01\x2e\x9c\x3b\x04\x66\xad\x9a\xcd\xfd\xcd\x73\x9b\x00\xd9\xaa\xc9\x3b\x82\x60\x18\x8d\xf0\x80\xba\x18\x03\x1d\x04\xea\x1e\x6a\x8d\xf3\xd0\x84\xa3\x77\xd8\x7b\x1f\x62\x8b\x57\xe0\x0e\x46\xb9\xad\x6e\xef\x8e\x85\x4f\x05\x81\x00\x40\xb8\xd5\xf4\x11\xa4\x51\xed\x55\x84\xb6\x36\x5b\xe5\x6d\x06\x83\xda\x41\x30\x49\x12\x4a\xa2\xd4\xbc\xaf\xf5\x7a\x4d\xd9\x94\x00\xe0\xfe\xfd\xfb\xcf\x3d\xf7\x9c\x10\xe2\x16\x08\xbf\x05\x24\x84\xa0\x75\xa0\xd3\xd3\xd3\xcd\x66\x73\x7a\x7a\x9a\x24\xc9\x7c\x3e\x27\x33\x0a\x4a\xaf\x45\x0b\x87\x34\xa5\x0d\x8b\x19\xad\x99\x60\x6b\x4e\xdd\x7c\x7d\xb7\x28\x58\x67\xd3\x45\x00\x00\x84\xf0\x15\x71\xc6\xb9\x60\xdc\x09\x21\xa5\xf4\xe8\x3d\xea\xb0\xac\xc2\x39\xad\xa6\x48\xad\x22\x5d\x95\x71\x54\x95\xa6\x2a\x93\x34\x9d\xcd\xe7\xcf\xbf\xf0\x42\x65\xaa\xf5\x6a\x7d\x75\x71\xb9\xbc\xbc\xac\xf2\xcc\x1a\xeb\x01\x18\x67\xc8\x98\x90\x32\x92\x92\xc2\xb9\x51\x6b\x94\xc5\x49\x2a\xcd\x39\xd7\x8c\x25\x35\xf3\xaa\xb9\x06\xf7\x80\x95\xb3\xc6\x3b\x00\xd4\x91\x9a\xc5\xb3\x24\x4d\x93\xc9\x34\x9d\x4c\x27\xd3\xf9\x74\x36\x4b\x27\xd3\x38\x49\xa3\x38\x8e\xe2\x34\x4e\x92\x28\x8a\x84\x54\x1e\x7d\x55\x96\x9f\xfe\xf5\xff\xf7\xf3\x9f\xf9\x74\x56\x1a\x04\x72\xd2\x43\xb1\x75\x4a\x04\x25\xb8\xe4\x0c\x18\x08\x06\x1c\x51\x70\x00\x44\x06\xc8\x00\x25\x67\xc8\xa0\x28\xca\x24\x8a\x8c\xb5\x79\x51\x32\xc6\xd6\x59\xee\x3c\x72\xce\x94\x14\x92\x0b\x06\x00\x21\x92\x68\x48\x22\x51\x4f\x3e\x22\xa5\x2a\xc4\xaa\x32\x94\x8a\xc3\x7a\x69\x51\x72\xae\xd2\xd8\x67\x45\xf1\xe8\x4b\x9f\xff\xb6\xef\xff\x11\xa9\x24\x03\x20\x2c\x64\x8c\xb5\x20\x30\x94\x9b\x85\x24\x49\x5a\xd5\x4c\x83\x08\x1a\x43\x3e\xa9\x16\x03\xa2\x3a\xe4\x0c\xd7\x3a\x1a\x80\x84\xc0\x92\x6c\x43\xa2\x06\xd1\x6a\x19\x4d\xbc\x5a\xd1\x1e\x78\x23\x72\x74\xf3\x05\xee\x82\x7a\x58\x8c\xa1\x50\x1d\x61\x32\x4e\x14\x00\x9e\x44\xba\xe6\x1b\xdb\xc4\xb9\x50\x0e\x48\xd3\x24\xd1\x88\xde\xa2\x6a\xea\xc2\x52\x2f\x04\x8e\x97\x77\x39\xda\xc2\xc2\xde\x6a\xcd\xcf\xb0\x3b\x87\xe8\x22\x62\xab\x4e\xeb\xeb\x6e\x7e\xe3\x5d\xbc\xec\x7e\xef\xcd\xa7\xd3\x3d\x71\xa8\x85\x16\xec\xd1\x89\xad\xb7\xe8\x46\xe4\x83\xeb\x38\x07\x1d\xd8\x83\x61\x30\xa3\x17\xbb\xd9\x49\xe2\x3f\xbd\xed\x0c\x15\x82\x14\x18\x32\x28\x69\xad\x1f\x3c\x78\x30\x99\x4c\x9a\xb7\x59\x55\x15\xf9\x08\x22\xe2\x7c\x3e\x7f\xe1\x85\x17\xa8\xc2\xbb\x94\xde\xf5\x40\x48\x14\x45\xd1\x73\xcf\x3d\xb7\xd9\x6c\x4e\x4e\x4e\x68\x3a\x3c\x9d\x4e\x67\xb3\x99\x94\x72\x3e\x9f\x93\xc7\xe1\x66\xb3\xe9\xf5\x38\xec\x52\xf3\x25\x0e\x2c\xbb\xe6\xe1\x00\x00\x8c\x24\xbd\x9a\xcf\x08\x21\x10\x25\xad\x9f\xd5\x7c\x9e\xd5\xcb\x85\xa4\x2b\xd5\xda\xc4\x26\xa9\x2c\xa5\x7f\xaa\x4c\x9d\x04\xca\x2c\x16\x8b\xe3\xe3\x63\xb2\xbe\xc9\xf3\x7c\xb3\xde\x54\x65\xc5\x00\x1c\xf0\x34\x8a\xb7\x79\xf5\x80\x01\x03\x85\x10\x39\xa7\x94\x0a\x06\xa5\xb4\x6a\x58\x54\xa5\x50\x82\xec\x74\x54\xa4\x52\x3d\x21\x03\xbe\x38\x99\x24\xe9\x24\x9d\x4c\x27\xd3\x69\x92\x4e\xa2\x38\xd1\x51\xa4\xa3\x38\x4e\x92\x28\x8a\xb5\x8e\xb8\x10\xde\xfb\xaa\x28\x4f\x5e\xff\xda\x1f\xff\xc6\xc7\xcf\xd7\xf9\x93\x6f\x6f\xfb\xc3\xe8\xb6\x05\x67\x9c\x31\x29\x38\x00\x02\x7a\x40\x87\xe8\x19\x20\x07\x98\x27\x31\xe7\xe0\x9c\x65\x20\xa4\x60\x71\x14\x09\x2e\x8a\x2a\x57\x52\x5e\x2c\xd7\x77\xf6\xe6\x61\x0c\xeb\xd1\x64\x58\xcf\x2e\x6a\xc5\xa6\x2d\xca\x32\x2f\xcb\xca\xd8\xb2\xf2\x79\x85\xde\x00\x03\x1e\x47\xb0\x7a\xf3\x2b\xf9\x87\x3e\xa2\xb5\x66\x1a\x39\x67\x14\x0a\x1c\x6a\x57\x8a\x91\xdf\x1b\x2b\x84\x39\x6f\x50\xfb\xb8\xeb\xd4\xcb\x8c\x42\xd9\x5a\x4b\x6a\xc6\xd6\x9b\xd3\x62\x91\x4d\xd6\x19\x5e\xa7\xa1\x9d\xad\x72\x93\x5a\x48\xd6\x0b\x78\xbd\xd5\x9a\x80\xd7\x44\xe8\x16\x3a\xb6\xca\x4d\x40\x62\xc3\x70\xc8\xfa\x50\xad\x05\xc0\x43\x35\x59\x1f\xf8\x35\x07\x01\x47\x55\x97\xbd\xa3\xdd\x7c\x52\x6c\x58\x89\xdd\x6d\xa1\x59\x81\x75\x20\xb6\x7b\xad\x56\xe3\xbd\xfd\xec\xb6\xd3\x5b\x1e\xdf\x39\x0e\x7e\xcd\x6a\xf4\x29\x85\x89\x1d\x63\x8c\x74\x1b\xcd\xc6\xbb\xc0\xd9\xdd\x0c\x52\x60\x33\x5e\x28\x59\x7e\x86\xcb\x79\xef\x4f\x4e\x4e\x4e\x4f\x4f\x29\xb6\xd7\x83\x07\x0f\x82\x13\xfd\xbb\x97\xde\x23\x40\x08\x00\x8c\x31\xb2\x0f\x24\x6b\x6f\x42\x3e\x8a\xe7\x24\x84\x58\x2c\x16\x94\x76\x32\xcb\xb2\xe0\x71\x18\xc4\x29\xb8\x3e\x73\xa4\x06\xc3\x9e\xed\x0b\x43\xaa\x50\xfa\x24\x82\x7b\xc4\x93\x77\x11\x82\x10\x18\xb4\xa1\x46\x08\xa9\x14\x45\x9c\xd1\xda\x3a\x17\x5b\x8a\x42\x63\xad\xb5\x86\x0a\xce\x3a\x67\xcd\xd6\x25\xc3\x6d\x53\x64\x84\x94\x19\xe8\x11\x28\x82\x0d\x2d\x46\xa2\xdf\x4a\x57\x6c\x7b\xcf\x9c\xb3\xf9\x64\x2e\xc3\x62\x4e\x14\xe9\x28\x89\xe2\x38\x4e\xd2\x24\x49\x93\x34\x8d\xe2\x44\x47\xb1\xa2\x63\x71\xac\xa3\x58\x47\x91\x52\x9a\x71\xee\x9c\xad\x8a\x72\x79\x79\xf1\x07\xbf\xfe\xcf\xbe\xfa\xd6\x49\x69\x6c\x24\x05\x00\x58\xe7\x81\x81\xe4\x1c\xea\xb8\x66\x08\xb5\x50\x87\x88\xce\xa1\xf7\xdb\x5f\xf4\xe8\xad\x90\x62\x93\xe7\x95\xf5\x47\x07\x7b\x5a\x8a\xbc\xac\x4c\x65\x10\xd1\x7b\x5c\x67\xf9\x34\x4d\xac\x73\xc6\x3a\xba\xa7\x6d\x62\x29\xc6\xac\x73\x65\x59\x79\xef\x49\xbb\x67\x2a\x53\x96\x55\x65\x6c\x59\xb9\xa2\xb0\x82\xb9\x54\x33\x2d\xdc\xd9\x57\x5f\x9e\xcc\xf7\xbc\xd6\x00\x50\x3f\xb2\x7e\x1d\x69\x00\xd7\xee\xce\xf1\x6a\xbd\xe4\x1b\x39\xd5\x7c\x1f\x35\x39\xcb\xd0\x0b\xd9\x2c\xb0\x01\xcc\x83\x3a\xd4\x1f\x1b\xa5\x50\xa7\x85\x3a\x41\xe7\xdf\x8c\x58\x16\x90\xaf\x17\xd2\xba\x2d\x77\x8f\x0e\xc1\x61\xb7\xd0\x8b\x76\xdd\xd6\xba\xbf\xbd\x9d\x69\x0e\x60\x2f\x30\x74\xab\xc1\x75\xf5\x69\xeb\x94\xee\x23\x80\x0e\x82\xb2\xeb\x8b\xaf\xcd\x73\x47\x4e\x19\x2f\x0c\xa1\xda\x2e\xe5\x21\x20\x1c\x02\x30\xbb\x4d\xaa\xba\xe5\x5d\x2d\xe7\xb1\xde\x53\x5a\x85\xf0\x56\x07\x08\x94\x52\xde\xbf\x7f\x7f\x36\x9b\xb1\x46\x1c\x5a\x00\x38\x3b\x3b\x7b\xf4\xe8\x91\x31\x86\x73\x7e\xef\xde\xbd\x07\x0f\x1e\xbc\xc3\x3d\xe5\x77\xa4\xf7\xc2\x3d\x34\x89\x73\x4e\x9a\xd2\x47\x8f\x1e\x95\x65\x79\x75\x75\xb5\x5e\xaf\x29\xd6\xb3\x52\xaa\x09\x87\x64\x3d\xd5\xe4\x17\xe1\x1b\x63\xd7\xd5\xa4\x88\xb5\xac\x17\x3e\x6c\x26\x80\x03\x22\x82\x10\x34\x82\x8c\x31\x6e\x19\x49\x8a\x24\x06\x3a\x2b\x85\x51\xce\x59\xa7\xb7\x4e\x87\xfe\x09\xda\x79\xef\xeb\x8c\x50\xe4\x83\xe1\x9d\x27\x86\xeb\x9a\xc9\xa1\x1c\xb1\xe4\x27\x2f\x71\xdd\x2d\x46\x3a\x53\x5e\xb3\x40\xa5\x94\x24\x14\x8c\xa2\x28\x8e\xe2\x24\x8a\x22\xa5\x23\xa9\xb5\x94\x4a\xeb\x48\x47\x91\x8e\xb4\xd2\x91\x54\x9a\xe0\xdf\x59\x6b\xca\x72\x7d\x75\xf9\xe8\x8d\x3f\xff\xea\x17\x3e\x9f\x55\x46\x0b\x81\x08\x8c\x81\x10\xbc\x30\xd6\x3a\x1f\x2b\xc9\x28\x09\x20\xc1\x30\xfd\x45\xf4\xce\xc1\x36\xc4\xb8\x71\x52\x58\x63\xb2\xca\x72\x21\xaa\xb2\x00\xf4\x0c\x20\x89\x94\x10\xa2\xa8\x4c\x65\x8c\xf7\x11\x03\xa8\xaa\xaa\x28\x8d\xf5\x8e\xe5\xc5\xf6\x26\x68\xfa\x69\xad\x31\x06\x9d\xab\x8c\x29\xab\xaa\xac\xaa\xb2\x32\x45\x65\xd1\x19\xef\xf9\x34\x11\xab\x87\x5f\x2b\x3f\xfc\xbd\x71\x92\x30\x40\x4e\xf6\x41\x42\x40\xfd\x71\xd2\x14\xb8\x25\x08\xb6\xc0\x6f\x1c\xf9\x5a\xd0\xd8\x24\x18\x98\x47\xb7\x7e\x7d\xfd\x80\x7c\xf3\x49\x85\x37\xa7\x23\x4c\xb0\xeb\x28\xd8\x0b\x4b\xad\xdf\x96\x7e\xb5\xe5\x7e\xb7\x3b\x6e\x85\xcb\x75\x41\xa8\x17\xbd\x60\x40\xe3\x3a\xb2\xa7\x57\xd0\x1c\x02\xc8\xde\x2f\x2e\x30\x74\x36\x2c\x64\x74\x0f\xdd\x58\xb9\xf7\x12\xd8\x98\xfe\x86\x67\xd7\x7a\x5e\xcd\xa3\x37\xf6\xa4\x17\xe1\x6e\x84\xc0\xa1\xc2\x10\x6e\x05\x0a\x10\x08\xb5\x43\x67\xe8\xcf\x8d\x2f\x70\xf3\x13\x08\x52\xa0\xb5\x96\x5c\x03\xa7\xd3\x29\xbb\x0e\x81\xcb\xe5\xf2\xd1\xa3\x47\x45\x51\x20\xe2\x62\xb1\x78\xe1\x85\x17\xde\xc9\x21\xd3\x9e\x96\xde\x6b\x40\x48\x14\x45\xd1\x83\x07\x0f\x2e\x2e\x2e\x28\xe1\x27\xc1\x21\x19\x3e\x50\x54\x1a\x82\xc3\x3c\xcf\x45\x1d\x78\xa5\xb9\xda\x1f\xbe\xcf\x40\x0d\x8d\x61\x2d\x41\x02\x72\xd8\x06\x12\x93\x5b\x55\xa9\xe0\xc2\x39\x27\xbc\x73\x42\x4a\xef\xb4\xd3\xce\xbb\xad\xd3\xe1\x93\x84\x88\xbe\xce\x89\x48\x0e\x7a\xdb\x7f\x7e\xfb\x4a\x7a\x44\xf4\x00\xf0\x24\x45\x14\x40\x9d\x1f\x0a\xb6\x22\x1a\x63\x0c\xb6\x3a\x59\x29\x84\x54\x4a\x2a\xad\xea\x5f\xa5\x14\x25\x9a\xd8\x46\xdb\xd6\x5a\x29\xad\x94\x16\x5b\x9d\xb0\x64\x0c\x8c\x31\x55\x59\x2e\xaf\x2e\x4f\x1e\xbf\xf5\xe7\x5f\xfa\xe2\xc9\xe9\x39\x7d\x19\x16\x51\x09\x4e\x76\x9b\x22\x4c\x2a\x01\x3c\xc2\x13\x85\x26\x22\x7a\x82\x51\xae\x04\x77\x82\x03\x62\x55\x19\x29\xa5\xad\x2a\xf0\x5e\x2a\x15\x49\x21\x04\x8f\x75\xca\x18\xb3\xd6\x70\xce\xa7\x49\x3c\x4d\xe2\xa2\x32\x59\x51\x92\xf9\x0a\x67\x2c\x52\xb2\x70\x6e\xb9\xd9\x78\xeb\x00\x7d\x5e\x94\x59\x51\x64\x79\x61\x8c\x75\xd6\x1a\x0b\x4a\x44\x00\xf9\xf9\x5b\xaf\x4d\x67\x73\x44\xcf\x19\x93\x52\x48\xa9\x48\xa9\x8b\xd7\x81\xb0\x77\xb3\x0b\x7b\xcd\x0a\xbd\x3b\xe1\xfa\x4c\x19\x3a\xfc\x08\xfa\x58\x12\x5c\xe7\xa1\xac\x0f\xfc\x9a\x9b\x01\x12\xba\x7b\xc6\x31\x66\xe4\xb7\xf7\xf4\x2e\xea\xf4\x56\x83\x1a\xf3\xa0\x03\x7e\xbd\x4d\x0d\x49\x99\x23\x40\xd8\xed\x09\xeb\xc0\x4c\x28\xb0\xd1\x95\x3c\xe8\x20\x56\xef\x9e\x6e\x3b\xac\x0f\xd2\x58\x03\x77\xd9\xf5\x27\x35\x72\x69\xbc\xae\x3d\x6a\xf5\x04\x86\xf1\x0f\x06\x00\xaf\x77\x7f\xb7\x40\x15\x48\x57\x41\xe5\x60\xf7\x14\xce\xed\x62\x5e\xb7\x10\x56\xa3\x49\x04\x24\xe7\xbf\xe3\xe3\xe3\x2e\xbc\xad\x56\xab\x47\x8f\x1e\x65\x59\x06\x00\x49\x92\x3c\x78\xf0\x60\xf7\x88\x2d\xef\x16\x7a\x6f\x02\x21\xd4\xa2\xe1\x64\x32\x79\xfc\xf8\x71\x59\x96\xce\xb9\x26\x1c\x0a\x21\x68\xed\x90\x6c\xed\xaa\xaa\x6a\x3a\x5a\x84\xef\x16\x9b\x6b\x06\xa4\x26\xc4\x7a\x05\x50\x00\x63\xcc\x33\xcf\x18\xf3\x9c\x7b\xe1\xb9\xe3\x42\x08\xef\xe5\x16\xe4\x9c\xf7\xbe\xd6\xaa\x39\x47\x9a\xb6\xb0\x7f\x0b\x7a\x64\x7e\xea\xb7\xf6\xa8\xe8\x49\xe8\xc3\x60\x54\x12\xf4\xb1\x00\x00\x0d\xa6\xf9\x44\x36\x90\x82\x73\x29\x64\xbd\x20\x29\xe4\xd6\xad\x8f\xa0\x51\x2a\x29\xa5\x50\x92\x9c\x10\x28\x39\x83\xa9\x4c\x55\x96\xab\xe5\xd5\xc5\xd9\xc9\xe9\xa3\x87\xaf\x7d\xf5\x55\x04\x1e\x2b\x05\x80\xd6\xf9\xdc\x58\xc1\xf9\xb6\x43\x64\xdf\x02\x34\x31\x04\x44\x56\x0b\x85\xde\x54\x95\x75\x2e\x92\x1c\xd1\x47\x51\x9c\x48\x29\x04\xaf\xaa\x92\x6e\x53\x4a\xe9\x84\xe0\x5c\x48\x29\x01\x3d\x72\xe1\x39\xe7\x9c\x1b\x6b\xbd\xf7\x89\x56\x15\x83\x2c\x2f\x56\xeb\x8d\x77\x36\x51\xaa\x70\x6e\x53\x54\xab\x3c\x5f\x67\x59\x51\x96\xcc\x7b\x86\xb8\x29\x0c\x63\x38\x9f\xa8\xb3\x37\x5e\x7d\xfe\x43\xdf\x01\xde\x01\xe0\x56\x19\x58\x87\x06\xc6\x1d\xc4\x3e\xe8\x20\x5f\x13\xff\x5a\x3b\x5b\x7b\x00\x6e\xc0\xbf\x2e\x37\xec\xe5\x9e\x2d\x56\xdb\xc5\x06\xb8\x49\xf6\x1a\xc2\xbf\x2e\xe4\xc0\x75\xa8\x83\xeb\x08\xd7\xda\x3f\x44\x2d\xf1\x11\x3a\xf0\xd9\xaa\x3c\xb2\xa7\x85\xf7\xd0\xa7\xc9\x84\x01\xe4\x0b\x87\x70\x78\xf5\xae\x17\xff\xa0\x0f\xba\xd8\x28\xd4\x0d\xf5\x61\xbc\x9d\x21\xb4\xeb\x62\x5b\x6f\xb9\x17\x08\x87\x00\x8c\x88\xd0\x0b\x1b\x91\x5d\x9b\x6d\x76\x5b\xe8\xee\x09\x6a\x7f\xb2\xbd\x42\x44\x72\x8a\x88\xa2\xa8\x75\xa1\xf5\x7a\x4d\x29\x44\x00\x40\x6b\xfd\xfc\xf3\xcf\x53\x28\xb5\xee\x28\xbd\xdb\xe9\x3d\x0b\x84\x44\x94\xc8\x89\xa2\xfe\xd0\xb3\xbf\xba\xba\x5a\xad\x56\x41\x3a\x24\xb3\x78\x72\xc3\xef\xc2\x61\xeb\x91\x33\xa8\x73\x14\x32\x00\x60\x82\x0b\xc6\x18\x72\xce\xbc\xe7\xde\x7b\x21\x68\x96\x25\xb7\xcb\x7b\xde\x37\xb4\x9c\xf4\x02\x36\x58\xb5\x87\x2d\xcb\xf6\xb5\x95\x0d\xad\x04\x02\xbd\xae\x54\xd8\x5e\x36\xfc\x61\x0c\x80\x71\x4e\xdc\x85\x93\xe3\x60\x0d\x81\xdb\xb5\x21\xb1\x75\xeb\xdb\x1a\xea\x70\x21\x04\xc5\x9a\x61\x1c\x01\x4c\x55\x55\x65\xb1\x59\x2f\x97\x97\xe7\x17\x67\xa7\x17\x67\xa7\x17\x67\x67\x16\x91\x73\x56\x59\x67\x6b\x6c\x10\x4f\x58\x15\x00\x20\x30\x56\x63\x35\x22\xa2\xf3\xc8\xc0\x7b\xe7\xf3\xa2\x88\x71\x2b\x3e\x4a\xa5\xd0\x6b\xef\xac\x10\xd2\x39\x49\x88\xe5\xdc\xb6\x27\x84\xda\x5a\xf2\xbc\x70\xd6\x61\x59\x55\x9c\x41\xac\xc4\x79\xb6\x71\xd6\x79\x67\x8d\x31\x79\x51\x1a\x63\xbd\x43\xc5\x00\x01\x04\x63\x79\xe9\xe6\xa9\x16\xe5\xa5\x29\x0b\xf4\x9e\x33\x10\x9c\x2b\x25\x85\x94\x8c\xf1\x2e\xfe\x51\xe7\x9b\x85\x2e\xfe\x75\x91\xaf\x85\x88\x30\xcc\x9e\xba\x28\xd8\x7d\xe5\x02\xd7\x66\x1d\xf0\xdb\x11\x81\xba\x9b\x37\x2a\x3c\x7b\x61\xb5\xb7\x30\xd2\x0d\x68\x40\xe6\x50\x83\xdd\x7e\x76\x2b\x77\xa9\x35\x3e\x30\x8c\x40\xdd\xc2\xf8\xfe\xa1\x73\x5b\xcf\x8e\x5d\x47\x8b\xa1\x76\xc2\xa1\x91\x42\xab\x1d\xe8\xbc\x06\xe3\x10\x38\xf2\x82\xc1\xa8\x16\x14\xea\x95\x3c\x68\x0c\x78\xb7\xb5\x56\x0b\xcd\x43\x41\x04\x0c\x10\x48\x26\xf7\x21\x6e\x73\xb8\x53\xef\xfd\x6a\xb5\x3a\x39\x39\x21\x08\x14\x42\xec\xef\xef\xbf\xf0\xc2\x0b\xef\x8d\xe5\xc0\x5e\x7a\xcf\xde\x58\x20\xce\xf9\xfd\xfb\xf7\xf7\xf6\xf6\x5e\x7f\xfd\x75\x8a\xd9\xea\xbd\x5f\x2e\x97\xab\xd5\x8a\x12\x59\x28\xa5\x92\x24\x89\xe3\x98\x82\xb4\x05\x7d\x69\xcb\xf5\x70\xdb\xdc\xf6\x3b\x06\x86\x02\x01\xb9\xaf\xf5\x24\x9c\x5c\xbe\xc9\xc7\xa2\xd6\x73\xe2\x76\x85\x2f\x6c\x35\x5e\x4f\x84\xad\xfc\x07\x35\xe0\x85\x22\xd6\xe0\xd7\xfc\x12\x02\x33\x02\xc6\x6a\xe6\x48\xe1\xd4\x04\xaf\x05\x3e\x29\x04\xaf\x03\x8d\x52\xa0\x35\x52\x97\x71\x7a\xbf\x8d\xa9\xaa\xaa\xc8\xb3\xcd\x7a\x79\xb5\xbc\xbc\x58\x5e\x5d\xae\x57\x2b\x53\x55\x9c\xf3\xca\x23\x20\x44\x4a\x72\x52\x82\x02\xa0\x47\xeb\x08\x9a\x51\x4b\x51\x38\x6f\xbd\x17\x5c\x39\xef\x39\x23\x57\x42\x6e\x4d\x55\x01\x7a\x67\x85\x94\xd6\x1a\x29\x8d\x54\xaa\x8e\xb6\x26\xab\xca\x68\xa5\xb8\x14\x4a\x2a\x2e\xa4\x17\x02\x01\x18\xfa\xcb\xab\xb5\xf3\x3e\x51\xca\x18\x23\x18\x73\xe8\x2b\x63\x4a\x53\x09\x06\x92\x33\x07\x58\x54\x56\x70\xe0\x8c\x79\x8f\xab\xcc\x44\x5a\xe4\x57\x27\xfe\xce\x11\x03\x10\x82\x93\xbc\xcb\x6b\xb7\xc2\x26\x1c\xc2\x80\xf0\x37\x0e\x84\xbd\xdc\xc7\xf7\x79\x56\xc0\x00\xf8\xc1\x75\x16\x19\xe0\xe1\xda\x2b\x33\x80\x10\x5d\xe0\x19\x57\x4b\x0e\xa1\x4e\xf3\x12\xa1\x3c\x52\xe8\xdd\x1c\x6a\xaa\xd5\xc9\x66\x85\x70\xa8\x7b\x56\x6b\x7c\xba\xe0\x84\xc3\xc2\xdc\x2e\x98\xd4\x02\xa7\xa1\x06\x59\x63\x39\x70\xbc\x63\x6c\x87\xb5\xc0\x5e\x78\x1b\x2a\x0f\xbd\x3f\xbd\x40\xd8\xc2\xad\x66\xa1\xb9\x10\x18\x6e\xa7\x0b\x75\xbd\xef\x33\x51\xd3\x1c\xd4\x5a\x1b\xc7\xf1\xf3\xcf\x3f\x3f\x99\x4c\xf8\x75\xb3\x1a\x5a\x48\x22\xdb\x7b\x44\xa4\x85\xa4\xbd\xbd\xbd\xa6\x27\xe2\x7b\x92\x9e\xfa\xde\x9e\x36\xfe\xf7\x3b\xa7\xe5\xc3\xc3\x43\x0a\xcc\x46\xfe\x9e\x88\x48\x96\xa5\x94\x2c\xb4\x4e\x2b\xa4\xbd\xf7\x14\x98\xa6\x2c\x4b\x72\x0b\x0b\xae\x87\xa1\x41\x06\x0c\x19\x32\x64\xc0\x39\xab\x35\x99\x88\x08\x20\xae\xb3\x59\x1f\x5e\x46\x08\x2f\x68\xe0\xb6\x88\xa4\x79\x0c\xe0\xd7\x12\xfd\xa0\xfe\x57\x8b\xa2\x01\x0c\xb7\x72\xc2\xd6\x89\x83\x73\x1e\x40\x6f\x2b\xc9\x52\xd0\x35\x46\x06\x96\x74\x69\xe7\xac\xa9\xaa\x22\xcb\x37\xeb\xd5\x7a\xb5\x5c\xaf\x96\xf9\x66\x5d\x15\x19\x07\x48\x22\x8d\xce\x3a\x06\x00\x60\x3d\x0a\xce\x38\x80\x63\x60\xbd\xe7\x35\x0b\x10\x8c\x33\x00\xe7\xd1\x7a\x04\xf0\x95\xf5\x9c\x83\xa8\x98\x94\x26\xd5\x4a\x2b\x29\xa4\x94\xd2\x4a\x6b\x38\x45\x59\xd5\xba\x74\x3e\xd6\x51\x1c\x47\xde\x39\x21\x24\x17\x1c\x80\xad\x37\xd9\x26\xcb\x8d\x75\x4b\xef\x9d\x73\x45\x59\xa2\x77\x64\x79\xc3\x00\x39\xa0\xe4\xac\x40\x5f\x55\x4e\x72\x8e\x00\x9c\xb1\xf3\x65\x79\x74\xfe\xd8\x7f\xf0\x23\xac\xb6\x08\x08\xc1\x82\x71\x37\xb1\xaf\x97\x60\x40\x83\xd4\xe5\x2c\x61\x0c\x7b\x19\x25\xeb\x40\x60\x93\x35\xb7\x80\xa1\x25\x48\xc1\xf0\xca\xdc\xb8\xbe\xb1\xdb\x72\x77\xb3\x75\xa8\x5b\xad\xb7\xd0\x6d\xbc\x59\xee\xaa\x58\x5b\x8d\x84\x1b\xc7\x1d\x5c\x11\x58\x07\xb4\x5a\x75\xb0\x03\x09\xcd\xd6\x7a\xdb\xc1\xbe\xf8\x9f\xbd\x8f\x09\xfb\xa0\x91\x75\x9e\x60\xf7\xba\x4f\x55\xee\xbe\x4e\xdd\x43\xbd\x2f\x5b\xeb\x97\xd7\xc6\xed\xbd\xef\x6a\xef\x55\xb0\x13\x1a\x06\x11\x67\xb3\xd9\xfe\xfe\x7e\x1c\xc7\xad\x11\x76\xce\x9d\x9f\x9f\x9f\x9d\x9d\x95\x65\x49\x97\xa3\x70\x4b\x01\xff\xde\xbd\x9c\x7f\x17\x92\x4f\xb5\xec\xf9\x8d\xcb\x82\xf1\x4d\x68\x99\x31\x46\x11\x67\xae\xae\xae\x2e\x2e\x2e\x5c\x9d\x5c\x9e\xfc\x0e\x29\x72\x77\x9a\xa6\xe4\x89\x3f\x9d\x4e\xab\xaa\xa2\x43\x4d\xf3\x74\x82\x1b\xdc\xb6\xb7\x45\x28\x04\x64\x04\x6d\xb5\xa3\x7d\xf8\xb7\x45\xbe\x20\xf9\x61\xbd\x1b\x90\x61\x70\x4b\x68\xe8\x5b\xa9\x61\xb6\x6d\xbe\x16\x3f\xeb\xbf\x74\xac\xc5\x1b\x39\xe7\x8c\x72\x42\x30\xc6\x9e\xf0\xca\xe6\x20\x78\xef\xac\x31\x65\x91\xe7\xd9\x3a\x5b\xaf\xb2\xf5\xaa\xc8\xb3\xaa\x28\x8c\xa9\xa4\x92\x4e\x88\x48\xab\x8d\xb5\xc6\x7a\x04\x82\x77\xf0\x88\x0c\x80\x73\xb6\x4d\x3d\xc1\x80\x33\xb0\xde\x7b\x83\x15\x03\x06\x10\x2b\xc1\x04\xac\xf2\xb2\xb2\x76\xa2\xb5\x14\x46\x4a\xa1\xa4\x14\x52\x29\x65\x9d\x77\x00\xec\x22\x2f\x0e\x60\x26\xa5\x12\xc2\x32\xce\x81\x31\xc5\xc0\x3b\x5b\x16\x45\x65\x6c\x65\x2d\xa5\xf1\xe0\x80\xb5\x93\x7b\xad\xfc\x61\x4c\x70\x4e\xd3\x8c\x2c\xb7\x97\x67\x17\xe8\x1c\xed\x97\x82\xae\xf2\x64\x99\x10\x3b\x1a\xce\xa6\x01\xe7\x08\x0a\x0e\x71\x10\x1a\xb4\x5e\xe6\xdb\xa2\x71\x1e\x3a\x84\x25\x43\xc0\x73\xa3\x8e\xb1\x0b\x3c\xcd\xc2\xc8\x6f\x73\xb3\xb7\x57\x23\x8d\xdf\x78\xd1\x66\xfb\x61\xac\x5a\xd7\xed\xad\x7c\x23\xdd\x58\x8d\x0d\xc7\xc1\xe8\x3d\xb7\xd5\xc9\x40\xbd\x8d\x74\x0f\xf5\xbe\x12\xe3\x15\x86\x5e\xb0\x16\x86\x75\x7b\xd5\x1c\xc9\xde\x77\x75\x68\x33\x7c\x02\x4d\x11\x30\x8a\x22\x8a\x91\x1d\x66\x90\xe1\x42\x45\x51\x9c\x9d\x9d\x5d\x5c\x5c\x18\x63\x18\x63\x14\xbd\xf2\xde\xbd\x7b\x14\x47\x8d\xe8\x5d\xcd\xf9\x77\xa1\xf7\xb2\xb4\xdb\x4b\x9c\xf3\xfd\xfd\xfd\xd9\x6c\x76\x71\x71\xb1\x5c\x2e\x7d\x1d\x8e\x8f\xc2\x37\x5f\x5d\x5d\x91\xbe\x94\x1c\xf3\xa2\x28\x22\x83\x1a\x12\x10\x65\x9d\x6f\x6f\x6b\xa6\x55\x8b\x6d\x0c\x18\xd0\x44\x39\x28\x33\xbb\x1f\x5a\xfd\xd3\x3e\x50\xab\x41\x9f\x68\x5d\x01\x02\xc4\xd6\x1c\xa7\xf5\x97\x5d\xfb\x0b\x4f\x38\x56\xef\x2d\x7b\xef\xad\x31\x55\x59\x96\x79\x9e\x67\x9b\x3c\xdf\x94\x45\x51\x95\x85\xb1\xc6\x7b\x1f\x27\x89\x72\x0e\xbd\x2f\x45\xe5\x3d\x22\x80\xe0\xcc\x21\x56\xce\x71\xc6\x38\x32\x04\x20\x66\x63\x11\x38\x83\xdc\x5a\xce\x58\xa2\x25\x02\x43\xcf\x04\xe7\x95\xf1\x80\x95\x14\x5c\x5a\x1e\x2b\x27\xad\x75\x4e\x29\xeb\xb8\x10\x9c\xf1\xcd\x26\x53\x4a\x69\xa5\xb8\xe0\x08\xac\x28\x4d\x9e\x65\x45\x45\x9f\xa7\x63\x80\xe8\xdd\xba\x28\x9d\x73\x9c\x81\x73\x0e\x11\x00\x51\x0a\x0a\xd0\xc6\x10\xd1\x79\x58\x2e\x37\xde\x7b\x00\x0c\x66\x42\xcd\x78\x19\xbd\xc0\xb6\x23\xf2\x75\xc1\x6f\x88\xd9\x75\x87\x97\x0d\x04\xd6\x1a\x41\x1a\xe8\x68\x11\xc7\xc1\x0f\xfa\xd0\x08\x1a\x50\xd4\xbd\x6e\xeb\xe8\x10\x7a\xf5\x6e\x0e\x1d\xea\xbd\x44\xef\xcb\xd6\xbb\x9f\x5d\x17\x10\x9f\xa1\x30\x72\x89\xa1\x2b\x76\x37\xbb\x68\xd7\x6c\xbf\x75\xca\xee\x50\xd7\xbb\x7f\x1c\xed\x5a\x6f\xdd\x8d\x97\xe8\x45\xbb\xee\xfe\x60\x91\x10\xf0\x8f\x73\x3e\x9b\xcd\xf6\xf6\xf6\x9a\x22\x20\xd6\xba\x8d\xd5\x6a\x75\x7a\x7a\xba\x5a\xad\x88\x0d\x4a\x29\x8f\x8e\x8e\x8e\x8f\x8f\x9b\x10\xf8\x3e\xa1\xf7\x1d\x10\x12\xd1\x23\x5f\x2c\x16\x21\xb9\x36\xbd\x25\xce\x39\x5a\x3e\x8c\xa2\x68\x36\x9b\x51\x72\x51\x0a\x35\x19\x04\x44\xc6\x58\x13\x11\x6b\xfe\xf1\x44\x66\x03\xa8\xb5\x9c\x8c\x35\x20\x31\xc0\x1c\x5c\x5b\x08\x6c\x7c\x7d\xac\x16\x08\x83\x10\xd8\xd5\x42\xb1\x70\x98\x5d\x3f\x79\x80\x10\xd1\x59\x5b\x55\x55\x51\xe4\x45\x9e\x15\x79\x5e\x16\x45\x55\x95\xd6\x5a\x5a\xbf\xb4\x8c\x27\x71\x5c\x56\x95\x94\x92\xc0\x06\x11\x04\x63\x4a\x08\xe7\x3d\xe7\x4f\xd8\x83\x47\x74\x1e\x3c\x82\x12\xcc\x79\x6f\x9d\xf7\x8c\x71\x06\xc4\xc9\xe9\x5a\x95\x75\xce\xa3\xf3\xde\x1a\x43\x36\x3b\xde\xd9\x8b\x95\x9b\xc4\x71\x12\x47\x1e\x61\x95\x97\x79\x51\x72\x60\xe8\x1d\x7a\x07\x80\xeb\x2c\xa7\x8c\x8c\x72\x1b\x59\xdb\x0b\x4e\xc8\x1b\x46\x12\x01\xe8\x42\xb4\x06\xfa\x24\xf4\x73\x2f\x5b\x19\x99\x29\xf7\xee\xef\x9e\x0b\xd7\x19\x53\xd8\xc3\xfa\x56\xa1\x5a\x80\xd4\x45\xaf\xde\x3d\x4d\x38\x84\x3e\x3b\xcf\x11\xd0\x6a\xee\x6f\x5e\x17\xaf\xeb\xfa\x46\x7e\x77\xa9\xd6\xba\xb5\xd6\xfd\xb6\x46\xa3\x17\xb1\x9a\x43\x17\x7e\x5b\x8d\xf7\x8e\x7f\xb7\x03\xdd\x91\x0f\xa7\xf4\xf6\xa7\x79\x4a\x6f\xcd\xd6\x29\xe1\xac\x1b\xc1\x69\xa8\xdc\x8b\x7f\x23\xbf\x37\x36\xd5\xac\x3f\xfe\xea\xe2\x75\x43\x50\x8a\x8e\x36\x9d\x4e\x29\x2d\x41\xd0\xa9\x86\x5f\xe7\x1c\x25\x58\xa6\x85\x40\xa8\x73\x18\xbc\x3f\x21\x90\xe8\x7d\x0a\x84\x44\x5a\xeb\x7b\xf7\xee\xed\xed\xed\x5d\x5c\x5c\x34\xc3\x65\x21\x22\x49\x81\x42\x08\x8a\xbc\x4c\x61\x88\xc9\xbc\x98\x4c\x4c\x37\x9b\x4d\xd3\xa6\x66\xbb\x88\xd8\xf8\x0a\x61\xfb\xe1\x3d\x41\xac\x27\x07\x1b\x7d\xc0\x6d\xf5\x50\x89\xb6\xfa\xb9\x52\x97\x21\x36\xa9\xc9\x59\x02\x79\xef\x8c\x31\x55\x59\x94\x45\x5e\x14\x79\x55\x15\xa6\xaa\x9c\xb5\xb8\xb5\x40\x43\x87\xe8\xb9\xa0\xa0\x34\xc6\x18\xd2\x2f\x96\xd6\x21\x12\xaa\x33\xc6\x98\xf7\x68\xbd\x57\x82\x03\x03\xce\x84\x47\x90\x8c\x19\xe7\x19\x63\x9c\x81\xf3\x68\xb8\xd7\x52\x30\x06\x0e\x6d\xa2\x84\x96\x82\x33\x26\xad\xa3\x50\xe4\x8a\x8b\xb2\xc8\x96\xeb\x4d\x1a\xeb\x4d\x5e\x15\xc6\x46\x52\x28\x06\xc0\xd0\x18\x2b\x19\xe4\xce\x73\x40\x64\xdb\xce\x0b\xce\x73\x63\xd9\x36\xba\x0d\x63\x0c\xa4\x52\xec\xc9\x7a\xa8\xe0\xb5\x44\xd8\x64\x19\x23\x5c\x66\x04\x29\x87\x4e\xe9\x8e\x64\x6b\x9c\x5b\x9b\xe3\x18\x36\x84\x88\xdd\x0a\xcd\x73\x5b\xe6\x36\xad\x4b\x0f\xed\xbc\x11\x32\x87\x76\x0e\xdd\x23\xf6\xad\xf6\x0d\x35\x3b\x02\x90\x43\x08\x34\x02\xa2\xa1\x7e\xeb\xb9\x74\x4f\x6c\xdd\x57\x00\xd4\x56\x07\x5a\x2d\x34\x2f\xd1\x6c\x7f\xf7\xf2\x33\xe0\x5f\xef\x1c\xab\x5b\x18\x02\xbf\x16\xfe\xf9\x3a\x2e\x68\x50\x81\xd2\x14\x9f\x54\xa0\xad\xa1\xc8\xb2\xec\xf4\xf4\xf4\xf2\xf2\x92\x1c\x30\x18\x63\x52\xca\xae\x22\xf4\x7d\x48\xef\x6b\x20\x04\x00\xc6\x58\x1c\xc7\xc7\xc7\xc7\x45\x51\x5c\x5c\x5c\x90\xd3\x68\x78\x1d\xc9\xdd\xe2\xea\xea\x8a\x04\x44\xca\xef\x4a\xc9\x48\xb1\x5e\x5c\xcc\xf3\x3c\x44\x71\xec\x06\xa9\xa9\x2f\x72\xed\xa2\xd8\x64\x58\x75\x8d\xee\x64\xb6\xc5\x77\x68\x4f\x8b\x7b\x5e\x6b\xb6\x31\xf3\xc5\x5a\x55\x62\x8d\x35\xa6\xaa\xca\xb2\x2a\x8b\xaa\x2a\x6d\x65\x9c\xb3\xe4\xcf\x51\x03\x2f\x5b\x1b\xbb\x48\x92\xa2\x2c\x85\x2c\xbd\x31\xdb\xb4\x52\x0c\x94\xa8\xd7\xe7\x1b\x53\x75\x0e\x08\x00\xce\x83\x07\x64\x1c\x38\x83\xca\xba\x1c\x51\x59\x97\x6a\xe9\x3d\x5e\x1a\x37\x8b\x95\xe4\xdc\x72\x2f\x1c\x93\xdc\x09\xc1\x4b\x8b\xc6\x7b\x6b\x0c\xe7\xcc\x56\x55\x59\x60\x24\x85\xf5\x9e\x42\xaf\x31\xb8\xf6\x91\x33\x00\x2d\x78\x3d\x47\x40\xc6\xf8\x62\x7f\x8f\x30\x95\xa4\x41\x5a\x3e\x04\xb8\xc6\xc2\x76\xc1\xb9\x5e\xea\xd6\x6c\x31\xc7\x2e\xb3\xee\x42\x48\x17\x60\x76\xc7\xbf\xee\x29\xdd\x36\xe1\xfa\x6b\x34\x84\x61\xbd\xa0\xd8\x5b\xb3\xb5\xbf\x0b\x5d\x5d\x7c\xea\xc5\xcb\x26\x9f\xc5\xeb\x12\x58\xab\xd0\xaa\x3c\xd4\xec\x48\x7f\x7a\xfb\xdf\xdb\xa5\xde\x46\xba\xcf\xf1\x9b\x89\x7f\x37\x96\x5b\x50\xd7\xdd\x83\x0d\x6a\xe2\x5f\x55\x55\x5a\xeb\xfd\xfd\xfd\xbd\xbd\xbd\x90\x20\x09\x1a\xe3\x6c\xad\x25\x43\x98\x3c\xcf\xc3\x68\x08\x21\x8e\x8f\x8f\xef\xdd\xbb\xf7\x2e\x4a\x9f\xfb\x8d\xa3\xf7\x3b\x10\x12\x31\xc6\x92\x24\x49\x92\xa4\x28\x8a\xd5\x6a\x45\x21\xd5\x9b\x9f\x2b\xa5\xb9\xe1\x9c\xd3\x0a\x22\x29\xdc\xd3\x34\x9d\x4c\x26\x64\x65\x4a\x59\x6f\x42\x8c\xc7\xa6\x1b\x62\x97\xd3\x51\x9b\xe1\x65\x0d\xdd\x18\xfa\xd4\x7b\xa7\x90\xe3\x88\xc8\x58\x08\x82\x56\x99\xaa\xac\xaa\xd2\x54\xc6\x5a\xeb\xbc\x43\x8f\x00\x18\x00\x98\x71\xb6\x31\x36\x15\x3a\xd6\xd1\x15\xcf\x2a\x5b\x92\xfb\x47\xc8\x3e\x81\x08\x8c\xc1\xd6\xf8\xa4\x99\x3b\x82\x01\x3a\x04\x00\xce\x38\x67\xe8\x3c\x56\x76\x6b\xc1\xb9\x29\x6d\xac\x04\x67\x4c\x72\x66\xb9\x07\xcb\x00\x41\x70\x8e\xd6\x54\x88\xe8\x5c\x5e\x1a\x2f\x05\x02\x73\xde\x3b\xe7\xd1\xa3\x10\xd7\xb0\x5f\x52\xb4\x71\x04\x00\xa6\x95\xdc\xbb\x73\x57\xe9\x68\x1b\x1f\x40\xc8\x10\x7d\xbb\x35\x3e\xbd\x03\x75\xe3\xf0\x42\x3d\x14\x43\x68\x37\x72\x74\x17\xfc\x6b\x3d\xa6\xa1\xa3\xcd\x2b\xee\x82\x40\x23\x47\x77\xa4\x71\x64\xed\x2d\xb4\x38\xec\x2e\xb3\x8d\x2e\x1c\x0e\xb5\xd9\xea\x5b\x73\x7f\x2f\x70\x76\xdf\xfc\xdd\x6f\xa1\xb7\xdb\x43\xb7\xb3\x0b\xfe\x8d\xd4\xe9\x6d\x73\xa8\x85\x91\x4d\xbc\x9e\x26\xde\x18\x43\x81\x41\x0e\x0e\x0e\x28\x3b\x12\xbb\x3e\x81\x26\x3f\xb1\xf3\xf3\xf3\xcb\xcb\xcb\xe6\xd5\xa5\x94\xfb\xfb\xfb\xf3\xf9\xfc\xce\x9d\x3b\xdd\xd1\x7b\x7f\xd2\x2d\x10\x5e\xa3\x38\x8e\xef\xdf\xbf\xbf\xd9\x6c\xde\x7a\xeb\xad\x96\xd1\x11\xab\x97\x97\x57\xab\x95\x52\x8a\x16\x0e\xb5\xd6\xb4\x1c\x3d\x9b\xcd\xac\xb5\x21\x67\x3a\x6f\x44\x43\xae\x9d\xf9\x9e\x4c\x48\x7b\x67\xa6\x4d\x06\x81\x1d\x7d\x4e\x8b\x01\x85\x16\xe8\xbd\xef\x43\x59\x70\xde\x6f\x23\xe8\x56\x95\x35\xc6\x39\x8b\xde\x03\x92\xc6\x93\x43\x1d\x94\x8b\xfa\x77\x9a\x15\x47\xb1\x9e\xa5\x89\xb3\xd6\x98\x0a\x11\x05\xe3\xdb\x86\x19\x30\x44\x2d\x05\x03\x00\x04\xe7\x91\x74\xc0\x88\x58\x59\xe7\x11\x95\x10\x94\xaa\x89\xda\xe6\x9c\x8e\x9f\x47\x43\x00\x00\x20\x00\x49\x44\x41\x54\x39\xc4\xd2\x7a\xce\xc0\x32\x2e\x38\x38\x0f\x82\x83\xe0\x3c\xab\x2c\x22\x08\xce\x00\x60\x5d\x1a\x2d\xb8\x47\x00\x44\x25\xf8\xd6\xb0\x96\x31\x47\xeb\xf6\x8c\x13\x5c\x73\x80\x38\x49\xee\x3e\xf8\x40\x92\x4e\x74\x14\xc9\x6d\x30\xbc\x27\x31\xa5\xb0\x23\xb8\x34\xc7\x6d\x48\x08\x18\x17\x32\x5a\x0c\xb4\x97\x9f\x76\xc7\x7c\x1c\xe7\x46\x30\x6f\x88\xa1\x77\x5f\xbf\x56\x37\x86\x68\x68\x4c\xc6\xdb\x7f\xaa\x6a\x23\xf5\x77\xac\x83\x1d\xf1\xb1\xf9\xf2\x37\x8f\xf6\xde\x4e\x8b\xe9\xdf\x78\x2f\x43\x98\xd4\x5b\xee\x05\xc2\x1b\x51\xf0\x19\x2e\x11\x10\x6e\xa4\xe5\x96\x09\x0c\x45\x6e\x9a\x4e\xa7\x7b\x7b\x7b\x14\x0e\xad\xdb\xed\x3c\xcf\xc9\x10\x94\x5c\xc5\xc2\x80\x68\xad\xf7\xf6\xf6\x66\xb3\xd9\x7b\x32\x3a\xcc\xd7\x43\xb7\x40\xd8\x43\x93\xc9\xe4\xa5\x97\x5e\xca\xf3\xfc\xd1\xa3\x47\xa7\xa7\xa7\xcd\xef\x8d\x5e\x29\x6b\xed\xe5\xe5\xe5\xd5\xd5\x15\x25\x01\x26\x2b\x53\xf2\xbb\xa0\x24\x88\x14\xb9\x8d\x84\xc8\x60\x56\x13\x2c\x6b\x5a\x92\xe2\x38\x0f\xea\x65\xe2\xbd\x0c\xa2\xc5\xe2\x09\x05\xad\x35\x94\x3f\x21\xdc\xc5\x36\x73\x06\x05\xa4\x51\x52\x49\xa1\x94\x5c\x96\x65\xe6\xc4\x34\x4d\xbd\x77\x59\xc6\x8c\x31\x4f\x3a\x50\xeb\x72\x01\x00\x01\x2a\xe7\x84\x67\x5a\x0a\xef\xd1\x79\x2f\x39\x37\xce\x71\xc6\x80\x33\x72\xbf\x27\x9d\xa5\xf7\x9e\x31\x10\x0c\xad\xf7\xd4\xc5\x58\x4a\xeb\xb0\xb4\x76\xeb\xf0\xcf\x98\x75\xdb\x61\xf5\x88\xce\x23\x27\x13\x21\x04\xe3\x1c\x97\x8c\x31\x60\x8c\x09\x21\x1e\x7c\xf0\xdb\xf7\x0e\x8f\x26\x93\x49\x9c\x24\x5a\x47\x21\x30\x6c\x77\x04\xba\xe3\x00\x1d\xb6\x78\xe3\xfe\xd6\x9e\xe6\xfe\x5e\x30\xeb\x62\xde\x8d\x35\xbb\x70\xb8\x0b\xed\x5e\x79\x17\x58\x6d\x6e\xf6\x0a\x2b\xdd\x3a\xcf\xb0\xa7\x75\xc5\x66\x85\x66\xa1\xdb\x81\xee\xb8\xb5\xda\x69\xed\x6f\xc1\x6a\xef\xad\x3d\x5b\xb9\x17\xa8\xba\x47\xa1\x33\x8c\xbd\x4d\x75\x7f\x87\x36\x49\xf8\x0b\xf8\xe7\xbd\x27\x18\x9b\xcf\xe7\x49\x92\x34\xc7\x21\x8c\x21\xad\xef\x5c\x5c\x5c\x90\x0a\xb4\x39\x44\x51\x14\xed\xef\xef\x53\x28\x6d\xb8\xa5\x0e\xdd\x02\xe1\x20\x25\x49\xf2\xe2\x8b\x2f\x3e\xf7\xdc\x73\x8f\x1f\x3f\x3e\x3d\x3d\x25\x6c\x68\x21\x22\xa5\x48\xbd\xb8\xb8\x88\xa2\x88\xa2\xb5\x91\x0f\x3e\x99\xd8\x38\xe7\xc8\x67\x81\xde\xcb\xa0\x35\x6d\x86\x33\x1d\x62\x9d\x2d\xea\x02\x5e\x28\xb3\x8e\x72\x09\x91\x94\xa2\xc6\x6e\x4d\xc8\x2c\xa2\x27\x75\xe8\x16\x89\x85\x10\xe4\xf0\x27\xb5\xd6\x4a\x6b\xa9\x95\x7a\xbc\xc9\x9f\x9f\x24\x71\x14\x59\xeb\x10\xb1\xce\xf0\x89\x88\xe0\x11\xad\xf3\x8c\x31\x25\x38\xa5\x6a\x02\x00\xeb\x3d\x92\xb9\x23\xa2\x71\x8e\x33\x49\x8a\x53\x0f\x74\x29\x04\x00\xcf\x10\x01\x4a\xe3\xa8\xa7\x9c\x33\x29\x44\xad\x70\xdd\xe6\xb4\x40\x84\xca\x39\xe7\x7c\xac\x24\x00\x0a\xce\x10\x04\x02\x92\x01\x6e\x3a\x49\x3f\xfc\x83\x7f\x71\xbe\xb7\x37\x99\xce\xe2\x24\x8d\xa2\x58\xd6\xde\xf4\x43\xc3\xb2\xcb\xa7\x3e\x04\x7b\x23\x85\xa1\xc7\xb4\x0b\x1c\x76\x77\x0e\xf5\x6a\x48\x48\x7d\x2a\xea\xb6\xc3\xfa\x3c\xdc\x77\xc4\xbf\x1b\xeb\x34\xaf\xd2\x5b\xee\xdd\x89\xdf\x94\xf8\x9f\x30\x70\xbf\x37\x82\xdf\xc8\x2f\x7c\x7d\xf8\x37\x02\x81\xd8\xb0\xff\x0c\x59\x76\xc9\x05\x70\x3e\x9f\x93\xfe\xb3\x45\x88\x58\x96\xe5\xe5\xe5\xe5\xc5\xc5\xc5\x66\xb3\x69\x3d\x1d\xce\x79\x92\x24\x7b\x7b\x7b\x01\x3b\x6f\xa9\x97\x6e\x81\xf0\x06\xa2\xec\xcc\xc7\xc7\xc7\x17\x17\x17\x8f\x1f\x3f\xce\xb2\x0c\x3b\xaa\x1b\x00\x20\x47\xc3\xf3\xf3\xf3\x26\x22\x72\xce\xd3\x34\x4d\xd3\x94\x5e\x56\x5a\x68\xf4\xde\xb7\x10\xb1\x09\x8a\xd8\xa7\xe7\x84\xeb\x53\xe0\x71\x56\x85\xdb\x85\xf4\x2d\x04\x7a\xb7\x0d\xe7\x0d\x08\xc0\x39\x30\xce\xe5\x36\x3e\x80\x56\xba\xd2\x5a\x47\x71\x54\x54\x71\x64\x8d\xb5\x0f\x37\xf9\x71\x1a\xa5\x5b\x27\x0a\x0c\xe1\xed\x49\x74\x53\x82\x03\x30\x5e\x3b\x4b\x0a\xce\xac\x87\xca\x39\xc1\x98\xf3\x1e\x01\xad\xf3\x08\xa8\xa5\xdc\x0a\x91\x00\x1e\x01\x00\xb4\x14\xa5\x75\x99\x31\x5a\x08\xc1\x39\x1d\x22\x36\x40\x2a\x5c\xe3\x3c\xdf\x76\x1e\x3c\x02\x03\xa0\x38\x01\x49\x1c\x7d\xef\x47\x7f\xf4\xfe\x0b\x2f\xce\xe6\x8b\x64\x32\x8d\xe3\x44\x45\x9a\x86\xae\x17\x30\x46\x50\x64\x84\x77\x77\xc5\x94\x11\x90\xeb\xdd\xec\x85\xbd\xde\xa3\xd0\x60\xd6\xdd\x02\x74\x10\xeb\xd9\x0a\xdd\x76\xba\x1d\xe8\x1d\x93\x67\xae\x33\x74\xad\x5d\xfa\x33\x42\xec\xfa\x5a\x40\xab\xd0\xea\xc6\xee\x38\xd7\x2a\x77\x85\x3c\xe8\x83\xba\x11\xf0\x1b\x69\xa4\xb7\x85\x00\x7b\x50\x7f\xb0\x2d\xfc\xe3\x9c\x53\x6a\x71\x32\x59\x6f\xb5\x43\x83\x50\x96\xe5\xc5\xc5\xc5\xe5\xe5\x25\xe1\x5f\x6b\x34\x68\xc9\x66\xb1\x58\xf4\xc2\xe7\x2d\xb5\xe8\x16\x08\x77\x22\xf2\x3b\x3c\x3c\x3c\xa4\x58\xb4\x57\x57\x57\xe4\x82\xda\xfd\x2c\x09\xf0\xce\xcf\xcf\xb5\xd6\x64\x4d\x13\x45\x11\xab\x8d\x71\x00\xc0\x18\x13\x3c\xf4\x19\x63\xbd\x62\x22\x74\xb8\xea\x10\x28\x42\x87\x11\x10\x80\xd5\x59\x65\xeb\x0c\x18\x88\x04\x3f\x9c\x73\x41\xf2\xa0\x56\x8a\x50\x30\x2e\xe3\xb2\x34\xce\x5a\xe7\x36\x99\x3f\x29\xaa\xbb\x71\x4c\x0d\x17\x45\xe1\x9c\x03\x40\x29\x18\x63\x9c\x93\x7b\x3b\xa2\xb1\xdb\x20\x2f\xac\xde\x03\x00\xde\x23\xa5\x75\xa7\xce\x01\x5c\x0b\x2a\x20\x38\x2f\x9d\x33\xc6\xc6\x52\x72\x46\xe7\x6e\x51\x90\x01\x28\xce\x39\x63\x08\x50\xd9\x6d\xb8\x1f\x60\x32\x8d\xa2\x0f\x7f\xcf\xf7\x7d\xef\x5f\xfa\xb1\xc5\xde\xfe\x74\x36\x4f\xb7\xaa\x51\x2d\xa5\x7a\x2a\xc9\xa9\x59\x73\x48\xda\xe8\x95\x48\x86\x0a\xe3\xb0\xd7\x7a\x5e\xbd\x68\x11\xf6\x8f\xe0\xd9\xdb\x5b\xa7\x39\x6f\xdb\xb1\xd0\x3b\x98\x23\x57\x19\xaa\xd3\xdb\x5a\x6f\xfb\xdd\x6e\xb4\xca\xdd\x73\x9f\x16\xfc\xa0\x0f\x9c\x76\xfc\xdd\xa5\xd9\x16\x58\x0e\xed\x24\x0a\xf8\x47\xe0\xe7\xbd\xa7\x9c\xa9\xc1\x40\xbd\x3b\x44\x88\x98\xe7\xf9\xd5\xd5\xd5\xe5\xe5\x25\x4d\xca\x5b\x8f\x80\x31\xa6\x94\x9a\xcd\x66\xf3\xf9\xfc\xbd\x1d\x1d\xf4\xed\xa5\xdb\x91\x7a\x0a\xe2\x9c\x2f\x16\x8b\xc5\x62\x41\x41\x89\x4e\x4e\x4e\x48\x5f\xda\x9c\xe7\x06\x22\xad\xe9\xe5\xe5\x25\x05\xf5\x9e\x4c\x26\x71\x1c\x0b\x21\x28\xa2\xe9\x6c\x36\xf3\xde\x93\x93\x7e\x59\x96\x88\x18\x42\x68\xb2\xe1\xe4\xa5\x30\xac\x3b\x6d\x76\x03\xeb\x00\xdf\xb4\x1f\x83\x46\x94\x6c\x63\x04\x25\x6b\xd2\x4a\xeb\x28\x8a\x83\x07\x2e\x49\x8d\x59\x5e\x9c\x96\xe6\x4e\x92\x30\xc6\xac\xf7\x55\x5e\x00\xa2\xe0\x9c\xbe\x60\x8f\xe0\xfc\x36\x43\x13\xe7\x3c\x16\xbc\x30\x16\x00\xa4\x10\xc8\x40\x09\xe1\x11\x01\x18\x86\xbc\xf6\xb0\x05\x45\x10\x8c\x03\x73\xde\x67\xce\x4b\xce\x22\x29\x18\x00\x63\xc8\x18\x2b\xad\x8b\xc9\x07\xd1\x83\x43\x64\x00\x69\xa4\x23\xa5\x5e\xf8\xf6\x97\x7e\xe4\x27\xfe\xfa\xfe\xe1\x9d\xe9\x7c\x91\x4e\x67\x49\x9a\x46\x51\xa4\xa4\x62\x75\x94\xe7\x5e\x84\xc3\xeb\xf2\x7a\x6b\x96\x30\xc4\x7f\x7b\x37\x47\xf0\x6f\xfc\x68\x8b\x31\xb5\x58\x6a\x0b\x96\xf0\xba\x9c\xf4\x0d\xaa\xd3\x84\x93\xde\x71\x1b\x02\xad\x1b\x47\x2c\xb4\x3f\xde\xce\xd0\x88\x0d\x35\xde\x9d\x9a\xb4\x1e\xe5\xee\x65\xe8\x43\xb2\x11\xcc\x6b\x81\xdf\x50\x79\xa8\xa9\xde\x76\x70\x3b\x59\xf4\x88\x48\x3e\x7c\x4d\xe1\x2f\x49\x92\x3b\x77\xee\x90\xf0\xd7\x7a\x93\xa1\x16\x19\x37\x9b\x0d\xd9\x25\x50\x6a\xdc\xde\x51\x4d\x92\x64\x3e\x9f\x37\x43\x69\xdf\xd2\x8e\x74\x0b\x84\xcf\x42\x14\xbb\x3d\x8e\xe3\x2c\xcb\x96\xcb\x25\x05\x68\xe8\xfd\x50\x01\x80\x1c\x7d\x96\xcb\xa5\x10\x22\x8e\x63\x8a\x77\xaa\x94\x22\x97\x44\x12\x13\xad\xb5\x24\x4a\x6e\x36\x9b\x21\xdd\x29\xf4\x69\xe1\x58\x47\xe3\xe4\xbd\xc7\xeb\x69\x2b\x42\x9a\xf3\xb0\x34\x28\x95\xb5\xd6\xea\x28\x72\xce\x25\xce\x52\x96\xc4\x2d\x54\x70\x96\x17\xc5\x69\x69\xef\x4d\xa6\x5c\x08\xce\xd8\x3a\xcb\xa9\x41\x72\x3f\x64\x8c\x25\x5a\x59\xe7\x29\x04\x9a\x14\xc2\x6d\x7d\xed\x19\x03\xb6\x8d\x34\xc7\x00\x80\x21\xa2\xf1\x48\x36\xa2\x08\xcc\x22\x28\xad\xb7\x39\x22\xb8\x60\x80\x0c\x11\x04\x03\x8f\x16\x98\x04\x00\xf0\x94\x29\x23\x52\xea\x85\x0f\x7e\xf0\x5f\xfd\xb7\x7f\xea\xf0\xde\xf1\x64\x36\x9f\x4c\x67\x49\x3a\x89\xe3\x44\x69\x2d\xc4\x93\x37\x76\x84\x47\xf7\x82\x56\x57\x7c\xb9\x91\x59\xf7\x16\xc6\xaf\x12\xca\x5d\x30\xee\x3d\x7d\xbc\x27\x3b\xb6\x73\x63\x9d\xde\x4b\x34\xf7\x8f\xb4\x80\xd7\xe5\x3f\xec\x13\xf5\x5a\x75\x7a\x3b\xd0\xaa\x1f\x3e\x93\x16\x7e\x77\xaf\x0b\x3b\xc0\xd2\xc8\xa1\x5e\x11\xad\x5b\xa1\xd9\xa5\x5d\x9a\x1a\x6a\xb0\xb5\x33\xe4\x08\x73\x35\x59\x6b\x19\x63\x51\x14\x91\x01\x67\x14\x45\x41\xd5\xdf\x1a\xba\xaa\xaa\x56\xab\xd5\xe5\xe5\xe5\x72\xb9\x0c\x36\x0a\xdd\x07\x24\x84\x38\x38\x38\x38\x3a\x3a\xaa\xaa\x6a\xe8\x29\xdf\xd2\x38\xdd\x02\xe1\xb3\x13\xe9\xf1\x27\x93\x89\x31\x66\xb5\x5a\xad\xd7\xeb\xa6\x80\x18\x28\xbc\xbb\xce\xb9\xcd\x66\xb3\xd9\x6c\x18\x63\xe4\x80\x91\xa6\x69\x1c\xc7\x64\x59\x4a\x7b\x68\xaa\x48\xba\xd3\x90\x09\x25\x18\x9d\x0e\x49\x8a\x4d\x86\x88\x88\x48\x79\x0f\xe9\x10\xe5\x2d\x14\xc2\x53\x76\x24\xe7\xa5\x72\xce\x39\x6d\x9d\x77\xce\x47\x7e\xbb\x88\x08\xc0\x6a\x91\x51\x0a\x51\x94\xd5\xa3\xa2\x3c\x8a\x93\xbb\x5a\xa7\x9b\xcd\x66\x93\x19\x63\xbc\xb1\x5c\x20\x79\x17\x2a\xc1\x83\x26\x53\x4b\x09\xdb\x3e\xd4\x6c\x0b\x18\x02\x78\x04\x4a\xe4\xe4\x01\x10\x80\x84\x5d\x29\x04\xa9\x4f\x91\x31\x92\x16\xa5\xe2\x55\x65\x10\xbc\xe4\x7c\xaa\x55\xa4\xd4\x07\x3e\xf8\xa1\xbf\xfa\x37\xfe\xd6\x9d\xe3\xfb\x93\xe9\x2c\x9d\x4c\x93\x74\x12\x25\x89\x52\x7a\x5c\xd5\xd3\xcb\x23\x9a\xd4\x2b\x88\xf4\xb2\xe9\x5e\x11\x67\xa4\xdc\xbb\x67\x5c\xee\x09\x75\xba\x00\xb0\x4b\xb7\x89\xc2\x2d\x8f\xd4\x19\x82\xb7\xdd\xaf\xd2\x1a\x8a\x5d\xea\xb4\xae\xdb\x0b\x93\x2d\xfc\xeb\x62\x2a\xec\x86\x7f\x5f\x0f\x62\xf5\x9e\x32\xd4\xec\x08\xda\xb5\x04\xc1\xed\x57\xd8\x31\x7b\x49\x92\x64\xb1\x58\x90\x23\x32\x7d\x0e\xdd\x31\x24\xbf\xe4\xe5\x72\x49\xca\xcf\x10\x0c\xb9\x77\x9c\xe3\x38\x3e\x3a\x3a\x3a\x38\x38\x20\x3f\xfa\x6f\x5c\x1a\x87\xf7\x3c\xb1\xf3\xf3\xf3\x6f\x75\x1f\xde\x23\xe4\xbd\x27\x7f\x7c\x0a\x5e\xda\xad\xd0\xbb\x93\x14\x23\x64\x53\xa3\xb5\x6e\xf2\x1a\xb2\x9c\x26\x50\x24\x7f\xa0\x66\x12\x8c\x27\x61\x4e\x1b\xa0\x08\x5b\x45\x8a\xf3\xb4\x3c\xb8\xf5\xbc\xad\x8c\x31\xd6\x18\x63\x2a\x53\x95\xa6\xaa\x8a\xa2\x28\x8b\xa2\x2a\xb3\xb2\x28\x4a\xc2\xdc\x2c\xcb\xb3\x0d\xfd\x5f\xe4\x45\x59\x55\x65\x55\x55\xc6\xa6\x82\x4f\x38\x2b\xf3\xa2\xac\xca\xa2\x2c\xcb\xb2\xb2\xd6\xc2\x36\x10\x0c\x14\xd6\x31\xc6\xac\xf7\x82\x0b\xc1\x99\x14\x02\x18\x90\x5e\xd4\x03\x14\x95\xf5\x00\x91\x92\xd6\x23\x22\x0a\xc1\x11\x41\x0a\x92\x6e\x11\x60\x1b\x51\x8d\x23\x32\x6b\xd0\xb9\x54\xc9\xbd\x49\xfa\xd2\xf7\x7c\xdf\xbf\xf8\xef\xfc\xd4\xe2\xe0\x4e\x3a\x9d\xa5\xe9\x24\x4e\xd2\x28\x8e\x95\xd2\x42\xca\x11\x30\x18\x81\x93\xdd\x19\xf7\xd3\x1e\xbd\xf1\x5a\x61\x9a\xdf\x3b\xdf\xff\x3a\xeb\xf4\x4a\x54\x43\xed\x8c\x48\x75\xbd\x4d\xdd\x58\xa7\xf7\xde\x87\x4e\xec\x36\xdb\x8b\xcd\xbb\x88\x77\x23\x87\xc6\xa1\x6e\x04\x02\x77\x69\xaa\xb9\xd9\x85\xc0\x40\xdb\x65\xf9\x06\xf8\x91\x12\x68\x3a\x9d\x26\x49\xd2\xb5\x76\x0e\x8d\x93\xf0\x47\x69\xc3\x29\x6b\xfc\xf8\x7b\x3b\x99\x4c\x16\x8b\x05\x4d\xa3\xbb\xd5\x6e\xe9\x69\xe9\xa9\x25\xc2\x77\x5d\x7e\x8d\x6f\x7e\xcb\xe4\x65\x78\x7e\x7e\xbe\x5c\x2e\x5b\x1f\x5b\x8b\x85\x01\x00\x69\xff\x29\x13\xb4\x94\x32\xad\x89\xa2\xb5\x29\xa5\xb4\xd6\x8b\xc5\xa2\x09\x8a\x64\xc3\xd2\x0a\x61\xc3\xeb\xa4\x45\x00\xe0\x9d\xf7\x8d\x54\x44\x40\x8a\x51\xe1\xbd\x97\x28\x3d\x22\x44\xb4\xcc\xb7\xc5\xdc\x27\xf9\x1c\xc8\x7e\x26\x8a\xb2\x22\xcf\xcb\xb2\x2c\x8d\x31\xc6\x5c\x39\x3f\x9d\x4e\xe7\x7c\x56\xe4\x79\x5e\x96\x9b\x4d\x56\x94\x25\x19\xd1\x44\x52\x78\x04\x87\x40\x8e\xf4\x0e\x91\x33\x0e\x00\x08\x0c\x18\x28\x25\x2b\xeb\x81\x31\x80\xad\xc4\x59\x59\xcb\x39\xe3\x0c\x18\x30\xe7\xbd\x31\x06\x9c\x57\x0c\x22\x21\xa4\xd6\xe9\x74\xfa\xd1\x9f\xfc\xeb\xff\xc2\x5f\xf9\xf1\xc9\x74\x96\xa4\xd3\x38\x4d\xa3\x38\xd6\x3a\x56\x5a\x09\x21\x77\xff\xe0\xbb\x22\xc5\x88\xf4\x36\x82\x70\x37\xca\x7f\xe3\xb2\x0b\xcd\x4e\xba\xd0\xd5\x2a\x7f\xfd\x75\xf0\xfa\x2a\x60\x6f\x9d\x5e\x48\x0b\x87\x46\x60\x6f\x68\x34\x9a\x15\x9a\x97\xee\x1d\x13\xec\x08\x82\x37\xca\x7c\x23\x87\xba\xe5\xde\xdf\x21\xcc\x1b\x29\xef\x88\x7c\x61\x27\x36\x0c\x5e\x82\xc3\x1f\x63\x2c\x4d\xd3\xbd\xbd\x3d\x02\xbf\x10\x1d\xbe\xf5\xed\x13\x6a\xae\xd7\xeb\xe5\x72\x19\x56\xfe\xf0\xba\x88\xdf\x7d\x04\xc1\x10\xa6\x2b\x50\x12\xbd\x67\xb8\xe8\x37\xb9\xe5\x5b\xd5\xe8\xdb\x4f\x52\xca\x3b\x77\xee\x1c\x1e\x1e\x1a\x63\x2e\x2e\x2e\x4e\x4f\x4f\x83\xd3\x05\xf4\x4d\x90\xc3\x89\xc6\x98\xe5\x72\xb9\x5c\x2e\x01\x80\x8c\x4e\x03\x28\x32\xc6\xc8\xca\x66\x3e\x9f\x03\x80\x73\x2e\x44\xb1\x71\xce\x51\x20\x9b\xe6\x52\x22\x22\xa2\xdf\x36\xcd\x18\x63\xbc\x5e\x26\x44\x29\x00\x11\xa2\x88\xd6\xf4\x18\x63\x7c\xab\x3c\x95\x52\x29\x1d\x45\x51\x14\xc7\x49\x91\x16\x65\x91\x57\x65\x51\x11\x1a\x5a\x77\xe5\x7d\x9c\xa6\x33\x1d\xc5\x51\xb4\xc9\xb2\x75\x96\x9b\xaa\xf2\xd6\x59\x67\xb5\xe0\x14\x8f\x0d\x81\xc1\x96\x21\x22\x22\xe3\x0c\x2c\x7a\x70\xc0\x11\x4b\x63\xad\xb5\x85\xb1\xc6\x3a\x40\x2c\x2a\xe3\xd0\x0b\xce\x95\x14\xb1\x52\x2a\x8e\xbf\xfb\x87\x7e\xf8\x2f\xff\xc4\x5f\xbb\xff\xe0\x03\xc9\x64\x92\x24\x69\x14\xa7\x51\x14\x29\x1d\x29\xa5\xf8\xc0\x37\xdf\xa4\x1b\x2b\xec\x72\xd6\xf8\x26\x5c\x67\xf4\xad\x42\x17\x1b\xde\x51\x75\x88\xba\xec\xb8\xf7\x66\x7b\xc7\xa1\x75\x6e\x2f\xf8\x75\xfb\x00\x8d\xf7\xfc\x46\xf0\xdb\x05\x14\xbb\x28\xd5\xfd\x0d\xd0\xb5\xcb\x25\x5a\x68\xd7\x2c\x77\x7f\x9b\x0b\x7e\x21\xe0\x0b\x85\x3a\x4b\xd3\x94\xd4\x9e\x64\x25\x3e\x04\x7e\xde\xfb\xf5\x7a\xbd\x5a\xad\x96\xcb\x65\xd3\xed\xa1\x35\xf2\xdd\xe1\x9d\x4e\xa7\x4d\x57\xfa\x5b\x7a\x7b\xe9\x16\x08\xbf\x51\x44\xd0\x75\xef\xde\xbd\x7b\xf7\xee\x15\x45\xf1\xc6\x1b\x6f\xac\xd7\x6b\xca\xfe\x0c\xd7\x15\x4d\xad\xc9\x38\x51\x30\x3a\x85\xeb\xa0\xb8\x5d\x69\x93\x92\xa2\xd8\x50\x3b\xe4\xa1\x48\x1a\x54\xef\x3d\xa1\xdb\x36\x4e\x4b\xf8\xc2\xb7\x92\x9f\x44\x44\x72\x65\xdf\xa2\x20\x63\x82\x8b\x4a\x0a\x2e\x15\x89\x84\x3a\x4e\xe2\xaa\x34\x55\x55\x96\x65\x55\x95\xd6\x54\x55\x55\x5a\x63\x9c\xb1\xd6\x59\x1e\xe9\xbd\xc9\x64\x9a\xe7\x79\x96\x6d\xb2\xdc\x5a\xeb\x9d\xe7\x0c\xbc\xf7\xbc\x5e\xa4\xf4\x88\x9c\x81\x60\x6c\xa2\x65\xee\x5c\x09\x4c\x49\x69\x11\xa2\x58\x00\xc0\xbd\x7b\xc7\x3f\xf0\x83\xdf\x7f\xe7\xce\x91\x90\xca\x18\x33\x5b\x2c\x3e\xf8\xed\x2f\xcd\x17\x7b\x71\x92\xc4\x49\x1a\xc7\x49\x14\xc7\x3a\x8a\x95\x52\x42\x2a\x41\xf1\xdc\x06\x3e\xfe\xc0\x2c\xc6\x1f\x44\x77\x84\x47\x4e\x19\x7a\x22\x70\x9d\xa7\x77\x39\x5d\x97\x79\x75\x9b\x6a\x71\xba\x67\x68\xe7\xc6\x3a\xcd\x4b\xdc\x58\xd8\x5d\xce\x7e\xaa\x66\xbb\x00\xd0\xfa\x6d\xee\xef\x96\xbb\xe7\xc2\x28\x3e\x0d\xb5\x3f\xd4\xce\x8e\xad\x05\x6a\xfa\xf9\x11\x04\x02\x40\x14\x45\xe4\x1f\x35\x99\x4c\xc8\xd5\xaf\x35\x1b\x08\xcf\x88\x8c\x03\x86\xc0\xaf\x35\xc2\xcd\x17\x86\x31\x46\xe1\xfe\x67\xb3\x59\x50\xab\xde\xd2\x37\x82\x6e\x81\xf0\x9b\x41\x71\x1c\x1f\x1c\x1c\x1c\x1c\x1c\x54\x55\xb5\x5e\xaf\x37\x9b\x0d\xb9\x4c\xd0\xd1\x2e\xa3\x6c\x7d\x2a\x55\x55\x51\xf0\x08\x00\xd0\x5a\xd3\x9a\x22\x99\x9e\x12\xe3\xa3\x84\x18\xf4\xe1\x19\x63\x28\x9c\x4d\x59\x14\x79\x51\x20\xe5\x99\xd8\xaa\x27\x11\x11\x38\x17\x28\x50\xe2\x56\x54\xe4\x5c\x18\x21\xb9\x94\x52\x56\xc6\x28\x29\x95\xd6\x91\x75\x89\xb5\xc6\x54\xc6\x9a\x8a\x22\xd4\x18\x6b\xb6\xde\x4e\xd6\x58\x67\xbd\x73\x89\xb5\x07\xd6\xf9\xaa\x42\x63\xbc\xa9\x6c\x55\x31\xe7\x01\xbd\x73\xae\xa8\xac\x71\x2e\x52\x0a\x95\x54\x0e\x2d\xe7\x42\x47\x49\x9a\xce\x66\xb3\xa3\x7b\xf7\x3e\xf4\xd2\x4b\x93\xe9\x2c\x4e\x27\x49\x92\x44\x71\xac\x75\x14\xc5\x49\x94\x24\x51\x14\x47\x51\xac\x22\xad\x94\x96\x52\x09\x29\x78\xed\x7d\xdf\xa5\xc0\x6b\xa0\xa3\xfa\xeb\xd2\x10\xbb\xef\x3d\xab\x3b\x2b\x87\xeb\xe8\xd8\x62\xf7\x43\x38\xd7\x5b\xa7\x05\x66\xcf\xdc\xce\x48\x9d\x56\x85\x21\xb6\x0b\xd7\x47\x6f\x17\xee\xdc\xac\x33\x34\x51\x18\xdf\x33\xb2\xb9\xa3\xa8\x07\x1d\xc0\x1b\x47\xbe\xa6\xa8\x37\xde\x54\x13\xf6\xf0\x7a\x86\x23\xda\x13\x3e\x3d\xb2\x71\x1b\x19\x3d\x3a\x91\x24\xbf\xf5\x7a\x1d\x1c\xfe\x86\xc6\x0d\x3a\xe3\x4c\x11\xd1\xee\xdc\xb9\x13\xa6\xce\xb7\xf4\x0d\xa5\x5b\x20\xfc\xa6\x92\xd6\x3a\x20\x22\x2d\x0d\x06\x44\x6c\x7d\xc0\xdd\x29\x3f\x1d\x0d\x92\x22\xc9\x85\xe4\x80\x11\xac\x4f\x19\x63\x0d\x03\x54\xef\xbd\x2f\x8b\x92\xe2\x9e\x96\x65\x51\xe4\xb9\x73\x0e\xd1\x03\x90\x44\xc8\xb9\x90\x8a\x31\x2e\xa4\x54\xca\x1a\x25\x8d\xb5\xca\x58\x6b\xac\xa9\x9c\x75\x3a\xb2\xde\x79\xe7\xac\xb3\x96\xfe\xd0\xac\xd8\x6f\xf5\x42\xce\x79\x0f\xdb\x0f\xdc\x03\x02\x20\x02\x7a\x44\xd8\xe6\x2d\x94\x52\x45\x91\x8e\x62\x1d\x45\x5a\x47\x51\x1c\x47\x71\x12\x27\x49\x14\xc7\x51\x14\x2b\xa5\x75\x14\xe9\x28\x8e\xa8\x42\x14\x29\xad\xc9\x28\x46\x4a\xd9\x0c\xab\xdd\x1c\x9c\x11\xe8\x1a\x17\xf2\x76\x3c\xd4\x0b\x51\xad\xf2\x8d\xb8\x7b\x63\x9d\x1d\xf1\x1b\x6e\xba\xf1\xdd\xaf\xd5\xaa\xdc\x45\xac\x66\xb5\x5d\xea\x40\x07\x81\xba\x7b\x76\x81\x3d\xe8\xa0\x11\xdc\x04\x57\x4f\xdb\xc8\x50\x0b\x2d\x99\x2f\xd8\xb9\x04\x99\x4f\x29\x45\xb0\x17\x45\x11\xad\xf6\x75\xc7\x27\x8c\x09\xd9\xca\xad\xd7\x6b\x9a\xe9\x16\x45\x01\xd7\x1f\x4d\xb7\xd0\xfa\xd2\xe9\x8a\x94\x14\x22\xc4\xc5\xbe\x05\xc2\x6f\x0e\xdd\x02\xe1\xb7\x86\x68\xc1\x6f\x7f\x7f\xdf\x18\x43\x69\x7e\xf3\x3c\x0f\xa6\xd2\xdd\xa9\x7d\x8b\x37\x51\x05\x6b\x2d\x65\xc3\x20\xc9\x8e\x66\xac\x49\x12\x27\x71\x12\x32\xd9\xc6\x71\xac\x23\x3d\x9b\xcf\xbd\xf3\xde\xbb\x72\xeb\x98\x91\x91\xe1\xa8\xf5\x9e\x96\x12\xb9\x90\x4a\x08\x2e\xad\x94\xca\x3a\xeb\x6c\xe4\x9d\x73\xce\xd6\xb0\xe7\xbc\xf7\x34\x49\xde\xba\xeb\x7b\x8f\xe4\xb0\x58\x87\x15\x05\x08\x49\x85\xb7\xc6\x39\xdb\x70\xa6\x64\xf0\xa3\x23\xa5\xb5\xd2\x4a\x29\x4d\xbe\xfc\x5a\x47\x4a\x47\x5a\x6b\xad\x23\xa9\xf5\x36\xc5\xb1\x94\x82\x0b\x2e\x38\x40\x7f\x44\xae\xae\x02\x6a\x84\xba\x15\xba\xec\x7e\xbc\xa9\x77\x42\x9d\xb7\xab\xcf\xd8\x50\x9c\x8e\xb7\xdf\x3b\xb1\xe8\xc2\x5e\x77\xe7\x38\x4a\xb5\x36\x5b\x38\xd7\xda\xd3\x9a\x17\xb6\xca\x4f\x0b\x7b\xbd\x32\x1f\x36\xb2\x1a\xd1\x8d\xd3\x0c\x32\x49\x12\x52\xb1\x8c\x28\x12\xe8\x5c\xfa\x78\x09\xf9\xf2\x3c\xaf\xc3\xf3\x5e\xab\xd9\x2c\xb4\x1e\x4d\xf8\xa2\x29\x5e\xff\xe1\xe1\xe1\x62\xb1\xb8\x0d\x07\xf3\x2d\xa1\xdb\x41\xff\x86\x93\xa9\xca\xb3\x47\x0f\xbf\xfc\xf9\xcf\x5e\x3e\x7e\xb8\x59\x2e\x9d\xb5\x52\xeb\xe9\xfe\xc1\xdd\x07\x2f\x7c\xe0\x3b\xbe\x53\x47\x31\x45\xab\x21\xfb\x17\xfa\xa2\xc8\xf6\x2c\xb4\x10\x50\xb0\xab\x8d\x69\x4d\x48\x8b\xa2\x38\x3f\x47\x12\x16\xb5\xd6\x71\x1c\x47\x51\x14\x45\x5a\x0a\x29\xa5\xf0\x9e\xf1\x34\x8d\xe2\x78\x36\x9f\xa3\x77\xce\xb9\xaa\xac\xea\xe5\xc5\xa2\x2c\x0b\x67\x3d\x70\xce\x41\x72\x2e\x48\xa0\xc4\x27\xf6\xa7\x54\x46\xca\x56\xb8\xbd\x3a\x00\x00\x30\x60\xc0\x10\x80\x33\xbe\x4d\xed\xb4\x85\x41\x29\x84\x90\x82\xfe\x48\x25\xa5\x94\x4a\x49\xa9\x95\x56\x64\xa0\x2a\xa5\x52\x4a\x49\xa9\xb6\x52\xa0\x10\x8c\x71\x04\xf0\x94\x31\xb1\x63\x06\xd9\xe4\x1d\xdd\x11\xe8\x62\x43\xef\x9e\xde\xcd\xe6\x0c\xe3\x3d\x59\x07\x1a\xd3\xa9\x56\xcd\x96\x06\x75\x17\xc0\xeb\xee\x1c\x2f\xf7\x22\x5f\xf7\x77\xe4\xdc\xf1\xa6\x46\x8e\x62\xad\xe4\xc4\x86\x6f\x43\xbd\x8e\xce\x43\xc8\xa7\x28\x8a\x9a\xce\x4b\xad\xc6\xc3\x25\x8c\x31\xf4\x91\xd2\x77\x4a\xe2\x5a\x77\x54\xe1\x26\xe4\xa3\x82\x10\x62\x32\x99\x10\xfe\xbd\xcf\x13\xc4\x7f\xcb\xe9\x16\x08\xbf\x51\xe4\x9d\x3b\x79\xf3\xf5\xcf\x7f\xea\x93\x9f\xfb\x83\xdf\x5b\x5f\x9c\x4a\xb6\xcd\x52\x44\x9f\x17\x7d\xa2\xfb\xc7\xf7\xff\x95\x7f\xf7\x6f\x3e\xf8\xf0\x47\x00\x40\x08\x41\x39\x2b\x28\xf4\x1a\x25\xd5\x24\x8f\xda\xe6\xf7\x39\x34\x61\xaf\x1b\x7e\x22\x2c\x1a\x63\xc2\xca\xbc\x94\x52\x2b\x15\x11\x2a\x6a\x25\x84\x60\x42\x08\xe1\xa5\x54\x71\x12\x4f\x9d\x47\xf4\xde\x39\x6b\x6d\x55\x55\x65\x59\x94\x45\x59\x96\x45\x51\x96\xd6\x18\xe7\x1c\x7a\xbf\xcd\xc6\x44\x19\x7d\x1b\x3d\xd8\x76\x87\x31\x06\x8c\x71\xfa\x8f\x93\xa3\x23\xd9\xe6\x08\x29\x03\x0e\x0a\xfa\x23\x25\x81\x5f\x2d\xff\x09\xb2\x88\x09\xfe\x1e\xa1\xf9\xde\xc2\xb8\x92\x10\x3a\x22\x4e\xef\x58\x8d\x88\x53\xcd\x3a\xd8\x91\xae\xba\xd8\xfc\xce\xaf\xd3\xbc\xaf\xee\xce\x11\x08\xdc\x65\xcf\x50\x3b\x2d\x34\x6a\x55\xeb\x05\xce\xdd\x61\xb2\x0b\x7b\x4d\x0a\x31\xcc\x02\xec\xd1\xdc\x2c\x8a\x22\xc2\xbc\x38\x8e\x55\x9d\xc3\xa4\x3b\xa3\x0a\x44\x32\x1f\x21\x1f\x25\xdf\xa6\x0f\xb3\x55\xb9\x5b\xa6\x6e\xf4\x62\x21\x00\x50\x7e\xef\x83\x83\x03\x72\x04\xec\x8e\xe7\x2d\x7d\xf3\xe9\x16\x08\xdf\x7e\x2a\xb2\xcd\x57\x3e\xfb\x99\xcf\x7f\xea\x37\xdf\x7c\xe5\xcb\x65\x59\x5e\x6d\xf2\x24\x52\x9e\x8b\xca\xda\x44\x6b\x16\xe2\xbf\x00\x2c\x4f\x1e\x7f\xec\xa7\xff\xe7\x1f\xfe\xc9\x7f\xf3\xfb\xff\xf2\x8f\xf3\xda\x2a\x8c\x42\xaf\xed\xef\xef\x3f\xf7\xdc\x73\x64\x5c\xb3\x5c\x2e\x57\xab\x55\x73\xb5\xa0\x97\x0f\xc2\x75\x25\x6a\x13\x3e\x29\xa1\xf5\x26\xcb\x08\x85\x05\xe7\x52\xa9\x48\x6b\x9a\x08\x4b\x21\x38\x57\x88\xa8\xbd\x8f\xe2\x78\xea\xa7\x0d\x33\x71\xca\xed\x6b\xc8\x55\xa3\x2c\x4b\x5a\x45\x01\x24\x2b\xd4\x5a\x04\x64\x7c\x6b\x80\x2a\x28\x20\x1c\x45\x74\xe3\x42\x08\x21\x42\x64\x9c\xad\x74\x28\x28\xd8\x1b\x17\x84\x95\x8c\x31\x04\x40\xef\x5b\x92\x4d\x4b\xad\x14\x7e\x43\x36\xc7\x56\x85\x56\xcd\xe6\x9e\xdd\x01\xb2\x49\x61\x24\x9b\xa7\x34\xf7\x0f\x9d\x3e\x22\xa4\x76\xfb\xfc\x6c\xed\xf4\xd6\x81\x61\xe4\x00\x80\xa0\x78\x1f\x01\xb3\xde\xcd\xde\x43\x43\xe0\x07\x0d\x64\x1a\x6a\xaa\x79\xe8\xd9\x60\x8f\xd5\xd3\x26\xdf\x20\x5a\xde\x03\x00\xf2\x26\x22\x8d\x08\x21\x1f\x69\x27\x86\x9e\x5a\x78\x49\x28\xd2\x61\x9e\xe7\x59\x96\x65\x59\x46\x9e\xb4\xad\xdb\x6f\xbd\x5d\xdd\x06\x87\x20\x90\xd5\x26\xa0\x69\x9a\x1e\x1d\x1d\x8d\xbf\x7b\xb7\xf4\x4d\xa6\x5b\x20\x7c\x3b\xe9\xf2\xf4\xf1\xff\xf7\xbb\xbf\xfd\xc5\xdf\xff\x9d\xf5\xe5\x05\x22\x72\x00\xeb\xfc\xe1\x7c\x06\x80\x97\xeb\x4c\x70\x26\xb8\xf0\x48\x29\xf7\x6a\xbd\x8d\x73\xbf\xfb\x2b\xbf\x7c\xfe\xf0\xcd\xbf\xfc\x53\xff\xa1\xba\xae\x1e\xa1\x2f\x27\x8a\xa2\xc3\xc3\x43\x4a\x6d\x48\x5e\x86\x9b\xcd\xa6\xbb\x1a\x01\x1d\xc0\xe8\x1e\xda\xf2\x1d\x44\xef\xb1\x2c\xca\x6d\xf4\x5e\x44\x4a\x50\x18\x69\xbd\x5d\xb3\x53\x4a\x45\x8a\x33\x0e\x88\x1e\xfd\x56\x15\xba\x4d\x1d\x08\x58\x73\x9c\xaa\xaa\x08\x23\x2d\x85\x2a\x05\x24\x81\x10\xa8\xb9\x5a\x35\xca\x03\x0a\x8a\x1a\xf9\x38\x0f\x2a\x50\x44\xd7\xdb\xf3\xa1\x7b\x61\x8c\x11\xb3\x6b\x22\x4a\xb7\xdc\x2c\x40\x1f\xfc\xc0\x75\x8d\xe2\xd3\x72\xa5\x21\xd8\xe8\x62\xcc\xc8\xa1\x91\x3a\xdd\xf6\x87\xea\x74\xd1\x7d\xbc\xab\xcd\xfd\x6c\x07\x9d\xea\x10\xc2\xf5\x56\x18\xda\x6c\xdd\xc5\xee\x80\x47\xe5\xe6\x92\x5e\x00\x3f\x00\x20\x0f\x5a\x7a\xbd\x26\x93\x09\x21\x9f\xd6\x3a\x04\x23\x6c\xdd\x57\xab\x33\xf4\x0e\x53\x2c\x43\x22\xf2\xca\x6d\x8e\x4f\xef\xd0\xc1\xf5\x09\x16\x5e\x9f\x95\xc2\xf5\x47\x43\xf3\x5a\x72\xae\x97\x75\x74\xa4\x5b\x14\x7c\xa7\xd1\x2d\x10\xbe\x3d\x74\xfa\xf0\xcd\xdf\xff\x67\xbf\xf2\xea\x67\xff\xd8\x5b\xe3\xbd\x17\xb4\xcc\x8e\x08\x00\x5a\x49\x00\x98\xc4\x51\x69\xcc\xa6\x28\x93\x48\x93\x57\x40\x80\x25\x44\xfc\xd2\x1f\xff\xbe\xa9\xca\x9f\xf8\x8f\xfe\x33\x31\xb0\x54\x4e\x1e\xbb\x69\x9a\x1e\x1f\x1f\x5b\x6b\xf3\x3c\x27\x31\x31\xcb\xb2\xf0\xe9\x36\xa9\xf9\x19\x0f\x49\x48\x4f\x78\x0d\xa2\x73\x6e\x93\x67\xeb\x6c\x43\x7d\xae\xe7\xd4\x51\x14\xe9\x48\x6b\xa5\x95\x96\x5a\x48\x01\x08\xf8\xc4\x34\x86\x3e\x69\xd8\xde\x8b\x47\xe7\x1d\xc5\x71\xb3\xb5\xed\x9d\x75\x1e\x9c\x17\x12\x85\x47\xe1\xbd\xf0\x82\x73\xdf\x4a\xc1\xd8\x05\xad\x11\x2c\x1f\x02\xb6\x21\x59\xb0\x09\x93\xc1\xf6\xa1\x79\x5d\xec\x88\x77\xdd\x46\x86\x36\x9f\x19\x47\x77\xa7\x11\xf8\x1c\xa9\x10\x18\xf1\x08\xb2\x76\xf7\x0f\xa1\xdd\x08\x0c\xf7\xee\x1f\xc7\xf5\x2e\x16\xe2\x75\x6a\x59\xb2\x04\xd8\xa3\xf4\x2c\x52\xca\x24\x49\x28\x00\x12\x85\xab\x6e\x61\x1e\xf4\xc9\x64\x00\x40\x53\xc9\x90\x28\x9b\x9c\x6e\x49\x89\xda\x3b\xb0\xcd\x37\xaa\xdb\x20\xf6\xf9\x77\x36\x0b\xd4\x4f\x32\xbd\xb9\x75\x01\x7c\xe7\xd3\x2d\x10\x7e\xbd\x94\xad\x57\xbf\xf3\xb1\x7f\xf4\xb9\xdf\xfe\x04\x3a\x5b\x56\x86\x73\x6e\xac\x5d\x4c\x52\xca\x40\x9b\xc4\x51\x51\x19\x8f\x7e\x92\xc4\x69\x1c\x3b\xef\x18\x00\x7d\x5f\xe8\xbd\x07\xe0\x00\x08\xe0\x39\x7f\xe5\x73\x9f\xf9\xdd\x8f\xfd\xd2\x8f\xfd\x5b\xff\xfe\x8d\x57\x6c\x7a\xd3\x3b\xe7\x1e\x3d\x7a\x44\xdf\x76\xcb\x37\xb1\x3b\xa5\x7d\xc2\xeb\x61\x9b\x9b\x09\xae\xb1\xa4\xf0\x83\x80\x60\xac\x33\x76\xb3\xd9\x6c\x28\x59\x3c\xe7\x4c\xd6\xab\x8c\x41\xa7\xaa\xb5\x06\x06\x40\xd7\x61\x8c\x31\xb6\xf5\xe3\x0f\xf0\x83\xe0\x11\x49\x76\xa4\x09\x38\x2d\x43\x12\x03\x62\xac\xd6\xac\xd6\xd0\x18\x00\x92\x40\x0b\x1b\x0a\xde\x11\x19\xb1\x59\xe8\xdd\xec\x02\xd5\x78\xb5\xa0\x7d\x0d\x75\x6e\x94\x2c\xc7\xf9\x69\x8b\x5a\x95\x9f\x0a\x47\xc7\xa1\x71\x08\x66\x86\x8e\xb6\x2a\xb4\xf6\xb3\xeb\x66\x23\xbd\xa7\xb7\x4e\x19\xb9\x50\xb8\x16\x36\x64\x3b\xac\x17\xf3\x9a\x80\xa7\xb5\xa6\x70\x83\xe4\x0b\x44\xba\xcd\x26\xe0\xf5\x4a\xf3\x4d\xf8\x27\x35\x7e\x08\x49\x48\x26\x9d\x01\x62\xc7\x45\x3d\xec\x48\x78\xbb\x53\x33\x0b\xe9\x6d\x14\xd0\x77\x11\xdd\x02\xe1\xd7\x45\xaf\x7e\xfe\x4f\x7e\xed\xe7\xfe\x41\xb9\x5a\xc6\x52\x78\xce\xac\xf5\x59\x59\xcc\x27\x69\x60\xe8\x89\xd6\x79\x55\x95\x85\xf1\x0a\x95\x14\xd6\xb9\xca\xda\x34\x8e\x10\xd1\x53\x4a\x3d\xef\x1d\xa2\x31\x66\x9d\x17\x9f\xfe\xc4\xaf\x7d\xe0\x23\x7f\xe1\x85\x8f\xfc\x85\x1d\xaf\x4e\x13\x4f\x92\x14\xe9\x0b\x6f\x4e\x78\xa9\x4e\xef\x67\x8f\xf5\xe9\xcd\xa6\x20\x9c\x00\x00\x80\x1c\xb7\x9b\xa1\xbe\xb5\xce\xda\x6c\xb3\xc9\xa0\xc6\x06\xce\x79\x14\x45\x64\x99\x1a\x6d\xcd\x10\x22\x4a\x9c\xdb\x6c\xb6\x9b\x23\x3b\xf4\x96\xb2\x21\x12\x40\xd2\x9c\x9d\xb8\x15\x63\x2c\x98\xf6\xb5\x7e\x5b\x04\x37\xa1\x5a\x2f\xd7\x1b\x81\xd2\x5d\x0a\x4f\x90\xbe\x39\x66\xa3\x12\xea\xe0\x80\xf7\x51\x17\x42\x9a\xe3\xd6\xad\x09\x1d\x3c\x1e\x11\xe6\xa0\x0f\xba\xc6\xf7\xf7\x1e\xda\x51\xb6\xa3\xfd\x24\xde\x05\x00\xa3\x38\xba\xa4\xd5\x24\x65\xbc\x52\x2a\xf8\xc2\x0e\x01\x5e\x13\x9b\x43\xa1\xac\x89\x92\x5d\xd3\x6f\xf3\xd2\x23\x4f\xa1\xd9\x4e\x73\x00\x5b\x97\xe8\x16\x9a\x75\x48\xf9\x49\xc9\x64\xe4\x40\x68\xf8\x5b\x7a\x87\xd3\x2d\x10\x3e\x23\x79\xe7\xfe\xe4\xd7\xff\xe9\x97\xff\xe0\x53\xe8\x7d\x50\x7d\x54\xd6\xce\x92\x24\xbd\xce\xf7\x93\x28\x52\x42\xf2\x6d\xf6\x3e\xce\x98\xe2\x8c\x91\x2c\xe8\x01\xac\xf7\x59\x51\xac\xb2\x9c\x01\x18\x63\x7e\xe3\x17\x7f\xee\x3f\xf9\x2f\xff\x6b\xf6\xf4\x73\xc9\x2d\xee\x26\x09\x25\x38\x24\xd3\xd3\x30\x23\x0e\xfe\x18\x2d\xb6\xd2\x53\xd8\x7e\xc7\x37\x7c\xce\x81\x5f\x50\xfb\xa1\x4d\x00\x20\xf3\xbc\xa0\xbc\x0a\xb2\x63\x93\xc1\xd1\x64\x99\x42\x01\xb4\xfa\x03\xb5\xb5\x1e\x61\x64\x28\x78\xef\xcb\xb2\x0c\x2e\x5f\x81\x5a\xe8\xd8\xdc\x0c\x32\x44\x0b\xa8\xba\x28\xd5\x8b\x5b\xd0\x07\x84\xbb\x3f\x8b\x1b\xeb\xb4\x36\x87\xe4\x8f\x5e\xac\x1a\x01\xaa\xf1\x16\x86\x90\x6f\xa4\x71\x56\xbb\xcd\x05\x9c\xd8\x26\x95\xec\x2c\xdd\x61\xbd\x80\x47\x4b\x77\xa4\xc9\xdc\x5a\x09\x2b\x45\xbf\x54\x68\x41\x5d\xf3\x31\x0d\xbd\x99\x21\x67\x27\xd9\x6d\x11\xe0\x05\x33\x4e\x18\x98\xf3\xb5\x9e\xf2\x8d\x08\xb7\x7b\x81\xf2\x3f\x2c\x16\x8b\xc9\x64\x72\x75\x75\x35\x34\xf8\xb7\xf4\xae\xa0\xdb\x34\x4c\xcf\x42\xce\xb9\xff\xed\xef\xfe\x9d\x87\x5f\xfc\xdc\x8b\x47\x87\xba\x46\xc1\xd2\x98\x75\x56\x1c\x2e\x66\xc6\x3a\xeb\x5c\xac\x95\xb1\x4e\x49\x01\xe4\x18\x47\xdf\x23\x22\x02\x78\xef\x4b\x63\x24\xe7\x59\x51\x64\x79\xbe\xcc\x32\xeb\x3c\xa2\xe7\xc0\xac\xb3\xff\xc5\x7f\xf3\xdf\x7f\xdb\x77\x7c\xe7\xdb\xdb\x61\x5a\x56\xac\xfd\x05\xcb\xe6\xf7\xdc\x62\xc1\xbd\xf3\xee\xf1\x3a\x43\xd4\x6a\x47\xd5\xb9\x2d\xf4\x75\x0a\x71\xf4\x9b\x3c\x71\xbc\x3f\x04\x8a\xc6\x18\x92\x33\x48\xd7\x1a\x9c\xa3\x9b\x6e\x18\xd4\x1a\xc9\x22\x4d\x82\x7a\x2e\xdf\xac\xc6\x6a\xeb\x86\x70\xe9\x2e\x10\x8e\xdf\xf5\x10\xfe\x8d\xe3\x62\xb8\xd0\x8e\x98\x37\xb4\xb3\xd9\x60\x17\xfc\x7c\x23\xb3\x5d\x4b\xf4\x21\x0a\xca\xc9\xa6\x38\x85\x88\x41\x4d\x1d\x56\xa3\x69\x09\x99\xd4\x95\x04\x78\x34\xd1\x21\x5b\x4d\xad\x75\x2f\x26\x85\x4b\x87\x9b\x0d\x75\x9a\x62\x56\x30\x51\x0e\x44\x9b\x94\xcf\x16\x06\x00\xaf\x75\xef\xad\x9a\x6f\x57\x41\x4a\x49\xcb\x7e\xb7\x2b\x7f\xef\x31\x92\xbb\x27\xaa\x80\x77\x67\x7e\x8d\x6f\x44\xcb\xff\xe4\x1f\xff\xa3\x9f\xff\xbf\x7f\xfe\xce\xde\xfc\x2a\xcb\xf7\x67\xd3\x79\x9a\x68\x29\x8b\xca\x01\xe3\x15\xc2\x3a\x2f\xa4\xe0\xdc\xf2\xa2\xaa\x94\x4a\x01\xa0\xb4\x95\xf7\x3e\x89\x22\x60\x0c\x10\xf3\xb2\xda\xe4\x39\x03\xdc\xe4\x99\xb5\x56\x30\x00\x0e\xce\x43\x55\x96\x45\x55\xbe\xfc\x99\x3f\x7c\x5a\x20\xbc\xb1\xcf\xde\x7b\x67\x8d\x29\x8b\xaf\x7d\xf9\xcf\xb2\xcb\xc7\x67\x8f\x1f\x5e\x5d\x9c\x17\xeb\x55\x12\x47\x8c\x73\xa1\x34\x53\x51\xba\x38\x98\x1e\xde\xd5\x49\xca\x45\x5b\x4f\x10\x70\x05\xfa\xb4\x73\x4d\xb6\xdb\x9a\xda\x43\x03\x03\x48\xb6\xa3\x84\x53\xcd\x3a\x41\x39\x16\x7e\x75\x6d\xbb\x1a\x72\x2e\xb6\xae\x18\x92\x38\x42\x83\x87\x76\xc1\x92\xd4\xad\x84\x8e\xae\x41\xc4\xee\x83\xa0\x49\xd4\xc2\xbc\xf0\xdb\x94\x32\x69\x4f\xc0\x83\xde\x53\x60\x14\xf6\x7a\xeb\x04\xa4\xe9\x8e\x79\x6b\x7f\xb7\xdc\x7c\x1c\x4d\x65\x5d\x38\x14\x28\xc0\x5b\xeb\x2a\x04\x75\x44\x4a\x29\xbe\x75\x83\x69\xd3\xd6\x08\x58\xca\xd6\x50\x43\x67\xc6\xd3\xea\x61\xf3\x95\x08\x3d\x31\xc6\x04\xab\x63\x42\x3b\x2a\xd0\x13\x19\x1f\xb1\x5e\xb1\xaf\x39\x08\xdd\x5e\xb5\x46\xac\xb7\xe7\xdd\x3a\x50\xaf\x3e\xc4\x71\x4c\xd1\x7d\x47\xc2\xbe\xbc\x57\x79\xdd\xfb\xa4\xe5\x5b\xd5\xe8\xd3\x91\x35\xe6\xab\xaf\xbe\xfa\xf7\x7f\xfa\xa7\xb3\x75\xfe\xb5\xd5\xe6\xe2\x6a\x35\x9f\xcd\xd3\x34\x4d\xd2\x38\xd2\x9a\x33\x7e\x89\x30\x91\xf2\x40\xcb\x55\x96\x4f\x22\x4d\x9f\xac\x96\xf2\x62\xb5\x91\x42\x28\x29\xad\xb3\x57\xeb\xf5\x26\xcb\xac\x35\xde\xb9\x27\x92\x22\xa2\x77\xd6\x54\xe5\x1f\xfd\xf6\x6f\xfe\xe4\xdf\xf8\x8f\xbf\xce\x7e\x7a\xef\xcb\x6c\xf3\xd6\xab\x5f\x7e\xe3\x2b\x5f\x7c\xeb\xab\x5f\x39\x7b\xe3\xb5\xe5\xd9\xa3\x72\xb3\xe2\x9c\xc7\x49\xc2\x6b\x67\x86\x8a\x3e\x6c\x44\x63\x2a\x6b\x9d\xb5\x56\xc6\x93\xe4\xf0\xee\xc1\xf3\x2f\xee\x3f\xf8\xe0\xf4\xe0\x48\x28\xdd\x12\xd4\x46\x74\x4d\x43\xac\x0a\xaf\xeb\xbe\x5a\x75\x28\xa4\x4e\x9e\xe7\xcd\xca\x58\x9b\xd2\x34\xb5\x6a\xba\x8e\xc4\xd6\xd4\xb0\x05\xbe\x0f\xd7\x79\x25\xb1\xef\xa7\x1a\xb4\x10\x61\x39\xc4\x22\xa1\x9d\x4d\xd5\x1f\x89\x2c\xb4\x09\x8d\xbc\x3c\x4d\x46\x1f\x24\xb0\x6e\xcc\xbc\xde\x21\x22\xbc\x6f\x01\x40\x2f\xfe\x11\x60\x07\xc9\xb5\x59\xa0\x5b\x0e\x85\x66\xde\x66\x1a\xc6\x50\x0e\x44\xd1\x4c\xba\x02\x56\x17\xd8\x7a\x85\xb0\xd6\xd3\x6f\x22\xee\x36\x21\x74\x83\x68\x93\xf6\x37\xed\x9c\xbb\x2d\x8f\x48\xd5\xad\x17\x69\x1c\x11\x6f\xec\x76\x6f\x1d\x56\xaf\xf9\x29\xa5\x92\x24\x89\xa2\x48\x29\xd5\xdb\x9f\x5b\x7a\x2f\xd1\x2d\x10\xde\x4c\x55\x59\x3c\x7c\xf5\x2b\xaf\xbd\xfc\x85\xaf\xbd\xf2\xca\xa3\x87\x0f\x3f\xf9\x87\x7f\xf4\x95\xd7\xde\x78\xeb\xad\x37\x85\x94\x9b\x3c\x3b\xbf\x5c\xa6\x49\xa2\xb5\x9e\x4c\x92\x49\x9a\x3e\x3e\x85\x28\xd2\xb3\x34\x11\xce\xbd\x74\xf7\x30\x52\xca\xa1\xcf\xcb\xca\x58\xbb\xce\x73\xc9\xf9\x72\xbd\x7e\x7c\x7e\xb1\xce\x32\x25\x38\x67\x20\xb6\x16\x33\x1e\xd1\x57\x55\x95\x65\xd9\x17\xbf\xf0\xb9\x6c\xbd\x4a\xa7\xb3\x67\xeb\xad\x73\xf6\x0b\xbf\xf7\xc9\x3f\xfc\xd5\x7f\xf2\xea\x9f\x7e\xa6\xcc\x36\xc4\x13\x95\xd6\x42\x4a\xae\x13\x64\x2c\x77\x0c\xbc\x63\x16\xb5\x14\xd6\x83\x12\x9c\x31\x26\x95\xd6\x9a\x01\x63\xc6\xd8\xcb\xb7\x5e\x2b\x4e\xde\x78\xf5\xf7\xfe\x39\xca\x78\x72\xf7\xf9\x07\x1f\xf9\x9e\xa3\x17\x3f\xac\x93\x14\x1a\xac\x27\xb0\x8f\x21\x25\xd2\xd3\xd6\x81\x3e\x39\x92\x56\x3a\xab\xaa\x6a\xde\x60\xf3\x94\x96\xb0\xd2\x5c\x94\x0a\x3b\x03\x24\x34\xf3\x35\xf6\xf6\x27\x54\xee\x5e\x6b\xa8\xcf\xcf\x50\x67\x97\x87\xf8\x76\x5d\xab\x17\x54\xba\xac\xbf\x7b\xf5\x80\x85\x01\xfe\xb1\x21\x64\xdb\x3e\x0a\xc2\x77\x4b\x07\x3b\x22\x1f\xc3\xf5\xc7\xdd\xed\x79\x17\xf9\xb0\xe1\xb7\xd0\xbc\x44\x77\x4e\xb6\x7b\x1d\xc6\x18\xe9\x3c\x43\x2a\x79\xa5\xd4\xd3\x4a\x2a\xb7\xf4\xae\xa6\x5b\x20\x1c\x23\x67\xed\x2b\x9f\xfd\xe3\x4f\xfc\xf2\x2f\xac\xce\x4e\xa7\x49\x9c\x95\xe5\x26\xcb\x3f\x78\x67\x1f\x8a\x3c\x5f\xad\x2e\x57\xeb\x8b\xb3\x0b\xce\x79\x14\xe9\x38\x8e\xd3\x74\x12\xc7\x51\x92\xc6\x91\xd2\x55\x51\x38\xe7\xb2\xa2\xb8\xbf\x98\xed\xc5\x89\x56\xc2\x7b\xb7\x5c\x65\xeb\x4d\x96\x15\x79\x5e\x14\x9b\xbc\x94\x82\x49\xce\xb5\x14\x88\x9e\xc4\x90\xaa\xaa\xf2\x22\xb7\xde\x9d\x9f\x9e\x3c\x1b\x10\x5a\x63\x7e\xf6\x7f\xf8\x6f\x3f\xfb\x5b\xbf\x4a\x33\x5b\x10\xd2\x32\x9e\x59\x74\x55\x59\xf9\x02\x80\xc2\xbf\x70\x25\x85\x56\x42\x09\x21\x05\x07\x00\xef\xfd\x3c\x4d\xb4\x12\x9c\xb1\x4d\x51\x49\x21\x92\x38\x4e\xe2\xd8\x79\x9f\x3f\xfe\xf3\x97\x5f\xfb\xd2\xcb\x42\xee\x7f\xe0\x43\xf7\xbe\xe3\xfb\x8e\x3f\xf4\x1d\x32\x8a\x83\x22\xb1\x29\xbd\x41\x47\x88\x79\xda\x3a\xd0\xa7\x59\xed\x9e\xd8\x64\xac\xc1\xb5\x7f\x68\x40\xe8\x74\xf2\x36\xa3\x05\x2d\x12\x8f\xba\xaa\xbf\xe0\x9a\xdd\xeb\xe6\xd8\x45\x8e\xde\xfb\xea\xee\xec\xbd\xf7\x1b\xeb\xec\xd2\xce\x8e\x75\xa0\xa3\x23\x0d\xa8\xe6\x1b\xc9\x16\x9a\x85\xa6\x26\xb9\x19\xb7\xe5\x46\x61\xab\x4b\xa1\x4e\xb7\x6f\xdd\xce\x77\x31\xac\x8b\x58\x6f\x57\x1d\x5a\xae\x9e\x4e\xa7\xb4\xe6\x77\xeb\xed\xf0\x3e\xa7\x5b\x20\x1c\xa4\xb3\xb7\xde\xf8\xe4\x2f\xfd\xdc\x5b\x5f\xfe\x33\x63\xad\x56\x92\x33\x36\x89\x63\x2d\xe5\xd1\xde\xe2\x70\x31\xfb\xc8\x07\x5f\x00\xc4\x37\x4e\xce\xce\x2e\xaf\x4e\xaf\x96\xcb\x2c\x37\x45\xce\xd1\x79\x6b\xc4\x6c\x56\x49\x2e\xa5\x3c\xbb\x5a\x5e\xad\xd6\xdf\x76\xb8\x2f\x19\x64\x79\x66\xab\x6a\x93\x67\xf5\x14\xdb\x71\x10\xd6\x1a\xf4\xce\x38\x87\xde\x79\xef\xac\xb5\x59\x9e\x39\xe7\x36\xeb\xd5\xb3\xf5\xf9\x53\x1f\xfb\x85\x4f\x7f\xe2\xe3\x0e\xc1\x21\x1a\xef\x4a\xeb\xad\xc7\xc2\xfa\xca\x91\x2b\x82\x00\xc6\x04\xe7\xb1\x96\x91\xa2\xff\x45\x69\xac\x12\x42\x09\x59\x1a\x2b\x38\x97\x82\x2b\x29\x8c\x73\x00\x50\x59\x6b\x10\xbc\x54\xb3\x38\xba\x78\xed\x95\xaf\x7d\xe1\xb3\x87\x87\x77\x3e\xf8\xfd\x1f\xfd\xee\x7f\xe9\xc7\xe7\x77\x8e\x8b\xb2\xcc\xb2\x8c\xd6\x75\xb0\x4f\x8f\xd7\x2a\x7c\xfd\x75\x9e\x96\x42\x9b\x23\x81\x78\xba\x0c\x3d\x70\xcc\xa6\x53\x63\x80\xc3\xae\xd7\x63\x17\x38\xe1\x3a\x00\xb4\xae\xf8\xb4\xfd\x6f\x95\x9b\x85\x26\xaa\xe1\x75\x57\xf4\xa0\xdd\x6d\x8a\x74\xad\xcd\x16\x4e\x34\x0b\xe3\xd4\x9a\x19\xec\x7e\x2f\xdd\x3b\x1a\x7a\x13\xde\xde\x3a\x40\xe1\x76\xb5\x5e\x2c\x16\xb4\xda\x47\xce\xf8\x4f\x75\x0b\xb7\xf4\x1e\xa6\x5b\x20\xec\xa1\xaa\x2c\x3e\xf3\xeb\x1f\xff\xf4\xaf\x7f\x7c\xb3\x5e\x2b\x29\x22\xa5\x58\x1d\x32\x5b\x0a\x81\x88\x52\x88\x17\xee\x1e\x09\xc1\xbf\xed\xf8\xae\x14\xc2\x23\x6e\x8a\xb2\x32\xe6\xe1\xc5\xd5\xc9\xd5\x72\x63\x4c\x61\xad\xe0\xcc\x00\x56\x65\x79\x76\x79\xa1\x19\x64\x79\xe6\xac\x35\xce\x95\x55\xe5\x3d\x2a\xc1\xc0\xf1\xc2\x58\xc1\xb9\xb1\x0e\xc0\x73\xf4\x65\x55\x1a\x63\x00\x00\x9e\x89\xf5\x67\xeb\xd5\xaf\xfe\xfc\x3f\x28\xad\x2b\xad\x2f\xad\xcf\x8d\x2d\x8d\x5f\x15\xe5\xba\xa8\x1c\x42\x1c\x45\x4a\xd2\xd2\x11\x44\x4a\x25\x91\xd2\x42\x20\x40\xac\xe5\x3c\x4d\x96\x59\x21\x04\x57\x52\x28\xc1\x8d\x15\x5a\x09\xe7\x3c\x22\x30\xce\x29\x77\x85\x8e\xa3\x0f\xcc\x26\xd6\xda\xaf\xfc\xfe\x6f\x7c\xe1\x77\x7e\xf5\xb9\x0f\x7f\xf7\x5f\xfa\xd7\xff\xbd\x8f\xfc\xc0\x47\x81\x31\x6b\x6d\x51\x14\x67\x67\x67\x64\xe0\x47\xbe\xf3\xcf\x8c\x5e\xdf\x5a\x6a\x8a\x2c\xad\x90\x3d\x4f\x69\xe3\xb5\x40\x00\x00\x1d\x97\x49\x44\x41\x54\x25\x00\xc1\x80\xf6\xb2\x85\xbb\x5f\x7f\x9d\x5d\xc6\x79\xa8\x0e\xc1\xe1\x8d\xa7\xbf\x1b\x89\x74\xe3\x14\x71\x8d\x0c\x95\x49\xd6\x7f\x2a\xdb\xc0\x5b\x7a\xff\xd0\x2d\x10\xb6\xe9\xab\x2f\x7f\xe1\x93\xbf\xf8\xb3\x67\x6f\xbc\xc6\x39\x77\xde\x33\x07\x92\x73\x8f\x68\xac\x53\x42\x50\x60\xb1\x58\x49\x63\x8d\x75\x4c\x0a\x41\x7a\xc2\x59\x12\x17\x82\x7f\xf8\xf9\xe3\xef\xfe\xb6\x07\xcb\xbc\x78\xf5\xe4\xec\xf5\xb3\x73\x70\x9e\xd9\xaa\xcc\x6d\xe1\x5c\x5e\x96\x1c\x10\x11\x2b\x53\x79\xef\xad\x65\x4e\x0a\x00\x44\xe7\x19\x7a\xeb\x6c\x65\x8d\xb1\xd6\x7b\x3f\x99\xcd\x92\x74\xf2\x0c\x3d\xff\x95\x9f\xf9\x7b\x6f\xbc\xf6\x5a\x56\xd9\xa2\xb2\x9b\xbc\x5c\x65\xe5\xaa\x28\xd7\x79\x59\x18\xeb\x11\x94\x92\x7b\x8b\xf9\x6c\x3a\x91\x82\x6f\x8a\x4a\xe7\x22\xd6\x6a\x96\x44\x42\xf0\xab\x4d\x26\x85\x20\x19\x51\x09\x21\xa5\x33\x56\x48\x21\xb4\x12\x82\x73\xc1\x99\xf3\x18\x2b\xcd\x38\xd3\x91\xd0\x5a\x5b\x6b\xcf\xbf\xf6\xa5\x5f\xfc\x1f\xff\xbb\xbd\xe3\x07\x1f\xfd\x37\xfe\x83\xef\xff\xb1\xbf\xb2\xb7\xb7\x17\x58\x2a\xa9\xd1\xc8\x08\x9e\x88\xcc\x25\x5a\xc6\x20\xef\x6d\x7a\x5a\x81\xe9\xa9\xe8\xbd\x8a\x5e\xcf\x46\xc1\xa2\xaa\xe9\xb4\xda\x1b\x7a\xed\x96\x6e\x69\x88\x6e\x81\xf0\x09\xd9\xaa\xfa\x83\x5f\xfd\x95\x4f\x7f\xe2\xd7\x44\x1d\x20\x54\x30\x28\xca\xd2\x18\x9b\x15\x85\xf3\x5e\x70\x3e\x4b\x13\x00\xb6\xca\xf3\x48\x29\xad\x24\x52\x80\x18\xce\x39\x63\xde\xa3\xe0\x50\x54\xd5\x66\x93\xad\x56\x6b\x57\x1a\x30\x86\xa3\xdf\x6c\x8a\x3a\xb1\xad\x43\xf4\x1c\x80\x33\x60\x0c\xdd\x56\xa3\x48\x36\x08\xc6\x3a\x67\x9d\x53\x52\xee\xef\x1d\x1c\xde\xbd\xf7\x54\x3d\x47\xef\x7f\xeb\x1f\xff\xc2\x3f\xff\x87\xff\x67\x59\xd9\x2c\x2f\xd7\x79\xb5\x29\xab\x75\x56\xae\xcb\xaa\x32\x16\x3d\x02\x62\x51\x54\x27\xd5\xd9\x72\xb9\x9a\x2f\x66\x4a\x69\xc9\x23\xe7\x7c\x56\x54\xa5\x71\x5a\x0a\x25\xc5\xa6\xa8\x18\x03\x2d\x45\x1a\xe9\x69\x12\x69\x25\x2b\x67\x05\xe7\x4a\x08\x25\x84\x94\x5c\x70\x8e\x80\xc6\x3a\xe7\xfc\x74\x32\x49\x27\x93\xf5\xf9\xc9\x3f\xfc\x3b\x7f\xfb\x93\xbf\xfc\x7f\xfd\xd5\xbf\xf9\x9f\x3e\xf7\xe1\xef\xa6\x55\x96\x60\x88\x1f\x9c\xe5\x49\x4d\x57\xe7\x78\xda\x12\xc5\x91\xb9\xe5\xe9\xb7\xb4\x23\xd1\x4b\x45\x12\x5e\x1c\xc7\x94\x3e\xb7\x2c\x4b\x72\x67\xbc\x5d\xe1\xbb\xa5\xaf\x87\x6e\x81\x70\x4b\xcb\xf3\xb3\xdf\xf8\xd9\x9f\x79\xf4\xb5\x57\x9c\x31\xa5\x73\xab\xcc\x47\x4a\xa2\x47\xeb\x9c\xb1\x16\x00\x8a\xca\x90\xfc\x87\x00\x79\x59\xe9\xb9\x00\x44\x4b\x31\x33\xbd\xf7\xde\x97\x95\x39\xc9\xb2\x4d\x9e\x9f\x2d\x57\x97\x9b\xa2\x32\xce\x54\x15\x78\xe7\x9c\xe5\xde\x39\x6f\x4b\x63\x15\x67\x8c\xd5\x33\xfa\xad\x62\x0a\xbd\xf7\x8e\xe2\x0b\x23\x28\x15\x3d\xf8\xe0\x4b\x93\xd9\x7c\x97\x3e\x7b\xe7\x96\xe7\xa7\x6f\xbc\xfa\xe5\x3f\xfa\xc4\xc7\x3f\xfd\x3b\xbf\x69\x2a\x0b\x5c\x30\xa5\x99\x45\xe6\x41\x44\x20\x11\x3c\x70\x34\x06\x11\xc9\xc2\xbd\x28\xca\x2c\x2f\x92\x38\x76\xfb\x73\xad\x54\x12\xc7\x4a\x8a\x0d\x00\x00\x0a\x21\xa6\xb1\x66\x2c\x2a\x8c\x05\x06\xd2\x18\xce\xb9\x12\x3c\x52\x4a\x0a\xae\xec\xd6\xb2\x66\x93\x97\x42\xb0\x24\xd2\xc6\x5a\x15\x45\x7b\x7b\x7b\x57\x27\x0f\xff\x8f\xbf\xfd\x5f\x7d\xe7\x0f\xfc\xd0\x8f\xff\xad\xff\x7c\xef\xe8\xb8\xdb\x4f\xe2\x53\xa4\xaa\xa2\x3d\x88\xb8\x58\x2c\xc8\x2f\x3e\x64\xbd\x09\xfe\xfe\xbd\x61\xc4\x6f\xe9\x7d\x42\x42\x08\x52\x69\xc6\xd7\x89\x7c\x1c\x5b\x72\xde\xad\x6d\xe7\x2d\xbd\x2d\x74\x0b\x84\x00\x00\x0f\xbf\xf6\xea\xc7\x7f\xe6\x7f\xc9\x96\x57\x8c\x31\xc1\xd9\x26\xaf\x2e\x57\x6b\xc1\x39\x65\xea\x13\x82\x33\xc6\x63\xad\x10\x31\x2b\x0a\xc1\xc5\x24\x8e\x00\xb1\x32\x16\x00\x9d\xf7\x79\x51\xac\xf3\x7c\xb5\x5e\x67\x79\x51\x99\xca\x38\xef\x3c\xb7\x0e\x9d\xb5\xd6\x19\xf0\x4e\xa0\xb5\xce\x0a\x86\x88\xe8\x5c\xd0\x10\x6e\x53\x4f\xf8\x3a\x66\xc7\x34\x4d\x16\xf3\xf9\xbf\xfc\xaf\xfd\xb5\xf1\xde\x9e\xbe\xf5\xc6\xaf\xfc\xcc\xdf\xfb\xf3\x2f\xff\x59\xb6\xba\xe2\x80\xce\x7b\x64\x3c\x8a\xe3\xd9\x3c\x9e\x4c\xd2\xcb\x75\xbe\xef\xe1\xfc\x72\x79\xb1\x5c\xab\xa2\xcc\xf3\x9c\xc2\x74\x6c\x15\xaf\x88\xc0\x58\x5e\x14\xe5\xc3\x52\x0a\x31\x99\xa6\xb3\xe9\x54\x2a\xc5\x39\x93\xdc\x09\xce\x18\xe3\xce\xfb\xd2\x58\x29\xf8\xff\xdf\xde\x9d\xc7\x7a\x76\x96\xf7\x01\x7f\x9e\xe7\x5d\xce\x39\xbf\xe5\x2e\xe3\x3b\xab\x8d\xc7\x36\xd8\x01\x3b\x0e\x10\x0c\x61\xc9\x94\xd5\x81\x10\x42\xe2\x12\x20\x20\x02\x24\x44\x84\x10\x50\x20\x25\x21\x8a\x2a\x21\x35\x48\x54\xca\x1f\x69\x55\xda\xb4\x64\xa3\xb4\x55\xad\x50\x22\x9a\x26\x54\x90\x46\x96\x5a\x08\xd0\x28\x2c\x49\xd9\xcc\x12\x7b\xc6\xcb\xcc\x5c\xdf\xfd\xb7\x9c\x73\xde\xe5\xe9\x1f\xe7\xce\xd5\x30\x86\xc1\x63\x3b\xcc\x8c\xcf\xf7\xf3\xc7\x48\xbe\xf3\xbb\x8f\xce\x3d\xd7\x9a\xaf\xce\x7b\xde\xf7\x79\x9a\x10\x17\x06\xe5\xb0\xcc\xd6\x88\xb7\xd6\x59\xa3\xaa\x93\xba\x19\x14\x7e\x7d\x67\xea\xad\xb1\xc6\x84\xa4\xa3\xd1\x68\x61\x34\x7c\xe0\xae\x3b\x3f\xf8\xdb\xbf\xf1\xb2\x9f\xff\x95\x27\x3c\xf5\x47\xbe\xe7\x0d\xe7\x33\x67\xdd\x9c\x73\xa3\xd1\x68\xf7\x76\x9c\xd9\xcd\xb1\xd7\x31\xb5\x9b\x86\x3a\x99\x4c\xba\x2d\x39\x8f\xe4\x57\x0c\x97\x14\x66\xee\x0e\x83\xee\x4e\xfd\x3a\xab\xdf\x90\x31\x66\xdf\xbe\x7d\x0f\x63\x3f\x0e\xc0\xc3\x86\x20\xa4\xbb\xbf\xfa\xa5\x4f\xfc\xa7\x3f\x8c\x6d\x93\x52\xda\xd8\xde\x69\xda\x66\x32\xaf\x63\x4c\xd6\xda\xe8\xac\xb3\x36\xa5\x2c\x22\x55\xe1\x8d\x31\xce\x18\x3d\x33\xff\xbd\x0d\x61\x3a\x9f\xd5\x4d\x3b\xab\xe7\x4d\xdb\x76\xbb\xce\x63\x8a\xc2\x1c\x32\x37\x6d\x56\x25\x27\x24\x42\xac\xac\x49\xdb\x18\xa9\x9b\xf2\xae\xc4\xdc\xfd\xc3\x4f\x4a\xda\xc4\x64\x98\x0b\xef\x8d\xaf\x7c\x35\xfa\xd1\x1f\x7b\xe9\x79\xae\xf6\xfe\x13\x77\xbd\xff\x9f\xbf\xf3\x81\xd3\xa7\x84\x79\xdf\x78\x98\x88\x8d\x75\x6c\x6d\x51\x94\x4b\x0b\x0b\x2a\x56\x8a\xa1\xf3\xfe\xc8\x91\xc3\xdb\x93\xe9\xbd\x27\x4f\xaf\x6d\x6c\x4e\xa7\xb3\xba\x6e\xeb\xba\x6e\xda\xb6\x69\xa3\xaa\x12\x2b\x13\xc5\x94\xb6\xb7\x76\xea\xba\x71\x45\x31\x1a\x0e\xca\xc2\xef\xcc\x34\xa6\xdc\xc5\xbf\xaa\x8a\x88\x35\xb2\x3d\x9d\x5b\x2b\xfb\xc6\xc3\xc2\xd9\x10\x53\xd3\x46\x6f\x6d\xe1\x9c\x35\x26\xe7\xdd\x0d\x7b\xd3\x36\x30\x9b\x7d\x23\xff\xa9\xdb\x3f\xb0\x71\xff\x89\xa7\xbd\xf8\x36\xb9\xf0\x2d\x79\x7b\xdb\x32\xbb\x43\x5d\x7b\x5f\xef\xba\x00\x76\xc7\x24\xba\xae\xca\x7b\x4b\xac\x5d\x47\x92\x0b\xfe\x95\xc3\xf7\xc5\xde\x50\xf8\xee\xb8\xc2\xd9\x9c\x73\xe7\x6c\xaf\x3d\x1b\xd6\x39\xe1\xfb\xac\xef\x41\x78\xe2\x1b\x77\x7e\xf4\xf7\xff\x6d\x0a\x6d\xd3\xb6\x6b\x9b\x5b\x5b\x93\xa9\xaa\x56\xde\x29\xd1\xac\xae\xe7\x0d\x0f\xcb\x92\x98\xbc\xb5\x21\xc6\x6e\x21\x74\x32\xaf\x49\x73\x1b\x42\xd7\x2c\xdb\x19\x26\xcd\x31\xa6\x10\x63\x13\xa3\xe6\xec\x0d\x67\x25\x21\xcb\x2c\x94\x73\xa6\xa4\xb9\x7b\x18\xcb\x29\x2b\x33\xd1\x6e\x10\x52\x52\x8d\x29\x0b\xb3\xf3\xde\x97\x55\x59\x54\xc7\x6e\xfd\xf1\x2b\x8f\x5e\xfb\xdd\x16\x7c\xea\xf9\xec\x77\xdf\xf3\xeb\x6b\xa7\x4f\x31\x53\x51\x78\xb6\x36\x2b\x8b\x75\x45\x51\x54\x65\x45\x2c\x22\x66\x58\xba\xaa\xaa\xc4\x98\xa5\xf1\x78\xff\x15\xfb\xd6\x36\x36\xef\xbd\xff\xf4\xea\xfa\xfa\x74\x3a\x6f\x9a\x66\x3e\xaf\xbb\x46\x1f\xdd\x1a\x6f\x56\x9d\xd7\x4d\xdd\x86\xa6\x69\x8b\xb2\xa8\xca\xa2\x0d\xb1\xf0\x2e\xab\x5a\x23\xe3\xaa\x98\xd5\x6d\x4a\xd9\x67\x3b\x99\xb7\xb3\x26\xd4\x6d\x3b\xae\xca\xa4\xb9\x89\x21\x69\xb6\x22\xf3\x36\xc4\x94\x8d\x88\xb3\xa6\xf4\x9e\xc8\x7d\xed\xff\x7c\x7c\xba\xb9\xf6\x9c\x9f\x79\xa3\xf3\xe7\x0e\x9d\x78\x78\xf8\xcc\x69\xf7\x6e\xd4\xc6\x39\x7f\xdb\x9d\xbf\xec\x42\x71\xaf\x0b\x73\xf7\x4c\xd9\xb6\xed\x63\x78\x63\xe4\xc5\xd5\x3d\xd3\xef\x75\x57\x3f\xbb\xc7\x7a\x37\x14\xbe\x9b\x9d\xd4\x7d\x18\x0b\x98\x70\x89\xeb\x75\x10\x4e\xb7\xb7\xfe\xe2\x83\x1f\xd8\xd8\xdc\x5c\xdb\xda\x6a\x9b\x26\xa6\x24\xcc\x4c\xdc\x84\x18\x73\xf2\xd6\x59\x23\x39\x27\x23\x12\xbb\x46\x88\x29\x85\x18\x9a\x36\x74\x2f\xf5\x62\xca\x21\xb4\x6d\x9b\x9d\x70\x88\x71\xde\xb6\xa4\xca\x4c\x51\x89\x94\x88\x33\xa9\x10\xa9\x6a\x22\xcd\x44\x9a\xb2\x36\x31\x39\x61\x25\xb2\xb2\x3b\xd0\x96\x98\x7d\xe1\x87\xd5\xa0\xa8\x06\x47\x8e\x3c\xee\x0d\x6f\x7f\xe7\x79\x2e\xf8\xcf\x6e\xff\xcf\x77\xdf\x75\xb7\xb3\x52\x79\x27\xc6\x24\x92\xaa\x2a\xaa\xb2\x1c\x94\x95\x31\x2e\x2a\xc7\x10\xd9\x98\x18\x53\x69\xad\x33\xc6\x96\x65\x75\xf0\xc0\xbe\xc5\xc5\xb5\xcd\xad\xfb\x4e\x9e\x5e\x5d\x5b\x9f\xf8\xd9\x6c\x5e\x87\xb6\x9d\x37\x4d\x0c\x49\x28\x33\x51\xca\xb9\xae\xeb\x6e\x33\x4b\xdd\x34\x85\xf7\xde\xb9\x41\x55\xec\xcc\x9b\x36\x24\x63\x84\x98\xd6\x77\xa6\x31\xa5\x6e\xef\x0c\x11\x85\x98\xbc\xb5\xce\x08\x8b\x74\xa7\x0f\xbd\xb1\x21\x25\x6b\xc4\x97\xe5\xc9\xaf\x7c\xe1\x8e\x0f\xbd\xff\xb9\xaf\x7d\x4b\xf1\xb0\xb6\xbf\x5e\x90\xae\x21\xd6\xde\xdb\x47\x3a\xab\x1b\x61\x97\x88\x7b\x73\xe9\xce\x99\xd4\xd3\xbd\x8c\x7c\xf0\xf9\xb6\x7e\x3a\xfb\x04\xe4\xde\x3e\xcc\xbd\x86\x76\xdf\xf1\x3f\xf7\xef\xdf\x7f\xb1\xaf\x1a\xe0\xd1\xd1\xeb\x20\xfc\xe4\xc7\xfe\xc7\x89\x13\x27\xd6\xb7\xb6\x26\xb3\x59\xce\xd9\x30\xc7\x9c\x95\xc8\x88\x64\x55\xcd\xca\xde\xa5\x14\x73\xd6\x6e\x2f\x4b\xca\x69\x77\xff\xe7\xee\x99\xe5\x44\x39\xa6\x94\x43\x4e\xdd\xdb\x2d\xcd\xd9\x08\x45\x55\x22\x25\x4d\xcc\x42\x24\x59\x13\x93\x92\xa6\x36\x66\x21\xca\xaa\xa4\x94\x49\x99\xd8\x18\x33\x2c\xcb\xb2\x2c\x17\x86\xe3\xe1\x78\xe1\x57\xdf\xf3\xdb\x57\xec\x3f\xf0\xdd\xae\x36\xc5\xf8\x97\x7f\xf6\x91\x94\xd5\x2a\x2b\x4b\x93\xb2\xa4\x5c\xb1\xb1\xd6\x19\xb1\x22\x66\x68\x5d\x13\xd3\x70\x30\x10\xe9\x16\x5e\x49\x89\x9c\x31\x0b\x83\x6a\x50\x96\x2b\xcb\x4b\xeb\x9b\x5b\x77\xdf\x77\xf2\xfe\xd3\xab\xb1\x6d\xed\x74\xde\xb6\x6d\x68\xdb\x10\x62\xf7\x03\xc5\x18\x73\x4a\x31\x84\xe8\x43\x2c\x8b\x10\x02\xb3\x54\xa5\x2f\xbc\x6b\xda\xc8\x4c\xce\x1a\xb2\x34\x6b\xda\x90\x72\xdd\x46\xef\x4c\x77\xdc\x22\xa6\xe4\xad\x4d\x59\x4b\xb5\x39\x1b\x6b\x44\x8c\x59\x3f\xfe\xcd\x3b\x3e\xf4\xfe\xe7\xbf\xfe\x6d\xdf\x87\x2c\xfc\x6e\xba\xde\xdc\xdd\x5c\xaa\x07\x53\xd5\xd5\xd5\xd5\xbd\x4e\x98\x7b\x7d\x9f\xf7\xda\x63\x76\x2f\x26\xf7\x3a\x8b\xea\x83\x66\x38\x5c\x22\xce\x5e\x63\x3c\xfb\x50\x7f\xd7\x2b\xa7\x7b\x32\x3b\xdb\x83\x23\xad\xfb\xfa\x6c\x36\xeb\x7a\xee\x60\x65\x12\xfa\xa6\xd7\x63\x98\xfe\xdd\x6f\xfd\xb3\xb5\xd5\xd3\x5b\x93\xc9\xac\xae\x49\x95\x49\xe7\x4d\xd3\x86\x68\x8c\x34\x21\x58\x31\xce\xc8\x59\x6d\x3a\xf2\x5e\x5f\xaa\x2e\x39\xd2\x6e\x57\x65\x6d\x42\x8c\x29\x5b\x26\x55\xed\x1e\xf4\x88\x28\x67\xca\xca\xc4\x9c\x72\xf6\x86\x49\x35\xe6\x4c\x44\xc2\x4a\x44\xc2\x62\xad\xf5\x85\x1f\x0e\x86\xa3\xe1\x68\x71\x71\xe9\x35\xbf\xfc\xce\x1f\xfe\x27\xcf\x3f\xcf\xd5\x9e\xf8\xd6\x37\xdf\xfd\xf3\x3f\x9b\x84\xbd\xb7\xc3\xaa\x54\x62\xef\xdc\xca\xe2\xc2\xf2\x78\x61\x50\x96\x65\xe1\x45\xac\x88\x61\x16\x25\x52\x26\x55\x52\x26\x25\xde\xdd\x9c\xca\x9c\x72\xde\xd8\xd9\x59\x5d\xdb\xdc\xdc\xde\xbe\xe7\xfe\x53\xd3\xe9\xac\x69\xda\xba\x6e\x9a\xb6\x0d\x31\xf1\xee\xc5\x13\x75\xfb\x3c\xad\x75\xce\x96\x45\x37\x34\xd5\x16\xde\x39\x6b\x9d\x35\xd6\x48\xe1\x6c\xe1\x9c\x77\xc6\x59\x63\x44\x86\x85\xaf\x0a\x57\x38\xeb\xac\x29\xac\x4d\x59\x07\xa5\xf7\xd6\x08\xd3\xf8\xc8\x35\x2f\x7a\xc3\xdb\x5c\x51\x9e\xe7\xe7\xba\xc4\xa9\x6a\xfa\x76\x7b\xad\x35\xcf\xfe\xb3\x3b\x3d\xb9\xf7\xe7\x39\xfd\x5c\xce\x7e\xe2\x3c\xbb\xe9\x0c\x3f\x68\xe6\xf0\x39\xdd\x6a\xce\x69\x64\x73\x4e\xaf\xb8\x73\xfe\x8a\xcf\x34\x93\xe3\x33\x0d\xb8\x2f\xd2\x3d\x03\xb8\xcc\x5c\xf0\x13\xe1\x65\x37\x5f\xe3\x3c\x95\x63\x5b\x1b\x66\x6b\xed\x78\x30\x10\xa2\xed\xd9\xcc\x59\x27\xcc\xa4\x39\x32\xd5\x4d\x43\xce\x9c\x1d\x84\x5d\x0a\xaa\xe6\x94\xb2\x6a\x6e\x62\x32\x4c\x4c\xc4\xaa\xac\x39\x2b\xc5\x9c\xad\x70\xd7\x17\x26\x66\x8d\x59\xbb\x6d\xa8\xdd\xbf\x83\x86\x49\xbb\x07\x41\x6b\x8a\xa2\x28\x8b\xb2\xf0\xc5\x68\x38\x5a\x39\x78\xf8\x35\x6f\x7d\xc7\x8d\x4f\x7b\xc6\xf9\xaf\xf9\xee\xb6\xb6\xcc\xa4\x6a\x59\xba\x41\x70\xce\x5a\x26\x2e\x9d\xf5\x56\x6c\x77\x92\x8a\x95\x28\x13\xf1\xbc\x6e\x93\x6a\x59\xf8\xac\xa4\x44\xc6\x88\x12\x31\xf3\x42\x35\x30\x2b\xb2\x30\x1a\x56\xd5\x60\x7b\x67\x7b\x6d\x7d\x73\x67\x32\x8d\x31\x36\x75\x33\xaf\xeb\x18\xe2\xde\xd6\xcd\xd8\xb4\x6d\xdb\xd6\xb3\xb9\xb1\xc6\x39\xe7\x0b\x5f\x16\x85\x31\x52\x15\x45\xe3\xac\x73\xa1\xdb\x47\xea\x8c\xd4\x6d\x18\xc5\x62\x54\x16\xde\x9a\xe4\x72\xca\x5a\x87\x60\x45\x46\x55\x71\xfa\xcb\x7f\x6f\xff\xe4\x8f\x7f\xe6\x57\xde\x7d\xce\xde\x99\x4b\xff\xff\x0d\x54\x46\x65\x54\xee\x4f\xe5\x5e\x2f\x8d\x56\x0b\x4b\xf7\xdc\x7f\x32\x67\xdd\x7d\xca\x09\x8e\x99\xac\xa1\xb6\x6d\x35\x25\x43\xa9\x69\xc2\x99\x76\xc3\x39\xc4\xb4\x77\xe0\x81\x48\x73\xd6\x94\xb2\x98\xae\xf5\x9a\x0a\x51\x48\x59\x77\xd7\x3c\x89\x88\x62\xce\x4c\xdd\x86\x19\x55\xa5\xa4\x6a\x84\x8d\x58\xe7\x6c\xe1\x8b\xaa\xaa\xca\xa2\x1a\x54\x83\x27\xff\xc8\xb3\x7f\xea\x8d\x6f\xde\x7f\xf8\xc8\xf7\xbc\x5a\x6b\x9d\x33\x36\xc7\x90\x43\xe4\xac\xe3\x81\xf7\xde\x2f\x0d\xcb\xc2\x89\x33\x2c\xac\xac\xdd\xaa\x1d\x13\x31\xa9\xc6\x10\x5b\xe6\xc9\xbc\x1e\x0d\x2a\x67\xbc\xaa\x2a\x53\xe9\xac\x91\x81\x66\x3d\xb0\x6f\x69\x79\x61\x74\xf8\xc0\xfe\x93\xab\x6b\xd3\xe9\x74\x7b\x67\xd2\x34\x4d\x5d\xef\x0d\x41\x4d\x94\xf3\xee\x0f\x12\x62\x0c\x71\x3e\x9b\x4f\x8c\x71\xde\x95\x65\x59\x55\x45\x59\x14\x85\xb3\xc4\xec\xac\x0c\xcb\x42\x98\x63\x4c\x0b\x83\xb2\x7b\x0e\x8a\x29\xef\x1b\x0f\x55\x75\x50\x16\x5f\xff\xdc\x67\x3f\xfb\x3f\xff\xf4\x59\x2f\x7b\xe5\x3f\xde\xef\x11\x00\xe0\x91\xe8\x75\x10\xde\xf6\x0b\x6f\xfe\xd0\xef\xfe\xce\xf1\x13\xc7\x43\x48\x93\x69\xca\x39\xc7\xd0\xb6\x6d\xd3\x86\xa6\x6d\x43\x8c\x31\xa6\xd8\x2d\x72\x85\x98\x63\xce\x4e\x38\xab\x1a\xa6\xac\x94\x72\x36\xc2\x67\x0f\x56\x33\x4c\x89\x34\x2b\x19\x66\x62\xf2\xa6\x7b\x56\xec\xa6\xcd\x91\x13\x43\x62\xbc\x73\xe3\xaa\xea\xf6\xd4\x5d\xf7\x03\x37\xdd\xfa\x8a\xd7\xdc\xfc\x8c\x67\x3e\xc4\xe6\xbf\xfb\xaf\xbc\x6a\x30\x1e\xa7\xad\xad\x10\x53\x5d\x37\x55\xe1\x97\xc7\x43\x6f\x45\x73\xd2\x2c\x24\xcc\x2c\xaa\x44\xcc\x44\x3c\x28\x6c\xe5\xed\xce\xbc\xa1\x9c\x0b\x6b\x98\x94\x98\x59\x49\x99\x9c\x91\x61\x59\xe4\x94\x7d\x61\x0e\xec\x5b\x3e\x72\x60\xa5\x6e\xda\xb5\x8d\xad\xfb\x4f\xaf\x6e\x6c\x6d\xed\xae\x97\x36\x6d\x68\xbb\x7d\xb2\x69\x6f\x65\x2f\xa6\x14\x66\xb1\xa9\x9b\xd9\xcc\x95\x55\xb9\x30\x1a\x95\xa5\xb7\x46\xea\x36\x84\x18\x87\x55\xd9\xc4\xd8\x3d\x17\x2a\xd1\xbc\x6d\x07\x85\x2f\x9c\x15\xe6\xcf\x7d\xfc\xa3\x8f\xbb\xe1\xc6\xab\x6e\xb8\xe9\x1f\xeb\x17\x09\x00\xf0\x08\xf4\x3a\x08\xaf\xbf\xf9\x29\xbf\xf9\xaf\x7f\xef\x23\x7f\xfc\x07\x7f\xfd\x89\x8f\x6d\x6c\x6e\x4c\x67\xb3\xc9\x6c\x12\x9b\x3a\xc4\xb6\xdb\x6a\xd2\x6d\x23\x11\xe6\x98\xd5\x70\xf7\xda\x8d\xa2\x2a\x13\x5b\xe9\xf6\x26\x10\x11\xa9\x92\xb0\xb0\x61\x47\x67\x5e\xf3\x08\x0b\x4b\xd6\x9c\x49\x86\x65\x21\x22\xc4\x22\xc6\x15\xde\xef\x5b\x5e\xba\xf1\xa9\x4f\x7f\xd6\xad\x2f\xb9\xe1\xe6\xa7\x5c\xd0\x01\x83\xfd\x87\x0e\x1f\x3e\x7a\x4d\xf3\xb5\xaf\x6a\x53\xd7\x75\xbb\x63\xa6\xde\xc8\x74\xde\x1c\x5a\x59\x2a\x0b\xd7\xbd\x9b\x64\xca\xdd\xec\x04\x52\x9e\xd6\x6d\xdb\x86\x51\x55\xd8\x6e\x5e\x39\xed\x3e\xab\x0a\x51\xe1\xec\xdc\x48\x4c\xd9\x89\x38\xe7\x87\x45\xb1\x38\x1a\x1e\x3a\xb0\xb2\xb5\x33\x39\x79\x7a\xf5\xf4\x03\xeb\x1b\x5b\xdb\x39\xa7\xb6\xe9\xa6\x87\x87\xee\x45\x98\x2a\x11\x53\x56\x6d\xea\x26\xc6\xa8\x59\x53\x1e\x86\x18\x8d\x31\xa5\x77\x4a\x75\x4a\xce\x1b\x6b\x44\xac\x35\x22\xd2\xc6\xc8\xc2\x46\xc4\x0a\x7f\xf2\xc3\x1f\x7c\xc5\xbb\xde\xeb\x8a\x47\xe7\x40\x05\x00\xc0\xa3\xa8\xd7\x41\x48\x44\xc3\xf1\xc2\xeb\xde\xf6\x8e\x1f\x7f\xe5\xcf\x7e\xe1\x33\x9f\xfc\xfc\xa7\x3f\xf5\x8d\xaf\xfc\xbf\xf5\xd3\x27\x53\x4a\x29\xa7\x10\xc2\xb4\x6e\x8c\x88\x30\xd5\x6d\xc8\x39\x1b\x23\xa6\xdb\x91\x49\xdc\xc4\x64\x8d\x94\xce\x32\x73\xca\x49\x95\x98\x85\x99\x9d\x35\xce\x39\x23\x66\xf7\x95\x9d\xaa\xb5\xd6\x3b\x57\x8c\xc6\x47\x6f\x78\xd2\xd3\x9e\x75\xec\xa6\xa7\x3d\x7d\x61\x79\xdf\xc3\xd8\x98\x27\x22\xb7\x1c\x7b\xfe\x89\xe3\xc7\x53\xdd\xa4\x9c\x26\xd3\x3a\x67\xb5\xce\xa6\x18\x75\x7f\x5a\x1c\x8f\xac\xb5\xcc\xc2\xc4\xaa\xa2\xaa\x85\x93\xd2\x55\xd6\x1a\xd2\x9c\xcf\x5c\x5e\xb7\x9f\xd5\x09\x2f\x0c\xca\x59\xdd\x90\x66\x51\x55\x66\x27\xb2\x50\x95\xa3\xb2\x58\x59\x5a\xdc\x38\xbc\x33\x9d\xcd\xef\x3f\x75\x7a\x7d\x73\x7b\x36\x9b\xb5\x6d\x68\x9a\xb6\xdb\x52\xb3\x37\x75\x3d\xc5\x34\x9d\x4c\x43\x4a\xe3\xd1\x70\x34\xa8\xda\x10\x99\xc9\x5b\xdb\xc6\x48\x4c\x63\x23\x31\xa6\x5a\x22\x11\x95\xde\xc5\x94\x37\x4f\xdf\xf7\x95\x4f\xdf\xf1\x43\xcf\x7b\xc9\xa3\xff\x2b\x04\x00\x78\x64\xfa\x1e\x84\x44\x24\x22\xfb\x0f\x1f\xb9\xf5\xb6\x57\xdd\x7a\xdb\xab\x4e\x9d\xbc\x7f\x7b\x63\xe3\xf4\xbd\xc7\x57\xef\xbb\x77\xed\xf4\xa9\xb5\xd3\xa7\x76\x36\x37\x26\x3b\x5b\x9b\xeb\x1b\x93\xc9\x0e\x6b\x96\xdd\xd9\x9e\x14\x73\x76\xd6\xc8\x99\x6d\x7e\x3b\xb3\x3a\xe5\xe4\xad\x2d\x0a\x5f\x3a\x6f\xac\x5d\x5e\xd9\xbf\xff\xd0\x91\x95\xc3\x47\xae\x7a\xfc\xf5\xd7\xdf\x74\xb3\x1f\x0c\xcb\xea\xdc\xc3\xe0\x17\xea\x39\xb7\xbe\xe4\xa3\x7f\x72\xbb\x2d\xcb\x34\x9f\x2b\xe9\x64\x36\x77\xd6\x3a\x11\x2b\x12\x42\x5c\x18\x0f\x9d\x73\xdd\xc6\x51\x11\xe3\xbb\x9d\x3c\x94\x27\xf3\xba\x89\x71\x58\x56\x85\xf7\xdd\x5e\x45\x55\x2d\x5d\xf7\xd8\x26\x44\x44\x7b\x33\x5d\x45\x06\xde\x95\x57\xec\xcb\xfb\xf4\xf0\xfe\x95\xcd\x9d\x9d\x53\x0f\xac\xaf\xae\x3e\xb0\xb1\xb5\x5d\x34\x3e\xc6\x38\x9d\xd5\xb3\xba\x66\xd5\xae\xcf\x6a\x9a\xd5\xdd\xee\xc4\xb2\xf4\xce\x9a\x26\xc4\x94\x72\xe1\x6d\xb7\x9b\x94\xf6\x36\x2d\x7a\x22\x92\xcf\xff\xd5\x9f\xdf\xf8\xec\x17\x58\xef\x1f\xe1\x4d\x00\x00\x78\x74\x21\x08\xbf\x8d\x2f\xca\x95\x43\x87\x57\x0e\x1d\xa6\xa7\xed\x7e\x65\xf7\xbc\x44\xca\xaa\x39\xb6\xa1\x6d\xea\xd0\x36\x6d\xd3\xa4\x14\x73\xca\xc3\x41\xd5\x7d\x86\x58\x54\xd5\x7b\x6f\x9d\x2b\x07\x83\x85\xa5\x7d\xce\x7b\x63\xed\xde\x93\xdf\xa3\xd2\x5c\xe3\xaa\x6b\xae\x7d\xde\x8f\xbd\xf8\x33\x77\xfc\xaf\xf9\x64\x32\x9f\x4d\x53\x4a\x21\xa5\x8d\xed\x49\xdd\xb6\xf3\xa6\x59\xdf\x99\x5a\x67\xc7\x83\x81\xf3\xce\x5b\x3b\x2c\x4b\x11\x13\x52\x6e\xda\x96\x88\x84\x29\xe7\x24\x22\xa4\xcc\xc4\xdd\x11\xc3\x9c\xf3\xf6\x6c\x46\xc4\xe3\xe1\x60\x77\xbc\x1d\x11\x13\x89\xc8\xb8\x2a\x87\x65\xb1\xb2\xbc\xb4\x71\x70\xff\xda\xc6\xd6\xda\xfa\xfa\xc9\x53\x0f\x10\xb3\x12\x85\xb6\x49\x29\x2b\xb3\xe6\x34\x9b\xcd\x8d\x31\x85\x77\x4c\x14\x53\x56\x55\x93\x64\x6b\x3a\x6f\x42\x1c\x16\x7e\x61\x2f\xfa\x9d\xd9\x5c\x3d\x79\xf7\x57\xbe\xf8\xf8\x27\x3f\xfd\x91\xdf\x07\x00\x80\x47\x11\x82\xf0\x7b\xd8\x9d\xf0\x62\x89\x88\x8a\xb2\x1a\xd2\xb7\xcd\x85\xf8\xfe\xcf\xf9\x7c\xc5\xeb\x7f\xe1\xab\x5f\xfc\x3c\x33\x8b\x31\x75\x3d\x0f\x4d\x93\x72\xda\x99\xd6\xd3\x79\x63\xac\xdd\xb7\x30\x22\xd5\x7d\x66\x54\x94\xde\x08\x65\xcd\x29\x45\xa6\x9c\x94\xb6\x26\x3b\x65\x51\x8e\xca\x82\x58\xa8\x3b\xcd\x96\x69\x32\x9d\x87\x10\x8d\x31\x4c\xca\xc4\x5d\xab\x1b\xe5\x6e\x77\x2c\x19\xe6\xca\x5a\xbb\xb8\x30\xae\xaa\x95\xe5\xc5\xd1\x70\xf8\xad\xe3\x27\xac\x31\x75\x6d\x27\x93\x19\x11\xe5\x9c\x35\xc6\xd0\x34\xb5\xb3\xde\xda\xb2\x60\x6b\xac\x30\xab\x52\x37\xe3\xc9\x59\xa3\xd4\xad\xd5\x66\xa1\xfc\xf5\x2f\xfc\x0d\x82\x10\x00\x2e\x35\x08\xc2\xcb\xcc\xca\xc1\x43\x2f\x79\xe5\x6b\x6f\xff\xc3\xff\x50\x0c\x47\xc6\xda\xc6\xba\xb6\x9e\x87\x10\x26\x75\xc3\xd4\xaa\xe6\x36\x84\x18\x62\xdb\x86\xf1\xb0\x72\xde\x0b\x8b\x30\x35\x31\x56\xde\x8f\x0a\xcb\x94\xbb\xfe\x6f\xaa\x5c\xb7\x41\x73\xb4\x42\x29\xc5\xd9\x6c\x3e\xaa\x2a\x62\xea\x86\x44\x75\x27\xf1\xbb\x06\x01\x4e\x4c\xa3\xc1\x8a\xb9\xfe\x9a\xab\xc7\xa3\xe1\x9d\xdf\xbc\x6b\x6d\x7d\x23\x84\x94\xe7\x73\x62\xce\x39\xcf\xe7\x35\x89\x18\x6b\x44\x58\x98\x1b\x66\x11\x36\x22\xc6\xd0\xac\x6e\x0d\x93\x21\x35\x94\x0d\xe9\xea\xbd\xc7\x2f\xf6\xfd\x03\x00\x38\x17\x82\xf0\xf2\xf3\xa2\x97\xbd\xfc\x4b\x5f\xfc\xc2\xe7\x3e\xf3\x29\xb2\xae\x1a\x5a\x63\xad\xa9\x6b\x25\x8e\x29\xd6\x4d\x4c\x71\x1a\x42\xdc\x9e\xcc\x9d\xb7\x57\x2c\x8e\x47\x83\xca\x58\x63\x98\xc6\x95\x17\xce\x5d\x04\x12\x71\x1b\x62\x5d\xb7\x4a\x24\x2c\x55\xe9\x4a\x6f\x85\x32\x11\x87\x94\x95\xc8\x1a\xd3\xbd\x39\x24\xa2\x94\xe3\xbc\xae\xbd\x73\x0b\x83\xaa\xba\xf2\xb0\xaa\x36\x4d\x13\x63\xea\xda\x92\x89\x48\x52\x6d\xeb\x26\x94\xc5\x4c\x4c\x48\xa9\x88\x2e\xe5\x9c\xb2\xe6\x6c\x67\xb9\x11\x52\x43\x6a\x34\x59\xa6\x18\xda\x8b\x7d\xf3\x00\x00\xce\x85\x20\xbc\xfc\x18\x63\x7e\xf1\x57\x7f\xed\x5f\x6d\x6e\x9c\xbc\xe7\xb8\x6a\x76\xde\x1b\x63\xc4\x98\xd8\xb6\xdd\xa4\xfb\xc9\xac\x9e\xcc\xeb\xaa\xf0\x94\x35\xc5\x34\x1a\x56\x55\x59\x90\xc6\x9c\x0d\xb3\xc4\x94\xdb\x98\x8c\x31\xe3\xca\xcf\x9a\x56\x84\x8c\x90\xb0\x36\x6d\x1d\x52\xae\xdb\x60\x8d\x5d\x1a\x0d\x69\xb7\x13\x00\x09\x71\x61\x8d\x77\x86\xb2\x1a\xe6\xe5\x85\x85\xa3\x8f\xbb\xb2\x6e\xff\x21\xa5\xa8\x9a\x43\x88\xa2\x9a\x62\x9c\x4c\x66\xc4\x9c\xb2\xeb\x46\x33\x51\x77\x88\x52\xb5\x6d\xdb\xe4\x24\x91\xa8\xe6\x85\x2b\x0e\x5e\xec\x9b\x07\x00\x70\x2e\x04\xe1\x65\x69\x61\x71\xf1\x2d\xbf\xfe\x9b\xef\x7f\xdf\xbf\xb8\xf7\xc4\x89\x44\x54\x0d\x47\xc6\xda\xd0\x34\xd3\xd9\x2c\xa5\x79\x61\x6c\xce\x79\x5e\xb7\xa7\xe2\xe6\x74\x5e\x8f\x87\x55\xe9\xdd\x70\x50\x65\xa2\xa5\xd1\x80\x58\x9a\x98\x96\xc7\xc3\xae\x71\x00\x31\xc7\x68\x0d\xeb\xbc\x69\x89\xb8\x74\xa6\x70\x96\x28\x93\x76\xed\xc1\xc5\x0b\x8f\xca\xa2\x6e\xc3\x34\xce\x42\x56\x56\x3a\x74\x60\x65\x7b\x3a\x3d\x75\x6a\x35\xc6\x14\xe3\x94\x88\xb3\xe6\xb6\x69\x26\x44\xc3\xe1\xc0\x30\x07\x11\x2b\x31\x08\x0f\xbd\x15\xd2\x14\x63\x24\x61\xcd\xd7\xfc\xe0\x53\x2f\xf6\x9d\x03\x00\x38\x17\x82\xf0\x72\x75\xe0\xf0\x91\x37\xff\xda\xbb\xff\xfd\xef\xbc\xef\x81\xd3\xa7\x0c\x93\x31\x26\x13\xf9\x94\x8d\x31\xac\x39\xb4\x6d\xce\xa9\x4d\x79\x7d\x7b\xba\x33\xab\x4b\xef\xaa\x72\x26\xc2\xab\xeb\x5b\x55\xe1\x87\x83\xd2\x0b\x29\xf1\xb0\x70\xce\x59\x23\x46\x98\x17\x2b\xcf\x22\xcc\xdd\x81\x8a\xa4\x4a\x4d\x88\x6d\x4c\xe3\xc1\x60\xe0\x8c\xb7\x26\x2b\x45\xd5\xc9\xbc\x19\x0f\x2b\xbd\xe6\xa8\x10\xb5\x6d\x68\x63\x9c\xcf\x6b\xc9\xa2\xaa\x6d\xd3\x74\x9d\x4a\x99\xd4\x0b\x93\x33\x86\x49\x48\x29\xa7\x9c\xf2\xa1\xab\xaf\xbd\xf9\x99\xc7\x2e\xf6\x6d\x03\x00\x38\x17\x82\xf0\x32\x76\xd5\x35\xd7\xbe\xe5\x37\x7e\xeb\xdf\xbc\xef\xbd\xd3\xcd\xf5\x44\x31\x66\x1a\x0c\x87\x39\xc5\xd8\xb6\x67\x56\x4a\xa3\xaa\xc6\x9c\x77\x66\xcd\x74\xde\x38\x6b\x8c\x31\x75\xe1\x9a\xa6\xdd\xd9\x99\x5a\x6b\xaa\xc2\x17\xde\x15\xde\xb5\x31\x8f\x87\x55\x55\x14\x46\xa4\xeb\x97\x93\x92\x1a\xd6\x51\xe9\x84\x33\x11\x59\x66\x12\x31\x24\x6e\x34\xc8\xcc\x07\x96\x97\xac\x91\x59\xdd\xa8\xaa\x10\xd5\x75\xd3\xcd\x5b\x08\x6d\x3b\xd5\x4c\x39\x8f\x0a\x6b\xd9\x0b\x69\xb7\x40\xea\x7c\x75\xdb\x2f\xbf\xcb\x97\xdf\x79\x22\x12\x00\xc0\x45\xd4\xeb\x31\x4c\x8f\x0d\x0f\x9c\x3a\xf5\x91\xff\xf8\x07\xdf\xba\xf3\x6b\x29\x25\x6b\x24\xc7\x18\x43\xdb\x36\x4d\x0c\x21\xa7\x14\x62\x88\x21\xa4\x94\x84\x79\xaf\x69\xb8\x11\x16\x11\x6b\xc4\x5a\x53\x38\x97\x55\xad\xb5\x57\x2c\x0c\xab\xd2\x8b\x48\xe1\xdd\xa0\x2c\xbd\x73\xd6\x1a\x66\x21\x96\xae\x91\xf7\xbc\x8d\x99\xa4\x2c\x2b\x25\xce\x44\x41\xe9\x81\xad\xad\xaf\x7e\xf3\x1f\x8e\xdf\x73\xdf\xe6\xe6\xf6\x6c\x36\x4f\x29\x11\xa9\x11\xa9\x0a\xbf\x7f\x69\x7c\x64\x65\x71\x61\x50\x0c\xbd\x2d\xbc\x7d\xd9\x2f\xbe\xe3\x29\xcf\x7b\xf1\xc5\xbe\x55\x00\x00\xdf\x01\x5f\xd0\x6c\xee\xcb\x71\xbe\x46\x1f\x2a\x7b\x67\x3f\xfc\x47\xbf\xff\xb9\xcf\xfe\xf5\x7c\x5e\xc7\x18\x35\x25\xd5\xc4\xaa\x6d\xdb\x36\x4d\xd3\xcd\xcf\xeb\xa6\x49\x30\xa9\x6a\xa6\xee\xe4\xbc\xaa\x92\xe6\x9c\x63\xca\x55\xe1\x9c\x31\x22\xec\x9d\x2d\xbd\x2b\x0b\x3f\xac\xca\x41\xe9\x07\x65\xe9\xbd\xb3\xc6\x58\x6b\x77\xea\xd6\x1a\x3b\xaa\x2a\x65\x9b\x88\x9b\xa4\x99\x78\x6b\x36\xbf\xf3\xee\xe3\x77\x1d\xbf\x67\x7b\x6b\x7b\x3a\x9d\xe5\x9c\x4b\x67\x4a\x67\xc7\x55\xb1\xb2\x38\x3a\xb8\x3c\x1e\x14\xf6\x05\xaf\x7a\xfd\xb1\x9f\x7e\x2d\x7f\x7b\x57\xb9\xcb\xf1\x3e\xa3\x32\x2a\xa3\xf2\x63\xb2\x32\x96\x46\x1f\x0b\x86\xa3\xf1\xeb\xde\xfa\xf6\xab\xae\xbd\xee\x2f\x3e\x7c\x7b\x3d\x9f\xc7\x94\x34\x27\xc3\x6c\x9d\xf3\xbe\x98\xce\x66\x89\x6a\xcd\xb9\xb0\x86\xce\x8c\x1b\xcc\x39\x51\xd6\xac\x9a\x94\xc4\x70\xce\xd4\xe4\xa4\xa4\xb3\xba\x15\xe6\x2e\x11\x0b\xef\x06\xa5\x17\x91\xd2\xbb\xc2\xbb\xd2\x7b\xef\xdd\x64\xb2\x63\xad\x1d\x14\xc5\xf6\x3c\x90\x71\x9a\xf5\x49\x57\x5f\xb9\x3c\x1a\xdc\x7d\xcf\x7d\x3b\xdb\x5b\xb3\xe9\x2c\xc5\x34\x2c\xdc\xa8\x74\x96\x29\x84\x78\xec\xd5\xaf\x7b\x70\x0a\x02\x00\x5c\x3a\x10\x84\x8f\x11\xd6\xba\x17\xfd\xe4\x4f\x5f\xf7\x03\x4f\xfc\xaf\x1f\xf8\xbd\x53\xf7\xdd\x3b\x9d\xcd\x8d\xb3\x62\x0c\x8b\x19\x30\x97\x45\xa9\x9a\x34\xa7\x9c\x55\x73\x56\xcd\x31\xa6\x94\x92\x65\xca\x6d\xab\x59\x8d\x91\xdd\x71\x4b\xaa\x4a\x1a\xb3\xc6\xba\x9d\xd6\xed\xe6\xce\x94\x89\xad\x15\x23\xa6\xf0\xb6\xeb\xb3\x93\x72\x1e\x54\x7e\x50\x96\x6d\xc8\xd5\x60\xb8\x34\x1a\x1d\x1a\x57\x4b\xd7\x5d\x75\xcf\xa9\x62\x6b\x6b\x6b\x3e\xaf\x0b\x6b\x2a\x67\x2b\x6f\x7f\xe2\xe7\xde\xf4\xfc\x57\xfe\x1c\x52\x10\x00\x2e\x65\x08\xc2\xc7\x94\xeb\x6e\x78\xe2\xbb\xde\xfb\x2f\xff\xf4\xbf\x7c\xe8\xaf\x3e\xf6\xe7\xd6\xba\x9c\x53\x1b\x13\x89\xb1\x5e\x84\x9d\xaa\xe6\x94\x52\x8c\x39\xa5\x26\xe4\x90\xb5\x70\xb6\x2c\xca\x98\x92\x11\x69\x43\x10\x56\x22\xca\xa9\x6b\x49\xaa\x4a\x4a\x4a\x99\xb4\x0d\x99\x28\xcd\x9a\x96\x54\x55\x29\xa4\x58\x38\x33\x2c\x0b\x16\xf6\x93\x9d\xc9\x76\xb9\x34\x1e\x17\xde\x1d\x5e\x1e\x79\x4a\x61\x50\x18\x52\x2b\xfc\x13\x6f\xf8\xa5\x63\x3f\xf5\xea\x87\x31\x67\x03\x00\xe0\xfb\x09\x41\xf8\x58\x53\x94\xd5\x6b\xde\xf4\x4b\xcf\x7e\xde\x0b\x3f\xf2\xa1\x3f\xba\xfb\x1b\x5f\x1f\x54\x92\x73\xa6\xdd\xf5\xd0\x94\x73\x4e\x36\x69\x4e\x89\x58\x82\x71\x46\x84\x89\x43\xcc\x29\x7b\xef\x55\xb5\x6e\xda\xac\x5c\x1a\xa1\xdd\x77\x88\xbb\x71\xa8\x44\xa4\xda\x74\xb3\x7a\x53\xa8\x9b\x7a\x5e\xd7\x21\x69\xca\xd9\x1a\xb9\xf2\x8a\xe5\x03\xfb\x16\x2b\xef\x96\x87\x45\xd3\x30\x93\xde\xfc\xac\xe7\xfe\xe8\xcb\x5f\x85\x14\x04\x80\x4b\x1f\x82\xf0\xb1\xe9\xe8\xe3\x9f\xf0\x8e\xf7\xbc\xf7\x73\x9f\xfe\xd4\xc7\xfe\xdb\xed\xab\x27\x4f\x86\x18\x55\x55\xc4\x74\xfd\x40\x73\x92\xe1\x50\xaa\x94\x72\x56\xd5\x6c\x8c\xcd\x39\x6b\xce\x4d\xdb\x8a\x31\xca\x64\x9d\x27\xda\x7d\x97\xd8\x65\x68\x88\x89\x89\xb2\x52\xce\x39\xa6\x14\x42\x68\xdb\x96\x88\x52\xce\xd3\x9c\x67\xb3\xd9\xda\xe6\xd6\xf5\x8f\x3b\x34\xae\xca\xc2\x9a\x2b\xae\xba\xe6\xa5\x6f\x7a\xbb\x31\xe6\x62\xdf\x06\x00\x80\xef\x0d\x41\xf8\x98\x25\x22\xb7\x3c\xe7\xd8\x0f\xdd\xf2\x8c\xcf\xfe\xef\x3b\x3e\xf1\xdf\x3f\x7a\xea\xe4\x7d\x2c\xc6\x08\xe7\x2c\x59\x72\x4e\x92\xc5\x74\x3b\x67\x02\xc7\x18\x02\x0b\x5b\xef\x9d\x92\x27\xe7\xbd\xeb\xa2\x51\x35\xab\x52\x13\x02\x29\x19\x91\xc2\x48\xca\xb1\x0d\x29\xa6\x4c\x9a\x99\x94\x89\x0c\x71\x52\x5d\xdb\x99\xe4\xe3\xf7\xdd\x70\xf5\x91\xa7\x1e\x7b\xe1\x4b\xdf\xf8\xd6\xc1\x78\xf1\x62\xdf\x00\x00\x80\x87\x04\x41\xf8\x18\xe7\x8b\xe2\xd8\xad\x2f\x79\xe6\x73\x5f\xf0\xc5\xbf\xf9\xec\x27\xff\xf2\xe3\xc7\xbf\xf9\xf5\x10\x89\x45\x44\xa4\x7b\xd4\xd3\x9c\x59\x24\xe5\xdc\x86\xe8\xac\xf3\xce\x93\x6a\x4c\xd1\x88\x90\x76\x0b\xa2\xaa\x2c\x45\x51\x08\x73\xdd\xd4\xd2\x34\xd6\x9a\x9c\x63\xce\x9a\x54\x89\xc8\x08\x19\xe3\x56\x0e\x1e\x7c\xf6\x73\x5f\xf8\xb2\x57\xbc\xfa\xba\x27\xdd\xc4\xcc\xdf\xeb\xba\x00\x00\x2e\x15\x08\xc2\x5e\x70\xde\xdf\xf2\x9c\x63\x3f\xfc\xac\xe7\x7c\xe5\xef\xbe\xf8\xf7\x7f\xfb\x7f\xbf\xfc\xf9\xbf\xdd\x5a\x5f\xef\xe6\xf4\xe6\x9c\x59\xa4\x20\x2a\x0a\x15\x26\x55\x0d\x21\x86\x10\xab\xc2\x99\xdd\x2d\x33\x64\x5d\x66\xa6\x10\x22\xb5\x2d\x8b\x88\xb0\x35\x62\x0b\xbf\xb8\x72\xf0\xc9\xb7\x3c\xe3\x96\x67\x3e\xfb\xc9\xb7\x3c\x63\x79\xff\x41\xe7\xdc\xc5\xfe\x41\x01\x00\x2e\x18\x82\xb0\x47\x44\xe4\xc8\xd1\x6b\x8e\x1c\xbd\xe6\x85\x3f\x79\xdb\xbd\x77\xdf\x75\xe7\x97\xfe\xee\x1b\x5f\xfe\xf2\xc9\xfb\xee\xd1\x18\x8d\xb1\xaa\x59\x73\x56\x22\x31\x86\x45\x0a\xef\xe8\xcc\xb9\x7b\x22\x8a\x29\x45\xe2\xa5\x2b\xf6\x5f\x7d\xfd\x0d\x8f\x7f\xe2\x8d\x3f\xf8\x94\xa7\x3e\xf1\xa6\x9b\x8f\x5c\x7d\xd4\xda\xdd\xf0\xbb\xd0\x83\xb1\x00\x00\x97\x08\x04\x61\x1f\x59\xe7\x8e\x3e\xe1\xfa\xa3\x4f\xb8\xfe\x45\x2f\xff\xa7\x3b\xdb\x5b\x1b\xab\xab\x27\xef\x39\xb1\xfe\xc0\xe9\xcd\xb5\xb5\xd9\x74\xd2\xd6\x73\x55\xf2\x45\x51\x54\xd5\xd2\xf2\xbe\xc5\xe5\xe5\xe5\x2b\x56\x56\x0e\x1e\x5e\x5c\x5e\x5e\x5e\xd9\x3f\x18\x0e\x2f\xf6\xe5\x03\x00\x3c\x9a\x10\x84\xbd\xc6\xcc\x0b\x8b\x4b\x0b\x8b\x4b\x47\x9f\x70\xfd\x77\xfc\xc0\x43\x6f\x68\x04\x00\x70\x99\xc2\x31\x2f\x00\x00\xe8\x35\x04\x21\x00\x00\xf4\x1a\xc6\x30\x01\x00\x40\xaf\x5d\xf0\x3b\xc2\xcb\x6e\xbe\x06\x2a\xa3\x32\x2a\xa3\x32\x2a\xa3\xf2\x79\x60\x69\x14\x00\x00\x7a\x0d\x41\x08\x00\x00\xbd\x86\x20\x04\x00\x80\x5e\x43\x10\x02\x00\x40\xaf\x21\x08\x01\x00\xa0\xd7\x10\x84\x00\x00\xd0\x6b\x08\x42\x00\x00\xe8\x35\x04\x21\x00\x00\xf4\x1a\x82\x10\x00\x00\x7a\x0d\x41\x08\x00\x00\xbd\x86\x20\x04\x00\x80\x5e\x43\x10\x02\x00\x40\xaf\x21\x08\x01\x00\xa0\xd7\x30\x86\x09\x00\x00\x7a\x8d\x55\xf5\xa1\x7f\xfa\x72\x9c\xaf\x81\xca\xa8\x8c\xca\xa8\x8c\xca\xa8\x7c\x1e\x58\x1a\x05\x00\x80\x5e\x43\x10\x02\x00\x40\xaf\x21\x08\x01\x00\xa0\xd7\x10\x84\x00\x00\xd0\x6b\x08\x42\x00\x00\xe8\x35\x04\x21\x00\x00\xf4\x1a\x82\x10\x00\x00\x7a\x0d\x41\x08\x00\x00\xbd\x86\x20\x04\x00\x80\x5e\x43\x10\x02\x00\x40\xaf\x21\x08\x01\x00\xa0\xd7\x10\x84\x00\x00\xd0\x6b\x08\x42\x00\x00\xe8\x35\x8c\x61\x02\x00\x80\x5e\xb3\x17\xfa\x0d\x97\xdd\x7c\x0d\x54\x46\x65\x54\x46\x65\x54\x46\xe5\xf3\xc0\xd2\x28\x00\x00\xf4\x1a\x82\x10\x00\x00\x7a\x0d\x41\x08\x00\x00\xbd\x86\x20\x04\x00\x80\x5e\x43\x10\x02\x00\x40\xaf\x21\x08\x01\x00\xa0\xd7\x10\x84\x00\x00\xd0\x6b\x08\x42\x00\x00\xe8\x35\x04\x21\x00\x00\xf4\x1a\x82\x10\x00\x00\x7a\x0d\x41\x08\x00\x00\xbd\x86\x20\x04\x00\x80\x5e\x43\x10\x02\x00\x40\xaf\x61\x0c\x13\x00\x00\xf4\x1a\xab\xea\x43\xff\xf4\xe5\x38\x5f\x03\x95\x51\x19\x95\x51\x19\x95\x51\xf9\x3c\xb0\x34\x0a\x00\x00\xbd\x86\x20\x04\x00\x80\x5e\x43\x10\x02\x00\x40\xaf\x21\x08\x01\x00\xa0\xd7\x10\x84\x00\x00\xd0\x6b\x08\x42\x00\x00\xe8\x35\x04\x21\x00\x00\xf4\x1a\x82\x10\x00\x00\x7a\x0d\x41\x08\x00\x00\xbd\x86\x20\x04\x00\x80\x5e\x43\x10\x02\x00\x40\xaf\x21\x08\x01\x00\xa0\xd7\x10\x84\x00\x00\xd0\x6b\x18\xc3\x04\x00\x00\xbd\x66\x2f\xf4\x1b\x2e\xbb\xf9\x1a\xa8\x8c\xca\xa8\x8c\xca\xa8\x8c\xca\xe7\x81\xa5\x51\x00\x00\xe8\x35\x04\x21\x00\x00\xf4\x1a\x82\x10\x00\x00\x7a\x0d\x41\x08\x00\x00\xbd\x86\x20\x04\x00\x80\x5e\x43\x10\x02\x00\x40\xaf\x21\x08\x01\x00\xa0\xd7\x10\x84\x00\x00\xd0\x6b\x08\x42\x00\x00\xe8\x35\x04\x21\x00\x00\xf4\x1a\x82\x10\x00\x00\x7a\x0d\x41\x08\x00\x00\xbd\x86\x20\x04\x00\x80\x5e\xc3\x18\x26\x00\x00\xe8\x35\x56\xd5\x87\xfe\xe9\xcb\x71\xbe\x06\x2a\xa3\x32\x2a\xa3\x32\x2a\xa3\xf2\x79\x60\x69\x14\x00\x00\x7a\x0d\x41\x08\x00\x00\xbd\x86\x20\x04\x00\x80\x5e\x43\x10\x02\x00\x40\xaf\x21\x08\x01\x00\xa0\xd7\x10\x84\x00\x00\xd0\x6b\x08\x42\x00\x00\xe8\x35\x04\x21\x00\x00\xf4\x1a\x82\x10\x00\x00\x7a\x0d\x41\x08\x00\x00\xbd\x86\x20\x04\x00\x80\x5e\x43\x10\x02\x00\x40\xaf\x21\x08\x01\x00\xa0\xd7\x30\x86\x09\x00\x00\x7a\xcd\x5e\xe8\x37\x5c\x76\xf3\x35\x50\x19\x95\x51\x19\x95\x51\x19\x95\xcf\x03\x4b\xa3\x00\x00\xd0\x6b\x08\x42\x00\x00\xe8\x35\x04\x21\x00\x00\xf4\x1a\x82\x10\x00\x00\x7a\x0d\x41\x08\x00\x00\xbd\x86\x20\x04\x00\x80\x5e\x43\x10\x02\x00\x40\xaf\x21\x08\x01\x00\xa0\xd7\x10\x84\x00\x00\xd0\x6b\x08\x42\x00\x00\xe8\x35\x04\x21\x00\x00\xf4\x1a\x82\x10\x00\x00\x7a\x0d\x41\x08\x00\x00\xbd\x86\x31\x4c\x00\x00\xd0\x6b\xac\xaa\x0f\xfd\xd3\x97\xe3\x7c\x0d\x54\x46\x65\x54\x46\x65\x54\x46\xe5\xf3\xc0\xd2\x28\x00\x00\xf4\x1a\x82\x10\x00\x00\x7a\x0d\x41\x08\x00\x00\xbd\x86\x20\x04\x00\x80\x5e\x43\x10\x02\x00\x40\xaf\x21\x08\x01\x00\xa0\xd7\x10\x84\x00\x00\xd0\x6b\x08\x42\x00\x00\xe8\x35\x04\x21\x00\x00\xf4\x1a\x82\x10\x00\x00\x7a\x0d\x41\x08\x00\x00\xbd\x86\x20\x04\x00\x80\x5e\x43\x10\x02\x00\x40\xaf\x61\x0c\x13\x00\x00\xf4\x9a\xbd\xd0\x6f\xb8\xec\xe6\x6b\xa0\x32\x2a\xa3\x32\x2a\xa3\x32\x2a\x9f\x07\x96\x46\x01\x00\xa0\xd7\x10\x84\x00\x00\xd0\x6b\x08\x42\x00\x00\xe8\x35\x04\x21\x00\x00\xf4\x1a\x82\x10\x00\x00\x7a\x0d\x41\x08\x00\x00\xbd\x86\x20\x04\x00\x80\x5e\x43\x10\x02\x00\x40\xaf\x21\x08\x01\x00\xa0\xd7\x10\x84\x00\x00\xd0\x6b\x08\x42\x00\x00\xe8\x35\x04\x21\x00\x00\xf4\x1a\x82\x10\x00\x00\x7a\xed\xff\x03\x34\x2b\xc2\x77\xb5\xdf\xf0\xa5\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82'
+from pathlib import Path
 
+from PySide6.QtGui import QPixmap, QIcon
 
-def generate_icon() -> QIcon:
-    pixmap = QPixmap()
-    pixmap.loadFromData(SOURCE)
-    return QIcon(pixmap)
+SOURCE: Path = Path(__file__).with_name('logo.png')
 
 
+def generate_icon() -> QIcon:
+    return QIcon(QPixmap(str(SOURCE)))
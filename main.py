@@ -24,19 +24,20 @@ from PySide6.QtWidgets import (
     QLabel,
     QFileDialog
 )
-from PySide6.QtCore import Slot
+from PySide6.QtCore import Slot, QThreadPool, QTimer
 
 import sys
 
 from ui_layout import Ui_Form
-from parsing import parse, InputDTO
-from ekspansja import InvalidInputException, systematic, heuristic
+from parsing import parse, InputDTO, ParseException
 from text_formatting import TextFormatter, Formatting, remove_subsribt
 from fileio import read_from_file, save_to_file
-from logo import generate_icon
+from tracing import Tracer
+from worker import MinimizationWorker
 
 
 Labels: list[str] = ['s', 'ms', 'μs']
+Methods: list[str] = ['systematic', 'heuristic', 'espresso']
 
 
 class MainWindow(QWidget):
@@ -47,6 +48,10 @@ class MainWindow(QWidget):
         self.__ui.stack.setCurrentIndex(1)
         self.__set_connections()
         self.__set_variables()
+        QTimer.singleShot(0, self.__set_icon)
+
+    def __set_icon(self) -> None:
+        from logo import generate_icon
         self.setWindowIcon(generate_icon())
 
     def __set_connections(self) -> None:
@@ -55,11 +60,15 @@ class MainWindow(QWidget):
         self.__ui.savebutton.clicked.connect(self.__save_to_file)
         self.__ui.comboBox.currentIndexChanged.connect(self.__change_format)
         self.__ui.methodbox.currentIndexChanged.connect(self.__change_executor)
+        self.__ui.cancelbutton.clicked.connect(self.__cancel)
 
     def __set_variables(self) -> None:
         self.__last_value = None
         self.__format = TextFormatter()
-        self.__executor = systematic
+        self.__executor = Methods[0]
+        self.__worker = None
+        self.__sessions = {}
+        self.__set_running(False)
 
     def __read_from_file(self) -> None:
         path, _ = QFileDialog.getOpenFileName(
@@ -84,7 +93,7 @@ class MainWindow(QWidget):
 
     @Slot(int)
     def __change_executor(self, index: int) -> None:
-        self.__executor = systematic if index == 0 else heuristic
+        self.__executor = Methods[index]
 
     def __save_to_file(self) -> None:
         path, _ = QFileDialog.getSaveFileName(
@@ -111,32 +120,78 @@ class MainWindow(QWidget):
         else:
             self.__add_item_to_list(self.__last_value)
 
-    def __print_time(self, time: float) -> None:
+    def __format_time(self, time: float) -> str:
         timestr = f'{int(time * 10 ** (3 * len(Labels))):,}'.replace(
             ',', '{} ') + '{}'
-        self.__ui.timelabel.setText(timestr.format(
-            *Labels[(len(Labels) - timestr.count('{')):]))
+        return timestr.format(*Labels[(len(Labels) - timestr.count('{')):])
+
+    def __print_time(self, time: float, tracer: Tracer) -> None:
+        self.__ui.timelabel.setText(self.__format_time(time))
+        self.__ui.timelabel.setToolTip('\n'.join(
+            f'{name}: {self.__format_time(seconds)}'
+            for name, seconds in tracer.breakdown()))
 
     def __error_message(self, message: str) -> None:
         self.__ui.stack.setCurrentIndex(1)
         self.__ui.err.setText(
             f'<p style="color:red">{message}</p>')
 
+    def __set_running(self, running: bool) -> None:
+        self.__ui.process.setEnabled(not running)
+        self.__ui.methodbox.setEnabled(not running)
+        self.__ui.cancelbutton.setEnabled(running)
+        self.__ui.progressbar.setVisible(running)
+        self.__ui.progressbar.setValue(0)
+
+    @Slot(int, int)
+    def __show_progress(self, done: int, total: int) -> None:
+        self.__ui.progressbar.setMaximum(total)
+        self.__ui.progressbar.setValue(done)
+
+    @Slot(object, float, object)
+    def __finished(self, value: list[str] | str, time: float,
+                   tracer: Tracer) -> None:
+        self.__set_running(False)
+        self.__last_value = value
+        self.__print_time(time, tracer)
+        self.__print_output()
+
+    @Slot(str)
+    def __failed(self, message: str) -> None:
+        self.__set_running(False)
+        self.__error_message(message)
+
+    @Slot()
+    def __cancelled(self) -> None:
+        self.__set_running(False)
+        self.__error_message('Minimalizacja została przerwana')
+
+    def __cancel(self) -> None:
+        if self.__worker:
+            self.__worker.cancel()
+
     def __call_logic(self, dto: InputDTO) -> None:
-        try:
-            self.__last_value, time = self.__executor(dto.first, dto.second)
-            self.__print_time(time)
-            self.__print_output()
-        except InvalidInputException:
-            self.__error_message('Nieprawidłowe dane wejściowe')
+        self.__worker = MinimizationWorker(self.__executor, dto,
+                                           self.__sessions)
+        self.__worker.signals.progress.connect(self.__show_progress)
+        self.__worker.signals.finished.connect(self.__finished)
+        self.__worker.signals.failed.connect(self.__failed)
+        self.__worker.signals.cancelled.connect(self.__cancelled)
+        self.__set_running(True)
+        QThreadPool.globalInstance().start(self.__worker)
 
     def __minimize(self) -> None:
         first = self.__ui.ledit.text()
         second = self.__ui.redit.text()
-        if (dto := parse(first, second)):
-            self.__call_logic(dto)
-        else:
-            self.__error_message('Nieprawidłowe dane wejściowe')
+        try:
+            self.__call_logic(parse(first, second))
+        except ParseException as exception:
+            edit = (self.__ui.ledit if exception.name == 'F'
+                    else self.__ui.redit)
+            edit.setFocus()
+            edit.setCursorPosition(exception.position - 1)
+            self.__error_message(
+                f'Nieprawidłowe dane wejściowe: {exception}')
 
 
 def main():
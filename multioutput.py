@@ -0,0 +1,234 @@
+"""
+Ekspresso procedure
+Copyright (C) 2022  Mateusz Jaracz 
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+
+
+from typing import List, Tuple
+from heapq import heapify, heappop, heappush
+
+import numpy as np
+
+from timing import benchmark
+from ekspansja import (
+    InvalidInputException,
+    PackedMatrix,
+    data_validation,
+    bit_length,
+    append_or_extend,
+    expansion,
+    implicant_string
+)
+
+
+Problems = List[Tuple[List[int], List[int]]]
+
+
+def group_by_outputs(problems: Problems) -> dict:
+    """
+    This function groups minterms of all F sets by the set of outputs
+    they belong to
+    :param problems: F and R indexes of each output
+    :type problems: list of tuples of lists of int
+    :returns: outputs mapped to their common minterms
+    :rtype: dict of tuple of int to packed matrix
+    """
+    tags = {}
+    for i, (first, _) in enumerate(problems):
+        for minterm in first:
+            tags.setdefault(minterm, []).append(i)
+    groups = {}
+    for minterm, outputs in tags.items():
+        groups.setdefault(tuple(outputs), []).append(minterm)
+    return groups
+
+
+def shared_implicants(
+        problems: Problems,
+        length: int,
+        batched: bool = False
+        ) -> List[Tuple[int, int]]:
+    """
+    This function expands every group of minterms once against R sets of
+    all outputs of the group, so the implicants are valid for all of them
+    :param problems: F and R indexes of each output
+    :type problems: list of tuples of lists of int
+    :param length: bit length of the greatest number
+    :type length: int
+    :param batched: if b matrixes should be built with numpy at once
+    :type batched: bool
+    :returns: masks of implicants
+    :rtype: list of tuple of int
+    """
+    candidates = {}
+    for outputs, fmatrix in group_by_outputs(problems).items():
+        rmatrix = sorted(set().union(*(problems[i][1] for i in outputs)))
+        for implicant in expansion(batched)(fmatrix, rmatrix, length,
+                                            append_or_extend):
+            candidates.setdefault(implicant, None)
+    return list(candidates)
+
+
+def valid_outputs(
+        candidates: List[Tuple[int, int]],
+        rmatrix: PackedMatrix
+        ) -> np.ndarray:
+    """
+    This function checks which implicants do not cover any R row
+    :param candidates: masks of implicants
+    :type candidates: list of tuple of int
+    :param rmatrix: packed R cube of one output
+    :type rmatrix: packed matrix
+    :returns: True for every implicant valid for the output
+    :rtype: numpy array
+    """
+    if not rmatrix:
+        return np.ones(len(candidates), dtype=bool)
+    rows = np.asarray(rmatrix, dtype=np.uint64)
+    output = np.empty(len(candidates), dtype=bool)
+    for start in range(0, len(candidates), 256):
+        care, value = (np.asarray(x, dtype=np.uint64).reshape(-1, 1) for x in
+                       zip(*candidates[start:start + 256]))
+        output[start:start + 256] = ~(((rows ^ value) & care) == 0).any(
+            axis=1)
+    return output
+
+
+def coverage(
+        candidates: List[Tuple[int, int]],
+        problems: Problems
+        ) -> List[List[int]]:
+    """
+    This function sets which F minterms of which outputs are covered by
+    each implicant, j bit of a mask is set if j minterm of F is covered
+    :param candidates: masks of implicants
+    :type candidates: list of tuple of int
+    :param problems: F and R indexes of each output
+    :type problems: list of tuples of lists of int
+    :returns: masks of covered minterms of each output for every implicant
+    :rtype: list of list of int
+    """
+    care, value = (np.asarray(x, dtype=np.uint64).reshape(-1, 1)
+                   for x in zip(*candidates))
+    output = [[] for _ in candidates]
+    for first, second in problems:
+        covered = (((np.asarray(first, dtype=np.uint64) ^ value) & care)
+                   == 0) & valid_outputs(candidates, second)[:, None]
+        for masks, row in zip(output, np.packbits(covered, axis=1,
+                                                  bitorder='little')):
+            masks.append(int.from_bytes(row.tobytes(), 'little'))
+    return output
+
+
+def select_implicants(
+        candidates: List[Tuple[int, int]],
+        covered: List[List[int]]
+        ) -> List[int]:
+    """
+    This function greedily picks implicants covering the most of not yet
+    covered minterms of all outputs, the fewer literals the better, gains
+    only decrease so they are recomputed lazily
+    :param candidates: masks of implicants
+    :type candidates: list of tuple of int
+    :param covered: masks of covered minterms of each output for every
+        implicant
+    :type covered: list of list of int
+    :returns: indexes of chosen implicants
+    :rtype: list of int
+    """
+    offsets = [0]
+    for i in range(len(covered[0]) - 1):
+        offsets.append(offsets[-1] + max(
+            masks[i] for masks in covered).bit_length())
+    totals = [sum(mask << offset for mask, offset in zip(masks, offsets))
+              for masks in covered]
+    uncovered = 0
+    for total in totals:
+        uncovered |= total
+    heap = [(-total.bit_count(), candidates[i][0].bit_count(), i)
+            for i, total in enumerate(totals)]
+    heapify(heap)
+    output = []
+    while uncovered:
+        _, literals, index = heappop(heap)
+        gain = (totals[index] & uncovered).bit_count()
+        if heap and (-gain, literals, index) > heap[0]:
+            heappush(heap, (-gain, literals, index))
+            continue
+        output.append(index)
+        uncovered &= ~totals[index]
+    return output
+
+
+def irredundant(chosen: List[int], covered: List[int]) -> List[int]:
+    """
+    This function removes implicants of one output which cover only
+    minterms covered by its other implicants
+    :param chosen: indexes of implicants of the output
+    :type chosen: list of int
+    :param covered: minterms of the output covered by each implicant
+    :type covered: list of int
+    :returns: indexes of kept implicants
+    :rtype: list of int
+    """
+    output = [index for index in chosen if covered[index]]
+    for index in reversed(list(output)):
+        rest = 0
+        for other in output:
+            if other != index:
+                rest |= covered[other]
+        if covered[index] & ~rest == 0:
+            output.remove(index)
+    return output
+
+
+def chain_sets(problems: Problems) -> List[List[int]]:
+    """
+    This function lists all F and R sets of given problems
+    :param problems: F and R indexes of each output
+    :type problems: list of tuples of lists of int
+    :returns: F and R sets
+    :rtype: list of list of int
+    """
+    return [sequence for problem in problems for sequence in problem
+            if sequence]
+
+
+@benchmark
+def multi_output(problems: Problems, batched: bool = False) -> List[str]:
+    """
+    This function minimizes outputs of multi-output function at once,
+    sharing implicants between outputs
+    :param problems: F and R indexes of each output, all over the same
+        variables
+    :type problems: list of tuples of lists of int
+    :param batched: if b matrixes should be built with numpy at once
+    :type batched: bool
+    :returns: optimalized function of each output
+    :rtype: list of str
+    :raises InvalidInputException: when given data is invalid
+    """
+    if any(not first or data_validation(first, second)
+           for first, second in problems):
+        raise InvalidInputException()
+    length = bit_length(*chain_sets(problems))
+    candidates = shared_implicants(problems, length, batched)
+    covered = coverage(candidates, problems)
+    chosen = select_implicants(candidates, covered)
+    return [' + '.join(implicant_string(candidates[index]) for index in
+                       irredundant(chosen, [masks[i] for masks in covered]))
+            for i in range(len(problems))]
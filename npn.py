@@ -0,0 +1,173 @@
+"""
+Ekspresso procedure
+Copyright (C) 2022  Mateusz Jaracz 
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+
+
+from itertools import chain, groupby, permutations, product
+from math import factorial, prod
+from typing import Iterator, List, Tuple
+
+import numpy as np
+
+
+# canonical variable j is original variable order[j], negation is the mask
+# of inverted original variables
+Transform = Tuple[Tuple[int, ...], int]
+
+# transforms are compared exhaustively while their number times number of
+# minterms does not exceed it, otherwise the form is only semi-canonical
+LIMIT: int = 1 << 12
+
+
+def candidates(arrays: List[np.ndarray], length: int) -> Iterator[Transform]:
+    """
+    This function yields transforms which can give the canonical form,
+    every variable is inverted so that more minterms have it set and
+    variables are sorted by their signatures, only ties are enumerated
+    :param arrays: minterms of F, R and don't care sets
+    :type arrays: list of uint64 arrays
+    :param length: number of variables
+    :type length: int
+    :returns: transforms, only the one keeping ties in their order when
+        there are too many of them
+    :rtype: iterator of transforms
+    """
+    signatures, fixed, free = [], 0, []
+    for i in range(length):
+        ones = tuple(int((array >> np.uint64(i) & np.uint64(1)).sum())
+                     for array in arrays)
+        zeros = tuple(len(array) - one for array, one in zip(arrays, ones))
+        if ones < zeros:
+            fixed |= 1 << i
+        elif ones == zeros:
+            free.append(i)
+        signatures.append(max(ones, zeros))
+    groups = [list(group) for _, group in groupby(
+        sorted(range(length), key=signatures.__getitem__),
+        key=signatures.__getitem__)]
+    count = prod(factorial(len(group)) for group in groups) << len(free)
+    if count * sum(map(len, arrays)) > LIMIT:
+        yield tuple(chain(*groups)), fixed
+        return
+    for orders in product(*map(permutations, groups)):
+        for signs in product((0, 1), repeat=len(free)):
+            yield tuple(chain(*orders)), fixed | sum(
+                sign << i for sign, i in zip(signs, free))
+
+
+def transform_minterms(array: np.ndarray, transform: Transform) -> np.ndarray:
+    """
+    This function inverts and permutes variables of minterms
+    :param array: minterms
+    :type array: uint64 array
+    :param transform: order of variables and negation mask
+    :type transform: tuple of tuple of int and int
+    :returns: sorted transformed minterms
+    :rtype: uint64 array
+    """
+    order, negation = transform
+    flipped, output = array ^ np.uint64(negation), np.zeros_like(array)
+    for j, i in enumerate(order):
+        output |= (flipped >> np.uint64(i) & np.uint64(1)) << np.uint64(j)
+    return np.sort(output)
+
+
+def canonical_form(
+        *sets: List[int],
+        length: int | None = None
+        ) -> Tuple[Transform, List[List[int]]] | None:
+    """
+    This function maps F, R and don't care sets to the representative of
+    their class of input permutations and negations, the smallest one of
+    the candidate transforms, when ties of variables need too many
+    transforms the form is only semi-canonical
+    :param sets: F, R and don't care indexes
+    :type sets: lists of int
+    :param length: number of variables, None to use the bit length of the
+        greatest index
+    :type length: int or None
+    :returns: transform and sorted transformed sets, None if indexes are
+        negative or do not fit in 64 bits
+    :rtype: tuple of transform and list of list of int or None
+    """
+    minterms = list(map(int, chain(*sets)))
+    if min(minterms, default=0) < 0 or max(minterms, default=0) >> 64:
+        return None
+    length = max(max(minterms, default=0).bit_length(), length or 0)
+    if length > 64:
+        return None
+    arrays = [np.unique(np.asarray(minterms, dtype=np.uint64))
+              for minterms in sets]
+    best = min((b''.join(transform_minterms(array, transform).tobytes()
+                         for array in arrays), transform)
+               for transform in candidates(arrays, length))[1]
+    return best, [transform_minterms(array, best).tolist()
+                  for array in arrays]
+
+
+def literals(implicant: str, prefix: str) -> List[Tuple[int, bool]]:
+    """
+    This function parses literals like "x3`" or "L3`" of the implicant
+    :param implicant: joined literals
+    :type implicant: str
+    :param prefix: letter before every literal
+    :type prefix: str
+    :returns: variables and if they are not negated
+    :rtype: list of tuples of int and bool
+    """
+    return [(int(literal.rstrip('`')), literal[-1] != '`')
+            for literal in implicant.split(prefix)[1:] if literal]
+
+
+def to_labels(expression: str, transform: Transform) -> str:
+    """
+    This function rewrites implicants of the original function into
+    labels of canonical variables
+    :param expression: implicants like "x3x1`" joined with " + "
+    :type expression: str
+    :param transform: order of variables and negation mask
+    :type transform: tuple of tuple of int and int
+    :returns: implicants like "L3L1`" joined with " + "
+    :rtype: str
+    """
+    order, negation = transform
+    position = {i: j for j, i in enumerate(order)}
+    return ' + '.join(''.join(
+        f'L{j}' if value else f'L{j}`' for j, value in sorted(
+            ((position[i], value ^ bool(negation >> i & 1))
+             for i, value in literals(implicant, 'x')), reverse=True))
+        for implicant in expression.split(' + '))
+
+
+def from_labels(labels: str, transform: Transform) -> str:
+    """
+    This function rewrites labels of canonical variables back into
+    implicants of the original function
+    :param labels: implicants like "L3L1`" joined with " + "
+    :type labels: str
+    :param transform: order of variables and negation mask
+    :type transform: tuple of tuple of int and int
+    :returns: implicants like "x3x1`" joined with " + "
+    :rtype: str
+    """
+    order, negation = transform
+    return ' + '.join('x' + 'x'.join(
+        f'{i}' if value else f'{i}`' for i, value in sorted(
+            ((order[j], value ^ bool(negation >> order[j] & 1))
+             for j, value in literals(implicant, 'L')), reverse=True))
+        for implicant in labels.split(' + '))
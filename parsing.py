@@ -17,37 +17,141 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>
 """
 
 
+
+from array import array
 from dataclasses import dataclass
+from typing import Iterator
+
+import re
+
+
+NUMBER: str = r'0[xX][0-9a-fA-F]+|0[bB][01]+|[0-9]+'
+TERM: str = (rf'({NUMBER})(?:[ \t]*(?:-|\.\.)[ \t]*({NUMBER})'
+             rf'(?:[ \t]*:[ \t]*({NUMBER}))?)?')
+TOKEN: re.Pattern = re.compile(rf'[\s,]*(?:{TERM}(?![^\s,])|([^\s,]))')
+LIMIT: int = 1 << 24
+
+
+class ParseException(Exception):
+    def __init__(self, name: str, position: int, message: str) -> None:
+        super().__init__(f'Invalid {name}, position {position}: {message}')
+        self.name = name
+        self.position = position
 
 
 @dataclass(frozen=True)
 class InputDTO:
-    first: list[int]
-    second: list[int]
-
-
-def return_type(type: object):
-    def handler(function):
-        def wrapper(*args: ..., **kwargs: ...) -> any:
-            if (value := function(*args, **kwargs)):
-                for element in value:
-                    if not isinstance(element, type):
-                        return None
-                return value
-            return None
-        return wrapper
-    return handler
-
-
-@return_type(int)
-def evaluate(input: str) -> object | None:
-    try:
-        return eval('[' + input + ']')
-    except Exception:
-        return None
-
-
-def parse(first: str, second: str) -> InputDTO | None:
-    if (f := evaluate(first)) and (r := evaluate(second)):
-        return InputDTO(f, r)
-    return None
+    first: array
+    second: array
+
+
+def number(value: str) -> int:
+    """
+    This function converts decimal, hex or binary literal into int
+    :param value: literal matched by NUMBER
+    :type value: str
+    :returns: value of the literal
+    :rtype: int
+    """
+    return int(value, 0) if value[1:2].isalpha() else int(value)
+
+
+def terms(text: str, name: str) -> Iterator[tuple[int, int, int, int]]:
+    """
+    This function yields terms written in text, a term is a decimal,
+    hex (0x) or binary (0b) number or a range of them written as "a-b"
+    or "a..b" with optional ":step", both ends are included, terms are
+    separated by commas or whitespace
+    :param text: text to be parsed
+    :type text: str
+    :param name: name of the input used in error messages
+    :type name: str
+    :returns: position of each term counted from 1, its start, inclusive
+        stop and step, stop is equal to start for a single number
+    :rtype: iterator of tuples of int
+    :raises ParseException: when text is not a list of terms
+    """
+    for token in TOKEN.finditer(text):
+        start, stop, step, error = token.groups()
+        position = token.start(1 if start else 4) + 1
+        if error:
+            term = re.match(TERM, text[position - 1:])
+            if term:
+                raise ParseException(name, position + term.end(),
+                                     'separator expected')
+            raise ParseException(name, position, 'number expected')
+        start = number(start)
+        if stop is None:
+            yield position, start, start, 1
+            continue
+        stop, step = number(stop), 1 if step is None else number(step)
+        if stop < start:
+            raise ParseException(name, position,
+                                 'end of range is lower than its start')
+        if not step:
+            raise ParseException(name, position, 'step must not be 0')
+        yield position, start, stop, step
+
+
+def read_numbers(
+        text: str,
+        name: str,
+        forbidden: set[int] | None = None
+        ) -> tuple[array, set[int]]:
+    """
+    This function reads numbers of one input, repeated numbers are read
+    once, numbers are checked against the other input while being read
+    :param text: text to be parsed
+    :type text: str
+    :param name: name of the input used in error messages
+    :type name: str
+    :param forbidden: numbers of the other input
+    :type forbidden: set of int or None
+    :returns: numbers in order of appearance and set of them
+    :rtype: tuple of array of unsigned long long and set of int
+    :raises ParseException: when text is invalid, empty, too long or
+        shares a number with the other input
+    """
+    output, seen, forbidden = array('Q'), set(), forbidden or set()
+    for position, start, stop, step in terms(text, name):
+        if stop >= 1 << 64:
+            raise ParseException(name, position, 'number is too big')
+        if start == stop:
+            if start in forbidden:
+                raise ParseException(name, position,
+                                     'number belongs to the other input')
+            if start not in seen:
+                seen.add(start)
+                output.append(start)
+            continue
+        values = range(start, stop + 1, step)
+        if len(seen) + len(values) > LIMIT:
+            raise ParseException(name, position, 'too many numbers')
+        if not forbidden.isdisjoint(values):
+            raise ParseException(name, position,
+                                 'number belongs to the other input')
+        if not seen.isdisjoint(values):
+            values = [value for value in values if value not in seen]
+        output.extend(values)
+        seen.update(values)
+    if not output:
+        raise ParseException(name, len(text) + 1, 'no numbers given')
+    if len(output) > LIMIT:
+        raise ParseException(name, len(text) + 1, 'too many numbers')
+    return output, seen
+
+
+def parse(first: str, second: str) -> InputDTO:
+    """
+    This function parses F and R inputs
+    :param first: text of F input
+    :type first: str
+    :param second: text of R input
+    :type second: str
+    :returns: F and R numbers
+    :rtype: InputDTO
+    :raises ParseException: when any of inputs is invalid
+    """
+    fnumbers, fset = read_numbers(first, 'F')
+    rnumbers, _ = read_numbers(second, 'R', fset)
+    return InputDTO(fnumbers, rnumbers)
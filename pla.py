@@ -0,0 +1,265 @@
+"""
+Ekspresso procedure
+Copyright (C) 2022  Mateusz Jaracz 
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+
+
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, TextIO
+
+from complement import complement, cube_string, parse_cube
+
+
+Functions = list[tuple[list[int], list[int]]]
+Cubes = list[tuple[list[str], list[str]]]
+
+ON, OFF, DONT_CARE = 1, 2, 3
+
+# files with more inputs are read as cubes unless minterms are asked for
+WIDE: int = 16
+
+
+class PLAException(Exception):
+    def __init__(self, line: int, message: str) -> None:
+        super().__init__(f'Invalid PLA file, line {line}: {message}')
+
+
+@dataclass(slots=True)
+class PLAHeader:
+    inputs: int = 0
+    outputs: int = 1
+    kind: str = 'fd'
+    input_labels: list[str] = field(default_factory=list)
+    output_labels: list[str] = field(default_factory=list)
+
+
+def read_pla(handle: Iterable[str], header: PLAHeader) -> Iterator[
+        tuple[str, str]]:
+    """
+    This function yields cubes of PLA file line by line, directives are
+    stored in given header as soon as they are read
+    :param handle: lines of PLA file
+    :type handle: iterable of str
+    :param header: header to be filled
+    :type header: PLAHeader
+    :returns: input part and output part of each cube
+    :rtype: iterator of tuples of str
+    :raises PLAException: when file is invalid
+    """
+    for number, line in enumerate(handle, 1):
+        line = line.split('#', 1)[0].strip()
+        if not line:
+            continue
+        if line[0] == '.':
+            directive, *values = line.split()
+            if directive in ('.e', '.end'):
+                return
+            try:
+                if directive == '.i':
+                    header.inputs = int(values[0])
+                elif directive == '.o':
+                    header.outputs = int(values[0])
+                elif directive == '.type':
+                    header.kind = values[0]
+            except (IndexError, ValueError):
+                raise PLAException(number, f'bad directive {line}')
+            if directive == '.ilb':
+                header.input_labels = values
+            elif directive == '.ob':
+                header.output_labels = values
+            continue
+        if not header.inputs:
+            raise PLAException(number, 'cube before .i directive')
+        cube = ''.join(line.split())
+        inputs, outputs = cube[:header.inputs], cube[header.inputs:] or '1'
+        if (len(inputs) != header.inputs or len(outputs) != header.outputs
+                or not set(inputs) <= set('01-2')
+                or not set(outputs) <= set('01-2~')):
+            raise PLAException(number, f'bad cube {line}')
+        yield inputs, outputs
+
+
+def cube_minterms(cube: str) -> Iterator[int]:
+    """
+    This function yields every minterm of input part of a cube, the first
+    character of the cube is the most significant bit
+    :param cube: string of '0', '1' and '-'
+    :type cube: str
+    :returns: minterms of the cube
+    :rtype: iterator of int
+    """
+    value = int(cube.replace('-', '0').replace('2', '0'), 2)
+    free = int(cube.replace('1', '0').replace('-', '1').replace('2', '1'), 2)
+    subset = 0
+    while True:
+        yield value | subset
+        if subset == free:
+            return
+        subset = (subset - free) & free
+
+
+def load_functions(handle: Iterable[str]) -> tuple[PLAHeader, Functions]:
+    """
+    This function reads PLA file and returns F and R indexes of every
+    output, minterms which are not given explicitly are in R unless the
+    type of the file contains 'r', minterms of both F and don't care
+    cubes are in F, only given minterms are kept so R is enumerated over
+    all inputs only when it is not given
+    :param handle: lines of PLA file
+    :type handle: iterable of str
+    :returns: header and tuple of F and R indexes of each output
+    :rtype: tuple of PLAHeader and list of tuples of lists of int
+    :raises PLAException: when file is invalid or R overlaps other sets
+    """
+    header, states = PLAHeader(), []
+    for number, (inputs, outputs) in enumerate(read_pla(handle, header), 1):
+        if not states:
+            states = [{} for _ in range(header.outputs)]
+        for state, char in zip(states, outputs):
+            if char == '1':
+                mark = ON
+            elif char in '-2' and 'd' in header.kind:
+                mark = DONT_CARE
+            elif char == '0' and 'r' in header.kind:
+                mark = OFF
+            else:
+                continue
+            for minterm in cube_minterms(inputs):
+                if (other := state.setdefault(minterm, mark)) == mark:
+                    continue
+                if OFF in (mark, other):
+                    raise PLAException(number, f'cube {inputs} overlaps '
+                                       'other set of its output')
+                state[minterm] = ON
+    states = states or [{} for _ in range(header.outputs)]
+    if 'r' in header.kind:
+        return header, [
+            (sorted(i for i, mark in state.items() if mark == ON),
+             sorted(i for i, mark in state.items() if mark == OFF))
+            for state in states]
+    return header, [
+        (sorted(i for i, mark in state.items() if mark == ON),
+         [i for i in range(1 << header.inputs) if i not in state])
+        for state in states]
+
+
+def load_cubes(handle: Iterable[str]) -> tuple[PLAHeader, Cubes]:
+    """
+    This function reads PLA file and returns F and R cubes of every output
+    without enumerating their minterms, unless the type of the file
+    contains 'r' R cubes are computed as the complement of F and don't
+    care cubes
+    :param handle: lines of PLA file
+    :type handle: iterable of str
+    :returns: header and tuple of F and R cubes of each output
+    :rtype: tuple of PLAHeader and list of tuples of lists of str
+    :raises PLAException: when file is invalid
+    """
+    header, functions = PLAHeader(), []
+    for inputs, outputs in read_pla(handle, header):
+        if not functions:
+            functions = [([], [], []) for _ in range(header.outputs)]
+        for cubes, char in zip(functions, outputs):
+            if char == '1':
+                cubes[0].append(inputs.replace('2', '-'))
+            elif char == '0' and 'r' in header.kind:
+                cubes[1].append(inputs.replace('2', '-'))
+            elif char in '-2' and 'd' in header.kind:
+                cubes[2].append(inputs.replace('2', '-'))
+    if 'r' in header.kind:
+        return header, [(first, second) for first, second, _ in functions
+                        or [([], [], [])] * header.outputs]
+    return header, [(first, [cube_string(cube, header.inputs) for cube in
+                             complement([parse_cube(cube) for cube
+                                         in first + dont_care])])
+                    for first, _, dont_care in functions
+                    or [([], [], [])] * header.outputs]
+
+
+def load_pla(
+        handle: Iterable[str],
+        cubes: bool | None = None
+        ) -> tuple[PLAHeader, Functions | Cubes, bool]:
+    """
+    This function reads PLA file with load_cubes or load_functions, files
+    with more than WIDE inputs are read as cubes by default
+    :param handle: lines of PLA file
+    :type handle: iterable of str
+    :param cubes: if the file should be read as cubes, None to decide by
+        the number of inputs
+    :type cubes: bool or None
+    :returns: header, F and R of each output and flag telling if they are
+        cubes
+    :rtype: tuple of PLAHeader, list of tuples of lists and bool
+    :raises PLAException: when file is invalid
+    """
+    lines = list(handle)
+    if cubes is None:
+        header = PLAHeader()
+        next(read_pla(lines, header), None)
+        cubes = header.inputs > WIDE
+    return *(load_cubes if cubes else load_functions)(lines), cubes
+
+
+def expression_cubes(expression: str, length: int) -> list[str]:
+    """
+    This function converts result of the engines into input parts of cubes
+    :param expression: implicants like "x3`x0 + x1"
+    :type expression: str
+    :param length: number of inputs
+    :type length: int
+    :returns: cubes of given length
+    :rtype: list of str
+    """
+    cubes = []
+    for implicant in expression.split(' + '):
+        cube = ['-'] * length
+        for literal in filter(None, implicant.split('x')[1:]):
+            cube[length - 1 - int(literal.rstrip('`'))] = (
+                '0' if literal[-1] == '`' else '1')
+        cubes.append(''.join(cube))
+    return cubes
+
+
+def write_pla(
+        handle: TextIO,
+        header: PLAHeader,
+        covers: list[list[str]]
+        ) -> None:
+    """
+    This function writes covers of all outputs as one PLA file, cubes
+    used by more outputs are written once
+    :param handle: output file
+    :type handle: text file
+    :param header: header of the input file
+    :type header: PLAHeader
+    :param covers: input parts of cubes of each output
+    :type covers: list of list of str
+    """
+    rows = {}
+    for i, cover in enumerate(covers):
+        for cube in cover:
+            rows.setdefault(cube, ['0'] * len(covers))[i] = '1'
+    handle.write(f'.i {header.inputs}\n.o {len(covers)}\n')
+    if header.input_labels:
+        handle.write('.ilb ' + ' '.join(header.input_labels) + '\n')
+    if header.output_labels:
+        handle.write('.ob ' + ' '.join(header.output_labels) + '\n')
+    handle.write(f'.p {len(rows)}\n')
+    for cube, outputs in rows.items():
+        handle.write(f'{cube} {"".join(outputs)}\n')
+    handle.write('.e\n')
@@ -0,0 +1,71 @@
+"""
+Ekspresso procedure
+Copyright (C) 2022  Mateusz Jaracz 
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+
+import json
+
+import pytest
+
+from batch import minimize, minimize_stream, pack_r
+from ekspansja import heuristic
+
+LINES = ['{"f": [1, 2], "r": [0, 3]}',
+         'not json',
+         '',
+         '[1, 2]',
+         '{"id": "a", "f": [3], "r": [0]}',
+         '{"f": [1.5], "r": [2]}']
+
+
+def test_stream_order():
+    results = list(minimize_stream(LINES))
+    assert [result['id'] for result in results] == [0, 1, 3, 'a', 5]
+    assert results[0]['result'] == heuristic([1, 2], [0, 3])[0]
+    assert results[3]['result'] == heuristic([3], [0])[0]
+    assert all('error' in results[index] for index in (1, 2, 4))
+
+
+@pytest.mark.parametrize('problem', [
+    {'f': [1.5], 'r': [2]},
+    {'f': [True], 'r': [2]},
+    {'f': [1], 'r': [False]},
+    {'f': [1], 'r': ['0']},
+    {'f': '1', 'r': [0]},
+    {'f': {'1': 1}, 'r': [0]},
+    {'f': [1], 'r': None},
+    {'f': [], 'r': [0]},
+    {'f': [-1], 'r': [0]},
+    {'f': [1], 'r': [1]},
+    {'r': [0]}])
+def test_bad_problem(problem):
+    result = minimize(problem, 'heuristic')
+    assert 'error' in result and 'result' not in result
+
+
+def test_bad_line_keeps_stream():
+    lines = [json.dumps({'f': [1], 'r': [True]}), '{"f": [1], "r": [0]}']
+    results = list(minimize_stream(lines, 'systematic'))
+    assert 'error' in results[0]
+    assert results[1]['result'] == 'x0'
+
+
+def test_pack_r_sorted():
+    pack_r.cache_clear()
+    list(minimize_stream(['{"f": [1], "r": [0, 2]}',
+                          '{"f": [3], "r": [2, 0]}']))
+    assert pack_r.cache_info().hits == 1
@@ -0,0 +1,138 @@
+"""
+Ekspresso procedure
+Copyright (C) 2022  Mateusz Jaracz 
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+
+
+from cache import (
+    ResultCache,
+    cache_key,
+    cached,
+    caching,
+    default_cache
+)
+from ekspansja import systematic, heuristic
+from npn import canonical_form, from_labels, to_labels
+from parsing import parse
+
+from functools import reduce
+from itertools import chain
+from operator import or_
+from re import findall
+
+import os
+
+F = [0, 1, 3, 7, 8, 12]
+R = [2, 4, 6, 9, 15]
+
+
+def test_cache_key():
+    assert cache_key('e', {'first': [3, 1], 'second': [2], 'progress': 1}) \
+        == cache_key('e', {'first': [3, 1], 'second': [2]})
+    assert cache_key('e', {'first': [3, 1], 'second': [2]}) \
+        != cache_key('e', {'first': [1, 3], 'second': [2]})
+    assert cache_key('e', {'first': [1], 'second': [2]}) \
+        != cache_key('f', {'first': [1], 'second': [2]})
+
+
+def test_cached_engines(tmp_path):
+    with caching(ResultCache(tmp_path, npn=False)) as cache:
+        first = systematic(F, R)[0], heuristic(F, R)[0]
+        assert (systematic(F, R)[0], heuristic(F, R)[0]) == first
+        assert (cache.hits, cache.misses, cache.writes) == (2, 2, 2)
+        reverse = systematic(F[::-1], R)[0]
+        assert (cache.hits, cache.misses) == (2, 3)
+    with caching(None):
+        assert (systematic(F, R)[0], heuristic(F, R)[0]) == first
+        assert systematic(F[::-1], R)[0] == reverse
+    assert cache.hits == 2
+
+
+def test_parsed_input(tmp_path):
+    data = parse('0, 1, 3, 7, 8, 12', '2, 4, 6, 9, 15')
+    with caching(ResultCache(tmp_path)) as cache:
+        first = systematic(data.first, data.second)[0], \
+            heuristic(data.first, data.second)[0]
+        assert (systematic(F, R)[0], heuristic(F, R)[0]) == first
+        assert (cache.hits, cache.writes) == (2, 2)
+
+
+def test_default_cache(monkeypatch, tmp_path):
+    monkeypatch.delenv('EKSPANSJA_CACHE', raising=False)
+    assert default_cache() is None
+    monkeypatch.setenv('EKSPANSJA_CACHE', str(tmp_path))
+    assert default_cache().directory == tmp_path
+
+
+def swap(x):
+    return (x & 0b1001 | x >> 1 & 0b0010 | x << 1 & 0b0100) ^ 0b0001
+
+
+def test_canonical_form():
+    transform, sets = canonical_form(F, R, [])
+    assert canonical_form([swap(x) for x in F], [swap(x) for x in R], [])[1] \
+        == sets
+    wide = [1 << i for i in range(8)]
+    assert canonical_form(wide, [0], [])[1] \
+        == canonical_form(wide[::-1], [0], [])[1]
+    assert canonical_form(F, R, [], length=6)[0][0][4:] == (4, 5)
+    expression = "x3`x2`x1` + x3`x0 + x3x0`"
+    assert from_labels(to_labels(expression, transform), transform) \
+        == expression
+
+
+def supercube(first, second=None, dont_care=None):
+    length = max(chain(first, second or [], dont_care or [])).bit_length()
+    care = (1 << length) - 1 & ~reduce(or_, (x ^ first[0] for x in first))
+    return 'x' + 'x'.join(f'{i}' if first[0] >> i & 1 else f'{i}`'
+                          for i in reversed(range(length)) if care >> i & 1)
+
+
+def covers(expression, x):
+    return any(all(x >> int(index) & 1 != bool(negated)
+                   for index, negated in findall(r'x(\d+)(`?)', term))
+               for term in expression.split(' + '))
+
+
+def test_npn_hit(tmp_path):
+    engine = cached(supercube)
+    first, second = [swap(x) for x in F], [swap(x) for x in R]
+    with caching(ResultCache(tmp_path)) as cache:
+        engine(F[:2], R)
+        result = engine(first[:2], second)
+        assert cache.hits == 1
+        systematic(F, R)
+        heuristic(F, R)
+        expressions = systematic(first, second)[0] + \
+            [heuristic(first, second)[0]]
+        assert cache.hits == 3
+    assert result == supercube(first[:2], second)
+    for expression in expressions:
+        assert all(covers(expression, x) for x in first)
+        assert not any(covers(expression, x) for x in second)
+
+
+def test_eviction(tmp_path):
+    cache = ResultCache(tmp_path, 30)
+    for i, key in enumerate('abc'):
+        cache.put(key, 'x' * 8)
+        os.utime(cache.path(key), (i, i))
+    assert cache.get('a') == (True, 'x' * 8)
+    cache.put('d', 'x' * 8)
+    assert cache.get('b') == (False, None)
+    assert cache.stats()['entries'] == 3 and cache.evictions == 1
+    assert cache.size == cache.stats()['bytes'] == 30
@@ -0,0 +1,61 @@
+"""
+Ekspresso procedure
+Copyright (C) 2022  Mateusz Jaracz 
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+from cli import main, minimize_shared
+from pla import PLAHeader, load_functions
+
+import io
+import sys
+
+import pytest
+
+CONSTANT = '.i 2\n.o 2\n.type fr\n00 11\n01 11\n10 1-\n11 10\n.e\n'
+
+
+def run(monkeypatch, path, text, *args):
+    monkeypatch.setattr(sys, 'argv', ['cli.py', '-o', str(path), *args])
+    monkeypatch.setattr(sys, 'stdin', io.StringIO(text))
+    main()
+    return path.read_text()
+
+
+def test_minimize_shared_constant():
+    _, functions = load_functions(io.StringIO(CONSTANT))
+    covers, _ = minimize_shared(functions, PLAHeader(2, 2), False)
+    assert covers == [['--'], ['0-']]
+
+
+@pytest.mark.parametrize('args', [(), ('-s',), ('-c',), ('-m', 'espresso')])
+def test_round_trip(monkeypatch, tmp_path, args):
+    output = run(monkeypatch, tmp_path / 'out.pla', CONSTANT, *args)
+    _, functions = load_functions(io.StringIO(output))
+    _, expected = load_functions(io.StringIO(CONSTANT))
+    for (first, _), (on, off) in zip(functions, expected):
+        assert set(on) <= set(first) and not set(off) & set(first)
+
+
+@pytest.mark.parametrize('args', [(), ('-c',)])
+def test_inputs(monkeypatch, tmp_path, args):
+    text = '.i 3\n.o 1\n.type f\n001 1\n.e\n'
+    output = run(monkeypatch, tmp_path / 'out.pla', text, *args)
+    assert '001 1' in output.splitlines()
+
+
+def test_shared_cubes(monkeypatch, tmp_path):
+    with pytest.raises(SystemExit):
+        run(monkeypatch, tmp_path / 'out.pla', CONSTANT, '-s', '-c')
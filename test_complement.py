@@ -0,0 +1,46 @@
+"""
+Ekspresso procedure
+Copyright (C) 2022  Mateusz Jaracz 
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+from complement import complement, cube_string, parse_cube
+
+from itertools import product
+
+CUBES = ['1-0-', '11-1', '0--0']
+
+
+def points(cubes, length):
+    return {point for point in product('01', repeat=length)
+            if any(all(c in '-' + p for c, p in zip(cube, point))
+                   for cube in cubes)}
+
+
+def test_parse_cube():
+    assert parse_cube('1-0-') == (0b1010, 0b1000)
+    assert cube_string(parse_cube('1-0-'), 4) == '1-0-'
+
+
+def test_complement():
+    result = [cube_string(cube, 4)
+              for cube in complement([parse_cube(c) for c in CUBES])]
+    assert points(result, 4) == set(product('01', repeat=4)) - points(
+        CUBES, 4)
+
+
+def test_complement_trivial():
+    assert complement([]) == [(0, 0)]
+    assert complement([(0, 0), (1, 1)]) == []
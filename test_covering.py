@@ -0,0 +1,84 @@
+"""
+Ekspresso procedure
+Copyright (C) 2022  Mateusz Jaracz 
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+
+
+from covering import (
+    best_cover,
+    cyclic_core,
+    minimum_cover_size,
+    minimum_covers
+)
+
+from itertools import combinations
+from random import Random
+
+import pytest
+
+ROWS = [0b0011, 0b0110, 0b1100, 0b1001]
+
+
+def brute_force(rows, width):
+    for i in range(width + 1):
+        if (output := [combi for combi in combinations(range(width), i)
+                       if all(any(row >> j & 1 for j in combi)
+                              for row in rows)]):
+            return output
+
+
+def test_cyclic_core():
+    assert cyclic_core(ROWS, 4) == ([], ROWS)
+    assert cyclic_core([0b0011, 0b0110, 0b1110], 4) == ([1], [])
+    assert cyclic_core([0b0011, 0b0110, 0b1110], 4, False) == (
+        [], [0b0011, 0b0110])
+    assert cyclic_core([0b0001, 0b0011, 0b1100], 4, False) == (
+        [0], [0b1100])
+
+
+def test_minimum_cover_size():
+    assert minimum_cover_size(ROWS, 4) == 2
+
+
+def test_best_cover():
+    assert best_cover(ROWS, 4) == ((0, 2), True)
+    assert len(best_cover(ROWS, 4, 0.0, [0, 1, 2])[0]) == 2
+    assert best_cover(ROWS, 4, costs=[3, 1, 3, 1]) == ((1, 3), True)
+    assert best_cover(ROWS, 4, costs=[1, 0, 9, 0]) == ((1, 3), True)
+
+
+def test_minimum_covers():
+    assert minimum_covers(ROWS, 4) == [(0, 2), (1, 3)]
+    assert minimum_covers(ROWS, 4) == brute_force(ROWS, 4)
+
+
+def test_minimum_covers_uncoverable():
+    assert minimum_covers([0b01, 0b00], 2) == []
+
+
+def test_check():
+    random = Random(1)
+    rows = [sum(1 << j for j in random.sample(range(30), 4))
+            for _ in range(60)]
+
+    def check():
+        raise InterruptedError()
+
+    with pytest.raises(InterruptedError):
+        best_cover(rows, 30, check=check)
+    with pytest.raises(InterruptedError):
+        minimum_covers(rows, 30, check=check)
@@ -17,20 +17,199 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>
 """
 
 
-from ekspansja import _bit_length, parse_input
+from ekspansja import (
+    InvalidInputException,
+    bit_length,
+    parse_input_packed,
+    last_matrix_setting,
+    absorb_rows,
+    pack_rows,
+    list_sorting_packed,
+    line_parsing_packed,
+    blocking_tensor,
+    expand_packed,
+    expand_batched,
+    generate_first_output,
+    generate_covering_output,
+    row_implicant,
+    systematic,
+    iter_systematic,
+    heuristic,
+    anytime,
+    espresso,
+    weighted,
+    systematic_cubes,
+    heuristic_cubes,
+    espresso_cubes,
+    minterm_cubes,
+    systematic_cubes_packed
+)
+from bench import generate_problem
 
 from typing import List
 
+import numpy as np
+import pytest
+
 FIRST: List[int] = [1, 2, 59, 228]
 SECOND: List[int] = [5, 6, 45, 56, 145]
 
+F: List[int] = [0, 1, 3, 7, 8, 12]
+R: List[int] = [2, 4, 6, 9, 15]
+
 
 def test_bit_length():
-    assert _bit_length(FIRST, SECOND, FIRST) == 8
+    assert bit_length(FIRST, SECOND, FIRST) == 8
+
+
+def test_parse_input_packed():
+    assert parse_input_packed(FIRST) == FIRST
+
+
+def test_last_matrix_setting():
+    op = [(0b1100, 0b0100), (0b0001, 0b0000), (0, 0)]
+    assert last_matrix_setting(F, op, 4) == [0b011, 0b001, 0b001, 0b101,
+                                             0b011, 0b011]
+    assert last_matrix_setting(F, op, 4, 4) == last_matrix_setting(
+        F, op, 65)
+
+
+def test_absorb_rows():
+    matrix = np.random.default_rng(1).random((200, 12)) < 0.3
+    assert pack_rows(absorb_rows(matrix)) == line_parsing_packed(
+        list_sorting_packed(pack_rows(matrix)))
+
+
+def test_blocking_tensor():
+    packed, bits = blocking_tensor(F, R, 4)
+    assert packed.tolist() == [[x ^ y for y in R] for x in F]
+    assert bits.tolist() == [[[int(c) for c in format(x ^ y, '04b')]
+                              for y in R] for x in F]
+
+
+def test_expand_batched():
+    for seed in range(20):
+        first, second = generate_problem(6, 0.4, seed)
+        result = list(expand_packed(first, second, 6))
+        assert list(expand_batched(first, second, 6)) == result
+        assert list(expand_batched(first, second, 6, chunk_size=1)) == result
+        first, second = generate_problem(6, 0.4, seed, 0.3)
+        assert systematic(first, second, batched=True)[0] \
+            == systematic(first, second)[0]
+        assert heuristic(first, second, batched=True)[0] \
+            == heuristic(first, second)[0]
+
+
+def test_generate_covering_output():
+    for seed in range(20):
+        first, second = generate_problem(6, 0.4, seed, 0.2)
+        expanded = [row_implicant(*row)
+                    for row in expand_packed(first, second, 6)]
+        result = generate_first_output(expanded, first)
+        assert generate_covering_output(first, second, 6) == result
+        assert generate_covering_output(first, second, 6, True) == result
+
+
+def test_systematic():
+    result, _ = systematic(F, R)
+    assert result == ['x3`x2`x1` + x3`x0 + x3x0`',
+                      'x2`x1`x0` + x3`x0 + x3x0`']
+    assert systematic(F, R, batched=True)[0] == result
+
+
+def test_iter_systematic():
+    assert list(iter_systematic(F, R)) == systematic(F, R)[0]
+    covers = [set(cover.split(' + ')) for cover in systematic(F, R)[0]]
+    for first_only, limit in ((False, 1), (True, None)):
+        result = list(iter_systematic(F, R, limit, first_only))
+        assert len(result) == 1 and set(result[0].split(' + ')) in covers
+    assert list(iter_systematic(FIRST, SECOND, limit=3)) \
+        == systematic(FIRST, SECOND)[0][:3]
+    assert list(iter_systematic([1], [0])) == [systematic([1], [0])[0]]
+    first, second = generate_problem(9, 0.5, 1)
+    result = list(iter_systematic(first, second, first_only=True))
+    assert len(result) == 1 and result[0].count('+') \
+        <= heuristic(first, second)[0].count('+')
+
+
+def test_heuristic():
+    result, _ = heuristic(F, R)
+    assert result == 'x3`x2`x1` + x3`x0 + x3x0`'
+    assert heuristic(F, R, batched=True)[0] == result
+
+
+@pytest.mark.parametrize('batched', [False, True])
+def test_workers(batched):
+    for seed in range(3):
+        first, second = generate_problem(6, 0.4, seed, 0.2)
+        assert systematic(first, second, batched, 2)[0] \
+            == systematic(first, second)[0]
+        assert heuristic(first, second, batched, 2)[0] \
+            == heuristic(first, second)[0]
+
+
+def test_anytime():
+    (result, proven), _ = anytime(F, R, 60.0)
+    assert proven and result == systematic(F, R)[0]
+    (result, proven), _ = anytime(F, R, 0.0)
+    assert not proven and result == [heuristic(F, R)[0]]
+    assert anytime([1], [0], 60.0)[0] == (['x0'], True)
+
+
+def test_cubes():
+    first = [f'{x:04b}' for x in F]
+    second = [f'{x:04b}' for x in R]
+    assert systematic_cubes(first, second)[0] == systematic(F, R)[0]
+    assert heuristic_cubes(first, second)[0] == heuristic(F, R)[0]
+    assert systematic_cubes_packed(*minterm_cubes(F, R, 4), True) \
+        == systematic(F, R)[0]
+    assert systematic_cubes(['1-0-', '11-1'], ['0---', '1010'])[0] == [
+        'x3x2 + x3x1`', 'x3x0 + x3x1`']
+
+
+def test_espresso():
+    assert espresso(F, R)[0] in systematic(F, R)[0]
+    assert espresso(F, R, 0)[0] in systematic(F, R)[0]
+    assert espresso_cubes(['1-0-', '11-1'], ['0---', '1010'])[0] in [
+        'x3x2 + x3x1`', 'x3x1` + x3x2']
+
+
+def test_weighted():
+    assert weighted(F, R)[0] in systematic(F, R)[0]
+    assert weighted(F, R, lambda implicant: 1)[0] in systematic(F, R)[0]
+    assert weighted(F, R, lambda implicant: (
+        9 if implicant == 'x2`x1`x0`' else 1))[0] == systematic(F, R)[0][0]
+
+
+def test_dont_care():
+    dont_care = [x for x in range(16) if x not in F + R]
+    assert systematic(F, dont_care=dont_care)[0] == systematic(F, R)[0]
+    assert heuristic(F, dont_care=dont_care)[0] == heuristic(F, R)[0]
+    assert espresso(F, dont_care=dont_care)[0] == espresso(F, R)[0]
+
+
+def test_length():
+    assert systematic([1], length=3)[0] == 'x2`x1`x0'
+    assert list(iter_systematic([1], length=3)) == ['x2`x1`x0']
+    assert heuristic([1], length=3)[0] == 'x2`x1`x0'
+    assert espresso([1], length=3)[0] == 'x2`x1`x0'
+    assert weighted([1], length=3)[0] == 'x2`x1`x0'
+    assert heuristic([1], dont_care=[3], length=2)[0] == 'x0'
+    with pytest.raises(InvalidInputException):
+        systematic([4], length=2)
+
+
+def test_many_variables():
+    first, second = [3072, 3073], [0, 1, 1024, 2048, 2049]
+    assert systematic(first, second)[0] == 'x11x10'
+    assert heuristic(first, second)[0] == 'x11x10'
+    assert espresso(first, second)[0] == 'x11x10'
+    assert systematic([1024, 2047], [0, 1023, 2046])[0][0] \
+        == 'x10x9` + x10x0'
+    assert heuristic([3072, 1025], [0, 2048, 1024])[0] == 'x11x10 + x0'
 
 
-def test_parse_input():
-    result_first = ['00000001', '00000010', '00111011', '11100100']
-    result_second = ['00000101', '00000110', '00101101', '00111000', '10010001']
-    assert parse_input(FIRST, 8) == result_first
-    assert parse_input(SECOND, 8) == result_second
+def test_generate_problem():
+    first, second = generate_problem(6, 0.5, 1)
+    assert (first, second) == generate_problem(6, 0.5, 1)
+    assert first and second and not set(first) & set(second)
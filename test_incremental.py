@@ -0,0 +1,45 @@
+"""
+Ekspresso procedure
+Copyright (C) 2022  Mateusz Jaracz 
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+
+
+from cache import caching
+from ekspansja import systematic
+from incremental import Session, repair_matrix
+
+F = [0, 1, 3, 7, 8, 12]
+R = [2, 4, 6, 9, 15]
+
+
+def test_repair_matrix():
+    rows = [0b0010, 0b0101]
+    assert repair_matrix(rows, 0, [0b0111], []) is rows
+    assert repair_matrix(rows, 0, [0b0100], []) == [0b0010, 0b0100]
+    assert repair_matrix(rows, 0, [], [0b0010]) is None
+
+
+def test_session():
+    session = Session()
+    with caching(None):
+        assert session.minimize(F, R)[0] == systematic(F, R)[0]
+        assert session.update(add_second=[10])[0] \
+            == systematic(F, R + [10])[0]
+        assert session.update(remove_first=[12], add_first=[13])[0] \
+            == systematic([0, 1, 3, 7, 8, 13], R + [10])[0]
+        assert session.update(remove_second=[2, 10])[0] \
+            == systematic([0, 1, 3, 7, 8, 13], [4, 6, 9, 15])[0]
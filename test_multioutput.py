@@ -0,0 +1,42 @@
+"""
+Ekspresso procedure
+Copyright (C) 2022  Mateusz Jaracz 
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+from multioutput import multi_output
+from pla import cube_minterms, expression_cubes
+
+PROBLEMS = [([0, 1, 3, 7, 8, 12], [2, 4, 6, 9, 15]),
+            ([1, 3, 5, 7, 12], [0, 2, 4, 6, 8]),
+            ([0, 1, 2, 3], [4, 5, 6, 7, 8])]
+
+
+def covered(expression, length):
+    return {minterm for cube in expression_cubes(expression, length)
+            for minterm in cube_minterms(cube)}
+
+
+def test_multi_output():
+    result, _ = multi_output(PROBLEMS)
+    for expression, (first, second) in zip(result, PROBLEMS):
+        assert set(first) <= covered(expression, 4)
+        assert not set(second) & covered(expression, 4)
+    assert multi_output(PROBLEMS, True)[0] == result
+
+
+def test_shared_implicant():
+    result, _ = multi_output([([5, 7], [0, 2]), ([5, 7, 1], [0, 2])])
+    assert result[0] in result[1].split(' + ')
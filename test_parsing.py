@@ -0,0 +1,45 @@
+"""
+Ekspresso procedure
+Copyright (C) 2022  Mateusz Jaracz 
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+from parsing import parse, ParseException
+
+import pytest
+
+
+def test_parse():
+    dto = parse('0, 1 3\n0x7 0b1000 12', '2 4..6:2 9-9,0xF')
+    assert list(dto.first) == [0, 1, 3, 7, 8, 12]
+    assert list(dto.second) == [2, 4, 6, 9, 15]
+
+
+def test_parse_ranges():
+    dto = parse('0-3 2..7:5', '8')
+    assert list(dto.first) == [0, 1, 2, 3, 7]
+
+
+@pytest.mark.parametrize('first, second, name, position', [
+    ('1, 2, x', '0', 'F', 7),
+    ('1;2', '0', 'F', 2),
+    ('5-3', '0', 'F', 1),
+    ('1 2', '3 0-2', 'R', 3),
+    ('1', '', 'R', 1)
+])
+def test_parse_errors(first, second, name, position):
+    with pytest.raises(ParseException) as error:
+        parse(first, second)
+    assert (error.value.name, error.value.position) == (name, position)
@@ -0,0 +1,120 @@
+"""
+Ekspresso procedure
+Copyright (C) 2022  Mateusz Jaracz 
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+
+from pla import (
+    PLAException,
+    PLAHeader,
+    read_pla,
+    cube_minterms,
+    load_functions,
+    load_cubes,
+    load_pla,
+    expression_cubes,
+    write_pla
+)
+
+import io
+
+import pytest
+
+TEXT = '.i 2\n.o 1\n.type {}\n00 1\n01 -\n10 0\n.e\n'
+
+
+def test_read_pla():
+    header = PLAHeader()
+    text = ('# comment\n.i 3\n.o 2\n.ilb a b c\n.ob f g\n.p 2\n'
+            '1-0 10 # cube\n0 2 1 ~1\n.e\n111 11\n')
+    assert list(read_pla(io.StringIO(text), header)) == [
+        ('1-0', '10'), ('021', '~1')]
+    assert header == PLAHeader(3, 2, 'fd', ['a', 'b', 'c'], ['f', 'g'])
+
+
+@pytest.mark.parametrize('text', [
+    '10 1\n', '.i 2\n.o 1\n101 1\n', '.i 2\n.o 1\n1x 1\n', '.i\n',
+    '.i 2\n.o 2\n10 1\n', '.i 2\n.o 1\n.type\n'])
+def test_bad_file(text):
+    with pytest.raises(PLAException):
+        list(read_pla(io.StringIO(text), PLAHeader()))
+
+
+def test_cube_minterms():
+    assert sorted(cube_minterms('1-0-')) == [8, 9, 12, 13]
+    assert list(cube_minterms('101')) == [5]
+    assert sorted(cube_minterms('2-')) == [0, 1, 2, 3]
+
+
+@pytest.mark.parametrize('kind, second', [
+    ('f', [1, 2, 3]), ('fd', [2, 3]), ('fr', [2]), ('fdr', [2])])
+def test_load_functions(kind, second):
+    header, functions = load_functions(io.StringIO(TEXT.format(kind)))
+    assert header.kind == kind
+    assert functions == [([0], second)]
+
+
+def test_overlap():
+    with pytest.raises(PLAException):
+        load_functions(io.StringIO('.i 2\n.o 1\n.type fr\n0- 1\n00 0\n'))
+
+
+def test_on_over_dont_care():
+    _, functions = load_functions(
+        io.StringIO('.i 2\n.o 1\n.type fd\n0- 1\n00 -\n'))
+    assert functions == [([0, 1], [2, 3])]
+
+
+def test_wide():
+    text = '.i 40\n.o 1\n.type fr\n' + '1' * 40 + ' 1\n' \
+        + '0' * 40 + ' 0\n'
+    _, functions = load_functions(io.StringIO(text))
+    assert functions == [([(1 << 40) - 1], [0])]
+    _, cubes, wide = load_pla(io.StringIO(text))
+    assert wide and cubes == [(['1' * 40], ['0' * 40])]
+    _, functions, wide = load_pla(io.StringIO(TEXT.format('fd')))
+    assert not wide
+
+
+@pytest.mark.parametrize('kind', ['f', 'fd', 'fr', 'fdr'])
+def test_load_cubes(kind):
+    _, functions = load_functions(io.StringIO(TEXT.format(kind)))
+    _, cubes = load_cubes(io.StringIO(TEXT.format(kind)))
+    for (first, second), (fcubes, rcubes) in zip(functions, cubes):
+        assert {x for cube in fcubes for x in cube_minterms(cube)} \
+            == set(first)
+        assert {x for cube in rcubes for x in cube_minterms(cube)} \
+            == set(second)
+
+
+def test_expression_cubes():
+    assert expression_cubes('x3`x0 + x2', 4) == ['0--1', '-1--']
+    assert expression_cubes('x', 3) == ['---']
+
+
+def test_write_pla():
+    header = PLAHeader(3, 2, 'fd', ['a', 'b', 'c'], ['f', 'g'])
+    covers = [['1-0', '011'], ['011'], []]
+    handle = io.StringIO()
+    write_pla(handle, header, covers)
+    assert handle.getvalue().count('011 110') == 1
+    header, functions = load_functions(io.StringIO(handle.getvalue()))
+    assert (header.input_labels, header.output_labels) == (
+        ['a', 'b', 'c'], ['f', 'g'])
+    for cover, (first, second) in zip(covers, functions):
+        assert first == sorted(x for cube in cover
+                               for x in cube_minterms(cube))
+        assert sorted(first + second) == list(range(8))
@@ -17,12 +17,14 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>
 """
 
 
-from time import time
+from functools import wraps
+from time import perf_counter
 
 
 def benchmark(function: callable) -> callable:
+    @wraps(function)
     def wrapper(*args: ..., **kwargs: ...) -> any:
-        start = time()
+        start = perf_counter()
         result = function(*args, **kwargs)
-        return result, time() - start
+        return result, perf_counter() - start
     return wrapper
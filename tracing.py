@@ -0,0 +1,103 @@
+"""
+Ekspresso procedure
+Copyright (C) 2022  Mateusz Jaracz 
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+
+
+from contextlib import contextmanager, nullcontext
+from time import perf_counter
+from typing import ContextManager, Iterator
+
+import json
+
+
+class Tracer:
+    def __init__(self) -> None:
+        self.phases: dict[str, list[float | int]] = {}
+        self.counters: dict[str, int] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            record = self.phases.setdefault(name, [0.0, 0])
+            record[0] += perf_counter() - start
+            record[1] += 1
+
+    def count(self, name: str, value: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def breakdown(self) -> list[tuple[str, float]]:
+        return sorted(((name, seconds) for name, (seconds, _)
+                       in self.phases.items()), key=lambda x: -x[1])
+
+    def to_dict(self) -> dict:
+        return {'phases': {name: {'seconds': seconds, 'calls': calls}
+                           for name, (seconds, calls)
+                           in self.phases.items()},
+                'counters': dict(self.counters)}
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict())
+
+
+# tracer of the current minimization, None when tracing is disabled
+ACTIVE: Tracer | None = None
+
+DISABLED: ContextManager[None] = nullcontext()
+
+
+@contextmanager
+def tracing(tracer: Tracer | None = None) -> Iterator[Tracer]:
+    """
+    This function enables tracing of the engines inside with block
+    :param tracer: tracer to be filled, new one if not given
+    :type tracer: Tracer or None
+    :returns: active tracer
+    :rtype: iterator of Tracer
+    """
+    global ACTIVE
+    previous, ACTIVE = ACTIVE, tracer or Tracer()
+    try:
+        yield ACTIVE
+    finally:
+        ACTIVE = previous
+
+
+def phase(name: str) -> ContextManager[None]:
+    """
+    This function measures wall time of a phase if tracing is enabled
+    :param name: name of the phase
+    :type name: str
+    :returns: context manager measuring the phase
+    :rtype: context manager
+    """
+    return ACTIVE.phase(name) if ACTIVE else DISABLED
+
+
+def count(name: str, value: int = 1) -> None:
+    """
+    This function adds value to a counter if tracing is enabled
+    :param name: name of the counter
+    :type name: str
+    :param value: value to be added
+    :type value: int
+    """
+    if ACTIVE:
+        ACTIVE.count(name, value)
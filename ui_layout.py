@@ -17,8 +17,8 @@ from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
     QPalette, QPixmap, QRadialGradient, QTransform)
 from PySide6.QtWidgets import (QApplication, QComboBox, QGridLayout, QHBoxLayout,
     QLabel, QLineEdit, QListWidget, QListWidgetItem,
-    QPushButton, QSizePolicy, QStackedWidget, QVBoxLayout,
-    QWidget)
+    QProgressBar, QPushButton, QSizePolicy, QStackedWidget,
+    QVBoxLayout, QWidget)
 
 class Ui_Form(object):
     def setupUi(self, Form):
@@ -100,11 +100,20 @@ class Ui_Form(object):
         self.methodbox = QComboBox(Form)
         self.methodbox.addItem("")
         self.methodbox.addItem("")
+        self.methodbox.addItem("")
         self.methodbox.setObjectName(u"methodbox")
         self.horizontalLayout.addWidget(self.methodbox)
         self.process = QPushButton(Form)
         self.process.setObjectName(u"process")
         self.horizontalLayout.addWidget(self.process)
+        self.progressbar = QProgressBar(Form)
+        self.progressbar.setObjectName(u"progressbar")
+        self.progressbar.setValue(0)
+        self.horizontalLayout.addWidget(self.progressbar)
+        self.cancelbutton = QPushButton(Form)
+        self.cancelbutton.setObjectName(u"cancelbutton")
+        self.cancelbutton.setEnabled(False)
+        self.horizontalLayout.addWidget(self.cancelbutton)
         self.gridLayout_3.addLayout(self.horizontalLayout, 5, 0, 1, 1)
         self.retranslateUi(Form)
         self.stack.setCurrentIndex(1)
@@ -128,5 +137,7 @@ class Ui_Form(object):
         self.err.setText("")
         self.methodbox.setItemText(0, QCoreApplication.translate("Form", u"Ekspansja systematyczna", None))
         self.methodbox.setItemText(1, QCoreApplication.translate("Form", u"Ekspansja heurystyczna", None))
+        self.methodbox.setItemText(2, QCoreApplication.translate("Form", u"Ekspansja iteracyjna (Espresso)", None))
         self.process.setText(QCoreApplication.translate("Form", u"Minimalizuj", None))
+        self.cancelbutton.setText(QCoreApplication.translate("Form", u"Anuluj", None))
     # retranslateUi
\ No newline at end of file
@@ -0,0 +1,89 @@
+"""
+Ekspresso procedure
+Copyright (C) 2022  Mateusz Jaracz 
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+
+
+from PySide6.QtCore import QObject, QRunnable, Signal, Slot
+
+from importlib import import_module
+from typing import Callable
+
+from parsing import InputDTO
+from tracing import tracing
+
+
+class WorkerSignals(QObject):
+    finished = Signal(object, float, object)
+    failed = Signal(str)
+    progress = Signal(int, int)
+    cancelled = Signal()
+
+
+class MinimizationWorker(QRunnable):
+    """
+    Runs the executor on a thread of QThreadPool, results are sent back
+    to the GUI thread with signals, engines and numpy are imported by the
+    first run so they do not slow down the start of the application,
+    systematic method reuses the session kept in given sessions so small
+    edits are minimized incrementally
+    """
+    def __init__(
+            self,
+            method: str,
+            dto: InputDTO,
+            sessions: dict | None = None
+            ) -> None:
+        super().__init__()
+        self.signals = WorkerSignals()
+        self.__method = method
+        self.__dto = dto
+        self.__sessions = sessions
+        self.__cancelled = False
+
+    def cancel(self) -> None:
+        self.__cancelled = True
+
+    def __progress(self, done: int, total: int) -> None:
+        if self.__cancelled:
+            raise import_module('ekspansja').CancelledException()
+        self.signals.progress.emit(done, total)
+
+    def __engine(self) -> Callable:
+        if self.__sessions is None or self.__method != 'systematic':
+            return getattr(import_module('ekspansja'), self.__method)
+        if self.__method not in self.__sessions:
+            self.__sessions[self.__method] = import_module(
+                'incremental').Session()
+        return self.__sessions[self.__method].minimize
+
+    @Slot()
+    def run(self) -> None:
+        engines = import_module('ekspansja')
+        try:
+            with tracing() as tracer:
+                value, time = self.__engine()(
+                    self.__dto.first, self.__dto.second,
+                    progress=self.__progress)
+        except engines.CancelledException:
+            self.signals.cancelled.emit()
+        except engines.InvalidInputException:
+            self.signals.failed.emit('Nieprawidłowe dane wejściowe')
+        except Exception as error:
+            self.signals.failed.emit(str(error))
+        else:
+            self.signals.finished.emit(value, time, tracer)